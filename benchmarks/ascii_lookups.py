@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+#
+#  ascii_lookups.py
+"""
+Compare the per-character cost of ``decimal``, ``digit`` and ``numeric``
+for ASCII text against the C :mod:`unicodedata` module.
+
+Run with ``python benchmarks/ascii_lookups.py`` from the repository root.
+"""
+#
+#  Copyright © 2021 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#  Licensed under the Python Software Foundation License Version 2.
+#
+#  See the LICENSE file for details.
+#
+
+# stdlib
+import os
+import sys
+import timeit
+import unicodedata
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# this package
+import pyunicodedata  # noqa: E402
+
+# A line of a typical log file.
+TEXT = "2021-09-30 12:34:56,789 INFO [worker-7] processed 1024 records in 0.53s (status=200)\n"
+
+
+def per_char(function, text: str = TEXT, number: int = 2000, repeat: int = 5) -> float:
+	"""
+	Returns the best time per character, in nanoseconds, of calling ``function`` for each character of ``text``.
+
+	:param function:
+	:param text:
+	:param number:
+	:param repeat:
+	"""
+
+	def run():
+		for ch in text:
+			function(ch, None)
+
+	run()  # load the tables
+	return min(timeit.repeat(run, number=number, repeat=repeat)) / number / len(text) * 1e9
+
+
+def main():
+	print(f"{'':10} {'pyunicodedata':>14} {'unicodedata':>12} {'ratio':>6}")
+
+	for name in ("decimal", "digit", "numeric"):
+		ours = per_char(getattr(pyunicodedata, name))
+		theirs = per_char(getattr(unicodedata, name))
+		print(f"{name:10} {ours:11.1f} ns {theirs:9.1f} ns {ours / theirs:5.2f}x")
+
+
+if __name__ == "__main__":
+	main()
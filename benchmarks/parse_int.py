@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+#
+#  parse_int.py
+"""
+Compare :func:`pyunicodedata.parse_int` with :class:`int`, with a loop over
+:func:`pyunicodedata.decimal`, and with a single pass which validates and accumulates
+each digit in turn, for numbers written in several scripts.
+
+``parse_int`` translates the digits to ASCII and passes them to :class:`int`,
+which is faster than the single pass in pure Python.
+
+Run with ``python benchmarks/parse_int.py`` from the repository root.
+"""
+#
+#  Copyright © 2021 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#  Licensed under the Python Software Foundation License Version 2.
+#
+#  See the LICENSE file for details.
+#
+
+# stdlib
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# this package
+import pyunicodedata  # noqa: E402
+from pyunicodedata._c_unicodedata import database  # noqa: E402
+
+NUMBERS = {
+		"ASCII": "1234567",
+		"Arabic-Indic": "١٢٣٤٥٦٧",
+		"Devanagari": "१२३४५६७",
+		"Fullwidth": "１２３４５６７",
+		"Mathematical": "\U0001d7cf\U0001d7d0\U0001d7d1\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5",
+		}
+
+
+def decimal_loop(s: str) -> int:
+	"""
+	Parse ``s`` one character at a time with :func:`pyunicodedata.decimal`.
+
+	:param s:
+	"""
+
+	result = 0
+	for ch in s:
+		result = result * 10 + pyunicodedata.decimal(ch)
+	return result
+
+
+def single_pass(s: str) -> int:
+	"""
+	Parse ``s`` in a single pass, checking each digit is from the same block of ten as the first.
+
+	This is the alternative to the implementation of :func:`pyunicodedata.parse_int`,
+	looking up the digits without the overhead of :func:`pyunicodedata.decimal`.
+
+	:param s:
+	"""
+
+	to_decimal = database()._PyUnicode_ToDecimalDigit
+	result = 0
+	zero = -1
+	for ch in s:
+		digit = to_decimal(ch)
+		if digit < 0:
+			raise ValueError(f"invalid literal: {s!r}")
+		if zero == -1:
+			zero = ord(ch) - digit
+		elif ord(ch) - digit != zero:
+			raise ValueError(f"digits from different scripts: {s!r}")
+		result = result * 10 + digit
+	return result
+
+
+def per_call(function, text: str, number: int = 20000, repeat: int = 5) -> float:
+	"""
+	Returns the best time per call of ``function(text)``, in nanoseconds.
+
+	:param function:
+	:param text:
+	:param number:
+	:param repeat:
+	"""
+
+	function(text)  # load the tables
+	return min(timeit.repeat(lambda: function(text), number=number, repeat=repeat)) / number * 1e9
+
+
+def main():
+	print(f"{'':13} {'parse_int':>12} {'int':>12} {'decimal loop':>14} {'single pass':>14}")
+
+	for script, text in NUMBERS.items():
+		assert pyunicodedata.parse_int(text) == int(text) == decimal_loop(text) == single_pass(text)
+		ours = per_call(pyunicodedata.parse_int, text)
+		builtin = per_call(int, text)
+		loop = per_call(decimal_loop, text)
+		single = per_call(single_pass, text)
+		print(f"{script:13} {ours:9.0f} ns {builtin:9.0f} ns {loop:11.0f} ns {single:11.0f} ns")
+
+
+if __name__ == "__main__":
+	main()
@@ -28,12 +28,12 @@
 
 # stdlib
 import dataclasses
-import json
 import os
+import struct
 import sys
 import zipfile
+from array import array
 from functools import partial
-from textwrap import dedent
 from typing import Iterator, List, Optional, Set, Tuple
 
 SCRIPT = sys.argv[0]
@@ -67,8 +67,16 @@ PUA_16 = range(0x100000, 0x10FFFE)
 NAME_ALIASES_START = 0xF0000
 NAMED_SEQUENCES_START = 0xF0200
 
+# Hangul syllables are decomposed and composed algorithmically at runtime,
+# so have no entries in the decomposition tables.
+HANGUL_SYLLABLES = range(0xAC00, 0xAC00 + 19 * 21 * 28)
+
 old_versions = ["3.2.0"]
 
+# other versions of Unicode to build tables for, each into a ucd_X_Y_Z
+# subpackage of pyunicodedata, for pyunicodedata.UCD(version)
+EXTRA_VERSIONS: List[str] = ["12.1.0"]
+
 CATEGORY_NAMES = [
 		"Cn",
 		"Lu",
@@ -151,6 +159,45 @@ CASE_IGNORABLE_MASK = 0x1000
 CASED_MASK = 0x2000
 EXTENDED_CASE_MASK = 0x4000
 
+# per-flag record bitmaps, written as record_is_<name>
+FLAG_BITMAPS = [
+		("alpha", ALPHA_MASK),
+		("decimal", DECIMAL_MASK),
+		("digit", DIGIT_MASK),
+		("lower", LOWER_MASK),
+		("linebreak", LINEBREAK_MASK),
+		("space", SPACE_MASK),
+		("title", TITLE_MASK),
+		("upper", UPPER_MASK),
+		("xid_start", XID_START_MASK),
+		("xid_continue", XID_CONTINUE_MASK),
+		("printable", PRINTABLE_MASK),
+		("numeric", NUMERIC_MASK),
+		("case_ignorable", CASE_IGNORABLE_MASK),
+		("cased", CASED_MASK),
+		("extended_case", EXTENDED_CASE_MASK),
+		]
+
+# names of the record columns, in the order of the fields of a type record
+RECORD_COLUMNS = ["upper", "lower", "title", "decimal", "digit", "flags", "numeric"]
+
+# names of the database record columns, written as db_<name>
+DATABASE_RECORD_COLUMNS = ["category", "combining", "bidirectional", "mirrored", "east_asian_width", "quickcheck"]
+
+# names of the fields of the change records for old versions which are written,
+# as changes_<version>_<name>, in the order of the fields made by merge_old_version
+# (kept short, as the names in the database are limited to 24 bytes)
+CHANGE_RECORD_COLUMNS = ["bidir", "category", "decimal", "mirrored", "width"]
+
+# note: should match definitions in pyunicodedata/_database.py
+DATABASE_MAGIC = b"PYUNIDB\0"
+DATABASE_FORMAT = 2
+DATABASE_HEADER = struct.Struct("<8sII16s")
+DATABASE_ENTRY = struct.Struct("<24scB2xQQ")
+DATABASE_ARRAY = 0
+DATABASE_SCALAR = 1
+DATABASE_SHARED = 2
+
 # these ranges need to match unicodedata.c:is_unified_ideograph
 cjk_ranges = [
 		("3400", "4DBF"),
@@ -178,23 +225,75 @@ def maketables(trace=0):
 		print(len(list(filter(None, old_unicode.table))), "characters")
 		merge_old_version(version, unicode, old_unicode)
 
-	# makeunicodename(unicode, trace)
-	# makeunicodedata(unicode, trace)
-	makeunicodetype(unicode, trace)
+	database, name_database, decomp_prefix = makepackage(unicode, trace, UNIDATA_VERSION, "pyunicodedata")
+
+	for version in EXTRA_VERSIONS:
+		print("--- Reading", UNICODE_DATA % ('-' + version), "...")
+		extra_unicode = UnicodeData(version, cjk_check=False)
+		print(len(list(filter(None, extra_unicode.table))), "characters")
+
+		package = os.path.join("pyunicodedata", version_package(version))
+		os.makedirs(package, exist_ok=True)
+
+		with open(os.path.join(package, "__init__.py"), 'w', encoding="UTF-8") as fp:
+			print(f'"""\nTables for version {version} of Unicode, generated by {SCRIPT}.\n"""', file=fp)
+
+		makepackage(
+				extra_unicode,
+				trace,
+				version,
+				package,
+				shared=(database, name_database),
+				decomp_prefix=decomp_prefix,
+				)
+
+
+def makepackage(unicode, trace, version, package, shared=None, decomp_prefix=None):
+	# write the modules and databases for one version of Unicode into the
+	# given package.  Tables which are the same as in the shared databases
+	# (those of the default version) are not repeated in the new databases.
+
+	database = Database(version)
+	name_database = Database(version)
+
+	makeunicodename(unicode, trace, name_database, package)
+	decomp_prefix = makeunicodedata(unicode, trace, database, package, decomp_prefix)
+	makeunicodetype(unicode, trace, database, package)
+
+	FILE = os.path.join(package, "unicodedata.db")
+	print("--- Writing", FILE, "...")
+
+	with open(FILE, "wb") as fp:
+		database.dump(fp, trace, shared[0] if shared else None)
+
+	# the names are by far the largest tables, and are kept in a
+	# database of their own so they are only loaded when needed
+	FILE = os.path.join(package, "unicodename.db")
+	print("--- Writing", FILE, "...")
+
+	with open(FILE, "wb") as fp:
+		name_database.dump(fp, trace, shared[1] if shared else None)
+
+	return database, name_database, decomp_prefix
+
+
+def version_package(version):
+	# note: should match pyunicodedata._database.version_package
+	return "ucd_" + version.replace('.', '_')
 
 
 # --------------------------------------------------------------------
 # unicode character properties
 
 
-def makeunicodedata(unicode, trace):
+def makeunicodedata(unicode, trace, database, package="pyunicodedata", decomp_prefix=None):
 
 	dummy = (0, 0, 0, 0, 0, 0)
 	table = [dummy]
 	cache = {0: dummy}
 	index = [0] * len(unicode.chars)
 
-	FILE = "pyunicodedata/unicodedata_db.h"
+	FILE = os.path.join(package, "_unicodedata_db.py")
 
 	print("--- Preparing", FILE, "...")
 
@@ -221,7 +320,10 @@ def makeunicodedata(unicode, trace):
 	# 2) decomposition data
 
 	decomp_data = [0]
-	decomp_prefix = ['']
+	# the prefixes of other versions start from those of the default version,
+	# as pyunicodedata._c_unicodedata only has the default version's list
+	decomp_prefix = [''] if decomp_prefix is None else list(decomp_prefix)
+	known_prefixes = len(decomp_prefix)
 	decomp_index = [0] * len(unicode.chars)
 	decomp_size = 0
 
@@ -231,7 +333,7 @@ def makeunicodedata(unicode, trace):
 
 	for char in unicode.chars:
 		record = unicode.table[char]
-		if record:
+		if record and char not in HANGUL_SYLLABLES:
 			if record.decomposition_type:
 				decomp = record.decomposition_type.split()
 				if len(decomp) > 19:
@@ -307,6 +409,8 @@ def makeunicodedata(unicode, trace):
 
 	print(len(table), "unique properties")
 	print(len(decomp_prefix), "unique decomposition prefixes")
+	if package != "pyunicodedata" and len(decomp_prefix) != known_prefixes:
+		raise Exception(f"new decomposition prefixes {decomp_prefix[known_prefixes:]!r} in {FILE}")
 	print(len(decomp_data), "unique decomposition entries:", end=' ')
 	print(decomp_size, "bytes")
 	print(total_first, "first characters in NFC")
@@ -315,140 +419,160 @@ def makeunicodedata(unicode, trace):
 
 	print("--- Writing", FILE, "...")
 
-	with open(FILE, 'w') as fp:
+	# store the records column-wise, one array per field
+	columns = []
+	for name, column in zip(DATABASE_RECORD_COLUMNS, zip(*table)):
+		columns.append(Array("db_" + name, [int(field) for field in column]))
+
+	with open(FILE, 'w', encoding="UTF-8") as fp:
 		fprint = partial(print, file=fp)
+		fprint(PY_ARRAY_IMPORTS)
+		fprint(f"UNIDATA_VERSION = {database.version!r}")
+		fprint()
+
+		# string literals
+		for name, values in [
+				("CATEGORY_NAMES", CATEGORY_NAMES),
+				("BIDIRECTIONAL_NAMES", BIDIRECTIONAL_NAMES),
+				("EASTASIANWIDTH_NAMES", EASTASIANWIDTH_NAMES),
+				("DECOMP_PREFIX", decomp_prefix),
+				]:
+			fprint(f"{name} = (")
+			for value in values:
+				fprint(f"  {value!r},")
+			fprint("  )")
+			fprint()
+
+		for column in columns:
+			database.add(column)
+			column.dump_py(fp, trace)
+
+	FILE = os.path.join(package, "_unicodedata_index.py")
+	print("--- Writing", FILE, "...")
+
+	# split record index table
+	index1, index2, shift = splitbins(index, trace)
 
-		fprint(f"/* this file was generated by {SCRIPT} {VERSION} */")
+	index1 = Array("db_index1", index1)
+	index2 = Array("db_index2", index2)
+	database.add_scalar("DB_SHIFT", shift)
+	database.add(index1)
+	database.add(index2)
+
+	with open(FILE, 'w', encoding="UTF-8") as fp:
+		fprint = partial(print, file=fp)
+		fprint(PY_ARRAY_IMPORTS)
+		fprint(f"DB_SHIFT = {shift}")
 		fprint()
-		fprint('#define UNIDATA_VERSION "%s"' % UNIDATA_VERSION)
-		fprint("/* a list of unique database records */")
-		fprint("const _PyUnicode_DatabaseRecord _PyUnicode_Database_Records[] = {")
-		for item in table:
-			fprint("    {%d, %d, %d, %d, %d, %d}," % item)
-		fprint("};")
+		index1.dump_py(fp, trace)
+		index2.dump_py(fp, trace)
+
+	FILE = os.path.join(package, "_unicodedata_decomp.py")
+	print("--- Writing", FILE, "...")
+
+	# split decomposition index table
+	index1, index2, shift = splitbins(decomp_index, trace)
+
+	decomp_data = Array("decomp_data", decomp_data)
+	index1 = Array("decomp_index1", index1)
+	index2 = Array("decomp_index2", index2)
+	database.add_scalar("DECOMP_SHIFT", shift)
+	database.add(decomp_data)
+	database.add(index1)
+	database.add(index2)
+
+	# the NFC pairs, as (first, last, composed) triples; the runtime
+	# looks them up by pair rather than through the reindexed
+	# first/last table used by unicodedata.c
+	comp_pairs = Array("comp_pairs", [code for pair in sorted(comp_pairs) for code in pair])
+	database.add(comp_pairs)
+
+	with open(FILE, 'w', encoding="UTF-8") as fp:
+		fprint = partial(print, file=fp)
+		fprint(PY_ARRAY_IMPORTS)
+		fprint(f"DECOMP_SHIFT = {shift}")
 		fprint()
+		decomp_data.dump_py(fp, trace)
+		index1.dump_py(fp, trace)
+		index2.dump_py(fp, trace)
+		comp_pairs.dump_py(fp, trace)
+
+	# delta tables for the old versions merged by merge_old_version(),
+	# overlaid on the records of this version at runtime
+	FILE = os.path.join(package, "_unicodedata_changes.py")
+	print("--- Writing", FILE, "...")
+
+	with open(FILE, 'w', encoding="UTF-8") as fp:
+		fprint = partial(print, file=fp)
+		fprint(PY_ARRAY_IMPORTS)
 
-		fprint("/* Reindexing of NFC first characters. */")
-		fprint("#define TOTAL_FIRST", total_first)
-		fprint("#define TOTAL_LAST", total_last)
-		fprint("struct reindex{int start;short count,index;};")
-		fprint("static struct reindex nfc_first[] = {")
-		for start, end in comp_first_ranges:
-			fprint(f"    {{ {start:d}, {end - start:d}, {comp_first[start]:d}}},")
-		fprint("    {0,0,0}")
-		fprint("};\n")
-		fprint("static struct reindex nfc_last[] = {")
-		for start, end in comp_last_ranges:
-			fprint(f"  {{ {start:d}, {end - start:d}, {comp_last[start]:d}}},")
-		fprint("  {0,0,0}")
-		fprint("};\n")
-
-		# FIXME: <fl> the following tables could be made static, and
-		# the support code moved into unicodedatabase.c
-
-		fprint("/* string literals */")
-		fprint("const char *_PyUnicode_CategoryNames[] = {")
-		for name in CATEGORY_NAMES:
-			fprint(f'    "{name}",')
-		fprint("    NULL")
-		fprint("};")
-
-		fprint("const char *_PyUnicode_BidirectionalNames[] = {")
-		for name in BIDIRECTIONAL_NAMES:
-			fprint(f'    "{name}",')
-		fprint("    NULL")
-		fprint("};")
-
-		fprint("const char *_PyUnicode_EastAsianWidthNames[] = {")
-		for name in EASTASIANWIDTH_NAMES:
-			fprint(f'    "{name}",')
-		fprint("    NULL")
-		fprint("};")
-
-		fprint("static const char *decomp_prefix[] = {")
-		for name in decomp_prefix:
-			fprint(f'    "{name}",')
-		fprint("    NULL")
-		fprint("};")
-
-		# split record index table
-		index1, index2, shift = splitbins(index, trace)
-
-		fprint("/* index tables for the database records */")
-		fprint("#define SHIFT", shift)
-		Array("index1", index1).dump(fp, trace)
-		Array("index2", index2).dump(fp, trace)
-
-		# split decomposition index table
-		index1, index2, shift = splitbins(decomp_index, trace)
-
-		fprint("/* decomposition data */")
-		Array("decomp_data", decomp_data).dump(fp, trace)
-
-		fprint("/* index tables for the decomposition data */")
-		fprint("#define DECOMP_SHIFT", shift)
-		Array("decomp_index1", index1).dump(fp, trace)
-		Array("decomp_index2", index2).dump(fp, trace)
-
-		index, index2, shift = splitbins(comp_data, trace)
-		fprint("/* NFC pairs */")
-		fprint("#define COMP_SHIFT", shift)
-		Array("comp_index", index).dump(fp, trace)
-		Array("comp_data", index2).dump(fp, trace)
-
-		# Generate delta tables for old versions
 		for version, table, normalization in unicode.changed:
 			cversion = version.replace('.', '_')
-			records = [table[0]]
-			cache = {table[0]: 0}
+
+			# the numeric changes are not stored, as unicodedata.c does not use
+			# them either (numeric() takes the changed decimal value instead)
+			mirrored = CHANGE_RECORD_COLUMNS.index("mirrored")
+			records = [table[0][:len(CHANGE_RECORD_COLUMNS)]]
+			cache = {records[0]: 0}
 			index = [0] * len(table)
 			for i, record in enumerate(table):
+				record = record[:len(CHANGE_RECORD_COLUMNS)]
 				try:
 					index[i] = cache[record]
 				except KeyError:
 					index[i] = cache[record] = len(records)
 					records.append(record)
+
+			print(len(records), "unique change records for", version)
+
 			index1, index2, shift = splitbins(index, trace)
-			fprint(f"static const change_record change_records_{cversion}[] = {{")
-			for record in records:
-				fprint(f"    {{ {', '.join(map(str, record))} }},")
-			fprint("};")
-			Array(f"changes_{cversion}_index", index1).dump(fp, trace)
-			Array(f"changes_{cversion}_data", index2).dump(fp, trace)
-			fprint(f"static const change_record* get_change_{cversion}(Py_UCS4 n)")
-			fprint('{')
-			fprint("    int index;")
-			fprint("    if (n >= 0x110000) index = 0;")
-			fprint("    else {")
-			fprint(f"        index = changes_{cversion}_index[n>>{shift:d}];")
-			fprint(f"        index = changes_{cversion}_data[(index<<{shift:d})+(n & {((1 << shift) - 1):d})];")
-			fprint("    }")
-			fprint(f"    return change_records_{cversion}+index;")
-			fprint("}\n")
-			fprint(f"static Py_UCS4 normalization_{cversion}(Py_UCS4 n)")
-			fprint('{')
-			fprint("    switch(n) {")
-			for k, v in normalization:
-				fprint(f"    case {hex(k)}: return 0x{v};")
-			fprint("    default: return 0;")
-			fprint("    }\n}\n")
+			index1 = Array(f"changes_{cversion}_index1", index1)
+			index2 = Array(f"changes_{cversion}_index2", index2)
+			database.add_scalar(f"CHANGES_{cversion}_SHIFT", shift)
+			database.add(index1)
+			database.add(index2)
+
+			fprint(f"CHANGES_{cversion}_SHIFT = {shift}")
+			fprint()
+			index1.dump_py(fp, trace)
+			index2.dump_py(fp, trace)
+
+			# store the change records column-wise, one array per field;
+			# merge_old_version() records the mirrored changes as strings
+			for column, (name, values) in enumerate(zip(CHANGE_RECORD_COLUMNS, zip(*records))):
+				if column == mirrored:
+					values = [value if value == 0xFF else int(value) for value in values]
+				table = Array(f"changes_{cversion}_{name}", list(values))
+				database.add(table)
+				table.dump_py(fp, trace)
+
+			# the normalization changes, as (code point, replacement) pairs
+			normalization = Array(
+					f"normalization_{cversion}",
+					[code for key, value in sorted(normalization) for code in (key, int(value, 16))],
+					)
+			database.add(normalization)
+			normalization.dump_py(fp, trace)
+
+	return decomp_prefix
 
 
 # --------------------------------------------------------------------
 # unicode character type tables
 
 
-def makeunicodetype(unicode, trace):
+def makeunicodetype(unicode, trace, database, package="pyunicodedata"):
 
-	FILE = "pyunicodedata/_unicodetype_db.py"
+	FILE = os.path.join(package, "_unicodetype_db.py")
 	print("--- Preparing", FILE, "...")
 
 	# extract unicode types
-	dummy = (0, 0, 0, 0, 0, 0)
+	dummy = (0, 0, 0, 0, 0, 0, 0)
 	table = [dummy]
 	cache = {0: dummy}
 	index = [0] * len(unicode.chars)
 	numeric = {}
+	numeric_index = {}
 	spaces = []
 	linebreaks = []
 	extra_casing = []
@@ -499,6 +623,14 @@ def makeunicodetype(unicode, trace):
 				title = int(record.simple_titlecase_mapping, 16)
 			else:
 				title = upper
+			# the simple case folding is the 'S' entry of CaseFolding.txt for
+			# characters with a multi-character 'F' entry, else the 'C' entry
+			if char in unicode.simple_case_folding:
+				simple_fold = unicode.simple_case_folding[char]
+			elif len(cf) == 1:
+				simple_fold = cf[0]
+			else:
+				simple_fold = char
 			if sc is None and cf != [lower]:
 				sc = ([lower], [title], [upper])
 			if sc is None:
@@ -514,19 +646,27 @@ def makeunicodetype(unicode, trace):
 				# character in uppercase, lowercase, or titlecase or the
 				# casefolded version of the character is different from the
 				# lowercase. The extra characters are stored in a different
-				# array.
+				# array. Each mapping is preceded by the simple mapping from
+				# UnicodeData.txt, which need not be its first character.
 				flags |= EXTENDED_CASE_MASK
+				extra_casing.append(lower)
 				lower = len(extra_casing) | (len(sc[0]) << 24)
 				extra_casing.extend(sc[0])
-				if cf != sc[0]:
+				# The case folding follows the lowercase mapping, preceded
+				# by the simple case folding, unless both can be inferred
+				# from the lowercase mapping.
+				if cf != sc[0] or simple_fold != (sc[0][0] if len(sc[0]) == 1 else char):
 					lower |= len(cf) << 20
+					extra_casing.append(simple_fold)
 					extra_casing.extend(cf)
+				extra_casing.append(upper)
 				upper = len(extra_casing) | (len(sc[2]) << 24)
 				extra_casing.extend(sc[2])
 				# Title is probably equal to upper.
-				if sc[1] == sc[2]:
+				if sc[1] == sc[2] and title == extra_casing[(upper & 0xFFFF) - 1]:
 					title = upper
 				else:
+					extra_casing.append(title)
 					title = len(extra_casing) | (len(sc[1]) << 24)
 					extra_casing.extend(sc[1])
 			# decimal digit, integer digit
@@ -538,10 +678,13 @@ def makeunicodetype(unicode, trace):
 			if record.numeric_type:
 				flags |= DIGIT_MASK
 				digit = int(record.numeric_type)
+			# index of the value in the numeric_values table
+			numeric_value = 0
 			if record.numeric_value:
 				flags |= NUMERIC_MASK
 				numeric.setdefault(record.numeric_value, []).append(char)
-			item = (upper, lower, title, decimal, digit, flags)
+				numeric_value = numeric_index.setdefault(record.numeric_value, len(numeric_index))
+			item = (upper, lower, title, decimal, digit, flags, numeric_value)
 
 			# add entry to index and item tables
 			i = cache.get(item)
@@ -552,25 +695,67 @@ def makeunicodetype(unicode, trace):
 
 	print(len(table), "unique character type entries")
 	print(sum(map(len, numeric.values())), "numeric code points")
+	print(len(numeric_index), "unique numeric values")
 	print(len(spaces), "whitespace code points")
 	print(len(linebreaks), "linebreak code points")
 	print(len(extra_casing), "extended case array")
 
 	print("--- Writing", FILE, "...")
 
+	# store the records column-wise, one array per field
+	columns = []
+	for name, column in zip(RECORD_COLUMNS, zip(*table)):
+		columns.append(Array("record_" + name, list(column)))
+
+	# and one byte per record for each flag, so that testing a flag
+	# is a single lookup
+	flags = [item[5] for item in table]
+	for name, mask in FLAG_BITMAPS:
+		columns.append(Array("record_is_" + name, [1 if flag & mask else 0 for flag in flags], 'B'))
+
+	# the case mappings which are more than one character, or where the
+	# case folding differs from the lowercase mapping, each preceded by
+	# the simple mapping
+	extended_case = Array("extended_case", extra_casing)
+
+	# the whitespace and line break characters, for the string functions
+	whitespace = Array("whitespace", sorted(spaces))
+	linebreaks = Array("linebreaks", sorted(linebreaks))
+
 	with open(FILE, 'w', encoding="UTF-8") as fp:
 		fprint = partial(print, file=fp)
-		fprint("data = [")
-		for idx, item in enumerate(table[:-1]):
-			fprint(f"  {list(item)!r},")
-		fprint(f"  {list(table[-1])!r}")
-		fprint(']')
-
-	FILE = "pyunicodedata/_unicodetype_index.py"
+		fprint(PY_ARRAY_IMPORTS)
+		for column in columns:
+			database.add(column)
+			column.dump_py(fp, trace)
+		for table in (extended_case, whitespace, linebreaks):
+			database.add(table)
+			table.dump_py(fp, trace)
+
+	FILE = os.path.join(package, "_unicodetype_index.py")
 	print("--- Writing", FILE, "...")
 
+	# split type index table
+	index1, index2, shift = splitbins(index, trace)
+
+	index1 = Array("index1", index1)
+	index2 = Array("index2", index2)
+	database.add_scalar("SHIFT", shift)
+	database.add(index1)
+	database.add(index2)
+
+	# the records of the Latin-1 characters, which skip the two-level index
+	latin1_records = Array("latin1_records", index[:256])
+	database.add(latin1_records)
+
 	with open(FILE, 'w', encoding="UTF-8") as fp:
-		fp.write(f"index = {json.dumps(index)}")
+		fprint = partial(print, file=fp)
+		fprint(PY_ARRAY_IMPORTS)
+		fprint(f"SHIFT = {shift}")
+		fprint()
+		index1.dump_py(fp, trace)
+		index2.dump_py(fp, trace)
+		latin1_records.dump_py(fp, trace)
 
 	# with open(FILE, "w") as fp:
 	#     fprint = partial(print, file=fp)
@@ -583,84 +768,45 @@ def makeunicodetype(unicode, trace):
 	#         fprint("    {%d, %d, %d, %d, %d, %d}," % item)
 	#     fprint("};")
 	#     fprint()
-	#
-	#     fprint("/* extended case mappings */")
-	#     fprint()
-	#     fprint("const Py_UCS4 _PyUnicode_ExtendedCase[] = {")
-	#     for c in extra_casing:
-	#         fprint("    %d," % c)
-	#     fprint("};")
-	#     fprint()
-	#
-	#     # split decomposition index table
-	#     index1, index2, shift = splitbins(index, trace)
-	#
-	#     fprint("/* type indexes */")
-	#     fprint("#define SHIFT", shift)
-	#     Array("index1", index1).dump(fp, trace)
-	#     Array("index2", index2).dump(fp, trace)
 
-	FILE = "pyunicodedata/_unicode_numeric.py"
+	FILE = os.path.join(package, "_unicode_numeric.py")
 	print("--- Writing", FILE, "...")
 
-	with open(FILE, 'w', encoding="UTF-8") as fp:
-		numeric_items = sorted(numeric.items())
-
-		data = {}
-
-		for value, codepoints in numeric_items:
-			# Turn text into float literals
-			parts = value.split('/')
-			parts = [repr(float(part)) for part in parts]
-			value = '/'.join(parts)
+	numeric_values = []
+	numeric_numerators = []
+	numeric_denominators = []
+
+	# numeric_index is in order of the indices stored in the type records
+	for value in numeric_index:
+		# Evaluate fractions such as "1/2" here rather than at runtime,
+		# and keep the exact value for numeric_fraction()
+		numerator, _, denominator = value.partition('/')
+		numeric_values.append(float(numerator) / float(denominator or 1))
+		numeric_numerators.append(int(numerator))
+		numeric_denominators.append(int(denominator or 1))
+
+	numeric_values = Array("numeric_values", numeric_values, 'd')
+	numeric_numerators = Array("numeric_numerators", numeric_numerators)
+	numeric_denominators = Array("numeric_denominators", numeric_denominators)
+	database.add(numeric_values)
+	database.add(numeric_numerators)
+	database.add(numeric_denominators)
 
-			codepoints.sort()
-			data[value] = codepoints
-
-		fp.write(f"numeric_items = {json.dumps(data, indent=2)}")
-
-	#     # Generate code for _PyUnicode_IsWhitespace()
-	#     fprint("/* Returns 1 for Unicode characters having the bidirectional")
-	#     fprint(" * type 'WS', 'B' or 'S' or the category 'Zs', 0 otherwise.")
-	#     fprint(" */")
-	#     fprint('int _PyUnicode_IsWhitespace(const Py_UCS4 ch)')
-	#     fprint('{')
-	#     fprint('    switch (ch) {')
-	#
-	#     for codepoint in sorted(spaces):
-	#         fprint('    case 0x%04X:' % (codepoint,))
-	#     fprint('        return 1;')
-	#
-	#     fprint('    }')
-	#     fprint('    return 0;')
-	#     fprint('}')
-	#     fprint()
-	#
-	#     # Generate code for _PyUnicode_IsLinebreak()
-	#     fprint("/* Returns 1 for Unicode characters having the line break")
-	#     fprint(" * property 'BK', 'CR', 'LF' or 'NL' or having bidirectional")
-	#     fprint(" * type 'B', 0 otherwise.")
-	#     fprint(" */")
-	#     fprint('int _PyUnicode_IsLinebreak(const Py_UCS4 ch)')
-	#     fprint('{')
-	#     fprint('    switch (ch) {')
-	#     for codepoint in sorted(linebreaks):
-	#         fprint('    case 0x%04X:' % (codepoint,))
-	#     fprint('        return 1;')
-	#
-	#     fprint('    }')
-	#     fprint('    return 0;')
-	#     fprint('}')
-	#     fprint()
+	with open(FILE, 'w', encoding="UTF-8") as fp:
+		fprint = partial(print, file=fp)
+		fprint(PY_ARRAY_IMPORTS)
+		numeric_values.dump_py(fp, trace)
+		numeric_numerators.dump_py(fp, trace)
+		numeric_denominators.dump_py(fp, trace)
 
 
 # --------------------------------------------------------------------
 # unicode name database
 
 
-def makeunicodename(unicode, trace):
+def makeunicodename(unicode, trace, database, package="pyunicodedata"):
 
-	FILE = "pyunicodedata/unicodename_db.h"
+	FILE = os.path.join(package, "_unicodename_db.py")
 
 	print("--- Preparing", FILE, "...")
 
@@ -773,6 +919,29 @@ def makeunicodename(unicode, trace):
 
 	assert getsize(phrasebook) == 1
 
+	#
+	# inverted word index, for pyunicodedata.search_names()
+
+	# the characters whose names contain each word; the aliases and
+	# named sequences, stored in PUA 15, are not characters' names
+	postings = {}
+	for char in unicode.chars:
+		name = names[char]
+		if name and char not in PUA_15:
+			for w in set(name[:-1].split()):
+				postings.setdefault(w, []).append(char)
+
+	# the words in alphabetical order, as indexes into the lexicon
+	search_words = []
+	search_postings = []
+	search_postings_offset = [0]
+	for w in sorted(postings):
+		search_words.append(words[w] if w in words else words[w + chr(0)])
+		search_postings.extend(postings[w])
+		search_postings_offset.append(len(search_postings))
+
+	print(len(search_words), "words in search index;", len(search_postings), "postings")
+
 	#
 	# unicode name hash table
 
@@ -793,65 +962,78 @@ def makeunicodename(unicode, trace):
 
 	print("--- Writing", FILE, "...")
 
-	with open(FILE, 'w') as fp:
-		fprint = partial(print, file=fp)
-
-		fprint(f"/* this file was generated by {SCRIPT} {VERSION} */")
-		fprint()
-		fprint("#define NAME_MAXLEN", 256)
-		fprint()
-		fprint("/* lexicon */")
-		Array("lexicon", lexicon).dump(fp, trace)
-		Array("lexicon_offset", lexicon_offset).dump(fp, trace)
-
-		# split decomposition index table
-		offset1, offset2, shift = splitbins(phrasebook_offset, trace)
-
-		fprint("/* code->name phrasebook */")
-		fprint("#define phrasebook_shift", shift)
-		fprint("#define phrasebook_short", short)
-
-		Array("phrasebook", phrasebook).dump(fp, trace)
-		Array("phrasebook_offset1", offset1).dump(fp, trace)
-		Array("phrasebook_offset2", offset2).dump(fp, trace)
-
-		fprint("/* name->code dictionary */")
-		codehash.dump(fp, trace)
+	lexicon = Array("lexicon", lexicon)
+	lexicon_offset = Array("lexicon_offset", lexicon_offset)
+
+	# split phrasebook index table
+	offset1, offset2, shift = splitbins(phrasebook_offset, trace)
+
+	phrasebook = Array("phrasebook", phrasebook)
+	offset1 = Array("phrasebook_offset1", offset1)
+	offset2 = Array("phrasebook_offset2", offset2)
+
+	# the aliases and named sequences are stored in the Private Use Area,
+	# and mapped back to the real code points by these tables
+	name_aliases = Array("name_aliases", [codepoint for name, codepoint in unicode.aliases])
+
+	named_sequences = []
+	named_sequence_offsets = [0]
+	for name, sequence in unicode.named_sequences:
+		named_sequences.extend(sequence)
+		named_sequence_offsets.append(len(named_sequences))
+
+	named_sequences = Array("named_sequences", named_sequences)
+	named_sequence_offsets = Array("named_sequence_offsets", named_sequence_offsets)
+
+	search_words = Array("search_words", search_words)
+	search_postings = Array("search_postings", search_postings)
+	search_postings_offset = Array("search_postings_offset", search_postings_offset)
+
+	# the CJK unified ideographs are named algorithmically, as (first, last) pairs
+	cjk_ideograph_ranges = Array("cjk_ideograph_ranges", [int(code, 16) for pair in unicode.cjk_ranges for code in pair])
+
+	scalars = {
+			"NAME_MAXLEN": 256,
+			"PHRASEBOOK_SHIFT": shift,
+			"PHRASEBOOK_SHORT": short,
+			"CODE_MAGIC": codehash.magic,
+			"CODE_SIZE": codehash.size,
+			"CODE_POLY": codehash.poly,
+			"ALIASES_START": NAME_ALIASES_START,
+			"ALIASES_END": NAME_ALIASES_START + len(unicode.aliases),
+			"NAMED_SEQUENCES_START": NAMED_SEQUENCES_START,
+			"NAMED_SEQUENCES_END": NAMED_SEQUENCES_START + len(unicode.named_sequences),
+			}
+
+	arrays = [
+			lexicon,
+			lexicon_offset,
+			phrasebook,
+			offset1,
+			offset2,
+			codehash.data,
+			name_aliases,
+			named_sequences,
+			named_sequence_offsets,
+			cjk_ideograph_ranges,
+			search_words,
+			search_postings,
+			search_postings_offset,
+			]
+
+	for name, value in scalars.items():
+		database.add_scalar(name, value)
+	for data in arrays:
+		database.add(data)
 
+	with open(FILE, 'w', encoding="UTF-8") as fp:
+		fprint = partial(print, file=fp)
+		fprint(PY_ARRAY_IMPORTS)
+		for name, value in scalars.items():
+			fprint(f"{name} = {value}")
 		fprint()
-		fprint(f"static const unsigned int aliases_start = {NAME_ALIASES_START:#x};")
-		fprint(f"static const unsigned int aliases_end = {NAME_ALIASES_START + len(unicode.aliases):#x};")
-
-		fprint("static const unsigned int name_aliases[] = {")
-		for name, codepoint in unicode.aliases:
-			fprint(f"    0x{codepoint:04X},")
-		fprint("};")
-
-		# In Unicode 6.0.0, the sequences contain at most 4 BMP chars,
-		# so we are using Py_UCS2 seq[4].  This needs to be updated if longer
-		# sequences or sequences with non-BMP chars are added.
-		# unicodedata_lookup should be adapted too.
-		fprint(
-				dedent(
-						"""
-            typedef struct NamedSequence {
-                int seqlen;
-                Py_UCS2 seq[4];
-            } named_sequence;
-            """
-						)
-				)
-
-		fprint(f"static const unsigned int named_sequences_start = {NAMED_SEQUENCES_START:#x};")
-		fprint(
-				f"static const unsigned int named_sequences_end = {NAMED_SEQUENCES_START + len(unicode.named_sequences):#x};"
-				)
-
-		fprint("static const named_sequence named_sequences[] = {")
-		for name, sequence in unicode.named_sequences:
-			seq_str = ", ".join(f"0x{cp:04X}" for cp in sequence)
-			fprint(f"    {{{len(sequence):d}, {{{seq_str}}}}},")
-		fprint("};")
+		for data in arrays:
+			data.dump_py(fp, trace)
 
 
 def merge_old_version(version, new, old):
@@ -1103,6 +1285,7 @@ class UnicodeData:
 				table[i] = from_row((f"{i:X}", ) + field[1:])
 		if cjk_check and cjk_ranges != cjk_ranges_found:
 			raise ValueError(f"CJK ranges deviate: have {cjk_ranges_found!r}")
+		self.cjk_ranges = cjk_ranges_found
 
 		# public attributes
 		self.filename = UNICODE_DATA % ''
@@ -1224,11 +1407,14 @@ class UnicodeData:
 			sc[c] = (lower, title, upper)
 
 		cf = self.case_folding = {}
+		scf = self.simple_case_folding = {}
 		if version != "3.2.0":
 			for data in UcdFile(CASE_FOLDING, version):
 				if data[1] in "CF":
 					c = int(data[0], 16)
 					cf[c] = [int(char, 16) for char in data[2].split()]
+				elif data[1] == 'S':
+					scf[int(data[0], 16)] = int(data[2], 16)
 
 	def uselatin1(self):
 		# restrict character range to ISO Latin 1
@@ -1328,9 +1514,10 @@ class Hash:
 
 class Array:
 
-	def __init__(self, name, data):
+	def __init__(self, name, data, typecode=None):
 		self.name = name
 		self.data = data
+		self.typecode = typecode or gettypecode(data)
 
 	def dump(self, file, trace=0):
 		# write data to file, as a C array
@@ -1358,6 +1545,115 @@ class Array:
 				file.write(s.rstrip() + '\n')
 		file.write("};\n\n")
 
+	def tobytes(self):
+		# return the data as little-endian bytes
+		data = array(self.typecode, self.data)
+		if sys.byteorder == "big":
+			data.byteswap()
+		return data.tobytes()
+
+	def dump_py(self, file, trace=0):
+		# write data to file, as a Python array built from a bytes literal
+		data = self.tobytes()
+		if trace:
+			print(self.name + ':', len(data), "bytes", file=sys.stderr)
+		file.write(f"{self.name} = array({self.typecode!r}, (\n")
+		for i in range(0, len(data), 64):
+			file.write(f"  {data[i:i + 64]!r}\n")
+		file.write("))\n")
+		if len(data) > len(self.data):
+			file.write('if byteorder == "big":  # pragma: no cover\n')
+			file.write(f"  {self.name}.byteswap()\n")
+		file.write('\n')
+
+
+# imports needed by modules containing arrays written by Array.dump_py()
+PY_ARRAY_IMPORTS = "# stdlib\nfrom array import array\nfrom sys import byteorder\n"
+
+
+class Database:
+	# a collection of arrays written to a single binary file, which
+	# pyunicodedata._database memory-maps at runtime.  Arrays are stored
+	# little-endian and aligned to 8 bytes so they can be cast in place.
+
+	def __init__(self, version):
+		self.version = version
+		self.entries = []
+
+	def add(self, table):
+		self.entries.append((table, DATABASE_ARRAY))
+
+	def add_scalar(self, name, value):
+		self.entries.append((Array(name, [value], 'q'), DATABASE_SCALAR))
+
+	def dump(self, file, trace=0, shared=None):
+		# write the header, the directory of entries, and then the arrays.
+		# entries which are the same as in the shared database are written
+		# as references to it, without any data
+		shared_entries = {}
+		if shared is not None:
+			shared_entries = {table.name: (table, kind) for table, kind in shared.entries}
+
+		offset = DATABASE_HEADER.size + DATABASE_ENTRY.size * len(self.entries)
+		directory = []
+		blobs = []
+		for table, kind in self.entries:
+			if len(table.name) > 24:  # the size of the name field of DATABASE_ENTRY
+				raise ValueError(f"name too long for the database: {table.name!r}")
+
+			if table.name in shared_entries:
+				shared_table, shared_kind = shared_entries[table.name]
+				if (shared_kind, shared_table.typecode, shared_table.data) == (kind, table.typecode, table.data):
+					directory.append(
+							DATABASE_ENTRY.pack(
+									table.name.encode("ascii"),
+									table.typecode.encode("ascii"),
+									DATABASE_SHARED,
+									0,
+									0,
+									)
+							)
+					continue
+
+			padding = -offset % 8
+			data = table.tobytes()
+			blobs.append(b'\0' * padding + data)
+			offset += padding
+			directory.append(
+					DATABASE_ENTRY.pack(
+							table.name.encode("ascii"),
+							table.typecode.encode("ascii"),
+							kind,
+							offset,
+							len(table.data),
+							)
+					)
+			offset += len(data)
+		file.write(
+				DATABASE_HEADER.pack(
+						DATABASE_MAGIC,
+						DATABASE_FORMAT,
+						len(self.entries),
+						self.version.encode("ascii"),
+						)
+				)
+		file.writelines(directory)
+		file.writelines(blobs)
+		if trace:
+			print("database:", offset, "bytes", file=sys.stderr)
+
+
+# maps the result of getsize() to the matching array typecode
+ARRAY_TYPECODES = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+
+
+def gettypecode(data):
+	# return the array typecode for the smallest possible integer size,
+	# using a signed type if the data contains negative numbers
+	if min(data) < 0:
+		return ARRAY_TYPECODES[getsize([abs(item) * 2 for item in data])].lower()
+	return ARRAY_TYPECODES[getsize(data)]
+
 
 def getsize(data):
 	# return smallest possible integer size for the given array
@@ -1366,8 +1662,10 @@ def getsize(data):
 		return 1
 	elif maxdata < 65536:
 		return 2
-	else:
+	elif maxdata < 4294967296:
 		return 4
+	else:
+		return 8
 
 
 def splitbins(t, trace=0):
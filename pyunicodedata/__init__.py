@@ -18,19 +18,170 @@ Pure-python implementation of some unicodedata functions.
 # stdlib
 import unicodedata
 
-# this package
-from pyunicodedata._c_unicodedata import Py_UNICODE_TODECIMAL, Py_UNICODE_TODIGIT, Py_UNICODE_TONUMERIC
+# typing is not imported at runtime, to keep the import (and the .pth file) cheap.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+	# stdlib
+	from fractions import Fraction
+	from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 __author__: str = "Dominic Davis-Foster"
 __license__: str = "PSF"
 __version__: str = "0.0.0"
 __email__: str = "dominic@davis-foster.co.uk"
 
-__all__ = ["decimal", "digit", "numeric"]
+__all__ = [
+		"UCD",
+		"bidirectional",
+		"casefold",
+		"category",
+		"combining",
+		"decimal",
+		"decimal_many",
+		"decimal_translation_table",
+		"decomposition",
+		"digit",
+		"digit_many",
+		"east_asian_width",
+		"escape_nonprintable",
+		"find_invalid_identifier_chars",
+		"is_identifier",
+		"is_normalized",
+		"islinebreak",
+		"isprintable",
+		"isspace",
+		"lookup",
+		"match_interpreter",
+		"mirrored",
+		"name",
+		"normalize",
+		"numeric",
+		"numeric_fraction",
+		"numeric_many",
+		"parse_int",
+		"search_names",
+		"simple_casefold",
+		"simple_casefold_table",
+		"simple_lower",
+		"simple_title",
+		"simple_upper",
+		"splitlines",
+		"to_lower",
+		"to_title",
+		"to_upper",
+		"ucd_3_2_0",
+		]
 
 MISSING = object()
 
 
+def _lazy(name: str, module: str = "_c_unicodedata") -> "Callable":
+	"""
+	Returns a placeholder for the function ``name`` from the given submodule of :mod:`pyunicodedata`.
+
+	The submodules load the character tables, so they are only imported when a placeholder is first called.
+	All placeholders for that module are then replaced by the real functions.
+
+	:param name:
+	:param module: :mod:`pyunicodedata._c_unicodedata`, or :mod:`pyunicodedata._unicodename` for the character names.
+	"""
+
+	_lazy_names.setdefault(module, []).append(name)
+	return _trampoline(name, module)
+
+
+def _trampoline(name: str, module: str) -> "Callable":
+	"""
+	Returns a function which replaces the placeholders for ``module`` and then calls the function ``name``.
+
+	:param name:
+	:param module:
+	"""
+
+	def trampoline(*args):
+		_load(module)
+		return globals()[name](*args)
+
+	trampoline.__name__ = trampoline.__qualname__ = name
+	return trampoline
+
+
+def _load(module: str = "_c_unicodedata") -> None:
+	"""
+	Import the given submodule of :mod:`pyunicodedata` and replace the placeholders created by :func:`~._lazy`
+	with the functions of its database.
+
+	The database for :data:`~._unidata_version` is used, which :func:`~.match_interpreter` may have changed.
+
+	:param module:
+	"""
+
+	# stdlib
+	from importlib import import_module
+
+	source = import_module(f"pyunicodedata.{module}").database(_unidata_version)
+
+	namespace = globals()
+	for name in _lazy_names[module]:
+		namespace[name] = getattr(source, name)
+
+	if module == "_c_unicodedata":
+		_latin1_decimal.update(source.latin1_decimal)
+		_latin1_digit.update(source.latin1_digit)
+		_latin1_numeric.update(source.latin1_numeric)
+
+
+_lazy_names: "Dict[str, List[str]]" = {}
+
+# The version of Unicode of the tables used by the functions of this module,
+# or :py:obj:`None` for those in :mod:`pyunicodedata` itself. Set by match_interpreter().
+_unidata_version: "Optional[str]" = None
+
+# Results for the Latin-1 characters, filled in by _load(),
+# which let the common case skip the call into _c_unicodedata.
+_latin1_decimal: "Dict[str, int]" = {}
+_latin1_digit: "Dict[str, int]" = {}
+_latin1_numeric: "Dict[str, float]" = {}
+
+Py_UNICODE_TODECIMAL: "Callable[[str], int]" = _lazy("Py_UNICODE_TODECIMAL")
+Py_UNICODE_TODIGIT: "Callable[[str], int]" = _lazy("Py_UNICODE_TODIGIT")
+Py_UNICODE_TONUMERIC: "Callable[[str], float]" = _lazy("Py_UNICODE_TONUMERIC")
+Py_UNICODE_TONUMERICFRACTION: "Callable[[str], Optional[Fraction]]" = _lazy("Py_UNICODE_TONUMERICFRACTION")
+_PyUnicode_ToDecimalDigitMany: "Callable[..., list]" = _lazy("_PyUnicode_ToDecimalDigitMany")
+_PyUnicode_ToDigitMany: "Callable[..., list]" = _lazy("_PyUnicode_ToDigitMany")
+_PyUnicode_ToNumericMany: "Callable[..., list]" = _lazy("_PyUnicode_ToNumericMany")
+unicodedata_UCD_category_impl: "Callable[[str], str]" = _lazy("unicodedata_UCD_category_impl")
+unicodedata_UCD_bidirectional_impl: "Callable[[str], str]" = _lazy("unicodedata_UCD_bidirectional_impl")
+unicodedata_UCD_combining_impl: "Callable[[str], int]" = _lazy("unicodedata_UCD_combining_impl")
+unicodedata_UCD_mirrored_impl: "Callable[[str], int]" = _lazy("unicodedata_UCD_mirrored_impl")
+unicodedata_UCD_east_asian_width_impl: "Callable[[str], str]" = _lazy("unicodedata_UCD_east_asian_width_impl")
+unicodedata_UCD_decomposition_impl: "Callable[[str], str]" = _lazy("unicodedata_UCD_decomposition_impl")
+unicodedata_UCD_normalize_impl: "Callable[[str, str], str]" = _lazy("unicodedata_UCD_normalize_impl")
+unicodedata_UCD_is_normalized_impl: "Callable[[str, str], bool]" = _lazy("unicodedata_UCD_is_normalized_impl")
+unicodedata_UCD_name_impl: "Callable[[str], Optional[str]]" = _lazy("unicodedata_UCD_name_impl", "_unicodename")
+unicodedata_UCD_lookup_impl: "Callable[[Union[str, bytes]], str]" = _lazy("unicodedata_UCD_lookup_impl", "_unicodename")
+search_names_impl: "Callable[[str, bool], List[int]]" = _lazy("search_names_impl", "_unicodename")
+Py_UNICODE_TOLOWER: "Callable[[str], str]" = _lazy("Py_UNICODE_TOLOWER")
+Py_UNICODE_TOUPPER: "Callable[[str], str]" = _lazy("Py_UNICODE_TOUPPER")
+Py_UNICODE_TOTITLE: "Callable[[str], str]" = _lazy("Py_UNICODE_TOTITLE")
+unicode_lower_impl: "Callable[[str], str]" = _lazy("unicode_lower_impl")
+unicode_upper_impl: "Callable[[str], str]" = _lazy("unicode_upper_impl")
+unicode_title_impl: "Callable[[str], str]" = _lazy("unicode_title_impl")
+unicode_casefold_impl: "Callable[[str], str]" = _lazy("unicode_casefold_impl")
+_PyUnicode_ToFoldedSimple: "Callable[[str], str]" = _lazy("_PyUnicode_ToFoldedSimple")
+decimal_translation_table_impl: "Callable[[], Dict[int, str]]" = _lazy("decimal_translation_table_impl")
+simple_casefold_table_impl: "Callable[[], Dict[int, str]]" = _lazy("simple_casefold_table_impl")
+parse_int_impl: "Callable[[str, int, bool], int]" = _lazy("parse_int_impl")
+unicode_isspace_impl: "Callable[[str], bool]" = _lazy("unicode_isspace_impl")
+unicode_islinebreak_impl: "Callable[[str], bool]" = _lazy("unicode_islinebreak_impl")
+unicode_splitlines_impl: "Callable[[str, bool], List[str]]" = _lazy("unicode_splitlines_impl")
+is_identifier_impl: "Callable[[str, bool], bool]" = _lazy("is_identifier_impl")
+find_invalid_identifier_chars_impl: "Callable[[str, bool], List[int]]" = _lazy("find_invalid_identifier_chars_impl")
+isprintable_impl: "Callable[[str], bool]" = _lazy("isprintable_impl")
+escape_nonprintable_impl: "Callable[[str], str]" = _lazy("escape_nonprintable_impl")
+
+
 def decimal(chr: str, default=MISSING):  # noqa: A002  # pylint: disable=redefined-builtin
 	"""
 	Returns the decimal value assigned to the character chr as integer.
@@ -41,9 +192,10 @@ def decimal(chr: str, default=MISSING):  # noqa: A002  # pylint: disable=redefin
 	:param default:
 	"""
 
-	# TODO: get_old_record
+	rc = _latin1_decimal.get(chr)
+	if rc is None:
+		rc = Py_UNICODE_TODECIMAL(chr)
 
-	rc: int = Py_UNICODE_TODECIMAL(chr)
 	if rc < 0:
 		if default is MISSING:
 			raise ValueError("not a decimal")
@@ -63,7 +215,10 @@ def digit(chr: str, default=MISSING):  # noqa: A002  # pylint: disable=redefined
 	:param default:
 	"""
 
-	rc: int = Py_UNICODE_TODIGIT(chr)
+	rc = _latin1_digit.get(chr)
+	if rc is None:
+		rc = Py_UNICODE_TODIGIT(chr)
+
 	if rc < 0:
 		if default is MISSING:
 			raise ValueError("not a digit")
@@ -83,9 +238,10 @@ def numeric(chr: str, default=MISSING):  # noqa: A002  # pylint: disable=redefin
 	:param default:
 	"""
 
-	# TODO: get_old_record
+	rc = _latin1_numeric.get(chr)
+	if rc is None:
+		rc = Py_UNICODE_TONUMERIC(chr)
 
-	rc: float = Py_UNICODE_TONUMERIC(chr)
 	if rc == -1.0:
 		if default is MISSING:
 			raise ValueError("not a numeric character")
@@ -95,11 +251,880 @@ def numeric(chr: str, default=MISSING):  # noqa: A002  # pylint: disable=redefin
 	return rc
 
 
-# combining
-# east asian width
-# mirrored
-# decomposition
-# is_normalized
+def numeric_fraction(chr: str, default=MISSING):  # noqa: A002  # pylint: disable=redefined-builtin
+	"""
+	Returns the numeric value assigned to the character chr as a :class:`fractions.Fraction`.
+
+	Unlike :func:`~.numeric` the value is exact, so ``'⅓'`` gives ``Fraction(1, 3)`` rather than ``0.333...``.
+	The same :class:`~fractions.Fraction` object is returned for every character with a given value.
+
+	If no such value is defined, default is returned, or, if not given, ValueError is raised.
+
+	:param chr:
+	:param default:
+	"""
+
+	rc = Py_UNICODE_TONUMERICFRACTION(chr)
+	if rc is None:
+		if default is MISSING:
+			raise ValueError("not a numeric character")
+		else:
+			return default
+
+	return rc
+
+
+def decimal_many(chars: "Union[str, Iterable[int]]", default: "Any" = None) -> "List[Any]":
+	"""
+	Returns the decimal value assigned to each character in chars, as integers.
+
+	Characters with no such value give ``default``.
+
+	This is equivalent to ``[decimal(ch, default) for ch in chars]``, but much faster for long strings.
+
+	:param chars: A string, or an iterable of code points.
+	:param default:
+
+	:raises ValueError: If a code point is not in ``range(0x110000)``.
+	"""
+
+	return _PyUnicode_ToDecimalDigitMany(chars, default)
+
+
+def digit_many(chars: "Union[str, Iterable[int]]", default: "Any" = None) -> "List[Any]":
+	"""
+	Returns the digit value assigned to each character in chars, as integers.
+
+	Characters with no such value give ``default``.
+
+	This is equivalent to ``[digit(ch, default) for ch in chars]``, but much faster for long strings.
+
+	:param chars: A string, or an iterable of code points.
+	:param default:
+
+	:raises ValueError: If a code point is not in ``range(0x110000)``.
+	"""
+
+	return _PyUnicode_ToDigitMany(chars, default)
+
+
+def numeric_many(chars: "Union[str, Iterable[int]]", default: "Any" = None) -> "List[Any]":
+	"""
+	Returns the numeric value assigned to each character in chars, as floats.
+
+	Characters with no such value give ``default``.
+
+	This is equivalent to ``[numeric(ch, default) for ch in chars]``, but much faster for long strings.
+
+	:param chars: A string, or an iterable of code points.
+	:param default:
+
+	:raises ValueError: If a code point is not in ``range(0x110000)``.
+	"""
+
+	return _PyUnicode_ToNumericMany(chars, default)
+
+
+def parse_int(s: str, *, base: int = 10, allow_mixed_scripts: bool = False) -> int:
+	"""
+	Returns the integer represented by the string ``s``, written with the decimal digits of any script.
+
+	As with :class:`int`, the digits may be surrounded by whitespace, preceded by a sign,
+	and separated by single underscores, and with ``base`` above 10 the letters ``a`` to ``z``
+	(in either case) are the digits 10 to 35.
+
+	.. code-block:: python
+
+		>>> parse_int("\u0661\u0669\u0668\u0664")
+		1984
+		>>> parse_int("-\uff14\uff12")
+		-42
+
+	:param s:
+	:param base: The base of the number, between 2 and 36.
+	:param allow_mixed_scripts: Whether to accept digits from more than one script,
+		such as ``"1\u0662"``. By default a :exc:`ValueError` is raised.
+
+	:raises ValueError: If ``s`` is not a valid integer in ``base``.
+	"""
+
+	return parse_int_impl(s, base, allow_mixed_scripts)
+
+
+def category(chr: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+	"""
+	Returns the general category assigned to the character chr as string.
+
+	:param chr:
+	"""
+
+	return unicodedata_UCD_category_impl(chr)
+
+
+def bidirectional(chr: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+	"""
+	Returns the bidirectional class assigned to the character chr as string.
+
+	If no such value is defined, an empty string is returned.
+
+	:param chr:
+	"""
+
+	return unicodedata_UCD_bidirectional_impl(chr)
+
+
+def combining(chr: str) -> int:  # noqa: A002  # pylint: disable=redefined-builtin
+	"""
+	Returns the canonical combining class assigned to the character chr as integer.
+
+	Returns 0 if no combining class is defined.
+
+	:param chr:
+	"""
+
+	return unicodedata_UCD_combining_impl(chr)
+
+
+def mirrored(chr: str) -> int:  # noqa: A002  # pylint: disable=redefined-builtin
+	"""
+	Returns the mirrored property assigned to the character chr as integer.
+
+	Returns 1 if the character has been identified as a "mirrored"
+	character in bidirectional text, 0 otherwise.
+
+	:param chr:
+	"""
+
+	return unicodedata_UCD_mirrored_impl(chr)
+
+
+def east_asian_width(chr: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+	"""
+	Returns the east asian width assigned to the character chr as string.
+
+	:param chr:
+	"""
+
+	return unicodedata_UCD_east_asian_width_impl(chr)
+
+
+def decomposition(chr: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+	"""
+	Returns the character decomposition mapping assigned to the character chr as string.
+
+	An empty string is returned in case no such mapping is defined.
+
+	:param chr:
+	"""
+
+	return unicodedata_UCD_decomposition_impl(chr)
+
+
+def normalize(form: str, unistr: str) -> str:
+	"""
+	Return the normal form ``form`` for the Unicode string ``unistr``.
+
+	Valid values for form are 'NFC', 'NFKC', 'NFD', and 'NFKD'.
+
+	If ``unistr`` is already normalized it is returned unchanged, without being copied.
+
+	:param form:
+	:param unistr:
+	"""
+
+	return unicodedata_UCD_normalize_impl(form, unistr)
+
+
+def is_normalized(form: str, unistr: str) -> bool:
+	"""
+	Return whether the Unicode string ``unistr`` is in the normal form ``form``.
+
+	Valid values for form are 'NFC', 'NFKC', 'NFD', and 'NFKD'.
+
+	:param form:
+	:param unistr:
+	"""
+
+	return unicodedata_UCD_is_normalized_impl(form, unistr)
+
+
+def name(chr: str, default=MISSING):  # noqa: A002  # pylint: disable=redefined-builtin
+	"""
+	Returns the name assigned to the character chr as a string.
+
+	If no name is defined, default is returned, or, if not given, ValueError is raised.
+
+	The character names are loaded the first time this function or :func:`~.lookup` is called.
+
+	:param chr:
+	:param default:
+	"""
+
+	rc = unicodedata_UCD_name_impl(chr)
+	if rc is None:
+		if default is MISSING:
+			raise ValueError("no such name")
+		else:
+			return default
+
+	return rc
+
+
+def lookup(name: "Union[str, bytes]") -> str:
+	"""
+	Look up character by name.
+
+	If a character with the given name is found, return the corresponding character.
+	If not found, KeyError is raised.
+
+	Names are matched case-insensitively, and name aliases and named sequences are supported.
+
+	:param name:
+	"""
+
+	return unicodedata_UCD_lookup_impl(name)
+
+
+def search_names(query: str, prefix: bool = False) -> "List[int]":
+	"""
+	Returns the code points of the characters whose names contain all the words in query, in order.
+
+	Words are matched case-insensitively, using an index of the words in the names
+	which is loaded with them, so this is much faster than calling :func:`~.name` for every character.
+
+	.. code-block:: python
+
+		>>> search_names("rightwards black arrow")[:3]
+		[10145, 10149, 10150]
+		>>> search_names("latin capital letter a with gr", prefix=True)
+		[192, 512, 7846, 7856]
+
+	:param query: Words separated by whitespace.
+	:param prefix: If :py:obj:`True`, the last word of the query only has to be the start of a word in the name,
+		for example when completing a name as it is typed.
+	"""
+
+	return search_names_impl(query, prefix)
+
+
+def simple_lower(chr: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+	"""
+	Returns the simple lowercase mapping of the character ``chr``, which is always a single character.
+
+	:param chr:
+	"""
+
+	return Py_UNICODE_TOLOWER(chr)
+
+
+def simple_upper(chr: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+	"""
+	Returns the simple uppercase mapping of the character ``chr``, which is always a single character.
+
+	For example ``simple_upper('ß')`` is ``'ß'``, whereas ``to_upper('ß')`` is ``'SS'``.
+
+	:param chr:
+	"""
+
+	return Py_UNICODE_TOUPPER(chr)
+
+
+def simple_title(chr: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+	"""
+	Returns the simple titlecase mapping of the character ``chr``, which is always a single character.
+
+	:param chr:
+	"""
+
+	return Py_UNICODE_TOTITLE(chr)
+
+
+def simple_casefold(chr: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+	"""
+	Returns the simple case folding of the character ``chr``, which is always a single character.
+
+	:param chr:
+	"""
+
+	return _PyUnicode_ToFoldedSimple(chr)
+
+
+def to_lower(unistr: str) -> str:
+	"""
+	Return a copy of the string ``unistr`` converted to lowercase using the full case mappings.
+
+	This is :meth:`str.lower`, but for the version of Unicode in :mod:`pyunicodedata`'s tables
+	rather than that of the running interpreter.
+
+	:param unistr:
+	"""
+
+	return unicode_lower_impl(unistr)
+
+
+def to_upper(unistr: str) -> str:
+	"""
+	Return a copy of the string ``unistr`` converted to uppercase using the full case mappings.
+
+	This is :meth:`str.upper`, but for the version of Unicode in :mod:`pyunicodedata`'s tables
+	rather than that of the running interpreter.
+
+	:param unistr:
+	"""
+
+	return unicode_upper_impl(unistr)
+
+
+def to_title(unistr: str) -> str:
+	"""
+	Return a titlecased version of the string ``unistr`` using the full case mappings.
+
+	This is :meth:`str.title`, but for the version of Unicode in :mod:`pyunicodedata`'s tables
+	rather than that of the running interpreter.
+
+	:param unistr:
+	"""
+
+	return unicode_title_impl(unistr)
+
+
+def casefold(unistr: str) -> str:
+	"""
+	Return a casefolded copy of the string ``unistr``, suitable for caseless comparisons.
+
+	This is :meth:`str.casefold`, but for the version of Unicode in :mod:`pyunicodedata`'s tables
+	rather than that of the running interpreter.
+
+	:param unistr:
+	"""
+
+	return unicode_casefold_impl(unistr)
+
+
+def isspace(unistr: str) -> bool:
+	"""
+	Return whether all the characters of the string ``unistr`` are whitespace, and there is at least one.
+
+	This is :meth:`str.isspace`, but for the version of Unicode in :mod:`pyunicodedata`'s tables
+	rather than that of the running interpreter.
+
+	:param unistr:
+	"""
+
+	return unicode_isspace_impl(unistr)
+
+
+def islinebreak(unistr: str) -> bool:
+	"""
+	Return whether all the characters of the string ``unistr`` are line breaks, and there is at least one.
+
+	:param unistr:
+	"""
+
+	return unicode_islinebreak_impl(unistr)
+
+
+def splitlines(unistr: str, keepends: bool = False) -> "List[str]":
+	"""
+	Return a list of the lines in the string ``unistr``, breaking at line boundaries.
+
+	This is :meth:`str.splitlines`, but for the version of Unicode in :mod:`pyunicodedata`'s tables
+	rather than that of the running interpreter.
+
+	:param unistr:
+	:param keepends: Whether to include the line breaks in the resulting list.
+	"""
+
+	return unicode_splitlines_impl(unistr, keepends)
+
+
+def is_identifier(unistr: str, *, normalize: bool = False) -> bool:
+	"""
+	Return whether the string ``unistr`` is a valid identifier.
+
+	This is :meth:`str.isidentifier`, but for the version of Unicode in :mod:`pyunicodedata`'s tables
+	rather than that of the running interpreter.
+
+	:param unistr:
+	:param normalize: Whether to check the NFKC normal form of ``unistr``, as Python does for the identifiers in source code.
+		For example ``"\uff3fname"`` (beginning with FULLWIDTH LOW LINE) is only an identifier once normalized.
+	"""
+
+	return is_identifier_impl(unistr, normalize)
+
+
+def find_invalid_identifier_chars(unistr: str, *, normalize: bool = False) -> "List[int]":
+	"""
+	Returns the offsets of the characters which stop the string ``unistr`` being a valid identifier.
+
+	The list is empty if ``unistr`` is a valid identifier, or is empty.
+
+	.. code-block:: python
+
+		>>> find_invalid_identifier_chars("user-name.first")
+		[4, 9]
+		>>> find_invalid_identifier_chars("2nd_field")
+		[0]
+
+	:param unistr:
+	:param normalize: Whether to check the NFKC normal form of ``unistr``, in which case the offsets are into that.
+	"""
+
+	return find_invalid_identifier_chars_impl(unistr, normalize)
+
+
+def isprintable(unistr: str) -> bool:
+	"""
+	Return whether all the characters of the string ``unistr`` are printable.
+
+	This is :meth:`str.isprintable`, but for the version of Unicode in :mod:`pyunicodedata`'s tables
+	rather than that of the running interpreter.
+
+	:param unistr:
+	"""
+
+	return isprintable_impl(unistr)
+
+
+def escape_nonprintable(unistr: str) -> str:
+	r"""
+	Return a copy of the string ``unistr`` with each non-printable character replaced by an escape sequence.
+
+	The escape sequences are those :func:`repr` uses (``\t``, ``\n``, ``\r``, ``\xNN``,
+	``\uNNNN`` and ``\UNNNNNNNN``), but quotes and backslashes are left as they are.
+
+	.. code-block:: python
+
+		>>> escape_nonprintable("café\tbar\x1b[0m\u200b")
+		'café\\tbar\\x1b[0m\\u200b'
+
+	:param unistr:
+	"""
+
+	return escape_nonprintable_impl(unistr)
+
+
+def decimal_translation_table() -> "Dict[int, str]":
+	"""
+	Returns a table for :meth:`str.translate` which maps every decimal digit to the ASCII digit with the same value.
+
+	.. code-block:: python
+
+		>>> "\u0661\u0669\u0668\u0664".translate(decimal_translation_table())
+		'1984'
+
+	The table is created on first use, and the same dictionary is returned each time, so it must not be modified.
+	"""
+
+	return decimal_translation_table_impl()
+
+
+def simple_casefold_table() -> "Dict[int, str]":
+	"""
+	Returns a table for :meth:`str.translate` which maps every character to its simple case folding.
+
+	Unlike :func:`~.casefold` each character is replaced by exactly one character,
+	so offsets into the folded string are the same as in the original.
+
+	The table is created on first use, and the same dictionary is returned each time, so it must not be modified.
+	"""
+
+	return simple_casefold_table_impl()
+
+
+class UCD:
+	"""
+	The character database for a particular version of Unicode, like :data:`unicodedata.ucd_3_2_0`.
+
+	The methods are the same as the functions of the same names in this module.
+	The tables for a version are loaded the first time one of its methods is called,
+	and are shared by all :class:`~.UCD` objects for that version.
+
+	Version 3.2.0, which is needed for IDNA 2003 (see :mod:`encodings.idna` and :mod:`stringprep`),
+	is stored as changes to the records of the default version, and is also available as :data:`~.ucd_3_2_0`.
+	The tables for version 12.1.0 are also included, in the ``ucd_12_1_0`` subpackage.
+
+	:param version: The version of Unicode, e.g. ``'12.1.0'``.
+
+	:raises ValueError: If there are no tables for that version.
+	"""
+
+	#: The version of Unicode the tables are for.
+	unidata_version: str
+
+	def __init__(self, version: str):
+		if version != _default_version() and version not in _ucd_versions():
+			raise ValueError(f"no tables for Unicode {version}")
+
+		self.unidata_version = version
+
+	def __repr__(self) -> str:
+		return f"{type(self).__name__}({self.unidata_version!r})"
+
+	def decimal(self, chr: str, default=MISSING):  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the decimal value assigned to the character chr as integer.
+
+		If no such value is defined, default is returned, or, if not given, ValueError is raised.
+
+		:param chr:
+		:param default:
+		"""
+
+		rc = _version_database("_c_unicodedata", self.unidata_version).Py_UNICODE_TODECIMAL(chr)
+		if rc < 0:
+			if default is MISSING:
+				raise ValueError("not a decimal")
+			else:
+				return default
+
+		return rc
+
+	def digit(self, chr: str, default=MISSING):  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the digit value assigned to the character chr as integer.
+
+		If no such value is defined, default is returned, or, if not given, ValueError is raised.
+
+		:param chr:
+		:param default:
+		"""
+
+		rc = _version_database("_c_unicodedata", self.unidata_version).Py_UNICODE_TODIGIT(chr)
+		if rc < 0:
+			if default is MISSING:
+				raise ValueError("not a digit")
+			else:
+				return default
+
+		return rc
+
+	def numeric(self, chr: str, default=MISSING):  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the numeric value assigned to the character chr as float.
+
+		If no such value is defined, default is returned, or, if not given, ValueError is raised.
+
+		:param chr:
+		:param default:
+		"""
+
+		rc = _version_database("_c_unicodedata", self.unidata_version).Py_UNICODE_TONUMERIC(chr)
+		if rc == -1.0:
+			if default is MISSING:
+				raise ValueError("not a numeric character")
+			else:
+				return default
+
+		return rc
+
+	def category(self, chr: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the general category assigned to the character chr as string.
+
+		:param chr:
+		"""
+
+		return _version_database("_c_unicodedata", self.unidata_version).unicodedata_UCD_category_impl(chr)
+
+	def bidirectional(self, chr: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the bidirectional class assigned to the character chr as string.
+
+		If no such value is defined, an empty string is returned.
+
+		:param chr:
+		"""
+
+		return _version_database("_c_unicodedata", self.unidata_version).unicodedata_UCD_bidirectional_impl(chr)
+
+	def combining(self, chr: str) -> int:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the canonical combining class assigned to the character chr as integer.
+
+		Returns 0 if no combining class is defined.
+
+		:param chr:
+		"""
+
+		return _version_database("_c_unicodedata", self.unidata_version).unicodedata_UCD_combining_impl(chr)
+
+	def mirrored(self, chr: str) -> int:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the mirrored property assigned to the character chr as integer.
+
+		Returns 1 if the character has been identified as a "mirrored"
+		character in bidirectional text, 0 otherwise.
+
+		:param chr:
+		"""
+
+		return _version_database("_c_unicodedata", self.unidata_version).unicodedata_UCD_mirrored_impl(chr)
+
+	def east_asian_width(self, chr: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the east asian width assigned to the character chr as string.
+
+		:param chr:
+		"""
+
+		return _version_database("_c_unicodedata", self.unidata_version).unicodedata_UCD_east_asian_width_impl(chr)
+
+	def decomposition(self, chr: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the character decomposition mapping assigned to the character chr as string.
+
+		An empty string is returned in case no such mapping is defined.
+
+		:param chr:
+		"""
+
+		return _version_database("_c_unicodedata", self.unidata_version).unicodedata_UCD_decomposition_impl(chr)
+
+	def normalize(self, form: str, unistr: str) -> str:
+		"""
+		Return the normal form ``form`` for the Unicode string ``unistr``.
+
+		Valid values for form are 'NFC', 'NFKC', 'NFD', and 'NFKD'.
+
+		:param form:
+		:param unistr:
+		"""
+
+		return _version_database("_c_unicodedata", self.unidata_version).unicodedata_UCD_normalize_impl(form, unistr)
+
+	def is_normalized(self, form: str, unistr: str) -> bool:
+		"""
+		Return whether the Unicode string ``unistr`` is in the normal form ``form``.
+
+		Valid values for form are 'NFC', 'NFKC', 'NFD', and 'NFKD'.
+
+		:param form:
+		:param unistr:
+		"""
+
+		database = _version_database("_c_unicodedata", self.unidata_version)
+		return database.unicodedata_UCD_is_normalized_impl(form, unistr)
+
+	def name(self, chr: str, default=MISSING):  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the name assigned to the character chr as a string.
+
+		If no name is defined, default is returned, or, if not given, ValueError is raised.
+
+		:param chr:
+		:param default:
+		"""
+
+		rc = _version_database("_unicodename", self.unidata_version).unicodedata_UCD_name_impl(chr)
+		if rc is None:
+			if default is MISSING:
+				raise ValueError("no such name")
+			else:
+				return default
+
+		return rc
+
+	def lookup(self, name: "Union[str, bytes]") -> str:
+		"""
+		Look up character by name.
+
+		If a character with the given name is found, return the corresponding character.
+		If not found, KeyError is raised.
+
+		:param name:
+		"""
+
+		return _version_database("_unicodename", self.unidata_version).unicodedata_UCD_lookup_impl(name)
+
+
+def _default_version() -> str:
+	"""
+	Returns the version of Unicode of the tables in :mod:`pyunicodedata` itself.
+	"""
+
+	# this package
+	from pyunicodedata._database import database_version
+
+	try:
+		return database_version()
+	except (OSError, ValueError):
+		# this package
+		from pyunicodedata._unicodedata_db import UNIDATA_VERSION
+		return UNIDATA_VERSION
+
+
+def _ucd_versions() -> "List[str]":
+	"""
+	Returns the other versions of Unicode there are tables for.
+	"""
+
+	# this package
+	from pyunicodedata._database import OLD_VERSIONS, database_versions
+
+	return [*OLD_VERSIONS, *database_versions()]
+
+
+def _version_database(module: str, version: str) -> "Any":
+	"""
+	Returns the database in the given submodule of :mod:`pyunicodedata` for the given version of Unicode.
+
+	The database is shared by every :class:`~.UCD` object for that version.
+
+	:param module: :mod:`pyunicodedata._c_unicodedata`, or :mod:`pyunicodedata._unicodename` for the character names.
+	:param version:
+	"""
+
+	try:
+		return _version_databases[(module, version)]
+	except KeyError:
+		pass
+
+	# stdlib
+	from importlib import import_module
+
+	source = import_module(f"pyunicodedata.{module}").database(None if version == _default_version() else version)
+	_version_databases[(module, version)] = source
+	return source
+
+
+# The databases for each version of Unicode used by UCD objects, keyed by module and version.
+_version_databases: "Dict[Tuple[str, str], Any]" = {}
+
+
+def __getattr__(name: str) -> "Any":
+	# ucd_3_2_0 is only created when it is first used, as UCD() looks for the database.
+	if name == "ucd_3_2_0":
+		ucd = globals()[name] = UCD("3.2.0")
+		return ucd
+
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# The attributes of unicodedata which match_interpreter() uses in place of those of this module.
+_UNICODEDATA_ATTRIBUTES = (
+		"bidirectional",
+		"category",
+		"combining",
+		"decimal",
+		"decomposition",
+		"digit",
+		"east_asian_width",
+		"is_normalized",
+		"lookup",
+		"mirrored",
+		"name",
+		"normalize",
+		"numeric",
+		"ucd_3_2_0",
+		)
+
+
+# The functions of this module which match_interpreter() replaced, so they can be restored.
+_own_attributes: "Dict[str, Any]" = {}
+
+# The versions of Unicode whose tables match_interpreter() has already checked against unicodedata.
+_checked_versions: "Dict[str, bool]" = {}
+
+
+def match_interpreter() -> "Optional[str]":
+	"""
+	Make the functions of this module give the same results as the interpreter's :mod:`unicodedata`.
+
+	If there are tables for :data:`unicodedata.unidata_version`, as there are for :class:`~.UCD`,
+	the functions which :mod:`unicodedata` provides (:func:`~.category`, :func:`~.numeric`, :func:`~.normalize`
+	and the others it shares with this module) are replaced by its own, which are much faster.
+	All other functions, such as :func:`~.numeric_fraction`, :func:`~.to_lower`, :func:`~.casefold`,
+	:func:`~.isprintable` and :func:`~.search_names`, use the tables for that version.
+
+	If there are no tables for the interpreter's version, nothing is delegated to :mod:`unicodedata`,
+	so every function keeps using the default tables, and a :exc:`RuntimeWarning` is issued.
+
+	The first time a version is selected, :func:`unicodedata.category` is compared with
+	:func:`~.category` from the tables for that version for a sample of code points,
+	and a :exc:`RuntimeWarning` is issued if they differ.
+
+	This should be called once, at startup. It only affects functions looked up on this module afterwards,
+	not those already imported with ``from pyunicodedata import ...``.
+
+	:returns: The version of Unicode of the tables now in use,
+		or :py:obj:`None` if there are no tables for the interpreter's version and the default tables are still used.
+	"""
+
+	# stdlib
+	import warnings
+
+	global _unidata_version
+
+	version = getattr(unicodedata, "unidata_version", None)
+	default = _default_version()
+
+	if version == default:
+		selected = None
+	elif version is not None and version in _ucd_versions():
+		selected = version
+	else:
+		if version is not None:
+			warnings.warn(
+					f"There are no tables for Unicode {version}, the version used by unicodedata; "
+					f"the tables for Unicode {default} are used instead.",
+					RuntimeWarning,
+					stacklevel=2,
+					)
+		version = selected = None
+
+	if selected != _unidata_version:
+		# Put the placeholders back, so the tables for the new version are loaded when they are next needed.
+		_unidata_version = selected
+		namespace = globals()
+		for module, names in _lazy_names.items():
+			for name in names:
+				namespace[name] = _trampoline(name, module)
+		_latin1_decimal.clear()
+		_latin1_digit.clear()
+		_latin1_numeric.clear()
+
+	if version is not None and version not in _checked_versions and hasattr(unicodedata, "category"):
+		# this package
+		from pyunicodedata._c_unicodedata import database
+
+		# A sample of code points from the planes with assigned characters,
+		# so this is much quicker than checking every character.
+		codes = [*range(0, 0x32000, 61), *range(0xe0000, 0xe0200, 61)]
+		category = database(selected).unicodedata_UCD_category_impl
+		differ = [code for code in codes if unicodedata.category(chr(code)) != category(chr(code))]
+		_checked_versions[version] = not differ
+		if differ:
+			warnings.warn(
+					f"The tables for Unicode {version} differ from unicodedata for {len(differ)} sampled characters, "
+					f"such as U+{differ[0]:04X}.",
+					RuntimeWarning,
+					stacklevel=2,
+					)
+
+	namespace = globals()
+	if not _own_attributes:
+		_own_attributes.update((name, namespace[name]) for name in _UNICODEDATA_ATTRIBUTES if name in namespace)
+
+	for name in _UNICODEDATA_ATTRIBUTES:
+		if version is not None and hasattr(unicodedata, name):
+			namespace[name] = getattr(unicodedata, name)
+		elif name in _own_attributes:
+			namespace[name] = _own_attributes[name]
+		else:
+			# created again by __getattr__() when needed
+			namespace.pop(name, None)
+
+	return version
+
+
+def _unicodedata_getattr(name: str) -> "Any":
+	# The module __getattr__ installed on unicodedata by install_patch().
+	if name == "ucd_3_2_0":
+		ucd = unicodedata.ucd_3_2_0 = __getattr__(name)
+		return ucd
+
+	raise AttributeError(f"module 'unicodedata' has no attribute {name!r}")
 
 
 def install_patch():
@@ -111,3 +1136,37 @@ def install_patch():
 
 	if not hasattr(unicodedata, "numeric"):
 		unicodedata.numeric = numeric
+
+	if not hasattr(unicodedata, "category"):
+		unicodedata.category = category
+
+	if not hasattr(unicodedata, "bidirectional"):
+		unicodedata.bidirectional = bidirectional
+
+	if not hasattr(unicodedata, "combining"):
+		unicodedata.combining = combining
+
+	if not hasattr(unicodedata, "mirrored"):
+		unicodedata.mirrored = mirrored
+
+	if not hasattr(unicodedata, "decomposition"):
+		unicodedata.decomposition = decomposition
+
+	if not hasattr(unicodedata, "name"):
+		unicodedata.name = name
+
+	if not hasattr(unicodedata, "lookup"):
+		unicodedata.lookup = lookup  # type: ignore[assignment]
+
+	if not hasattr(unicodedata, "normalize"):
+		unicodedata.normalize = normalize
+
+	if not hasattr(unicodedata, "is_normalized"):
+		unicodedata.is_normalized = is_normalized
+
+	if not hasattr(unicodedata, "east_asian_width"):
+		unicodedata.east_asian_width = east_asian_width  # type: ignore[assignment]
+
+	if not hasattr(unicodedata, "ucd_3_2_0"):
+		# As for this module, ucd_3_2_0 is only created when it is first used.
+		unicodedata.__getattr__ = _unicodedata_getattr  # type: ignore[method-assign]
@@ -3,6 +3,9 @@
 #  _c_unicode.py
 """
 Parts of unicodedata based on CPython C source code.
+
+The tables and the functions which use them belong to a :class:`~.Database` for a particular version of Unicode,
+returned by :func:`~.database`. The tables are only loaded when the database for a version is first needed.
 """
 #
 #  Based on CPython.
@@ -15,10 +18,19 @@ Parts of unicodedata based on CPython C source code.
 #  See the LICENSE file for details.
 #
 
+# stdlib
+import re
+
 # this package
-from ._unicode_numeric import numeric_items
-from ._unicodetype_db import data
-from ._unicodetype_index import index
+from ._database import OLD_VERSIONS, load_tables
+from ._unicodedata_db import BIDIRECTIONAL_NAMES, CATEGORY_NAMES, DECOMP_PREFIX, EASTASIANWIDTH_NAMES
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+	# stdlib
+	from fractions import Fraction
+	from typing import Any, Dict, FrozenSet, Iterable, List, Match, Optional, Set, Tuple, Union
 
 ALPHA_MASK = 0x01
 DECIMAL_MASK = 0x02
@@ -36,191 +48,1983 @@ CASE_IGNORABLE_MASK = 0x1000
 CASED_MASK = 0x2000
 EXTENDED_CASE_MASK = 0x4000
 
+# Hangul syllables are composed and decomposed algorithmically.
+SBase = 0xAC00
+LBase = 0x1100
+VBase = 0x1161
+TBase = 0x11A7
+LCount = 19
+VCount = 21
+TCount = 28
+NCount = VCount * TCount
+SCount = LCount * NCount
 
-def _PyUnicode_IsTitlecase(ch: str) -> int:  # pragma: no cover
+# Sequences of modern conjoining jamo which compose to a Hangul syllable.
+_hangul_jamo = re.compile("[\u1100-\u1112][\u1161-\u1175][\u11a8-\u11c2]?")
+
+
+def _compose_jamo(match: "Match[str]") -> str:
 	"""
-	Returns 1 for Unicode characters having the category 'Lt', 0 otherwise.
+	Returns the Hangul syllable for the sequence of conjoining jamo matched by :data:`~._hangul_jamo`.
 
-	:param ch:
+	:param match:
 	"""
 
-	record = data[index[ord(ch)]]
-	upper, lower, title, decimal, digit, flags = record
-	return flags & TITLE_MASK != 0
+	jamo = match.group()
+	code = SBase + ((ord(jamo[0]) - LBase) * VCount + ord(jamo[1]) - VBase) * TCount
+	if len(jamo) == 3:
+		code += ord(jamo[2]) - TBase
+
+	return chr(code)
+
+
+# Results of Database.is_normalized_quickcheck()
+YES = 0
+MAYBE = 1
+NO = 2
+
+# The normalization forms, as (nfc, k).
+NORMALIZATION_FORMS = {"NFC": (True, False), "NFKC": (True, True), "NFD": (False, False), "NFKD": (False, True)}
+
+# The decompositions of the Hangul syllables normalize() has seen, keyed by code point, for str.translate().
+# These are the same in every version of Unicode.
+_hangul_decompositions: "Dict[int, str]" = {}
+
+# The blocks of ten decimal digits parse_int_impl() has seen, plus the underscore, keyed by the code point of zero.
+_digit_blocks: "Dict[int, str]" = {}
+
+# The prefixes int() accepts for these bases, which parse_int_impl() does not.
+_int_prefixes = {2: "0b", 8: "0o", 16: "0x"}
+
+# The escape sequences for the non-printable characters seen, as used by repr().
+_escapes: "Dict[str, str]" = {'\t': "\\t", '\n': "\\n", '\r': "\\r"}
 
 
-def _PyUnicode_IsXidStart(ch: str) -> int:  # pragma: no cover
+def _escape_run(match: "Match[str]") -> str:
 	"""
-	Returns 1 for Unicode characters having the XID_Start property, 0 otherwise.
+	Returns the escape sequences for a run of non-printable characters.
 
-	:param ch:
+	:param match:
 	"""
 
-	record = data[index[ord(ch)]]
-	upper, lower, title, decimal, digit, flags = record
-	return flags & XID_START_MASK != 0
+	return ''.join(map(_escape, match.group()))
 
 
-def _PyUnicode_IsXidContinue(ch: str) -> int:  # pragma: no cover
+def _escape(ch: str) -> str:
 	"""
-	Returns 1 for Unicode characters having the XID_Continue property, 0 otherwise.
+	Returns the escape sequence for the non-printable character ``ch``, as used by :func:`repr`.
 
 	:param ch:
 	"""
 
-	record = data[index[ord(ch)]]
-	upper, lower, title, decimal, digit, flags = record
+	escape = _escapes.get(ch)
+	if escape is None:
+		code = ord(ch)
+		if code < 0x100:
+			escape = f"\\x{code:02x}"
+		elif code < 0x10000:
+			escape = f"\\u{code:04x}"
+		else:
+			escape = f"\\U{code:08x}"
+		_escapes[ch] = escape
 
-	return flags & XID_CONTINUE_MASK != 0
+	return escape
 
 
-def _PyUnicode_ToDecimalDigit(ch: str) -> int:
+def _codes_with_records(records: "Set[int]", index1, index2, shift: int) -> "List[int]":
 	"""
-	Returns the integer decimal (0-9) for Unicode characters having this property, -1 otherwise.
+	Returns the code points whose record in the two-level index ``index1``/``index2`` is one of ``records``.
 
-	:param ch:
+	Each block of the index which is shared between several ranges of code points is only searched once.
+
+	:param records: The indices of the records.
+	:param index1:
+	:param index2:
+	:param shift: The number of low bits of a code point used to index into ``index2``.
 	"""
 
-	record = data[index[ord(ch)]]
-	upper, lower, title, decimal, digit, flags = record
+	codes: "List[int]" = []
+	offsets: "Dict[int, List[int]]" = {}
+	block_size = 1 << shift
 
-	if flags & DECIMAL_MASK:
-		return decimal
-	else:
-		return -1
+	for block, start in enumerate(index1):
+		if start not in offsets:
+			base = start << shift
+			offsets[start] = [offset for offset, record in enumerate(index2[base:base + block_size]) if record in records]
+		block_start = block << shift
+		codes.extend(block_start + offset for offset in offsets[start])
 
+	return codes
 
-def _PyUnicode_IsDecimalDigit(ch: str) -> int:  # pragma: no cover
+
+class Database:
 	"""
-	Returns whether the string is decimal digits.
+	The character database and type tables for a version of Unicode, and the functions which use them.
 
-	:param ch:
+	Use :func:`~.database` rather than creating these directly, so the tables for each version are only loaded once.
+
+	:param unidata_version: The version of Unicode to load the tables for, or :py:obj:`None` for the default version.
 	"""
 
-	if _PyUnicode_ToDecimalDigit(ch) < 0:
-		return 0
-	return 1
+	def __init__(self, unidata_version: "Optional[str]" = None):
+		#: The version of Unicode of the tables, or :py:obj:`None` for the default version.
+		self.unidata_version = unidata_version
 
+		tables = load_tables(unidata_version)
+		self.SHIFT: int = tables["SHIFT"]
+		self.index1 = tables["index1"]
+		self.index2 = tables["index2"]
 
-def _PyUnicode_ToDigit(ch: str) -> int:
-	"""
-	Returns the integer digit (0-9) for Unicode characters having this property, -1 otherwise.
+		# The record indices of the Latin-1 characters, which skip the two-level index.
+		self.latin1_records = tables["latin1_records"]
 
-	:param ch:
-	"""
+		# The type records, stored column-wise.
+		self.record_upper = tables["record_upper"]
+		self.record_lower = tables["record_lower"]
+		self.record_title = tables["record_title"]
+		self.record_decimal = tables["record_decimal"]
+		self.record_digit = tables["record_digit"]
+		self.record_flags = tables["record_flags"]
+		self.record_numeric = tables["record_numeric"]
 
-	record = data[index[ord(ch)]]
-	upper, lower, title, decimal, digit, flags = record
+		# One byte per record for each flag, so a predicate is a single lookup.
+		self.record_is_alpha = tables["record_is_alpha"]
+		self.record_is_decimal = tables["record_is_decimal"]
+		self.record_is_digit = tables["record_is_digit"]
+		self.record_is_lower = tables["record_is_lower"]
+		self.record_is_linebreak = tables["record_is_linebreak"]
+		self.record_is_space = tables["record_is_space"]
+		self.record_is_title = tables["record_is_title"]
+		self.record_is_upper = tables["record_is_upper"]
+		self.record_is_xid_start = tables["record_is_xid_start"]
+		self.record_is_xid_continue = tables["record_is_xid_continue"]
+		self.record_is_printable = tables["record_is_printable"]
+		self.record_is_numeric = tables["record_is_numeric"]
+		self.record_is_case_ignorable = tables["record_is_case_ignorable"]
+		self.record_is_cased = tables["record_is_cased"]
+		self.record_is_extended_case = tables["record_is_extended_case"]
 
-	if flags & DIGIT_MASK:
-		return digit
-	else:
-		return -1
+		# The case mappings of the records with EXTENDED_CASE_MASK set.
+		# Their upper, lower and title fields are an offset into this array, with the length of the mapping in the top byte.
+		# Each mapping is preceded by the simple mapping, and the case folding
+		# (unless it can be inferred from the lowercase mapping) follows the lowercase mapping.
+		self.extended_case = tables["extended_case"]
 
+		# The whitespace and line break characters.
+		self.WHITESPACE: "FrozenSet[str]" = frozenset(map(chr, tables["whitespace"]))
+		self.LINEBREAKS: "FrozenSet[str]" = frozenset(map(chr, tables["linebreaks"]))
 
-def _PyUnicode_IsDigit(ch: str) -> int:  # pragma: no cover
-	"""
-	Returns whether the string is digits.
+		self.numeric_values = tables["numeric_values"]
+		self.numeric_numerators = tables["numeric_numerators"]
+		self.numeric_denominators = tables["numeric_denominators"]
 
-	:param ch:
-	"""
+		# The character database: the index, and the records stored column-wise.
+		self.DB_SHIFT: int = tables["DB_SHIFT"]
+		self.db_index1 = tables["db_index1"]
+		self.db_index2 = tables["db_index2"]
+		self.db_category = tables["db_category"]
+		self.db_combining = tables["db_combining"]
+		self.db_bidirectional = tables["db_bidirectional"]
+		self.db_mirrored = tables["db_mirrored"]
+		self.db_east_asian_width = tables["db_east_asian_width"]
+		self.db_quickcheck = tables["db_quickcheck"]
 
-	if _PyUnicode_ToDigit(ch) < 0:
-		return 0
-	return 1
+		# The decompositions, and the pairs of characters which compose.
+		self.DECOMP_SHIFT: int = tables["DECOMP_SHIFT"]
+		self.decomp_data = tables["decomp_data"]
+		self.decomp_index1 = tables["decomp_index1"]
+		self.decomp_index2 = tables["decomp_index2"]
+		comp_pairs = tables["comp_pairs"]
 
+		# One Fraction per distinct numeric value, created on first use.
+		# Sharing them means repeated lookups return the same object without allocating.
+		self._numeric_fractions: "List[Optional[Fraction]]" = [None] * len(self.numeric_values)
 
-def _PyUnicode_IsNumeric(ch: str) -> int:  # pragma: no cover
-	"""
-	Returns the numeric value as double for Unicode characters having this property, -1.0 otherwise.
+		# The tables returned by decimal_translation_table_impl() and simple_casefold_table_impl(), created on first use.
+		self._decimal_translation_table: "Optional[Dict[int, str]]" = None
+		self._simple_casefold_table: "Optional[Dict[int, str]]" = None
 
-	:param ch:
-	"""
+		# The full case mappings of the characters the string functions have seen,
+		# keyed by code point for str.translate(), and the characters seen.
+		self._lower_table: "Dict[int, str]" = {}
+		self._upper_table: "Dict[int, str]" = {}
+		self._title_table: "Dict[int, str]" = {}
+		self._folded_table: "Dict[int, str]" = {}
+		self._cased: "Set[str]" = set()
+		self._case_ignorable: "Set[str]" = set()
+		self._case_seen: "Set[str]" = set()
 
-	record = data[index[ord(ch)]]
-	upper, lower, title, decimal, digit, flags = record
-	return flags & NUMERIC_MASK != 0
+		# The NFC pairs, as {first: {last: composed}}.
+		self.nfc_pairs: "Dict[int, Dict[int, int]]" = {}
+		for index in range(0, len(comp_pairs), 3):
+			self.nfc_pairs.setdefault(comp_pairs[index], {})[comp_pairs[index + 1]] = comp_pairs[index + 2]
 
+		# Characters whose canonical decomposition was a different single character in an older version of Unicode,
+		# mapped to that character. Only filled in by PreviousDatabase.
+		self._normalization_changes: "Dict[int, int]" = {}
 
-def _PyUnicode_ToNumeric(ch: str) -> float:
-	"""
-	Returns the numeric value as double for Unicode characters having this property, -1.0 otherwise.
-	"""
+		# For each normalization form, the characters normalize() has seen which have
+		# a combining class of 0 and are certainly normalized.
+		# ASCII and C1 controls are normalized in every form, and never combine.
+		self._normalize_boundaries: "Dict[str, Set[str]]" = {
+				form: {chr(code) for code in range(0xa0)}
+				for form in NORMALIZATION_FORMS
+				}
 
-	for value, codepoints in numeric_items.items():
-		if ord(ch) in codepoints:
-			return eval(value)
+		# The characters parse_int_impl() strips, which are those of WHITESPACE rather than the interpreter's.
+		self._whitespace_chars = ''.join(sorted(self.WHITESPACE))
 
-	return -1.0
+		# Matches a line break, treating CR LF as one.
+		self._linebreak = re.compile("\r\n|[" + ''.join(map(re.escape, sorted(self.LINEBREAKS))) + ']')
 
+		# The characters is_identifier_impl() has seen which may start an identifier (including the underscore),
+		# and which may continue one, and all the characters it has seen.
+		self._identifier_start: "Set[str]" = {'_'}
+		self._identifier_continue: "Set[str]" = set()
+		self._identifier_seen: "Set[str]" = set()
 
-def _PyUnicode_IsPrintable(ch: str) -> int:  # pragma: no cover
-	r"""
-	Returns 1 for Unicode characters to be hex-escaped when repr()ed, 0 otherwise.
+		# The characters isprintable_impl() and escape_nonprintable_impl() have seen which are printable,
+		# and all the characters they have seen, starting with Latin-1.
+		self._printable_seen: "Set[str]" = {chr(code) for code in range(256)}
+		self._printable: "Set[str]" = {
+				ch
+				for ch in self._printable_seen
+				if self.record_is_printable[self.latin1_records[ord(ch)]]
+				}
 
-	All characters except those characters defined in the Unicode character
-	database as following categories are considered printable.
+		# Precomputed results for the Latin-1 characters, keyed by character,
+		# for use by the functions in pyunicodedata before they call into this database.
+		# These go through the methods, so they include the changes made by subclasses.
+		self.latin1_decimal = {chr(code): self._PyUnicode_ToDecimalDigit(chr(code)) for code in range(256)}
+		self.latin1_digit = {chr(code): self._PyUnicode_ToDigit(chr(code)) for code in range(256)}
+		self.latin1_numeric = {chr(code): self._PyUnicode_ToNumeric(chr(code)) for code in range(256)}
 
-	* Cc (Other, Control)
-	* Cf (Other, Format)
-	* Cs (Other, Surrogate)
-	* Co (Other, Private Use)
-	* Cn (Other, Not Assigned)
-	* Zl Separator, Line ('\u2028', LINE SEPARATOR)
-	* Zp Separator, Paragraph ('\u2029', PARAGRAPH SEPARATOR)
-	* Zs (Separator, Space) other than ASCII space('\x20').
+	def __repr__(self) -> str:
+		return f"{type(self).__name__}({self.unidata_version!r})"
 
-	:param ch:
-	"""
+	def gettyperecordindex(self, code: int) -> int:
+		"""
+		Returns the index of the type record for the given code point.
 
-	record = data[index[ord(ch)]]
-	upper, lower, title, decimal, digit, flags = record
-	return flags & PRINTABLE_MASK != 0
+		:param code:
+		"""
 
+		if code >= 0x110000:
+			return 0
 
-def _PyUnicode_IsLowercase(ch: str) -> int:  # pragma: no cover
-	"""
-	Returns 1 for Unicode characters having the category 'Ll', 0 otherwise.
+		index = self.index1[(code >> self.SHIFT)]
+		return self.index2[(index << self.SHIFT) + (code & ((1 << self.SHIFT) - 1))]
 
-	:param ch:
-	"""
+	def gettyperecord(self, code: int):
+		"""
+		Returns the type record for the given code point.
+
+		:param code:
+		"""
+
+		index = self.gettyperecordindex(code)
+		return (
+				self.record_upper[index],
+				self.record_lower[index],
+				self.record_title[index],
+				self.record_decimal[index],
+				self.record_digit[index],
+				self.record_flags[index],
+				self.record_numeric[index],
+				)
+
+	def _PyUnicode_IsTitlecase(self, ch: str) -> int:
+		"""
+		Returns 1 for Unicode characters having the category 'Lt', 0 otherwise.
+
+		:param ch:
+		"""
+
+		code = ord(ch)
+		index = self.latin1_records[code] if code < 256 else self.gettyperecordindex(code)
+		return self.record_is_title[index]
+
+	def _PyUnicode_IsXidStart(self, ch: str) -> int:
+		"""
+		Returns 1 for Unicode characters having the XID_Start property, 0 otherwise.
+
+		:param ch:
+		"""
+
+		code = ord(ch)
+		index = self.latin1_records[code] if code < 256 else self.gettyperecordindex(code)
+		return self.record_is_xid_start[index]
+
+	def _PyUnicode_IsXidContinue(self, ch: str) -> int:
+		"""
+		Returns 1 for Unicode characters having the XID_Continue property, 0 otherwise.
+
+		:param ch:
+		"""
+
+		code = ord(ch)
+		index = self.latin1_records[code] if code < 256 else self.gettyperecordindex(code)
+		return self.record_is_xid_continue[index]
+
+	def _PyUnicode_ToDecimalDigit(self, ch: str) -> int:
+		"""
+		Returns the integer decimal (0-9) for Unicode characters having this property, -1 otherwise.
+
+		:param ch:
+		"""
+
+		code = ord(ch)
+		index = self.latin1_records[code] if code < 256 else self.gettyperecordindex(code)
+
+		if self.record_is_decimal[index]:
+			return self.record_decimal[index]
+		else:
+			return -1
+
+	def _PyUnicode_IsDecimalDigit(self, ch: str) -> int:  # pragma: no cover
+		"""
+		Returns whether the string is decimal digits.
+
+		:param ch:
+		"""
+
+		if self._PyUnicode_ToDecimalDigit(ch) < 0:
+			return 0
+		return 1
+
+	def _PyUnicode_ToDigit(self, ch: str) -> int:
+		"""
+		Returns the integer digit (0-9) for Unicode characters having this property, -1 otherwise.
+
+		:param ch:
+		"""
+
+		code = ord(ch)
+		index = self.latin1_records[code] if code < 256 else self.gettyperecordindex(code)
+
+		if self.record_is_digit[index]:
+			return self.record_digit[index]
+		else:
+			return -1
+
+	def _PyUnicode_IsDigit(self, ch: str) -> int:  # pragma: no cover
+		"""
+		Returns whether the string is digits.
+
+		:param ch:
+		"""
+
+		if self._PyUnicode_ToDigit(ch) < 0:
+			return 0
+		return 1
+
+	def _PyUnicode_IsNumeric(self, ch: str) -> int:  # pragma: no cover
+		"""
+		Returns the numeric value as double for Unicode characters having this property, -1.0 otherwise.
+
+		:param ch:
+		"""
+
+		code = ord(ch)
+		index = self.latin1_records[code] if code < 256 else self.gettyperecordindex(code)
+		return self.record_is_numeric[index]
+
+	def _PyUnicode_ToNumeric(self, ch: str) -> float:
+		"""
+		Returns the numeric value as double for Unicode characters having this property, -1.0 otherwise.
+		"""
+
+		code = ord(ch)
+		index = self.latin1_records[code] if code < 256 else self.gettyperecordindex(code)
+
+		if self.record_is_numeric[index]:
+			return self.numeric_values[self.record_numeric[index]]
+		else:
+			return -1.0
+
+	def _PyUnicode_ToNumericFraction(self, ch: str) -> "Optional[Fraction]":
+		"""
+		Returns the exact numeric value as a :class:`fractions.Fraction` for Unicode characters having this property,
+		:py:obj:`None` otherwise.
+		"""
+
+		code = ord(ch)
+		index = self.latin1_records[code] if code < 256 else self.gettyperecordindex(code)
+
+		if not self.record_is_numeric[index]:
+			return None
+
+		numeric = self.record_numeric[index]
+
+		fraction = self._numeric_fractions[numeric]
+		if fraction is None:
+			# fractions is slow to import, and most programs never need it.
+			from fractions import Fraction  # pylint: disable=redefined-outer-name
+
+			fraction = Fraction(self.numeric_numerators[numeric], self.numeric_denominators[numeric])
+			self._numeric_fractions[numeric] = fraction
+
+		return fraction
+
+	def _PyUnicode_IsPrintable(self, ch: str) -> int:
+		r"""
+		Returns 1 for Unicode characters to be hex-escaped when repr()ed, 0 otherwise.
+
+		All characters except those characters defined in the Unicode character
+		database as following categories are considered printable.
+
+		* Cc (Other, Control)
+		* Cf (Other, Format)
+		* Cs (Other, Surrogate)
+		* Co (Other, Private Use)
+		* Cn (Other, Not Assigned)
+		* Zl Separator, Line ('\u2028', LINE SEPARATOR)
+		* Zp Separator, Paragraph ('\u2029', PARAGRAPH SEPARATOR)
+		* Zs (Separator, Space) other than ASCII space('\x20').
+
+		:param ch:
+		"""
+
+		code = ord(ch)
+		index = self.latin1_records[code] if code < 256 else self.gettyperecordindex(code)
+		return self.record_is_printable[index]
+
+	def _PyUnicode_IsLowercase(self, ch: str) -> int:  # pragma: no cover
+		"""
+		Returns 1 for Unicode characters having the category 'Ll', 0 otherwise.
+
+		:param ch:
+		"""
+
+		code = ord(ch)
+		index = self.latin1_records[code] if code < 256 else self.gettyperecordindex(code)
+		return self.record_is_lower[index]
+
+	def _PyUnicode_IsUppercase(self, ch: str) -> int:  # pragma: no cover
+		"""
+		Returns 1 for Unicode characters having the category 'Lu', 0 otherwise.
+
+		:param ch:
+		"""
+
+		code = ord(ch)
+		index = self.latin1_records[code] if code < 256 else self.gettyperecordindex(code)
+		return self.record_is_upper[index]
+
+	def _PyUnicode_IsCased(self, ch: str) -> int:  # pragma: no cover
+		"""
+		Returns 1 for Unicode characters having the Cased property, 0 otherwise.
+
+		:param ch:
+		"""
+
+		code = ord(ch)
+		index = self.latin1_records[code] if code < 256 else self.gettyperecordindex(code)
+		return self.record_is_cased[index]
+
+	def _PyUnicode_IsCaseIgnorable(self, ch: str) -> int:  # pragma: no cover
+		"""
+		Returns 1 for Unicode characters having the Case_Ignorable property, 0 otherwise.
+
+		:param ch:
+		"""
+
+		code = ord(ch)
+		index = self.latin1_records[code] if code < 256 else self.gettyperecordindex(code)
+		return self.record_is_case_ignorable[index]
+
+	def _simple_case(self, ch: str, column) -> str:
+		"""
+		Returns the simple case mapping of ``ch`` from the given record column.
+
+		:param ch:
+		:param column: One of ``record_upper``, ``record_lower`` and ``record_title``.
+		"""
+
+		code = ord(ch)
+		index = self.latin1_records[code] if code < 256 else self.gettyperecordindex(code)
+
+		if self.record_is_extended_case[index]:
+			return chr(self.extended_case[(column[index] & 0xFFFF) - 1])
+
+		return chr(code + column[index])
+
+	def _full_case(self, ch: str, column) -> str:
+		"""
+		Returns the full case mapping of ``ch`` from the given record column.
+
+		:param ch:
+		:param column: One of ``record_upper``, ``record_lower`` and ``record_title``.
+		"""
+
+		code = ord(ch)
+		index = self.latin1_records[code] if code < 256 else self.gettyperecordindex(code)
+
+		if self.record_is_extended_case[index]:
+			field = column[index]
+			start = field & 0xFFFF
+			return ''.join(map(chr, self.extended_case[start:start + (field >> 24)]))
+
+		return chr(code + column[index])
+
+	def _PyUnicode_ToLowercase(self, ch: str) -> str:
+		"""
+		Returns the simple lowercase mapping of ``ch``.
+
+		:param ch:
+		"""
+
+		return self._simple_case(ch, self.record_lower)
+
+	def _PyUnicode_ToUppercase(self, ch: str) -> str:
+		"""
+		Returns the simple uppercase mapping of ``ch``.
+
+		:param ch:
+		"""
+
+		return self._simple_case(ch, self.record_upper)
+
+	def _PyUnicode_ToTitlecase(self, ch: str) -> str:
+		"""
+		Returns the simple titlecase mapping of ``ch``.
+
+		:param ch:
+		"""
+
+		return self._simple_case(ch, self.record_title)
+
+	def _PyUnicode_ToLowerFull(self, ch: str) -> str:
+		"""
+		Returns the full lowercase mapping of ``ch``, ignoring the context-dependent final sigma.
+
+		:param ch:
+		"""
+
+		return self._full_case(ch, self.record_lower)
+
+	def _PyUnicode_ToUpperFull(self, ch: str) -> str:
+		"""
+		Returns the full uppercase mapping of ``ch``.
+
+		:param ch:
+		"""
+
+		return self._full_case(ch, self.record_upper)
+
+	def _PyUnicode_ToTitleFull(self, ch: str) -> str:
+		"""
+		Returns the full titlecase mapping of ``ch``.
+
+		:param ch:
+		"""
+
+		return self._full_case(ch, self.record_title)
+
+	def _PyUnicode_ToFoldedFull(self, ch: str) -> str:
+		"""
+		Returns the full case folding of ``ch``.
+
+		:param ch:
+		"""
+
+		code = ord(ch)
+		index = self.latin1_records[code] if code < 256 else self.gettyperecordindex(code)
+
+		if self.record_is_extended_case[index]:
+			field = self.record_lower[index]
+			length = (field >> 20) & 7
+			if length:
+				start = (field & 0xFFFF) + (field >> 24) + 1
+				return ''.join(map(chr, self.extended_case[start:start + length]))
+
+		return self._full_case(ch, self.record_lower)
+
+	def _PyUnicode_ToFoldedSimple(self, ch: str) -> str:
+		"""
+		Returns the simple case folding of ``ch``.
+
+		:param ch:
+		"""
+
+		code = ord(ch)
+		index = self.latin1_records[code] if code < 256 else self.gettyperecordindex(code)
+
+		if not self.record_is_extended_case[index]:
+			return chr(code + self.record_lower[index])
+
+		field = self.record_lower[index]
+		if (field >> 20) & 7:
+			return chr(self.extended_case[(field & 0xFFFF) + (field >> 24)])
+		if field >> 24 == 1:
+			# the case folding is the lowercase mapping
+			return chr(self.extended_case[field & 0xFFFF])
+		return ch
+
+	def decimal_translation_table_impl(self) -> "Dict[int, str]":
+		"""
+		Returns a table for :meth:`str.translate` which maps every decimal digit to the ASCII digit with the same value.
+
+		The table is created on first use, and the same dictionary is returned each time.
+		"""
+
+		if self._decimal_translation_table is None:
+			records = {index for index, is_decimal in enumerate(self.record_is_decimal) if is_decimal}
+			self._decimal_translation_table = {
+					code: "0123456789"[self.record_decimal[self.gettyperecordindex(code)]]
+					for code in _codes_with_records(records, self.index1, self.index2, self.SHIFT)
+					if not 0x30 <= code <= 0x39
+					}
+
+		return self._decimal_translation_table
+
+	def simple_casefold_table_impl(self) -> "Dict[int, str]":
+		"""
+		Returns a table for :meth:`str.translate` which maps every character to its simple case folding.
+
+		Unlike :meth:`str.casefold`, each character is replaced by a single character,
+		so the table suits caseless matching where the length of the string must not change.
+
+		The table is created on first use, and the same dictionary is returned each time.
+		"""
+
+		if self._simple_casefold_table is None:
+			records = {
+					index
+					for index, (lower, is_extended_case) in enumerate(zip(self.record_lower, self.record_is_extended_case))
+					if lower or is_extended_case
+					}
+			table = {}
+			for code in _codes_with_records(records, self.index1, self.index2, self.SHIFT):
+				ch = chr(code)
+				folded = self._PyUnicode_ToFoldedSimple(ch)
+				if folded != ch:
+					table[code] = folded
+			self._simple_casefold_table = table
+
+		return self._simple_casefold_table
+
+	def _add_case_mappings(self, input: str) -> None:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Adds the case mappings of the characters of ``input`` not seen before to the tables.
+
+		:param input:
+		"""
+
+		if self._case_seen.issuperset(input):
+			return
+
+		new = set(input)
+		new -= self._case_seen
+		for ch in new:
+			code = ord(ch)
+			self._lower_table[code] = self._PyUnicode_ToLowerFull(ch)
+			self._upper_table[code] = self._PyUnicode_ToUpperFull(ch)
+			self._title_table[code] = self._PyUnicode_ToTitleFull(ch)
+			self._folded_table[code] = self._PyUnicode_ToFoldedFull(ch)
+			if self._PyUnicode_IsCased(ch):
+				self._cased.add(ch)
+			if self._PyUnicode_IsCaseIgnorable(ch):
+				self._case_ignorable.add(ch)
+
+		self._case_seen.update(new)
+
+	def _is_final_sigma(self, before: str, after: str, first: bool, last: bool) -> bool:
+		"""
+		Returns whether a capital sigma is at the end of a word, and so lowercases to a final sigma.
+
+		That is, it is preceded by a cased letter and not followed by one,
+		skipping any case-ignorable characters in between (see handle_capital_sigma in unicodeobject.c).
+
+		:param before: The text between the previous capital sigma (or the start of the string) and this one.
+		:param after: The text between this capital sigma and the next one (or the end of the string).
+		:param first: Whether there is no capital sigma before this one.
+		:param last: Whether there is no capital sigma after this one.
+		"""
+
+		for ch in reversed(before):
+			if ch not in self._case_ignorable:
+				if ch not in self._cased:
+					return False
+				break
+		else:
+			# Otherwise the previous character is another (cased) capital sigma.
+			if first:
+				return False
+
+		for ch in after:
+			if ch not in self._case_ignorable:
+				return ch not in self._cased
+
+		return last
+
+	def unicode_lower_impl(self, input: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Return a copy of the string ``input`` converted to lowercase, as :meth:`str.lower` does.
+
+		:param input:
+		"""
+
+		if not isinstance(input, str):
+			raise TypeError(f"lower() argument must be str, not {type(input).__name__}")
+
+		if input.isascii():
+			# ASCII case mappings are the same in every version of Unicode
+			return input.lower()
+
+		self._add_case_mappings(input)
+
+		if "\u03a3" not in input:
+			return input.translate(self._lower_table)
+
+		# A capital sigma lowercases to a final sigma at the end of a word.
+		parts = input.split("\u03a3")
+		last = len(parts) - 2
+		chunks = [parts[0].translate(self._lower_table)]
+		for i in range(len(parts) - 1):
+			if self._is_final_sigma(parts[i], parts[i + 1], i == 0, i == last):
+				chunks.append("\u03c2")
+			else:
+				chunks.append("\u03c3")
+			chunks.append(parts[i + 1].translate(self._lower_table))
+
+		return ''.join(chunks)
+
+	def unicode_upper_impl(self, input: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Return a copy of the string ``input`` converted to uppercase, as :meth:`str.upper` does.
+
+		:param input:
+		"""
+
+		if not isinstance(input, str):
+			raise TypeError(f"upper() argument must be str, not {type(input).__name__}")
+
+		if input.isascii():
+			return input.upper()
+
+		self._add_case_mappings(input)
+		return input.translate(self._upper_table)
+
+	def unicode_casefold_impl(self, input: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Return a version of the string ``input`` suitable for caseless comparisons, as :meth:`str.casefold` does.
+
+		:param input:
+		"""
+
+		if not isinstance(input, str):
+			raise TypeError(f"casefold() argument must be str, not {type(input).__name__}")
+
+		if input.isascii():
+			return input.lower()
+
+		self._add_case_mappings(input)
+		return input.translate(self._folded_table)
+
+	def unicode_title_impl(self, input: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Return a titlecased version of the string ``input``, as :meth:`str.title` does.
+
+		Each cased character following an uncased one is titlecased, and the remaining characters are lowercased.
+
+		:param input:
+		"""
+
+		if not isinstance(input, str):
+			raise TypeError(f"title() argument must be str, not {type(input).__name__}")
+
+		if input.isascii():
+			return input.title()
+
+		self._add_case_mappings(input)
+
+		chunks = []
+		previous_is_cased = False
+		for i, ch in enumerate(input):
+			if not previous_is_cased:
+				chunks.append(self._title_table[ord(ch)])
+			elif ch == "\u03a3":
+				sigma_start = input.rfind("\u03a3", 0, i)
+				sigma_end = input.find("\u03a3", i + 1)
+				final = self._is_final_sigma(
+						input[sigma_start + 1:i],
+						input[i + 1:] if sigma_end == -1 else input[i + 1:sigma_end],
+						sigma_start == -1,
+						sigma_end == -1,
+						)
+				chunks.append("\u03c2" if final else "\u03c3")
+			else:
+				chunks.append(self._lower_table[ord(ch)])
+			previous_is_cased = ch in self._cased
+
+		return ''.join(chunks)
+
+	def _getrecord_ex(self, code: int) -> int:
+		"""
+		Returns the index of the database record for the given code point.
+
+		:param code:
+		"""
+
+		if code >= 0x110000:
+			return 0
+
+		index = self.db_index1[(code >> self.DB_SHIFT)]
+		return self.db_index2[(index << self.DB_SHIFT) + (code & ((1 << self.DB_SHIFT) - 1))]
+
+	def unicodedata_UCD_category_impl(self, chr: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the general category assigned to the character chr as string.
+
+		:param chr:
+		"""
+
+		return CATEGORY_NAMES[self.db_category[self._getrecord_ex(ord(chr))]]
+
+	def unicodedata_UCD_bidirectional_impl(self, chr: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the bidirectional class assigned to the character chr as string.
+
+		If no such value is defined, an empty string is returned.
+
+		:param chr:
+		"""
+
+		return BIDIRECTIONAL_NAMES[self.db_bidirectional[self._getrecord_ex(ord(chr))]]
+
+	def unicodedata_UCD_combining_impl(self, chr: str) -> int:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the canonical combining class assigned to the character chr as integer.
+
+		Returns 0 if no combining class is defined.
+
+		:param chr:
+		"""
+
+		return self.db_combining[self._getrecord_ex(ord(chr))]
+
+	def unicodedata_UCD_mirrored_impl(self, chr: str) -> int:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the mirrored property assigned to the character chr as integer.
+
+		Returns 1 if the character has been identified as a "mirrored"
+		character in bidirectional text, 0 otherwise.
+
+		:param chr:
+		"""
+
+		return self.db_mirrored[self._getrecord_ex(ord(chr))]
+
+	def unicodedata_UCD_east_asian_width_impl(self, chr: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the east asian width assigned to the character chr as string.
+
+		:param chr:
+		"""
+
+		return EASTASIANWIDTH_NAMES[self.db_east_asian_width[self._getrecord_ex(ord(chr))]]
+
+	def get_decomp_record(self, code: int) -> "Tuple[int, int, int]":
+		"""
+		Returns the index of the decomposition of the given code point in ``decomp_data``,
+		the index of its prefix in ``DECOMP_PREFIX``, and its length.
+
+		:param code:
+		"""
+
+		if code >= 0x110000:
+			index = 0
+		else:
+			index = self.decomp_index1[(code >> self.DECOMP_SHIFT)]
+			index = self.decomp_index2[(index << self.DECOMP_SHIFT) + (code & ((1 << self.DECOMP_SHIFT) - 1))]
+
+		# high byte is number of hex bytes (usually one or two), low byte is prefix code
+		count = self.decomp_data[index] >> 8
+		prefix = self.decomp_data[index] & 255
+
+		return index + 1, prefix, count
+
+	def unicodedata_UCD_decomposition_impl(self, chr: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the character decomposition mapping assigned to the character chr as string.
+
+		An empty string is returned in case no such mapping is defined.
+
+		:param chr:
+		"""
+
+		index, prefix, count = self.get_decomp_record(ord(chr))
+		decomp = [DECOMP_PREFIX[prefix]] if prefix else []
+		decomp.extend(f"{code:04X}" for code in self.decomp_data[index:index + count])
+		return ' '.join(decomp)
+
+	def _decompose(self, input: str, k: bool) -> "List[int]":  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the canonical (or, if ``k`` is :py:obj:`True`, compatibility) decomposition of ``input``,
+		in canonical order, as a list of code points.
+
+		:param input:
+		:param k:
+		"""
+
+		output: "List[int]" = []
+		append = output.append
+		# The combining class of each character in output.
+		combining: "List[int]" = []
+		stack: "List[int]" = []
+
+		for ch in input:
+			code = ord(ch)
+
+			# Hangul Decomposition. Neither the syllables nor the conjoining jamo
+			# need any table lookups, as the jamo do not decompose or combine.
+			if SBase <= code < SBase + SCount:
+				SIndex = code - SBase
+				append(LBase + SIndex // NCount)
+				append(VBase + (SIndex % NCount) // TCount)
+				T = TBase + SIndex % TCount
+				if T != TBase:
+					append(T)
+					combining.extend((0, 0, 0))
+				else:
+					combining.extend((0, 0))
+				continue
+
+			if LBase <= code < TBase + TCount:
+				append(code)
+				combining.append(0)
+				continue
+
+			stack.append(code)
+
+			while stack:
+				code = stack.pop()
+
+				# Hangul Decomposition.
+				if SBase <= code < SBase + SCount:
+					SIndex = code - SBase
+					append(LBase + SIndex // NCount)
+					append(VBase + (SIndex % NCount) // TCount)
+					T = TBase + SIndex % TCount
+					if T != TBase:
+						append(T)
+						combining.append(0)
+					combining.extend((0, 0))
+					continue
+
+				# Normalization changes.
+				if code in self._normalization_changes:
+					stack.append(self._normalization_changes[code])
+					continue
+
+				# Other decompositions.
+				index, prefix, count = self.get_decomp_record(code)
+
+				# Copy character if it is not decomposable, or has a
+				# compatibility decomposition, but we do NFD.
+				if not count or (prefix and not k):
+					append(code)
+					combining.append(self.db_combining[self._getrecord_ex(code)])
+					continue
+
+				# Copy decomposition onto the stack, in reverse order.
+				stack.extend(reversed(self.decomp_data[index:index + count]))
+
+		if not any(combining):
+			return output
+
+		# Sort canonically.
+		prev = combining[0]
+
+		for i in range(1, len(output)):
+			cur = combining[i]
+			if prev == 0 or cur == 0 or prev <= cur:
+				prev = cur
+				continue
+
+			# Non-canonical order. Need to switch *i with previous.
+			o = i - 1
+			while True:
+				output[o + 1], output[o] = output[o], output[o + 1]
+				combining[o + 1], combining[o] = combining[o], combining[o + 1]
+				o -= 1
+				if o < 0:
+					break
+				prev = combining[o]
+				if prev == 0 or prev <= cur:
+					break
+
+			prev = combining[i]
+
+		return output
 
-	record = data[index[ord(ch)]]
-	upper, lower, title, decimal, digit, flags = record
-	return flags & LOWER_MASK != 0
+	def nfd_nfkd(self, input: str, k: bool) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the NFD (or, if ``k`` is :py:obj:`True`, NFKD) normal form of ``input``.
 
+		:param input:
+		:param k:
+		"""
 
-def _PyUnicode_IsUppercase(ch: str) -> int:  # pragma: no cover
+		return ''.join(map(chr, self._decompose(input, k)))
+
+	def nfc_nfkc(self, input: str, k: bool) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the NFC (or, if ``k`` is :py:obj:`True`, NFKC) normal form of ``input``.
+
+		:param input:
+		:param k:
+		"""
+
+		data = self._decompose(input, k)
+		length = len(data)
+		output: "List[int]" = []
+		skipped: "Set[int]" = set()
+
+		i = 0
+		while i < length:
+			if i in skipped:
+				# *i character is skipped. Remove from list.
+				skipped.remove(i)
+				i += 1
+				continue
+
+			# Hangul Composition. We don't need to check for <LV,T>
+			# pairs, since we always have decomposed data.
+			code = data[i]
+			if LBase <= code < LBase + LCount and i + 1 < length and VBase <= data[i + 1] < VBase + VCount:
+				# check L character is a modern leading consonant (0x1100 ~ 0x1112)
+				# and V character is a modern vowel (0x1161 ~ 0x1175).
+				LIndex = code - LBase
+				VIndex = data[i + 1] - VBase
+				code = SBase + (LIndex * VCount + VIndex) * TCount
+				i += 2
+				if i < length and TBase < data[i] < TBase + TCount:
+					# check T character is a modern trailing consonant (0x11A8 ~ 0x11C2).
+					code += data[i] - TBase
+					i += 1
+				output.append(code)
+				continue
+
+			pairs = self.nfc_pairs.get(code)
+			if pairs is None:
+				output.append(code)
+				i += 1
+				continue
+
+			# Find next unblocked character.
+			i1 = i + 1
+			comb = 0
+			while i1 < length:
+				code1 = data[i1]
+				comb1 = self.db_combining[self._getrecord_ex(code1)]
+				if comb:
+					if comb1 == 0:
+						break
+					if comb >= comb1:
+						# Character is blocked.
+						i1 += 1
+						continue
+
+				composed = pairs.get(code1)
+				if composed is None:
+					# i1 cannot be combined with i. If i1 is a starter,
+					# we don't need to look further.
+					# Otherwise, record the combining class.
+					if comb1 == 0:
+						break
+					comb = comb1
+					i1 += 1
+					continue
+
+				# Replace the original character, and mark the second character unused.
+				code = composed
+				skipped.add(i1)
+				i1 += 1
+				pairs = self.nfc_pairs.get(code)
+				if pairs is None:
+					break
+
+			output.append(code)
+			i += 1
+
+		return ''.join(map(chr, output))
+
+	def is_normalized_quickcheck(self, input: str, nfc: bool, k: bool, yes_only: bool) -> int:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Return :py:obj:`~.YES` if ``input`` is certainly normalized,
+		:py:obj:`~.NO` or :py:obj:`~.MAYBE` if it might not be.
+
+		:param input:
+		:param nfc: Whether to check for composed (NFC/NFKC) rather than decomposed (NFD/NFKD) form.
+		:param k: Whether to check for a compatibility form (NFKC/NFKD).
+		:param yes_only: If :py:obj:`True`, return :py:obj:`~.MAYBE` as soon as the answer is not certainly :py:obj:`~.YES`.
+		"""
+
+		# The two quickcheck bits at this shift have type QuickcheckResult.
+		quickcheck_shift = (4 if nfc else 0) + (2 if k else 0)
+
+		result = YES  # certainly normalized, unless we find something
+		prev_combining = 0
+
+		for ch in input:
+			index = self._getrecord_ex(ord(ch))
+
+			combining = self.db_combining[index]
+			if combining and prev_combining > combining:
+				return NO  # non-canonical sort order, not normalized
+			prev_combining = combining
+
+			quickcheck = (self.db_quickcheck[index] >> quickcheck_shift) & 3
+			if yes_only:
+				if quickcheck:
+					return MAYBE
+			elif quickcheck == NO:
+				return NO
+			elif quickcheck == MAYBE:
+				result = MAYBE  # this string might need normalization
+
+		return result
+
+	def _find_non_boundaries(self, input: str, boundaries: "Set[str]", mask: int) -> "Set[str]":  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the characters of ``input`` which are not normalization boundaries.
+
+		Characters not seen before are looked up, and added to ``boundaries`` if they are boundaries.
+
+		:param input:
+		:param boundaries: The known boundaries for the normalization form, from ``_normalize_boundaries``.
+		:param mask: The quickcheck bits for the normalization form.
+		"""
+
+		if boundaries.issuperset(input):
+			return set()
+
+		others = set(input)
+		others -= boundaries
+		for ch in others:
+			index = self._getrecord_ex(ord(ch))
+			if not self.db_combining[index] and not self.db_quickcheck[index] & mask:
+				boundaries.add(ch)
+
+		others -= boundaries
+		return others
+
+	def unicodedata_UCD_normalize_impl(self, form: str, input: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Return the normal form ``form`` for the Unicode string ``input``.
+
+		Valid values for form are 'NFC', 'NFKC', 'NFD', and 'NFKD'.
+
+		The string is returned unchanged if it is already normalized.
+		Otherwise only the parts of it which might not be normalized are passed through
+		the decompose, reorder and compose steps, and the rest is copied as-is.
+
+		:param form:
+		:param input:
+		"""
+
+		if not isinstance(form, str):
+			raise TypeError(f"normalize() argument 1 must be str, not {type(form).__name__}")
+		if not isinstance(input, str):
+			raise TypeError(f"normalize() argument 2 must be str, not {type(input).__name__}")
+
+		try:
+			nfc, k = NORMALIZATION_FORMS[form]
+		except KeyError:
+			raise ValueError("invalid normalization form") from None
+
+		if input.isascii():
+			# ASCII text is normalized in every form
+			return input
+
+		normalize = self.nfc_nfkc if nfc else self.nfd_nfkd
+		mask = 3 << ((4 if nfc else 0) + (2 if k else 0))
+
+		# The string is split before each character with a combining class of 0
+		# which is certainly normalized, as nothing before such a character
+		# can decompose, reorder or compose with anything after it.
+		boundaries = self._normalize_boundaries[form]
+
+		# If the characters are all boundaries the string is already normalized.
+		others = self._find_non_boundaries(input, boundaries, mask)
+		if not others:
+			return input
+
+		if nfc and any(VBase <= ord(ch) < VBase + VCount for ch in others):
+			# Leading consonants are boundaries, which would make each syllable a segment of its own.
+			# Composing the jamo first gives a canonically equivalent string, with the same normal form.
+			input = _hangul_jamo.sub(_compose_jamo, input)
+
+		# Otherwise each segment which fails the quickcheck is normalized on its own.
+		chunks = []
+		copied = 0  # input[:copied] has been added to chunks
+		segment = 0  # start of the current segment
+		dirty = False  # whether the current segment needs normalizing
+		hangul = False  # whether there are Hangul syllables to decompose
+		prev_combining = 0
+
+		for i, ch in enumerate(input):
+			if ch in boundaries:
+				if dirty:
+					chunks.append(input[copied:segment])
+					chunks.append(normalize(input[segment:i], k))
+					copied = i
+					dirty = False
+				segment = i
+				prev_combining = 0
+				continue
+
+			code = ord(ch)
+			if SBase <= code < SBase + SCount:
+				# Hangul syllables don't combine, and only decompose in NFD and NFKD.
+				# Those outside of dirty segments are decomposed at the end with str.translate().
+				if not nfc:
+					hangul = True
+					if code not in _hangul_decompositions:
+						_hangul_decompositions[code] = self.nfd_nfkd(ch, False)
+				prev_combining = 0
+				continue
+
+			index = self._getrecord_ex(code)
+			combining = self.db_combining[index]
+			if self.db_quickcheck[index] & mask or prev_combining > combining:
+				dirty = True
+			prev_combining = combining
+
+		if not chunks and not dirty:
+			result = input
+		else:
+			chunks.append(input[copied:segment])
+			if dirty:
+				chunks.append(normalize(input[segment:], k))
+			else:
+				chunks.append(input[segment:])
+			result = ''.join(chunks)
+
+		if hangul:
+			return result.translate(_hangul_decompositions)
+
+		return result
+
+	def unicodedata_UCD_is_normalized_impl(self, form: str, input: str) -> bool:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Return whether the Unicode string ``input`` is in the normal form ``form``.
+
+		Valid values for form are 'NFC', 'NFKC', 'NFD', and 'NFKD'.
+
+		Strings made up of characters already known to be normalization boundaries
+		are checked without copying them. Otherwise the quickcheck property answers for most strings,
+		and only a "maybe" from it requires the string to be normalized and compared.
+
+		:param form:
+		:param input:
+		"""
+
+		if not isinstance(form, str):
+			raise TypeError(f"is_normalized() argument 1 must be str, not {type(form).__name__}")
+		if not isinstance(input, str):
+			raise TypeError(f"is_normalized() argument 2 must be str, not {type(input).__name__}")
+
+		try:
+			nfc, k = NORMALIZATION_FORMS[form]
+		except KeyError:
+			raise ValueError("invalid normalization form") from None
+
+		if input.isascii():
+			# ASCII text is normalized in every form
+			return True
+
+		mask = 3 << ((4 if nfc else 0) + (2 if k else 0))
+		others = self._find_non_boundaries(input, self._normalize_boundaries[form], mask)
+		if not others:
+			return True
+
+		if nfc and any(VBase <= ord(ch) < VBase + VCount for ch in others) and _hangul_jamo.search(input):
+			# A leading consonant followed by a vowel always composes.
+			return False
+
+		result = self.is_normalized_quickcheck(input, nfc, k, False)
+		if result == MAYBE:
+			return self.unicodedata_UCD_normalize_impl(form, input) == input
+
+		return result == YES
+
+	def parse_int_impl(self, s: str, base: int, allow_mixed_scripts: bool) -> int:
+		"""
+		Returns the integer represented by the string ``s``, which may use the decimal digits of any script.
+
+		As with :class:`int`, the digits may be surrounded by whitespace, preceded by a sign,
+		and separated by single underscores. The letters ``a`` to ``z`` (in either case) are the digits 10 to 35.
+
+		The whitespace stripped is that of :attr:`~.Database.WHITESPACE`.
+		The digits are translated to ASCII with :meth:`str.translate` and the validated result is passed to :class:`int`,
+		so the running interpreter's own (possibly different) digit tables are never used.
+		This is faster than validating and accumulating the digits in a single pass in Python
+		(see ``benchmarks/parse_int.py``).
+
+		:param s:
+		:param base: The base of the number, between 2 and 36.
+		:param allow_mixed_scripts: If :py:obj:`False`, all the decimal digits must be from the same block of ten.
+		"""
+
+		if not isinstance(s, str):
+			raise TypeError(f"parse_int() argument must be str, not {type(s).__name__}")
+		if not isinstance(base, int):
+			raise TypeError(f"parse_int() base must be int, not {type(base).__name__}")
+		if not 2 <= base <= 36:
+			raise ValueError("parse_int() base must be >= 2 and <= 36")
+
+		text = s.strip(self._whitespace_chars)
+		sign = text[:1]
+		if sign in "+-":
+			text = text[1:]
+
+		if text.isascii():
+			digits = text
+		else:
+			digits = text.translate(self.decimal_translation_table_impl())
+
+		# int() would also accept a second sign, leading whitespace and a prefix, and non-ASCII digits.
+		if (
+				not digits.isascii() or not digits[:1].isalnum()
+				or digits[:2].lower() == _int_prefixes.get(base)
+				):
+			raise ValueError(f"invalid literal for parse_int() with base {base}: {s!r}")
+
+		try:
+			result = int(digits, base)
+		except ValueError:
+			raise ValueError(f"invalid literal for parse_int() with base {base}: {s!r}") from None
+
+		if not allow_mixed_scripts and digits is not text:
+			# The digits of each script are a run of ten code points, starting with zero.
+			# ASCII letters (which are only digits in bases above 10) count as the same script as the ASCII digits.
+			first = ord(text[0])
+			zero = first - ord(digits[0]) + 0x30 if first > 0x7f else 0x30
+			block = _digit_blocks.get(zero)
+			if block is None:
+				block = _digit_blocks[zero] = ''.join(map(chr, range(zero, zero + 10))) + '_'
+			if text.strip(block):
+				raise ValueError(f"parse_int() digits from different scripts: {s!r}")
+
+		return -result if sign == '-' else result
+
+	def _lookup_many(self, chars: "Union[str, Iterable[int]]", column, bitmap, default: "Any", values=None) -> list:
+		"""
+		Returns the value from the record column ``column`` for each character in ``chars``,
+		or ``default`` for characters whose records are not in ``bitmap``.
+
+		Each distinct character is only looked up once, which makes this much faster
+		than calling the single-character functions for text with a small alphabet.
+
+		:param chars: A string, or an iterable of code points.
+		:param column: The record column to look up, e.g. ``record_decimal``.
+		:param bitmap: The flag bitmap which indicates the field is set, e.g. ``record_is_decimal``.
+		:param default: The value to use for characters without the property.
+		:param values: Optional table to map the field's value through.
+		"""
+
+		distinct: "Dict[Any, int]"
+
+		if isinstance(chars, str):
+			distinct = {ch: ord(ch) for ch in set(chars)}
+		else:
+			chars = list(chars)
+			distinct = {code: code for code in set(chars)}
+
+		shift = self.SHIFT
+		bitmask = (1 << self.SHIFT) - 1
+		lookup: "Dict[Any, Any]" = {}
+
+		for key, code in distinct.items():
+			if not 0 <= code < 0x110000:
+				raise ValueError("code point not in range(0x110000)")
+
+			index = self.index2[(self.index1[code >> shift] << shift) + (code & bitmask)]
+
+			if bitmap[index]:
+				value = column[index]
+				lookup[key] = value if values is None else values[value]
+			else:
+				lookup[key] = default
+
+		return list(map(lookup.__getitem__, chars))
+
+	def _PyUnicode_ToDecimalDigitMany(self, chars: "Union[str, Iterable[int]]", default: "Any") -> list:
+		"""
+		Returns the integer decimal (0-9) for each character having this property, ``default`` otherwise.
+
+		:param chars: A string, or an iterable of code points.
+		:param default:
+		"""
+
+		return self._lookup_many(chars, self.record_decimal, self.record_is_decimal, default)
+
+	def _PyUnicode_ToDigitMany(self, chars: "Union[str, Iterable[int]]", default: "Any") -> list:
+		"""
+		Returns the integer digit (0-9) for each character having this property, ``default`` otherwise.
+
+		:param chars: A string, or an iterable of code points.
+		:param default:
+		"""
+
+		return self._lookup_many(chars, self.record_digit, self.record_is_digit, default)
+
+	def _PyUnicode_ToNumericMany(self, chars: "Union[str, Iterable[int]]", default: "Any") -> list:
+		"""
+		Returns the numeric value as double for each character having this property, ``default`` otherwise.
+
+		:param chars: A string, or an iterable of code points.
+		:param default:
+		"""
+
+		return self._lookup_many(chars, self.record_numeric, self.record_is_numeric, default, self.numeric_values)
+
+	def _PyUnicode_IsWhitespace(self, ch: str) -> int:
+		"""
+		Returns 1 for Unicode characters having the bidirectional type 'WS', 'B' or 'S' or the category 'Zs', 0 otherwise.
+
+		:param ch:
+		"""
+
+		return 1 if ch in self.WHITESPACE else 0
+
+	def _PyUnicode_IsLinebreak(self, ch: str) -> int:
+		"""
+		Returns 1 for Unicode characters having the line break property 'BK', 'CR', 'LF' or 'NL'
+		or having bidirectional type 'B', 0 otherwise.
+
+		:param ch:
+		"""
+
+		return 1 if ch in self.LINEBREAKS else 0
+
+	def unicode_isspace_impl(self, input: str) -> bool:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Return whether the string ``input`` is not empty, and all its characters are whitespace, as :meth:`str.isspace` does.
+
+		:param input:
+		"""
+
+		if not isinstance(input, str):
+			raise TypeError(f"isspace() argument must be str, not {type(input).__name__}")
+
+		return bool(input) and self.WHITESPACE.issuperset(input)
+
+	def unicode_islinebreak_impl(self, input: str) -> bool:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Return whether the string ``input`` is not empty, and all its characters are line breaks.
+
+		:param input:
+		"""
+
+		if not isinstance(input, str):
+			raise TypeError(f"islinebreak() argument must be str, not {type(input).__name__}")
+
+		return bool(input) and self.LINEBREAKS.issuperset(input)
+
+	def unicode_splitlines_impl(self, input: str, keepends: bool) -> "List[str]":  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Return a list of the lines in the string ``input``, breaking at line boundaries, as :meth:`str.splitlines` does.
+
+		:param input:
+		:param keepends: Whether to include the line breaks in the resulting list.
+		"""
+
+		if not isinstance(input, str):
+			raise TypeError(f"splitlines() argument must be str, not {type(input).__name__}")
+
+		if input.isascii():
+			# The ASCII line breaks are the same in every version of Unicode
+			return input.splitlines(keepends)
+
+		lines = []
+		start = 0
+		for match in self._linebreak.finditer(input):
+			lines.append(input[start:match.end() if keepends else match.start()])
+			start = match.end()
+
+		if start < len(input):
+			lines.append(input[start:])
+
+		return lines
+
+	def _add_identifier_chars(self, input: str) -> None:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Adds the characters of ``input`` not seen before to the sets of identifier characters.
+
+		:param input:
+		"""
+
+		if self._identifier_seen.issuperset(input):
+			return
+
+		new = set(input)
+		new -= self._identifier_seen
+		for ch in new:
+			if self._PyUnicode_IsXidStart(ch):
+				self._identifier_start.add(ch)
+			if self._PyUnicode_IsXidContinue(ch):
+				self._identifier_continue.add(ch)
+
+		self._identifier_seen.update(new)
+
+	def is_identifier_impl(self, input: str, normalize: bool) -> bool:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Return whether the string ``input`` is a valid identifier, as :meth:`str.isidentifier` does.
+
+		The first character must have the XID_Start property or be an underscore,
+		and the others must have the XID_Continue property.
+
+		:param input:
+		:param normalize: Whether to check the NFKC normal form of ``input``, as Python does for the identifiers in source code.
+		"""
+
+		if not isinstance(input, str):
+			raise TypeError(f"is_identifier() argument must be str, not {type(input).__name__}")
+
+		if input.isascii():
+			# ASCII identifiers are the same in every version of Unicode, and are normalized
+			return input.isidentifier()
+
+		if normalize:
+			input = self.unicodedata_UCD_normalize_impl("NFKC", input)
+
+		self._add_identifier_chars(input)
+		return input[0] in self._identifier_start and self._identifier_continue.issuperset(input)
+
+	def find_invalid_identifier_chars_impl(self, input: str, normalize: bool) -> "List[int]":  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the offsets of the characters which stop the string ``input`` being a valid identifier.
+
+		:param input:
+		:param normalize: Whether to check the NFKC normal form of ``input``, in which case the offsets are into that.
+		"""
+
+		if not isinstance(input, str):
+			raise TypeError(f"find_invalid_identifier_chars() argument must be str, not {type(input).__name__}")
+
+		if normalize:
+			input = self.unicodedata_UCD_normalize_impl("NFKC", input)
+
+		if not input:
+			return []
+
+		self._add_identifier_chars(input)
+		invalid = [] if input[0] in self._identifier_start else [0]
+		if not self._identifier_continue.issuperset(input):
+			invalid.extend(offset for offset, ch in enumerate(input[1:], 1) if ch not in self._identifier_continue)
+
+		return invalid
+
+	def _add_printable_chars(self, input: "Iterable[str]") -> None:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Adds the characters of ``input`` not seen before to the set of printable characters.
+
+		:param input: A string, or a set of characters.
+		"""
+
+		if self._printable_seen.issuperset(input):
+			return
+
+		new = set(input)
+		new -= self._printable_seen
+		for ch in new:
+			if self._PyUnicode_IsPrintable(ch):
+				self._printable.add(ch)
+
+		self._printable_seen.update(new)
+
+	def isprintable_impl(self, input: str) -> bool:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Return whether all the characters of the string ``input`` are printable, as :meth:`str.isprintable` does.
+
+		:param input:
+		"""
+
+		if not isinstance(input, str):
+			raise TypeError(f"isprintable() argument must be str, not {type(input).__name__}")
+
+		if input.isascii():
+			# The printable ASCII characters are the same in every version of Unicode
+			return input.isprintable()
+
+		self._add_printable_chars(input)
+		return self._printable.issuperset(input)
+
+	def escape_nonprintable_impl(self, input: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Return a copy of the string ``input`` with each non-printable character replaced by its escape sequence,
+		as :func:`repr` does.
+
+		The string is returned unchanged if every character is printable.
+		Otherwise each distinct non-printable character is replaced with :meth:`str.replace`,
+		or, if there are many of them, each run of them is matched with a regular expression.
+
+		:param input:
+		"""
+
+		if not isinstance(input, str):
+			raise TypeError(f"escape_nonprintable() argument must be str, not {type(input).__name__}")
+
+		if input.isascii() and input.isprintable():
+			return input
+
+		nonprintable = set(input)
+		self._add_printable_chars(nonprintable)
+		nonprintable -= self._printable
+		if not nonprintable:
+			return input
+
+		if len(nonprintable) > 16:
+			pattern = re.compile('[' + ''.join(map(re.escape, sorted(nonprintable))) + "]+")
+			return pattern.sub(_escape_run, input)
+
+		# The escape sequences are printable, so the replacements do not affect each other.
+		for ch in nonprintable:
+			input = input.replace(ch, _escape(ch))
+
+		return input
+
+	Py_UNICODE_ISSPACE = _PyUnicode_IsWhitespace
+	Py_UNICODE_ISLOWER = _PyUnicode_IsLowercase
+	Py_UNICODE_ISUPPER = _PyUnicode_IsUppercase
+	Py_UNICODE_ISTITLE = _PyUnicode_IsTitlecase
+	Py_UNICODE_ISLINEBREAK = _PyUnicode_IsLinebreak
+
+	Py_UNICODE_TOLOWER = _PyUnicode_ToLowercase
+	Py_UNICODE_TOUPPER = _PyUnicode_ToUppercase
+	Py_UNICODE_TOTITLE = _PyUnicode_ToTitlecase
+
+	Py_UNICODE_ISDECIMAL = _PyUnicode_IsDecimalDigit
+	Py_UNICODE_ISDIGIT = _PyUnicode_IsDigit
+	Py_UNICODE_ISNUMERIC = _PyUnicode_IsNumeric
+	Py_UNICODE_ISPRINTABLE = _PyUnicode_IsPrintable
+
+	Py_UNICODE_TODECIMAL = _PyUnicode_ToDecimalDigit
+	Py_UNICODE_TODIGIT = _PyUnicode_ToDigit
+	Py_UNICODE_TONUMERIC = _PyUnicode_ToNumeric
+	Py_UNICODE_TONUMERICFRACTION = _PyUnicode_ToNumericFraction
+
+
+class PreviousDatabase(Database):
 	"""
-	Returns 1 for Unicode characters having the category 'Lu', 0 otherwise.
+	A version of Unicode from :data:`~.OLD_VERSIONS`, which is stored as changes to the records of the default version,
+	as in unicodedata.c.
 
-	:param ch:
+	The methods which apply those changes override those of :class:`~.Database`.
+
+	:param unidata_version:
 	"""
 
-	record = data[index[ord(ch)]]
-	upper, lower, title, decimal, digit, flags = record
-	return flags & UPPER_MASK != 0
+	def __init__(self, unidata_version: str):
+		cversion = unidata_version.replace('.', '_')
+		tables = load_tables(unidata_version)
+
+		# The changes are needed by the methods Database.__init__() calls.
+		self.CHANGES_SHIFT: int = tables[f"CHANGES_{cversion}_SHIFT"]
+		self.changes_index1 = tables[f"changes_{cversion}_index1"]
+		self.changes_index2 = tables[f"changes_{cversion}_index2"]
+
+		# The change records, stored column-wise. 0xFF means "no change",
+		# and a category of 0 that the character was not yet assigned.
+		self.changes_bidirectional = tables[f"changes_{cversion}_bidir"]
+		self.changes_category = tables[f"changes_{cversion}_category"]
+		self.changes_decimal = tables[f"changes_{cversion}_decimal"]
+		self.changes_mirrored = tables[f"changes_{cversion}_mirrored"]
+		self.changes_east_asian_width = tables[f"changes_{cversion}_width"]
+
+		super().__init__(unidata_version)
+
+		# The normalization changes, as (code point, replacement) pairs.
+		normalization_changes = tables[f"normalization_{cversion}"]
+		self._normalization_changes.update(zip(normalization_changes[::2], normalization_changes[1::2]))
+
+	def _get_old_record(self, code: int) -> int:
+		"""
+		Returns the index of the change record for the given code point in the older version of Unicode.
+
+		:param code:
+		"""
+
+		if code >= 0x110000:
+			return 0
+
+		index = self.changes_index1[(code >> self.CHANGES_SHIFT)]
+		return self.changes_index2[(index << self.CHANGES_SHIFT) + (code & ((1 << self.CHANGES_SHIFT) - 1))]
+
+	def _PyUnicode_ToDecimalDigit(self, ch: str) -> int:
+		"""
+		Returns the integer decimal (0-9) for Unicode characters having this property
+		in the older version of Unicode, -1 otherwise.
+
+		:param ch:
+		"""
+
+		old = self._get_old_record(ord(ch))
+		if self.changes_category[old] == 0:  # unassigned
+			return -1
+		if self.changes_decimal[old] != 0xFF:
+			return self.changes_decimal[old]
+
+		return super()._PyUnicode_ToDecimalDigit(ch)
+
+	def _PyUnicode_ToNumeric(self, ch: str) -> float:
+		"""
+		Returns the numeric value as double for Unicode characters having this property
+		in the older version of Unicode, -1.0 otherwise.
+
+		As in unicodedata.c only changes to the decimal value are taken into account.
+
+		:param ch:
+		"""
+
+		old = self._get_old_record(ord(ch))
+		if self.changes_category[old] == 0:  # unassigned
+			return -1.0
+		if self.changes_decimal[old] != 0xFF:
+			return float(self.changes_decimal[old])
+
+		return super()._PyUnicode_ToNumeric(ch)
+
+	def _map_many(self, chars: "Union[str, Iterable[int]]", function, missing: "Any", default: "Any") -> list:
+		"""
+		Returns ``function(ch)`` for each character in ``chars``, or ``default`` where that returns ``missing``.
+
+		This takes the place of :meth:`Database._lookup_many`, which reads the records of the default version.
+		Each distinct character is still only looked up once.
+
+		:param chars: A string, or an iterable of code points.
+		:param function: One of the single-character methods, e.g. :meth:`~._PyUnicode_ToDecimalDigit`.
+		:param missing: The value ``function`` returns for characters without the property.
+		:param default: The value to use for characters without the property.
+		"""
 
+		lookup: "Dict[Any, Any]" = {}
 
-# def Py_UNICODE_ISSPACE(ch):
-# 	if ord(ch) < 128:
-# 		return _Py_ascii_whitespace[ch]
-# 	return _PyUnicode_IsWhitespace(ch)
+		if isinstance(chars, str):
+			for ch in set(chars):
+				lookup[ch] = function(ch)
+		else:
+			chars = list(chars)
+			for code in set(chars):
+				if not 0 <= code < 0x110000:
+					raise ValueError("code point not in range(0x110000)")
+				lookup[code] = function(chr(code))
 
-Py_UNICODE_ISLOWER = _PyUnicode_IsLowercase
-Py_UNICODE_ISUPPER = _PyUnicode_IsUppercase
-Py_UNICODE_ISTITLE = _PyUnicode_IsTitlecase
-# Py_UNICODE_ISLINEBREAK = _PyUnicode_IsLinebreak
+		for key, value in lookup.items():
+			if value == missing:
+				lookup[key] = default
 
-# Py_UNICODE_TOLOWER = _PyUnicode_ToLowercase
-# Py_UNICODE_TOUPPER = _PyUnicode_ToUppercase
-# Py_UNICODE_TOTITLE = _PyUnicode_ToTitlecase
+		return list(map(lookup.__getitem__, chars))
 
-Py_UNICODE_ISDECIMAL = _PyUnicode_IsDecimalDigit
-Py_UNICODE_ISDIGIT = _PyUnicode_IsDigit
-Py_UNICODE_ISNUMERIC = _PyUnicode_IsNumeric
-Py_UNICODE_ISPRINTABLE = _PyUnicode_IsPrintable
+	def _PyUnicode_ToDecimalDigitMany(self, chars: "Union[str, Iterable[int]]", default: "Any") -> list:
+		"""
+		Returns the integer decimal (0-9) for each character having this property
+		in the older version of Unicode, ``default`` otherwise.
+
+		:param chars: A string, or an iterable of code points.
+		:param default:
+		"""
+
+		return self._map_many(chars, self._PyUnicode_ToDecimalDigit, -1, default)
+
+	def _PyUnicode_ToNumericMany(self, chars: "Union[str, Iterable[int]]", default: "Any") -> list:
+		"""
+		Returns the numeric value as double for each character having this property
+		in the older version of Unicode, ``default`` otherwise.
+
+		:param chars: A string, or an iterable of code points.
+		:param default:
+		"""
+
+		return self._map_many(chars, self._PyUnicode_ToNumeric, -1.0, default)
+
+	def decimal_translation_table_impl(self) -> "Dict[int, str]":
+		"""
+		Returns a table for :meth:`str.translate` which maps every decimal digit in the older version of Unicode
+		to the ASCII digit with the same value.
+
+		The table is created on first use, and the same dictionary is returned each time.
+		"""
+
+		if self._decimal_translation_table is not None:
+			return self._decimal_translation_table
+
+		# The table for the default version is updated in place
+		# for the characters whose decimal value changed, or which were not yet assigned.
+		table = super().decimal_translation_table_impl()
+		records = {
+				index
+				for index, (category, decimal) in enumerate(zip(self.changes_category, self.changes_decimal))
+				if category == 0 or decimal != 0xFF
+				}
+		for code in _codes_with_records(records, self.changes_index1, self.changes_index2, self.CHANGES_SHIFT):
+			decimal = self._PyUnicode_ToDecimalDigit(chr(code))
+			if decimal < 0:
+				table.pop(code, None)
+			elif not 0x30 <= code <= 0x39:
+				table[code] = "0123456789"[decimal]
+
+		return table
+
+	def unicodedata_UCD_category_impl(self, chr: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the general category assigned to the character chr in the older version of Unicode.
+
+		:param chr:
+		"""
+
+		code = ord(chr)
+		old = self._get_old_record(code)
+		if self.changes_category[old] != 0xFF:
+			return CATEGORY_NAMES[self.changes_category[old]]
+
+		return CATEGORY_NAMES[self.db_category[self._getrecord_ex(code)]]
+
+	def unicodedata_UCD_bidirectional_impl(self, chr: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the bidirectional class assigned to the character chr in the older version of Unicode.
+
+		:param chr:
+		"""
+
+		code = ord(chr)
+		old = self._get_old_record(code)
+		if self.changes_category[old] == 0:  # unassigned
+			return ''
+		if self.changes_bidirectional[old] != 0xFF:
+			return BIDIRECTIONAL_NAMES[self.changes_bidirectional[old]]
+
+		return BIDIRECTIONAL_NAMES[self.db_bidirectional[self._getrecord_ex(code)]]
+
+	def unicodedata_UCD_combining_impl(self, chr: str) -> int:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the canonical combining class assigned to the character chr in the older version of Unicode.
+
+		:param chr:
+		"""
+
+		code = ord(chr)
+		if self.changes_category[self._get_old_record(code)] == 0:  # unassigned
+			return 0
+
+		return self.db_combining[self._getrecord_ex(code)]
+
+	def unicodedata_UCD_mirrored_impl(self, chr: str) -> int:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the mirrored property assigned to the character chr in the older version of Unicode.
+
+		:param chr:
+		"""
+
+		code = ord(chr)
+		old = self._get_old_record(code)
+		if self.changes_category[old] == 0:  # unassigned
+			return 0
+		if self.changes_mirrored[old] != 0xFF:
+			return self.changes_mirrored[old]
+
+		return self.db_mirrored[self._getrecord_ex(code)]
+
+	def unicodedata_UCD_east_asian_width_impl(self, chr: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the east asian width assigned to the character chr in the older version of Unicode.
+
+		:param chr:
+		"""
+
+		code = ord(chr)
+		old = self._get_old_record(code)
+		if self.changes_category[old] == 0:  # unassigned
+			return EASTASIANWIDTH_NAMES[0]
+		if self.changes_east_asian_width[old] != 0xFF:
+			return EASTASIANWIDTH_NAMES[self.changes_east_asian_width[old]]
+
+		return EASTASIANWIDTH_NAMES[self.db_east_asian_width[self._getrecord_ex(code)]]
+
+	def get_decomp_record(self, code: int) -> "Tuple[int, int, int]":
+		"""
+		Returns the decomposition record of the given code point in the older version of Unicode,
+		as :meth:`Database.get_decomp_record` does.
+
+		:param code:
+		"""
+
+		if self.changes_category[self._get_old_record(code)] == 0:
+			# unassigned in the older version, so no decomposition
+			code = 0x110000
+
+		return super().get_decomp_record(code)
+
+	def unicodedata_UCD_normalize_impl(self, form: str, input: str) -> str:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Return the normal form ``form`` for the Unicode string ``input`` in the older version of Unicode.
+
+		The quickcheck property is for the current version, so the whole string is always normalized.
+
+		:param form:
+		:param input:
+		"""
+
+		if not isinstance(form, str):
+			raise TypeError(f"normalize() argument 1 must be str, not {type(form).__name__}")
+		if not isinstance(input, str):
+			raise TypeError(f"normalize() argument 2 must be str, not {type(input).__name__}")
+
+		try:
+			nfc, k = NORMALIZATION_FORMS[form]
+		except KeyError:
+			raise ValueError("invalid normalization form") from None
+
+		if input.isascii():
+			# ASCII text is normalized in every form
+			return input
+
+		return self.nfc_nfkc(input, k) if nfc else self.nfd_nfkd(input, k)
+
+	def unicodedata_UCD_is_normalized_impl(self, form: str, input: str) -> bool:  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Return whether the Unicode string ``input`` is in the normal form ``form`` in the older version of Unicode.
+
+		:param form:
+		:param input:
+		"""
+
+		if not isinstance(form, str):
+			raise TypeError(f"is_normalized() argument 1 must be str, not {type(form).__name__}")
+		if not isinstance(input, str):
+			raise TypeError(f"is_normalized() argument 2 must be str, not {type(input).__name__}")
+
+		return self.unicodedata_UCD_normalize_impl(form, input) == input
+
+	Py_UNICODE_TODECIMAL = _PyUnicode_ToDecimalDigit
+	Py_UNICODE_TONUMERIC = _PyUnicode_ToNumeric
+
+
+# The database for each version of Unicode, keyed by version, created by database() when first needed.
+_databases: "Dict[Optional[str], Database]" = {}
+
+
+def database(unidata_version: "Optional[str]" = None) -> Database:
+	"""
+	Returns the :class:`~.Database` for the given version of Unicode, loading its tables the first time.
+
+	:param unidata_version: The version of Unicode, which must be one of :data:`~.OLD_VERSIONS`
+		or have a ``ucd_X_Y_Z`` subpackage, or :py:obj:`None` for the default version.
+	"""
+
+	try:
+		return _databases[unidata_version]
+	except KeyError:
+		pass
+
+	if unidata_version in OLD_VERSIONS:
+		result: Database = PreviousDatabase(unidata_version)
+	else:
+		result = Database(unidata_version)
 
-Py_UNICODE_TODECIMAL = _PyUnicode_ToDecimalDigit
-Py_UNICODE_TODIGIT = _PyUnicode_ToDigit
-Py_UNICODE_TONUMERIC = _PyUnicode_ToNumeric
+	_databases[unidata_version] = result
+	return result
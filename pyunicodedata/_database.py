@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+#
+#  _database.py
+"""
+Access to the memory-mapped binary database written by ``makeunicodedata.py``.
+
+The database holds the same tables as the generated ``_unicode*`` modules,
+stored little-endian so they can be shared between processes through the OS page cache.
+
+Databases for other versions of Unicode are kept in ``ucd_X_Y_Z`` subpackages.
+Tables which are the same as in the default version are not repeated, but refer to the default version's database.
+The versions in :data:`~.OLD_VERSIONS` have no tables of their own,
+but are stored as changes to the records of the default version.
+"""
+#
+#  Copyright © 2021 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#  Licensed under the Python Software Foundation License Version 2.
+#
+#  See the LICENSE file for details.
+#
+
+# stdlib
+import functools
+import mmap
+import os
+import struct
+import sys
+from array import array
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set
+
+__all__ = [
+		"DATABASE",
+		"NAME_DATABASE",
+		"OLD_VERSIONS",
+		"database_version",
+		"database_versions",
+		"load_name_tables",
+		"load_tables",
+		"open_database",
+		"version_package",
+		]
+
+#: The location of the binary database.
+DATABASE = os.path.join(os.path.dirname(__file__), "unicodedata.db")
+
+#: The location of the binary database of character names, which is kept separate as it is by far the largest.
+NAME_DATABASE = os.path.join(os.path.dirname(__file__), "unicodename.db")
+
+#: Versions of Unicode which are stored as changes to the default version's tables.
+OLD_VERSIONS = ("3.2.0", )  # note: should match old_versions in makeunicodedata.py
+
+# note: should match definitions in makeunicodedata.py
+DATABASE_MAGIC = b"PYUNIDB\0"
+DATABASE_FORMAT = 2
+DATABASE_HEADER = struct.Struct("<8sII16s")
+DATABASE_ENTRY = struct.Struct("<24scB2xQQ")
+DATABASE_ARRAY = 0
+DATABASE_SCALAR = 1
+DATABASE_SHARED = 2
+
+
+def open_database(filename: str = DATABASE, shared: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+	"""
+	Memory-map the binary database and return its tables.
+
+	Arrays are returned as :class:`memoryview` objects cast to the appropriate type,
+	and scalars as :class:`int`.
+
+	:param filename: The database to open.
+	:param shared: The tables of the database which those in a versioned database can refer to,
+		i.e. those of the default version.
+
+	:raises OSError: If the file cannot be opened.
+	:raises ValueError: If the file is not a valid database, or cannot be used on this platform.
+	"""
+
+	if sys.byteorder != "little":  # pragma: no cover
+		raise ValueError("The database can only be memory-mapped on little-endian platforms.")
+
+	with open(filename, "rb") as fp:
+		buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+	view = memoryview(buffer)
+
+	if len(view) < DATABASE_HEADER.size:
+		raise ValueError(f"{filename!r} is not a pyunicodedata database.")
+
+	magic, format_version, count, unidata_version = DATABASE_HEADER.unpack_from(view)
+	if magic != DATABASE_MAGIC:
+		raise ValueError(f"{filename!r} is not a pyunicodedata database.")
+	if format_version != DATABASE_FORMAT:
+		raise ValueError(f"Unsupported database format {format_version} in {filename!r}.")
+
+	directory_end = DATABASE_HEADER.size + DATABASE_ENTRY.size * count
+	if directory_end > len(view):
+		raise ValueError(f"{filename!r} is truncated.")
+
+	tables: Dict[str, Any] = {}
+
+	for entry in DATABASE_ENTRY.iter_unpack(view[DATABASE_HEADER.size:directory_end]):
+		name, typecode, kind, offset, length = entry
+		name = name.rstrip(b'\0').decode("ascii")
+		if kind == DATABASE_SHARED:
+			if shared is None:
+				raise ValueError(f"{filename!r} refers to the tables of another database.")
+			tables[name] = shared[name]
+			continue
+
+		typecode = typecode.decode("ascii")
+		end = offset + length * struct.calcsize(typecode)
+		if end > len(view):
+			raise ValueError(f"{filename!r} is truncated.")
+
+		table = view[offset:end].cast(typecode)
+		if kind == DATABASE_SCALAR:
+			tables[name] = table[0]
+		else:
+			tables[name] = table
+
+	return tables
+
+
+def database_version(filename: str = DATABASE) -> str:
+	"""
+	Returns the version of Unicode the given database is for.
+
+	:param filename:
+
+	:raises OSError: If the file cannot be opened.
+	:raises ValueError: If the file is not a valid database.
+	"""
+
+	with open(filename, "rb") as fp:
+		header = fp.read(DATABASE_HEADER.size)
+
+	if len(header) < DATABASE_HEADER.size or header[:len(DATABASE_MAGIC)] != DATABASE_MAGIC:
+		raise ValueError(f"{filename!r} is not a pyunicodedata database.")
+
+	return DATABASE_HEADER.unpack(header)[3].rstrip(b'\0').decode("ascii")
+
+
+def version_package(version: str) -> str:
+	"""
+	Returns the name of the subpackage holding the tables for the given version of Unicode.
+
+	:param version: The version of Unicode, e.g. ``'12.1.0'``.
+	"""
+
+	return "ucd_" + version.replace('.', '_')
+
+
+def database_versions() -> List[str]:
+	"""
+	Returns the versions of Unicode for which there are tables in ``ucd_X_Y_Z`` subpackages,
+	besides the default version.
+	"""
+
+	versions: Set[str] = set()
+
+	for directory in _package_directories():
+		for entry in os.listdir(directory):
+			if entry.startswith("ucd_") and os.path.isfile(os.path.join(directory, entry, "__init__.py")):
+				versions.add(entry[4:].replace('_', '.'))
+
+	return sorted(versions, key=lambda version: tuple(map(int, version.split('.'))))
+
+
+def _package_directories() -> List[str]:
+	"""
+	Returns the directories making up the :mod:`pyunicodedata` package, which the ``ucd_X_Y_Z`` subpackages are found in.
+	"""
+
+	return list(import_module("pyunicodedata").__path__)
+
+
+def _version_file(version: str, filename: str) -> str:
+	"""
+	Returns the location of the given file in the subpackage for the given version of Unicode.
+
+	:param version:
+	:param filename:
+
+	:raises FileNotFoundError: If there is no subpackage for that version.
+	"""
+
+	for directory in _package_directories():
+		package = os.path.join(directory, version_package(version))
+		if os.path.isfile(os.path.join(package, "__init__.py")):
+			return os.path.join(package, filename)
+
+	raise FileNotFoundError(f"No tables for Unicode {version}.")
+
+
+# The generated modules holding the tables, in each package.
+_TABLE_MODULES = (
+		"_unicodedata_index",
+		"_unicodedata_db",
+		"_unicodedata_decomp",
+		"_unicodedata_changes",
+		"_unicodetype_index",
+		"_unicodetype_db",
+		"_unicode_numeric",
+		)
+
+
+def load_tables(version: Optional[str] = None) -> Dict[str, Any]:
+	"""
+	Return the character database and type tables.
+
+	The tables are memory-mapped from :data:`~.DATABASE` where possible,
+	falling back to the generated modules if the database is missing or unusable.
+	The default version's tables are only loaded once.
+
+	:param version: The version of Unicode to load the tables for, from its ``ucd_X_Y_Z`` subpackage.
+		By default, and for the versions in :data:`~.OLD_VERSIONS`, the tables of the default version are loaded.
+	"""
+
+	if version in OLD_VERSIONS or version is None:
+		return dict(_default_tables())
+
+	try:
+		return open_database(_version_file(version, "unicodedata.db"), shared=_default_tables())
+	except (OSError, ValueError):
+		pass
+
+	return _collect_tables(_import_modules(version, _TABLE_MODULES))
+
+
+def load_name_tables(version: Optional[str] = None) -> Dict[str, Any]:
+	"""
+	Return the character name tables.
+
+	The tables are memory-mapped from :data:`~.NAME_DATABASE` where possible,
+	falling back to the generated module if the database is missing or unusable.
+	The default version's tables are only loaded once.
+
+	:param version: The version of Unicode to load the tables for, from its ``ucd_X_Y_Z`` subpackage.
+		By default, and for the versions in :data:`~.OLD_VERSIONS`, the tables of the default version are loaded.
+	"""
+
+	if version in OLD_VERSIONS or version is None:
+		return dict(_default_name_tables())
+
+	try:
+		return open_database(_version_file(version, "unicodename.db"), shared=_default_name_tables())
+	except (OSError, ValueError):
+		pass
+
+	return _collect_tables(_import_modules(version, ["_unicodename_db"]))
+
+
+@functools.lru_cache(maxsize=None)
+def _default_tables() -> Dict[str, Any]:
+	"""
+	Return the character database and type tables of the default version.
+
+	These are loaded once, and shared by the tables of the other versions.
+	"""
+
+	try:
+		return open_database(DATABASE)
+	except (OSError, ValueError):
+		return _collect_tables(_import_modules(None, _TABLE_MODULES))
+
+
+@functools.lru_cache(maxsize=None)
+def _default_name_tables() -> Dict[str, Any]:
+	"""
+	Return the character name tables of the default version.
+
+	These are loaded once, and shared by the tables of the other versions.
+	"""
+
+	try:
+		return open_database(NAME_DATABASE)
+	except (OSError, ValueError):
+		return _collect_tables(_import_modules(None, ["_unicodename_db"]))
+
+
+def _import_modules(version: Optional[str], names: Iterable[str]) -> List[ModuleType]:
+	"""
+	Import the given generated modules, for the default version or from the version's subpackage.
+
+	:param version:
+	:param names:
+	"""
+
+	package = "pyunicodedata" if version is None else f"pyunicodedata.{version_package(version)}"
+	return [import_module(f"{package}.{name}") for name in names]
+
+
+def _collect_tables(modules: Iterable[ModuleType]) -> Dict[str, Any]:
+	"""
+	Return the arrays and integers defined in the given generated modules.
+
+	:param modules:
+	"""
+
+	tables: Dict[str, Any] = {}
+
+	for module in modules:
+		for name, value in vars(module).items():
+			if isinstance(value, (array, int)):
+				tables[name] = value
+
+	return tables
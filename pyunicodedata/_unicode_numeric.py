@@ -1,2162 +1,62 @@
-numeric_items = {
-  "-1.0/2.0": [
-    3891
-  ],
-  "0.0": [
-    48,
-    1632,
-    1776,
-    1984,
-    2406,
-    2534,
-    2662,
-    2790,
-    2918,
-    3046,
-    3174,
-    3192,
-    3302,
-    3430,
-    3558,
-    3664,
-    3792,
-    3872,
-    4160,
-    4240,
-    6112,
-    6128,
-    6160,
-    6470,
-    6608,
-    6784,
-    6800,
-    6992,
-    7088,
-    7232,
-    7248,
-    8304,
-    8320,
-    8585,
-    9450,
-    9471,
-    12295,
-    38646,
-    42528,
-    42735,
-    43216,
-    43264,
-    43472,
-    43504,
-    43600,
-    44016,
-    63922,
-    65296,
-    65930,
-    66720,
-    68912,
-    69734,
-    69872,
-    69942,
-    70096,
-    70384,
-    70736,
-    70864,
-    71248,
-    71360,
-    71472,
-    71904,
-    72016,
-    72784,
-    73040,
-    73120,
-    92768,
-    93008,
-    93824,
-    119520,
-    120782,
-    120792,
-    120802,
-    120812,
-    120822,
-    123200,
-    123632,
-    125264,
-    127232,
-    127233,
-    127243,
-    127244,
-    130032
-  ],
-  "1.0": [
-    49,
-    185,
-    1633,
-    1777,
-    1985,
-    2407,
-    2535,
-    2663,
-    2791,
-    2919,
-    3047,
-    3175,
-    3193,
-    3196,
-    3303,
-    3431,
-    3559,
-    3665,
-    3793,
-    3873,
-    4161,
-    4241,
-    4969,
-    6113,
-    6129,
-    6161,
-    6471,
-    6609,
-    6618,
-    6785,
-    6801,
-    6993,
-    7089,
-    7233,
-    7249,
-    8321,
-    8543,
-    8544,
-    8560,
-    9312,
-    9332,
-    9352,
-    9461,
-    10102,
-    10112,
-    10122,
-    12321,
-    12690,
-    12832,
-    12928,
-    19968,
-    22769,
-    22777,
-    24186,
-    24332,
-    42529,
-    42726,
-    43217,
-    43265,
-    43473,
-    43505,
-    43601,
-    44017,
-    65297,
-    65799,
-    65858,
-    65880,
-    65881,
-    65882,
-    66273,
-    66336,
-    66513,
-    66721,
-    67672,
-    67705,
-    67751,
-    67835,
-    67862,
-    68032,
-    68160,
-    68221,
-    68253,
-    68331,
-    68440,
-    68472,
-    68521,
-    68858,
-    68913,
-    69216,
-    69405,
-    69457,
-    69573,
-    69714,
-    69735,
-    69873,
-    69943,
-    70097,
-    70113,
-    70385,
-    70737,
-    70865,
-    71249,
-    71361,
-    71473,
-    71905,
-    72017,
-    72785,
-    72794,
-    73041,
-    73121,
-    74773,
-    74782,
-    74796,
-    74804,
-    74831,
-    74840,
-    92769,
-    93009,
-    93825,
-    93844,
-    119521,
-    119648,
-    119666,
-    119671,
-    120783,
-    120793,
-    120803,
-    120813,
-    120823,
-    123201,
-    123633,
-    125127,
-    125265,
-    126065,
-    126115,
-    126129,
-    126209,
-    127234,
-    130033,
-    133418
-  ],
-  "1.0/10.0": [
-    3420,
-    8530,
-    73675
-  ],
-  "1.0/12.0": [
-    68086
-  ],
-  "1.0/16.0": [
-    2548,
-    2933,
-    3446,
-    43059,
-    73673,
-    73674
-  ],
-  "1.0/160.0": [
-    3416,
-    73665
-  ],
-  "1.0/2.0": [
-    189,
-    2931,
-    3444,
-    3882,
-    11517,
-    43057,
-    65857,
-    65909,
-    65910,
-    68029,
-    68168,
-    69243,
-    69414,
-    73681,
-    73682,
-    74852,
-    126126,
-    126268
-  ],
-  "1.0/20.0": [
-    3419,
-    73672
-  ],
-  "1.0/3.0": [
-    8531,
-    69245,
-    74842,
-    74845,
-    74853
-  ],
-  "1.0/32.0": [
-    73669
-  ],
-  "1.0/320.0": [
-    73664,
-    73684
-  ],
-  "1.0/4.0": [
-    188,
-    2551,
-    2930,
-    3443,
-    43056,
-    65856,
-    65931,
-    69244,
-    73680,
-    74848,
-    74850,
-    74851,
-    126125
-  ],
-  "1.0/40.0": [
-    3417,
-    73668
-  ],
-  "1.0/5.0": [
-    3422,
-    8533,
-    73679
-  ],
-  "1.0/6.0": [
-    8537,
-    74849,
-    126269
-  ],
-  "1.0/64.0": [
-    73667
-  ],
-  "1.0/7.0": [
-    8528
-  ],
-  "1.0/8.0": [
-    2549,
-    2934,
-    3447,
-    8539,
-    43060,
-    73676,
-    74847
-  ],
-  "1.0/80.0": [
-    73666
-  ],
-  "1.0/9.0": [
-    8529
-  ],
-  "10.0": [
-    3056,
-    3440,
-    4978,
-    8553,
-    8569,
-    9321,
-    9341,
-    9361,
-    9470,
-    10111,
-    10121,
-    10131,
-    12344,
-    12841,
-    12872,
-    12937,
-    20160,
-    21313,
-    25342,
-    63859,
-    63997,
-    65808,
-    65865,
-    65872,
-    65879,
-    65888,
-    65889,
-    65890,
-    65891,
-    65892,
-    66282,
-    66338,
-    66515,
-    67675,
-    67710,
-    67757,
-    67837,
-    67863,
-    68041,
-    68164,
-    68254,
-    68333,
-    68444,
-    68476,
-    68525,
-    68860,
-    69225,
-    69410,
-    69458,
-    69577,
-    69723,
-    70122,
-    71482,
-    71914,
-    72803,
-    93019,
-    93834,
-    119530,
-    119657,
-    126074,
-    126218,
-    126263
-  ],
-  "10.0/12.0": [
-    68095
-  ],
-  "100.0": [
-    3057,
-    3441,
-    4987,
-    8557,
-    8573,
-    20336,
-    30334,
-    38476,
-    65817,
-    65867,
-    65874,
-    65898,
-    66291,
-    66517,
-    67677,
-    67759,
-    67839,
-    67865,
-    68050,
-    68166,
-    68335,
-    68446,
-    68478,
-    68527,
-    68862,
-    69234,
-    69413,
-    69460,
-    69579,
-    69732,
-    70131,
-    72812,
-    93020,
-    126083,
-    126227
-  ],
-  "1000.0": [
-    3058,
-    3442,
-    8559,
-    8575,
-    8576,
-    20191,
-    21315,
-    38433,
-    65826,
-    65869,
-    65876,
-    65905,
-    67678,
-    68059,
-    68167,
-    68447,
-    68479,
-    68863,
-    69733,
-    70132,
-    126092,
-    126236
-  ],
-  "10000.0": [
-    4988,
-    8578,
-    19975,
-    33836,
-    65835,
-    65877,
-    67679,
-    68068,
-    93021,
-    126101,
-    126131,
-    126245,
-    126267
-  ],
-  "100000.0": [
-    8584,
-    68077,
-    126110,
-    126112,
-    126132
-  ],
-  "1000000.0": [
-    93022
-  ],
-  "10000000.0": [
-    126113
-  ],
-  "100000000.0": [
-    20159,
-    20740,
-    93023
-  ],
-  "10000000000.0": [
-    93024
-  ],
-  "1000000000000.0": [
-    20806,
-    93025
-  ],
-  "11.0": [
-    8554,
-    8570,
-    9322,
-    9342,
-    9362,
-    9451,
-    93835,
-    119531
-  ],
-  "11.0/12.0": [
-    68028
-  ],
-  "11.0/2.0": [
-    3887
-  ],
-  "12.0": [
-    8555,
-    8571,
-    9323,
-    9343,
-    9363,
-    9452,
-    93836,
-    119532
-  ],
-  "13.0": [
-    9324,
-    9344,
-    9364,
-    9453,
-    93837,
-    119533
-  ],
-  "13.0/2.0": [
-    3888
-  ],
-  "14.0": [
-    9325,
-    9345,
-    9365,
-    9454,
-    93838,
-    119534
-  ],
-  "15.0": [
-    9326,
-    9346,
-    9366,
-    9455,
-    93839,
-    119535
-  ],
-  "15.0/2.0": [
-    3889
-  ],
-  "16.0": [
-    2553,
-    9327,
-    9347,
-    9367,
-    9456,
-    93840,
-    119536
-  ],
-  "17.0": [
-    5870,
-    9328,
-    9348,
-    9368,
-    9457,
-    93841,
-    119537
-  ],
-  "17.0/2.0": [
-    3890
-  ],
-  "18.0": [
-    5871,
-    9329,
-    9349,
-    9369,
-    9458,
-    93842,
-    119538
-  ],
-  "19.0": [
-    5872,
-    9330,
-    9350,
-    9370,
-    9459,
-    93843,
-    119539
-  ],
-  "2.0": [
-    50,
-    178,
-    1634,
-    1778,
-    1986,
-    2408,
-    2536,
-    2664,
-    2792,
-    2920,
-    3048,
-    3176,
-    3194,
-    3197,
-    3304,
-    3432,
-    3560,
-    3666,
-    3794,
-    3874,
-    4162,
-    4242,
-    4970,
-    6114,
-    6130,
-    6162,
-    6472,
-    6610,
-    6786,
-    6802,
-    6994,
-    7090,
-    7234,
-    7250,
-    8322,
-    8545,
-    8561,
-    9313,
-    9333,
-    9353,
-    9462,
-    10103,
-    10113,
-    10123,
-    12322,
-    12691,
-    12833,
-    12929,
-    13443,
-    20108,
-    20841,
-    24333,
-    24336,
-    36014,
-    36019,
-    36144,
-    42530,
-    42727,
-    43218,
-    43266,
-    43474,
-    43506,
-    43602,
-    44018,
-    63864,
-    65298,
-    65800,
-    65883,
-    65884,
-    65885,
-    65886,
-    66274,
-    66514,
-    66722,
-    67673,
-    67706,
-    67752,
-    67866,
-    68033,
-    68161,
-    68441,
-    68473,
-    68522,
-    68914,
-    69217,
-    69406,
-    69574,
-    69715,
-    69736,
-    69874,
-    69944,
-    70098,
-    70114,
-    70386,
-    70738,
-    70866,
-    71250,
-    71362,
-    71474,
-    71906,
-    72018,
-    72786,
-    72795,
-    73042,
-    73122,
-    74752,
-    74774,
-    74783,
-    74787,
-    74797,
-    74805,
-    74826,
-    74832,
-    74838,
-    74841,
-    92770,
-    93010,
-    93826,
-    93845,
-    119522,
-    119649,
-    119667,
-    120784,
-    120794,
-    120804,
-    120814,
-    120824,
-    123202,
-    123634,
-    125128,
-    125266,
-    126066,
-    126116,
-    126130,
-    126210,
-    126255,
-    127235,
-    130034,
-    140176
-  ],
-  "2.0/12.0": [
-    68087
-  ],
-  "2.0/3.0": [
-    8532,
-    65911,
-    69246,
-    74843,
-    74846,
-    74854
-  ],
-  "2.0/5.0": [
-    8534
-  ],
-  "20.0": [
-    4979,
-    9331,
-    9351,
-    9371,
-    9460,
-    12345,
-    12873,
-    21316,
-    24319,
-    65809,
-    66283,
-    66516,
-    67676,
-    67711,
-    67758,
-    67838,
-    67864,
-    68042,
-    68165,
-    68255,
-    68334,
-    68445,
-    68477,
-    68526,
-    69226,
-    69411,
-    69459,
-    69578,
-    69724,
-    70123,
-    71483,
-    71915,
-    72804,
-    119658,
-    126075,
-    126219
-  ],
-  "200.0": [
-    65818,
-    66292,
-    68051,
-    69235,
-    126084,
-    126228
-  ],
-  "2000.0": [
-    65827,
-    68060,
-    126093,
-    126237,
-    126266
-  ],
-  "20000.0": [
-    65836,
-    68069,
-    126102,
-    126246
-  ],
-  "200000.0": [
-    68078,
-    126111
-  ],
-  "20000000.0": [
-    126114
-  ],
-  "21.0": [
-    12881
-  ],
-  "216000.0": [
-    74802
-  ],
-  "22.0": [
-    12882
-  ],
-  "23.0": [
-    12883
-  ],
-  "24.0": [
-    12884
-  ],
-  "25.0": [
-    12885
-  ],
-  "26.0": [
-    12886
-  ],
-  "27.0": [
-    12887
-  ],
-  "28.0": [
-    12888
-  ],
-  "29.0": [
-    12889
-  ],
-  "3.0": [
-    51,
-    179,
-    1635,
-    1779,
-    1987,
-    2409,
-    2537,
-    2665,
-    2793,
-    2921,
-    3049,
-    3177,
-    3195,
-    3198,
-    3305,
-    3433,
-    3561,
-    3667,
-    3795,
-    3875,
-    4163,
-    4243,
-    4971,
-    6115,
-    6131,
-    6163,
-    6473,
-    6611,
-    6787,
-    6803,
-    6995,
-    7091,
-    7235,
-    7251,
-    8323,
-    8546,
-    8562,
-    9314,
-    9334,
-    9354,
-    9463,
-    10104,
-    10114,
-    10124,
-    12323,
-    12692,
-    12834,
-    12930,
-    19977,
-    20200,
-    21441,
-    21442,
-    21443,
-    21444,
-    24334,
-    42531,
-    42728,
-    43219,
-    43267,
-    43475,
-    43507,
-    43603,
-    44019,
-    63851,
-    65299,
-    65801,
-    66275,
-    66723,
-    67674,
-    67707,
-    67753,
-    67867,
-    68034,
-    68162,
-    68442,
-    68474,
-    68523,
-    68915,
-    69218,
-    69407,
-    69575,
-    69716,
-    69737,
-    69875,
-    69945,
-    70099,
-    70115,
-    70387,
-    70739,
-    70867,
-    71251,
-    71363,
-    71475,
-    71907,
-    72019,
-    72787,
-    72796,
-    73043,
-    73123,
-    74753,
-    74760,
-    74775,
-    74784,
-    74788,
-    74789,
-    74798,
-    74799,
-    74806,
-    74807,
-    74810,
-    74811,
-    74827,
-    74833,
-    74839,
-    92771,
-    93011,
-    93827,
-    93846,
-    119523,
-    119650,
-    119668,
-    120785,
-    120795,
-    120805,
-    120815,
-    120825,
-    123203,
-    123635,
-    125129,
-    125267,
-    126067,
-    126117,
-    126211,
-    126256,
-    127236,
-    130035,
-    133885,
-    133913,
-    141720,
-    146203
-  ],
-  "3.0/12.0": [
-    68088
-  ],
-  "3.0/16.0": [
-    2550,
-    2935,
-    3448,
-    43061,
-    73678
-  ],
-  "3.0/2.0": [
-    3883
-  ],
-  "3.0/20.0": [
-    3421,
-    73677
-  ],
-  "3.0/4.0": [
-    190,
-    2552,
-    2932,
-    3445,
-    43058,
-    65912,
-    73683,
-    126127
-  ],
-  "3.0/5.0": [
-    8535
-  ],
-  "3.0/64.0": [
-    73671
-  ],
-  "3.0/8.0": [
-    8540
-  ],
-  "3.0/80.0": [
-    3418,
-    73670
-  ],
-  "30.0": [
-    4980,
-    12346,
-    12874,
-    12890,
-    21317,
-    65810,
-    65893,
-    66284,
-    68043,
-    69227,
-    69412,
-    69725,
-    70124,
-    71916,
-    72805,
-    119659,
-    126076,
-    126220,
-    133507
-  ],
-  "300.0": [
-    65819,
-    65899,
-    66293,
-    68052,
-    69236,
-    126085,
-    126229
-  ],
-  "3000.0": [
-    65828,
-    68061,
-    126094,
-    126238
-  ],
-  "30000.0": [
-    65837,
-    68070,
-    126103,
-    126247
-  ],
-  "300000.0": [
-    68079
-  ],
-  "31.0": [
-    12891
-  ],
-  "32.0": [
-    12892
-  ],
-  "33.0": [
-    12893
-  ],
-  "34.0": [
-    12894
-  ],
-  "35.0": [
-    12895
-  ],
-  "36.0": [
-    12977
-  ],
-  "37.0": [
-    12978
-  ],
-  "38.0": [
-    12979
-  ],
-  "39.0": [
-    12980
-  ],
-  "4.0": [
-    52,
-    1636,
-    1780,
-    1988,
-    2410,
-    2538,
-    2666,
-    2794,
-    2922,
-    3050,
-    3178,
-    3306,
-    3434,
-    3562,
-    3668,
-    3796,
-    3876,
-    4164,
-    4244,
-    4972,
-    6116,
-    6132,
-    6164,
-    6474,
-    6612,
-    6788,
-    6804,
-    6996,
-    7092,
-    7236,
-    7252,
-    8308,
-    8324,
-    8547,
-    8563,
-    9315,
-    9335,
-    9355,
-    9464,
-    10105,
-    10115,
-    10125,
-    12324,
-    12693,
-    12835,
-    12931,
-    20118,
-    22235,
-    32902,
-    42532,
-    42729,
-    43220,
-    43268,
-    43476,
-    43508,
-    43604,
-    44020,
-    65300,
-    65802,
-    66276,
-    66724,
-    67708,
-    67754,
-    67755,
-    68035,
-    68163,
-    68443,
-    68475,
-    68524,
-    68916,
-    69219,
-    69408,
-    69576,
-    69717,
-    69738,
-    69876,
-    69946,
-    70100,
-    70116,
-    70388,
-    70740,
-    70868,
-    71252,
-    71364,
-    71476,
-    71908,
-    72020,
-    72788,
-    72797,
-    73044,
-    73124,
-    74754,
-    74761,
-    74767,
-    74776,
-    74785,
-    74790,
-    74800,
-    74808,
-    74812,
-    74813,
-    74814,
-    74815,
-    74828,
-    74834,
-    74835,
-    74857,
-    92772,
-    93012,
-    93828,
-    119524,
-    119651,
-    119669,
-    120786,
-    120796,
-    120806,
-    120816,
-    120826,
-    123204,
-    123636,
-    125130,
-    125268,
-    126068,
-    126118,
-    126212,
-    126257,
-    127237,
-    130036,
-    131172,
-    131298,
-    156269
-  ],
-  "4.0/12.0": [
-    68089
-  ],
-  "4.0/5.0": [
-    8536
-  ],
-  "40.0": [
-    4981,
-    12875,
-    12981,
-    21324,
-    65811,
-    66285,
-    68044,
-    69228,
-    69726,
-    70125,
-    71917,
-    72806,
-    74855,
-    119660,
-    126077,
-    126221,
-    133516,
-    133532
-  ],
-  "400.0": [
-    65820,
-    66294,
-    68053,
-    69237,
-    126086,
-    126230,
-    126264
-  ],
-  "4000.0": [
-    65829,
-    68062,
-    126095,
-    126239
-  ],
-  "40000.0": [
-    65838,
-    68071,
-    126104,
-    126248
-  ],
-  "400000.0": [
-    68080
-  ],
-  "41.0": [
-    12982
-  ],
-  "42.0": [
-    12983
-  ],
-  "43.0": [
-    12984
-  ],
-  "432000.0": [
-    74803
-  ],
-  "44.0": [
-    12985
-  ],
-  "45.0": [
-    12986
-  ],
-  "46.0": [
-    12987
-  ],
-  "47.0": [
-    12988
-  ],
-  "48.0": [
-    12989
-  ],
-  "49.0": [
-    12990
-  ],
-  "5.0": [
-    53,
-    1637,
-    1781,
-    1989,
-    2411,
-    2539,
-    2667,
-    2795,
-    2923,
-    3051,
-    3179,
-    3307,
-    3435,
-    3563,
-    3669,
-    3797,
-    3877,
-    4165,
-    4245,
-    4973,
-    6117,
-    6133,
-    6165,
-    6475,
-    6613,
-    6789,
-    6805,
-    6997,
-    7093,
-    7237,
-    7253,
-    8309,
-    8325,
-    8548,
-    8564,
-    9316,
-    9336,
-    9356,
-    9465,
-    10106,
-    10116,
-    10126,
-    12325,
-    12836,
-    12932,
-    13317,
-    14378,
-    20116,
-    20237,
-    42533,
-    42730,
-    43221,
-    43269,
-    43477,
-    43509,
-    43605,
-    44021,
-    65301,
-    65803,
-    65859,
-    65864,
-    65871,
-    65887,
-    65907,
-    66277,
-    66337,
-    66725,
-    67709,
-    67756,
-    67836,
-    68036,
-    68332,
-    68859,
-    68917,
-    69220,
-    69409,
-    69718,
-    69739,
-    69877,
-    69947,
-    70101,
-    70117,
-    70389,
-    70741,
-    70869,
-    71253,
-    71365,
-    71477,
-    71909,
-    72021,
-    72789,
-    72798,
-    73045,
-    73125,
-    74755,
-    74762,
-    74768,
-    74777,
-    74786,
-    74791,
-    74801,
-    74809,
-    74829,
-    74836,
-    74837,
-    74858,
-    92773,
-    93013,
-    93829,
-    119525,
-    119652,
-    119670,
-    119672,
-    120787,
-    120797,
-    120807,
-    120817,
-    120827,
-    123205,
-    123637,
-    125131,
-    125269,
-    126069,
-    126119,
-    126213,
-    126258,
-    127238,
-    130037,
-    131361
-  ],
-  "5.0/12.0": [
-    68090
-  ],
-  "5.0/2.0": [
-    3884
-  ],
-  "5.0/6.0": [
-    8538,
-    74844
-  ],
-  "5.0/8.0": [
-    8541
-  ],
-  "50.0": [
-    4982,
-    8556,
-    8572,
-    8582,
-    12876,
-    12991,
-    65812,
-    65860,
-    65866,
-    65873,
-    65894,
-    65895,
-    65896,
-    65897,
-    65908,
-    66286,
-    66339,
-    68045,
-    68222,
-    68861,
-    69229,
-    69727,
-    70126,
-    71918,
-    72807,
-    74856,
-    119661,
-    126078,
-    126222
-  ],
-  "500.0": [
-    8558,
-    8574,
-    65821,
-    65861,
-    65868,
-    65875,
-    65900,
-    65901,
-    65902,
-    65903,
-    65904,
-    66295,
-    68054,
-    69238,
-    126087,
-    126231
-  ],
-  "5000.0": [
-    8577,
-    65830,
-    65862,
-    65870,
-    65906,
-    68063,
-    126096,
-    126240
-  ],
-  "50000.0": [
-    8583,
-    65839,
-    65863,
-    65878,
-    68072,
-    126105,
-    126249
-  ],
-  "500000.0": [
-    68081
-  ],
-  "6.0": [
-    54,
-    1638,
-    1782,
-    1990,
-    2412,
-    2540,
-    2668,
-    2796,
-    2924,
-    3052,
-    3180,
-    3308,
-    3436,
-    3564,
-    3670,
-    3798,
-    3878,
-    4166,
-    4246,
-    4974,
-    6118,
-    6134,
-    6166,
-    6476,
-    6614,
-    6790,
-    6806,
-    6998,
-    7094,
-    7238,
-    7254,
-    8310,
-    8326,
-    8549,
-    8565,
-    8581,
-    9317,
-    9337,
-    9357,
-    9466,
-    10107,
-    10117,
-    10127,
-    12326,
-    12837,
-    12933,
-    20845,
-    38470,
-    38520,
-    42534,
-    42731,
-    43222,
-    43270,
-    43478,
-    43510,
-    43606,
-    44022,
-    63953,
-    63955,
-    65302,
-    65804,
-    66278,
-    66726,
-    68037,
-    68918,
-    69221,
-    69719,
-    69740,
-    69878,
-    69948,
-    70102,
-    70118,
-    70390,
-    70742,
-    70870,
-    71254,
-    71366,
-    71478,
-    71910,
-    72022,
-    72790,
-    72799,
-    73046,
-    73126,
-    74756,
-    74763,
-    74769,
-    74778,
-    74792,
-    74816,
-    74830,
-    74859,
-    92774,
-    93014,
-    93830,
-    119526,
-    119653,
-    120788,
-    120798,
-    120808,
-    120818,
-    120828,
-    123206,
-    123638,
-    125132,
-    125270,
-    126070,
-    126120,
-    126214,
-    126259,
-    127239,
-    130038,
-    133866
-  ],
-  "6.0/12.0": [
-    68091
-  ],
-  "60.0": [
-    4983,
-    12877,
-    65813,
-    66287,
-    68046,
-    69230,
-    69728,
-    70127,
-    71919,
-    72808,
-    119662,
-    126079,
-    126223
-  ],
-  "600.0": [
-    65822,
-    66296,
-    68055,
-    69239,
-    126088,
-    126232,
-    126265
-  ],
-  "6000.0": [
-    65831,
-    68064,
-    126097,
-    126241
-  ],
-  "60000.0": [
-    65840,
-    68073,
-    126106,
-    126250
-  ],
-  "600000.0": [
-    68082
-  ],
-  "7.0": [
-    55,
-    1639,
-    1783,
-    1991,
-    2413,
-    2541,
-    2669,
-    2797,
-    2925,
-    3053,
-    3181,
-    3309,
-    3437,
-    3565,
-    3671,
-    3799,
-    3879,
-    4167,
-    4247,
-    4975,
-    6119,
-    6135,
-    6167,
-    6477,
-    6615,
-    6791,
-    6807,
-    6999,
-    7095,
-    7239,
-    7255,
-    8311,
-    8327,
-    8550,
-    8566,
-    9318,
-    9338,
-    9358,
-    9467,
-    10108,
-    10118,
-    10128,
-    12327,
-    12838,
-    12934,
-    15181,
-    19971,
-    26578,
-    28422,
-    42535,
-    42732,
-    43223,
-    43271,
-    43479,
-    43511,
-    43607,
-    44023,
-    65303,
-    65805,
-    66279,
-    66727,
-    68038,
-    68919,
-    69222,
-    69720,
-    69741,
-    69879,
-    69949,
-    70103,
-    70119,
-    70391,
-    70743,
-    70871,
-    71255,
-    71367,
-    71479,
-    71911,
-    72023,
-    72791,
-    72800,
-    73047,
-    73127,
-    74757,
-    74764,
-    74770,
-    74779,
-    74793,
-    74817,
-    74818,
-    74819,
-    74860,
-    92775,
-    93015,
-    93831,
-    119527,
-    119654,
-    120789,
-    120799,
-    120809,
-    120819,
-    120829,
-    123207,
-    123639,
-    125133,
-    125271,
-    126071,
-    126121,
-    126215,
-    126260,
-    127240,
-    130039,
-    131073
-  ],
-  "7.0/12.0": [
-    68092
-  ],
-  "7.0/2.0": [
-    3885
-  ],
-  "7.0/8.0": [
-    8542
-  ],
-  "70.0": [
-    4984,
-    12878,
-    65814,
-    66288,
-    68047,
-    69231,
-    69729,
-    70128,
-    71920,
-    72809,
-    119663,
-    126080,
-    126224
-  ],
-  "700.0": [
-    65823,
-    66297,
-    68056,
-    69240,
-    126089,
-    126233
-  ],
-  "7000.0": [
-    65832,
-    68065,
-    126098,
-    126242
-  ],
-  "70000.0": [
-    65841,
-    68074,
-    126107,
-    126251
-  ],
-  "700000.0": [
-    68083
-  ],
-  "8.0": [
-    56,
-    1640,
-    1784,
-    1992,
-    2414,
-    2542,
-    2670,
-    2798,
-    2926,
-    3054,
-    3182,
-    3310,
-    3438,
-    3566,
-    3672,
-    3800,
-    3880,
-    4168,
-    4248,
-    4976,
-    6120,
-    6136,
-    6168,
-    6478,
-    6616,
-    6792,
-    6808,
-    7000,
-    7096,
-    7240,
-    7256,
-    8312,
-    8328,
-    8551,
-    8567,
-    9319,
-    9339,
-    9359,
-    9468,
-    10109,
-    10119,
-    10129,
-    12328,
-    12839,
-    12935,
-    20843,
-    25420,
-    42536,
-    42733,
-    43224,
-    43272,
-    43480,
-    43512,
-    43608,
-    44024,
-    65304,
-    65806,
-    66280,
-    66728,
-    68039,
-    68920,
-    69223,
-    69721,
-    69742,
-    69880,
-    69950,
-    70104,
-    70120,
-    70392,
-    70744,
-    70872,
-    71256,
-    71368,
-    71480,
-    71912,
-    72024,
-    72792,
-    72801,
-    73048,
-    73128,
-    74758,
-    74765,
-    74771,
-    74780,
-    74794,
-    74820,
-    74821,
-    74861,
-    92776,
-    93016,
-    93832,
-    119528,
-    119655,
-    120790,
-    120800,
-    120810,
-    120820,
-    120830,
-    123208,
-    123640,
-    125134,
-    125272,
-    126072,
-    126122,
-    126216,
-    126261,
-    127241,
-    130040
-  ],
-  "8.0/12.0": [
-    68093
-  ],
-  "80.0": [
-    4985,
-    12879,
-    65815,
-    66289,
-    69232,
-    69730,
-    70129,
-    71921,
-    72810,
-    119664,
-    126081,
-    126225
-  ],
-  "800.0": [
-    65824,
-    66298,
-    68057,
-    69241,
-    126090,
-    126234
-  ],
-  "8000.0": [
-    65833,
-    68066,
-    126099,
-    126243
-  ],
-  "80000.0": [
-    65842,
-    68075,
-    126108,
-    126252
-  ],
-  "800000.0": [
-    68084
-  ],
-  "9.0": [
-    57,
-    1641,
-    1785,
-    1993,
-    2415,
-    2543,
-    2671,
-    2799,
-    2927,
-    3055,
-    3183,
-    3311,
-    3439,
-    3567,
-    3673,
-    3801,
-    3881,
-    4169,
-    4249,
-    4977,
-    6121,
-    6137,
-    6169,
-    6479,
-    6617,
-    6793,
-    6809,
-    7001,
-    7097,
-    7241,
-    7257,
-    8313,
-    8329,
-    8552,
-    8568,
-    9320,
-    9340,
-    9360,
-    9469,
-    10110,
-    10120,
-    10130,
-    12329,
-    12840,
-    12936,
-    20061,
-    24318,
-    29590,
-    42537,
-    42734,
-    43225,
-    43273,
-    43481,
-    43513,
-    43609,
-    44025,
-    65305,
-    65807,
-    66281,
-    66729,
-    68040,
-    68921,
-    69224,
-    69722,
-    69743,
-    69881,
-    69951,
-    70105,
-    70121,
-    70393,
-    70745,
-    70873,
-    71257,
-    71369,
-    71481,
-    71913,
-    72025,
-    72793,
-    72802,
-    73049,
-    73129,
-    74759,
-    74766,
-    74772,
-    74781,
-    74795,
-    74822,
-    74823,
-    74824,
-    74825,
-    74862,
-    92777,
-    93017,
-    93833,
-    119529,
-    119656,
-    120791,
-    120801,
-    120811,
-    120821,
-    120831,
-    123209,
-    123641,
-    125135,
-    125273,
-    126073,
-    126123,
-    126217,
-    126262,
-    127242,
-    130041,
-    194704
-  ],
-  "9.0/12.0": [
-    68094
-  ],
-  "9.0/2.0": [
-    3886
-  ],
-  "90.0": [
-    4986,
-    65816,
-    66290,
-    66369,
-    69233,
-    69731,
-    70130,
-    71922,
-    72811,
-    119665,
-    126082,
-    126226
-  ],
-  "900.0": [
-    65825,
-    66299,
-    66378,
-    68058,
-    69242,
-    126091,
-    126235
-  ],
-  "9000.0": [
-    65834,
-    68067,
-    126100,
-    126244
-  ],
-  "90000.0": [
-    65843,
-    68076,
-    126109,
-    126253
-  ],
-  "900000.0": [
-    68085
-  ]
-}
\ No newline at end of file
+# stdlib
+from array import array
+from sys import byteorder
+
+numeric_values = array('d', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\x00@\x00\x00\x00\x00\x00\x00\x08@\x00\x00\x00\x00\x00\x00\x10@\x00\x00\x00\x00\x00\x00\x14@\x00\x00\x00\x00\x00\x00\x18@\x00\x00\x00\x00\x00\x00\x1c@'
+  b'\x00\x00\x00\x00\x00\x00 @\x00\x00\x00\x00\x00\x00"@\x00\x00\x00\x00\x00\x00\xd0?\x00\x00\x00\x00\x00\x00\xe0?\x00\x00\x00\x00\x00\x00\xe8?\x00\x00\x00\x00\x00\x00\xb0?\x00\x00\x00\x00\x00\x00\xc0?\x00\x00\x00\x00\x00\x00\xc8?'
+  b'\x00\x00\x00\x00\x00\x000@\x00\x00\x00\x00\x00\x00$@\x00\x00\x00\x00\x00\x00Y@\x00\x00\x00\x00\x00@\x8f@\x9a\x99\x99\x99\x99\x99y?\x9a\x99\x99\x99\x99\x99\x99?333333\xa3?\x9a\x99\x99\x99\x99\x99\xa9?'
+  b'\x9a\x99\x99\x99\x99\x99\xb9?333333\xc3?\x9a\x99\x99\x99\x99\x99\xc9?\x00\x00\x00\x00\x00\x00\xf8?\x00\x00\x00\x00\x00\x00\x04@\x00\x00\x00\x00\x00\x00\x0c@\x00\x00\x00\x00\x00\x00\x12@\x00\x00\x00\x00\x00\x00\x16@'
+  b'\x00\x00\x00\x00\x00\x00\x1a@\x00\x00\x00\x00\x00\x00\x1e@\x00\x00\x00\x00\x00\x00!@\x00\x00\x00\x00\x00\x00\xe0\xbf\x00\x00\x00\x00\x00\x004@\x00\x00\x00\x00\x00\x00>@\x00\x00\x00\x00\x00\x00D@\x00\x00\x00\x00\x00\x00I@'
+  b'\x00\x00\x00\x00\x00\x00N@\x00\x00\x00\x00\x00\x80Q@\x00\x00\x00\x00\x00\x00T@\x00\x00\x00\x00\x00\x80V@\x00\x00\x00\x00\x00\x88\xc3@\x00\x00\x00\x00\x00\x001@\x00\x00\x00\x00\x00\x002@\x00\x00\x00\x00\x00\x003@'
+  b'\x92$I\x92$I\xc2?\x1c\xc7q\x1c\xc7q\xbc?UUUUUU\xd5?UUUUUU\xe5?\x9a\x99\x99\x99\x99\x99\xd9?333333\xe3?\x9a\x99\x99\x99\x99\x99\xe9?UUUUUU\xc5?'
+  b'\xab\xaa\xaa\xaa\xaa\xaa\xea?\x00\x00\x00\x00\x00\x00\xd8?\x00\x00\x00\x00\x00\x00\xe4?\x00\x00\x00\x00\x00\x00\xec?\x00\x00\x00\x00\x00\x00&@\x00\x00\x00\x00\x00\x00(@\x00\x00\x00\x00\x00@\x7f@\x00\x00\x00\x00\x00\x88\xb3@'
+  b'\x00\x00\x00\x00\x00j\xe8@\x00\x00\x00\x00\x00j\xf8@\x00\x00\x00\x00\x00\x00*@\x00\x00\x00\x00\x00\x00,@\x00\x00\x00\x00\x00\x00.@\x00\x00\x00\x00\x00\x005@\x00\x00\x00\x00\x00\x006@\x00\x00\x00\x00\x00\x007@'
+  b'\x00\x00\x00\x00\x00\x008@\x00\x00\x00\x00\x00\x009@\x00\x00\x00\x00\x00\x00:@\x00\x00\x00\x00\x00\x00;@\x00\x00\x00\x00\x00\x00<@\x00\x00\x00\x00\x00\x00=@\x00\x00\x00\x00\x00\x00?@\x00\x00\x00\x00\x00\x00@@'
+  b'\x00\x00\x00\x00\x00\x80@@\x00\x00\x00\x00\x00\x00A@\x00\x00\x00\x00\x00\x80A@\x00\x00\x00\x00\x00\x00B@\x00\x00\x00\x00\x00\x80B@\x00\x00\x00\x00\x00\x00C@\x00\x00\x00\x00\x00\x80C@\x00\x00\x00\x00\x00\x80D@'
+  b'\x00\x00\x00\x00\x00\x00E@\x00\x00\x00\x00\x00\x80E@\x00\x00\x00\x00\x00\x00F@\x00\x00\x00\x00\x00\x80F@\x00\x00\x00\x00\x00\x00G@\x00\x00\x00\x00\x00\x80G@\x00\x00\x00\x00\x00\x00H@\x00\x00\x00\x00\x00\x80H@'
+  b'\x00\x00\x00\x00\x84\xd7\x97A\x00\x00\x00\xa2\x94\x1amB\x00\x00\x00\x00\x00\x00i@\x00\x00\x00\x00\x00\xc0r@\x00\x00\x00\x00\x00\x00y@\x00\x00\x00\x00\x00\xc0\x82@\x00\x00\x00\x00\x00\xe0\x85@\x00\x00\x00\x00\x00\x00\x89@'
+  b'\x00\x00\x00\x00\x00 \x8c@\x00\x00\x00\x00\x00@\x9f@\x00\x00\x00\x00\x00p\xa7@\x00\x00\x00\x00\x00@\xaf@\x00\x00\x00\x00\x00p\xb7@\x00\x00\x00\x00\x00X\xbb@\x00\x00\x00\x00\x00@\xbf@\x00\x00\x00\x00\x00\x94\xc1@'
+  b'\x00\x00\x00\x00\x00\x88\xd3@\x00\x00\x00\x00\x00L\xdd@\x00\x00\x00\x00\x00\x88\xe3@\x00\x00\x00\x00\x00L\xed@\x00\x00\x00\x00\x00\x17\xf1@\x00\x00\x00\x00\x00\x88\xf3@\x00\x00\x00\x00\x00\xf9\xf5@UUUUUU\xed?'
+  b'\x00\x00\x00\x00\x00j\x08A\x00\x00\x00\x00\x80O\x12A\x00\x00\x00\x00\x00j\x18A\x00\x00\x00\x00\x80\x84\x1eA\x00\x00\x00\x00\x80O"A\x00\x00\x00\x00\xc0\\%A\x00\x00\x00\x00\x00j(A\x00\x00\x00\x00@w+A'
+  b'UUUUUU\xb5?UUUUUU\xc5?\x00\x00\x00\x00\x00\x00\xd0?UUUUUU\xd5?\xab\xaa\xaa\xaa\xaa\xaa\xda?\x00\x00\x00\x00\x00\x00\xe0?\xab\xaa\xaa\xaa\xaa\xaa\xe2?UUUUUU\xe5?'
+  b'\x00\x00\x00\x00\x00\x00\xe8?\xab\xaa\xaa\xaa\xaa\xaa\xea?\x9a\x99\x99\x99\x99\x99i?\x9a\x99\x99\x99\x99\x99\x89?\x00\x00\x00\x00\x00\x00\x90?\x00\x00\x00\x00\x00\x00\xa0?\x00\x00\x00\x00\x00\x00\xa8?\x00\x00\x00\x00\x00^\nA'
+  b'\x00\x00\x00\x00\x00^\x1aA\x00\x00\x00\x00\x80\x84.A\x00\x00\x00 _\xa0\x02B\x00\x00\x00\x00\xd0\x12cA\x00\x00\x00\x00\xd0\x12sA'
+))
+if byteorder == "big":  # pragma: no cover
+  numeric_values.byteswap()
+
+numeric_numerators = array('q', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\x00\x00\x00\x00\x05\x00\x00\x00\x00\x00\x00\x00\x06\x00\x00\x00\x00\x00\x00\x00\x07\x00\x00\x00\x00\x00\x00\x00'
+  b'\x08\x00\x00\x00\x00\x00\x00\x00\t\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00'
+  b'\x10\x00\x00\x00\x00\x00\x00\x00\n\x00\x00\x00\x00\x00\x00\x00d\x00\x00\x00\x00\x00\x00\x00\xe8\x03\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00'
+  b'\x01\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\x05\x00\x00\x00\x00\x00\x00\x00\x07\x00\x00\x00\x00\x00\x00\x00\t\x00\x00\x00\x00\x00\x00\x00\x0b\x00\x00\x00\x00\x00\x00\x00'
+  b'\r\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x00\x00\x00\x00\x11\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\x14\x00\x00\x00\x00\x00\x00\x00\x1e\x00\x00\x00\x00\x00\x00\x00(\x00\x00\x00\x00\x00\x00\x002\x00\x00\x00\x00\x00\x00\x00'
+  b"<\x00\x00\x00\x00\x00\x00\x00F\x00\x00\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Z\x00\x00\x00\x00\x00\x00\x00\x10'\x00\x00\x00\x00\x00\x00\x11\x00\x00\x00\x00\x00\x00\x00\x12\x00\x00\x00\x00\x00\x00\x00\x13\x00\x00\x00\x00\x00\x00\x00"
+  b'\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00'
+  b'\x05\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\x05\x00\x00\x00\x00\x00\x00\x00\x07\x00\x00\x00\x00\x00\x00\x00\x0b\x00\x00\x00\x00\x00\x00\x00\x0c\x00\x00\x00\x00\x00\x00\x00\xf4\x01\x00\x00\x00\x00\x00\x00\x88\x13\x00\x00\x00\x00\x00\x00'
+  b'P\xc3\x00\x00\x00\x00\x00\x00\xa0\x86\x01\x00\x00\x00\x00\x00\r\x00\x00\x00\x00\x00\x00\x00\x0e\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x00\x00\x00\x00\x15\x00\x00\x00\x00\x00\x00\x00\x16\x00\x00\x00\x00\x00\x00\x00\x17\x00\x00\x00\x00\x00\x00\x00'
+  b'\x18\x00\x00\x00\x00\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x00\x00\x00\x00\x00\x00\x1c\x00\x00\x00\x00\x00\x00\x00\x1d\x00\x00\x00\x00\x00\x00\x00\x1f\x00\x00\x00\x00\x00\x00\x00 \x00\x00\x00\x00\x00\x00\x00'
+  b'!\x00\x00\x00\x00\x00\x00\x00"\x00\x00\x00\x00\x00\x00\x00#\x00\x00\x00\x00\x00\x00\x00$\x00\x00\x00\x00\x00\x00\x00%\x00\x00\x00\x00\x00\x00\x00&\x00\x00\x00\x00\x00\x00\x00\'\x00\x00\x00\x00\x00\x00\x00)\x00\x00\x00\x00\x00\x00\x00'
+  b'*\x00\x00\x00\x00\x00\x00\x00+\x00\x00\x00\x00\x00\x00\x00,\x00\x00\x00\x00\x00\x00\x00-\x00\x00\x00\x00\x00\x00\x00.\x00\x00\x00\x00\x00\x00\x00/\x00\x00\x00\x00\x00\x00\x000\x00\x00\x00\x00\x00\x00\x001\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\xe1\xf5\x05\x00\x00\x00\x00\x00\x10\xa5\xd4\xe8\x00\x00\x00\xc8\x00\x00\x00\x00\x00\x00\x00,\x01\x00\x00\x00\x00\x00\x00\x90\x01\x00\x00\x00\x00\x00\x00X\x02\x00\x00\x00\x00\x00\x00\xbc\x02\x00\x00\x00\x00\x00\x00 \x03\x00\x00\x00\x00\x00\x00'
+  b'\x84\x03\x00\x00\x00\x00\x00\x00\xd0\x07\x00\x00\x00\x00\x00\x00\xb8\x0b\x00\x00\x00\x00\x00\x00\xa0\x0f\x00\x00\x00\x00\x00\x00p\x17\x00\x00\x00\x00\x00\x00X\x1b\x00\x00\x00\x00\x00\x00@\x1f\x00\x00\x00\x00\x00\x00(#\x00\x00\x00\x00\x00\x00'
+  b' N\x00\x00\x00\x00\x00\x000u\x00\x00\x00\x00\x00\x00@\x9c\x00\x00\x00\x00\x00\x00`\xea\x00\x00\x00\x00\x00\x00p\x11\x01\x00\x00\x00\x00\x00\x808\x01\x00\x00\x00\x00\x00\x90_\x01\x00\x00\x00\x00\x00\x0b\x00\x00\x00\x00\x00\x00\x00'
+  b"@\r\x03\x00\x00\x00\x00\x00\xe0\x93\x04\x00\x00\x00\x00\x00\x80\x1a\x06\x00\x00\x00\x00\x00 \xa1\x07\x00\x00\x00\x00\x00\xc0'\t\x00\x00\x00\x00\x00`\xae\n\x00\x00\x00\x00\x00\x005\x0c\x00\x00\x00\x00\x00\xa0\xbb\r\x00\x00\x00\x00\x00"
+  b'\x01\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\x00\x00\x00\x00\x05\x00\x00\x00\x00\x00\x00\x00\x06\x00\x00\x00\x00\x00\x00\x00\x07\x00\x00\x00\x00\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00'
+  b'\t\x00\x00\x00\x00\x00\x00\x00\n\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\xc0K\x03\x00\x00\x00\x00\x00'
+  b'\x80\x97\x06\x00\x00\x00\x00\x00@B\x0f\x00\x00\x00\x00\x00\x00\xe4\x0bT\x02\x00\x00\x00\x80\x96\x98\x00\x00\x00\x00\x00\x00-1\x01\x00\x00\x00\x00'
+))
+if byteorder == "big":  # pragma: no cover
+  numeric_numerators.byteswap()
+
+numeric_denominators = array('H', (
+  b'\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x04\x00\x02\x00\x04\x00\x10\x00\x08\x00\x10\x00\x01\x00\x01\x00\x01\x00\x01\x00\xa0\x00(\x00P\x00\x14\x00\n\x00\x14\x00\x05\x00\x02\x00\x02\x00\x02\x00\x02\x00\x02\x00'
+  b'\x02\x00\x02\x00\x02\x00\x02\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x07\x00\t\x00\x03\x00\x03\x00\x05\x00\x05\x00\x05\x00\x06\x00\x06\x00\x08\x00\x08\x00\x08\x00\x01\x00\x01\x00\x01\x00\x01\x00'
+  b'\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00'
+  b'\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x0c\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00'
+  b'\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00@\x01P\x00@\x00 \x00@\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00'
+))
+if byteorder == "big":  # pragma: no cover
+  numeric_denominators.byteswap()
+
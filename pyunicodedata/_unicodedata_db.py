@@ -0,0 +1,150 @@
+# stdlib
+from array import array
+from sys import byteorder
+
+UNIDATA_VERSION = '13.0.0'
+
+CATEGORY_NAMES = (
+  'Cn',
+  'Lu',
+  'Ll',
+  'Lt',
+  'Mn',
+  'Mc',
+  'Me',
+  'Nd',
+  'Nl',
+  'No',
+  'Zs',
+  'Zl',
+  'Zp',
+  'Cc',
+  'Cf',
+  'Cs',
+  'Co',
+  'Cn',
+  'Lm',
+  'Lo',
+  'Pc',
+  'Pd',
+  'Ps',
+  'Pe',
+  'Pi',
+  'Pf',
+  'Po',
+  'Sm',
+  'Sc',
+  'Sk',
+  'So',
+  )
+
+BIDIRECTIONAL_NAMES = (
+  '',
+  'L',
+  'LRE',
+  'LRO',
+  'R',
+  'AL',
+  'RLE',
+  'RLO',
+  'PDF',
+  'EN',
+  'ES',
+  'ET',
+  'AN',
+  'CS',
+  'NSM',
+  'BN',
+  'B',
+  'S',
+  'WS',
+  'ON',
+  'LRI',
+  'RLI',
+  'FSI',
+  'PDI',
+  )
+
+EASTASIANWIDTH_NAMES = (
+  'F',
+  'H',
+  'W',
+  'Na',
+  'A',
+  'N',
+  )
+
+DECOMP_PREFIX = (
+  '',
+  '<noBreak>',
+  '<compat>',
+  '<super>',
+  '<fraction>',
+  '<sub>',
+  '<font>',
+  '<circle>',
+  '<wide>',
+  '<vertical>',
+  '<square>',
+  '<isolated>',
+  '<final>',
+  '<initial>',
+  '<medial>',
+  '<small>',
+  '<narrow>',
+  )
+
+db_category = array('B', (
+  b'\x00\r\r\r\r\n\x1a\x1a\x1c\x16\x17\x1b\x1a\x15\x07\x1b\x1b\x01\x1d\x14\x02\n\x1a\x1c\x1e\x1d\x1e\x13\x18\x0e\x1e\x1d\x1e\x1b\t\x02\x19\t\x01\x01\x1b\x02\x02\x02\x01\x01\x02\x02\x13\x01\x03\x12\x12\x12\x1d\x1d\x12\x12\x1d\x04\x04\x04\x04\x04'
+  b'\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x12\x1a\x1d\x01\x1b\x01\x1e\x04\x06\x1a\x15\x1c\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x15\x04\x1a\x04\x04\x13\x0e\x1b\x1a\x1c\x1a\x1a\x04\x04\x04\x0e\x13\x13\x12\x04\x04\x04\x04\x04\x04\x04'
+  b'\x07\x1a\x04\x13\x07\x1e\x04\x04\x07\x12\x1a\x1c\x05\x13\x04\x04\x13\x07\x04\x05\x05\t\x04\x04\x04\x04\t\x04\x04\x13\x04\x04\x04\x04\x1a\x04\x16\x17\x04\x04\x04\x04\x04\x13\x13\n\x08\x0e\x05\x04\x04\x04\x04\x04\x04\x02\x02\x03\x01\x1d\n\n\x0e\x0e'
+  b'\x15\x15\x1a\x18\x19\x16\x18\x1a\x0b\x0c\x0e\x0e\x0e\x0e\x0e\x1a\x1a\x1a\x14\x1b\x0e\x0e\x0e\x0e\t\x1b\x1b\x16\x17\x12\x1c\x1c\x1e\x1e\x01\x1e\x1b\t\x08\x08\x1b\x1e\x1b\x1b\x1b\x1b\x1b\x1b\x1b\x1e\x16\x17\x1e\t\x1b\x1b\x1e\x1e\n\x1a\x12\x08\x16\x17'
+  b'\x15\x16\x17\x04\x04\x04\x04\x05\x08\x13\x04\x1d\x12\x13\x1e\t\x1e\t\t\x1d\x0f\x10\x13\x13\x04\x13\x1d\x17\x1c\x1a\x16\x17\x15\x14\x1a\x16\x17\x1a\x1b\x15\x1b\x1b\x1c\x1a\x1a\x1c\x16\x17\x1b\x1a\x15\x07\x1b\x1b\x01\x1d\x14\x02\x1a\x16\x17\x13\x12\x1e'
+  b'\x1e\x1b\x0e\x08\t\t\x1e\x01\x02\t\t\x04\x04\x05\x1e\x05\x05\x1b\x07\x1e\x1e\x1d'
+))
+
+db_combining = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe6\xe6\xe8\xdc\xd8'
+  b'\xca\xdc\xca\x01\x01\xe6\xf0\x00\xe9\xea\x00\x00\x00\x00\x00\x00\x00\xe6\x00\x00\x00\x00\xdc\xde\xe4\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x00\x17\x00\x18\x19\x00\x00\x00\x00\x00\x00\x00\x1e\x1f \x00\x00\x00\x00\x1b\x1c\x1d!"\xe6\xdc'
+  b'\x00\x00#\x00\x00\x00$\x00\x00\x00\x00\x00\x00\x00\x07\t\x00\x00\x07\x00\x00\x00\x00\x00T[\x00\x00\t\x00gkvz\x00\xd8\x00\x00\x81\x82\x00\x84\x00\x00\x00\x00\x00\x00\t\x01\xea\xd6\xca\xe8\xe9\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\xda\xe4\xe8\xde\xe0\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\t\x00\x06\x00\xd8\xe2\x00\x00\x00\x00\x00'
+))
+
+db_bidirectional = array('B', (
+  b'\x00\x0f\x11\x10\x12\x12\x13\x0b\x0b\x13\x13\n\r\n\t\x13\x13\x01\x13\x13\x01\r\x13\x0b\x13\x13\x13\x01\x13\x0f\x13\x13\x0b\x0b\t\x01\x13\x13\x01\x01\x13\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x13\x01\x13\x13\x13\x01\x13\x0e\x0e\x0e\x0e\x0e'
+  b'\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x13\x13\x13\x01\x13\x01\x01\x0e\x0e\x01\x13\x0b\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x04\x0e\x04\x0e\x0e\x04\x0c\x05\x0b\x05\r\x05\x0e\x0e\x0e\x05\x05\x05\x05\x0e\x0e\x0e\x0e\x0e\x0e\x0e'
+  b'\x0c\x0c\x0e\x05\t\x05\x0e\x0e\x04\x04\x13\x04\x01\x01\x0e\x0e\x01\x01\x0e\x01\x01\x01\x0e\x0e\x0e\x0e\x13\x01\x0e\x01\x0e\x0e\x0e\x0e\x01\x0e\x13\x13\x0e\x0e\x0e\x0e\x0e\x01\x01\x12\x01\x0f\x01\x0e\x0e\x0e\x0e\x0e\x0e\x01\x01\x01\x01\x13\x12\x12\x01\x04'
+  b'\x13\x13\x13\x13\x13\x13\x13\x13\x12\x10\x02\x06\x08\x03\x07\x0b\x0b\x0b\x13\r\x14\x15\x16\x17\t\n\x13\x13\x13\x01\x0b\x0b\x13\x13\x01\x0b\x13\x13\x01\x01\x13\x13\x13\x13\x13\n\x0b\x13\x13\x13\x13\x13\x01\x13\x13\x13\x13\x13\x12\x13\x01\x01\x13\x13'
+  b'\x13\x13\x13\x0e\x0e\x0e\x0e\x01\x01\x01\x0e\x13\x01\x01\x01\x01\x01\x01\x13\x01\x01\x01\x01\x04\x0e\x04\x05\x13\x05\x13\x13\x13\x13\x13\r\x13\x13\x0b\n\n\x13\x13\x0b\x13\x0b\x0b\x13\x13\n\r\n\t\x13\x13\x01\x13\x13\x01\x13\x13\x13\x01\x01\x13'
+  b'\x13\x13\x13\x13\t\x04\x04\x04\x04\x0c\x05\x01\x0e\x01\x01\x01\x01\x01\t\x01\x01\x13'
+))
+
+db_mirrored = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x01\x01\x01\x00\x00\x01\x01\x00\x01\x01\x00\x00\x00\x01\x01\x00\x00\x00\x00\x00\x01\x01'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+
+db_east_asian_width = array('B', (
+  b'\x00\x05\x05\x05\x05\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x05\x04\x04\x03\x04\x05\x04\x05\x04\x04\x03\x04\x04\x04\x05\x05\x04\x05\x04\x04\x04\x04\x05\x05\x04\x04\x05\x05\x05\x05\x05\x05\x05\x05\x04\x04\x04\x05\x04\x04\x04\x04\x04'
+  b'\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x05\x05\x05\x05\x05\x04\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05'
+  b'\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x02\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05'
+  b'\x04\x05\x05\x04\x04\x05\x05\x04\x05\x05\x05\x05\x05\x05\x05\x04\x04\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x04\x05\x01\x05\x04\x04\x05\x05\x05\x04\x05\x05\x05\x05\x04\x05\x05\x05\x04\x04\x02\x02\x02\x04\x04\x02\x05\x05\x02\x00\x02\x02\x02\x02\x02'
+  b'\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x04\x02\x05\x05\x04\x02\x05\x05\x05\x05\x05\x05\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x00'
+  b'\x01\x01\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x02\x02\x05\x05\x05\x05\x05\x05\x04\x02'
+))
+
+db_quickcheck = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x00\x00\x00\x88\x00\x88\x00\x00\x00\x88\x00\x00\x88\x88\x00\x88\n\x00\x00\x00\n\n\x00\x88\x88\x00\x00\x88\x88\x88\x00\x00\x00\x00\x00\x00\x88P\x00\x00\x00P'
+  b'\x00PP\x00P\xaaP\x00\x00\x00\xaa\xaa\x8a\x8a\x00\n\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\n\x00\x00\x00\x00\x00\x00PP'
+  b'\x00\x00\x00\x88\x00\x00\x00\x00\x00\x00\x00\x00\x00\nP\x00\xaa\x00\x00P\n\x00P\n\x00P\x00\x00P\x88\x00\x00\x00\x00\x88\x00\x00\x00\x00\x00\xaa\x00\x88\x00P\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8a\xaa\n\xaa\xaa\xaa\x88\x00\x00'
+  b'\x00\x88\x88\x00\x00\x00\x00\x88\x00\x00\x00\x00\x00\x00\x00\x00\x88\x88\x00\x00\x00\x00\x00\x00\x88\x88\x88\x88\x88\x88\x88\x00\x88\x88\xaa\x00\x88\x88\x88\x88\n\n\x00\x00\n\x00\x00\x88\n\x00\xaa\xaa\x88\x00\x00\xaa\x00\x88\x88\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x88\nP\x88\n\x88\x00\x88\x88\x00\x88\x00\x00\x00\xaa\xaa\x00\x88\x00\x00\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88'
+  b'\x88\x88\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaa\x00\x00\x88\x88\x88\x00\x00'
+))
+
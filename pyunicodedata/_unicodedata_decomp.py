@@ -0,0 +1,1646 @@
+# stdlib
+from array import array
+from sys import byteorder
+
+DECOMP_SHIFT = 7
+
+decomp_data = array('I', (
+  b'\x00\x00\x00\x00\x01\x01\x00\x00 \x00\x00\x00\x02\x02\x00\x00 \x00\x00\x00\x08\x03\x00\x00\x03\x01\x00\x00a\x00\x00\x00\x02\x02\x00\x00 \x00\x00\x00\x04\x03\x00\x00\x03\x01\x00\x002\x00\x00\x00\x03\x01\x00\x003\x00\x00\x00\x02\x02\x00\x00'
+  b" \x00\x00\x00\x01\x03\x00\x00\x02\x01\x00\x00\xbc\x03\x00\x00\x02\x02\x00\x00 \x00\x00\x00'\x03\x00\x00\x03\x01\x00\x001\x00\x00\x00\x03\x01\x00\x00o\x00\x00\x00\x04\x03\x00\x001\x00\x00\x00D \x00\x004\x00\x00\x00\x04\x03\x00\x00"
+  b'1\x00\x00\x00D \x00\x002\x00\x00\x00\x04\x03\x00\x003\x00\x00\x00D \x00\x004\x00\x00\x00\x00\x02\x00\x00A\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00A\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00A\x00\x00\x00\x02\x03\x00\x00'
+  b"\x00\x02\x00\x00A\x00\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00A\x00\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00A\x00\x00\x00\n\x03\x00\x00\x00\x02\x00\x00C\x00\x00\x00'\x03\x00\x00\x00\x02\x00\x00E\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00"
+  b'E\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00E\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00E\x00\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00I\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00I\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00I\x00\x00\x00'
+  b'\x02\x03\x00\x00\x00\x02\x00\x00I\x00\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00N\x00\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00O\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00O\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00O\x00\x00\x00\x02\x03\x00\x00'
+  b'\x00\x02\x00\x00O\x00\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00O\x00\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00U\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00U\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00U\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00'
+  b'U\x00\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00Y\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00a\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00a\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00a\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00a\x00\x00\x00'
+  b"\x03\x03\x00\x00\x00\x02\x00\x00a\x00\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00a\x00\x00\x00\n\x03\x00\x00\x00\x02\x00\x00c\x00\x00\x00'\x03\x00\x00\x00\x02\x00\x00e\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00e\x00\x00\x00\x01\x03\x00\x00"
+  b'\x00\x02\x00\x00e\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00e\x00\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00i\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00i\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00i\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00'
+  b'i\x00\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00n\x00\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00o\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00o\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00o\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00o\x00\x00\x00'
+  b'\x03\x03\x00\x00\x00\x02\x00\x00o\x00\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00u\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00u\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00u\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00u\x00\x00\x00\x08\x03\x00\x00'
+  b'\x00\x02\x00\x00y\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00y\x00\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00A\x00\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00a\x00\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00A\x00\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00'
+  b'a\x00\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00A\x00\x00\x00(\x03\x00\x00\x00\x02\x00\x00a\x00\x00\x00(\x03\x00\x00\x00\x02\x00\x00C\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00c\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00C\x00\x00\x00'
+  b'\x02\x03\x00\x00\x00\x02\x00\x00c\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00C\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00c\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00C\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00c\x00\x00\x00\x0c\x03\x00\x00'
+  b'\x00\x02\x00\x00D\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00d\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00E\x00\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00e\x00\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00E\x00\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00'
+  b'e\x00\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00E\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00e\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00E\x00\x00\x00(\x03\x00\x00\x00\x02\x00\x00e\x00\x00\x00(\x03\x00\x00\x00\x02\x00\x00E\x00\x00\x00'
+  b'\x0c\x03\x00\x00\x00\x02\x00\x00e\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00G\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00g\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00G\x00\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00g\x00\x00\x00\x06\x03\x00\x00'
+  b"\x00\x02\x00\x00G\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00g\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00G\x00\x00\x00'\x03\x00\x00\x00\x02\x00\x00g\x00\x00\x00'\x03\x00\x00\x00\x02\x00\x00H\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00"
+  b'h\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00I\x00\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00i\x00\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00I\x00\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00i\x00\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00I\x00\x00\x00'
+  b'\x06\x03\x00\x00\x00\x02\x00\x00i\x00\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00I\x00\x00\x00(\x03\x00\x00\x00\x02\x00\x00i\x00\x00\x00(\x03\x00\x00\x00\x02\x00\x00I\x00\x00\x00\x07\x03\x00\x00\x02\x02\x00\x00I\x00\x00\x00J\x00\x00\x00'
+  b"\x02\x02\x00\x00i\x00\x00\x00j\x00\x00\x00\x00\x02\x00\x00J\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00j\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00K\x00\x00\x00'\x03\x00\x00\x00\x02\x00\x00k\x00\x00\x00'\x03\x00\x00\x00\x02\x00\x00"
+  b"L\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00l\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00L\x00\x00\x00'\x03\x00\x00\x00\x02\x00\x00l\x00\x00\x00'\x03\x00\x00\x00\x02\x00\x00L\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00l\x00\x00\x00"
+  b"\x0c\x03\x00\x00\x02\x02\x00\x00L\x00\x00\x00\xb7\x00\x00\x00\x02\x02\x00\x00l\x00\x00\x00\xb7\x00\x00\x00\x00\x02\x00\x00N\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00n\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00N\x00\x00\x00'\x03\x00\x00"
+  b"\x00\x02\x00\x00n\x00\x00\x00'\x03\x00\x00\x00\x02\x00\x00N\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00n\x00\x00\x00\x0c\x03\x00\x00\x02\x02\x00\x00\xbc\x02\x00\x00n\x00\x00\x00\x00\x02\x00\x00O\x00\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00"
+  b'o\x00\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00O\x00\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00o\x00\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00O\x00\x00\x00\x0b\x03\x00\x00\x00\x02\x00\x00o\x00\x00\x00\x0b\x03\x00\x00\x00\x02\x00\x00R\x00\x00\x00'
+  b"\x01\x03\x00\x00\x00\x02\x00\x00r\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00R\x00\x00\x00'\x03\x00\x00\x00\x02\x00\x00r\x00\x00\x00'\x03\x00\x00\x00\x02\x00\x00R\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00r\x00\x00\x00\x0c\x03\x00\x00"
+  b"\x00\x02\x00\x00S\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00s\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00S\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00s\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00S\x00\x00\x00'\x03\x00\x00\x00\x02\x00\x00"
+  b"s\x00\x00\x00'\x03\x00\x00\x00\x02\x00\x00S\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00s\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00T\x00\x00\x00'\x03\x00\x00\x00\x02\x00\x00t\x00\x00\x00'\x03\x00\x00\x00\x02\x00\x00T\x00\x00\x00"
+  b'\x0c\x03\x00\x00\x00\x02\x00\x00t\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00U\x00\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00u\x00\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00U\x00\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00u\x00\x00\x00\x04\x03\x00\x00'
+  b'\x00\x02\x00\x00U\x00\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00u\x00\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00U\x00\x00\x00\n\x03\x00\x00\x00\x02\x00\x00u\x00\x00\x00\n\x03\x00\x00\x00\x02\x00\x00U\x00\x00\x00\x0b\x03\x00\x00\x00\x02\x00\x00'
+  b'u\x00\x00\x00\x0b\x03\x00\x00\x00\x02\x00\x00U\x00\x00\x00(\x03\x00\x00\x00\x02\x00\x00u\x00\x00\x00(\x03\x00\x00\x00\x02\x00\x00W\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00w\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00Y\x00\x00\x00'
+  b'\x02\x03\x00\x00\x00\x02\x00\x00y\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00Y\x00\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00Z\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00z\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00Z\x00\x00\x00\x07\x03\x00\x00'
+  b'\x00\x02\x00\x00z\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00Z\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00z\x00\x00\x00\x0c\x03\x00\x00\x02\x01\x00\x00s\x00\x00\x00\x00\x02\x00\x00O\x00\x00\x00\x1b\x03\x00\x00\x00\x02\x00\x00o\x00\x00\x00'
+  b'\x1b\x03\x00\x00\x00\x02\x00\x00U\x00\x00\x00\x1b\x03\x00\x00\x00\x02\x00\x00u\x00\x00\x00\x1b\x03\x00\x00\x02\x02\x00\x00D\x00\x00\x00}\x01\x00\x00\x02\x02\x00\x00D\x00\x00\x00~\x01\x00\x00\x02\x02\x00\x00d\x00\x00\x00~\x01\x00\x00'
+  b'\x02\x02\x00\x00L\x00\x00\x00J\x00\x00\x00\x02\x02\x00\x00L\x00\x00\x00j\x00\x00\x00\x02\x02\x00\x00l\x00\x00\x00j\x00\x00\x00\x02\x02\x00\x00N\x00\x00\x00J\x00\x00\x00\x02\x02\x00\x00N\x00\x00\x00j\x00\x00\x00\x02\x02\x00\x00'
+  b'n\x00\x00\x00j\x00\x00\x00\x00\x02\x00\x00A\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00a\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00I\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00i\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00O\x00\x00\x00'
+  b'\x0c\x03\x00\x00\x00\x02\x00\x00o\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00U\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00u\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00\xdc\x00\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00\xfc\x00\x00\x00\x04\x03\x00\x00'
+  b'\x00\x02\x00\x00\xdc\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xfc\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xdc\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00\xfc\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00\xdc\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00'
+  b"\xfc\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\xc4\x00\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00\xe4\x00\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00&\x02\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00'\x02\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00\xc6\x00\x00\x00"
+  b'\x04\x03\x00\x00\x00\x02\x00\x00\xe6\x00\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00G\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00g\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00K\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00k\x00\x00\x00\x0c\x03\x00\x00'
+  b'\x00\x02\x00\x00O\x00\x00\x00(\x03\x00\x00\x00\x02\x00\x00o\x00\x00\x00(\x03\x00\x00\x00\x02\x00\x00\xea\x01\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00\xeb\x01\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00\xb7\x01\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00'
+  b'\x92\x02\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00j\x00\x00\x00\x0c\x03\x00\x00\x02\x02\x00\x00D\x00\x00\x00Z\x00\x00\x00\x02\x02\x00\x00D\x00\x00\x00z\x00\x00\x00\x02\x02\x00\x00d\x00\x00\x00z\x00\x00\x00\x00\x02\x00\x00G\x00\x00\x00'
+  b'\x01\x03\x00\x00\x00\x02\x00\x00g\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00N\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00n\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\xc5\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xe5\x00\x00\x00\x01\x03\x00\x00'
+  b'\x00\x02\x00\x00\xc6\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xe6\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xd8\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xf8\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00A\x00\x00\x00\x0f\x03\x00\x00\x00\x02\x00\x00'
+  b'a\x00\x00\x00\x0f\x03\x00\x00\x00\x02\x00\x00A\x00\x00\x00\x11\x03\x00\x00\x00\x02\x00\x00a\x00\x00\x00\x11\x03\x00\x00\x00\x02\x00\x00E\x00\x00\x00\x0f\x03\x00\x00\x00\x02\x00\x00e\x00\x00\x00\x0f\x03\x00\x00\x00\x02\x00\x00E\x00\x00\x00'
+  b'\x11\x03\x00\x00\x00\x02\x00\x00e\x00\x00\x00\x11\x03\x00\x00\x00\x02\x00\x00I\x00\x00\x00\x0f\x03\x00\x00\x00\x02\x00\x00i\x00\x00\x00\x0f\x03\x00\x00\x00\x02\x00\x00I\x00\x00\x00\x11\x03\x00\x00\x00\x02\x00\x00i\x00\x00\x00\x11\x03\x00\x00'
+  b'\x00\x02\x00\x00O\x00\x00\x00\x0f\x03\x00\x00\x00\x02\x00\x00o\x00\x00\x00\x0f\x03\x00\x00\x00\x02\x00\x00O\x00\x00\x00\x11\x03\x00\x00\x00\x02\x00\x00o\x00\x00\x00\x11\x03\x00\x00\x00\x02\x00\x00R\x00\x00\x00\x0f\x03\x00\x00\x00\x02\x00\x00'
+  b'r\x00\x00\x00\x0f\x03\x00\x00\x00\x02\x00\x00R\x00\x00\x00\x11\x03\x00\x00\x00\x02\x00\x00r\x00\x00\x00\x11\x03\x00\x00\x00\x02\x00\x00U\x00\x00\x00\x0f\x03\x00\x00\x00\x02\x00\x00u\x00\x00\x00\x0f\x03\x00\x00\x00\x02\x00\x00U\x00\x00\x00'
+  b'\x11\x03\x00\x00\x00\x02\x00\x00u\x00\x00\x00\x11\x03\x00\x00\x00\x02\x00\x00S\x00\x00\x00&\x03\x00\x00\x00\x02\x00\x00s\x00\x00\x00&\x03\x00\x00\x00\x02\x00\x00T\x00\x00\x00&\x03\x00\x00\x00\x02\x00\x00t\x00\x00\x00&\x03\x00\x00'
+  b"\x00\x02\x00\x00H\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00h\x00\x00\x00\x0c\x03\x00\x00\x00\x02\x00\x00A\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00a\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00E\x00\x00\x00'\x03\x00\x00\x00\x02\x00\x00"
+  b"e\x00\x00\x00'\x03\x00\x00\x00\x02\x00\x00\xd6\x00\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00\xf6\x00\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00\xd5\x00\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00\xf5\x00\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00O\x00\x00\x00"
+  b'\x07\x03\x00\x00\x00\x02\x00\x00o\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00.\x02\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00/\x02\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00Y\x00\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00y\x00\x00\x00\x04\x03\x00\x00'
+  b'\x03\x01\x00\x00h\x00\x00\x00\x03\x01\x00\x00f\x02\x00\x00\x03\x01\x00\x00j\x00\x00\x00\x03\x01\x00\x00r\x00\x00\x00\x03\x01\x00\x00y\x02\x00\x00\x03\x01\x00\x00{\x02\x00\x00\x03\x01\x00\x00\x81\x02\x00\x00\x03\x01\x00\x00w\x00\x00\x00'
+  b'\x03\x01\x00\x00y\x00\x00\x00\x02\x02\x00\x00 \x00\x00\x00\x06\x03\x00\x00\x02\x02\x00\x00 \x00\x00\x00\x07\x03\x00\x00\x02\x02\x00\x00 \x00\x00\x00\n\x03\x00\x00\x02\x02\x00\x00 \x00\x00\x00(\x03\x00\x00\x02\x02\x00\x00 \x00\x00\x00'
+  b'\x03\x03\x00\x00\x02\x02\x00\x00 \x00\x00\x00\x0b\x03\x00\x00\x03\x01\x00\x00c\x02\x00\x00\x03\x01\x00\x00l\x00\x00\x00\x03\x01\x00\x00s\x00\x00\x00\x03\x01\x00\x00x\x00\x00\x00\x03\x01\x00\x00\x95\x02\x00\x00\x00\x01\x00\x00\x00\x03\x00\x00'
+  b'\x00\x01\x00\x00\x01\x03\x00\x00\x00\x01\x00\x00\x13\x03\x00\x00\x00\x02\x00\x00\x08\x03\x00\x00\x01\x03\x00\x00\x00\x01\x00\x00\xb9\x02\x00\x00\x02\x02\x00\x00 \x00\x00\x00E\x03\x00\x00\x00\x01\x00\x00;\x00\x00\x00\x02\x02\x00\x00 \x00\x00\x00'
+  b'\x01\x03\x00\x00\x00\x02\x00\x00\xa8\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\x91\x03\x00\x00\x01\x03\x00\x00\x00\x01\x00\x00\xb7\x00\x00\x00\x00\x02\x00\x00\x95\x03\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\x97\x03\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00'
+  b'\x99\x03\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\x9f\x03\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xa5\x03\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xa9\x03\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xca\x03\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\x99\x03\x00\x00'
+  b'\x08\x03\x00\x00\x00\x02\x00\x00\xa5\x03\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00\xb1\x03\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xb5\x03\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xb7\x03\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xb9\x03\x00\x00\x01\x03\x00\x00'
+  b'\x00\x02\x00\x00\xcb\x03\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xb9\x03\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00\xc5\x03\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00\xbf\x03\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xc5\x03\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00'
+  b'\xc9\x03\x00\x00\x01\x03\x00\x00\x02\x01\x00\x00\xb2\x03\x00\x00\x02\x01\x00\x00\xb8\x03\x00\x00\x02\x01\x00\x00\xa5\x03\x00\x00\x00\x02\x00\x00\xd2\x03\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xd2\x03\x00\x00\x08\x03\x00\x00\x02\x01\x00\x00\xc6\x03\x00\x00'
+  b'\x02\x01\x00\x00\xc0\x03\x00\x00\x02\x01\x00\x00\xba\x03\x00\x00\x02\x01\x00\x00\xc1\x03\x00\x00\x02\x01\x00\x00\xc2\x03\x00\x00\x02\x01\x00\x00\x98\x03\x00\x00\x02\x01\x00\x00\xb5\x03\x00\x00\x02\x01\x00\x00\xa3\x03\x00\x00\x00\x02\x00\x00\x15\x04\x00\x00'
+  b'\x00\x03\x00\x00\x00\x02\x00\x00\x15\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00\x13\x04\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\x06\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00\x1a\x04\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\x18\x04\x00\x00\x00\x03\x00\x00'
+  b'\x00\x02\x00\x00#\x04\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00\x18\x04\x00\x00\x06\x03\x00\x00\x00\x02\x00\x008\x04\x00\x00\x06\x03\x00\x00\x00\x02\x00\x005\x04\x00\x00\x00\x03\x00\x00\x00\x02\x00\x005\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00'
+  b'3\x04\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00V\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00:\x04\x00\x00\x01\x03\x00\x00\x00\x02\x00\x008\x04\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00C\x04\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00t\x04\x00\x00'
+  b'\x0f\x03\x00\x00\x00\x02\x00\x00u\x04\x00\x00\x0f\x03\x00\x00\x00\x02\x00\x00\x16\x04\x00\x00\x06\x03\x00\x00\x00\x02\x00\x006\x04\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00\x10\x04\x00\x00\x06\x03\x00\x00\x00\x02\x00\x000\x04\x00\x00\x06\x03\x00\x00'
+  b'\x00\x02\x00\x00\x10\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x000\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00\x15\x04\x00\x00\x06\x03\x00\x00\x00\x02\x00\x005\x04\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00\xd8\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00'
+  b'\xd9\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00\x16\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x006\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00\x17\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x007\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00\x18\x04\x00\x00'
+  b'\x04\x03\x00\x00\x00\x02\x00\x008\x04\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00\x18\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x008\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00\x1e\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00>\x04\x00\x00\x08\x03\x00\x00'
+  b'\x00\x02\x00\x00\xe8\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00\xe9\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00-\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00M\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00#\x04\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00'
+  b"C\x04\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00#\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00C\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00#\x04\x00\x00\x0b\x03\x00\x00\x00\x02\x00\x00C\x04\x00\x00\x0b\x03\x00\x00\x00\x02\x00\x00'\x04\x00\x00"
+  b"\x08\x03\x00\x00\x00\x02\x00\x00G\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00+\x04\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00K\x04\x00\x00\x08\x03\x00\x00\x02\x02\x00\x00e\x05\x00\x00\x82\x05\x00\x00\x00\x02\x00\x00'\x06\x00\x00S\x06\x00\x00"
+  b"\x00\x02\x00\x00'\x06\x00\x00T\x06\x00\x00\x00\x02\x00\x00H\x06\x00\x00T\x06\x00\x00\x00\x02\x00\x00'\x06\x00\x00U\x06\x00\x00\x00\x02\x00\x00J\x06\x00\x00T\x06\x00\x00\x02\x02\x00\x00'\x06\x00\x00t\x06\x00\x00\x02\x02\x00\x00"
+  b'H\x06\x00\x00t\x06\x00\x00\x02\x02\x00\x00\xc7\x06\x00\x00t\x06\x00\x00\x02\x02\x00\x00J\x06\x00\x00t\x06\x00\x00\x00\x02\x00\x00\xd5\x06\x00\x00T\x06\x00\x00\x00\x02\x00\x00\xc1\x06\x00\x00T\x06\x00\x00\x00\x02\x00\x00\xd2\x06\x00\x00'
+  b'T\x06\x00\x00\x00\x02\x00\x00(\t\x00\x00<\t\x00\x00\x00\x02\x00\x000\t\x00\x00<\t\x00\x00\x00\x02\x00\x003\t\x00\x00<\t\x00\x00\x00\x02\x00\x00\x15\t\x00\x00<\t\x00\x00\x00\x02\x00\x00\x16\t\x00\x00<\t\x00\x00'
+  b'\x00\x02\x00\x00\x17\t\x00\x00<\t\x00\x00\x00\x02\x00\x00\x1c\t\x00\x00<\t\x00\x00\x00\x02\x00\x00!\t\x00\x00<\t\x00\x00\x00\x02\x00\x00"\t\x00\x00<\t\x00\x00\x00\x02\x00\x00+\t\x00\x00<\t\x00\x00\x00\x02\x00\x00'
+  b'/\t\x00\x00<\t\x00\x00\x00\x02\x00\x00\xc7\t\x00\x00\xbe\t\x00\x00\x00\x02\x00\x00\xc7\t\x00\x00\xd7\t\x00\x00\x00\x02\x00\x00\xa1\t\x00\x00\xbc\t\x00\x00\x00\x02\x00\x00\xa2\t\x00\x00\xbc\t\x00\x00\x00\x02\x00\x00\xaf\t\x00\x00'
+  b'\xbc\t\x00\x00\x00\x02\x00\x002\n\x00\x00<\n\x00\x00\x00\x02\x00\x008\n\x00\x00<\n\x00\x00\x00\x02\x00\x00\x16\n\x00\x00<\n\x00\x00\x00\x02\x00\x00\x17\n\x00\x00<\n\x00\x00\x00\x02\x00\x00\x1c\n\x00\x00<\n\x00\x00'
+  b'\x00\x02\x00\x00+\n\x00\x00<\n\x00\x00\x00\x02\x00\x00G\x0b\x00\x00V\x0b\x00\x00\x00\x02\x00\x00G\x0b\x00\x00>\x0b\x00\x00\x00\x02\x00\x00G\x0b\x00\x00W\x0b\x00\x00\x00\x02\x00\x00!\x0b\x00\x00<\x0b\x00\x00\x00\x02\x00\x00'
+  b'"\x0b\x00\x00<\x0b\x00\x00\x00\x02\x00\x00\x92\x0b\x00\x00\xd7\x0b\x00\x00\x00\x02\x00\x00\xc6\x0b\x00\x00\xbe\x0b\x00\x00\x00\x02\x00\x00\xc7\x0b\x00\x00\xbe\x0b\x00\x00\x00\x02\x00\x00\xc6\x0b\x00\x00\xd7\x0b\x00\x00\x00\x02\x00\x00F\x0c\x00\x00'
+  b'V\x0c\x00\x00\x00\x02\x00\x00\xbf\x0c\x00\x00\xd5\x0c\x00\x00\x00\x02\x00\x00\xc6\x0c\x00\x00\xd5\x0c\x00\x00\x00\x02\x00\x00\xc6\x0c\x00\x00\xd6\x0c\x00\x00\x00\x02\x00\x00\xc6\x0c\x00\x00\xc2\x0c\x00\x00\x00\x02\x00\x00\xca\x0c\x00\x00\xd5\x0c\x00\x00'
+  b'\x00\x02\x00\x00F\r\x00\x00>\r\x00\x00\x00\x02\x00\x00G\r\x00\x00>\r\x00\x00\x00\x02\x00\x00F\r\x00\x00W\r\x00\x00\x00\x02\x00\x00\xd9\r\x00\x00\xca\r\x00\x00\x00\x02\x00\x00\xd9\r\x00\x00\xcf\r\x00\x00\x00\x02\x00\x00'
+  b'\xdc\r\x00\x00\xca\r\x00\x00\x00\x02\x00\x00\xd9\r\x00\x00\xdf\r\x00\x00\x02\x02\x00\x00M\x0e\x00\x002\x0e\x00\x00\x02\x02\x00\x00\xcd\x0e\x00\x00\xb2\x0e\x00\x00\x02\x02\x00\x00\xab\x0e\x00\x00\x99\x0e\x00\x00\x02\x02\x00\x00\xab\x0e\x00\x00'
+  b'\xa1\x0e\x00\x00\x01\x01\x00\x00\x0b\x0f\x00\x00\x00\x02\x00\x00B\x0f\x00\x00\xb7\x0f\x00\x00\x00\x02\x00\x00L\x0f\x00\x00\xb7\x0f\x00\x00\x00\x02\x00\x00Q\x0f\x00\x00\xb7\x0f\x00\x00\x00\x02\x00\x00V\x0f\x00\x00\xb7\x0f\x00\x00\x00\x02\x00\x00'
+  b'[\x0f\x00\x00\xb7\x0f\x00\x00\x00\x02\x00\x00@\x0f\x00\x00\xb5\x0f\x00\x00\x00\x02\x00\x00q\x0f\x00\x00r\x0f\x00\x00\x00\x02\x00\x00q\x0f\x00\x00t\x0f\x00\x00\x00\x02\x00\x00\xb2\x0f\x00\x00\x80\x0f\x00\x00\x02\x02\x00\x00\xb2\x0f\x00\x00'
+  b'\x81\x0f\x00\x00\x00\x02\x00\x00\xb3\x0f\x00\x00\x80\x0f\x00\x00\x02\x02\x00\x00\xb3\x0f\x00\x00\x81\x0f\x00\x00\x00\x02\x00\x00q\x0f\x00\x00\x80\x0f\x00\x00\x00\x02\x00\x00\x92\x0f\x00\x00\xb7\x0f\x00\x00\x00\x02\x00\x00\x9c\x0f\x00\x00\xb7\x0f\x00\x00'
+  b'\x00\x02\x00\x00\xa1\x0f\x00\x00\xb7\x0f\x00\x00\x00\x02\x00\x00\xa6\x0f\x00\x00\xb7\x0f\x00\x00\x00\x02\x00\x00\xab\x0f\x00\x00\xb7\x0f\x00\x00\x00\x02\x00\x00\x90\x0f\x00\x00\xb5\x0f\x00\x00\x00\x02\x00\x00%\x10\x00\x00.\x10\x00\x00\x03\x01\x00\x00'
+  b'\xdc\x10\x00\x00\x00\x02\x00\x00\x05\x1b\x00\x005\x1b\x00\x00\x00\x02\x00\x00\x07\x1b\x00\x005\x1b\x00\x00\x00\x02\x00\x00\t\x1b\x00\x005\x1b\x00\x00\x00\x02\x00\x00\x0b\x1b\x00\x005\x1b\x00\x00\x00\x02\x00\x00\r\x1b\x00\x005\x1b\x00\x00'
+  b'\x00\x02\x00\x00\x11\x1b\x00\x005\x1b\x00\x00\x00\x02\x00\x00:\x1b\x00\x005\x1b\x00\x00\x00\x02\x00\x00<\x1b\x00\x005\x1b\x00\x00\x00\x02\x00\x00>\x1b\x00\x005\x1b\x00\x00\x00\x02\x00\x00?\x1b\x00\x005\x1b\x00\x00\x00\x02\x00\x00'
+  b'B\x1b\x00\x005\x1b\x00\x00\x03\x01\x00\x00A\x00\x00\x00\x03\x01\x00\x00\xc6\x00\x00\x00\x03\x01\x00\x00B\x00\x00\x00\x03\x01\x00\x00D\x00\x00\x00\x03\x01\x00\x00E\x00\x00\x00\x03\x01\x00\x00\x8e\x01\x00\x00\x03\x01\x00\x00G\x00\x00\x00'
+  b'\x03\x01\x00\x00H\x00\x00\x00\x03\x01\x00\x00I\x00\x00\x00\x03\x01\x00\x00J\x00\x00\x00\x03\x01\x00\x00K\x00\x00\x00\x03\x01\x00\x00L\x00\x00\x00\x03\x01\x00\x00M\x00\x00\x00\x03\x01\x00\x00N\x00\x00\x00\x03\x01\x00\x00O\x00\x00\x00'
+  b'\x03\x01\x00\x00"\x02\x00\x00\x03\x01\x00\x00P\x00\x00\x00\x03\x01\x00\x00R\x00\x00\x00\x03\x01\x00\x00T\x00\x00\x00\x03\x01\x00\x00U\x00\x00\x00\x03\x01\x00\x00W\x00\x00\x00\x03\x01\x00\x00a\x00\x00\x00\x03\x01\x00\x00P\x02\x00\x00'
+  b'\x03\x01\x00\x00Q\x02\x00\x00\x03\x01\x00\x00\x02\x1d\x00\x00\x03\x01\x00\x00b\x00\x00\x00\x03\x01\x00\x00d\x00\x00\x00\x03\x01\x00\x00e\x00\x00\x00\x03\x01\x00\x00Y\x02\x00\x00\x03\x01\x00\x00[\x02\x00\x00\x03\x01\x00\x00\\\x02\x00\x00'
+  b'\x03\x01\x00\x00g\x00\x00\x00\x03\x01\x00\x00k\x00\x00\x00\x03\x01\x00\x00m\x00\x00\x00\x03\x01\x00\x00K\x01\x00\x00\x03\x01\x00\x00o\x00\x00\x00\x03\x01\x00\x00T\x02\x00\x00\x03\x01\x00\x00\x16\x1d\x00\x00\x03\x01\x00\x00\x17\x1d\x00\x00'
+  b'\x03\x01\x00\x00p\x00\x00\x00\x03\x01\x00\x00t\x00\x00\x00\x03\x01\x00\x00u\x00\x00\x00\x03\x01\x00\x00\x1d\x1d\x00\x00\x03\x01\x00\x00o\x02\x00\x00\x03\x01\x00\x00v\x00\x00\x00\x03\x01\x00\x00%\x1d\x00\x00\x03\x01\x00\x00\xb2\x03\x00\x00'
+  b'\x03\x01\x00\x00\xb3\x03\x00\x00\x03\x01\x00\x00\xb4\x03\x00\x00\x03\x01\x00\x00\xc6\x03\x00\x00\x03\x01\x00\x00\xc7\x03\x00\x00\x05\x01\x00\x00i\x00\x00\x00\x05\x01\x00\x00r\x00\x00\x00\x05\x01\x00\x00u\x00\x00\x00\x05\x01\x00\x00v\x00\x00\x00'
+  b'\x05\x01\x00\x00\xb2\x03\x00\x00\x05\x01\x00\x00\xb3\x03\x00\x00\x05\x01\x00\x00\xc1\x03\x00\x00\x05\x01\x00\x00\xc6\x03\x00\x00\x05\x01\x00\x00\xc7\x03\x00\x00\x03\x01\x00\x00=\x04\x00\x00\x03\x01\x00\x00R\x02\x00\x00\x03\x01\x00\x00c\x00\x00\x00'
+  b'\x03\x01\x00\x00U\x02\x00\x00\x03\x01\x00\x00\xf0\x00\x00\x00\x03\x01\x00\x00\\\x02\x00\x00\x03\x01\x00\x00f\x00\x00\x00\x03\x01\x00\x00_\x02\x00\x00\x03\x01\x00\x00a\x02\x00\x00\x03\x01\x00\x00e\x02\x00\x00\x03\x01\x00\x00h\x02\x00\x00'
+  b'\x03\x01\x00\x00i\x02\x00\x00\x03\x01\x00\x00j\x02\x00\x00\x03\x01\x00\x00{\x1d\x00\x00\x03\x01\x00\x00\x9d\x02\x00\x00\x03\x01\x00\x00m\x02\x00\x00\x03\x01\x00\x00\x85\x1d\x00\x00\x03\x01\x00\x00\x9f\x02\x00\x00\x03\x01\x00\x00q\x02\x00\x00'
+  b'\x03\x01\x00\x00p\x02\x00\x00\x03\x01\x00\x00r\x02\x00\x00\x03\x01\x00\x00s\x02\x00\x00\x03\x01\x00\x00t\x02\x00\x00\x03\x01\x00\x00u\x02\x00\x00\x03\x01\x00\x00x\x02\x00\x00\x03\x01\x00\x00\x82\x02\x00\x00\x03\x01\x00\x00\x83\x02\x00\x00'
+  b'\x03\x01\x00\x00\xab\x01\x00\x00\x03\x01\x00\x00\x89\x02\x00\x00\x03\x01\x00\x00\x8a\x02\x00\x00\x03\x01\x00\x00\x1c\x1d\x00\x00\x03\x01\x00\x00\x8b\x02\x00\x00\x03\x01\x00\x00\x8c\x02\x00\x00\x03\x01\x00\x00z\x00\x00\x00\x03\x01\x00\x00\x90\x02\x00\x00'
+  b'\x03\x01\x00\x00\x91\x02\x00\x00\x03\x01\x00\x00\x92\x02\x00\x00\x03\x01\x00\x00\xb8\x03\x00\x00\x00\x02\x00\x00A\x00\x00\x00%\x03\x00\x00\x00\x02\x00\x00a\x00\x00\x00%\x03\x00\x00\x00\x02\x00\x00B\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00'
+  b'b\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00B\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00b\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00B\x00\x00\x001\x03\x00\x00\x00\x02\x00\x00b\x00\x00\x001\x03\x00\x00\x00\x02\x00\x00\xc7\x00\x00\x00'
+  b'\x01\x03\x00\x00\x00\x02\x00\x00\xe7\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00D\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00d\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00D\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00d\x00\x00\x00#\x03\x00\x00'
+  b"\x00\x02\x00\x00D\x00\x00\x001\x03\x00\x00\x00\x02\x00\x00d\x00\x00\x001\x03\x00\x00\x00\x02\x00\x00D\x00\x00\x00'\x03\x00\x00\x00\x02\x00\x00d\x00\x00\x00'\x03\x00\x00\x00\x02\x00\x00D\x00\x00\x00-\x03\x00\x00\x00\x02\x00\x00"
+  b'd\x00\x00\x00-\x03\x00\x00\x00\x02\x00\x00\x12\x01\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\x13\x01\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\x12\x01\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\x13\x01\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00E\x00\x00\x00'
+  b'-\x03\x00\x00\x00\x02\x00\x00e\x00\x00\x00-\x03\x00\x00\x00\x02\x00\x00E\x00\x00\x000\x03\x00\x00\x00\x02\x00\x00e\x00\x00\x000\x03\x00\x00\x00\x02\x00\x00(\x02\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00)\x02\x00\x00\x06\x03\x00\x00'
+  b'\x00\x02\x00\x00F\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00f\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00G\x00\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00g\x00\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00H\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00'
+  b'h\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00H\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00h\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00H\x00\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00h\x00\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00H\x00\x00\x00'
+  b"'\x03\x00\x00\x00\x02\x00\x00h\x00\x00\x00'\x03\x00\x00\x00\x02\x00\x00H\x00\x00\x00.\x03\x00\x00\x00\x02\x00\x00h\x00\x00\x00.\x03\x00\x00\x00\x02\x00\x00I\x00\x00\x000\x03\x00\x00\x00\x02\x00\x00i\x00\x00\x000\x03\x00\x00"
+  b'\x00\x02\x00\x00\xcf\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xef\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00K\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00k\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00K\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00'
+  b'k\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00K\x00\x00\x001\x03\x00\x00\x00\x02\x00\x00k\x00\x00\x001\x03\x00\x00\x00\x02\x00\x00L\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00l\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x006\x1e\x00\x00'
+  b'\x04\x03\x00\x00\x00\x02\x00\x007\x1e\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00L\x00\x00\x001\x03\x00\x00\x00\x02\x00\x00l\x00\x00\x001\x03\x00\x00\x00\x02\x00\x00L\x00\x00\x00-\x03\x00\x00\x00\x02\x00\x00l\x00\x00\x00-\x03\x00\x00'
+  b'\x00\x02\x00\x00M\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00m\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00M\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00m\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00M\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00'
+  b'm\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00N\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00n\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00N\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00n\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00N\x00\x00\x00'
+  b'1\x03\x00\x00\x00\x02\x00\x00n\x00\x00\x001\x03\x00\x00\x00\x02\x00\x00N\x00\x00\x00-\x03\x00\x00\x00\x02\x00\x00n\x00\x00\x00-\x03\x00\x00\x00\x02\x00\x00\xd5\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xf5\x00\x00\x00\x01\x03\x00\x00'
+  b'\x00\x02\x00\x00\xd5\x00\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00\xf5\x00\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00L\x01\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00M\x01\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00L\x01\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00'
+  b'M\x01\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00P\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00p\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00P\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00p\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00R\x00\x00\x00'
+  b'\x07\x03\x00\x00\x00\x02\x00\x00r\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00R\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00r\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00Z\x1e\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00[\x1e\x00\x00\x04\x03\x00\x00'
+  b'\x00\x02\x00\x00R\x00\x00\x001\x03\x00\x00\x00\x02\x00\x00r\x00\x00\x001\x03\x00\x00\x00\x02\x00\x00S\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00s\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00S\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00'
+  b's\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00Z\x01\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00[\x01\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00`\x01\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00a\x01\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00b\x1e\x00\x00'
+  b'\x07\x03\x00\x00\x00\x02\x00\x00c\x1e\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00T\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00t\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00T\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00t\x00\x00\x00#\x03\x00\x00'
+  b'\x00\x02\x00\x00T\x00\x00\x001\x03\x00\x00\x00\x02\x00\x00t\x00\x00\x001\x03\x00\x00\x00\x02\x00\x00T\x00\x00\x00-\x03\x00\x00\x00\x02\x00\x00t\x00\x00\x00-\x03\x00\x00\x00\x02\x00\x00U\x00\x00\x00$\x03\x00\x00\x00\x02\x00\x00'
+  b'u\x00\x00\x00$\x03\x00\x00\x00\x02\x00\x00U\x00\x00\x000\x03\x00\x00\x00\x02\x00\x00u\x00\x00\x000\x03\x00\x00\x00\x02\x00\x00U\x00\x00\x00-\x03\x00\x00\x00\x02\x00\x00u\x00\x00\x00-\x03\x00\x00\x00\x02\x00\x00h\x01\x00\x00'
+  b'\x01\x03\x00\x00\x00\x02\x00\x00i\x01\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00j\x01\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00k\x01\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00V\x00\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00v\x00\x00\x00\x03\x03\x00\x00'
+  b'\x00\x02\x00\x00V\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00v\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00W\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00w\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00W\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00'
+  b'w\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00W\x00\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00w\x00\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00W\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00w\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00W\x00\x00\x00'
+  b'#\x03\x00\x00\x00\x02\x00\x00w\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00X\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00x\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00X\x00\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00x\x00\x00\x00\x08\x03\x00\x00'
+  b'\x00\x02\x00\x00Y\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00y\x00\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00Z\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00z\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00Z\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00'
+  b'z\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00Z\x00\x00\x001\x03\x00\x00\x00\x02\x00\x00z\x00\x00\x001\x03\x00\x00\x00\x02\x00\x00h\x00\x00\x001\x03\x00\x00\x00\x02\x00\x00t\x00\x00\x00\x08\x03\x00\x00\x00\x02\x00\x00w\x00\x00\x00'
+  b'\n\x03\x00\x00\x00\x02\x00\x00y\x00\x00\x00\n\x03\x00\x00\x02\x02\x00\x00a\x00\x00\x00\xbe\x02\x00\x00\x00\x02\x00\x00\x7f\x01\x00\x00\x07\x03\x00\x00\x00\x02\x00\x00A\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00a\x00\x00\x00#\x03\x00\x00'
+  b'\x00\x02\x00\x00A\x00\x00\x00\t\x03\x00\x00\x00\x02\x00\x00a\x00\x00\x00\t\x03\x00\x00\x00\x02\x00\x00\xc2\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xe2\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xc2\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00'
+  b'\xe2\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\xc2\x00\x00\x00\t\x03\x00\x00\x00\x02\x00\x00\xe2\x00\x00\x00\t\x03\x00\x00\x00\x02\x00\x00\xc2\x00\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00\xe2\x00\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00\xa0\x1e\x00\x00'
+  b'\x02\x03\x00\x00\x00\x02\x00\x00\xa1\x1e\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00\x02\x01\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\x03\x01\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\x02\x01\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\x03\x01\x00\x00\x00\x03\x00\x00'
+  b'\x00\x02\x00\x00\x02\x01\x00\x00\t\x03\x00\x00\x00\x02\x00\x00\x03\x01\x00\x00\t\x03\x00\x00\x00\x02\x00\x00\x02\x01\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00\x03\x01\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00\xa0\x1e\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00'
+  b'\xa1\x1e\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00E\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00e\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00E\x00\x00\x00\t\x03\x00\x00\x00\x02\x00\x00e\x00\x00\x00\t\x03\x00\x00\x00\x02\x00\x00E\x00\x00\x00'
+  b'\x03\x03\x00\x00\x00\x02\x00\x00e\x00\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00\xca\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xea\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xca\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\xea\x00\x00\x00\x00\x03\x00\x00'
+  b'\x00\x02\x00\x00\xca\x00\x00\x00\t\x03\x00\x00\x00\x02\x00\x00\xea\x00\x00\x00\t\x03\x00\x00\x00\x02\x00\x00\xca\x00\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00\xea\x00\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00\xb8\x1e\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00'
+  b'\xb9\x1e\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00I\x00\x00\x00\t\x03\x00\x00\x00\x02\x00\x00i\x00\x00\x00\t\x03\x00\x00\x00\x02\x00\x00I\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00i\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00O\x00\x00\x00'
+  b'#\x03\x00\x00\x00\x02\x00\x00o\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00O\x00\x00\x00\t\x03\x00\x00\x00\x02\x00\x00o\x00\x00\x00\t\x03\x00\x00\x00\x02\x00\x00\xd4\x00\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xf4\x00\x00\x00\x01\x03\x00\x00'
+  b'\x00\x02\x00\x00\xd4\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\xf4\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\xd4\x00\x00\x00\t\x03\x00\x00\x00\x02\x00\x00\xf4\x00\x00\x00\t\x03\x00\x00\x00\x02\x00\x00\xd4\x00\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00'
+  b'\xf4\x00\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00\xcc\x1e\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00\xcd\x1e\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00\xa0\x01\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xa1\x01\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xa0\x01\x00\x00'
+  b'\x00\x03\x00\x00\x00\x02\x00\x00\xa1\x01\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\xa0\x01\x00\x00\t\x03\x00\x00\x00\x02\x00\x00\xa1\x01\x00\x00\t\x03\x00\x00\x00\x02\x00\x00\xa0\x01\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00\xa1\x01\x00\x00\x03\x03\x00\x00'
+  b'\x00\x02\x00\x00\xa0\x01\x00\x00#\x03\x00\x00\x00\x02\x00\x00\xa1\x01\x00\x00#\x03\x00\x00\x00\x02\x00\x00U\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00u\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00U\x00\x00\x00\t\x03\x00\x00\x00\x02\x00\x00'
+  b'u\x00\x00\x00\t\x03\x00\x00\x00\x02\x00\x00\xaf\x01\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xb0\x01\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xaf\x01\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\xb0\x01\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\xaf\x01\x00\x00'
+  b'\t\x03\x00\x00\x00\x02\x00\x00\xb0\x01\x00\x00\t\x03\x00\x00\x00\x02\x00\x00\xaf\x01\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00\xb0\x01\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00\xaf\x01\x00\x00#\x03\x00\x00\x00\x02\x00\x00\xb0\x01\x00\x00#\x03\x00\x00'
+  b'\x00\x02\x00\x00Y\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00y\x00\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00Y\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00y\x00\x00\x00#\x03\x00\x00\x00\x02\x00\x00Y\x00\x00\x00\t\x03\x00\x00\x00\x02\x00\x00'
+  b'y\x00\x00\x00\t\x03\x00\x00\x00\x02\x00\x00Y\x00\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00y\x00\x00\x00\x03\x03\x00\x00\x00\x02\x00\x00\xb1\x03\x00\x00\x13\x03\x00\x00\x00\x02\x00\x00\xb1\x03\x00\x00\x14\x03\x00\x00\x00\x02\x00\x00\x00\x1f\x00\x00'
+  b'\x00\x03\x00\x00\x00\x02\x00\x00\x01\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\x00\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\x01\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\x00\x1f\x00\x00B\x03\x00\x00\x00\x02\x00\x00\x01\x1f\x00\x00B\x03\x00\x00'
+  b'\x00\x02\x00\x00\x91\x03\x00\x00\x13\x03\x00\x00\x00\x02\x00\x00\x91\x03\x00\x00\x14\x03\x00\x00\x00\x02\x00\x00\x08\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\t\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\x08\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00'
+  b'\t\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\x08\x1f\x00\x00B\x03\x00\x00\x00\x02\x00\x00\t\x1f\x00\x00B\x03\x00\x00\x00\x02\x00\x00\xb5\x03\x00\x00\x13\x03\x00\x00\x00\x02\x00\x00\xb5\x03\x00\x00\x14\x03\x00\x00\x00\x02\x00\x00\x10\x1f\x00\x00'
+  b'\x00\x03\x00\x00\x00\x02\x00\x00\x11\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\x10\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\x11\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\x95\x03\x00\x00\x13\x03\x00\x00\x00\x02\x00\x00\x95\x03\x00\x00\x14\x03\x00\x00'
+  b'\x00\x02\x00\x00\x18\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\x19\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\x18\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\x19\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xb7\x03\x00\x00\x13\x03\x00\x00\x00\x02\x00\x00'
+  b'\xb7\x03\x00\x00\x14\x03\x00\x00\x00\x02\x00\x00 \x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00!\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00 \x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00!\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00 \x1f\x00\x00'
+  b'B\x03\x00\x00\x00\x02\x00\x00!\x1f\x00\x00B\x03\x00\x00\x00\x02\x00\x00\x97\x03\x00\x00\x13\x03\x00\x00\x00\x02\x00\x00\x97\x03\x00\x00\x14\x03\x00\x00\x00\x02\x00\x00(\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00)\x1f\x00\x00\x00\x03\x00\x00'
+  b'\x00\x02\x00\x00(\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00)\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00(\x1f\x00\x00B\x03\x00\x00\x00\x02\x00\x00)\x1f\x00\x00B\x03\x00\x00\x00\x02\x00\x00\xb9\x03\x00\x00\x13\x03\x00\x00\x00\x02\x00\x00'
+  b'\xb9\x03\x00\x00\x14\x03\x00\x00\x00\x02\x00\x000\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x001\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x000\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x001\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x000\x1f\x00\x00'
+  b'B\x03\x00\x00\x00\x02\x00\x001\x1f\x00\x00B\x03\x00\x00\x00\x02\x00\x00\x99\x03\x00\x00\x13\x03\x00\x00\x00\x02\x00\x00\x99\x03\x00\x00\x14\x03\x00\x00\x00\x02\x00\x008\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x009\x1f\x00\x00\x00\x03\x00\x00'
+  b'\x00\x02\x00\x008\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x009\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x008\x1f\x00\x00B\x03\x00\x00\x00\x02\x00\x009\x1f\x00\x00B\x03\x00\x00\x00\x02\x00\x00\xbf\x03\x00\x00\x13\x03\x00\x00\x00\x02\x00\x00'
+  b'\xbf\x03\x00\x00\x14\x03\x00\x00\x00\x02\x00\x00@\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00A\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00@\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00A\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\x9f\x03\x00\x00'
+  b'\x13\x03\x00\x00\x00\x02\x00\x00\x9f\x03\x00\x00\x14\x03\x00\x00\x00\x02\x00\x00H\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00I\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00H\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00I\x1f\x00\x00\x01\x03\x00\x00'
+  b'\x00\x02\x00\x00\xc5\x03\x00\x00\x13\x03\x00\x00\x00\x02\x00\x00\xc5\x03\x00\x00\x14\x03\x00\x00\x00\x02\x00\x00P\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00Q\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00P\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00'
+  b'Q\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00P\x1f\x00\x00B\x03\x00\x00\x00\x02\x00\x00Q\x1f\x00\x00B\x03\x00\x00\x00\x02\x00\x00\xa5\x03\x00\x00\x14\x03\x00\x00\x00\x02\x00\x00Y\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00Y\x1f\x00\x00'
+  b'\x01\x03\x00\x00\x00\x02\x00\x00Y\x1f\x00\x00B\x03\x00\x00\x00\x02\x00\x00\xc9\x03\x00\x00\x13\x03\x00\x00\x00\x02\x00\x00\xc9\x03\x00\x00\x14\x03\x00\x00\x00\x02\x00\x00`\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00a\x1f\x00\x00\x00\x03\x00\x00'
+  b'\x00\x02\x00\x00`\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00a\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00`\x1f\x00\x00B\x03\x00\x00\x00\x02\x00\x00a\x1f\x00\x00B\x03\x00\x00\x00\x02\x00\x00\xa9\x03\x00\x00\x13\x03\x00\x00\x00\x02\x00\x00'
+  b'\xa9\x03\x00\x00\x14\x03\x00\x00\x00\x02\x00\x00h\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00i\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00h\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00i\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00h\x1f\x00\x00'
+  b'B\x03\x00\x00\x00\x02\x00\x00i\x1f\x00\x00B\x03\x00\x00\x00\x02\x00\x00\xb1\x03\x00\x00\x00\x03\x00\x00\x00\x01\x00\x00\xac\x03\x00\x00\x00\x02\x00\x00\xb5\x03\x00\x00\x00\x03\x00\x00\x00\x01\x00\x00\xad\x03\x00\x00\x00\x02\x00\x00\xb7\x03\x00\x00'
+  b'\x00\x03\x00\x00\x00\x01\x00\x00\xae\x03\x00\x00\x00\x02\x00\x00\xb9\x03\x00\x00\x00\x03\x00\x00\x00\x01\x00\x00\xaf\x03\x00\x00\x00\x02\x00\x00\xbf\x03\x00\x00\x00\x03\x00\x00\x00\x01\x00\x00\xcc\x03\x00\x00\x00\x02\x00\x00\xc5\x03\x00\x00\x00\x03\x00\x00'
+  b'\x00\x01\x00\x00\xcd\x03\x00\x00\x00\x02\x00\x00\xc9\x03\x00\x00\x00\x03\x00\x00\x00\x01\x00\x00\xce\x03\x00\x00\x00\x02\x00\x00\x00\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00\x01\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00\x02\x1f\x00\x00E\x03\x00\x00'
+  b'\x00\x02\x00\x00\x03\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00\x04\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00\x05\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00\x06\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00\x07\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00'
+  b'\x08\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00\t\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00\n\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00\x0b\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00\x0c\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00\r\x1f\x00\x00'
+  b'E\x03\x00\x00\x00\x02\x00\x00\x0e\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00\x0f\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00 \x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00!\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00"\x1f\x00\x00E\x03\x00\x00'
+  b"\x00\x02\x00\x00#\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00$\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00%\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00&\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00'\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00"
+  b'(\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00)\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00*\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00+\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00,\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00-\x1f\x00\x00'
+  b'E\x03\x00\x00\x00\x02\x00\x00.\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00/\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00`\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00a\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00b\x1f\x00\x00E\x03\x00\x00'
+  b'\x00\x02\x00\x00c\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00d\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00e\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00f\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00g\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00'
+  b'h\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00i\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00j\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00k\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00l\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00m\x1f\x00\x00'
+  b'E\x03\x00\x00\x00\x02\x00\x00n\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00o\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00\xb1\x03\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00\xb1\x03\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00p\x1f\x00\x00E\x03\x00\x00'
+  b'\x00\x02\x00\x00\xb1\x03\x00\x00E\x03\x00\x00\x00\x02\x00\x00\xac\x03\x00\x00E\x03\x00\x00\x00\x02\x00\x00\xb1\x03\x00\x00B\x03\x00\x00\x00\x02\x00\x00\xb6\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00\x91\x03\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00'
+  b'\x91\x03\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00\x91\x03\x00\x00\x00\x03\x00\x00\x00\x01\x00\x00\x86\x03\x00\x00\x00\x02\x00\x00\x91\x03\x00\x00E\x03\x00\x00\x02\x02\x00\x00 \x00\x00\x00\x13\x03\x00\x00\x00\x01\x00\x00\xb9\x03\x00\x00\x02\x02\x00\x00'
+  b' \x00\x00\x00\x13\x03\x00\x00\x02\x02\x00\x00 \x00\x00\x00B\x03\x00\x00\x00\x02\x00\x00\xa8\x00\x00\x00B\x03\x00\x00\x00\x02\x00\x00t\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00\xb7\x03\x00\x00E\x03\x00\x00\x00\x02\x00\x00\xae\x03\x00\x00'
+  b'E\x03\x00\x00\x00\x02\x00\x00\xb7\x03\x00\x00B\x03\x00\x00\x00\x02\x00\x00\xc6\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00\x95\x03\x00\x00\x00\x03\x00\x00\x00\x01\x00\x00\x88\x03\x00\x00\x00\x02\x00\x00\x97\x03\x00\x00\x00\x03\x00\x00\x00\x01\x00\x00'
+  b'\x89\x03\x00\x00\x00\x02\x00\x00\x97\x03\x00\x00E\x03\x00\x00\x00\x02\x00\x00\xbf\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\xbf\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00\xbf\x1f\x00\x00B\x03\x00\x00\x00\x02\x00\x00\xb9\x03\x00\x00\x06\x03\x00\x00'
+  b'\x00\x02\x00\x00\xb9\x03\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00\xca\x03\x00\x00\x00\x03\x00\x00\x00\x01\x00\x00\x90\x03\x00\x00\x00\x02\x00\x00\xb9\x03\x00\x00B\x03\x00\x00\x00\x02\x00\x00\xca\x03\x00\x00B\x03\x00\x00\x00\x02\x00\x00\x99\x03\x00\x00'
+  b'\x06\x03\x00\x00\x00\x02\x00\x00\x99\x03\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00\x99\x03\x00\x00\x00\x03\x00\x00\x00\x01\x00\x00\x8a\x03\x00\x00\x00\x02\x00\x00\xfe\x1f\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\xfe\x1f\x00\x00\x01\x03\x00\x00\x00\x02\x00\x00'
+  b'\xfe\x1f\x00\x00B\x03\x00\x00\x00\x02\x00\x00\xc5\x03\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00\xc5\x03\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00\xcb\x03\x00\x00\x00\x03\x00\x00\x00\x01\x00\x00\xb0\x03\x00\x00\x00\x02\x00\x00\xc1\x03\x00\x00\x13\x03\x00\x00'
+  b'\x00\x02\x00\x00\xc1\x03\x00\x00\x14\x03\x00\x00\x00\x02\x00\x00\xc5\x03\x00\x00B\x03\x00\x00\x00\x02\x00\x00\xcb\x03\x00\x00B\x03\x00\x00\x00\x02\x00\x00\xa5\x03\x00\x00\x06\x03\x00\x00\x00\x02\x00\x00\xa5\x03\x00\x00\x04\x03\x00\x00\x00\x02\x00\x00'
+  b'\xa5\x03\x00\x00\x00\x03\x00\x00\x00\x01\x00\x00\x8e\x03\x00\x00\x00\x02\x00\x00\xa1\x03\x00\x00\x14\x03\x00\x00\x00\x02\x00\x00\xa8\x00\x00\x00\x00\x03\x00\x00\x00\x01\x00\x00\x85\x03\x00\x00\x00\x01\x00\x00`\x00\x00\x00\x00\x02\x00\x00|\x1f\x00\x00'
+  b'E\x03\x00\x00\x00\x02\x00\x00\xc9\x03\x00\x00E\x03\x00\x00\x00\x02\x00\x00\xce\x03\x00\x00E\x03\x00\x00\x00\x02\x00\x00\xc9\x03\x00\x00B\x03\x00\x00\x00\x02\x00\x00\xf6\x1f\x00\x00E\x03\x00\x00\x00\x02\x00\x00\x9f\x03\x00\x00\x00\x03\x00\x00'
+  b'\x00\x01\x00\x00\x8c\x03\x00\x00\x00\x02\x00\x00\xa9\x03\x00\x00\x00\x03\x00\x00\x00\x01\x00\x00\x8f\x03\x00\x00\x00\x02\x00\x00\xa9\x03\x00\x00E\x03\x00\x00\x00\x01\x00\x00\xb4\x00\x00\x00\x02\x02\x00\x00 \x00\x00\x00\x14\x03\x00\x00\x00\x01\x00\x00'
+  b'\x02 \x00\x00\x00\x01\x00\x00\x03 \x00\x00\x02\x01\x00\x00 \x00\x00\x00\x02\x01\x00\x00 \x00\x00\x00\x02\x01\x00\x00 \x00\x00\x00\x02\x01\x00\x00 \x00\x00\x00\x02\x01\x00\x00 \x00\x00\x00\x01\x01\x00\x00 \x00\x00\x00\x02\x01\x00\x00'
+  b' \x00\x00\x00\x02\x01\x00\x00 \x00\x00\x00\x02\x01\x00\x00 \x00\x00\x00\x01\x01\x00\x00\x10 \x00\x00\x02\x02\x00\x00 \x00\x00\x003\x03\x00\x00\x02\x01\x00\x00.\x00\x00\x00\x02\x02\x00\x00.\x00\x00\x00.\x00\x00\x00\x02\x03\x00\x00'
+  b'.\x00\x00\x00.\x00\x00\x00.\x00\x00\x00\x01\x01\x00\x00 \x00\x00\x00\x02\x02\x00\x002 \x00\x002 \x00\x00\x02\x03\x00\x002 \x00\x002 \x00\x002 \x00\x00\x02\x02\x00\x005 \x00\x005 \x00\x00\x02\x03\x00\x00'
+  b'5 \x00\x005 \x00\x005 \x00\x00\x02\x02\x00\x00!\x00\x00\x00!\x00\x00\x00\x02\x02\x00\x00 \x00\x00\x00\x05\x03\x00\x00\x02\x02\x00\x00?\x00\x00\x00?\x00\x00\x00\x02\x02\x00\x00?\x00\x00\x00!\x00\x00\x00\x02\x02\x00\x00'
+  b'!\x00\x00\x00?\x00\x00\x00\x02\x04\x00\x002 \x00\x002 \x00\x002 \x00\x002 \x00\x00\x02\x01\x00\x00 \x00\x00\x00\x03\x01\x00\x000\x00\x00\x00\x03\x01\x00\x00i\x00\x00\x00\x03\x01\x00\x004\x00\x00\x00\x03\x01\x00\x00'
+  b'5\x00\x00\x00\x03\x01\x00\x006\x00\x00\x00\x03\x01\x00\x007\x00\x00\x00\x03\x01\x00\x008\x00\x00\x00\x03\x01\x00\x009\x00\x00\x00\x03\x01\x00\x00+\x00\x00\x00\x03\x01\x00\x00\x12"\x00\x00\x03\x01\x00\x00=\x00\x00\x00\x03\x01\x00\x00'
+  b'(\x00\x00\x00\x03\x01\x00\x00)\x00\x00\x00\x03\x01\x00\x00n\x00\x00\x00\x05\x01\x00\x000\x00\x00\x00\x05\x01\x00\x001\x00\x00\x00\x05\x01\x00\x002\x00\x00\x00\x05\x01\x00\x003\x00\x00\x00\x05\x01\x00\x004\x00\x00\x00\x05\x01\x00\x00'
+  b'5\x00\x00\x00\x05\x01\x00\x006\x00\x00\x00\x05\x01\x00\x007\x00\x00\x00\x05\x01\x00\x008\x00\x00\x00\x05\x01\x00\x009\x00\x00\x00\x05\x01\x00\x00+\x00\x00\x00\x05\x01\x00\x00\x12"\x00\x00\x05\x01\x00\x00=\x00\x00\x00\x05\x01\x00\x00'
+  b'(\x00\x00\x00\x05\x01\x00\x00)\x00\x00\x00\x05\x01\x00\x00a\x00\x00\x00\x05\x01\x00\x00e\x00\x00\x00\x05\x01\x00\x00o\x00\x00\x00\x05\x01\x00\x00x\x00\x00\x00\x05\x01\x00\x00Y\x02\x00\x00\x05\x01\x00\x00h\x00\x00\x00\x05\x01\x00\x00'
+  b'k\x00\x00\x00\x05\x01\x00\x00l\x00\x00\x00\x05\x01\x00\x00m\x00\x00\x00\x05\x01\x00\x00n\x00\x00\x00\x05\x01\x00\x00p\x00\x00\x00\x05\x01\x00\x00s\x00\x00\x00\x05\x01\x00\x00t\x00\x00\x00\x02\x02\x00\x00R\x00\x00\x00s\x00\x00\x00'
+  b'\x02\x03\x00\x00a\x00\x00\x00/\x00\x00\x00c\x00\x00\x00\x02\x03\x00\x00a\x00\x00\x00/\x00\x00\x00s\x00\x00\x00\x06\x01\x00\x00C\x00\x00\x00\x02\x02\x00\x00\xb0\x00\x00\x00C\x00\x00\x00\x02\x03\x00\x00c\x00\x00\x00/\x00\x00\x00'
+  b'o\x00\x00\x00\x02\x03\x00\x00c\x00\x00\x00/\x00\x00\x00u\x00\x00\x00\x02\x01\x00\x00\x90\x01\x00\x00\x02\x02\x00\x00\xb0\x00\x00\x00F\x00\x00\x00\x06\x01\x00\x00g\x00\x00\x00\x06\x01\x00\x00H\x00\x00\x00\x06\x01\x00\x00H\x00\x00\x00'
+  b"\x06\x01\x00\x00H\x00\x00\x00\x06\x01\x00\x00h\x00\x00\x00\x06\x01\x00\x00'\x01\x00\x00\x06\x01\x00\x00I\x00\x00\x00\x06\x01\x00\x00I\x00\x00\x00\x06\x01\x00\x00L\x00\x00\x00\x06\x01\x00\x00l\x00\x00\x00\x06\x01\x00\x00N\x00\x00\x00"
+  b'\x02\x02\x00\x00N\x00\x00\x00o\x00\x00\x00\x06\x01\x00\x00P\x00\x00\x00\x06\x01\x00\x00Q\x00\x00\x00\x06\x01\x00\x00R\x00\x00\x00\x06\x01\x00\x00R\x00\x00\x00\x06\x01\x00\x00R\x00\x00\x00\x03\x02\x00\x00S\x00\x00\x00M\x00\x00\x00'
+  b'\x02\x03\x00\x00T\x00\x00\x00E\x00\x00\x00L\x00\x00\x00\x03\x02\x00\x00T\x00\x00\x00M\x00\x00\x00\x06\x01\x00\x00Z\x00\x00\x00\x00\x01\x00\x00\xa9\x03\x00\x00\x06\x01\x00\x00Z\x00\x00\x00\x00\x01\x00\x00K\x00\x00\x00\x00\x01\x00\x00'
+  b'\xc5\x00\x00\x00\x06\x01\x00\x00B\x00\x00\x00\x06\x01\x00\x00C\x00\x00\x00\x06\x01\x00\x00e\x00\x00\x00\x06\x01\x00\x00E\x00\x00\x00\x06\x01\x00\x00F\x00\x00\x00\x06\x01\x00\x00M\x00\x00\x00\x06\x01\x00\x00o\x00\x00\x00\x02\x01\x00\x00'
+  b'\xd0\x05\x00\x00\x02\x01\x00\x00\xd1\x05\x00\x00\x02\x01\x00\x00\xd2\x05\x00\x00\x02\x01\x00\x00\xd3\x05\x00\x00\x06\x01\x00\x00i\x00\x00\x00\x02\x03\x00\x00F\x00\x00\x00A\x00\x00\x00X\x00\x00\x00\x06\x01\x00\x00\xc0\x03\x00\x00\x06\x01\x00\x00'
+  b'\xb3\x03\x00\x00\x06\x01\x00\x00\x93\x03\x00\x00\x06\x01\x00\x00\xa0\x03\x00\x00\x06\x01\x00\x00\x11"\x00\x00\x06\x01\x00\x00D\x00\x00\x00\x06\x01\x00\x00d\x00\x00\x00\x06\x01\x00\x00e\x00\x00\x00\x06\x01\x00\x00i\x00\x00\x00\x06\x01\x00\x00'
+  b'j\x00\x00\x00\x04\x03\x00\x001\x00\x00\x00D \x00\x007\x00\x00\x00\x04\x03\x00\x001\x00\x00\x00D \x00\x009\x00\x00\x00\x04\x04\x00\x001\x00\x00\x00D \x00\x001\x00\x00\x000\x00\x00\x00\x04\x03\x00\x001\x00\x00\x00'
+  b'D \x00\x003\x00\x00\x00\x04\x03\x00\x002\x00\x00\x00D \x00\x003\x00\x00\x00\x04\x03\x00\x001\x00\x00\x00D \x00\x005\x00\x00\x00\x04\x03\x00\x002\x00\x00\x00D \x00\x005\x00\x00\x00\x04\x03\x00\x003\x00\x00\x00'
+  b'D \x00\x005\x00\x00\x00\x04\x03\x00\x004\x00\x00\x00D \x00\x005\x00\x00\x00\x04\x03\x00\x001\x00\x00\x00D \x00\x006\x00\x00\x00\x04\x03\x00\x005\x00\x00\x00D \x00\x006\x00\x00\x00\x04\x03\x00\x001\x00\x00\x00'
+  b'D \x00\x008\x00\x00\x00\x04\x03\x00\x003\x00\x00\x00D \x00\x008\x00\x00\x00\x04\x03\x00\x005\x00\x00\x00D \x00\x008\x00\x00\x00\x04\x03\x00\x007\x00\x00\x00D \x00\x008\x00\x00\x00\x04\x02\x00\x001\x00\x00\x00'
+  b'D \x00\x00\x02\x01\x00\x00I\x00\x00\x00\x02\x02\x00\x00I\x00\x00\x00I\x00\x00\x00\x02\x03\x00\x00I\x00\x00\x00I\x00\x00\x00I\x00\x00\x00\x02\x02\x00\x00I\x00\x00\x00V\x00\x00\x00\x02\x01\x00\x00V\x00\x00\x00\x02\x02\x00\x00'
+  b'V\x00\x00\x00I\x00\x00\x00\x02\x03\x00\x00V\x00\x00\x00I\x00\x00\x00I\x00\x00\x00\x02\x04\x00\x00V\x00\x00\x00I\x00\x00\x00I\x00\x00\x00I\x00\x00\x00\x02\x02\x00\x00I\x00\x00\x00X\x00\x00\x00\x02\x01\x00\x00X\x00\x00\x00'
+  b'\x02\x02\x00\x00X\x00\x00\x00I\x00\x00\x00\x02\x03\x00\x00X\x00\x00\x00I\x00\x00\x00I\x00\x00\x00\x02\x01\x00\x00L\x00\x00\x00\x02\x01\x00\x00C\x00\x00\x00\x02\x01\x00\x00D\x00\x00\x00\x02\x01\x00\x00M\x00\x00\x00\x02\x01\x00\x00'
+  b'i\x00\x00\x00\x02\x02\x00\x00i\x00\x00\x00i\x00\x00\x00\x02\x03\x00\x00i\x00\x00\x00i\x00\x00\x00i\x00\x00\x00\x02\x02\x00\x00i\x00\x00\x00v\x00\x00\x00\x02\x01\x00\x00v\x00\x00\x00\x02\x02\x00\x00v\x00\x00\x00i\x00\x00\x00'
+  b'\x02\x03\x00\x00v\x00\x00\x00i\x00\x00\x00i\x00\x00\x00\x02\x04\x00\x00v\x00\x00\x00i\x00\x00\x00i\x00\x00\x00i\x00\x00\x00\x02\x02\x00\x00i\x00\x00\x00x\x00\x00\x00\x02\x01\x00\x00x\x00\x00\x00\x02\x02\x00\x00x\x00\x00\x00'
+  b'i\x00\x00\x00\x02\x03\x00\x00x\x00\x00\x00i\x00\x00\x00i\x00\x00\x00\x02\x01\x00\x00l\x00\x00\x00\x02\x01\x00\x00c\x00\x00\x00\x02\x01\x00\x00d\x00\x00\x00\x02\x01\x00\x00m\x00\x00\x00\x04\x03\x00\x000\x00\x00\x00D \x00\x00'
+  b'3\x00\x00\x00\x00\x02\x00\x00\x90!\x00\x008\x03\x00\x00\x00\x02\x00\x00\x92!\x00\x008\x03\x00\x00\x00\x02\x00\x00\x94!\x00\x008\x03\x00\x00\x00\x02\x00\x00\xd0!\x00\x008\x03\x00\x00\x00\x02\x00\x00\xd4!\x00\x008\x03\x00\x00'
+  b'\x00\x02\x00\x00\xd2!\x00\x008\x03\x00\x00\x00\x02\x00\x00\x03"\x00\x008\x03\x00\x00\x00\x02\x00\x00\x08"\x00\x008\x03\x00\x00\x00\x02\x00\x00\x0b"\x00\x008\x03\x00\x00\x00\x02\x00\x00#"\x00\x008\x03\x00\x00\x00\x02\x00\x00'
+  b'%"\x00\x008\x03\x00\x00\x02\x02\x00\x00+"\x00\x00+"\x00\x00\x02\x03\x00\x00+"\x00\x00+"\x00\x00+"\x00\x00\x02\x02\x00\x00."\x00\x00."\x00\x00\x02\x03\x00\x00."\x00\x00."\x00\x00."\x00\x00'
+  b'\x00\x02\x00\x00<"\x00\x008\x03\x00\x00\x00\x02\x00\x00C"\x00\x008\x03\x00\x00\x00\x02\x00\x00E"\x00\x008\x03\x00\x00\x00\x02\x00\x00H"\x00\x008\x03\x00\x00\x00\x02\x00\x00=\x00\x00\x008\x03\x00\x00\x00\x02\x00\x00'
+  b'a"\x00\x008\x03\x00\x00\x00\x02\x00\x00M"\x00\x008\x03\x00\x00\x00\x02\x00\x00<\x00\x00\x008\x03\x00\x00\x00\x02\x00\x00>\x00\x00\x008\x03\x00\x00\x00\x02\x00\x00d"\x00\x008\x03\x00\x00\x00\x02\x00\x00e"\x00\x00'
+  b'8\x03\x00\x00\x00\x02\x00\x00r"\x00\x008\x03\x00\x00\x00\x02\x00\x00s"\x00\x008\x03\x00\x00\x00\x02\x00\x00v"\x00\x008\x03\x00\x00\x00\x02\x00\x00w"\x00\x008\x03\x00\x00\x00\x02\x00\x00z"\x00\x008\x03\x00\x00'
+  b'\x00\x02\x00\x00{"\x00\x008\x03\x00\x00\x00\x02\x00\x00\x82"\x00\x008\x03\x00\x00\x00\x02\x00\x00\x83"\x00\x008\x03\x00\x00\x00\x02\x00\x00\x86"\x00\x008\x03\x00\x00\x00\x02\x00\x00\x87"\x00\x008\x03\x00\x00\x00\x02\x00\x00'
+  b'\xa2"\x00\x008\x03\x00\x00\x00\x02\x00\x00\xa8"\x00\x008\x03\x00\x00\x00\x02\x00\x00\xa9"\x00\x008\x03\x00\x00\x00\x02\x00\x00\xab"\x00\x008\x03\x00\x00\x00\x02\x00\x00|"\x00\x008\x03\x00\x00\x00\x02\x00\x00}"\x00\x00'
+  b'8\x03\x00\x00\x00\x02\x00\x00\x91"\x00\x008\x03\x00\x00\x00\x02\x00\x00\x92"\x00\x008\x03\x00\x00\x00\x02\x00\x00\xb2"\x00\x008\x03\x00\x00\x00\x02\x00\x00\xb3"\x00\x008\x03\x00\x00\x00\x02\x00\x00\xb4"\x00\x008\x03\x00\x00'
+  b'\x00\x02\x00\x00\xb5"\x00\x008\x03\x00\x00\x00\x01\x00\x00\x080\x00\x00\x00\x01\x00\x00\t0\x00\x00\x07\x01\x00\x001\x00\x00\x00\x07\x01\x00\x002\x00\x00\x00\x07\x01\x00\x003\x00\x00\x00\x07\x01\x00\x004\x00\x00\x00\x07\x01\x00\x00'
+  b'5\x00\x00\x00\x07\x01\x00\x006\x00\x00\x00\x07\x01\x00\x007\x00\x00\x00\x07\x01\x00\x008\x00\x00\x00\x07\x01\x00\x009\x00\x00\x00\x07\x02\x00\x001\x00\x00\x000\x00\x00\x00\x07\x02\x00\x001\x00\x00\x001\x00\x00\x00\x07\x02\x00\x00'
+  b'1\x00\x00\x002\x00\x00\x00\x07\x02\x00\x001\x00\x00\x003\x00\x00\x00\x07\x02\x00\x001\x00\x00\x004\x00\x00\x00\x07\x02\x00\x001\x00\x00\x005\x00\x00\x00\x07\x02\x00\x001\x00\x00\x006\x00\x00\x00\x07\x02\x00\x001\x00\x00\x00'
+  b'7\x00\x00\x00\x07\x02\x00\x001\x00\x00\x008\x00\x00\x00\x07\x02\x00\x001\x00\x00\x009\x00\x00\x00\x07\x02\x00\x002\x00\x00\x000\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x001\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00'
+  b'2\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x003\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x004\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x005\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00'
+  b'6\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x007\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x008\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x009\x00\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x00'
+  b'1\x00\x00\x000\x00\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x001\x00\x00\x001\x00\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x001\x00\x00\x002\x00\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x001\x00\x00\x00'
+  b'3\x00\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x001\x00\x00\x004\x00\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x001\x00\x00\x005\x00\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x001\x00\x00\x006\x00\x00\x00'
+  b')\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x001\x00\x00\x007\x00\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x001\x00\x00\x008\x00\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x001\x00\x00\x009\x00\x00\x00)\x00\x00\x00'
+  b'\x02\x04\x00\x00(\x00\x00\x002\x00\x00\x000\x00\x00\x00)\x00\x00\x00\x02\x02\x00\x001\x00\x00\x00.\x00\x00\x00\x02\x02\x00\x002\x00\x00\x00.\x00\x00\x00\x02\x02\x00\x003\x00\x00\x00.\x00\x00\x00\x02\x02\x00\x004\x00\x00\x00'
+  b'.\x00\x00\x00\x02\x02\x00\x005\x00\x00\x00.\x00\x00\x00\x02\x02\x00\x006\x00\x00\x00.\x00\x00\x00\x02\x02\x00\x007\x00\x00\x00.\x00\x00\x00\x02\x02\x00\x008\x00\x00\x00.\x00\x00\x00\x02\x02\x00\x009\x00\x00\x00.\x00\x00\x00'
+  b'\x02\x03\x00\x001\x00\x00\x000\x00\x00\x00.\x00\x00\x00\x02\x03\x00\x001\x00\x00\x001\x00\x00\x00.\x00\x00\x00\x02\x03\x00\x001\x00\x00\x002\x00\x00\x00.\x00\x00\x00\x02\x03\x00\x001\x00\x00\x003\x00\x00\x00.\x00\x00\x00'
+  b'\x02\x03\x00\x001\x00\x00\x004\x00\x00\x00.\x00\x00\x00\x02\x03\x00\x001\x00\x00\x005\x00\x00\x00.\x00\x00\x00\x02\x03\x00\x001\x00\x00\x006\x00\x00\x00.\x00\x00\x00\x02\x03\x00\x001\x00\x00\x007\x00\x00\x00.\x00\x00\x00'
+  b'\x02\x03\x00\x001\x00\x00\x008\x00\x00\x00.\x00\x00\x00\x02\x03\x00\x001\x00\x00\x009\x00\x00\x00.\x00\x00\x00\x02\x03\x00\x002\x00\x00\x000\x00\x00\x00.\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00a\x00\x00\x00)\x00\x00\x00'
+  b'\x02\x03\x00\x00(\x00\x00\x00b\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00c\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00d\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00e\x00\x00\x00)\x00\x00\x00'
+  b'\x02\x03\x00\x00(\x00\x00\x00f\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00g\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00h\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00i\x00\x00\x00)\x00\x00\x00'
+  b'\x02\x03\x00\x00(\x00\x00\x00j\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00k\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00l\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00m\x00\x00\x00)\x00\x00\x00'
+  b'\x02\x03\x00\x00(\x00\x00\x00n\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00o\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00p\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00q\x00\x00\x00)\x00\x00\x00'
+  b'\x02\x03\x00\x00(\x00\x00\x00r\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00s\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00t\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00u\x00\x00\x00)\x00\x00\x00'
+  b'\x02\x03\x00\x00(\x00\x00\x00v\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00w\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00x\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00y\x00\x00\x00)\x00\x00\x00'
+  b'\x02\x03\x00\x00(\x00\x00\x00z\x00\x00\x00)\x00\x00\x00\x07\x01\x00\x00A\x00\x00\x00\x07\x01\x00\x00B\x00\x00\x00\x07\x01\x00\x00C\x00\x00\x00\x07\x01\x00\x00D\x00\x00\x00\x07\x01\x00\x00E\x00\x00\x00\x07\x01\x00\x00F\x00\x00\x00'
+  b'\x07\x01\x00\x00G\x00\x00\x00\x07\x01\x00\x00H\x00\x00\x00\x07\x01\x00\x00I\x00\x00\x00\x07\x01\x00\x00J\x00\x00\x00\x07\x01\x00\x00K\x00\x00\x00\x07\x01\x00\x00L\x00\x00\x00\x07\x01\x00\x00M\x00\x00\x00\x07\x01\x00\x00N\x00\x00\x00'
+  b'\x07\x01\x00\x00O\x00\x00\x00\x07\x01\x00\x00P\x00\x00\x00\x07\x01\x00\x00Q\x00\x00\x00\x07\x01\x00\x00R\x00\x00\x00\x07\x01\x00\x00S\x00\x00\x00\x07\x01\x00\x00T\x00\x00\x00\x07\x01\x00\x00U\x00\x00\x00\x07\x01\x00\x00V\x00\x00\x00'
+  b'\x07\x01\x00\x00W\x00\x00\x00\x07\x01\x00\x00X\x00\x00\x00\x07\x01\x00\x00Y\x00\x00\x00\x07\x01\x00\x00Z\x00\x00\x00\x07\x01\x00\x00a\x00\x00\x00\x07\x01\x00\x00b\x00\x00\x00\x07\x01\x00\x00c\x00\x00\x00\x07\x01\x00\x00d\x00\x00\x00'
+  b'\x07\x01\x00\x00e\x00\x00\x00\x07\x01\x00\x00f\x00\x00\x00\x07\x01\x00\x00g\x00\x00\x00\x07\x01\x00\x00h\x00\x00\x00\x07\x01\x00\x00i\x00\x00\x00\x07\x01\x00\x00j\x00\x00\x00\x07\x01\x00\x00k\x00\x00\x00\x07\x01\x00\x00l\x00\x00\x00'
+  b'\x07\x01\x00\x00m\x00\x00\x00\x07\x01\x00\x00n\x00\x00\x00\x07\x01\x00\x00o\x00\x00\x00\x07\x01\x00\x00p\x00\x00\x00\x07\x01\x00\x00q\x00\x00\x00\x07\x01\x00\x00r\x00\x00\x00\x07\x01\x00\x00s\x00\x00\x00\x07\x01\x00\x00t\x00\x00\x00'
+  b'\x07\x01\x00\x00u\x00\x00\x00\x07\x01\x00\x00v\x00\x00\x00\x07\x01\x00\x00w\x00\x00\x00\x07\x01\x00\x00x\x00\x00\x00\x07\x01\x00\x00y\x00\x00\x00\x07\x01\x00\x00z\x00\x00\x00\x07\x01\x00\x000\x00\x00\x00\x02\x04\x00\x00+"\x00\x00'
+  b'+"\x00\x00+"\x00\x00+"\x00\x00\x02\x03\x00\x00:\x00\x00\x00:\x00\x00\x00=\x00\x00\x00\x02\x02\x00\x00=\x00\x00\x00=\x00\x00\x00\x02\x03\x00\x00=\x00\x00\x00=\x00\x00\x00=\x00\x00\x00\x00\x02\x00\x00\xdd*\x00\x00'
+  b'8\x03\x00\x00\x05\x01\x00\x00j\x00\x00\x00\x03\x01\x00\x00V\x00\x00\x00\x03\x01\x00\x00a-\x00\x00\x02\x01\x00\x00\xcdk\x00\x00\x02\x01\x00\x00\x9f\x9f\x00\x00\x02\x01\x00\x00\x00N\x00\x00\x02\x01\x00\x00(N\x00\x00\x02\x01\x00\x00'
+  b'6N\x00\x00\x02\x01\x00\x00?N\x00\x00\x02\x01\x00\x00YN\x00\x00\x02\x01\x00\x00\x85N\x00\x00\x02\x01\x00\x00\x8cN\x00\x00\x02\x01\x00\x00\xa0N\x00\x00\x02\x01\x00\x00\xbaN\x00\x00\x02\x01\x00\x00?Q\x00\x00\x02\x01\x00\x00'
+  b'eQ\x00\x00\x02\x01\x00\x00kQ\x00\x00\x02\x01\x00\x00\x82Q\x00\x00\x02\x01\x00\x00\x96Q\x00\x00\x02\x01\x00\x00\xabQ\x00\x00\x02\x01\x00\x00\xe0Q\x00\x00\x02\x01\x00\x00\xf5Q\x00\x00\x02\x01\x00\x00\x00R\x00\x00\x02\x01\x00\x00'
+  b'\x9bR\x00\x00\x02\x01\x00\x00\xf9R\x00\x00\x02\x01\x00\x00\x15S\x00\x00\x02\x01\x00\x00\x1aS\x00\x00\x02\x01\x00\x008S\x00\x00\x02\x01\x00\x00AS\x00\x00\x02\x01\x00\x00\\S\x00\x00\x02\x01\x00\x00iS\x00\x00\x02\x01\x00\x00'
+  b'\x82S\x00\x00\x02\x01\x00\x00\xb6S\x00\x00\x02\x01\x00\x00\xc8S\x00\x00\x02\x01\x00\x00\xe3S\x00\x00\x02\x01\x00\x00\xd7V\x00\x00\x02\x01\x00\x00\x1fW\x00\x00\x02\x01\x00\x00\xebX\x00\x00\x02\x01\x00\x00\x02Y\x00\x00\x02\x01\x00\x00'
+  b"\nY\x00\x00\x02\x01\x00\x00\x15Y\x00\x00\x02\x01\x00\x00'Y\x00\x00\x02\x01\x00\x00sY\x00\x00\x02\x01\x00\x00P[\x00\x00\x02\x01\x00\x00\x80[\x00\x00\x02\x01\x00\x00\xf8[\x00\x00\x02\x01\x00\x00\x0f\\\x00\x00\x02\x01\x00\x00"
+  b'"\\\x00\x00\x02\x01\x00\x008\\\x00\x00\x02\x01\x00\x00n\\\x00\x00\x02\x01\x00\x00q\\\x00\x00\x02\x01\x00\x00\xdb]\x00\x00\x02\x01\x00\x00\xe5]\x00\x00\x02\x01\x00\x00\xf1]\x00\x00\x02\x01\x00\x00\xfe]\x00\x00\x02\x01\x00\x00'
+  b'r^\x00\x00\x02\x01\x00\x00z^\x00\x00\x02\x01\x00\x00\x7f^\x00\x00\x02\x01\x00\x00\xf4^\x00\x00\x02\x01\x00\x00\xfe^\x00\x00\x02\x01\x00\x00\x0b_\x00\x00\x02\x01\x00\x00\x13_\x00\x00\x02\x01\x00\x00P_\x00\x00\x02\x01\x00\x00'
+  b'a_\x00\x00\x02\x01\x00\x00s_\x00\x00\x02\x01\x00\x00\xc3_\x00\x00\x02\x01\x00\x00\x08b\x00\x00\x02\x01\x00\x006b\x00\x00\x02\x01\x00\x00Kb\x00\x00\x02\x01\x00\x00/e\x00\x00\x02\x01\x00\x004e\x00\x00\x02\x01\x00\x00'
+  b'\x87e\x00\x00\x02\x01\x00\x00\x97e\x00\x00\x02\x01\x00\x00\xa4e\x00\x00\x02\x01\x00\x00\xb9e\x00\x00\x02\x01\x00\x00\xe0e\x00\x00\x02\x01\x00\x00\xe5e\x00\x00\x02\x01\x00\x00\xf0f\x00\x00\x02\x01\x00\x00\x08g\x00\x00\x02\x01\x00\x00'
+  b'(g\x00\x00\x02\x01\x00\x00 k\x00\x00\x02\x01\x00\x00bk\x00\x00\x02\x01\x00\x00yk\x00\x00\x02\x01\x00\x00\xb3k\x00\x00\x02\x01\x00\x00\xcbk\x00\x00\x02\x01\x00\x00\xd4k\x00\x00\x02\x01\x00\x00\xdbk\x00\x00\x02\x01\x00\x00'
+  b'\x0fl\x00\x00\x02\x01\x00\x00\x14l\x00\x00\x02\x01\x00\x004l\x00\x00\x02\x01\x00\x00kp\x00\x00\x02\x01\x00\x00*r\x00\x00\x02\x01\x00\x006r\x00\x00\x02\x01\x00\x00;r\x00\x00\x02\x01\x00\x00?r\x00\x00\x02\x01\x00\x00'
+  b'Gr\x00\x00\x02\x01\x00\x00Yr\x00\x00\x02\x01\x00\x00[r\x00\x00\x02\x01\x00\x00\xacr\x00\x00\x02\x01\x00\x00\x84s\x00\x00\x02\x01\x00\x00\x89s\x00\x00\x02\x01\x00\x00\xdct\x00\x00\x02\x01\x00\x00\xe6t\x00\x00\x02\x01\x00\x00'
+  b'\x18u\x00\x00\x02\x01\x00\x00\x1fu\x00\x00\x02\x01\x00\x00(u\x00\x00\x02\x01\x00\x000u\x00\x00\x02\x01\x00\x00\x8bu\x00\x00\x02\x01\x00\x00\x92u\x00\x00\x02\x01\x00\x00vv\x00\x00\x02\x01\x00\x00}v\x00\x00\x02\x01\x00\x00'
+  b'\xaev\x00\x00\x02\x01\x00\x00\xbfv\x00\x00\x02\x01\x00\x00\xeev\x00\x00\x02\x01\x00\x00\xdbw\x00\x00\x02\x01\x00\x00\xe2w\x00\x00\x02\x01\x00\x00\xf3w\x00\x00\x02\x01\x00\x00:y\x00\x00\x02\x01\x00\x00\xb8y\x00\x00\x02\x01\x00\x00'
+  b'\xbey\x00\x00\x02\x01\x00\x00tz\x00\x00\x02\x01\x00\x00\xcbz\x00\x00\x02\x01\x00\x00\xf9z\x00\x00\x02\x01\x00\x00s|\x00\x00\x02\x01\x00\x00\xf8|\x00\x00\x02\x01\x00\x006\x7f\x00\x00\x02\x01\x00\x00Q\x7f\x00\x00\x02\x01\x00\x00'
+  b'\x8a\x7f\x00\x00\x02\x01\x00\x00\xbd\x7f\x00\x00\x02\x01\x00\x00\x01\x80\x00\x00\x02\x01\x00\x00\x0c\x80\x00\x00\x02\x01\x00\x00\x12\x80\x00\x00\x02\x01\x00\x003\x80\x00\x00\x02\x01\x00\x00\x7f\x80\x00\x00\x02\x01\x00\x00\x89\x80\x00\x00\x02\x01\x00\x00'
+  b'\xe3\x81\x00\x00\x02\x01\x00\x00\xea\x81\x00\x00\x02\x01\x00\x00\xf3\x81\x00\x00\x02\x01\x00\x00\xfc\x81\x00\x00\x02\x01\x00\x00\x0c\x82\x00\x00\x02\x01\x00\x00\x1b\x82\x00\x00\x02\x01\x00\x00\x1f\x82\x00\x00\x02\x01\x00\x00n\x82\x00\x00\x02\x01\x00\x00'
+  b'r\x82\x00\x00\x02\x01\x00\x00x\x82\x00\x00\x02\x01\x00\x00M\x86\x00\x00\x02\x01\x00\x00k\x86\x00\x00\x02\x01\x00\x00@\x88\x00\x00\x02\x01\x00\x00L\x88\x00\x00\x02\x01\x00\x00c\x88\x00\x00\x02\x01\x00\x00~\x89\x00\x00\x02\x01\x00\x00'
+  b'\x8b\x89\x00\x00\x02\x01\x00\x00\xd2\x89\x00\x00\x02\x01\x00\x00\x00\x8a\x00\x00\x02\x01\x00\x007\x8c\x00\x00\x02\x01\x00\x00F\x8c\x00\x00\x02\x01\x00\x00U\x8c\x00\x00\x02\x01\x00\x00x\x8c\x00\x00\x02\x01\x00\x00\x9d\x8c\x00\x00\x02\x01\x00\x00'
+  b'd\x8d\x00\x00\x02\x01\x00\x00p\x8d\x00\x00\x02\x01\x00\x00\xb3\x8d\x00\x00\x02\x01\x00\x00\xab\x8e\x00\x00\x02\x01\x00\x00\xca\x8e\x00\x00\x02\x01\x00\x00\x9b\x8f\x00\x00\x02\x01\x00\x00\xb0\x8f\x00\x00\x02\x01\x00\x00\xb5\x8f\x00\x00\x02\x01\x00\x00'
+  b'\x91\x90\x00\x00\x02\x01\x00\x00I\x91\x00\x00\x02\x01\x00\x00\xc6\x91\x00\x00\x02\x01\x00\x00\xcc\x91\x00\x00\x02\x01\x00\x00\xd1\x91\x00\x00\x02\x01\x00\x00w\x95\x00\x00\x02\x01\x00\x00\x80\x95\x00\x00\x02\x01\x00\x00\x1c\x96\x00\x00\x02\x01\x00\x00'
+  b'\xb6\x96\x00\x00\x02\x01\x00\x00\xb9\x96\x00\x00\x02\x01\x00\x00\xe8\x96\x00\x00\x02\x01\x00\x00Q\x97\x00\x00\x02\x01\x00\x00^\x97\x00\x00\x02\x01\x00\x00b\x97\x00\x00\x02\x01\x00\x00i\x97\x00\x00\x02\x01\x00\x00\xcb\x97\x00\x00\x02\x01\x00\x00'
+  b'\xed\x97\x00\x00\x02\x01\x00\x00\xf3\x97\x00\x00\x02\x01\x00\x00\x01\x98\x00\x00\x02\x01\x00\x00\xa8\x98\x00\x00\x02\x01\x00\x00\xdb\x98\x00\x00\x02\x01\x00\x00\xdf\x98\x00\x00\x02\x01\x00\x00\x96\x99\x00\x00\x02\x01\x00\x00\x99\x99\x00\x00\x02\x01\x00\x00'
+  b'\xac\x99\x00\x00\x02\x01\x00\x00\xa8\x9a\x00\x00\x02\x01\x00\x00\xd8\x9a\x00\x00\x02\x01\x00\x00\xdf\x9a\x00\x00\x02\x01\x00\x00%\x9b\x00\x00\x02\x01\x00\x00/\x9b\x00\x00\x02\x01\x00\x002\x9b\x00\x00\x02\x01\x00\x00<\x9b\x00\x00\x02\x01\x00\x00'
+  b'Z\x9b\x00\x00\x02\x01\x00\x00\xe5\x9c\x00\x00\x02\x01\x00\x00u\x9e\x00\x00\x02\x01\x00\x00\x7f\x9e\x00\x00\x02\x01\x00\x00\xa5\x9e\x00\x00\x02\x01\x00\x00\xbb\x9e\x00\x00\x02\x01\x00\x00\xc3\x9e\x00\x00\x02\x01\x00\x00\xcd\x9e\x00\x00\x02\x01\x00\x00'
+  b'\xd1\x9e\x00\x00\x02\x01\x00\x00\xf9\x9e\x00\x00\x02\x01\x00\x00\xfd\x9e\x00\x00\x02\x01\x00\x00\x0e\x9f\x00\x00\x02\x01\x00\x00\x13\x9f\x00\x00\x02\x01\x00\x00 \x9f\x00\x00\x02\x01\x00\x00;\x9f\x00\x00\x02\x01\x00\x00J\x9f\x00\x00\x02\x01\x00\x00'
+  b'R\x9f\x00\x00\x02\x01\x00\x00\x8d\x9f\x00\x00\x02\x01\x00\x00\x9c\x9f\x00\x00\x02\x01\x00\x00\xa0\x9f\x00\x00\x08\x01\x00\x00 \x00\x00\x00\x02\x01\x00\x00\x120\x00\x00\x02\x01\x00\x00AS\x00\x00\x02\x01\x00\x00DS\x00\x00\x02\x01\x00\x00'
+  b'ES\x00\x00\x00\x02\x00\x00K0\x00\x00\x990\x00\x00\x00\x02\x00\x00M0\x00\x00\x990\x00\x00\x00\x02\x00\x00O0\x00\x00\x990\x00\x00\x00\x02\x00\x00Q0\x00\x00\x990\x00\x00\x00\x02\x00\x00S0\x00\x00\x990\x00\x00'
+  b'\x00\x02\x00\x00U0\x00\x00\x990\x00\x00\x00\x02\x00\x00W0\x00\x00\x990\x00\x00\x00\x02\x00\x00Y0\x00\x00\x990\x00\x00\x00\x02\x00\x00[0\x00\x00\x990\x00\x00\x00\x02\x00\x00]0\x00\x00\x990\x00\x00\x00\x02\x00\x00'
+  b'_0\x00\x00\x990\x00\x00\x00\x02\x00\x00a0\x00\x00\x990\x00\x00\x00\x02\x00\x00d0\x00\x00\x990\x00\x00\x00\x02\x00\x00f0\x00\x00\x990\x00\x00\x00\x02\x00\x00h0\x00\x00\x990\x00\x00\x00\x02\x00\x00o0\x00\x00'
+  b'\x990\x00\x00\x00\x02\x00\x00o0\x00\x00\x9a0\x00\x00\x00\x02\x00\x00r0\x00\x00\x990\x00\x00\x00\x02\x00\x00r0\x00\x00\x9a0\x00\x00\x00\x02\x00\x00u0\x00\x00\x990\x00\x00\x00\x02\x00\x00u0\x00\x00\x9a0\x00\x00'
+  b'\x00\x02\x00\x00x0\x00\x00\x990\x00\x00\x00\x02\x00\x00x0\x00\x00\x9a0\x00\x00\x00\x02\x00\x00{0\x00\x00\x990\x00\x00\x00\x02\x00\x00{0\x00\x00\x9a0\x00\x00\x00\x02\x00\x00F0\x00\x00\x990\x00\x00\x02\x02\x00\x00'
+  b' \x00\x00\x00\x990\x00\x00\x02\x02\x00\x00 \x00\x00\x00\x9a0\x00\x00\x00\x02\x00\x00\x9d0\x00\x00\x990\x00\x00\t\x02\x00\x00\x880\x00\x00\x8a0\x00\x00\x00\x02\x00\x00\xab0\x00\x00\x990\x00\x00\x00\x02\x00\x00\xad0\x00\x00'
+  b'\x990\x00\x00\x00\x02\x00\x00\xaf0\x00\x00\x990\x00\x00\x00\x02\x00\x00\xb10\x00\x00\x990\x00\x00\x00\x02\x00\x00\xb30\x00\x00\x990\x00\x00\x00\x02\x00\x00\xb50\x00\x00\x990\x00\x00\x00\x02\x00\x00\xb70\x00\x00\x990\x00\x00'
+  b'\x00\x02\x00\x00\xb90\x00\x00\x990\x00\x00\x00\x02\x00\x00\xbb0\x00\x00\x990\x00\x00\x00\x02\x00\x00\xbd0\x00\x00\x990\x00\x00\x00\x02\x00\x00\xbf0\x00\x00\x990\x00\x00\x00\x02\x00\x00\xc10\x00\x00\x990\x00\x00\x00\x02\x00\x00'
+  b'\xc40\x00\x00\x990\x00\x00\x00\x02\x00\x00\xc60\x00\x00\x990\x00\x00\x00\x02\x00\x00\xc80\x00\x00\x990\x00\x00\x00\x02\x00\x00\xcf0\x00\x00\x990\x00\x00\x00\x02\x00\x00\xcf0\x00\x00\x9a0\x00\x00\x00\x02\x00\x00\xd20\x00\x00'
+  b'\x990\x00\x00\x00\x02\x00\x00\xd20\x00\x00\x9a0\x00\x00\x00\x02\x00\x00\xd50\x00\x00\x990\x00\x00\x00\x02\x00\x00\xd50\x00\x00\x9a0\x00\x00\x00\x02\x00\x00\xd80\x00\x00\x990\x00\x00\x00\x02\x00\x00\xd80\x00\x00\x9a0\x00\x00'
+  b'\x00\x02\x00\x00\xdb0\x00\x00\x990\x00\x00\x00\x02\x00\x00\xdb0\x00\x00\x9a0\x00\x00\x00\x02\x00\x00\xa60\x00\x00\x990\x00\x00\x00\x02\x00\x00\xef0\x00\x00\x990\x00\x00\x00\x02\x00\x00\xf00\x00\x00\x990\x00\x00\x00\x02\x00\x00'
+  b'\xf10\x00\x00\x990\x00\x00\x00\x02\x00\x00\xf20\x00\x00\x990\x00\x00\x00\x02\x00\x00\xfd0\x00\x00\x990\x00\x00\t\x02\x00\x00\xb30\x00\x00\xc80\x00\x00\x02\x01\x00\x00\x00\x11\x00\x00\x02\x01\x00\x00\x01\x11\x00\x00\x02\x01\x00\x00'
+  b'\xaa\x11\x00\x00\x02\x01\x00\x00\x02\x11\x00\x00\x02\x01\x00\x00\xac\x11\x00\x00\x02\x01\x00\x00\xad\x11\x00\x00\x02\x01\x00\x00\x03\x11\x00\x00\x02\x01\x00\x00\x04\x11\x00\x00\x02\x01\x00\x00\x05\x11\x00\x00\x02\x01\x00\x00\xb0\x11\x00\x00\x02\x01\x00\x00'
+  b'\xb1\x11\x00\x00\x02\x01\x00\x00\xb2\x11\x00\x00\x02\x01\x00\x00\xb3\x11\x00\x00\x02\x01\x00\x00\xb4\x11\x00\x00\x02\x01\x00\x00\xb5\x11\x00\x00\x02\x01\x00\x00\x1a\x11\x00\x00\x02\x01\x00\x00\x06\x11\x00\x00\x02\x01\x00\x00\x07\x11\x00\x00\x02\x01\x00\x00'
+  b'\x08\x11\x00\x00\x02\x01\x00\x00!\x11\x00\x00\x02\x01\x00\x00\t\x11\x00\x00\x02\x01\x00\x00\n\x11\x00\x00\x02\x01\x00\x00\x0b\x11\x00\x00\x02\x01\x00\x00\x0c\x11\x00\x00\x02\x01\x00\x00\r\x11\x00\x00\x02\x01\x00\x00\x0e\x11\x00\x00\x02\x01\x00\x00'
+  b'\x0f\x11\x00\x00\x02\x01\x00\x00\x10\x11\x00\x00\x02\x01\x00\x00\x11\x11\x00\x00\x02\x01\x00\x00\x12\x11\x00\x00\x02\x01\x00\x00a\x11\x00\x00\x02\x01\x00\x00b\x11\x00\x00\x02\x01\x00\x00c\x11\x00\x00\x02\x01\x00\x00d\x11\x00\x00\x02\x01\x00\x00'
+  b'e\x11\x00\x00\x02\x01\x00\x00f\x11\x00\x00\x02\x01\x00\x00g\x11\x00\x00\x02\x01\x00\x00h\x11\x00\x00\x02\x01\x00\x00i\x11\x00\x00\x02\x01\x00\x00j\x11\x00\x00\x02\x01\x00\x00k\x11\x00\x00\x02\x01\x00\x00l\x11\x00\x00\x02\x01\x00\x00'
+  b'm\x11\x00\x00\x02\x01\x00\x00n\x11\x00\x00\x02\x01\x00\x00o\x11\x00\x00\x02\x01\x00\x00p\x11\x00\x00\x02\x01\x00\x00q\x11\x00\x00\x02\x01\x00\x00r\x11\x00\x00\x02\x01\x00\x00s\x11\x00\x00\x02\x01\x00\x00t\x11\x00\x00\x02\x01\x00\x00'
+  b'u\x11\x00\x00\x02\x01\x00\x00`\x11\x00\x00\x02\x01\x00\x00\x14\x11\x00\x00\x02\x01\x00\x00\x15\x11\x00\x00\x02\x01\x00\x00\xc7\x11\x00\x00\x02\x01\x00\x00\xc8\x11\x00\x00\x02\x01\x00\x00\xcc\x11\x00\x00\x02\x01\x00\x00\xce\x11\x00\x00\x02\x01\x00\x00'
+  b'\xd3\x11\x00\x00\x02\x01\x00\x00\xd7\x11\x00\x00\x02\x01\x00\x00\xd9\x11\x00\x00\x02\x01\x00\x00\x1c\x11\x00\x00\x02\x01\x00\x00\xdd\x11\x00\x00\x02\x01\x00\x00\xdf\x11\x00\x00\x02\x01\x00\x00\x1d\x11\x00\x00\x02\x01\x00\x00\x1e\x11\x00\x00\x02\x01\x00\x00'
+  b' \x11\x00\x00\x02\x01\x00\x00"\x11\x00\x00\x02\x01\x00\x00#\x11\x00\x00\x02\x01\x00\x00\'\x11\x00\x00\x02\x01\x00\x00)\x11\x00\x00\x02\x01\x00\x00+\x11\x00\x00\x02\x01\x00\x00,\x11\x00\x00\x02\x01\x00\x00-\x11\x00\x00\x02\x01\x00\x00'
+  b'.\x11\x00\x00\x02\x01\x00\x00/\x11\x00\x00\x02\x01\x00\x002\x11\x00\x00\x02\x01\x00\x006\x11\x00\x00\x02\x01\x00\x00@\x11\x00\x00\x02\x01\x00\x00G\x11\x00\x00\x02\x01\x00\x00L\x11\x00\x00\x02\x01\x00\x00\xf1\x11\x00\x00\x02\x01\x00\x00'
+  b'\xf2\x11\x00\x00\x02\x01\x00\x00W\x11\x00\x00\x02\x01\x00\x00X\x11\x00\x00\x02\x01\x00\x00Y\x11\x00\x00\x02\x01\x00\x00\x84\x11\x00\x00\x02\x01\x00\x00\x85\x11\x00\x00\x02\x01\x00\x00\x88\x11\x00\x00\x02\x01\x00\x00\x91\x11\x00\x00\x02\x01\x00\x00'
+  b'\x92\x11\x00\x00\x02\x01\x00\x00\x94\x11\x00\x00\x02\x01\x00\x00\x9e\x11\x00\x00\x02\x01\x00\x00\xa1\x11\x00\x00\x03\x01\x00\x00\x00N\x00\x00\x03\x01\x00\x00\x8cN\x00\x00\x03\x01\x00\x00\tN\x00\x00\x03\x01\x00\x00\xdbV\x00\x00\x03\x01\x00\x00'
+  b'\nN\x00\x00\x03\x01\x00\x00-N\x00\x00\x03\x01\x00\x00\x0bN\x00\x00\x03\x01\x00\x002u\x00\x00\x03\x01\x00\x00YN\x00\x00\x03\x01\x00\x00\x19N\x00\x00\x03\x01\x00\x00\x01N\x00\x00\x03\x01\x00\x00)Y\x00\x00\x03\x01\x00\x00'
+  b'0W\x00\x00\x03\x01\x00\x00\xbaN\x00\x00\x02\x03\x00\x00(\x00\x00\x00\x00\x11\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\x02\x11\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\x03\x11\x00\x00)\x00\x00\x00\x02\x03\x00\x00'
+  b'(\x00\x00\x00\x05\x11\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\x06\x11\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\x07\x11\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\t\x11\x00\x00)\x00\x00\x00\x02\x03\x00\x00'
+  b'(\x00\x00\x00\x0b\x11\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\x0c\x11\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\x0e\x11\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\x0f\x11\x00\x00)\x00\x00\x00\x02\x03\x00\x00'
+  b'(\x00\x00\x00\x10\x11\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\x11\x11\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\x12\x11\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x00\x00\x11\x00\x00a\x11\x00\x00)\x00\x00\x00'
+  b'\x02\x04\x00\x00(\x00\x00\x00\x02\x11\x00\x00a\x11\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x00\x03\x11\x00\x00a\x11\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x00\x05\x11\x00\x00a\x11\x00\x00)\x00\x00\x00\x02\x04\x00\x00'
+  b'(\x00\x00\x00\x06\x11\x00\x00a\x11\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x00\x07\x11\x00\x00a\x11\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x00\t\x11\x00\x00a\x11\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x00'
+  b'\x0b\x11\x00\x00a\x11\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x00\x0c\x11\x00\x00a\x11\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x00\x0e\x11\x00\x00a\x11\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x00\x0f\x11\x00\x00'
+  b'a\x11\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x00\x10\x11\x00\x00a\x11\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x00\x11\x11\x00\x00a\x11\x00\x00)\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x00\x12\x11\x00\x00a\x11\x00\x00'
+  b')\x00\x00\x00\x02\x04\x00\x00(\x00\x00\x00\x0c\x11\x00\x00n\x11\x00\x00)\x00\x00\x00\x02\x07\x00\x00(\x00\x00\x00\x0b\x11\x00\x00i\x11\x00\x00\x0c\x11\x00\x00e\x11\x00\x00\xab\x11\x00\x00)\x00\x00\x00\x02\x06\x00\x00(\x00\x00\x00'
+  b'\x0b\x11\x00\x00i\x11\x00\x00\x12\x11\x00\x00n\x11\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\x00N\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\x8cN\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\tN\x00\x00'
+  b')\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\xdbV\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\x94N\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00mQ\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\x03N\x00\x00'
+  b')\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00kQ\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00]N\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00AS\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\x08g\x00\x00'
+  b')\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00kp\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x004l\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00(g\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\xd1\x91\x00\x00'
+  b')\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\x1fW\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\xe5e\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00*h\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\tg\x00\x00'
+  b')\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00>y\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\rT\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00yr\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\xa1\x8c\x00\x00'
+  b')\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00]y\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\xb4R\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\xe3N\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00|T\x00\x00'
+  b')\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00f[\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\xe3v\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\x01O\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\xc7\x8c\x00\x00'
+  b')\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00TS\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00my\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\x11O\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\xea\x81\x00\x00'
+  b')\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00\xf3\x81\x00\x00)\x00\x00\x00\x07\x01\x00\x00OU\x00\x00\x07\x01\x00\x00|^\x00\x00\x07\x01\x00\x00\x87e\x00\x00\x07\x01\x00\x00\x8f{\x00\x00\n\x03\x00\x00P\x00\x00\x00T\x00\x00\x00'
+  b'E\x00\x00\x00\x07\x02\x00\x002\x00\x00\x001\x00\x00\x00\x07\x02\x00\x002\x00\x00\x002\x00\x00\x00\x07\x02\x00\x002\x00\x00\x003\x00\x00\x00\x07\x02\x00\x002\x00\x00\x004\x00\x00\x00\x07\x02\x00\x002\x00\x00\x005\x00\x00\x00'
+  b'\x07\x02\x00\x002\x00\x00\x006\x00\x00\x00\x07\x02\x00\x002\x00\x00\x007\x00\x00\x00\x07\x02\x00\x002\x00\x00\x008\x00\x00\x00\x07\x02\x00\x002\x00\x00\x009\x00\x00\x00\x07\x02\x00\x003\x00\x00\x000\x00\x00\x00\x07\x02\x00\x00'
+  b'3\x00\x00\x001\x00\x00\x00\x07\x02\x00\x003\x00\x00\x002\x00\x00\x00\x07\x02\x00\x003\x00\x00\x003\x00\x00\x00\x07\x02\x00\x003\x00\x00\x004\x00\x00\x00\x07\x02\x00\x003\x00\x00\x005\x00\x00\x00\x07\x01\x00\x00\x00\x11\x00\x00'
+  b'\x07\x01\x00\x00\x02\x11\x00\x00\x07\x01\x00\x00\x03\x11\x00\x00\x07\x01\x00\x00\x05\x11\x00\x00\x07\x01\x00\x00\x06\x11\x00\x00\x07\x01\x00\x00\x07\x11\x00\x00\x07\x01\x00\x00\t\x11\x00\x00\x07\x01\x00\x00\x0b\x11\x00\x00\x07\x01\x00\x00\x0c\x11\x00\x00'
+  b'\x07\x01\x00\x00\x0e\x11\x00\x00\x07\x01\x00\x00\x0f\x11\x00\x00\x07\x01\x00\x00\x10\x11\x00\x00\x07\x01\x00\x00\x11\x11\x00\x00\x07\x01\x00\x00\x12\x11\x00\x00\x07\x02\x00\x00\x00\x11\x00\x00a\x11\x00\x00\x07\x02\x00\x00\x02\x11\x00\x00a\x11\x00\x00'
+  b'\x07\x02\x00\x00\x03\x11\x00\x00a\x11\x00\x00\x07\x02\x00\x00\x05\x11\x00\x00a\x11\x00\x00\x07\x02\x00\x00\x06\x11\x00\x00a\x11\x00\x00\x07\x02\x00\x00\x07\x11\x00\x00a\x11\x00\x00\x07\x02\x00\x00\t\x11\x00\x00a\x11\x00\x00\x07\x02\x00\x00'
+  b'\x0b\x11\x00\x00a\x11\x00\x00\x07\x02\x00\x00\x0c\x11\x00\x00a\x11\x00\x00\x07\x02\x00\x00\x0e\x11\x00\x00a\x11\x00\x00\x07\x02\x00\x00\x0f\x11\x00\x00a\x11\x00\x00\x07\x02\x00\x00\x10\x11\x00\x00a\x11\x00\x00\x07\x02\x00\x00\x11\x11\x00\x00'
+  b'a\x11\x00\x00\x07\x02\x00\x00\x12\x11\x00\x00a\x11\x00\x00\x07\x05\x00\x00\x0e\x11\x00\x00a\x11\x00\x00\xb7\x11\x00\x00\x00\x11\x00\x00i\x11\x00\x00\x07\x04\x00\x00\x0c\x11\x00\x00n\x11\x00\x00\x0b\x11\x00\x00t\x11\x00\x00\x07\x02\x00\x00'
+  b'\x0b\x11\x00\x00n\x11\x00\x00\x07\x01\x00\x00\x00N\x00\x00\x07\x01\x00\x00\x8cN\x00\x00\x07\x01\x00\x00\tN\x00\x00\x07\x01\x00\x00\xdbV\x00\x00\x07\x01\x00\x00\x94N\x00\x00\x07\x01\x00\x00mQ\x00\x00\x07\x01\x00\x00\x03N\x00\x00'
+  b'\x07\x01\x00\x00kQ\x00\x00\x07\x01\x00\x00]N\x00\x00\x07\x01\x00\x00AS\x00\x00\x07\x01\x00\x00\x08g\x00\x00\x07\x01\x00\x00kp\x00\x00\x07\x01\x00\x004l\x00\x00\x07\x01\x00\x00(g\x00\x00\x07\x01\x00\x00\xd1\x91\x00\x00'
+  b'\x07\x01\x00\x00\x1fW\x00\x00\x07\x01\x00\x00\xe5e\x00\x00\x07\x01\x00\x00*h\x00\x00\x07\x01\x00\x00\tg\x00\x00\x07\x01\x00\x00>y\x00\x00\x07\x01\x00\x00\rT\x00\x00\x07\x01\x00\x00yr\x00\x00\x07\x01\x00\x00\xa1\x8c\x00\x00'
+  b'\x07\x01\x00\x00]y\x00\x00\x07\x01\x00\x00\xb4R\x00\x00\x07\x01\x00\x00\xd8y\x00\x00\x07\x01\x00\x007u\x00\x00\x07\x01\x00\x00sY\x00\x00\x07\x01\x00\x00i\x90\x00\x00\x07\x01\x00\x00*Q\x00\x00\x07\x01\x00\x00pS\x00\x00'
+  b'\x07\x01\x00\x00\xe8l\x00\x00\x07\x01\x00\x00\x05\x98\x00\x00\x07\x01\x00\x00\x11O\x00\x00\x07\x01\x00\x00\x99Q\x00\x00\x07\x01\x00\x00ck\x00\x00\x07\x01\x00\x00\nN\x00\x00\x07\x01\x00\x00-N\x00\x00\x07\x01\x00\x00\x0bN\x00\x00'
+  b'\x07\x01\x00\x00\xe6]\x00\x00\x07\x01\x00\x00\xf3S\x00\x00\x07\x01\x00\x00;S\x00\x00\x07\x01\x00\x00\x97[\x00\x00\x07\x01\x00\x00f[\x00\x00\x07\x01\x00\x00\xe3v\x00\x00\x07\x01\x00\x00\x01O\x00\x00\x07\x01\x00\x00\xc7\x8c\x00\x00'
+  b'\x07\x01\x00\x00TS\x00\x00\x07\x01\x00\x00\x1cY\x00\x00\x07\x02\x00\x003\x00\x00\x006\x00\x00\x00\x07\x02\x00\x003\x00\x00\x007\x00\x00\x00\x07\x02\x00\x003\x00\x00\x008\x00\x00\x00\x07\x02\x00\x003\x00\x00\x009\x00\x00\x00'
+  b'\x07\x02\x00\x004\x00\x00\x000\x00\x00\x00\x07\x02\x00\x004\x00\x00\x001\x00\x00\x00\x07\x02\x00\x004\x00\x00\x002\x00\x00\x00\x07\x02\x00\x004\x00\x00\x003\x00\x00\x00\x07\x02\x00\x004\x00\x00\x004\x00\x00\x00\x07\x02\x00\x00'
+  b'4\x00\x00\x005\x00\x00\x00\x07\x02\x00\x004\x00\x00\x006\x00\x00\x00\x07\x02\x00\x004\x00\x00\x007\x00\x00\x00\x07\x02\x00\x004\x00\x00\x008\x00\x00\x00\x07\x02\x00\x004\x00\x00\x009\x00\x00\x00\x07\x02\x00\x005\x00\x00\x00'
+  b'0\x00\x00\x00\x02\x02\x00\x001\x00\x00\x00\x08g\x00\x00\x02\x02\x00\x002\x00\x00\x00\x08g\x00\x00\x02\x02\x00\x003\x00\x00\x00\x08g\x00\x00\x02\x02\x00\x004\x00\x00\x00\x08g\x00\x00\x02\x02\x00\x005\x00\x00\x00\x08g\x00\x00'
+  b'\x02\x02\x00\x006\x00\x00\x00\x08g\x00\x00\x02\x02\x00\x007\x00\x00\x00\x08g\x00\x00\x02\x02\x00\x008\x00\x00\x00\x08g\x00\x00\x02\x02\x00\x009\x00\x00\x00\x08g\x00\x00\x02\x03\x00\x001\x00\x00\x000\x00\x00\x00\x08g\x00\x00'
+  b'\x02\x03\x00\x001\x00\x00\x001\x00\x00\x00\x08g\x00\x00\x02\x03\x00\x001\x00\x00\x002\x00\x00\x00\x08g\x00\x00\n\x02\x00\x00H\x00\x00\x00g\x00\x00\x00\n\x03\x00\x00e\x00\x00\x00r\x00\x00\x00g\x00\x00\x00\n\x02\x00\x00'
+  b'e\x00\x00\x00V\x00\x00\x00\n\x03\x00\x00L\x00\x00\x00T\x00\x00\x00D\x00\x00\x00\x07\x01\x00\x00\xa20\x00\x00\x07\x01\x00\x00\xa40\x00\x00\x07\x01\x00\x00\xa60\x00\x00\x07\x01\x00\x00\xa80\x00\x00\x07\x01\x00\x00\xaa0\x00\x00'
+  b'\x07\x01\x00\x00\xab0\x00\x00\x07\x01\x00\x00\xad0\x00\x00\x07\x01\x00\x00\xaf0\x00\x00\x07\x01\x00\x00\xb10\x00\x00\x07\x01\x00\x00\xb30\x00\x00\x07\x01\x00\x00\xb50\x00\x00\x07\x01\x00\x00\xb70\x00\x00\x07\x01\x00\x00\xb90\x00\x00'
+  b'\x07\x01\x00\x00\xbb0\x00\x00\x07\x01\x00\x00\xbd0\x00\x00\x07\x01\x00\x00\xbf0\x00\x00\x07\x01\x00\x00\xc10\x00\x00\x07\x01\x00\x00\xc40\x00\x00\x07\x01\x00\x00\xc60\x00\x00\x07\x01\x00\x00\xc80\x00\x00\x07\x01\x00\x00\xca0\x00\x00'
+  b'\x07\x01\x00\x00\xcb0\x00\x00\x07\x01\x00\x00\xcc0\x00\x00\x07\x01\x00\x00\xcd0\x00\x00\x07\x01\x00\x00\xce0\x00\x00\x07\x01\x00\x00\xcf0\x00\x00\x07\x01\x00\x00\xd20\x00\x00\x07\x01\x00\x00\xd50\x00\x00\x07\x01\x00\x00\xd80\x00\x00'
+  b'\x07\x01\x00\x00\xdb0\x00\x00\x07\x01\x00\x00\xde0\x00\x00\x07\x01\x00\x00\xdf0\x00\x00\x07\x01\x00\x00\xe00\x00\x00\x07\x01\x00\x00\xe10\x00\x00\x07\x01\x00\x00\xe20\x00\x00\x07\x01\x00\x00\xe40\x00\x00\x07\x01\x00\x00\xe60\x00\x00'
+  b'\x07\x01\x00\x00\xe80\x00\x00\x07\x01\x00\x00\xe90\x00\x00\x07\x01\x00\x00\xea0\x00\x00\x07\x01\x00\x00\xeb0\x00\x00\x07\x01\x00\x00\xec0\x00\x00\x07\x01\x00\x00\xed0\x00\x00\x07\x01\x00\x00\xef0\x00\x00\x07\x01\x00\x00\xf00\x00\x00'
+  b'\x07\x01\x00\x00\xf10\x00\x00\x07\x01\x00\x00\xf20\x00\x00\n\x02\x00\x00\xe4N\x00\x00\x8cT\x00\x00\n\x04\x00\x00\xa20\x00\x00\xd10\x00\x00\xfc0\x00\x00\xc80\x00\x00\n\x04\x00\x00\xa20\x00\x00\xeb0\x00\x00\xd50\x00\x00'
+  b'\xa10\x00\x00\n\x04\x00\x00\xa20\x00\x00\xf30\x00\x00\xda0\x00\x00\xa20\x00\x00\n\x03\x00\x00\xa20\x00\x00\xfc0\x00\x00\xeb0\x00\x00\n\x04\x00\x00\xa40\x00\x00\xcb0\x00\x00\xf30\x00\x00\xb00\x00\x00\n\x03\x00\x00'
+  b'\xa40\x00\x00\xf30\x00\x00\xc10\x00\x00\n\x03\x00\x00\xa60\x00\x00\xa90\x00\x00\xf30\x00\x00\n\x05\x00\x00\xa80\x00\x00\xb90\x00\x00\xaf0\x00\x00\xfc0\x00\x00\xc90\x00\x00\n\x04\x00\x00\xa80\x00\x00\xfc0\x00\x00'
+  b'\xab0\x00\x00\xfc0\x00\x00\n\x03\x00\x00\xaa0\x00\x00\xf30\x00\x00\xb90\x00\x00\n\x03\x00\x00\xaa0\x00\x00\xfc0\x00\x00\xe00\x00\x00\n\x03\x00\x00\xab0\x00\x00\xa40\x00\x00\xea0\x00\x00\n\x04\x00\x00\xab0\x00\x00'
+  b'\xe90\x00\x00\xc30\x00\x00\xc80\x00\x00\n\x04\x00\x00\xab0\x00\x00\xed0\x00\x00\xea0\x00\x00\xfc0\x00\x00\n\x03\x00\x00\xac0\x00\x00\xed0\x00\x00\xf30\x00\x00\n\x03\x00\x00\xac0\x00\x00\xf30\x00\x00\xde0\x00\x00'
+  b'\n\x02\x00\x00\xae0\x00\x00\xac0\x00\x00\n\x03\x00\x00\xae0\x00\x00\xcb0\x00\x00\xfc0\x00\x00\n\x04\x00\x00\xad0\x00\x00\xe50\x00\x00\xea0\x00\x00\xfc0\x00\x00\n\x04\x00\x00\xae0\x00\x00\xeb0\x00\x00\xc00\x00\x00'
+  b'\xfc0\x00\x00\n\x02\x00\x00\xad0\x00\x00\xed0\x00\x00\n\x05\x00\x00\xad0\x00\x00\xed0\x00\x00\xb00\x00\x00\xe90\x00\x00\xe00\x00\x00\n\x06\x00\x00\xad0\x00\x00\xed0\x00\x00\xe10\x00\x00\xfc0\x00\x00\xc80\x00\x00'
+  b'\xeb0\x00\x00\n\x05\x00\x00\xad0\x00\x00\xed0\x00\x00\xef0\x00\x00\xc30\x00\x00\xc80\x00\x00\n\x03\x00\x00\xb00\x00\x00\xe90\x00\x00\xe00\x00\x00\n\x05\x00\x00\xb00\x00\x00\xe90\x00\x00\xe00\x00\x00\xc80\x00\x00'
+  b'\xf30\x00\x00\n\x05\x00\x00\xaf0\x00\x00\xeb0\x00\x00\xbc0\x00\x00\xa40\x00\x00\xed0\x00\x00\n\x04\x00\x00\xaf0\x00\x00\xed0\x00\x00\xfc0\x00\x00\xcd0\x00\x00\n\x03\x00\x00\xb10\x00\x00\xfc0\x00\x00\xb90\x00\x00'
+  b'\n\x03\x00\x00\xb30\x00\x00\xeb0\x00\x00\xca0\x00\x00\n\x03\x00\x00\xb30\x00\x00\xfc0\x00\x00\xdd0\x00\x00\n\x04\x00\x00\xb50\x00\x00\xa40\x00\x00\xaf0\x00\x00\xeb0\x00\x00\n\x05\x00\x00\xb50\x00\x00\xf30\x00\x00'
+  b'\xc10\x00\x00\xfc0\x00\x00\xe00\x00\x00\n\x04\x00\x00\xb70\x00\x00\xea0\x00\x00\xf30\x00\x00\xb00\x00\x00\n\x03\x00\x00\xbb0\x00\x00\xf30\x00\x00\xc10\x00\x00\n\x03\x00\x00\xbb0\x00\x00\xf30\x00\x00\xc80\x00\x00'
+  b'\n\x03\x00\x00\xc00\x00\x00\xfc0\x00\x00\xb90\x00\x00\n\x02\x00\x00\xc70\x00\x00\xb70\x00\x00\n\x02\x00\x00\xc90\x00\x00\xeb0\x00\x00\n\x02\x00\x00\xc80\x00\x00\xf30\x00\x00\n\x02\x00\x00\xca0\x00\x00\xce0\x00\x00'
+  b'\n\x03\x00\x00\xce0\x00\x00\xc30\x00\x00\xc80\x00\x00\n\x03\x00\x00\xcf0\x00\x00\xa40\x00\x00\xc40\x00\x00\n\x05\x00\x00\xd10\x00\x00\xfc0\x00\x00\xbb0\x00\x00\xf30\x00\x00\xc80\x00\x00\n\x03\x00\x00\xd10\x00\x00'
+  b'\xfc0\x00\x00\xc40\x00\x00\n\x04\x00\x00\xd00\x00\x00\xfc0\x00\x00\xec0\x00\x00\xeb0\x00\x00\n\x05\x00\x00\xd40\x00\x00\xa20\x00\x00\xb90\x00\x00\xc80\x00\x00\xeb0\x00\x00\n\x03\x00\x00\xd40\x00\x00\xaf0\x00\x00'
+  b'\xeb0\x00\x00\n\x02\x00\x00\xd40\x00\x00\xb30\x00\x00\n\x02\x00\x00\xd30\x00\x00\xeb0\x00\x00\n\x05\x00\x00\xd50\x00\x00\xa10\x00\x00\xe90\x00\x00\xc30\x00\x00\xc90\x00\x00\n\x04\x00\x00\xd50\x00\x00\xa30\x00\x00'
+  b'\xfc0\x00\x00\xc80\x00\x00\n\x05\x00\x00\xd60\x00\x00\xc30\x00\x00\xb70\x00\x00\xa70\x00\x00\xeb0\x00\x00\n\x03\x00\x00\xd50\x00\x00\xe90\x00\x00\xf30\x00\x00\n\x05\x00\x00\xd80\x00\x00\xaf0\x00\x00\xbf0\x00\x00'
+  b'\xfc0\x00\x00\xeb0\x00\x00\n\x02\x00\x00\xda0\x00\x00\xbd0\x00\x00\n\x03\x00\x00\xda0\x00\x00\xcb0\x00\x00\xd20\x00\x00\n\x03\x00\x00\xd80\x00\x00\xeb0\x00\x00\xc40\x00\x00\n\x03\x00\x00\xda0\x00\x00\xf30\x00\x00'
+  b'\xb90\x00\x00\n\x03\x00\x00\xda0\x00\x00\xfc0\x00\x00\xb80\x00\x00\n\x03\x00\x00\xd90\x00\x00\xfc0\x00\x00\xbf0\x00\x00\n\x04\x00\x00\xdd0\x00\x00\xa40\x00\x00\xf30\x00\x00\xc80\x00\x00\n\x03\x00\x00\xdc0\x00\x00'
+  b'\xeb0\x00\x00\xc80\x00\x00\n\x02\x00\x00\xdb0\x00\x00\xf30\x00\x00\n\x03\x00\x00\xdd0\x00\x00\xf30\x00\x00\xc90\x00\x00\n\x03\x00\x00\xdb0\x00\x00\xfc0\x00\x00\xeb0\x00\x00\n\x03\x00\x00\xdb0\x00\x00\xfc0\x00\x00'
+  b'\xf30\x00\x00\n\x04\x00\x00\xde0\x00\x00\xa40\x00\x00\xaf0\x00\x00\xed0\x00\x00\n\x03\x00\x00\xde0\x00\x00\xa40\x00\x00\xeb0\x00\x00\n\x03\x00\x00\xde0\x00\x00\xc30\x00\x00\xcf0\x00\x00\n\x03\x00\x00\xde0\x00\x00'
+  b'\xeb0\x00\x00\xaf0\x00\x00\n\x05\x00\x00\xde0\x00\x00\xf30\x00\x00\xb70\x00\x00\xe70\x00\x00\xf30\x00\x00\n\x04\x00\x00\xdf0\x00\x00\xaf0\x00\x00\xed0\x00\x00\xf30\x00\x00\n\x02\x00\x00\xdf0\x00\x00\xea0\x00\x00'
+  b'\n\x05\x00\x00\xdf0\x00\x00\xea0\x00\x00\xd00\x00\x00\xfc0\x00\x00\xeb0\x00\x00\n\x02\x00\x00\xe10\x00\x00\xac0\x00\x00\n\x04\x00\x00\xe10\x00\x00\xac0\x00\x00\xc80\x00\x00\xf30\x00\x00\n\x04\x00\x00\xe10\x00\x00'
+  b'\xfc0\x00\x00\xc80\x00\x00\xeb0\x00\x00\n\x03\x00\x00\xe40\x00\x00\xfc0\x00\x00\xc90\x00\x00\n\x03\x00\x00\xe40\x00\x00\xfc0\x00\x00\xeb0\x00\x00\n\x03\x00\x00\xe60\x00\x00\xa20\x00\x00\xf30\x00\x00\n\x04\x00\x00'
+  b'\xea0\x00\x00\xc30\x00\x00\xc80\x00\x00\xeb0\x00\x00\n\x02\x00\x00\xea0\x00\x00\xe90\x00\x00\n\x03\x00\x00\xeb0\x00\x00\xd40\x00\x00\xfc0\x00\x00\n\x04\x00\x00\xeb0\x00\x00\xfc0\x00\x00\xd60\x00\x00\xeb0\x00\x00'
+  b'\n\x02\x00\x00\xec0\x00\x00\xe00\x00\x00\n\x05\x00\x00\xec0\x00\x00\xf30\x00\x00\xc80\x00\x00\xb20\x00\x00\xf30\x00\x00\n\x03\x00\x00\xef0\x00\x00\xc30\x00\x00\xc80\x00\x00\x02\x02\x00\x000\x00\x00\x00\xb9p\x00\x00'
+  b'\x02\x02\x00\x001\x00\x00\x00\xb9p\x00\x00\x02\x02\x00\x002\x00\x00\x00\xb9p\x00\x00\x02\x02\x00\x003\x00\x00\x00\xb9p\x00\x00\x02\x02\x00\x004\x00\x00\x00\xb9p\x00\x00\x02\x02\x00\x005\x00\x00\x00\xb9p\x00\x00\x02\x02\x00\x00'
+  b'6\x00\x00\x00\xb9p\x00\x00\x02\x02\x00\x007\x00\x00\x00\xb9p\x00\x00\x02\x02\x00\x008\x00\x00\x00\xb9p\x00\x00\x02\x02\x00\x009\x00\x00\x00\xb9p\x00\x00\x02\x03\x00\x001\x00\x00\x000\x00\x00\x00\xb9p\x00\x00\x02\x03\x00\x00'
+  b'1\x00\x00\x001\x00\x00\x00\xb9p\x00\x00\x02\x03\x00\x001\x00\x00\x002\x00\x00\x00\xb9p\x00\x00\x02\x03\x00\x001\x00\x00\x003\x00\x00\x00\xb9p\x00\x00\x02\x03\x00\x001\x00\x00\x004\x00\x00\x00\xb9p\x00\x00\x02\x03\x00\x00'
+  b'1\x00\x00\x005\x00\x00\x00\xb9p\x00\x00\x02\x03\x00\x001\x00\x00\x006\x00\x00\x00\xb9p\x00\x00\x02\x03\x00\x001\x00\x00\x007\x00\x00\x00\xb9p\x00\x00\x02\x03\x00\x001\x00\x00\x008\x00\x00\x00\xb9p\x00\x00\x02\x03\x00\x00'
+  b'1\x00\x00\x009\x00\x00\x00\xb9p\x00\x00\x02\x03\x00\x002\x00\x00\x000\x00\x00\x00\xb9p\x00\x00\x02\x03\x00\x002\x00\x00\x001\x00\x00\x00\xb9p\x00\x00\x02\x03\x00\x002\x00\x00\x002\x00\x00\x00\xb9p\x00\x00\x02\x03\x00\x00'
+  b'2\x00\x00\x003\x00\x00\x00\xb9p\x00\x00\x02\x03\x00\x002\x00\x00\x004\x00\x00\x00\xb9p\x00\x00\n\x03\x00\x00h\x00\x00\x00P\x00\x00\x00a\x00\x00\x00\n\x02\x00\x00d\x00\x00\x00a\x00\x00\x00\n\x02\x00\x00A\x00\x00\x00'
+  b'U\x00\x00\x00\n\x03\x00\x00b\x00\x00\x00a\x00\x00\x00r\x00\x00\x00\n\x02\x00\x00o\x00\x00\x00V\x00\x00\x00\n\x02\x00\x00p\x00\x00\x00c\x00\x00\x00\n\x02\x00\x00d\x00\x00\x00m\x00\x00\x00\n\x03\x00\x00d\x00\x00\x00'
+  b'm\x00\x00\x00\xb2\x00\x00\x00\n\x03\x00\x00d\x00\x00\x00m\x00\x00\x00\xb3\x00\x00\x00\n\x02\x00\x00I\x00\x00\x00U\x00\x00\x00\n\x02\x00\x00s^\x00\x00\x10b\x00\x00\n\x02\x00\x00-f\x00\x00\x8cT\x00\x00\n\x02\x00\x00'
+  b"'Y\x00\x00ck\x00\x00\n\x02\x00\x00\x0ef\x00\x00\xbbl\x00\x00\n\x04\x00\x00*h\x00\x00\x0f_\x00\x00\x1aO\x00\x00>y\x00\x00\n\x02\x00\x00p\x00\x00\x00A\x00\x00\x00\n\x02\x00\x00n\x00\x00\x00A\x00\x00\x00"
+  b'\n\x02\x00\x00\xbc\x03\x00\x00A\x00\x00\x00\n\x02\x00\x00m\x00\x00\x00A\x00\x00\x00\n\x02\x00\x00k\x00\x00\x00A\x00\x00\x00\n\x02\x00\x00K\x00\x00\x00B\x00\x00\x00\n\x02\x00\x00M\x00\x00\x00B\x00\x00\x00\n\x02\x00\x00'
+  b'G\x00\x00\x00B\x00\x00\x00\n\x03\x00\x00c\x00\x00\x00a\x00\x00\x00l\x00\x00\x00\n\x04\x00\x00k\x00\x00\x00c\x00\x00\x00a\x00\x00\x00l\x00\x00\x00\n\x02\x00\x00p\x00\x00\x00F\x00\x00\x00\n\x02\x00\x00n\x00\x00\x00'
+  b'F\x00\x00\x00\n\x02\x00\x00\xbc\x03\x00\x00F\x00\x00\x00\n\x02\x00\x00\xbc\x03\x00\x00g\x00\x00\x00\n\x02\x00\x00m\x00\x00\x00g\x00\x00\x00\n\x02\x00\x00k\x00\x00\x00g\x00\x00\x00\n\x02\x00\x00H\x00\x00\x00z\x00\x00\x00'
+  b'\n\x03\x00\x00k\x00\x00\x00H\x00\x00\x00z\x00\x00\x00\n\x03\x00\x00M\x00\x00\x00H\x00\x00\x00z\x00\x00\x00\n\x03\x00\x00G\x00\x00\x00H\x00\x00\x00z\x00\x00\x00\n\x03\x00\x00T\x00\x00\x00H\x00\x00\x00z\x00\x00\x00'
+  b'\n\x02\x00\x00\xbc\x03\x00\x00\x13!\x00\x00\n\x02\x00\x00m\x00\x00\x00\x13!\x00\x00\n\x02\x00\x00d\x00\x00\x00\x13!\x00\x00\n\x02\x00\x00k\x00\x00\x00\x13!\x00\x00\n\x02\x00\x00f\x00\x00\x00m\x00\x00\x00\n\x02\x00\x00'
+  b'n\x00\x00\x00m\x00\x00\x00\n\x02\x00\x00\xbc\x03\x00\x00m\x00\x00\x00\n\x02\x00\x00m\x00\x00\x00m\x00\x00\x00\n\x02\x00\x00c\x00\x00\x00m\x00\x00\x00\n\x02\x00\x00k\x00\x00\x00m\x00\x00\x00\n\x03\x00\x00m\x00\x00\x00'
+  b'm\x00\x00\x00\xb2\x00\x00\x00\n\x03\x00\x00c\x00\x00\x00m\x00\x00\x00\xb2\x00\x00\x00\n\x02\x00\x00m\x00\x00\x00\xb2\x00\x00\x00\n\x03\x00\x00k\x00\x00\x00m\x00\x00\x00\xb2\x00\x00\x00\n\x03\x00\x00m\x00\x00\x00m\x00\x00\x00'
+  b'\xb3\x00\x00\x00\n\x03\x00\x00c\x00\x00\x00m\x00\x00\x00\xb3\x00\x00\x00\n\x02\x00\x00m\x00\x00\x00\xb3\x00\x00\x00\n\x03\x00\x00k\x00\x00\x00m\x00\x00\x00\xb3\x00\x00\x00\n\x03\x00\x00m\x00\x00\x00\x15"\x00\x00s\x00\x00\x00'
+  b'\n\x04\x00\x00m\x00\x00\x00\x15"\x00\x00s\x00\x00\x00\xb2\x00\x00\x00\n\x02\x00\x00P\x00\x00\x00a\x00\x00\x00\n\x03\x00\x00k\x00\x00\x00P\x00\x00\x00a\x00\x00\x00\n\x03\x00\x00M\x00\x00\x00P\x00\x00\x00a\x00\x00\x00'
+  b'\n\x03\x00\x00G\x00\x00\x00P\x00\x00\x00a\x00\x00\x00\n\x03\x00\x00r\x00\x00\x00a\x00\x00\x00d\x00\x00\x00\n\x05\x00\x00r\x00\x00\x00a\x00\x00\x00d\x00\x00\x00\x15"\x00\x00s\x00\x00\x00\n\x06\x00\x00r\x00\x00\x00'
+  b'a\x00\x00\x00d\x00\x00\x00\x15"\x00\x00s\x00\x00\x00\xb2\x00\x00\x00\n\x02\x00\x00p\x00\x00\x00s\x00\x00\x00\n\x02\x00\x00n\x00\x00\x00s\x00\x00\x00\n\x02\x00\x00\xbc\x03\x00\x00s\x00\x00\x00\n\x02\x00\x00m\x00\x00\x00'
+  b's\x00\x00\x00\n\x02\x00\x00p\x00\x00\x00V\x00\x00\x00\n\x02\x00\x00n\x00\x00\x00V\x00\x00\x00\n\x02\x00\x00\xbc\x03\x00\x00V\x00\x00\x00\n\x02\x00\x00m\x00\x00\x00V\x00\x00\x00\n\x02\x00\x00k\x00\x00\x00V\x00\x00\x00'
+  b'\n\x02\x00\x00M\x00\x00\x00V\x00\x00\x00\n\x02\x00\x00p\x00\x00\x00W\x00\x00\x00\n\x02\x00\x00n\x00\x00\x00W\x00\x00\x00\n\x02\x00\x00\xbc\x03\x00\x00W\x00\x00\x00\n\x02\x00\x00m\x00\x00\x00W\x00\x00\x00\n\x02\x00\x00'
+  b'k\x00\x00\x00W\x00\x00\x00\n\x02\x00\x00M\x00\x00\x00W\x00\x00\x00\n\x02\x00\x00k\x00\x00\x00\xa9\x03\x00\x00\n\x02\x00\x00M\x00\x00\x00\xa9\x03\x00\x00\n\x04\x00\x00a\x00\x00\x00.\x00\x00\x00m\x00\x00\x00.\x00\x00\x00'
+  b'\n\x02\x00\x00B\x00\x00\x00q\x00\x00\x00\n\x02\x00\x00c\x00\x00\x00c\x00\x00\x00\n\x02\x00\x00c\x00\x00\x00d\x00\x00\x00\n\x04\x00\x00C\x00\x00\x00\x15"\x00\x00k\x00\x00\x00g\x00\x00\x00\n\x03\x00\x00C\x00\x00\x00'
+  b'o\x00\x00\x00.\x00\x00\x00\n\x02\x00\x00d\x00\x00\x00B\x00\x00\x00\n\x02\x00\x00G\x00\x00\x00y\x00\x00\x00\n\x02\x00\x00h\x00\x00\x00a\x00\x00\x00\n\x02\x00\x00H\x00\x00\x00P\x00\x00\x00\n\x02\x00\x00i\x00\x00\x00'
+  b'n\x00\x00\x00\n\x02\x00\x00K\x00\x00\x00K\x00\x00\x00\n\x02\x00\x00K\x00\x00\x00M\x00\x00\x00\n\x02\x00\x00k\x00\x00\x00t\x00\x00\x00\n\x02\x00\x00l\x00\x00\x00m\x00\x00\x00\n\x02\x00\x00l\x00\x00\x00n\x00\x00\x00'
+  b'\n\x03\x00\x00l\x00\x00\x00o\x00\x00\x00g\x00\x00\x00\n\x02\x00\x00l\x00\x00\x00x\x00\x00\x00\n\x02\x00\x00m\x00\x00\x00b\x00\x00\x00\n\x03\x00\x00m\x00\x00\x00i\x00\x00\x00l\x00\x00\x00\n\x03\x00\x00m\x00\x00\x00'
+  b'o\x00\x00\x00l\x00\x00\x00\n\x02\x00\x00P\x00\x00\x00H\x00\x00\x00\n\x04\x00\x00p\x00\x00\x00.\x00\x00\x00m\x00\x00\x00.\x00\x00\x00\n\x03\x00\x00P\x00\x00\x00P\x00\x00\x00M\x00\x00\x00\n\x02\x00\x00P\x00\x00\x00'
+  b'R\x00\x00\x00\n\x02\x00\x00s\x00\x00\x00r\x00\x00\x00\n\x02\x00\x00S\x00\x00\x00v\x00\x00\x00\n\x02\x00\x00W\x00\x00\x00b\x00\x00\x00\n\x03\x00\x00V\x00\x00\x00\x15"\x00\x00m\x00\x00\x00\n\x03\x00\x00A\x00\x00\x00'
+  b'\x15"\x00\x00m\x00\x00\x00\x02\x02\x00\x001\x00\x00\x00\xe5e\x00\x00\x02\x02\x00\x002\x00\x00\x00\xe5e\x00\x00\x02\x02\x00\x003\x00\x00\x00\xe5e\x00\x00\x02\x02\x00\x004\x00\x00\x00\xe5e\x00\x00\x02\x02\x00\x005\x00\x00\x00'
+  b'\xe5e\x00\x00\x02\x02\x00\x006\x00\x00\x00\xe5e\x00\x00\x02\x02\x00\x007\x00\x00\x00\xe5e\x00\x00\x02\x02\x00\x008\x00\x00\x00\xe5e\x00\x00\x02\x02\x00\x009\x00\x00\x00\xe5e\x00\x00\x02\x03\x00\x001\x00\x00\x000\x00\x00\x00'
+  b'\xe5e\x00\x00\x02\x03\x00\x001\x00\x00\x001\x00\x00\x00\xe5e\x00\x00\x02\x03\x00\x001\x00\x00\x002\x00\x00\x00\xe5e\x00\x00\x02\x03\x00\x001\x00\x00\x003\x00\x00\x00\xe5e\x00\x00\x02\x03\x00\x001\x00\x00\x004\x00\x00\x00'
+  b'\xe5e\x00\x00\x02\x03\x00\x001\x00\x00\x005\x00\x00\x00\xe5e\x00\x00\x02\x03\x00\x001\x00\x00\x006\x00\x00\x00\xe5e\x00\x00\x02\x03\x00\x001\x00\x00\x007\x00\x00\x00\xe5e\x00\x00\x02\x03\x00\x001\x00\x00\x008\x00\x00\x00'
+  b'\xe5e\x00\x00\x02\x03\x00\x001\x00\x00\x009\x00\x00\x00\xe5e\x00\x00\x02\x03\x00\x002\x00\x00\x000\x00\x00\x00\xe5e\x00\x00\x02\x03\x00\x002\x00\x00\x001\x00\x00\x00\xe5e\x00\x00\x02\x03\x00\x002\x00\x00\x002\x00\x00\x00'
+  b'\xe5e\x00\x00\x02\x03\x00\x002\x00\x00\x003\x00\x00\x00\xe5e\x00\x00\x02\x03\x00\x002\x00\x00\x004\x00\x00\x00\xe5e\x00\x00\x02\x03\x00\x002\x00\x00\x005\x00\x00\x00\xe5e\x00\x00\x02\x03\x00\x002\x00\x00\x006\x00\x00\x00'
+  b'\xe5e\x00\x00\x02\x03\x00\x002\x00\x00\x007\x00\x00\x00\xe5e\x00\x00\x02\x03\x00\x002\x00\x00\x008\x00\x00\x00\xe5e\x00\x00\x02\x03\x00\x002\x00\x00\x009\x00\x00\x00\xe5e\x00\x00\x02\x03\x00\x003\x00\x00\x000\x00\x00\x00'
+  b'\xe5e\x00\x00\x02\x03\x00\x003\x00\x00\x001\x00\x00\x00\xe5e\x00\x00\n\x03\x00\x00g\x00\x00\x00a\x00\x00\x00l\x00\x00\x00\x03\x01\x00\x00J\x04\x00\x00\x03\x01\x00\x00L\x04\x00\x00\x03\x01\x00\x00o\xa7\x00\x00\x03\x01\x00\x00'
+  b"&\x01\x00\x00\x03\x01\x00\x00S\x01\x00\x00\x03\x01\x00\x00'\xa7\x00\x00\x03\x01\x00\x007\xab\x00\x00\x03\x01\x00\x00k\x02\x00\x00\x03\x01\x00\x00R\xab\x00\x00\x03\x01\x00\x00\x8d\x02\x00\x00\x00\x01\x00\x00H\x8c\x00\x00\x00\x01\x00\x00"
+  b'\xf4f\x00\x00\x00\x01\x00\x00\xca\x8e\x00\x00\x00\x01\x00\x00\xc8\x8c\x00\x00\x00\x01\x00\x00\xd1n\x00\x00\x00\x01\x00\x002N\x00\x00\x00\x01\x00\x00\xe5S\x00\x00\x00\x01\x00\x00\x9c\x9f\x00\x00\x00\x01\x00\x00\x9c\x9f\x00\x00\x00\x01\x00\x00'
+  b'QY\x00\x00\x00\x01\x00\x00\xd1\x91\x00\x00\x00\x01\x00\x00\x87U\x00\x00\x00\x01\x00\x00HY\x00\x00\x00\x01\x00\x00\xf6a\x00\x00\x00\x01\x00\x00iv\x00\x00\x00\x01\x00\x00\x85\x7f\x00\x00\x00\x01\x00\x00?\x86\x00\x00\x00\x01\x00\x00'
+  b'\xba\x87\x00\x00\x00\x01\x00\x00\xf8\x88\x00\x00\x00\x01\x00\x00\x8f\x90\x00\x00\x00\x01\x00\x00\x02j\x00\x00\x00\x01\x00\x00\x1bm\x00\x00\x00\x01\x00\x00\xd9p\x00\x00\x00\x01\x00\x00\xdes\x00\x00\x00\x01\x00\x00=\x84\x00\x00\x00\x01\x00\x00'
+  b'j\x91\x00\x00\x00\x01\x00\x00\xf1\x99\x00\x00\x00\x01\x00\x00\x82N\x00\x00\x00\x01\x00\x00uS\x00\x00\x00\x01\x00\x00\x04k\x00\x00\x00\x01\x00\x00\x1br\x00\x00\x00\x01\x00\x00-\x86\x00\x00\x00\x01\x00\x00\x1e\x9e\x00\x00\x00\x01\x00\x00'
+  b'P]\x00\x00\x00\x01\x00\x00\xebo\x00\x00\x00\x01\x00\x00\xcd\x85\x00\x00\x00\x01\x00\x00d\x89\x00\x00\x00\x01\x00\x00\xc9b\x00\x00\x00\x01\x00\x00\xd8\x81\x00\x00\x00\x01\x00\x00\x1f\x88\x00\x00\x00\x01\x00\x00\xca^\x00\x00\x00\x01\x00\x00'
+  b'\x17g\x00\x00\x00\x01\x00\x00jm\x00\x00\x00\x01\x00\x00\xfcr\x00\x00\x00\x01\x00\x00\xce\x90\x00\x00\x00\x01\x00\x00\x86O\x00\x00\x00\x01\x00\x00\xb7Q\x00\x00\x00\x01\x00\x00\xdeR\x00\x00\x00\x01\x00\x00\xc4d\x00\x00\x00\x01\x00\x00'
+  b'\xd3j\x00\x00\x00\x01\x00\x00\x10r\x00\x00\x00\x01\x00\x00\xe7v\x00\x00\x00\x01\x00\x00\x01\x80\x00\x00\x00\x01\x00\x00\x06\x86\x00\x00\x00\x01\x00\x00\\\x86\x00\x00\x00\x01\x00\x00\xef\x8d\x00\x00\x00\x01\x00\x002\x97\x00\x00\x00\x01\x00\x00'
+  b'o\x9b\x00\x00\x00\x01\x00\x00\xfa\x9d\x00\x00\x00\x01\x00\x00\x8cx\x00\x00\x00\x01\x00\x00\x7fy\x00\x00\x00\x01\x00\x00\xa0}\x00\x00\x00\x01\x00\x00\xc9\x83\x00\x00\x00\x01\x00\x00\x04\x93\x00\x00\x00\x01\x00\x00\x7f\x9e\x00\x00\x00\x01\x00\x00'
+  b'\xd6\x8a\x00\x00\x00\x01\x00\x00\xdfX\x00\x00\x00\x01\x00\x00\x04_\x00\x00\x00\x01\x00\x00`|\x00\x00\x00\x01\x00\x00~\x80\x00\x00\x00\x01\x00\x00br\x00\x00\x00\x01\x00\x00\xcax\x00\x00\x00\x01\x00\x00\xc2\x8c\x00\x00\x00\x01\x00\x00'
+  b'\xf7\x96\x00\x00\x00\x01\x00\x00\xd8X\x00\x00\x00\x01\x00\x00b\\\x00\x00\x00\x01\x00\x00\x13j\x00\x00\x00\x01\x00\x00\xdam\x00\x00\x00\x01\x00\x00\x0fo\x00\x00\x00\x01\x00\x00/}\x00\x00\x00\x01\x00\x007~\x00\x00\x00\x01\x00\x00'
+  b'K\x96\x00\x00\x00\x01\x00\x00\xd2R\x00\x00\x00\x01\x00\x00\x8b\x80\x00\x00\x00\x01\x00\x00\xdcQ\x00\x00\x00\x01\x00\x00\xccQ\x00\x00\x00\x01\x00\x00\x1cz\x00\x00\x00\x01\x00\x00\xbe}\x00\x00\x00\x01\x00\x00\xf1\x83\x00\x00\x00\x01\x00\x00'
+  b'u\x96\x00\x00\x00\x01\x00\x00\x80\x8b\x00\x00\x00\x01\x00\x00\xcfb\x00\x00\x00\x01\x00\x00\x02j\x00\x00\x00\x01\x00\x00\xfe\x8a\x00\x00\x00\x01\x00\x009N\x00\x00\x00\x01\x00\x00\xe7[\x00\x00\x00\x01\x00\x00\x12`\x00\x00\x00\x01\x00\x00'
+  b'\x87s\x00\x00\x00\x01\x00\x00pu\x00\x00\x00\x01\x00\x00\x17S\x00\x00\x00\x01\x00\x00\xfbx\x00\x00\x00\x01\x00\x00\xbfO\x00\x00\x00\x01\x00\x00\xa9_\x00\x00\x00\x01\x00\x00\rN\x00\x00\x00\x01\x00\x00\xccl\x00\x00\x00\x01\x00\x00'
+  b'xe\x00\x00\x00\x01\x00\x00"}\x00\x00\x00\x01\x00\x00\xc3S\x00\x00\x00\x01\x00\x00^X\x00\x00\x00\x01\x00\x00\x01w\x00\x00\x00\x01\x00\x00I\x84\x00\x00\x00\x01\x00\x00\xaa\x8a\x00\x00\x00\x01\x00\x00\xbak\x00\x00\x00\x01\x00\x00'
+  b'\xb0\x8f\x00\x00\x00\x01\x00\x00\x88l\x00\x00\x00\x01\x00\x00\xfeb\x00\x00\x00\x01\x00\x00\xe5\x82\x00\x00\x00\x01\x00\x00\xa0c\x00\x00\x00\x01\x00\x00eu\x00\x00\x00\x01\x00\x00\xaeN\x00\x00\x00\x01\x00\x00iQ\x00\x00\x00\x01\x00\x00'
+  b'\xc9Q\x00\x00\x00\x01\x00\x00\x81h\x00\x00\x00\x01\x00\x00\xe7|\x00\x00\x00\x01\x00\x00o\x82\x00\x00\x00\x01\x00\x00\xd2\x8a\x00\x00\x00\x01\x00\x00\xcf\x91\x00\x00\x00\x01\x00\x00\xf5R\x00\x00\x00\x01\x00\x00BT\x00\x00\x00\x01\x00\x00'
+  b'sY\x00\x00\x00\x01\x00\x00\xec^\x00\x00\x00\x01\x00\x00\xc5e\x00\x00\x00\x01\x00\x00\xfeo\x00\x00\x00\x01\x00\x00*y\x00\x00\x00\x01\x00\x00\xad\x95\x00\x00\x00\x01\x00\x00j\x9a\x00\x00\x00\x01\x00\x00\x97\x9e\x00\x00\x00\x01\x00\x00'
+  b'\xce\x9e\x00\x00\x00\x01\x00\x00\x9bR\x00\x00\x00\x01\x00\x00\xc6f\x00\x00\x00\x01\x00\x00wk\x00\x00\x00\x01\x00\x00b\x8f\x00\x00\x00\x01\x00\x00t^\x00\x00\x00\x01\x00\x00\x90a\x00\x00\x00\x01\x00\x00\x00b\x00\x00\x00\x01\x00\x00'
+  b'\x9ad\x00\x00\x00\x01\x00\x00#o\x00\x00\x00\x01\x00\x00Iq\x00\x00\x00\x01\x00\x00\x89t\x00\x00\x00\x01\x00\x00\xcay\x00\x00\x00\x01\x00\x00\xf4}\x00\x00\x00\x01\x00\x00o\x80\x00\x00\x00\x01\x00\x00&\x8f\x00\x00\x00\x01\x00\x00'
+  b'\xee\x84\x00\x00\x00\x01\x00\x00#\x90\x00\x00\x00\x01\x00\x00J\x93\x00\x00\x00\x01\x00\x00\x17R\x00\x00\x00\x01\x00\x00\xa3R\x00\x00\x00\x01\x00\x00\xbdT\x00\x00\x00\x01\x00\x00\xc8p\x00\x00\x00\x01\x00\x00\xc2\x88\x00\x00\x00\x01\x00\x00'
+  b'\xaa\x8a\x00\x00\x00\x01\x00\x00\xc9^\x00\x00\x00\x01\x00\x00\xf5_\x00\x00\x00\x01\x00\x00{c\x00\x00\x00\x01\x00\x00\xaek\x00\x00\x00\x01\x00\x00>|\x00\x00\x00\x01\x00\x00us\x00\x00\x00\x01\x00\x00\xe4N\x00\x00\x00\x01\x00\x00'
+  b'\xf9V\x00\x00\x00\x01\x00\x00\xe7[\x00\x00\x00\x01\x00\x00\xba]\x00\x00\x00\x01\x00\x00\x1c`\x00\x00\x00\x01\x00\x00\xb2s\x00\x00\x00\x01\x00\x00it\x00\x00\x00\x01\x00\x00\x9a\x7f\x00\x00\x00\x01\x00\x00F\x80\x00\x00\x00\x01\x00\x00'
+  b'4\x92\x00\x00\x00\x01\x00\x00\xf6\x96\x00\x00\x00\x01\x00\x00H\x97\x00\x00\x00\x01\x00\x00\x18\x98\x00\x00\x00\x01\x00\x00\x8bO\x00\x00\x00\x01\x00\x00\xaey\x00\x00\x00\x01\x00\x00\xb4\x91\x00\x00\x00\x01\x00\x00\xb8\x96\x00\x00\x00\x01\x00\x00'
+  b'\xe1`\x00\x00\x00\x01\x00\x00\x86N\x00\x00\x00\x01\x00\x00\xdaP\x00\x00\x00\x01\x00\x00\xee[\x00\x00\x00\x01\x00\x00?\\\x00\x00\x00\x01\x00\x00\x99e\x00\x00\x00\x01\x00\x00\x02j\x00\x00\x00\x01\x00\x00\xceq\x00\x00\x00\x01\x00\x00'
+  b'Bv\x00\x00\x00\x01\x00\x00\xfc\x84\x00\x00\x00\x01\x00\x00|\x90\x00\x00\x00\x01\x00\x00\x8d\x9f\x00\x00\x00\x01\x00\x00\x88f\x00\x00\x00\x01\x00\x00.\x96\x00\x00\x00\x01\x00\x00\x89R\x00\x00\x00\x01\x00\x00{g\x00\x00\x00\x01\x00\x00'
+  b'\xf3g\x00\x00\x00\x01\x00\x00Am\x00\x00\x00\x01\x00\x00\x9cn\x00\x00\x00\x01\x00\x00\tt\x00\x00\x00\x01\x00\x00Yu\x00\x00\x00\x01\x00\x00kx\x00\x00\x00\x01\x00\x00\x10}\x00\x00\x00\x01\x00\x00^\x98\x00\x00\x00\x01\x00\x00'
+  b'mQ\x00\x00\x00\x01\x00\x00.b\x00\x00\x00\x01\x00\x00x\x96\x00\x00\x00\x01\x00\x00+P\x00\x00\x00\x01\x00\x00\x19]\x00\x00\x00\x01\x00\x00\xeam\x00\x00\x00\x01\x00\x00*\x8f\x00\x00\x00\x01\x00\x00\x8b_\x00\x00\x00\x01\x00\x00'
+  b'Da\x00\x00\x00\x01\x00\x00\x17h\x00\x00\x00\x01\x00\x00\x87s\x00\x00\x00\x01\x00\x00\x86\x96\x00\x00\x00\x01\x00\x00)R\x00\x00\x00\x01\x00\x00\x0fT\x00\x00\x00\x01\x00\x00e\\\x00\x00\x00\x01\x00\x00\x13f\x00\x00\x00\x01\x00\x00'
+  b'Ng\x00\x00\x00\x01\x00\x00\xa8h\x00\x00\x00\x01\x00\x00\xe5l\x00\x00\x00\x01\x00\x00\x06t\x00\x00\x00\x01\x00\x00\xe2u\x00\x00\x00\x01\x00\x00y\x7f\x00\x00\x00\x01\x00\x00\xcf\x88\x00\x00\x00\x01\x00\x00\xe1\x88\x00\x00\x00\x01\x00\x00'
+  b'\xcc\x91\x00\x00\x00\x01\x00\x00\xe2\x96\x00\x00\x00\x01\x00\x00?S\x00\x00\x00\x01\x00\x00\xban\x00\x00\x00\x01\x00\x00\x1dT\x00\x00\x00\x01\x00\x00\xd0q\x00\x00\x00\x01\x00\x00\x98t\x00\x00\x00\x01\x00\x00\xfa\x85\x00\x00\x00\x01\x00\x00'
+  b'\xa3\x96\x00\x00\x00\x01\x00\x00W\x9c\x00\x00\x00\x01\x00\x00\x9f\x9e\x00\x00\x00\x01\x00\x00\x97g\x00\x00\x00\x01\x00\x00\xcbm\x00\x00\x00\x01\x00\x00\xe8\x81\x00\x00\x00\x01\x00\x00\xcbz\x00\x00\x00\x01\x00\x00 {\x00\x00\x00\x01\x00\x00'
+  b'\x92|\x00\x00\x00\x01\x00\x00\xc0r\x00\x00\x00\x01\x00\x00\x99p\x00\x00\x00\x01\x00\x00X\x8b\x00\x00\x00\x01\x00\x00\xc0N\x00\x00\x00\x01\x00\x006\x83\x00\x00\x00\x01\x00\x00:R\x00\x00\x00\x01\x00\x00\x07R\x00\x00\x00\x01\x00\x00'
+  b'\xa6^\x00\x00\x00\x01\x00\x00\xd3b\x00\x00\x00\x01\x00\x00\xd6|\x00\x00\x00\x01\x00\x00\x85[\x00\x00\x00\x01\x00\x00\x1em\x00\x00\x00\x01\x00\x00\xb4f\x00\x00\x00\x01\x00\x00;\x8f\x00\x00\x00\x01\x00\x00L\x88\x00\x00\x00\x01\x00\x00'
+  b'M\x96\x00\x00\x00\x01\x00\x00\x8b\x89\x00\x00\x00\x01\x00\x00\xd3^\x00\x00\x00\x01\x00\x00@Q\x00\x00\x00\x01\x00\x00\xc0U\x00\x00\x00\x01\x00\x00ZX\x00\x00\x00\x01\x00\x00tf\x00\x00\x00\x01\x00\x00\xdeQ\x00\x00\x00\x01\x00\x00'
+  b'*s\x00\x00\x00\x01\x00\x00\xcav\x00\x00\x00\x01\x00\x00<y\x00\x00\x00\x01\x00\x00^y\x00\x00\x00\x01\x00\x00ey\x00\x00\x00\x01\x00\x00\x8fy\x00\x00\x00\x01\x00\x00V\x97\x00\x00\x00\x01\x00\x00\xbe|\x00\x00\x00\x01\x00\x00'
+  b'\xbd\x7f\x00\x00\x00\x01\x00\x00\x12\x86\x00\x00\x00\x01\x00\x00\xf8\x8a\x00\x00\x00\x01\x00\x008\x90\x00\x00\x00\x01\x00\x00\xfd\x90\x00\x00\x00\x01\x00\x00\xef\x98\x00\x00\x00\x01\x00\x00\xfc\x98\x00\x00\x00\x01\x00\x00(\x99\x00\x00\x00\x01\x00\x00'
+  b'\xb4\x9d\x00\x00\x00\x01\x00\x00\xde\x90\x00\x00\x00\x01\x00\x00\xb7\x96\x00\x00\x00\x01\x00\x00\xaeO\x00\x00\x00\x01\x00\x00\xe7P\x00\x00\x00\x01\x00\x00MQ\x00\x00\x00\x01\x00\x00\xc9R\x00\x00\x00\x01\x00\x00\xe4R\x00\x00\x00\x01\x00\x00'
+  b'QS\x00\x00\x00\x01\x00\x00\x9dU\x00\x00\x00\x01\x00\x00\x06V\x00\x00\x00\x01\x00\x00hV\x00\x00\x00\x01\x00\x00@X\x00\x00\x00\x01\x00\x00\xa8X\x00\x00\x00\x01\x00\x00d\\\x00\x00\x00\x01\x00\x00n\\\x00\x00\x00\x01\x00\x00'
+  b'\x94`\x00\x00\x00\x01\x00\x00ha\x00\x00\x00\x01\x00\x00\x8ea\x00\x00\x00\x01\x00\x00\xf2a\x00\x00\x00\x01\x00\x00Oe\x00\x00\x00\x01\x00\x00\xe2e\x00\x00\x00\x01\x00\x00\x91f\x00\x00\x00\x01\x00\x00\x85h\x00\x00\x00\x01\x00\x00'
+  b'wm\x00\x00\x00\x01\x00\x00\x1an\x00\x00\x00\x01\x00\x00"o\x00\x00\x00\x01\x00\x00nq\x00\x00\x00\x01\x00\x00+r\x00\x00\x00\x01\x00\x00"t\x00\x00\x00\x01\x00\x00\x91x\x00\x00\x00\x01\x00\x00>y\x00\x00\x00\x01\x00\x00'
+  b'Iy\x00\x00\x00\x01\x00\x00Hy\x00\x00\x00\x01\x00\x00Py\x00\x00\x00\x01\x00\x00Vy\x00\x00\x00\x01\x00\x00]y\x00\x00\x00\x01\x00\x00\x8dy\x00\x00\x00\x01\x00\x00\x8ey\x00\x00\x00\x01\x00\x00@z\x00\x00\x00\x01\x00\x00'
+  b'\x81z\x00\x00\x00\x01\x00\x00\xc0{\x00\x00\x00\x01\x00\x00\xf4}\x00\x00\x00\x01\x00\x00\t~\x00\x00\x00\x01\x00\x00A~\x00\x00\x00\x01\x00\x00r\x7f\x00\x00\x00\x01\x00\x00\x05\x80\x00\x00\x00\x01\x00\x00\xed\x81\x00\x00\x00\x01\x00\x00'
+  b'y\x82\x00\x00\x00\x01\x00\x00y\x82\x00\x00\x00\x01\x00\x00W\x84\x00\x00\x00\x01\x00\x00\x10\x89\x00\x00\x00\x01\x00\x00\x96\x89\x00\x00\x00\x01\x00\x00\x01\x8b\x00\x00\x00\x01\x00\x009\x8b\x00\x00\x00\x01\x00\x00\xd3\x8c\x00\x00\x00\x01\x00\x00'
+  b'\x08\x8d\x00\x00\x00\x01\x00\x00\xb6\x8f\x00\x00\x00\x01\x00\x008\x90\x00\x00\x00\x01\x00\x00\xe3\x96\x00\x00\x00\x01\x00\x00\xff\x97\x00\x00\x00\x01\x00\x00;\x98\x00\x00\x00\x01\x00\x00u`\x00\x00\x00\x01\x00\x00\xeeB\x02\x00\x00\x01\x00\x00'
+  b'\x18\x82\x00\x00\x00\x01\x00\x00&N\x00\x00\x00\x01\x00\x00\xb5Q\x00\x00\x00\x01\x00\x00hQ\x00\x00\x00\x01\x00\x00\x80O\x00\x00\x00\x01\x00\x00EQ\x00\x00\x00\x01\x00\x00\x80Q\x00\x00\x00\x01\x00\x00\xc7R\x00\x00\x00\x01\x00\x00'
+  b'\xfaR\x00\x00\x00\x01\x00\x00\x9dU\x00\x00\x00\x01\x00\x00UU\x00\x00\x00\x01\x00\x00\x99U\x00\x00\x00\x01\x00\x00\xe2U\x00\x00\x00\x01\x00\x00ZX\x00\x00\x00\x01\x00\x00\xb3X\x00\x00\x00\x01\x00\x00DY\x00\x00\x00\x01\x00\x00'
+  b'TY\x00\x00\x00\x01\x00\x00bZ\x00\x00\x00\x01\x00\x00([\x00\x00\x00\x01\x00\x00\xd2^\x00\x00\x00\x01\x00\x00\xd9^\x00\x00\x00\x01\x00\x00i_\x00\x00\x00\x01\x00\x00\xad_\x00\x00\x00\x01\x00\x00\xd8`\x00\x00\x00\x01\x00\x00'
+  b'Na\x00\x00\x00\x01\x00\x00\x08a\x00\x00\x00\x01\x00\x00\x8ea\x00\x00\x00\x01\x00\x00`a\x00\x00\x00\x01\x00\x00\xf2a\x00\x00\x00\x01\x00\x004b\x00\x00\x00\x01\x00\x00\xc4c\x00\x00\x00\x01\x00\x00\x1cd\x00\x00\x00\x01\x00\x00'
+  b'Rd\x00\x00\x00\x01\x00\x00Ve\x00\x00\x00\x01\x00\x00tf\x00\x00\x00\x01\x00\x00\x17g\x00\x00\x00\x01\x00\x00\x1bg\x00\x00\x00\x01\x00\x00Vg\x00\x00\x00\x01\x00\x00yk\x00\x00\x00\x01\x00\x00\xbak\x00\x00\x00\x01\x00\x00'
+  b'Am\x00\x00\x00\x01\x00\x00\xdbn\x00\x00\x00\x01\x00\x00\xcbn\x00\x00\x00\x01\x00\x00"o\x00\x00\x00\x01\x00\x00\x1ep\x00\x00\x00\x01\x00\x00nq\x00\x00\x00\x01\x00\x00\xa7w\x00\x00\x00\x01\x00\x005r\x00\x00\x00\x01\x00\x00'
+  b'\xafr\x00\x00\x00\x01\x00\x00*s\x00\x00\x00\x01\x00\x00qt\x00\x00\x00\x01\x00\x00\x06u\x00\x00\x00\x01\x00\x00;u\x00\x00\x00\x01\x00\x00\x1dv\x00\x00\x00\x01\x00\x00\x1fv\x00\x00\x00\x01\x00\x00\xcav\x00\x00\x00\x01\x00\x00'
+  b'\xdbv\x00\x00\x00\x01\x00\x00\xf4v\x00\x00\x00\x01\x00\x00Jw\x00\x00\x00\x01\x00\x00@w\x00\x00\x00\x01\x00\x00\xccx\x00\x00\x00\x01\x00\x00\xb1z\x00\x00\x00\x01\x00\x00\xc0{\x00\x00\x00\x01\x00\x00{|\x00\x00\x00\x01\x00\x00'
+  b'[}\x00\x00\x00\x01\x00\x00\xf4}\x00\x00\x00\x01\x00\x00>\x7f\x00\x00\x00\x01\x00\x00\x05\x80\x00\x00\x00\x01\x00\x00R\x83\x00\x00\x00\x01\x00\x00\xef\x83\x00\x00\x00\x01\x00\x00y\x87\x00\x00\x00\x01\x00\x00A\x89\x00\x00\x00\x01\x00\x00'
+  b'\x86\x89\x00\x00\x00\x01\x00\x00\x96\x89\x00\x00\x00\x01\x00\x00\xbf\x8a\x00\x00\x00\x01\x00\x00\xf8\x8a\x00\x00\x00\x01\x00\x00\xcb\x8a\x00\x00\x00\x01\x00\x00\x01\x8b\x00\x00\x00\x01\x00\x00\xfe\x8a\x00\x00\x00\x01\x00\x00\xed\x8a\x00\x00\x00\x01\x00\x00'
+  b'9\x8b\x00\x00\x00\x01\x00\x00\x8a\x8b\x00\x00\x00\x01\x00\x00\x08\x8d\x00\x00\x00\x01\x00\x008\x8f\x00\x00\x00\x01\x00\x00r\x90\x00\x00\x00\x01\x00\x00\x99\x91\x00\x00\x00\x01\x00\x00v\x92\x00\x00\x00\x01\x00\x00|\x96\x00\x00\x00\x01\x00\x00'
+  b'\xe3\x96\x00\x00\x00\x01\x00\x00V\x97\x00\x00\x00\x01\x00\x00\xdb\x97\x00\x00\x00\x01\x00\x00\xff\x97\x00\x00\x00\x01\x00\x00\x0b\x98\x00\x00\x00\x01\x00\x00;\x98\x00\x00\x00\x01\x00\x00\x12\x9b\x00\x00\x00\x01\x00\x00\x9c\x9f\x00\x00\x00\x01\x00\x00'
+  b'J(\x02\x00\x00\x01\x00\x00D(\x02\x00\x00\x01\x00\x00\xd53\x02\x00\x00\x01\x00\x00\x9d;\x00\x00\x00\x01\x00\x00\x18@\x00\x00\x00\x01\x00\x009@\x00\x00\x00\x01\x00\x00IR\x02\x00\x00\x01\x00\x00\xd0\\\x02\x00\x00\x01\x00\x00'
+  b'\xd3~\x02\x00\x00\x01\x00\x00C\x9f\x00\x00\x00\x01\x00\x00\x8e\x9f\x00\x00\x02\x02\x00\x00f\x00\x00\x00f\x00\x00\x00\x02\x02\x00\x00f\x00\x00\x00i\x00\x00\x00\x02\x02\x00\x00f\x00\x00\x00l\x00\x00\x00\x02\x03\x00\x00f\x00\x00\x00'
+  b'f\x00\x00\x00i\x00\x00\x00\x02\x03\x00\x00f\x00\x00\x00f\x00\x00\x00l\x00\x00\x00\x02\x02\x00\x00\x7f\x01\x00\x00t\x00\x00\x00\x02\x02\x00\x00s\x00\x00\x00t\x00\x00\x00\x02\x02\x00\x00t\x05\x00\x00v\x05\x00\x00\x02\x02\x00\x00'
+  b't\x05\x00\x00e\x05\x00\x00\x02\x02\x00\x00t\x05\x00\x00k\x05\x00\x00\x02\x02\x00\x00~\x05\x00\x00v\x05\x00\x00\x02\x02\x00\x00t\x05\x00\x00m\x05\x00\x00\x00\x02\x00\x00\xd9\x05\x00\x00\xb4\x05\x00\x00\x00\x02\x00\x00\xf2\x05\x00\x00'
+  b'\xb7\x05\x00\x00\x06\x01\x00\x00\xe2\x05\x00\x00\x06\x01\x00\x00\xd0\x05\x00\x00\x06\x01\x00\x00\xd3\x05\x00\x00\x06\x01\x00\x00\xd4\x05\x00\x00\x06\x01\x00\x00\xdb\x05\x00\x00\x06\x01\x00\x00\xdc\x05\x00\x00\x06\x01\x00\x00\xdd\x05\x00\x00\x06\x01\x00\x00'
+  b'\xe8\x05\x00\x00\x06\x01\x00\x00\xea\x05\x00\x00\x06\x01\x00\x00+\x00\x00\x00\x00\x02\x00\x00\xe9\x05\x00\x00\xc1\x05\x00\x00\x00\x02\x00\x00\xe9\x05\x00\x00\xc2\x05\x00\x00\x00\x02\x00\x00I\xfb\x00\x00\xc1\x05\x00\x00\x00\x02\x00\x00I\xfb\x00\x00'
+  b'\xc2\x05\x00\x00\x00\x02\x00\x00\xd0\x05\x00\x00\xb7\x05\x00\x00\x00\x02\x00\x00\xd0\x05\x00\x00\xb8\x05\x00\x00\x00\x02\x00\x00\xd0\x05\x00\x00\xbc\x05\x00\x00\x00\x02\x00\x00\xd1\x05\x00\x00\xbc\x05\x00\x00\x00\x02\x00\x00\xd2\x05\x00\x00\xbc\x05\x00\x00'
+  b'\x00\x02\x00\x00\xd3\x05\x00\x00\xbc\x05\x00\x00\x00\x02\x00\x00\xd4\x05\x00\x00\xbc\x05\x00\x00\x00\x02\x00\x00\xd5\x05\x00\x00\xbc\x05\x00\x00\x00\x02\x00\x00\xd6\x05\x00\x00\xbc\x05\x00\x00\x00\x02\x00\x00\xd8\x05\x00\x00\xbc\x05\x00\x00\x00\x02\x00\x00'
+  b'\xd9\x05\x00\x00\xbc\x05\x00\x00\x00\x02\x00\x00\xda\x05\x00\x00\xbc\x05\x00\x00\x00\x02\x00\x00\xdb\x05\x00\x00\xbc\x05\x00\x00\x00\x02\x00\x00\xdc\x05\x00\x00\xbc\x05\x00\x00\x00\x02\x00\x00\xde\x05\x00\x00\xbc\x05\x00\x00\x00\x02\x00\x00\xe0\x05\x00\x00'
+  b'\xbc\x05\x00\x00\x00\x02\x00\x00\xe1\x05\x00\x00\xbc\x05\x00\x00\x00\x02\x00\x00\xe3\x05\x00\x00\xbc\x05\x00\x00\x00\x02\x00\x00\xe4\x05\x00\x00\xbc\x05\x00\x00\x00\x02\x00\x00\xe6\x05\x00\x00\xbc\x05\x00\x00\x00\x02\x00\x00\xe7\x05\x00\x00\xbc\x05\x00\x00'
+  b'\x00\x02\x00\x00\xe8\x05\x00\x00\xbc\x05\x00\x00\x00\x02\x00\x00\xe9\x05\x00\x00\xbc\x05\x00\x00\x00\x02\x00\x00\xea\x05\x00\x00\xbc\x05\x00\x00\x00\x02\x00\x00\xd5\x05\x00\x00\xb9\x05\x00\x00\x00\x02\x00\x00\xd1\x05\x00\x00\xbf\x05\x00\x00\x00\x02\x00\x00'
+  b'\xdb\x05\x00\x00\xbf\x05\x00\x00\x00\x02\x00\x00\xe4\x05\x00\x00\xbf\x05\x00\x00\x02\x02\x00\x00\xd0\x05\x00\x00\xdc\x05\x00\x00\x0b\x01\x00\x00q\x06\x00\x00\x0c\x01\x00\x00q\x06\x00\x00\x0b\x01\x00\x00{\x06\x00\x00\x0c\x01\x00\x00{\x06\x00\x00'
+  b'\r\x01\x00\x00{\x06\x00\x00\x0e\x01\x00\x00{\x06\x00\x00\x0b\x01\x00\x00~\x06\x00\x00\x0c\x01\x00\x00~\x06\x00\x00\r\x01\x00\x00~\x06\x00\x00\x0e\x01\x00\x00~\x06\x00\x00\x0b\x01\x00\x00\x80\x06\x00\x00\x0c\x01\x00\x00\x80\x06\x00\x00'
+  b'\r\x01\x00\x00\x80\x06\x00\x00\x0e\x01\x00\x00\x80\x06\x00\x00\x0b\x01\x00\x00z\x06\x00\x00\x0c\x01\x00\x00z\x06\x00\x00\r\x01\x00\x00z\x06\x00\x00\x0e\x01\x00\x00z\x06\x00\x00\x0b\x01\x00\x00\x7f\x06\x00\x00\x0c\x01\x00\x00\x7f\x06\x00\x00'
+  b'\r\x01\x00\x00\x7f\x06\x00\x00\x0e\x01\x00\x00\x7f\x06\x00\x00\x0b\x01\x00\x00y\x06\x00\x00\x0c\x01\x00\x00y\x06\x00\x00\r\x01\x00\x00y\x06\x00\x00\x0e\x01\x00\x00y\x06\x00\x00\x0b\x01\x00\x00\xa4\x06\x00\x00\x0c\x01\x00\x00\xa4\x06\x00\x00'
+  b'\r\x01\x00\x00\xa4\x06\x00\x00\x0e\x01\x00\x00\xa4\x06\x00\x00\x0b\x01\x00\x00\xa6\x06\x00\x00\x0c\x01\x00\x00\xa6\x06\x00\x00\r\x01\x00\x00\xa6\x06\x00\x00\x0e\x01\x00\x00\xa6\x06\x00\x00\x0b\x01\x00\x00\x84\x06\x00\x00\x0c\x01\x00\x00\x84\x06\x00\x00'
+  b'\r\x01\x00\x00\x84\x06\x00\x00\x0e\x01\x00\x00\x84\x06\x00\x00\x0b\x01\x00\x00\x83\x06\x00\x00\x0c\x01\x00\x00\x83\x06\x00\x00\r\x01\x00\x00\x83\x06\x00\x00\x0e\x01\x00\x00\x83\x06\x00\x00\x0b\x01\x00\x00\x86\x06\x00\x00\x0c\x01\x00\x00\x86\x06\x00\x00'
+  b'\r\x01\x00\x00\x86\x06\x00\x00\x0e\x01\x00\x00\x86\x06\x00\x00\x0b\x01\x00\x00\x87\x06\x00\x00\x0c\x01\x00\x00\x87\x06\x00\x00\r\x01\x00\x00\x87\x06\x00\x00\x0e\x01\x00\x00\x87\x06\x00\x00\x0b\x01\x00\x00\x8d\x06\x00\x00\x0c\x01\x00\x00\x8d\x06\x00\x00'
+  b'\x0b\x01\x00\x00\x8c\x06\x00\x00\x0c\x01\x00\x00\x8c\x06\x00\x00\x0b\x01\x00\x00\x8e\x06\x00\x00\x0c\x01\x00\x00\x8e\x06\x00\x00\x0b\x01\x00\x00\x88\x06\x00\x00\x0c\x01\x00\x00\x88\x06\x00\x00\x0b\x01\x00\x00\x98\x06\x00\x00\x0c\x01\x00\x00\x98\x06\x00\x00'
+  b'\x0b\x01\x00\x00\x91\x06\x00\x00\x0c\x01\x00\x00\x91\x06\x00\x00\x0b\x01\x00\x00\xa9\x06\x00\x00\x0c\x01\x00\x00\xa9\x06\x00\x00\r\x01\x00\x00\xa9\x06\x00\x00\x0e\x01\x00\x00\xa9\x06\x00\x00\x0b\x01\x00\x00\xaf\x06\x00\x00\x0c\x01\x00\x00\xaf\x06\x00\x00'
+  b'\r\x01\x00\x00\xaf\x06\x00\x00\x0e\x01\x00\x00\xaf\x06\x00\x00\x0b\x01\x00\x00\xb3\x06\x00\x00\x0c\x01\x00\x00\xb3\x06\x00\x00\r\x01\x00\x00\xb3\x06\x00\x00\x0e\x01\x00\x00\xb3\x06\x00\x00\x0b\x01\x00\x00\xb1\x06\x00\x00\x0c\x01\x00\x00\xb1\x06\x00\x00'
+  b'\r\x01\x00\x00\xb1\x06\x00\x00\x0e\x01\x00\x00\xb1\x06\x00\x00\x0b\x01\x00\x00\xba\x06\x00\x00\x0c\x01\x00\x00\xba\x06\x00\x00\x0b\x01\x00\x00\xbb\x06\x00\x00\x0c\x01\x00\x00\xbb\x06\x00\x00\r\x01\x00\x00\xbb\x06\x00\x00\x0e\x01\x00\x00\xbb\x06\x00\x00'
+  b'\x0b\x01\x00\x00\xc0\x06\x00\x00\x0c\x01\x00\x00\xc0\x06\x00\x00\x0b\x01\x00\x00\xc1\x06\x00\x00\x0c\x01\x00\x00\xc1\x06\x00\x00\r\x01\x00\x00\xc1\x06\x00\x00\x0e\x01\x00\x00\xc1\x06\x00\x00\x0b\x01\x00\x00\xbe\x06\x00\x00\x0c\x01\x00\x00\xbe\x06\x00\x00'
+  b'\r\x01\x00\x00\xbe\x06\x00\x00\x0e\x01\x00\x00\xbe\x06\x00\x00\x0b\x01\x00\x00\xd2\x06\x00\x00\x0c\x01\x00\x00\xd2\x06\x00\x00\x0b\x01\x00\x00\xd3\x06\x00\x00\x0c\x01\x00\x00\xd3\x06\x00\x00\x0b\x01\x00\x00\xad\x06\x00\x00\x0c\x01\x00\x00\xad\x06\x00\x00'
+  b'\r\x01\x00\x00\xad\x06\x00\x00\x0e\x01\x00\x00\xad\x06\x00\x00\x0b\x01\x00\x00\xc7\x06\x00\x00\x0c\x01\x00\x00\xc7\x06\x00\x00\x0b\x01\x00\x00\xc6\x06\x00\x00\x0c\x01\x00\x00\xc6\x06\x00\x00\x0b\x01\x00\x00\xc8\x06\x00\x00\x0c\x01\x00\x00\xc8\x06\x00\x00'
+  b'\x0b\x01\x00\x00w\x06\x00\x00\x0b\x01\x00\x00\xcb\x06\x00\x00\x0c\x01\x00\x00\xcb\x06\x00\x00\x0b\x01\x00\x00\xc5\x06\x00\x00\x0c\x01\x00\x00\xc5\x06\x00\x00\x0b\x01\x00\x00\xc9\x06\x00\x00\x0c\x01\x00\x00\xc9\x06\x00\x00\x0b\x01\x00\x00\xd0\x06\x00\x00'
+  b"\x0c\x01\x00\x00\xd0\x06\x00\x00\r\x01\x00\x00\xd0\x06\x00\x00\x0e\x01\x00\x00\xd0\x06\x00\x00\r\x01\x00\x00I\x06\x00\x00\x0e\x01\x00\x00I\x06\x00\x00\x0b\x02\x00\x00&\x06\x00\x00'\x06\x00\x00\x0c\x02\x00\x00&\x06\x00\x00'\x06\x00\x00"
+  b'\x0b\x02\x00\x00&\x06\x00\x00\xd5\x06\x00\x00\x0c\x02\x00\x00&\x06\x00\x00\xd5\x06\x00\x00\x0b\x02\x00\x00&\x06\x00\x00H\x06\x00\x00\x0c\x02\x00\x00&\x06\x00\x00H\x06\x00\x00\x0b\x02\x00\x00&\x06\x00\x00\xc7\x06\x00\x00\x0c\x02\x00\x00'
+  b'&\x06\x00\x00\xc7\x06\x00\x00\x0b\x02\x00\x00&\x06\x00\x00\xc6\x06\x00\x00\x0c\x02\x00\x00&\x06\x00\x00\xc6\x06\x00\x00\x0b\x02\x00\x00&\x06\x00\x00\xc8\x06\x00\x00\x0c\x02\x00\x00&\x06\x00\x00\xc8\x06\x00\x00\x0b\x02\x00\x00&\x06\x00\x00'
+  b'\xd0\x06\x00\x00\x0c\x02\x00\x00&\x06\x00\x00\xd0\x06\x00\x00\r\x02\x00\x00&\x06\x00\x00\xd0\x06\x00\x00\x0b\x02\x00\x00&\x06\x00\x00I\x06\x00\x00\x0c\x02\x00\x00&\x06\x00\x00I\x06\x00\x00\r\x02\x00\x00&\x06\x00\x00I\x06\x00\x00'
+  b'\x0b\x01\x00\x00\xcc\x06\x00\x00\x0c\x01\x00\x00\xcc\x06\x00\x00\r\x01\x00\x00\xcc\x06\x00\x00\x0e\x01\x00\x00\xcc\x06\x00\x00\x0b\x02\x00\x00&\x06\x00\x00,\x06\x00\x00\x0b\x02\x00\x00&\x06\x00\x00-\x06\x00\x00\x0b\x02\x00\x00&\x06\x00\x00'
+  b'E\x06\x00\x00\x0b\x02\x00\x00&\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x00&\x06\x00\x00J\x06\x00\x00\x0b\x02\x00\x00(\x06\x00\x00,\x06\x00\x00\x0b\x02\x00\x00(\x06\x00\x00-\x06\x00\x00\x0b\x02\x00\x00(\x06\x00\x00.\x06\x00\x00'
+  b'\x0b\x02\x00\x00(\x06\x00\x00E\x06\x00\x00\x0b\x02\x00\x00(\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x00(\x06\x00\x00J\x06\x00\x00\x0b\x02\x00\x00*\x06\x00\x00,\x06\x00\x00\x0b\x02\x00\x00*\x06\x00\x00-\x06\x00\x00\x0b\x02\x00\x00'
+  b'*\x06\x00\x00.\x06\x00\x00\x0b\x02\x00\x00*\x06\x00\x00E\x06\x00\x00\x0b\x02\x00\x00*\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x00*\x06\x00\x00J\x06\x00\x00\x0b\x02\x00\x00+\x06\x00\x00,\x06\x00\x00\x0b\x02\x00\x00+\x06\x00\x00'
+  b'E\x06\x00\x00\x0b\x02\x00\x00+\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x00+\x06\x00\x00J\x06\x00\x00\x0b\x02\x00\x00,\x06\x00\x00-\x06\x00\x00\x0b\x02\x00\x00,\x06\x00\x00E\x06\x00\x00\x0b\x02\x00\x00-\x06\x00\x00,\x06\x00\x00'
+  b'\x0b\x02\x00\x00-\x06\x00\x00E\x06\x00\x00\x0b\x02\x00\x00.\x06\x00\x00,\x06\x00\x00\x0b\x02\x00\x00.\x06\x00\x00-\x06\x00\x00\x0b\x02\x00\x00.\x06\x00\x00E\x06\x00\x00\x0b\x02\x00\x003\x06\x00\x00,\x06\x00\x00\x0b\x02\x00\x00'
+  b'3\x06\x00\x00-\x06\x00\x00\x0b\x02\x00\x003\x06\x00\x00.\x06\x00\x00\x0b\x02\x00\x003\x06\x00\x00E\x06\x00\x00\x0b\x02\x00\x005\x06\x00\x00-\x06\x00\x00\x0b\x02\x00\x005\x06\x00\x00E\x06\x00\x00\x0b\x02\x00\x006\x06\x00\x00'
+  b',\x06\x00\x00\x0b\x02\x00\x006\x06\x00\x00-\x06\x00\x00\x0b\x02\x00\x006\x06\x00\x00.\x06\x00\x00\x0b\x02\x00\x006\x06\x00\x00E\x06\x00\x00\x0b\x02\x00\x007\x06\x00\x00-\x06\x00\x00\x0b\x02\x00\x007\x06\x00\x00E\x06\x00\x00'
+  b'\x0b\x02\x00\x008\x06\x00\x00E\x06\x00\x00\x0b\x02\x00\x009\x06\x00\x00,\x06\x00\x00\x0b\x02\x00\x009\x06\x00\x00E\x06\x00\x00\x0b\x02\x00\x00:\x06\x00\x00,\x06\x00\x00\x0b\x02\x00\x00:\x06\x00\x00E\x06\x00\x00\x0b\x02\x00\x00'
+  b'A\x06\x00\x00,\x06\x00\x00\x0b\x02\x00\x00A\x06\x00\x00-\x06\x00\x00\x0b\x02\x00\x00A\x06\x00\x00.\x06\x00\x00\x0b\x02\x00\x00A\x06\x00\x00E\x06\x00\x00\x0b\x02\x00\x00A\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x00A\x06\x00\x00'
+  b"J\x06\x00\x00\x0b\x02\x00\x00B\x06\x00\x00-\x06\x00\x00\x0b\x02\x00\x00B\x06\x00\x00E\x06\x00\x00\x0b\x02\x00\x00B\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x00B\x06\x00\x00J\x06\x00\x00\x0b\x02\x00\x00C\x06\x00\x00'\x06\x00\x00"
+  b'\x0b\x02\x00\x00C\x06\x00\x00,\x06\x00\x00\x0b\x02\x00\x00C\x06\x00\x00-\x06\x00\x00\x0b\x02\x00\x00C\x06\x00\x00.\x06\x00\x00\x0b\x02\x00\x00C\x06\x00\x00D\x06\x00\x00\x0b\x02\x00\x00C\x06\x00\x00E\x06\x00\x00\x0b\x02\x00\x00'
+  b'C\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x00C\x06\x00\x00J\x06\x00\x00\x0b\x02\x00\x00D\x06\x00\x00,\x06\x00\x00\x0b\x02\x00\x00D\x06\x00\x00-\x06\x00\x00\x0b\x02\x00\x00D\x06\x00\x00.\x06\x00\x00\x0b\x02\x00\x00D\x06\x00\x00'
+  b'E\x06\x00\x00\x0b\x02\x00\x00D\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x00D\x06\x00\x00J\x06\x00\x00\x0b\x02\x00\x00E\x06\x00\x00,\x06\x00\x00\x0b\x02\x00\x00E\x06\x00\x00-\x06\x00\x00\x0b\x02\x00\x00E\x06\x00\x00.\x06\x00\x00'
+  b'\x0b\x02\x00\x00E\x06\x00\x00E\x06\x00\x00\x0b\x02\x00\x00E\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x00E\x06\x00\x00J\x06\x00\x00\x0b\x02\x00\x00F\x06\x00\x00,\x06\x00\x00\x0b\x02\x00\x00F\x06\x00\x00-\x06\x00\x00\x0b\x02\x00\x00'
+  b'F\x06\x00\x00.\x06\x00\x00\x0b\x02\x00\x00F\x06\x00\x00E\x06\x00\x00\x0b\x02\x00\x00F\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x00F\x06\x00\x00J\x06\x00\x00\x0b\x02\x00\x00G\x06\x00\x00,\x06\x00\x00\x0b\x02\x00\x00G\x06\x00\x00'
+  b'E\x06\x00\x00\x0b\x02\x00\x00G\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x00G\x06\x00\x00J\x06\x00\x00\x0b\x02\x00\x00J\x06\x00\x00,\x06\x00\x00\x0b\x02\x00\x00J\x06\x00\x00-\x06\x00\x00\x0b\x02\x00\x00J\x06\x00\x00.\x06\x00\x00'
+  b'\x0b\x02\x00\x00J\x06\x00\x00E\x06\x00\x00\x0b\x02\x00\x00J\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x00J\x06\x00\x00J\x06\x00\x00\x0b\x02\x00\x000\x06\x00\x00p\x06\x00\x00\x0b\x02\x00\x001\x06\x00\x00p\x06\x00\x00\x0b\x02\x00\x00'
+  b'I\x06\x00\x00p\x06\x00\x00\x0b\x03\x00\x00 \x00\x00\x00L\x06\x00\x00Q\x06\x00\x00\x0b\x03\x00\x00 \x00\x00\x00M\x06\x00\x00Q\x06\x00\x00\x0b\x03\x00\x00 \x00\x00\x00N\x06\x00\x00Q\x06\x00\x00\x0b\x03\x00\x00 \x00\x00\x00'
+  b'O\x06\x00\x00Q\x06\x00\x00\x0b\x03\x00\x00 \x00\x00\x00P\x06\x00\x00Q\x06\x00\x00\x0b\x03\x00\x00 \x00\x00\x00Q\x06\x00\x00p\x06\x00\x00\x0c\x02\x00\x00&\x06\x00\x001\x06\x00\x00\x0c\x02\x00\x00&\x06\x00\x002\x06\x00\x00'
+  b'\x0c\x02\x00\x00&\x06\x00\x00E\x06\x00\x00\x0c\x02\x00\x00&\x06\x00\x00F\x06\x00\x00\x0c\x02\x00\x00&\x06\x00\x00I\x06\x00\x00\x0c\x02\x00\x00&\x06\x00\x00J\x06\x00\x00\x0c\x02\x00\x00(\x06\x00\x001\x06\x00\x00\x0c\x02\x00\x00'
+  b'(\x06\x00\x002\x06\x00\x00\x0c\x02\x00\x00(\x06\x00\x00E\x06\x00\x00\x0c\x02\x00\x00(\x06\x00\x00F\x06\x00\x00\x0c\x02\x00\x00(\x06\x00\x00I\x06\x00\x00\x0c\x02\x00\x00(\x06\x00\x00J\x06\x00\x00\x0c\x02\x00\x00*\x06\x00\x00'
+  b'1\x06\x00\x00\x0c\x02\x00\x00*\x06\x00\x002\x06\x00\x00\x0c\x02\x00\x00*\x06\x00\x00E\x06\x00\x00\x0c\x02\x00\x00*\x06\x00\x00F\x06\x00\x00\x0c\x02\x00\x00*\x06\x00\x00I\x06\x00\x00\x0c\x02\x00\x00*\x06\x00\x00J\x06\x00\x00'
+  b'\x0c\x02\x00\x00+\x06\x00\x001\x06\x00\x00\x0c\x02\x00\x00+\x06\x00\x002\x06\x00\x00\x0c\x02\x00\x00+\x06\x00\x00E\x06\x00\x00\x0c\x02\x00\x00+\x06\x00\x00F\x06\x00\x00\x0c\x02\x00\x00+\x06\x00\x00I\x06\x00\x00\x0c\x02\x00\x00'
+  b'+\x06\x00\x00J\x06\x00\x00\x0c\x02\x00\x00A\x06\x00\x00I\x06\x00\x00\x0c\x02\x00\x00A\x06\x00\x00J\x06\x00\x00\x0c\x02\x00\x00B\x06\x00\x00I\x06\x00\x00\x0c\x02\x00\x00B\x06\x00\x00J\x06\x00\x00\x0c\x02\x00\x00C\x06\x00\x00'
+  b"'\x06\x00\x00\x0c\x02\x00\x00C\x06\x00\x00D\x06\x00\x00\x0c\x02\x00\x00C\x06\x00\x00E\x06\x00\x00\x0c\x02\x00\x00C\x06\x00\x00I\x06\x00\x00\x0c\x02\x00\x00C\x06\x00\x00J\x06\x00\x00\x0c\x02\x00\x00D\x06\x00\x00E\x06\x00\x00"
+  b"\x0c\x02\x00\x00D\x06\x00\x00I\x06\x00\x00\x0c\x02\x00\x00D\x06\x00\x00J\x06\x00\x00\x0c\x02\x00\x00E\x06\x00\x00'\x06\x00\x00\x0c\x02\x00\x00E\x06\x00\x00E\x06\x00\x00\x0c\x02\x00\x00F\x06\x00\x001\x06\x00\x00\x0c\x02\x00\x00"
+  b'F\x06\x00\x002\x06\x00\x00\x0c\x02\x00\x00F\x06\x00\x00E\x06\x00\x00\x0c\x02\x00\x00F\x06\x00\x00F\x06\x00\x00\x0c\x02\x00\x00F\x06\x00\x00I\x06\x00\x00\x0c\x02\x00\x00F\x06\x00\x00J\x06\x00\x00\x0c\x02\x00\x00I\x06\x00\x00'
+  b'p\x06\x00\x00\x0c\x02\x00\x00J\x06\x00\x001\x06\x00\x00\x0c\x02\x00\x00J\x06\x00\x002\x06\x00\x00\x0c\x02\x00\x00J\x06\x00\x00E\x06\x00\x00\x0c\x02\x00\x00J\x06\x00\x00F\x06\x00\x00\x0c\x02\x00\x00J\x06\x00\x00I\x06\x00\x00'
+  b'\x0c\x02\x00\x00J\x06\x00\x00J\x06\x00\x00\r\x02\x00\x00&\x06\x00\x00,\x06\x00\x00\r\x02\x00\x00&\x06\x00\x00-\x06\x00\x00\r\x02\x00\x00&\x06\x00\x00.\x06\x00\x00\r\x02\x00\x00&\x06\x00\x00E\x06\x00\x00\r\x02\x00\x00'
+  b'&\x06\x00\x00G\x06\x00\x00\r\x02\x00\x00(\x06\x00\x00,\x06\x00\x00\r\x02\x00\x00(\x06\x00\x00-\x06\x00\x00\r\x02\x00\x00(\x06\x00\x00.\x06\x00\x00\r\x02\x00\x00(\x06\x00\x00E\x06\x00\x00\r\x02\x00\x00(\x06\x00\x00'
+  b'G\x06\x00\x00\r\x02\x00\x00*\x06\x00\x00,\x06\x00\x00\r\x02\x00\x00*\x06\x00\x00-\x06\x00\x00\r\x02\x00\x00*\x06\x00\x00.\x06\x00\x00\r\x02\x00\x00*\x06\x00\x00E\x06\x00\x00\r\x02\x00\x00*\x06\x00\x00G\x06\x00\x00'
+  b'\r\x02\x00\x00+\x06\x00\x00E\x06\x00\x00\r\x02\x00\x00,\x06\x00\x00-\x06\x00\x00\r\x02\x00\x00,\x06\x00\x00E\x06\x00\x00\r\x02\x00\x00-\x06\x00\x00,\x06\x00\x00\r\x02\x00\x00-\x06\x00\x00E\x06\x00\x00\r\x02\x00\x00'
+  b'.\x06\x00\x00,\x06\x00\x00\r\x02\x00\x00.\x06\x00\x00E\x06\x00\x00\r\x02\x00\x003\x06\x00\x00,\x06\x00\x00\r\x02\x00\x003\x06\x00\x00-\x06\x00\x00\r\x02\x00\x003\x06\x00\x00.\x06\x00\x00\r\x02\x00\x003\x06\x00\x00'
+  b'E\x06\x00\x00\r\x02\x00\x005\x06\x00\x00-\x06\x00\x00\r\x02\x00\x005\x06\x00\x00.\x06\x00\x00\r\x02\x00\x005\x06\x00\x00E\x06\x00\x00\r\x02\x00\x006\x06\x00\x00,\x06\x00\x00\r\x02\x00\x006\x06\x00\x00-\x06\x00\x00'
+  b'\r\x02\x00\x006\x06\x00\x00.\x06\x00\x00\r\x02\x00\x006\x06\x00\x00E\x06\x00\x00\r\x02\x00\x007\x06\x00\x00-\x06\x00\x00\r\x02\x00\x008\x06\x00\x00E\x06\x00\x00\r\x02\x00\x009\x06\x00\x00,\x06\x00\x00\r\x02\x00\x00'
+  b'9\x06\x00\x00E\x06\x00\x00\r\x02\x00\x00:\x06\x00\x00,\x06\x00\x00\r\x02\x00\x00:\x06\x00\x00E\x06\x00\x00\r\x02\x00\x00A\x06\x00\x00,\x06\x00\x00\r\x02\x00\x00A\x06\x00\x00-\x06\x00\x00\r\x02\x00\x00A\x06\x00\x00'
+  b'.\x06\x00\x00\r\x02\x00\x00A\x06\x00\x00E\x06\x00\x00\r\x02\x00\x00B\x06\x00\x00-\x06\x00\x00\r\x02\x00\x00B\x06\x00\x00E\x06\x00\x00\r\x02\x00\x00C\x06\x00\x00,\x06\x00\x00\r\x02\x00\x00C\x06\x00\x00-\x06\x00\x00'
+  b'\r\x02\x00\x00C\x06\x00\x00.\x06\x00\x00\r\x02\x00\x00C\x06\x00\x00D\x06\x00\x00\r\x02\x00\x00C\x06\x00\x00E\x06\x00\x00\r\x02\x00\x00D\x06\x00\x00,\x06\x00\x00\r\x02\x00\x00D\x06\x00\x00-\x06\x00\x00\r\x02\x00\x00'
+  b'D\x06\x00\x00.\x06\x00\x00\r\x02\x00\x00D\x06\x00\x00E\x06\x00\x00\r\x02\x00\x00D\x06\x00\x00G\x06\x00\x00\r\x02\x00\x00E\x06\x00\x00,\x06\x00\x00\r\x02\x00\x00E\x06\x00\x00-\x06\x00\x00\r\x02\x00\x00E\x06\x00\x00'
+  b'.\x06\x00\x00\r\x02\x00\x00E\x06\x00\x00E\x06\x00\x00\r\x02\x00\x00F\x06\x00\x00,\x06\x00\x00\r\x02\x00\x00F\x06\x00\x00-\x06\x00\x00\r\x02\x00\x00F\x06\x00\x00.\x06\x00\x00\r\x02\x00\x00F\x06\x00\x00E\x06\x00\x00'
+  b'\r\x02\x00\x00F\x06\x00\x00G\x06\x00\x00\r\x02\x00\x00G\x06\x00\x00,\x06\x00\x00\r\x02\x00\x00G\x06\x00\x00E\x06\x00\x00\r\x02\x00\x00G\x06\x00\x00p\x06\x00\x00\r\x02\x00\x00J\x06\x00\x00,\x06\x00\x00\r\x02\x00\x00'
+  b'J\x06\x00\x00-\x06\x00\x00\r\x02\x00\x00J\x06\x00\x00.\x06\x00\x00\r\x02\x00\x00J\x06\x00\x00E\x06\x00\x00\r\x02\x00\x00J\x06\x00\x00G\x06\x00\x00\x0e\x02\x00\x00&\x06\x00\x00E\x06\x00\x00\x0e\x02\x00\x00&\x06\x00\x00'
+  b'G\x06\x00\x00\x0e\x02\x00\x00(\x06\x00\x00E\x06\x00\x00\x0e\x02\x00\x00(\x06\x00\x00G\x06\x00\x00\x0e\x02\x00\x00*\x06\x00\x00E\x06\x00\x00\x0e\x02\x00\x00*\x06\x00\x00G\x06\x00\x00\x0e\x02\x00\x00+\x06\x00\x00E\x06\x00\x00'
+  b'\x0e\x02\x00\x00+\x06\x00\x00G\x06\x00\x00\x0e\x02\x00\x003\x06\x00\x00E\x06\x00\x00\x0e\x02\x00\x003\x06\x00\x00G\x06\x00\x00\x0e\x02\x00\x004\x06\x00\x00E\x06\x00\x00\x0e\x02\x00\x004\x06\x00\x00G\x06\x00\x00\x0e\x02\x00\x00'
+  b'C\x06\x00\x00D\x06\x00\x00\x0e\x02\x00\x00C\x06\x00\x00E\x06\x00\x00\x0e\x02\x00\x00D\x06\x00\x00E\x06\x00\x00\x0e\x02\x00\x00F\x06\x00\x00E\x06\x00\x00\x0e\x02\x00\x00F\x06\x00\x00G\x06\x00\x00\x0e\x02\x00\x00J\x06\x00\x00'
+  b'E\x06\x00\x00\x0e\x02\x00\x00J\x06\x00\x00G\x06\x00\x00\x0e\x03\x00\x00@\x06\x00\x00N\x06\x00\x00Q\x06\x00\x00\x0e\x03\x00\x00@\x06\x00\x00O\x06\x00\x00Q\x06\x00\x00\x0e\x03\x00\x00@\x06\x00\x00P\x06\x00\x00Q\x06\x00\x00'
+  b'\x0b\x02\x00\x007\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x007\x06\x00\x00J\x06\x00\x00\x0b\x02\x00\x009\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x009\x06\x00\x00J\x06\x00\x00\x0b\x02\x00\x00:\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x00'
+  b':\x06\x00\x00J\x06\x00\x00\x0b\x02\x00\x003\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x003\x06\x00\x00J\x06\x00\x00\x0b\x02\x00\x004\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x004\x06\x00\x00J\x06\x00\x00\x0b\x02\x00\x00-\x06\x00\x00'
+  b'I\x06\x00\x00\x0b\x02\x00\x00-\x06\x00\x00J\x06\x00\x00\x0b\x02\x00\x00,\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x00,\x06\x00\x00J\x06\x00\x00\x0b\x02\x00\x00.\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x00.\x06\x00\x00J\x06\x00\x00'
+  b'\x0b\x02\x00\x005\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x005\x06\x00\x00J\x06\x00\x00\x0b\x02\x00\x006\x06\x00\x00I\x06\x00\x00\x0b\x02\x00\x006\x06\x00\x00J\x06\x00\x00\x0b\x02\x00\x004\x06\x00\x00,\x06\x00\x00\x0b\x02\x00\x00'
+  b'4\x06\x00\x00-\x06\x00\x00\x0b\x02\x00\x004\x06\x00\x00.\x06\x00\x00\x0b\x02\x00\x004\x06\x00\x00E\x06\x00\x00\x0b\x02\x00\x004\x06\x00\x001\x06\x00\x00\x0b\x02\x00\x003\x06\x00\x001\x06\x00\x00\x0b\x02\x00\x005\x06\x00\x00'
+  b'1\x06\x00\x00\x0b\x02\x00\x006\x06\x00\x001\x06\x00\x00\x0c\x02\x00\x007\x06\x00\x00I\x06\x00\x00\x0c\x02\x00\x007\x06\x00\x00J\x06\x00\x00\x0c\x02\x00\x009\x06\x00\x00I\x06\x00\x00\x0c\x02\x00\x009\x06\x00\x00J\x06\x00\x00'
+  b'\x0c\x02\x00\x00:\x06\x00\x00I\x06\x00\x00\x0c\x02\x00\x00:\x06\x00\x00J\x06\x00\x00\x0c\x02\x00\x003\x06\x00\x00I\x06\x00\x00\x0c\x02\x00\x003\x06\x00\x00J\x06\x00\x00\x0c\x02\x00\x004\x06\x00\x00I\x06\x00\x00\x0c\x02\x00\x00'
+  b'4\x06\x00\x00J\x06\x00\x00\x0c\x02\x00\x00-\x06\x00\x00I\x06\x00\x00\x0c\x02\x00\x00-\x06\x00\x00J\x06\x00\x00\x0c\x02\x00\x00,\x06\x00\x00I\x06\x00\x00\x0c\x02\x00\x00,\x06\x00\x00J\x06\x00\x00\x0c\x02\x00\x00.\x06\x00\x00'
+  b'I\x06\x00\x00\x0c\x02\x00\x00.\x06\x00\x00J\x06\x00\x00\x0c\x02\x00\x005\x06\x00\x00I\x06\x00\x00\x0c\x02\x00\x005\x06\x00\x00J\x06\x00\x00\x0c\x02\x00\x006\x06\x00\x00I\x06\x00\x00\x0c\x02\x00\x006\x06\x00\x00J\x06\x00\x00'
+  b'\x0c\x02\x00\x004\x06\x00\x00,\x06\x00\x00\x0c\x02\x00\x004\x06\x00\x00-\x06\x00\x00\x0c\x02\x00\x004\x06\x00\x00.\x06\x00\x00\x0c\x02\x00\x004\x06\x00\x00E\x06\x00\x00\x0c\x02\x00\x004\x06\x00\x001\x06\x00\x00\x0c\x02\x00\x00'
+  b'3\x06\x00\x001\x06\x00\x00\x0c\x02\x00\x005\x06\x00\x001\x06\x00\x00\x0c\x02\x00\x006\x06\x00\x001\x06\x00\x00\r\x02\x00\x004\x06\x00\x00,\x06\x00\x00\r\x02\x00\x004\x06\x00\x00-\x06\x00\x00\r\x02\x00\x004\x06\x00\x00'
+  b'.\x06\x00\x00\r\x02\x00\x004\x06\x00\x00E\x06\x00\x00\r\x02\x00\x003\x06\x00\x00G\x06\x00\x00\r\x02\x00\x004\x06\x00\x00G\x06\x00\x00\r\x02\x00\x007\x06\x00\x00E\x06\x00\x00\x0e\x02\x00\x003\x06\x00\x00,\x06\x00\x00'
+  b'\x0e\x02\x00\x003\x06\x00\x00-\x06\x00\x00\x0e\x02\x00\x003\x06\x00\x00.\x06\x00\x00\x0e\x02\x00\x004\x06\x00\x00,\x06\x00\x00\x0e\x02\x00\x004\x06\x00\x00-\x06\x00\x00\x0e\x02\x00\x004\x06\x00\x00.\x06\x00\x00\x0e\x02\x00\x00'
+  b"7\x06\x00\x00E\x06\x00\x00\x0e\x02\x00\x008\x06\x00\x00E\x06\x00\x00\x0c\x02\x00\x00'\x06\x00\x00K\x06\x00\x00\x0b\x02\x00\x00'\x06\x00\x00K\x06\x00\x00\r\x03\x00\x00*\x06\x00\x00,\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x00"
+  b'*\x06\x00\x00-\x06\x00\x00,\x06\x00\x00\r\x03\x00\x00*\x06\x00\x00-\x06\x00\x00,\x06\x00\x00\r\x03\x00\x00*\x06\x00\x00-\x06\x00\x00E\x06\x00\x00\r\x03\x00\x00*\x06\x00\x00.\x06\x00\x00E\x06\x00\x00\r\x03\x00\x00'
+  b'*\x06\x00\x00E\x06\x00\x00,\x06\x00\x00\r\x03\x00\x00*\x06\x00\x00E\x06\x00\x00-\x06\x00\x00\r\x03\x00\x00*\x06\x00\x00E\x06\x00\x00.\x06\x00\x00\x0c\x03\x00\x00,\x06\x00\x00E\x06\x00\x00-\x06\x00\x00\r\x03\x00\x00'
+  b',\x06\x00\x00E\x06\x00\x00-\x06\x00\x00\x0c\x03\x00\x00-\x06\x00\x00E\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00-\x06\x00\x00E\x06\x00\x00I\x06\x00\x00\r\x03\x00\x003\x06\x00\x00-\x06\x00\x00,\x06\x00\x00\r\x03\x00\x00'
+  b'3\x06\x00\x00,\x06\x00\x00-\x06\x00\x00\x0c\x03\x00\x003\x06\x00\x00,\x06\x00\x00I\x06\x00\x00\x0c\x03\x00\x003\x06\x00\x00E\x06\x00\x00-\x06\x00\x00\r\x03\x00\x003\x06\x00\x00E\x06\x00\x00-\x06\x00\x00\r\x03\x00\x00'
+  b'3\x06\x00\x00E\x06\x00\x00,\x06\x00\x00\x0c\x03\x00\x003\x06\x00\x00E\x06\x00\x00E\x06\x00\x00\r\x03\x00\x003\x06\x00\x00E\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x005\x06\x00\x00-\x06\x00\x00-\x06\x00\x00\r\x03\x00\x00'
+  b'5\x06\x00\x00-\x06\x00\x00-\x06\x00\x00\x0c\x03\x00\x005\x06\x00\x00E\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x004\x06\x00\x00-\x06\x00\x00E\x06\x00\x00\r\x03\x00\x004\x06\x00\x00-\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x00'
+  b'4\x06\x00\x00,\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x004\x06\x00\x00E\x06\x00\x00.\x06\x00\x00\r\x03\x00\x004\x06\x00\x00E\x06\x00\x00.\x06\x00\x00\x0c\x03\x00\x004\x06\x00\x00E\x06\x00\x00E\x06\x00\x00\r\x03\x00\x00'
+  b'4\x06\x00\x00E\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x006\x06\x00\x00-\x06\x00\x00I\x06\x00\x00\x0c\x03\x00\x006\x06\x00\x00.\x06\x00\x00E\x06\x00\x00\r\x03\x00\x006\x06\x00\x00.\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x00'
+  b'7\x06\x00\x00E\x06\x00\x00-\x06\x00\x00\r\x03\x00\x007\x06\x00\x00E\x06\x00\x00-\x06\x00\x00\r\x03\x00\x007\x06\x00\x00E\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x007\x06\x00\x00E\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00'
+  b'9\x06\x00\x00,\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x009\x06\x00\x00E\x06\x00\x00E\x06\x00\x00\r\x03\x00\x009\x06\x00\x00E\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x009\x06\x00\x00E\x06\x00\x00I\x06\x00\x00\x0c\x03\x00\x00'
+  b':\x06\x00\x00E\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x00:\x06\x00\x00E\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00:\x06\x00\x00E\x06\x00\x00I\x06\x00\x00\x0c\x03\x00\x00A\x06\x00\x00.\x06\x00\x00E\x06\x00\x00\r\x03\x00\x00'
+  b'A\x06\x00\x00.\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x00B\x06\x00\x00E\x06\x00\x00-\x06\x00\x00\x0c\x03\x00\x00B\x06\x00\x00E\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x00D\x06\x00\x00-\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x00'
+  b'D\x06\x00\x00-\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00D\x06\x00\x00-\x06\x00\x00I\x06\x00\x00\r\x03\x00\x00D\x06\x00\x00,\x06\x00\x00,\x06\x00\x00\x0c\x03\x00\x00D\x06\x00\x00,\x06\x00\x00,\x06\x00\x00\x0c\x03\x00\x00'
+  b'D\x06\x00\x00.\x06\x00\x00E\x06\x00\x00\r\x03\x00\x00D\x06\x00\x00.\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x00D\x06\x00\x00E\x06\x00\x00-\x06\x00\x00\r\x03\x00\x00D\x06\x00\x00E\x06\x00\x00-\x06\x00\x00\r\x03\x00\x00'
+  b'E\x06\x00\x00-\x06\x00\x00,\x06\x00\x00\r\x03\x00\x00E\x06\x00\x00-\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x00E\x06\x00\x00-\x06\x00\x00J\x06\x00\x00\r\x03\x00\x00E\x06\x00\x00,\x06\x00\x00-\x06\x00\x00\r\x03\x00\x00'
+  b'E\x06\x00\x00,\x06\x00\x00E\x06\x00\x00\r\x03\x00\x00E\x06\x00\x00.\x06\x00\x00,\x06\x00\x00\r\x03\x00\x00E\x06\x00\x00.\x06\x00\x00E\x06\x00\x00\r\x03\x00\x00E\x06\x00\x00,\x06\x00\x00.\x06\x00\x00\r\x03\x00\x00'
+  b'G\x06\x00\x00E\x06\x00\x00,\x06\x00\x00\r\x03\x00\x00G\x06\x00\x00E\x06\x00\x00E\x06\x00\x00\r\x03\x00\x00F\x06\x00\x00-\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x00F\x06\x00\x00-\x06\x00\x00I\x06\x00\x00\x0c\x03\x00\x00'
+  b'F\x06\x00\x00,\x06\x00\x00E\x06\x00\x00\r\x03\x00\x00F\x06\x00\x00,\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x00F\x06\x00\x00,\x06\x00\x00I\x06\x00\x00\x0c\x03\x00\x00F\x06\x00\x00E\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00'
+  b'F\x06\x00\x00E\x06\x00\x00I\x06\x00\x00\x0c\x03\x00\x00J\x06\x00\x00E\x06\x00\x00E\x06\x00\x00\r\x03\x00\x00J\x06\x00\x00E\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x00(\x06\x00\x00.\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00'
+  b'*\x06\x00\x00,\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00*\x06\x00\x00,\x06\x00\x00I\x06\x00\x00\x0c\x03\x00\x00*\x06\x00\x00.\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00*\x06\x00\x00.\x06\x00\x00I\x06\x00\x00\x0c\x03\x00\x00'
+  b'*\x06\x00\x00E\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00*\x06\x00\x00E\x06\x00\x00I\x06\x00\x00\x0c\x03\x00\x00,\x06\x00\x00E\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00,\x06\x00\x00-\x06\x00\x00I\x06\x00\x00\x0c\x03\x00\x00'
+  b',\x06\x00\x00E\x06\x00\x00I\x06\x00\x00\x0c\x03\x00\x003\x06\x00\x00.\x06\x00\x00I\x06\x00\x00\x0c\x03\x00\x005\x06\x00\x00-\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x004\x06\x00\x00-\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00'
+  b'6\x06\x00\x00-\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00D\x06\x00\x00,\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00D\x06\x00\x00E\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00J\x06\x00\x00-\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00'
+  b'J\x06\x00\x00,\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00J\x06\x00\x00E\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00E\x06\x00\x00E\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00B\x06\x00\x00E\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00'
+  b'F\x06\x00\x00-\x06\x00\x00J\x06\x00\x00\r\x03\x00\x00B\x06\x00\x00E\x06\x00\x00-\x06\x00\x00\r\x03\x00\x00D\x06\x00\x00-\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x009\x06\x00\x00E\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00'
+  b'C\x06\x00\x00E\x06\x00\x00J\x06\x00\x00\r\x03\x00\x00F\x06\x00\x00,\x06\x00\x00-\x06\x00\x00\x0c\x03\x00\x00E\x06\x00\x00.\x06\x00\x00J\x06\x00\x00\r\x03\x00\x00D\x06\x00\x00,\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x00'
+  b'C\x06\x00\x00E\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x00D\x06\x00\x00,\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x00F\x06\x00\x00,\x06\x00\x00-\x06\x00\x00\x0c\x03\x00\x00,\x06\x00\x00-\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00'
+  b'-\x06\x00\x00,\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00E\x06\x00\x00,\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00A\x06\x00\x00E\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00(\x06\x00\x00-\x06\x00\x00J\x06\x00\x00\r\x03\x00\x00'
+  b'C\x06\x00\x00E\x06\x00\x00E\x06\x00\x00\r\x03\x00\x009\x06\x00\x00,\x06\x00\x00E\x06\x00\x00\r\x03\x00\x005\x06\x00\x00E\x06\x00\x00E\x06\x00\x00\x0c\x03\x00\x003\x06\x00\x00.\x06\x00\x00J\x06\x00\x00\x0c\x03\x00\x00'
+  b"F\x06\x00\x00,\x06\x00\x00J\x06\x00\x00\x0b\x03\x00\x005\x06\x00\x00D\x06\x00\x00\xd2\x06\x00\x00\x0b\x03\x00\x00B\x06\x00\x00D\x06\x00\x00\xd2\x06\x00\x00\x0b\x04\x00\x00'\x06\x00\x00D\x06\x00\x00D\x06\x00\x00G\x06\x00\x00"
+  b"\x0b\x04\x00\x00'\x06\x00\x00C\x06\x00\x00(\x06\x00\x001\x06\x00\x00\x0b\x04\x00\x00E\x06\x00\x00-\x06\x00\x00E\x06\x00\x00/\x06\x00\x00\x0b\x04\x00\x005\x06\x00\x00D\x06\x00\x009\x06\x00\x00E\x06\x00\x00\x0b\x04\x00\x00"
+  b'1\x06\x00\x003\x06\x00\x00H\x06\x00\x00D\x06\x00\x00\x0b\x04\x00\x009\x06\x00\x00D\x06\x00\x00J\x06\x00\x00G\x06\x00\x00\x0b\x04\x00\x00H\x06\x00\x003\x06\x00\x00D\x06\x00\x00E\x06\x00\x00\x0b\x03\x00\x005\x06\x00\x00'
+  b"D\x06\x00\x00I\x06\x00\x00\x0b\x12\x00\x005\x06\x00\x00D\x06\x00\x00I\x06\x00\x00 \x00\x00\x00'\x06\x00\x00D\x06\x00\x00D\x06\x00\x00G\x06\x00\x00 \x00\x00\x009\x06\x00\x00D\x06\x00\x00J\x06\x00\x00G\x06\x00\x00"
+  b" \x00\x00\x00H\x06\x00\x003\x06\x00\x00D\x06\x00\x00E\x06\x00\x00\x0b\x08\x00\x00,\x06\x00\x00D\x06\x00\x00 \x00\x00\x00,\x06\x00\x00D\x06\x00\x00'\x06\x00\x00D\x06\x00\x00G\x06\x00\x00\x0b\x04\x00\x001\x06\x00\x00"
+  b"\xcc\x06\x00\x00'\x06\x00\x00D\x06\x00\x00\t\x01\x00\x00,\x00\x00\x00\t\x01\x00\x00\x010\x00\x00\t\x01\x00\x00\x020\x00\x00\t\x01\x00\x00:\x00\x00\x00\t\x01\x00\x00;\x00\x00\x00\t\x01\x00\x00!\x00\x00\x00\t\x01\x00\x00"
+  b'?\x00\x00\x00\t\x01\x00\x00\x160\x00\x00\t\x01\x00\x00\x170\x00\x00\t\x01\x00\x00& \x00\x00\t\x01\x00\x00% \x00\x00\t\x01\x00\x00\x14 \x00\x00\t\x01\x00\x00\x13 \x00\x00\t\x01\x00\x00_\x00\x00\x00\t\x01\x00\x00'
+  b'_\x00\x00\x00\t\x01\x00\x00(\x00\x00\x00\t\x01\x00\x00)\x00\x00\x00\t\x01\x00\x00{\x00\x00\x00\t\x01\x00\x00}\x00\x00\x00\t\x01\x00\x00\x140\x00\x00\t\x01\x00\x00\x150\x00\x00\t\x01\x00\x00\x100\x00\x00\t\x01\x00\x00'
+  b'\x110\x00\x00\t\x01\x00\x00\n0\x00\x00\t\x01\x00\x00\x0b0\x00\x00\t\x01\x00\x00\x080\x00\x00\t\x01\x00\x00\t0\x00\x00\t\x01\x00\x00\x0c0\x00\x00\t\x01\x00\x00\r0\x00\x00\t\x01\x00\x00\x0e0\x00\x00\t\x01\x00\x00'
+  b'\x0f0\x00\x00\t\x01\x00\x00[\x00\x00\x00\t\x01\x00\x00]\x00\x00\x00\x02\x01\x00\x00> \x00\x00\x02\x01\x00\x00> \x00\x00\x02\x01\x00\x00> \x00\x00\x02\x01\x00\x00> \x00\x00\x02\x01\x00\x00_\x00\x00\x00\x02\x01\x00\x00'
+  b'_\x00\x00\x00\x02\x01\x00\x00_\x00\x00\x00\x0f\x01\x00\x00,\x00\x00\x00\x0f\x01\x00\x00\x010\x00\x00\x0f\x01\x00\x00.\x00\x00\x00\x0f\x01\x00\x00;\x00\x00\x00\x0f\x01\x00\x00:\x00\x00\x00\x0f\x01\x00\x00?\x00\x00\x00\x0f\x01\x00\x00'
+  b'!\x00\x00\x00\x0f\x01\x00\x00\x14 \x00\x00\x0f\x01\x00\x00(\x00\x00\x00\x0f\x01\x00\x00)\x00\x00\x00\x0f\x01\x00\x00{\x00\x00\x00\x0f\x01\x00\x00}\x00\x00\x00\x0f\x01\x00\x00\x140\x00\x00\x0f\x01\x00\x00\x150\x00\x00\x0f\x01\x00\x00'
+  b'#\x00\x00\x00\x0f\x01\x00\x00&\x00\x00\x00\x0f\x01\x00\x00*\x00\x00\x00\x0f\x01\x00\x00+\x00\x00\x00\x0f\x01\x00\x00-\x00\x00\x00\x0f\x01\x00\x00<\x00\x00\x00\x0f\x01\x00\x00>\x00\x00\x00\x0f\x01\x00\x00=\x00\x00\x00\x0f\x01\x00\x00'
+  b'\\\x00\x00\x00\x0f\x01\x00\x00$\x00\x00\x00\x0f\x01\x00\x00%\x00\x00\x00\x0f\x01\x00\x00@\x00\x00\x00\x0b\x02\x00\x00 \x00\x00\x00K\x06\x00\x00\x0e\x02\x00\x00@\x06\x00\x00K\x06\x00\x00\x0b\x02\x00\x00 \x00\x00\x00L\x06\x00\x00'
+  b'\x0b\x02\x00\x00 \x00\x00\x00M\x06\x00\x00\x0b\x02\x00\x00 \x00\x00\x00N\x06\x00\x00\x0e\x02\x00\x00@\x06\x00\x00N\x06\x00\x00\x0b\x02\x00\x00 \x00\x00\x00O\x06\x00\x00\x0e\x02\x00\x00@\x06\x00\x00O\x06\x00\x00\x0b\x02\x00\x00'
+  b' \x00\x00\x00P\x06\x00\x00\x0e\x02\x00\x00@\x06\x00\x00P\x06\x00\x00\x0b\x02\x00\x00 \x00\x00\x00Q\x06\x00\x00\x0e\x02\x00\x00@\x06\x00\x00Q\x06\x00\x00\x0b\x02\x00\x00 \x00\x00\x00R\x06\x00\x00\x0e\x02\x00\x00@\x06\x00\x00'
+  b'R\x06\x00\x00\x0b\x01\x00\x00!\x06\x00\x00\x0b\x01\x00\x00"\x06\x00\x00\x0c\x01\x00\x00"\x06\x00\x00\x0b\x01\x00\x00#\x06\x00\x00\x0c\x01\x00\x00#\x06\x00\x00\x0b\x01\x00\x00$\x06\x00\x00\x0c\x01\x00\x00$\x06\x00\x00\x0b\x01\x00\x00'
+  b"%\x06\x00\x00\x0c\x01\x00\x00%\x06\x00\x00\x0b\x01\x00\x00&\x06\x00\x00\x0c\x01\x00\x00&\x06\x00\x00\r\x01\x00\x00&\x06\x00\x00\x0e\x01\x00\x00&\x06\x00\x00\x0b\x01\x00\x00'\x06\x00\x00\x0c\x01\x00\x00'\x06\x00\x00\x0b\x01\x00\x00"
+  b'(\x06\x00\x00\x0c\x01\x00\x00(\x06\x00\x00\r\x01\x00\x00(\x06\x00\x00\x0e\x01\x00\x00(\x06\x00\x00\x0b\x01\x00\x00)\x06\x00\x00\x0c\x01\x00\x00)\x06\x00\x00\x0b\x01\x00\x00*\x06\x00\x00\x0c\x01\x00\x00*\x06\x00\x00\r\x01\x00\x00'
+  b'*\x06\x00\x00\x0e\x01\x00\x00*\x06\x00\x00\x0b\x01\x00\x00+\x06\x00\x00\x0c\x01\x00\x00+\x06\x00\x00\r\x01\x00\x00+\x06\x00\x00\x0e\x01\x00\x00+\x06\x00\x00\x0b\x01\x00\x00,\x06\x00\x00\x0c\x01\x00\x00,\x06\x00\x00\r\x01\x00\x00'
+  b',\x06\x00\x00\x0e\x01\x00\x00,\x06\x00\x00\x0b\x01\x00\x00-\x06\x00\x00\x0c\x01\x00\x00-\x06\x00\x00\r\x01\x00\x00-\x06\x00\x00\x0e\x01\x00\x00-\x06\x00\x00\x0b\x01\x00\x00.\x06\x00\x00\x0c\x01\x00\x00.\x06\x00\x00\r\x01\x00\x00'
+  b'.\x06\x00\x00\x0e\x01\x00\x00.\x06\x00\x00\x0b\x01\x00\x00/\x06\x00\x00\x0c\x01\x00\x00/\x06\x00\x00\x0b\x01\x00\x000\x06\x00\x00\x0c\x01\x00\x000\x06\x00\x00\x0b\x01\x00\x001\x06\x00\x00\x0c\x01\x00\x001\x06\x00\x00\x0b\x01\x00\x00'
+  b'2\x06\x00\x00\x0c\x01\x00\x002\x06\x00\x00\x0b\x01\x00\x003\x06\x00\x00\x0c\x01\x00\x003\x06\x00\x00\r\x01\x00\x003\x06\x00\x00\x0e\x01\x00\x003\x06\x00\x00\x0b\x01\x00\x004\x06\x00\x00\x0c\x01\x00\x004\x06\x00\x00\r\x01\x00\x00'
+  b'4\x06\x00\x00\x0e\x01\x00\x004\x06\x00\x00\x0b\x01\x00\x005\x06\x00\x00\x0c\x01\x00\x005\x06\x00\x00\r\x01\x00\x005\x06\x00\x00\x0e\x01\x00\x005\x06\x00\x00\x0b\x01\x00\x006\x06\x00\x00\x0c\x01\x00\x006\x06\x00\x00\r\x01\x00\x00'
+  b'6\x06\x00\x00\x0e\x01\x00\x006\x06\x00\x00\x0b\x01\x00\x007\x06\x00\x00\x0c\x01\x00\x007\x06\x00\x00\r\x01\x00\x007\x06\x00\x00\x0e\x01\x00\x007\x06\x00\x00\x0b\x01\x00\x008\x06\x00\x00\x0c\x01\x00\x008\x06\x00\x00\r\x01\x00\x00'
+  b'8\x06\x00\x00\x0e\x01\x00\x008\x06\x00\x00\x0b\x01\x00\x009\x06\x00\x00\x0c\x01\x00\x009\x06\x00\x00\r\x01\x00\x009\x06\x00\x00\x0e\x01\x00\x009\x06\x00\x00\x0b\x01\x00\x00:\x06\x00\x00\x0c\x01\x00\x00:\x06\x00\x00\r\x01\x00\x00'
+  b':\x06\x00\x00\x0e\x01\x00\x00:\x06\x00\x00\x0b\x01\x00\x00A\x06\x00\x00\x0c\x01\x00\x00A\x06\x00\x00\r\x01\x00\x00A\x06\x00\x00\x0e\x01\x00\x00A\x06\x00\x00\x0b\x01\x00\x00B\x06\x00\x00\x0c\x01\x00\x00B\x06\x00\x00\r\x01\x00\x00'
+  b'B\x06\x00\x00\x0e\x01\x00\x00B\x06\x00\x00\x0b\x01\x00\x00C\x06\x00\x00\x0c\x01\x00\x00C\x06\x00\x00\r\x01\x00\x00C\x06\x00\x00\x0e\x01\x00\x00C\x06\x00\x00\x0b\x01\x00\x00D\x06\x00\x00\x0c\x01\x00\x00D\x06\x00\x00\r\x01\x00\x00'
+  b'D\x06\x00\x00\x0e\x01\x00\x00D\x06\x00\x00\x0b\x01\x00\x00E\x06\x00\x00\x0c\x01\x00\x00E\x06\x00\x00\r\x01\x00\x00E\x06\x00\x00\x0e\x01\x00\x00E\x06\x00\x00\x0b\x01\x00\x00F\x06\x00\x00\x0c\x01\x00\x00F\x06\x00\x00\r\x01\x00\x00'
+  b'F\x06\x00\x00\x0e\x01\x00\x00F\x06\x00\x00\x0b\x01\x00\x00G\x06\x00\x00\x0c\x01\x00\x00G\x06\x00\x00\r\x01\x00\x00G\x06\x00\x00\x0e\x01\x00\x00G\x06\x00\x00\x0b\x01\x00\x00H\x06\x00\x00\x0c\x01\x00\x00H\x06\x00\x00\x0b\x01\x00\x00'
+  b'I\x06\x00\x00\x0c\x01\x00\x00I\x06\x00\x00\x0b\x01\x00\x00J\x06\x00\x00\x0c\x01\x00\x00J\x06\x00\x00\r\x01\x00\x00J\x06\x00\x00\x0e\x01\x00\x00J\x06\x00\x00\x0b\x02\x00\x00D\x06\x00\x00"\x06\x00\x00\x0c\x02\x00\x00D\x06\x00\x00'
+  b'"\x06\x00\x00\x0b\x02\x00\x00D\x06\x00\x00#\x06\x00\x00\x0c\x02\x00\x00D\x06\x00\x00#\x06\x00\x00\x0b\x02\x00\x00D\x06\x00\x00%\x06\x00\x00\x0c\x02\x00\x00D\x06\x00\x00%\x06\x00\x00\x0b\x02\x00\x00D\x06\x00\x00\'\x06\x00\x00'
+  b'\x0c\x02\x00\x00D\x06\x00\x00\'\x06\x00\x00\x08\x01\x00\x00!\x00\x00\x00\x08\x01\x00\x00"\x00\x00\x00\x08\x01\x00\x00#\x00\x00\x00\x08\x01\x00\x00$\x00\x00\x00\x08\x01\x00\x00%\x00\x00\x00\x08\x01\x00\x00&\x00\x00\x00\x08\x01\x00\x00'
+  b"'\x00\x00\x00\x08\x01\x00\x00(\x00\x00\x00\x08\x01\x00\x00)\x00\x00\x00\x08\x01\x00\x00*\x00\x00\x00\x08\x01\x00\x00+\x00\x00\x00\x08\x01\x00\x00,\x00\x00\x00\x08\x01\x00\x00-\x00\x00\x00\x08\x01\x00\x00.\x00\x00\x00\x08\x01\x00\x00"
+  b'/\x00\x00\x00\x08\x01\x00\x000\x00\x00\x00\x08\x01\x00\x001\x00\x00\x00\x08\x01\x00\x002\x00\x00\x00\x08\x01\x00\x003\x00\x00\x00\x08\x01\x00\x004\x00\x00\x00\x08\x01\x00\x005\x00\x00\x00\x08\x01\x00\x006\x00\x00\x00\x08\x01\x00\x00'
+  b'7\x00\x00\x00\x08\x01\x00\x008\x00\x00\x00\x08\x01\x00\x009\x00\x00\x00\x08\x01\x00\x00:\x00\x00\x00\x08\x01\x00\x00;\x00\x00\x00\x08\x01\x00\x00<\x00\x00\x00\x08\x01\x00\x00=\x00\x00\x00\x08\x01\x00\x00>\x00\x00\x00\x08\x01\x00\x00'
+  b'?\x00\x00\x00\x08\x01\x00\x00@\x00\x00\x00\x08\x01\x00\x00A\x00\x00\x00\x08\x01\x00\x00B\x00\x00\x00\x08\x01\x00\x00C\x00\x00\x00\x08\x01\x00\x00D\x00\x00\x00\x08\x01\x00\x00E\x00\x00\x00\x08\x01\x00\x00F\x00\x00\x00\x08\x01\x00\x00'
+  b'G\x00\x00\x00\x08\x01\x00\x00H\x00\x00\x00\x08\x01\x00\x00I\x00\x00\x00\x08\x01\x00\x00J\x00\x00\x00\x08\x01\x00\x00K\x00\x00\x00\x08\x01\x00\x00L\x00\x00\x00\x08\x01\x00\x00M\x00\x00\x00\x08\x01\x00\x00N\x00\x00\x00\x08\x01\x00\x00'
+  b'O\x00\x00\x00\x08\x01\x00\x00P\x00\x00\x00\x08\x01\x00\x00Q\x00\x00\x00\x08\x01\x00\x00R\x00\x00\x00\x08\x01\x00\x00S\x00\x00\x00\x08\x01\x00\x00T\x00\x00\x00\x08\x01\x00\x00U\x00\x00\x00\x08\x01\x00\x00V\x00\x00\x00\x08\x01\x00\x00'
+  b'W\x00\x00\x00\x08\x01\x00\x00X\x00\x00\x00\x08\x01\x00\x00Y\x00\x00\x00\x08\x01\x00\x00Z\x00\x00\x00\x08\x01\x00\x00[\x00\x00\x00\x08\x01\x00\x00\\\x00\x00\x00\x08\x01\x00\x00]\x00\x00\x00\x08\x01\x00\x00^\x00\x00\x00\x08\x01\x00\x00'
+  b'_\x00\x00\x00\x08\x01\x00\x00`\x00\x00\x00\x08\x01\x00\x00a\x00\x00\x00\x08\x01\x00\x00b\x00\x00\x00\x08\x01\x00\x00c\x00\x00\x00\x08\x01\x00\x00d\x00\x00\x00\x08\x01\x00\x00e\x00\x00\x00\x08\x01\x00\x00f\x00\x00\x00\x08\x01\x00\x00'
+  b'g\x00\x00\x00\x08\x01\x00\x00h\x00\x00\x00\x08\x01\x00\x00i\x00\x00\x00\x08\x01\x00\x00j\x00\x00\x00\x08\x01\x00\x00k\x00\x00\x00\x08\x01\x00\x00l\x00\x00\x00\x08\x01\x00\x00m\x00\x00\x00\x08\x01\x00\x00n\x00\x00\x00\x08\x01\x00\x00'
+  b'o\x00\x00\x00\x08\x01\x00\x00p\x00\x00\x00\x08\x01\x00\x00q\x00\x00\x00\x08\x01\x00\x00r\x00\x00\x00\x08\x01\x00\x00s\x00\x00\x00\x08\x01\x00\x00t\x00\x00\x00\x08\x01\x00\x00u\x00\x00\x00\x08\x01\x00\x00v\x00\x00\x00\x08\x01\x00\x00'
+  b'w\x00\x00\x00\x08\x01\x00\x00x\x00\x00\x00\x08\x01\x00\x00y\x00\x00\x00\x08\x01\x00\x00z\x00\x00\x00\x08\x01\x00\x00{\x00\x00\x00\x08\x01\x00\x00|\x00\x00\x00\x08\x01\x00\x00}\x00\x00\x00\x08\x01\x00\x00~\x00\x00\x00\x08\x01\x00\x00'
+  b'\x85)\x00\x00\x08\x01\x00\x00\x86)\x00\x00\x10\x01\x00\x00\x020\x00\x00\x10\x01\x00\x00\x0c0\x00\x00\x10\x01\x00\x00\r0\x00\x00\x10\x01\x00\x00\x010\x00\x00\x10\x01\x00\x00\xfb0\x00\x00\x10\x01\x00\x00\xf20\x00\x00\x10\x01\x00\x00'
+  b'\xa10\x00\x00\x10\x01\x00\x00\xa30\x00\x00\x10\x01\x00\x00\xa50\x00\x00\x10\x01\x00\x00\xa70\x00\x00\x10\x01\x00\x00\xa90\x00\x00\x10\x01\x00\x00\xe30\x00\x00\x10\x01\x00\x00\xe50\x00\x00\x10\x01\x00\x00\xe70\x00\x00\x10\x01\x00\x00'
+  b'\xc30\x00\x00\x10\x01\x00\x00\xfc0\x00\x00\x10\x01\x00\x00\xa20\x00\x00\x10\x01\x00\x00\xa40\x00\x00\x10\x01\x00\x00\xa60\x00\x00\x10\x01\x00\x00\xa80\x00\x00\x10\x01\x00\x00\xaa0\x00\x00\x10\x01\x00\x00\xab0\x00\x00\x10\x01\x00\x00'
+  b'\xad0\x00\x00\x10\x01\x00\x00\xaf0\x00\x00\x10\x01\x00\x00\xb10\x00\x00\x10\x01\x00\x00\xb30\x00\x00\x10\x01\x00\x00\xb50\x00\x00\x10\x01\x00\x00\xb70\x00\x00\x10\x01\x00\x00\xb90\x00\x00\x10\x01\x00\x00\xbb0\x00\x00\x10\x01\x00\x00'
+  b'\xbd0\x00\x00\x10\x01\x00\x00\xbf0\x00\x00\x10\x01\x00\x00\xc10\x00\x00\x10\x01\x00\x00\xc40\x00\x00\x10\x01\x00\x00\xc60\x00\x00\x10\x01\x00\x00\xc80\x00\x00\x10\x01\x00\x00\xca0\x00\x00\x10\x01\x00\x00\xcb0\x00\x00\x10\x01\x00\x00'
+  b'\xcc0\x00\x00\x10\x01\x00\x00\xcd0\x00\x00\x10\x01\x00\x00\xce0\x00\x00\x10\x01\x00\x00\xcf0\x00\x00\x10\x01\x00\x00\xd20\x00\x00\x10\x01\x00\x00\xd50\x00\x00\x10\x01\x00\x00\xd80\x00\x00\x10\x01\x00\x00\xdb0\x00\x00\x10\x01\x00\x00'
+  b'\xde0\x00\x00\x10\x01\x00\x00\xdf0\x00\x00\x10\x01\x00\x00\xe00\x00\x00\x10\x01\x00\x00\xe10\x00\x00\x10\x01\x00\x00\xe20\x00\x00\x10\x01\x00\x00\xe40\x00\x00\x10\x01\x00\x00\xe60\x00\x00\x10\x01\x00\x00\xe80\x00\x00\x10\x01\x00\x00'
+  b'\xe90\x00\x00\x10\x01\x00\x00\xea0\x00\x00\x10\x01\x00\x00\xeb0\x00\x00\x10\x01\x00\x00\xec0\x00\x00\x10\x01\x00\x00\xed0\x00\x00\x10\x01\x00\x00\xef0\x00\x00\x10\x01\x00\x00\xf30\x00\x00\x10\x01\x00\x00\x990\x00\x00\x10\x01\x00\x00'
+  b'\x9a0\x00\x00\x10\x01\x00\x00d1\x00\x00\x10\x01\x00\x0011\x00\x00\x10\x01\x00\x0021\x00\x00\x10\x01\x00\x0031\x00\x00\x10\x01\x00\x0041\x00\x00\x10\x01\x00\x0051\x00\x00\x10\x01\x00\x0061\x00\x00\x10\x01\x00\x00'
+  b'71\x00\x00\x10\x01\x00\x0081\x00\x00\x10\x01\x00\x0091\x00\x00\x10\x01\x00\x00:1\x00\x00\x10\x01\x00\x00;1\x00\x00\x10\x01\x00\x00<1\x00\x00\x10\x01\x00\x00=1\x00\x00\x10\x01\x00\x00>1\x00\x00\x10\x01\x00\x00'
+  b'?1\x00\x00\x10\x01\x00\x00@1\x00\x00\x10\x01\x00\x00A1\x00\x00\x10\x01\x00\x00B1\x00\x00\x10\x01\x00\x00C1\x00\x00\x10\x01\x00\x00D1\x00\x00\x10\x01\x00\x00E1\x00\x00\x10\x01\x00\x00F1\x00\x00\x10\x01\x00\x00'
+  b'G1\x00\x00\x10\x01\x00\x00H1\x00\x00\x10\x01\x00\x00I1\x00\x00\x10\x01\x00\x00J1\x00\x00\x10\x01\x00\x00K1\x00\x00\x10\x01\x00\x00L1\x00\x00\x10\x01\x00\x00M1\x00\x00\x10\x01\x00\x00N1\x00\x00\x10\x01\x00\x00'
+  b'O1\x00\x00\x10\x01\x00\x00P1\x00\x00\x10\x01\x00\x00Q1\x00\x00\x10\x01\x00\x00R1\x00\x00\x10\x01\x00\x00S1\x00\x00\x10\x01\x00\x00T1\x00\x00\x10\x01\x00\x00U1\x00\x00\x10\x01\x00\x00V1\x00\x00\x10\x01\x00\x00'
+  b'W1\x00\x00\x10\x01\x00\x00X1\x00\x00\x10\x01\x00\x00Y1\x00\x00\x10\x01\x00\x00Z1\x00\x00\x10\x01\x00\x00[1\x00\x00\x10\x01\x00\x00\\1\x00\x00\x10\x01\x00\x00]1\x00\x00\x10\x01\x00\x00^1\x00\x00\x10\x01\x00\x00'
+  b'_1\x00\x00\x10\x01\x00\x00`1\x00\x00\x10\x01\x00\x00a1\x00\x00\x10\x01\x00\x00b1\x00\x00\x10\x01\x00\x00c1\x00\x00\x08\x01\x00\x00\xa2\x00\x00\x00\x08\x01\x00\x00\xa3\x00\x00\x00\x08\x01\x00\x00\xac\x00\x00\x00\x08\x01\x00\x00'
+  b'\xaf\x00\x00\x00\x08\x01\x00\x00\xa6\x00\x00\x00\x08\x01\x00\x00\xa5\x00\x00\x00\x08\x01\x00\x00\xa9 \x00\x00\x10\x01\x00\x00\x02%\x00\x00\x10\x01\x00\x00\x90!\x00\x00\x10\x01\x00\x00\x91!\x00\x00\x10\x01\x00\x00\x92!\x00\x00\x10\x01\x00\x00'
+  b'\x93!\x00\x00\x10\x01\x00\x00\xa0%\x00\x00\x10\x01\x00\x00\xcb%\x00\x00\x00\x02\x00\x00\x99\x10\x01\x00\xba\x10\x01\x00\x00\x02\x00\x00\x9b\x10\x01\x00\xba\x10\x01\x00\x00\x02\x00\x00\xa5\x10\x01\x00\xba\x10\x01\x00\x00\x02\x00\x001\x11\x01\x00'
+  b"'\x11\x01\x00\x00\x02\x00\x002\x11\x01\x00'\x11\x01\x00\x00\x02\x00\x00G\x13\x01\x00>\x13\x01\x00\x00\x02\x00\x00G\x13\x01\x00W\x13\x01\x00\x00\x02\x00\x00\xb9\x14\x01\x00\xba\x14\x01\x00\x00\x02\x00\x00\xb9\x14\x01\x00\xb0\x14\x01\x00"
+  b'\x00\x02\x00\x00\xb9\x14\x01\x00\xbd\x14\x01\x00\x00\x02\x00\x00\xb8\x15\x01\x00\xaf\x15\x01\x00\x00\x02\x00\x00\xb9\x15\x01\x00\xaf\x15\x01\x00\x00\x02\x00\x005\x19\x01\x000\x19\x01\x00\x00\x02\x00\x00W\xd1\x01\x00e\xd1\x01\x00\x00\x02\x00\x00'
+  b'X\xd1\x01\x00e\xd1\x01\x00\x00\x02\x00\x00_\xd1\x01\x00n\xd1\x01\x00\x00\x02\x00\x00_\xd1\x01\x00o\xd1\x01\x00\x00\x02\x00\x00_\xd1\x01\x00p\xd1\x01\x00\x00\x02\x00\x00_\xd1\x01\x00q\xd1\x01\x00\x00\x02\x00\x00_\xd1\x01\x00'
+  b'r\xd1\x01\x00\x00\x02\x00\x00\xb9\xd1\x01\x00e\xd1\x01\x00\x00\x02\x00\x00\xba\xd1\x01\x00e\xd1\x01\x00\x00\x02\x00\x00\xbb\xd1\x01\x00n\xd1\x01\x00\x00\x02\x00\x00\xbc\xd1\x01\x00n\xd1\x01\x00\x00\x02\x00\x00\xbb\xd1\x01\x00o\xd1\x01\x00'
+  b'\x00\x02\x00\x00\xbc\xd1\x01\x00o\xd1\x01\x00\x06\x01\x00\x00A\x00\x00\x00\x06\x01\x00\x00B\x00\x00\x00\x06\x01\x00\x00C\x00\x00\x00\x06\x01\x00\x00D\x00\x00\x00\x06\x01\x00\x00E\x00\x00\x00\x06\x01\x00\x00F\x00\x00\x00\x06\x01\x00\x00'
+  b'G\x00\x00\x00\x06\x01\x00\x00H\x00\x00\x00\x06\x01\x00\x00I\x00\x00\x00\x06\x01\x00\x00J\x00\x00\x00\x06\x01\x00\x00K\x00\x00\x00\x06\x01\x00\x00L\x00\x00\x00\x06\x01\x00\x00M\x00\x00\x00\x06\x01\x00\x00N\x00\x00\x00\x06\x01\x00\x00'
+  b'O\x00\x00\x00\x06\x01\x00\x00P\x00\x00\x00\x06\x01\x00\x00Q\x00\x00\x00\x06\x01\x00\x00R\x00\x00\x00\x06\x01\x00\x00S\x00\x00\x00\x06\x01\x00\x00T\x00\x00\x00\x06\x01\x00\x00U\x00\x00\x00\x06\x01\x00\x00V\x00\x00\x00\x06\x01\x00\x00'
+  b'W\x00\x00\x00\x06\x01\x00\x00X\x00\x00\x00\x06\x01\x00\x00Y\x00\x00\x00\x06\x01\x00\x00Z\x00\x00\x00\x06\x01\x00\x00a\x00\x00\x00\x06\x01\x00\x00b\x00\x00\x00\x06\x01\x00\x00c\x00\x00\x00\x06\x01\x00\x00d\x00\x00\x00\x06\x01\x00\x00'
+  b'e\x00\x00\x00\x06\x01\x00\x00f\x00\x00\x00\x06\x01\x00\x00g\x00\x00\x00\x06\x01\x00\x00h\x00\x00\x00\x06\x01\x00\x00i\x00\x00\x00\x06\x01\x00\x00j\x00\x00\x00\x06\x01\x00\x00k\x00\x00\x00\x06\x01\x00\x00l\x00\x00\x00\x06\x01\x00\x00'
+  b'm\x00\x00\x00\x06\x01\x00\x00n\x00\x00\x00\x06\x01\x00\x00o\x00\x00\x00\x06\x01\x00\x00p\x00\x00\x00\x06\x01\x00\x00q\x00\x00\x00\x06\x01\x00\x00r\x00\x00\x00\x06\x01\x00\x00s\x00\x00\x00\x06\x01\x00\x00t\x00\x00\x00\x06\x01\x00\x00'
+  b'u\x00\x00\x00\x06\x01\x00\x00v\x00\x00\x00\x06\x01\x00\x00w\x00\x00\x00\x06\x01\x00\x00x\x00\x00\x00\x06\x01\x00\x00y\x00\x00\x00\x06\x01\x00\x00z\x00\x00\x00\x06\x01\x00\x00A\x00\x00\x00\x06\x01\x00\x00B\x00\x00\x00\x06\x01\x00\x00'
+  b'C\x00\x00\x00\x06\x01\x00\x00D\x00\x00\x00\x06\x01\x00\x00E\x00\x00\x00\x06\x01\x00\x00F\x00\x00\x00\x06\x01\x00\x00G\x00\x00\x00\x06\x01\x00\x00H\x00\x00\x00\x06\x01\x00\x00I\x00\x00\x00\x06\x01\x00\x00J\x00\x00\x00\x06\x01\x00\x00'
+  b'K\x00\x00\x00\x06\x01\x00\x00L\x00\x00\x00\x06\x01\x00\x00M\x00\x00\x00\x06\x01\x00\x00N\x00\x00\x00\x06\x01\x00\x00O\x00\x00\x00\x06\x01\x00\x00P\x00\x00\x00\x06\x01\x00\x00Q\x00\x00\x00\x06\x01\x00\x00R\x00\x00\x00\x06\x01\x00\x00'
+  b'S\x00\x00\x00\x06\x01\x00\x00T\x00\x00\x00\x06\x01\x00\x00U\x00\x00\x00\x06\x01\x00\x00V\x00\x00\x00\x06\x01\x00\x00W\x00\x00\x00\x06\x01\x00\x00X\x00\x00\x00\x06\x01\x00\x00Y\x00\x00\x00\x06\x01\x00\x00Z\x00\x00\x00\x06\x01\x00\x00'
+  b'a\x00\x00\x00\x06\x01\x00\x00b\x00\x00\x00\x06\x01\x00\x00c\x00\x00\x00\x06\x01\x00\x00d\x00\x00\x00\x06\x01\x00\x00e\x00\x00\x00\x06\x01\x00\x00f\x00\x00\x00\x06\x01\x00\x00g\x00\x00\x00\x06\x01\x00\x00i\x00\x00\x00\x06\x01\x00\x00'
+  b'j\x00\x00\x00\x06\x01\x00\x00k\x00\x00\x00\x06\x01\x00\x00l\x00\x00\x00\x06\x01\x00\x00m\x00\x00\x00\x06\x01\x00\x00n\x00\x00\x00\x06\x01\x00\x00o\x00\x00\x00\x06\x01\x00\x00p\x00\x00\x00\x06\x01\x00\x00q\x00\x00\x00\x06\x01\x00\x00'
+  b'r\x00\x00\x00\x06\x01\x00\x00s\x00\x00\x00\x06\x01\x00\x00t\x00\x00\x00\x06\x01\x00\x00u\x00\x00\x00\x06\x01\x00\x00v\x00\x00\x00\x06\x01\x00\x00w\x00\x00\x00\x06\x01\x00\x00x\x00\x00\x00\x06\x01\x00\x00y\x00\x00\x00\x06\x01\x00\x00'
+  b'z\x00\x00\x00\x06\x01\x00\x00A\x00\x00\x00\x06\x01\x00\x00B\x00\x00\x00\x06\x01\x00\x00C\x00\x00\x00\x06\x01\x00\x00D\x00\x00\x00\x06\x01\x00\x00E\x00\x00\x00\x06\x01\x00\x00F\x00\x00\x00\x06\x01\x00\x00G\x00\x00\x00\x06\x01\x00\x00'
+  b'H\x00\x00\x00\x06\x01\x00\x00I\x00\x00\x00\x06\x01\x00\x00J\x00\x00\x00\x06\x01\x00\x00K\x00\x00\x00\x06\x01\x00\x00L\x00\x00\x00\x06\x01\x00\x00M\x00\x00\x00\x06\x01\x00\x00N\x00\x00\x00\x06\x01\x00\x00O\x00\x00\x00\x06\x01\x00\x00'
+  b'P\x00\x00\x00\x06\x01\x00\x00Q\x00\x00\x00\x06\x01\x00\x00R\x00\x00\x00\x06\x01\x00\x00S\x00\x00\x00\x06\x01\x00\x00T\x00\x00\x00\x06\x01\x00\x00U\x00\x00\x00\x06\x01\x00\x00V\x00\x00\x00\x06\x01\x00\x00W\x00\x00\x00\x06\x01\x00\x00'
+  b'X\x00\x00\x00\x06\x01\x00\x00Y\x00\x00\x00\x06\x01\x00\x00Z\x00\x00\x00\x06\x01\x00\x00a\x00\x00\x00\x06\x01\x00\x00b\x00\x00\x00\x06\x01\x00\x00c\x00\x00\x00\x06\x01\x00\x00d\x00\x00\x00\x06\x01\x00\x00e\x00\x00\x00\x06\x01\x00\x00'
+  b'f\x00\x00\x00\x06\x01\x00\x00g\x00\x00\x00\x06\x01\x00\x00h\x00\x00\x00\x06\x01\x00\x00i\x00\x00\x00\x06\x01\x00\x00j\x00\x00\x00\x06\x01\x00\x00k\x00\x00\x00\x06\x01\x00\x00l\x00\x00\x00\x06\x01\x00\x00m\x00\x00\x00\x06\x01\x00\x00'
+  b'n\x00\x00\x00\x06\x01\x00\x00o\x00\x00\x00\x06\x01\x00\x00p\x00\x00\x00\x06\x01\x00\x00q\x00\x00\x00\x06\x01\x00\x00r\x00\x00\x00\x06\x01\x00\x00s\x00\x00\x00\x06\x01\x00\x00t\x00\x00\x00\x06\x01\x00\x00u\x00\x00\x00\x06\x01\x00\x00'
+  b'v\x00\x00\x00\x06\x01\x00\x00w\x00\x00\x00\x06\x01\x00\x00x\x00\x00\x00\x06\x01\x00\x00y\x00\x00\x00\x06\x01\x00\x00z\x00\x00\x00\x06\x01\x00\x00A\x00\x00\x00\x06\x01\x00\x00C\x00\x00\x00\x06\x01\x00\x00D\x00\x00\x00\x06\x01\x00\x00'
+  b'G\x00\x00\x00\x06\x01\x00\x00J\x00\x00\x00\x06\x01\x00\x00K\x00\x00\x00\x06\x01\x00\x00N\x00\x00\x00\x06\x01\x00\x00O\x00\x00\x00\x06\x01\x00\x00P\x00\x00\x00\x06\x01\x00\x00Q\x00\x00\x00\x06\x01\x00\x00S\x00\x00\x00\x06\x01\x00\x00'
+  b'T\x00\x00\x00\x06\x01\x00\x00U\x00\x00\x00\x06\x01\x00\x00V\x00\x00\x00\x06\x01\x00\x00W\x00\x00\x00\x06\x01\x00\x00X\x00\x00\x00\x06\x01\x00\x00Y\x00\x00\x00\x06\x01\x00\x00Z\x00\x00\x00\x06\x01\x00\x00a\x00\x00\x00\x06\x01\x00\x00'
+  b'b\x00\x00\x00\x06\x01\x00\x00c\x00\x00\x00\x06\x01\x00\x00d\x00\x00\x00\x06\x01\x00\x00f\x00\x00\x00\x06\x01\x00\x00h\x00\x00\x00\x06\x01\x00\x00i\x00\x00\x00\x06\x01\x00\x00j\x00\x00\x00\x06\x01\x00\x00k\x00\x00\x00\x06\x01\x00\x00'
+  b'l\x00\x00\x00\x06\x01\x00\x00m\x00\x00\x00\x06\x01\x00\x00n\x00\x00\x00\x06\x01\x00\x00p\x00\x00\x00\x06\x01\x00\x00q\x00\x00\x00\x06\x01\x00\x00r\x00\x00\x00\x06\x01\x00\x00s\x00\x00\x00\x06\x01\x00\x00t\x00\x00\x00\x06\x01\x00\x00'
+  b'u\x00\x00\x00\x06\x01\x00\x00v\x00\x00\x00\x06\x01\x00\x00w\x00\x00\x00\x06\x01\x00\x00x\x00\x00\x00\x06\x01\x00\x00y\x00\x00\x00\x06\x01\x00\x00z\x00\x00\x00\x06\x01\x00\x00A\x00\x00\x00\x06\x01\x00\x00B\x00\x00\x00\x06\x01\x00\x00'
+  b'C\x00\x00\x00\x06\x01\x00\x00D\x00\x00\x00\x06\x01\x00\x00E\x00\x00\x00\x06\x01\x00\x00F\x00\x00\x00\x06\x01\x00\x00G\x00\x00\x00\x06\x01\x00\x00H\x00\x00\x00\x06\x01\x00\x00I\x00\x00\x00\x06\x01\x00\x00J\x00\x00\x00\x06\x01\x00\x00'
+  b'K\x00\x00\x00\x06\x01\x00\x00L\x00\x00\x00\x06\x01\x00\x00M\x00\x00\x00\x06\x01\x00\x00N\x00\x00\x00\x06\x01\x00\x00O\x00\x00\x00\x06\x01\x00\x00P\x00\x00\x00\x06\x01\x00\x00Q\x00\x00\x00\x06\x01\x00\x00R\x00\x00\x00\x06\x01\x00\x00'
+  b'S\x00\x00\x00\x06\x01\x00\x00T\x00\x00\x00\x06\x01\x00\x00U\x00\x00\x00\x06\x01\x00\x00V\x00\x00\x00\x06\x01\x00\x00W\x00\x00\x00\x06\x01\x00\x00X\x00\x00\x00\x06\x01\x00\x00Y\x00\x00\x00\x06\x01\x00\x00Z\x00\x00\x00\x06\x01\x00\x00'
+  b'a\x00\x00\x00\x06\x01\x00\x00b\x00\x00\x00\x06\x01\x00\x00c\x00\x00\x00\x06\x01\x00\x00d\x00\x00\x00\x06\x01\x00\x00e\x00\x00\x00\x06\x01\x00\x00f\x00\x00\x00\x06\x01\x00\x00g\x00\x00\x00\x06\x01\x00\x00h\x00\x00\x00\x06\x01\x00\x00'
+  b'i\x00\x00\x00\x06\x01\x00\x00j\x00\x00\x00\x06\x01\x00\x00k\x00\x00\x00\x06\x01\x00\x00l\x00\x00\x00\x06\x01\x00\x00m\x00\x00\x00\x06\x01\x00\x00n\x00\x00\x00\x06\x01\x00\x00o\x00\x00\x00\x06\x01\x00\x00p\x00\x00\x00\x06\x01\x00\x00'
+  b'q\x00\x00\x00\x06\x01\x00\x00r\x00\x00\x00\x06\x01\x00\x00s\x00\x00\x00\x06\x01\x00\x00t\x00\x00\x00\x06\x01\x00\x00u\x00\x00\x00\x06\x01\x00\x00v\x00\x00\x00\x06\x01\x00\x00w\x00\x00\x00\x06\x01\x00\x00x\x00\x00\x00\x06\x01\x00\x00'
+  b'y\x00\x00\x00\x06\x01\x00\x00z\x00\x00\x00\x06\x01\x00\x00A\x00\x00\x00\x06\x01\x00\x00B\x00\x00\x00\x06\x01\x00\x00D\x00\x00\x00\x06\x01\x00\x00E\x00\x00\x00\x06\x01\x00\x00F\x00\x00\x00\x06\x01\x00\x00G\x00\x00\x00\x06\x01\x00\x00'
+  b'J\x00\x00\x00\x06\x01\x00\x00K\x00\x00\x00\x06\x01\x00\x00L\x00\x00\x00\x06\x01\x00\x00M\x00\x00\x00\x06\x01\x00\x00N\x00\x00\x00\x06\x01\x00\x00O\x00\x00\x00\x06\x01\x00\x00P\x00\x00\x00\x06\x01\x00\x00Q\x00\x00\x00\x06\x01\x00\x00'
+  b'S\x00\x00\x00\x06\x01\x00\x00T\x00\x00\x00\x06\x01\x00\x00U\x00\x00\x00\x06\x01\x00\x00V\x00\x00\x00\x06\x01\x00\x00W\x00\x00\x00\x06\x01\x00\x00X\x00\x00\x00\x06\x01\x00\x00Y\x00\x00\x00\x06\x01\x00\x00a\x00\x00\x00\x06\x01\x00\x00'
+  b'b\x00\x00\x00\x06\x01\x00\x00c\x00\x00\x00\x06\x01\x00\x00d\x00\x00\x00\x06\x01\x00\x00e\x00\x00\x00\x06\x01\x00\x00f\x00\x00\x00\x06\x01\x00\x00g\x00\x00\x00\x06\x01\x00\x00h\x00\x00\x00\x06\x01\x00\x00i\x00\x00\x00\x06\x01\x00\x00'
+  b'j\x00\x00\x00\x06\x01\x00\x00k\x00\x00\x00\x06\x01\x00\x00l\x00\x00\x00\x06\x01\x00\x00m\x00\x00\x00\x06\x01\x00\x00n\x00\x00\x00\x06\x01\x00\x00o\x00\x00\x00\x06\x01\x00\x00p\x00\x00\x00\x06\x01\x00\x00q\x00\x00\x00\x06\x01\x00\x00'
+  b'r\x00\x00\x00\x06\x01\x00\x00s\x00\x00\x00\x06\x01\x00\x00t\x00\x00\x00\x06\x01\x00\x00u\x00\x00\x00\x06\x01\x00\x00v\x00\x00\x00\x06\x01\x00\x00w\x00\x00\x00\x06\x01\x00\x00x\x00\x00\x00\x06\x01\x00\x00y\x00\x00\x00\x06\x01\x00\x00'
+  b'z\x00\x00\x00\x06\x01\x00\x00A\x00\x00\x00\x06\x01\x00\x00B\x00\x00\x00\x06\x01\x00\x00D\x00\x00\x00\x06\x01\x00\x00E\x00\x00\x00\x06\x01\x00\x00F\x00\x00\x00\x06\x01\x00\x00G\x00\x00\x00\x06\x01\x00\x00I\x00\x00\x00\x06\x01\x00\x00'
+  b'J\x00\x00\x00\x06\x01\x00\x00K\x00\x00\x00\x06\x01\x00\x00L\x00\x00\x00\x06\x01\x00\x00M\x00\x00\x00\x06\x01\x00\x00O\x00\x00\x00\x06\x01\x00\x00S\x00\x00\x00\x06\x01\x00\x00T\x00\x00\x00\x06\x01\x00\x00U\x00\x00\x00\x06\x01\x00\x00'
+  b'V\x00\x00\x00\x06\x01\x00\x00W\x00\x00\x00\x06\x01\x00\x00X\x00\x00\x00\x06\x01\x00\x00Y\x00\x00\x00\x06\x01\x00\x00a\x00\x00\x00\x06\x01\x00\x00b\x00\x00\x00\x06\x01\x00\x00c\x00\x00\x00\x06\x01\x00\x00d\x00\x00\x00\x06\x01\x00\x00'
+  b'e\x00\x00\x00\x06\x01\x00\x00f\x00\x00\x00\x06\x01\x00\x00g\x00\x00\x00\x06\x01\x00\x00h\x00\x00\x00\x06\x01\x00\x00i\x00\x00\x00\x06\x01\x00\x00j\x00\x00\x00\x06\x01\x00\x00k\x00\x00\x00\x06\x01\x00\x00l\x00\x00\x00\x06\x01\x00\x00'
+  b'm\x00\x00\x00\x06\x01\x00\x00n\x00\x00\x00\x06\x01\x00\x00o\x00\x00\x00\x06\x01\x00\x00p\x00\x00\x00\x06\x01\x00\x00q\x00\x00\x00\x06\x01\x00\x00r\x00\x00\x00\x06\x01\x00\x00s\x00\x00\x00\x06\x01\x00\x00t\x00\x00\x00\x06\x01\x00\x00'
+  b'u\x00\x00\x00\x06\x01\x00\x00v\x00\x00\x00\x06\x01\x00\x00w\x00\x00\x00\x06\x01\x00\x00x\x00\x00\x00\x06\x01\x00\x00y\x00\x00\x00\x06\x01\x00\x00z\x00\x00\x00\x06\x01\x00\x00A\x00\x00\x00\x06\x01\x00\x00B\x00\x00\x00\x06\x01\x00\x00'
+  b'C\x00\x00\x00\x06\x01\x00\x00D\x00\x00\x00\x06\x01\x00\x00E\x00\x00\x00\x06\x01\x00\x00F\x00\x00\x00\x06\x01\x00\x00G\x00\x00\x00\x06\x01\x00\x00H\x00\x00\x00\x06\x01\x00\x00I\x00\x00\x00\x06\x01\x00\x00J\x00\x00\x00\x06\x01\x00\x00'
+  b'K\x00\x00\x00\x06\x01\x00\x00L\x00\x00\x00\x06\x01\x00\x00M\x00\x00\x00\x06\x01\x00\x00N\x00\x00\x00\x06\x01\x00\x00O\x00\x00\x00\x06\x01\x00\x00P\x00\x00\x00\x06\x01\x00\x00Q\x00\x00\x00\x06\x01\x00\x00R\x00\x00\x00\x06\x01\x00\x00'
+  b'S\x00\x00\x00\x06\x01\x00\x00T\x00\x00\x00\x06\x01\x00\x00U\x00\x00\x00\x06\x01\x00\x00V\x00\x00\x00\x06\x01\x00\x00W\x00\x00\x00\x06\x01\x00\x00X\x00\x00\x00\x06\x01\x00\x00Y\x00\x00\x00\x06\x01\x00\x00Z\x00\x00\x00\x06\x01\x00\x00'
+  b'a\x00\x00\x00\x06\x01\x00\x00b\x00\x00\x00\x06\x01\x00\x00c\x00\x00\x00\x06\x01\x00\x00d\x00\x00\x00\x06\x01\x00\x00e\x00\x00\x00\x06\x01\x00\x00f\x00\x00\x00\x06\x01\x00\x00g\x00\x00\x00\x06\x01\x00\x00h\x00\x00\x00\x06\x01\x00\x00'
+  b'i\x00\x00\x00\x06\x01\x00\x00j\x00\x00\x00\x06\x01\x00\x00k\x00\x00\x00\x06\x01\x00\x00l\x00\x00\x00\x06\x01\x00\x00m\x00\x00\x00\x06\x01\x00\x00n\x00\x00\x00\x06\x01\x00\x00o\x00\x00\x00\x06\x01\x00\x00p\x00\x00\x00\x06\x01\x00\x00'
+  b'q\x00\x00\x00\x06\x01\x00\x00r\x00\x00\x00\x06\x01\x00\x00s\x00\x00\x00\x06\x01\x00\x00t\x00\x00\x00\x06\x01\x00\x00u\x00\x00\x00\x06\x01\x00\x00v\x00\x00\x00\x06\x01\x00\x00w\x00\x00\x00\x06\x01\x00\x00x\x00\x00\x00\x06\x01\x00\x00'
+  b'y\x00\x00\x00\x06\x01\x00\x00z\x00\x00\x00\x06\x01\x00\x00A\x00\x00\x00\x06\x01\x00\x00B\x00\x00\x00\x06\x01\x00\x00C\x00\x00\x00\x06\x01\x00\x00D\x00\x00\x00\x06\x01\x00\x00E\x00\x00\x00\x06\x01\x00\x00F\x00\x00\x00\x06\x01\x00\x00'
+  b'G\x00\x00\x00\x06\x01\x00\x00H\x00\x00\x00\x06\x01\x00\x00I\x00\x00\x00\x06\x01\x00\x00J\x00\x00\x00\x06\x01\x00\x00K\x00\x00\x00\x06\x01\x00\x00L\x00\x00\x00\x06\x01\x00\x00M\x00\x00\x00\x06\x01\x00\x00N\x00\x00\x00\x06\x01\x00\x00'
+  b'O\x00\x00\x00\x06\x01\x00\x00P\x00\x00\x00\x06\x01\x00\x00Q\x00\x00\x00\x06\x01\x00\x00R\x00\x00\x00\x06\x01\x00\x00S\x00\x00\x00\x06\x01\x00\x00T\x00\x00\x00\x06\x01\x00\x00U\x00\x00\x00\x06\x01\x00\x00V\x00\x00\x00\x06\x01\x00\x00'
+  b'W\x00\x00\x00\x06\x01\x00\x00X\x00\x00\x00\x06\x01\x00\x00Y\x00\x00\x00\x06\x01\x00\x00Z\x00\x00\x00\x06\x01\x00\x00a\x00\x00\x00\x06\x01\x00\x00b\x00\x00\x00\x06\x01\x00\x00c\x00\x00\x00\x06\x01\x00\x00d\x00\x00\x00\x06\x01\x00\x00'
+  b'e\x00\x00\x00\x06\x01\x00\x00f\x00\x00\x00\x06\x01\x00\x00g\x00\x00\x00\x06\x01\x00\x00h\x00\x00\x00\x06\x01\x00\x00i\x00\x00\x00\x06\x01\x00\x00j\x00\x00\x00\x06\x01\x00\x00k\x00\x00\x00\x06\x01\x00\x00l\x00\x00\x00\x06\x01\x00\x00'
+  b'm\x00\x00\x00\x06\x01\x00\x00n\x00\x00\x00\x06\x01\x00\x00o\x00\x00\x00\x06\x01\x00\x00p\x00\x00\x00\x06\x01\x00\x00q\x00\x00\x00\x06\x01\x00\x00r\x00\x00\x00\x06\x01\x00\x00s\x00\x00\x00\x06\x01\x00\x00t\x00\x00\x00\x06\x01\x00\x00'
+  b'u\x00\x00\x00\x06\x01\x00\x00v\x00\x00\x00\x06\x01\x00\x00w\x00\x00\x00\x06\x01\x00\x00x\x00\x00\x00\x06\x01\x00\x00y\x00\x00\x00\x06\x01\x00\x00z\x00\x00\x00\x06\x01\x00\x00A\x00\x00\x00\x06\x01\x00\x00B\x00\x00\x00\x06\x01\x00\x00'
+  b'C\x00\x00\x00\x06\x01\x00\x00D\x00\x00\x00\x06\x01\x00\x00E\x00\x00\x00\x06\x01\x00\x00F\x00\x00\x00\x06\x01\x00\x00G\x00\x00\x00\x06\x01\x00\x00H\x00\x00\x00\x06\x01\x00\x00I\x00\x00\x00\x06\x01\x00\x00J\x00\x00\x00\x06\x01\x00\x00'
+  b'K\x00\x00\x00\x06\x01\x00\x00L\x00\x00\x00\x06\x01\x00\x00M\x00\x00\x00\x06\x01\x00\x00N\x00\x00\x00\x06\x01\x00\x00O\x00\x00\x00\x06\x01\x00\x00P\x00\x00\x00\x06\x01\x00\x00Q\x00\x00\x00\x06\x01\x00\x00R\x00\x00\x00\x06\x01\x00\x00'
+  b'S\x00\x00\x00\x06\x01\x00\x00T\x00\x00\x00\x06\x01\x00\x00U\x00\x00\x00\x06\x01\x00\x00V\x00\x00\x00\x06\x01\x00\x00W\x00\x00\x00\x06\x01\x00\x00X\x00\x00\x00\x06\x01\x00\x00Y\x00\x00\x00\x06\x01\x00\x00Z\x00\x00\x00\x06\x01\x00\x00'
+  b'a\x00\x00\x00\x06\x01\x00\x00b\x00\x00\x00\x06\x01\x00\x00c\x00\x00\x00\x06\x01\x00\x00d\x00\x00\x00\x06\x01\x00\x00e\x00\x00\x00\x06\x01\x00\x00f\x00\x00\x00\x06\x01\x00\x00g\x00\x00\x00\x06\x01\x00\x00h\x00\x00\x00\x06\x01\x00\x00'
+  b'i\x00\x00\x00\x06\x01\x00\x00j\x00\x00\x00\x06\x01\x00\x00k\x00\x00\x00\x06\x01\x00\x00l\x00\x00\x00\x06\x01\x00\x00m\x00\x00\x00\x06\x01\x00\x00n\x00\x00\x00\x06\x01\x00\x00o\x00\x00\x00\x06\x01\x00\x00p\x00\x00\x00\x06\x01\x00\x00'
+  b'q\x00\x00\x00\x06\x01\x00\x00r\x00\x00\x00\x06\x01\x00\x00s\x00\x00\x00\x06\x01\x00\x00t\x00\x00\x00\x06\x01\x00\x00u\x00\x00\x00\x06\x01\x00\x00v\x00\x00\x00\x06\x01\x00\x00w\x00\x00\x00\x06\x01\x00\x00x\x00\x00\x00\x06\x01\x00\x00'
+  b'y\x00\x00\x00\x06\x01\x00\x00z\x00\x00\x00\x06\x01\x00\x00A\x00\x00\x00\x06\x01\x00\x00B\x00\x00\x00\x06\x01\x00\x00C\x00\x00\x00\x06\x01\x00\x00D\x00\x00\x00\x06\x01\x00\x00E\x00\x00\x00\x06\x01\x00\x00F\x00\x00\x00\x06\x01\x00\x00'
+  b'G\x00\x00\x00\x06\x01\x00\x00H\x00\x00\x00\x06\x01\x00\x00I\x00\x00\x00\x06\x01\x00\x00J\x00\x00\x00\x06\x01\x00\x00K\x00\x00\x00\x06\x01\x00\x00L\x00\x00\x00\x06\x01\x00\x00M\x00\x00\x00\x06\x01\x00\x00N\x00\x00\x00\x06\x01\x00\x00'
+  b'O\x00\x00\x00\x06\x01\x00\x00P\x00\x00\x00\x06\x01\x00\x00Q\x00\x00\x00\x06\x01\x00\x00R\x00\x00\x00\x06\x01\x00\x00S\x00\x00\x00\x06\x01\x00\x00T\x00\x00\x00\x06\x01\x00\x00U\x00\x00\x00\x06\x01\x00\x00V\x00\x00\x00\x06\x01\x00\x00'
+  b'W\x00\x00\x00\x06\x01\x00\x00X\x00\x00\x00\x06\x01\x00\x00Y\x00\x00\x00\x06\x01\x00\x00Z\x00\x00\x00\x06\x01\x00\x00a\x00\x00\x00\x06\x01\x00\x00b\x00\x00\x00\x06\x01\x00\x00c\x00\x00\x00\x06\x01\x00\x00d\x00\x00\x00\x06\x01\x00\x00'
+  b'e\x00\x00\x00\x06\x01\x00\x00f\x00\x00\x00\x06\x01\x00\x00g\x00\x00\x00\x06\x01\x00\x00h\x00\x00\x00\x06\x01\x00\x00i\x00\x00\x00\x06\x01\x00\x00j\x00\x00\x00\x06\x01\x00\x00k\x00\x00\x00\x06\x01\x00\x00l\x00\x00\x00\x06\x01\x00\x00'
+  b'm\x00\x00\x00\x06\x01\x00\x00n\x00\x00\x00\x06\x01\x00\x00o\x00\x00\x00\x06\x01\x00\x00p\x00\x00\x00\x06\x01\x00\x00q\x00\x00\x00\x06\x01\x00\x00r\x00\x00\x00\x06\x01\x00\x00s\x00\x00\x00\x06\x01\x00\x00t\x00\x00\x00\x06\x01\x00\x00'
+  b'u\x00\x00\x00\x06\x01\x00\x00v\x00\x00\x00\x06\x01\x00\x00w\x00\x00\x00\x06\x01\x00\x00x\x00\x00\x00\x06\x01\x00\x00y\x00\x00\x00\x06\x01\x00\x00z\x00\x00\x00\x06\x01\x00\x00A\x00\x00\x00\x06\x01\x00\x00B\x00\x00\x00\x06\x01\x00\x00'
+  b'C\x00\x00\x00\x06\x01\x00\x00D\x00\x00\x00\x06\x01\x00\x00E\x00\x00\x00\x06\x01\x00\x00F\x00\x00\x00\x06\x01\x00\x00G\x00\x00\x00\x06\x01\x00\x00H\x00\x00\x00\x06\x01\x00\x00I\x00\x00\x00\x06\x01\x00\x00J\x00\x00\x00\x06\x01\x00\x00'
+  b'K\x00\x00\x00\x06\x01\x00\x00L\x00\x00\x00\x06\x01\x00\x00M\x00\x00\x00\x06\x01\x00\x00N\x00\x00\x00\x06\x01\x00\x00O\x00\x00\x00\x06\x01\x00\x00P\x00\x00\x00\x06\x01\x00\x00Q\x00\x00\x00\x06\x01\x00\x00R\x00\x00\x00\x06\x01\x00\x00'
+  b'S\x00\x00\x00\x06\x01\x00\x00T\x00\x00\x00\x06\x01\x00\x00U\x00\x00\x00\x06\x01\x00\x00V\x00\x00\x00\x06\x01\x00\x00W\x00\x00\x00\x06\x01\x00\x00X\x00\x00\x00\x06\x01\x00\x00Y\x00\x00\x00\x06\x01\x00\x00Z\x00\x00\x00\x06\x01\x00\x00'
+  b'a\x00\x00\x00\x06\x01\x00\x00b\x00\x00\x00\x06\x01\x00\x00c\x00\x00\x00\x06\x01\x00\x00d\x00\x00\x00\x06\x01\x00\x00e\x00\x00\x00\x06\x01\x00\x00f\x00\x00\x00\x06\x01\x00\x00g\x00\x00\x00\x06\x01\x00\x00h\x00\x00\x00\x06\x01\x00\x00'
+  b'i\x00\x00\x00\x06\x01\x00\x00j\x00\x00\x00\x06\x01\x00\x00k\x00\x00\x00\x06\x01\x00\x00l\x00\x00\x00\x06\x01\x00\x00m\x00\x00\x00\x06\x01\x00\x00n\x00\x00\x00\x06\x01\x00\x00o\x00\x00\x00\x06\x01\x00\x00p\x00\x00\x00\x06\x01\x00\x00'
+  b'q\x00\x00\x00\x06\x01\x00\x00r\x00\x00\x00\x06\x01\x00\x00s\x00\x00\x00\x06\x01\x00\x00t\x00\x00\x00\x06\x01\x00\x00u\x00\x00\x00\x06\x01\x00\x00v\x00\x00\x00\x06\x01\x00\x00w\x00\x00\x00\x06\x01\x00\x00x\x00\x00\x00\x06\x01\x00\x00'
+  b'y\x00\x00\x00\x06\x01\x00\x00z\x00\x00\x00\x06\x01\x00\x00A\x00\x00\x00\x06\x01\x00\x00B\x00\x00\x00\x06\x01\x00\x00C\x00\x00\x00\x06\x01\x00\x00D\x00\x00\x00\x06\x01\x00\x00E\x00\x00\x00\x06\x01\x00\x00F\x00\x00\x00\x06\x01\x00\x00'
+  b'G\x00\x00\x00\x06\x01\x00\x00H\x00\x00\x00\x06\x01\x00\x00I\x00\x00\x00\x06\x01\x00\x00J\x00\x00\x00\x06\x01\x00\x00K\x00\x00\x00\x06\x01\x00\x00L\x00\x00\x00\x06\x01\x00\x00M\x00\x00\x00\x06\x01\x00\x00N\x00\x00\x00\x06\x01\x00\x00'
+  b'O\x00\x00\x00\x06\x01\x00\x00P\x00\x00\x00\x06\x01\x00\x00Q\x00\x00\x00\x06\x01\x00\x00R\x00\x00\x00\x06\x01\x00\x00S\x00\x00\x00\x06\x01\x00\x00T\x00\x00\x00\x06\x01\x00\x00U\x00\x00\x00\x06\x01\x00\x00V\x00\x00\x00\x06\x01\x00\x00'
+  b'W\x00\x00\x00\x06\x01\x00\x00X\x00\x00\x00\x06\x01\x00\x00Y\x00\x00\x00\x06\x01\x00\x00Z\x00\x00\x00\x06\x01\x00\x00a\x00\x00\x00\x06\x01\x00\x00b\x00\x00\x00\x06\x01\x00\x00c\x00\x00\x00\x06\x01\x00\x00d\x00\x00\x00\x06\x01\x00\x00'
+  b'e\x00\x00\x00\x06\x01\x00\x00f\x00\x00\x00\x06\x01\x00\x00g\x00\x00\x00\x06\x01\x00\x00h\x00\x00\x00\x06\x01\x00\x00i\x00\x00\x00\x06\x01\x00\x00j\x00\x00\x00\x06\x01\x00\x00k\x00\x00\x00\x06\x01\x00\x00l\x00\x00\x00\x06\x01\x00\x00'
+  b'm\x00\x00\x00\x06\x01\x00\x00n\x00\x00\x00\x06\x01\x00\x00o\x00\x00\x00\x06\x01\x00\x00p\x00\x00\x00\x06\x01\x00\x00q\x00\x00\x00\x06\x01\x00\x00r\x00\x00\x00\x06\x01\x00\x00s\x00\x00\x00\x06\x01\x00\x00t\x00\x00\x00\x06\x01\x00\x00'
+  b'u\x00\x00\x00\x06\x01\x00\x00v\x00\x00\x00\x06\x01\x00\x00w\x00\x00\x00\x06\x01\x00\x00x\x00\x00\x00\x06\x01\x00\x00y\x00\x00\x00\x06\x01\x00\x00z\x00\x00\x00\x06\x01\x00\x001\x01\x00\x00\x06\x01\x00\x007\x02\x00\x00\x06\x01\x00\x00'
+  b'\x91\x03\x00\x00\x06\x01\x00\x00\x92\x03\x00\x00\x06\x01\x00\x00\x93\x03\x00\x00\x06\x01\x00\x00\x94\x03\x00\x00\x06\x01\x00\x00\x95\x03\x00\x00\x06\x01\x00\x00\x96\x03\x00\x00\x06\x01\x00\x00\x97\x03\x00\x00\x06\x01\x00\x00\x98\x03\x00\x00\x06\x01\x00\x00'
+  b'\x99\x03\x00\x00\x06\x01\x00\x00\x9a\x03\x00\x00\x06\x01\x00\x00\x9b\x03\x00\x00\x06\x01\x00\x00\x9c\x03\x00\x00\x06\x01\x00\x00\x9d\x03\x00\x00\x06\x01\x00\x00\x9e\x03\x00\x00\x06\x01\x00\x00\x9f\x03\x00\x00\x06\x01\x00\x00\xa0\x03\x00\x00\x06\x01\x00\x00'
+  b'\xa1\x03\x00\x00\x06\x01\x00\x00\xf4\x03\x00\x00\x06\x01\x00\x00\xa3\x03\x00\x00\x06\x01\x00\x00\xa4\x03\x00\x00\x06\x01\x00\x00\xa5\x03\x00\x00\x06\x01\x00\x00\xa6\x03\x00\x00\x06\x01\x00\x00\xa7\x03\x00\x00\x06\x01\x00\x00\xa8\x03\x00\x00\x06\x01\x00\x00'
+  b'\xa9\x03\x00\x00\x06\x01\x00\x00\x07"\x00\x00\x06\x01\x00\x00\xb1\x03\x00\x00\x06\x01\x00\x00\xb2\x03\x00\x00\x06\x01\x00\x00\xb3\x03\x00\x00\x06\x01\x00\x00\xb4\x03\x00\x00\x06\x01\x00\x00\xb5\x03\x00\x00\x06\x01\x00\x00\xb6\x03\x00\x00\x06\x01\x00\x00'
+  b'\xb7\x03\x00\x00\x06\x01\x00\x00\xb8\x03\x00\x00\x06\x01\x00\x00\xb9\x03\x00\x00\x06\x01\x00\x00\xba\x03\x00\x00\x06\x01\x00\x00\xbb\x03\x00\x00\x06\x01\x00\x00\xbc\x03\x00\x00\x06\x01\x00\x00\xbd\x03\x00\x00\x06\x01\x00\x00\xbe\x03\x00\x00\x06\x01\x00\x00'
+  b'\xbf\x03\x00\x00\x06\x01\x00\x00\xc0\x03\x00\x00\x06\x01\x00\x00\xc1\x03\x00\x00\x06\x01\x00\x00\xc2\x03\x00\x00\x06\x01\x00\x00\xc3\x03\x00\x00\x06\x01\x00\x00\xc4\x03\x00\x00\x06\x01\x00\x00\xc5\x03\x00\x00\x06\x01\x00\x00\xc6\x03\x00\x00\x06\x01\x00\x00'
+  b'\xc7\x03\x00\x00\x06\x01\x00\x00\xc8\x03\x00\x00\x06\x01\x00\x00\xc9\x03\x00\x00\x06\x01\x00\x00\x02"\x00\x00\x06\x01\x00\x00\xf5\x03\x00\x00\x06\x01\x00\x00\xd1\x03\x00\x00\x06\x01\x00\x00\xf0\x03\x00\x00\x06\x01\x00\x00\xd5\x03\x00\x00\x06\x01\x00\x00'
+  b'\xf1\x03\x00\x00\x06\x01\x00\x00\xd6\x03\x00\x00\x06\x01\x00\x00\x91\x03\x00\x00\x06\x01\x00\x00\x92\x03\x00\x00\x06\x01\x00\x00\x93\x03\x00\x00\x06\x01\x00\x00\x94\x03\x00\x00\x06\x01\x00\x00\x95\x03\x00\x00\x06\x01\x00\x00\x96\x03\x00\x00\x06\x01\x00\x00'
+  b'\x97\x03\x00\x00\x06\x01\x00\x00\x98\x03\x00\x00\x06\x01\x00\x00\x99\x03\x00\x00\x06\x01\x00\x00\x9a\x03\x00\x00\x06\x01\x00\x00\x9b\x03\x00\x00\x06\x01\x00\x00\x9c\x03\x00\x00\x06\x01\x00\x00\x9d\x03\x00\x00\x06\x01\x00\x00\x9e\x03\x00\x00\x06\x01\x00\x00'
+  b'\x9f\x03\x00\x00\x06\x01\x00\x00\xa0\x03\x00\x00\x06\x01\x00\x00\xa1\x03\x00\x00\x06\x01\x00\x00\xf4\x03\x00\x00\x06\x01\x00\x00\xa3\x03\x00\x00\x06\x01\x00\x00\xa4\x03\x00\x00\x06\x01\x00\x00\xa5\x03\x00\x00\x06\x01\x00\x00\xa6\x03\x00\x00\x06\x01\x00\x00'
+  b'\xa7\x03\x00\x00\x06\x01\x00\x00\xa8\x03\x00\x00\x06\x01\x00\x00\xa9\x03\x00\x00\x06\x01\x00\x00\x07"\x00\x00\x06\x01\x00\x00\xb1\x03\x00\x00\x06\x01\x00\x00\xb2\x03\x00\x00\x06\x01\x00\x00\xb3\x03\x00\x00\x06\x01\x00\x00\xb4\x03\x00\x00\x06\x01\x00\x00'
+  b'\xb5\x03\x00\x00\x06\x01\x00\x00\xb6\x03\x00\x00\x06\x01\x00\x00\xb7\x03\x00\x00\x06\x01\x00\x00\xb8\x03\x00\x00\x06\x01\x00\x00\xb9\x03\x00\x00\x06\x01\x00\x00\xba\x03\x00\x00\x06\x01\x00\x00\xbb\x03\x00\x00\x06\x01\x00\x00\xbc\x03\x00\x00\x06\x01\x00\x00'
+  b'\xbd\x03\x00\x00\x06\x01\x00\x00\xbe\x03\x00\x00\x06\x01\x00\x00\xbf\x03\x00\x00\x06\x01\x00\x00\xc0\x03\x00\x00\x06\x01\x00\x00\xc1\x03\x00\x00\x06\x01\x00\x00\xc2\x03\x00\x00\x06\x01\x00\x00\xc3\x03\x00\x00\x06\x01\x00\x00\xc4\x03\x00\x00\x06\x01\x00\x00'
+  b'\xc5\x03\x00\x00\x06\x01\x00\x00\xc6\x03\x00\x00\x06\x01\x00\x00\xc7\x03\x00\x00\x06\x01\x00\x00\xc8\x03\x00\x00\x06\x01\x00\x00\xc9\x03\x00\x00\x06\x01\x00\x00\x02"\x00\x00\x06\x01\x00\x00\xf5\x03\x00\x00\x06\x01\x00\x00\xd1\x03\x00\x00\x06\x01\x00\x00'
+  b'\xf0\x03\x00\x00\x06\x01\x00\x00\xd5\x03\x00\x00\x06\x01\x00\x00\xf1\x03\x00\x00\x06\x01\x00\x00\xd6\x03\x00\x00\x06\x01\x00\x00\x91\x03\x00\x00\x06\x01\x00\x00\x92\x03\x00\x00\x06\x01\x00\x00\x93\x03\x00\x00\x06\x01\x00\x00\x94\x03\x00\x00\x06\x01\x00\x00'
+  b'\x95\x03\x00\x00\x06\x01\x00\x00\x96\x03\x00\x00\x06\x01\x00\x00\x97\x03\x00\x00\x06\x01\x00\x00\x98\x03\x00\x00\x06\x01\x00\x00\x99\x03\x00\x00\x06\x01\x00\x00\x9a\x03\x00\x00\x06\x01\x00\x00\x9b\x03\x00\x00\x06\x01\x00\x00\x9c\x03\x00\x00\x06\x01\x00\x00'
+  b'\x9d\x03\x00\x00\x06\x01\x00\x00\x9e\x03\x00\x00\x06\x01\x00\x00\x9f\x03\x00\x00\x06\x01\x00\x00\xa0\x03\x00\x00\x06\x01\x00\x00\xa1\x03\x00\x00\x06\x01\x00\x00\xf4\x03\x00\x00\x06\x01\x00\x00\xa3\x03\x00\x00\x06\x01\x00\x00\xa4\x03\x00\x00\x06\x01\x00\x00'
+  b'\xa5\x03\x00\x00\x06\x01\x00\x00\xa6\x03\x00\x00\x06\x01\x00\x00\xa7\x03\x00\x00\x06\x01\x00\x00\xa8\x03\x00\x00\x06\x01\x00\x00\xa9\x03\x00\x00\x06\x01\x00\x00\x07"\x00\x00\x06\x01\x00\x00\xb1\x03\x00\x00\x06\x01\x00\x00\xb2\x03\x00\x00\x06\x01\x00\x00'
+  b'\xb3\x03\x00\x00\x06\x01\x00\x00\xb4\x03\x00\x00\x06\x01\x00\x00\xb5\x03\x00\x00\x06\x01\x00\x00\xb6\x03\x00\x00\x06\x01\x00\x00\xb7\x03\x00\x00\x06\x01\x00\x00\xb8\x03\x00\x00\x06\x01\x00\x00\xb9\x03\x00\x00\x06\x01\x00\x00\xba\x03\x00\x00\x06\x01\x00\x00'
+  b'\xbb\x03\x00\x00\x06\x01\x00\x00\xbc\x03\x00\x00\x06\x01\x00\x00\xbd\x03\x00\x00\x06\x01\x00\x00\xbe\x03\x00\x00\x06\x01\x00\x00\xbf\x03\x00\x00\x06\x01\x00\x00\xc0\x03\x00\x00\x06\x01\x00\x00\xc1\x03\x00\x00\x06\x01\x00\x00\xc2\x03\x00\x00\x06\x01\x00\x00'
+  b'\xc3\x03\x00\x00\x06\x01\x00\x00\xc4\x03\x00\x00\x06\x01\x00\x00\xc5\x03\x00\x00\x06\x01\x00\x00\xc6\x03\x00\x00\x06\x01\x00\x00\xc7\x03\x00\x00\x06\x01\x00\x00\xc8\x03\x00\x00\x06\x01\x00\x00\xc9\x03\x00\x00\x06\x01\x00\x00\x02"\x00\x00\x06\x01\x00\x00'
+  b'\xf5\x03\x00\x00\x06\x01\x00\x00\xd1\x03\x00\x00\x06\x01\x00\x00\xf0\x03\x00\x00\x06\x01\x00\x00\xd5\x03\x00\x00\x06\x01\x00\x00\xf1\x03\x00\x00\x06\x01\x00\x00\xd6\x03\x00\x00\x06\x01\x00\x00\x91\x03\x00\x00\x06\x01\x00\x00\x92\x03\x00\x00\x06\x01\x00\x00'
+  b'\x93\x03\x00\x00\x06\x01\x00\x00\x94\x03\x00\x00\x06\x01\x00\x00\x95\x03\x00\x00\x06\x01\x00\x00\x96\x03\x00\x00\x06\x01\x00\x00\x97\x03\x00\x00\x06\x01\x00\x00\x98\x03\x00\x00\x06\x01\x00\x00\x99\x03\x00\x00\x06\x01\x00\x00\x9a\x03\x00\x00\x06\x01\x00\x00'
+  b'\x9b\x03\x00\x00\x06\x01\x00\x00\x9c\x03\x00\x00\x06\x01\x00\x00\x9d\x03\x00\x00\x06\x01\x00\x00\x9e\x03\x00\x00\x06\x01\x00\x00\x9f\x03\x00\x00\x06\x01\x00\x00\xa0\x03\x00\x00\x06\x01\x00\x00\xa1\x03\x00\x00\x06\x01\x00\x00\xf4\x03\x00\x00\x06\x01\x00\x00'
+  b'\xa3\x03\x00\x00\x06\x01\x00\x00\xa4\x03\x00\x00\x06\x01\x00\x00\xa5\x03\x00\x00\x06\x01\x00\x00\xa6\x03\x00\x00\x06\x01\x00\x00\xa7\x03\x00\x00\x06\x01\x00\x00\xa8\x03\x00\x00\x06\x01\x00\x00\xa9\x03\x00\x00\x06\x01\x00\x00\x07"\x00\x00\x06\x01\x00\x00'
+  b'\xb1\x03\x00\x00\x06\x01\x00\x00\xb2\x03\x00\x00\x06\x01\x00\x00\xb3\x03\x00\x00\x06\x01\x00\x00\xb4\x03\x00\x00\x06\x01\x00\x00\xb5\x03\x00\x00\x06\x01\x00\x00\xb6\x03\x00\x00\x06\x01\x00\x00\xb7\x03\x00\x00\x06\x01\x00\x00\xb8\x03\x00\x00\x06\x01\x00\x00'
+  b'\xb9\x03\x00\x00\x06\x01\x00\x00\xba\x03\x00\x00\x06\x01\x00\x00\xbb\x03\x00\x00\x06\x01\x00\x00\xbc\x03\x00\x00\x06\x01\x00\x00\xbd\x03\x00\x00\x06\x01\x00\x00\xbe\x03\x00\x00\x06\x01\x00\x00\xbf\x03\x00\x00\x06\x01\x00\x00\xc0\x03\x00\x00\x06\x01\x00\x00'
+  b'\xc1\x03\x00\x00\x06\x01\x00\x00\xc2\x03\x00\x00\x06\x01\x00\x00\xc3\x03\x00\x00\x06\x01\x00\x00\xc4\x03\x00\x00\x06\x01\x00\x00\xc5\x03\x00\x00\x06\x01\x00\x00\xc6\x03\x00\x00\x06\x01\x00\x00\xc7\x03\x00\x00\x06\x01\x00\x00\xc8\x03\x00\x00\x06\x01\x00\x00'
+  b'\xc9\x03\x00\x00\x06\x01\x00\x00\x02"\x00\x00\x06\x01\x00\x00\xf5\x03\x00\x00\x06\x01\x00\x00\xd1\x03\x00\x00\x06\x01\x00\x00\xf0\x03\x00\x00\x06\x01\x00\x00\xd5\x03\x00\x00\x06\x01\x00\x00\xf1\x03\x00\x00\x06\x01\x00\x00\xd6\x03\x00\x00\x06\x01\x00\x00'
+  b'\x91\x03\x00\x00\x06\x01\x00\x00\x92\x03\x00\x00\x06\x01\x00\x00\x93\x03\x00\x00\x06\x01\x00\x00\x94\x03\x00\x00\x06\x01\x00\x00\x95\x03\x00\x00\x06\x01\x00\x00\x96\x03\x00\x00\x06\x01\x00\x00\x97\x03\x00\x00\x06\x01\x00\x00\x98\x03\x00\x00\x06\x01\x00\x00'
+  b'\x99\x03\x00\x00\x06\x01\x00\x00\x9a\x03\x00\x00\x06\x01\x00\x00\x9b\x03\x00\x00\x06\x01\x00\x00\x9c\x03\x00\x00\x06\x01\x00\x00\x9d\x03\x00\x00\x06\x01\x00\x00\x9e\x03\x00\x00\x06\x01\x00\x00\x9f\x03\x00\x00\x06\x01\x00\x00\xa0\x03\x00\x00\x06\x01\x00\x00'
+  b'\xa1\x03\x00\x00\x06\x01\x00\x00\xf4\x03\x00\x00\x06\x01\x00\x00\xa3\x03\x00\x00\x06\x01\x00\x00\xa4\x03\x00\x00\x06\x01\x00\x00\xa5\x03\x00\x00\x06\x01\x00\x00\xa6\x03\x00\x00\x06\x01\x00\x00\xa7\x03\x00\x00\x06\x01\x00\x00\xa8\x03\x00\x00\x06\x01\x00\x00'
+  b'\xa9\x03\x00\x00\x06\x01\x00\x00\x07"\x00\x00\x06\x01\x00\x00\xb1\x03\x00\x00\x06\x01\x00\x00\xb2\x03\x00\x00\x06\x01\x00\x00\xb3\x03\x00\x00\x06\x01\x00\x00\xb4\x03\x00\x00\x06\x01\x00\x00\xb5\x03\x00\x00\x06\x01\x00\x00\xb6\x03\x00\x00\x06\x01\x00\x00'
+  b'\xb7\x03\x00\x00\x06\x01\x00\x00\xb8\x03\x00\x00\x06\x01\x00\x00\xb9\x03\x00\x00\x06\x01\x00\x00\xba\x03\x00\x00\x06\x01\x00\x00\xbb\x03\x00\x00\x06\x01\x00\x00\xbc\x03\x00\x00\x06\x01\x00\x00\xbd\x03\x00\x00\x06\x01\x00\x00\xbe\x03\x00\x00\x06\x01\x00\x00'
+  b'\xbf\x03\x00\x00\x06\x01\x00\x00\xc0\x03\x00\x00\x06\x01\x00\x00\xc1\x03\x00\x00\x06\x01\x00\x00\xc2\x03\x00\x00\x06\x01\x00\x00\xc3\x03\x00\x00\x06\x01\x00\x00\xc4\x03\x00\x00\x06\x01\x00\x00\xc5\x03\x00\x00\x06\x01\x00\x00\xc6\x03\x00\x00\x06\x01\x00\x00'
+  b'\xc7\x03\x00\x00\x06\x01\x00\x00\xc8\x03\x00\x00\x06\x01\x00\x00\xc9\x03\x00\x00\x06\x01\x00\x00\x02"\x00\x00\x06\x01\x00\x00\xf5\x03\x00\x00\x06\x01\x00\x00\xd1\x03\x00\x00\x06\x01\x00\x00\xf0\x03\x00\x00\x06\x01\x00\x00\xd5\x03\x00\x00\x06\x01\x00\x00'
+  b'\xf1\x03\x00\x00\x06\x01\x00\x00\xd6\x03\x00\x00\x06\x01\x00\x00\xdc\x03\x00\x00\x06\x01\x00\x00\xdd\x03\x00\x00\x06\x01\x00\x000\x00\x00\x00\x06\x01\x00\x001\x00\x00\x00\x06\x01\x00\x002\x00\x00\x00\x06\x01\x00\x003\x00\x00\x00\x06\x01\x00\x00'
+  b'4\x00\x00\x00\x06\x01\x00\x005\x00\x00\x00\x06\x01\x00\x006\x00\x00\x00\x06\x01\x00\x007\x00\x00\x00\x06\x01\x00\x008\x00\x00\x00\x06\x01\x00\x009\x00\x00\x00\x06\x01\x00\x000\x00\x00\x00\x06\x01\x00\x001\x00\x00\x00\x06\x01\x00\x00'
+  b'2\x00\x00\x00\x06\x01\x00\x003\x00\x00\x00\x06\x01\x00\x004\x00\x00\x00\x06\x01\x00\x005\x00\x00\x00\x06\x01\x00\x006\x00\x00\x00\x06\x01\x00\x007\x00\x00\x00\x06\x01\x00\x008\x00\x00\x00\x06\x01\x00\x009\x00\x00\x00\x06\x01\x00\x00'
+  b'0\x00\x00\x00\x06\x01\x00\x001\x00\x00\x00\x06\x01\x00\x002\x00\x00\x00\x06\x01\x00\x003\x00\x00\x00\x06\x01\x00\x004\x00\x00\x00\x06\x01\x00\x005\x00\x00\x00\x06\x01\x00\x006\x00\x00\x00\x06\x01\x00\x007\x00\x00\x00\x06\x01\x00\x00'
+  b'8\x00\x00\x00\x06\x01\x00\x009\x00\x00\x00\x06\x01\x00\x000\x00\x00\x00\x06\x01\x00\x001\x00\x00\x00\x06\x01\x00\x002\x00\x00\x00\x06\x01\x00\x003\x00\x00\x00\x06\x01\x00\x004\x00\x00\x00\x06\x01\x00\x005\x00\x00\x00\x06\x01\x00\x00'
+  b'6\x00\x00\x00\x06\x01\x00\x007\x00\x00\x00\x06\x01\x00\x008\x00\x00\x00\x06\x01\x00\x009\x00\x00\x00\x06\x01\x00\x000\x00\x00\x00\x06\x01\x00\x001\x00\x00\x00\x06\x01\x00\x002\x00\x00\x00\x06\x01\x00\x003\x00\x00\x00\x06\x01\x00\x00'
+  b"4\x00\x00\x00\x06\x01\x00\x005\x00\x00\x00\x06\x01\x00\x006\x00\x00\x00\x06\x01\x00\x007\x00\x00\x00\x06\x01\x00\x008\x00\x00\x00\x06\x01\x00\x009\x00\x00\x00\x06\x01\x00\x00'\x06\x00\x00\x06\x01\x00\x00(\x06\x00\x00\x06\x01\x00\x00"
+  b',\x06\x00\x00\x06\x01\x00\x00/\x06\x00\x00\x06\x01\x00\x00H\x06\x00\x00\x06\x01\x00\x002\x06\x00\x00\x06\x01\x00\x00-\x06\x00\x00\x06\x01\x00\x007\x06\x00\x00\x06\x01\x00\x00J\x06\x00\x00\x06\x01\x00\x00C\x06\x00\x00\x06\x01\x00\x00'
+  b'D\x06\x00\x00\x06\x01\x00\x00E\x06\x00\x00\x06\x01\x00\x00F\x06\x00\x00\x06\x01\x00\x003\x06\x00\x00\x06\x01\x00\x009\x06\x00\x00\x06\x01\x00\x00A\x06\x00\x00\x06\x01\x00\x005\x06\x00\x00\x06\x01\x00\x00B\x06\x00\x00\x06\x01\x00\x00'
+  b'1\x06\x00\x00\x06\x01\x00\x004\x06\x00\x00\x06\x01\x00\x00*\x06\x00\x00\x06\x01\x00\x00+\x06\x00\x00\x06\x01\x00\x00.\x06\x00\x00\x06\x01\x00\x000\x06\x00\x00\x06\x01\x00\x006\x06\x00\x00\x06\x01\x00\x008\x06\x00\x00\x06\x01\x00\x00'
+  b':\x06\x00\x00\x06\x01\x00\x00n\x06\x00\x00\x06\x01\x00\x00\xba\x06\x00\x00\x06\x01\x00\x00\xa1\x06\x00\x00\x06\x01\x00\x00o\x06\x00\x00\x06\x01\x00\x00(\x06\x00\x00\x06\x01\x00\x00,\x06\x00\x00\x06\x01\x00\x00G\x06\x00\x00\x06\x01\x00\x00'
+  b'-\x06\x00\x00\x06\x01\x00\x00J\x06\x00\x00\x06\x01\x00\x00C\x06\x00\x00\x06\x01\x00\x00D\x06\x00\x00\x06\x01\x00\x00E\x06\x00\x00\x06\x01\x00\x00F\x06\x00\x00\x06\x01\x00\x003\x06\x00\x00\x06\x01\x00\x009\x06\x00\x00\x06\x01\x00\x00'
+  b'A\x06\x00\x00\x06\x01\x00\x005\x06\x00\x00\x06\x01\x00\x00B\x06\x00\x00\x06\x01\x00\x004\x06\x00\x00\x06\x01\x00\x00*\x06\x00\x00\x06\x01\x00\x00+\x06\x00\x00\x06\x01\x00\x00.\x06\x00\x00\x06\x01\x00\x006\x06\x00\x00\x06\x01\x00\x00'
+  b':\x06\x00\x00\x06\x01\x00\x00,\x06\x00\x00\x06\x01\x00\x00-\x06\x00\x00\x06\x01\x00\x00J\x06\x00\x00\x06\x01\x00\x00D\x06\x00\x00\x06\x01\x00\x00F\x06\x00\x00\x06\x01\x00\x003\x06\x00\x00\x06\x01\x00\x009\x06\x00\x00\x06\x01\x00\x00'
+  b'5\x06\x00\x00\x06\x01\x00\x00B\x06\x00\x00\x06\x01\x00\x004\x06\x00\x00\x06\x01\x00\x00.\x06\x00\x00\x06\x01\x00\x006\x06\x00\x00\x06\x01\x00\x00:\x06\x00\x00\x06\x01\x00\x00\xba\x06\x00\x00\x06\x01\x00\x00o\x06\x00\x00\x06\x01\x00\x00'
+  b'(\x06\x00\x00\x06\x01\x00\x00,\x06\x00\x00\x06\x01\x00\x00G\x06\x00\x00\x06\x01\x00\x00-\x06\x00\x00\x06\x01\x00\x007\x06\x00\x00\x06\x01\x00\x00J\x06\x00\x00\x06\x01\x00\x00C\x06\x00\x00\x06\x01\x00\x00E\x06\x00\x00\x06\x01\x00\x00'
+  b'F\x06\x00\x00\x06\x01\x00\x003\x06\x00\x00\x06\x01\x00\x009\x06\x00\x00\x06\x01\x00\x00A\x06\x00\x00\x06\x01\x00\x005\x06\x00\x00\x06\x01\x00\x00B\x06\x00\x00\x06\x01\x00\x004\x06\x00\x00\x06\x01\x00\x00*\x06\x00\x00\x06\x01\x00\x00'
+  b"+\x06\x00\x00\x06\x01\x00\x00.\x06\x00\x00\x06\x01\x00\x006\x06\x00\x00\x06\x01\x00\x008\x06\x00\x00\x06\x01\x00\x00:\x06\x00\x00\x06\x01\x00\x00n\x06\x00\x00\x06\x01\x00\x00\xa1\x06\x00\x00\x06\x01\x00\x00'\x06\x00\x00\x06\x01\x00\x00"
+  b'(\x06\x00\x00\x06\x01\x00\x00,\x06\x00\x00\x06\x01\x00\x00/\x06\x00\x00\x06\x01\x00\x00G\x06\x00\x00\x06\x01\x00\x00H\x06\x00\x00\x06\x01\x00\x002\x06\x00\x00\x06\x01\x00\x00-\x06\x00\x00\x06\x01\x00\x007\x06\x00\x00\x06\x01\x00\x00'
+  b'J\x06\x00\x00\x06\x01\x00\x00D\x06\x00\x00\x06\x01\x00\x00E\x06\x00\x00\x06\x01\x00\x00F\x06\x00\x00\x06\x01\x00\x003\x06\x00\x00\x06\x01\x00\x009\x06\x00\x00\x06\x01\x00\x00A\x06\x00\x00\x06\x01\x00\x005\x06\x00\x00\x06\x01\x00\x00'
+  b'B\x06\x00\x00\x06\x01\x00\x001\x06\x00\x00\x06\x01\x00\x004\x06\x00\x00\x06\x01\x00\x00*\x06\x00\x00\x06\x01\x00\x00+\x06\x00\x00\x06\x01\x00\x00.\x06\x00\x00\x06\x01\x00\x000\x06\x00\x00\x06\x01\x00\x006\x06\x00\x00\x06\x01\x00\x00'
+  b'8\x06\x00\x00\x06\x01\x00\x00:\x06\x00\x00\x06\x01\x00\x00(\x06\x00\x00\x06\x01\x00\x00,\x06\x00\x00\x06\x01\x00\x00/\x06\x00\x00\x06\x01\x00\x00H\x06\x00\x00\x06\x01\x00\x002\x06\x00\x00\x06\x01\x00\x00-\x06\x00\x00\x06\x01\x00\x00'
+  b'7\x06\x00\x00\x06\x01\x00\x00J\x06\x00\x00\x06\x01\x00\x00D\x06\x00\x00\x06\x01\x00\x00E\x06\x00\x00\x06\x01\x00\x00F\x06\x00\x00\x06\x01\x00\x003\x06\x00\x00\x06\x01\x00\x009\x06\x00\x00\x06\x01\x00\x00A\x06\x00\x00\x06\x01\x00\x00'
+  b'5\x06\x00\x00\x06\x01\x00\x00B\x06\x00\x00\x06\x01\x00\x001\x06\x00\x00\x06\x01\x00\x004\x06\x00\x00\x06\x01\x00\x00*\x06\x00\x00\x06\x01\x00\x00+\x06\x00\x00\x06\x01\x00\x00.\x06\x00\x00\x06\x01\x00\x000\x06\x00\x00\x06\x01\x00\x00'
+  b'6\x06\x00\x00\x06\x01\x00\x008\x06\x00\x00\x06\x01\x00\x00:\x06\x00\x00\x02\x02\x00\x000\x00\x00\x00.\x00\x00\x00\x02\x02\x00\x000\x00\x00\x00,\x00\x00\x00\x02\x02\x00\x001\x00\x00\x00,\x00\x00\x00\x02\x02\x00\x002\x00\x00\x00'
+  b',\x00\x00\x00\x02\x02\x00\x003\x00\x00\x00,\x00\x00\x00\x02\x02\x00\x004\x00\x00\x00,\x00\x00\x00\x02\x02\x00\x005\x00\x00\x00,\x00\x00\x00\x02\x02\x00\x006\x00\x00\x00,\x00\x00\x00\x02\x02\x00\x007\x00\x00\x00,\x00\x00\x00'
+  b'\x02\x02\x00\x008\x00\x00\x00,\x00\x00\x00\x02\x02\x00\x009\x00\x00\x00,\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00A\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00B\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00'
+  b'C\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00D\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00E\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00F\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00'
+  b'G\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00H\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00I\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00J\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00'
+  b'K\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00L\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00M\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00N\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00'
+  b'O\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00P\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00Q\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00R\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00'
+  b'S\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00T\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00U\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00V\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00'
+  b'W\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00X\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00Y\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00(\x00\x00\x00Z\x00\x00\x00)\x00\x00\x00\x02\x03\x00\x00\x140\x00\x00'
+  b'S\x00\x00\x00\x150\x00\x00\x07\x01\x00\x00C\x00\x00\x00\x07\x01\x00\x00R\x00\x00\x00\x07\x02\x00\x00C\x00\x00\x00D\x00\x00\x00\x07\x02\x00\x00W\x00\x00\x00Z\x00\x00\x00\n\x01\x00\x00A\x00\x00\x00\n\x01\x00\x00B\x00\x00\x00'
+  b'\n\x01\x00\x00C\x00\x00\x00\n\x01\x00\x00D\x00\x00\x00\n\x01\x00\x00E\x00\x00\x00\n\x01\x00\x00F\x00\x00\x00\n\x01\x00\x00G\x00\x00\x00\n\x01\x00\x00H\x00\x00\x00\n\x01\x00\x00I\x00\x00\x00\n\x01\x00\x00J\x00\x00\x00'
+  b'\n\x01\x00\x00K\x00\x00\x00\n\x01\x00\x00L\x00\x00\x00\n\x01\x00\x00M\x00\x00\x00\n\x01\x00\x00N\x00\x00\x00\n\x01\x00\x00O\x00\x00\x00\n\x01\x00\x00P\x00\x00\x00\n\x01\x00\x00Q\x00\x00\x00\n\x01\x00\x00R\x00\x00\x00'
+  b'\n\x01\x00\x00S\x00\x00\x00\n\x01\x00\x00T\x00\x00\x00\n\x01\x00\x00U\x00\x00\x00\n\x01\x00\x00V\x00\x00\x00\n\x01\x00\x00W\x00\x00\x00\n\x01\x00\x00X\x00\x00\x00\n\x01\x00\x00Y\x00\x00\x00\n\x01\x00\x00Z\x00\x00\x00'
+  b'\n\x02\x00\x00H\x00\x00\x00V\x00\x00\x00\n\x02\x00\x00M\x00\x00\x00V\x00\x00\x00\n\x02\x00\x00S\x00\x00\x00D\x00\x00\x00\n\x02\x00\x00S\x00\x00\x00S\x00\x00\x00\n\x03\x00\x00P\x00\x00\x00P\x00\x00\x00V\x00\x00\x00'
+  b'\n\x02\x00\x00W\x00\x00\x00C\x00\x00\x00\x03\x02\x00\x00M\x00\x00\x00C\x00\x00\x00\x03\x02\x00\x00M\x00\x00\x00D\x00\x00\x00\x03\x02\x00\x00M\x00\x00\x00R\x00\x00\x00\n\x02\x00\x00D\x00\x00\x00J\x00\x00\x00\n\x02\x00\x00'
+  b'{0\x00\x00K0\x00\x00\n\x02\x00\x00\xb30\x00\x00\xb30\x00\x00\n\x01\x00\x00\xb50\x00\x00\n\x01\x00\x00Kb\x00\x00\n\x01\x00\x00W[\x00\x00\n\x01\x00\x00\xccS\x00\x00\n\x01\x00\x00\xc70\x00\x00\n\x01\x00\x00'
+  b'\x8cN\x00\x00\n\x01\x00\x00\x1aY\x00\x00\n\x01\x00\x00\xe3\x89\x00\x00\n\x01\x00\x00)Y\x00\x00\n\x01\x00\x00\xa4N\x00\x00\n\x01\x00\x00 f\x00\x00\n\x01\x00\x00!q\x00\x00\n\x01\x00\x00\x99e\x00\x00\n\x01\x00\x00'
+  b'MR\x00\x00\n\x01\x00\x00\x8c_\x00\x00\n\x01\x00\x00\x8dQ\x00\x00\n\x01\x00\x00\xb0e\x00\x00\n\x01\x00\x00\x1dR\x00\x00\n\x01\x00\x00B}\x00\x00\n\x01\x00\x00\x1fu\x00\x00\n\x01\x00\x00\xa9\x8c\x00\x00\n\x01\x00\x00'
+  b'\xf0X\x00\x00\n\x01\x00\x009T\x00\x00\n\x01\x00\x00\x14o\x00\x00\n\x01\x00\x00\x95b\x00\x00\n\x01\x00\x00Uc\x00\x00\n\x01\x00\x00\x00N\x00\x00\n\x01\x00\x00\tN\x00\x00\n\x01\x00\x00J\x90\x00\x00\n\x01\x00\x00'
+  b'\xe6]\x00\x00\n\x01\x00\x00-N\x00\x00\n\x01\x00\x00\xf3S\x00\x00\n\x01\x00\x00\x07c\x00\x00\n\x01\x00\x00p\x8d\x00\x00\n\x01\x00\x00Sb\x00\x00\n\x01\x00\x00\x81y\x00\x00\n\x01\x00\x00zz\x00\x00\n\x01\x00\x00'
+  b'\x08T\x00\x00\n\x01\x00\x00\x80n\x00\x00\n\x01\x00\x00\tg\x00\x00\n\x01\x00\x00\x08g\x00\x00\n\x01\x00\x003u\x00\x00\n\x01\x00\x00rR\x00\x00\n\x01\x00\x00\xb6U\x00\x00\n\x01\x00\x00M\x91\x00\x00\x02\x03\x00\x00'
+  b'\x140\x00\x00,g\x00\x00\x150\x00\x00\x02\x03\x00\x00\x140\x00\x00\tN\x00\x00\x150\x00\x00\x02\x03\x00\x00\x140\x00\x00\x8cN\x00\x00\x150\x00\x00\x02\x03\x00\x00\x140\x00\x00\x89[\x00\x00\x150\x00\x00\x02\x03\x00\x00'
+  b'\x140\x00\x00\xb9p\x00\x00\x150\x00\x00\x02\x03\x00\x00\x140\x00\x00Sb\x00\x00\x150\x00\x00\x02\x03\x00\x00\x140\x00\x00\xd7v\x00\x00\x150\x00\x00\x02\x03\x00\x00\x140\x00\x00\xddR\x00\x00\x150\x00\x00\x02\x03\x00\x00'
+  b'\x140\x00\x00We\x00\x00\x150\x00\x00\x07\x01\x00\x00\x97_\x00\x00\x07\x01\x00\x00\xefS\x00\x00\x06\x01\x00\x000\x00\x00\x00\x06\x01\x00\x001\x00\x00\x00\x06\x01\x00\x002\x00\x00\x00\x06\x01\x00\x003\x00\x00\x00\x06\x01\x00\x00'
+  b'4\x00\x00\x00\x06\x01\x00\x005\x00\x00\x00\x06\x01\x00\x006\x00\x00\x00\x06\x01\x00\x007\x00\x00\x00\x06\x01\x00\x008\x00\x00\x00\x06\x01\x00\x009\x00\x00\x00\x00\x01\x00\x00=N\x00\x00\x00\x01\x00\x008N\x00\x00\x00\x01\x00\x00'
+  b'AN\x00\x00\x00\x01\x00\x00"\x01\x02\x00\x00\x01\x00\x00`O\x00\x00\x00\x01\x00\x00\xaeO\x00\x00\x00\x01\x00\x00\xbbO\x00\x00\x00\x01\x00\x00\x02P\x00\x00\x00\x01\x00\x00zP\x00\x00\x00\x01\x00\x00\x99P\x00\x00\x00\x01\x00\x00'
+  b'\xe7P\x00\x00\x00\x01\x00\x00\xcfP\x00\x00\x00\x01\x00\x00\x9e4\x00\x00\x00\x01\x00\x00:\x06\x02\x00\x00\x01\x00\x00MQ\x00\x00\x00\x01\x00\x00TQ\x00\x00\x00\x01\x00\x00dQ\x00\x00\x00\x01\x00\x00wQ\x00\x00\x00\x01\x00\x00'
+  b'\x1c\x05\x02\x00\x00\x01\x00\x00\xb94\x00\x00\x00\x01\x00\x00gQ\x00\x00\x00\x01\x00\x00\x8dQ\x00\x00\x00\x01\x00\x00K\x05\x02\x00\x00\x01\x00\x00\x97Q\x00\x00\x00\x01\x00\x00\xa4Q\x00\x00\x00\x01\x00\x00\xccN\x00\x00\x00\x01\x00\x00'
+  b'\xacQ\x00\x00\x00\x01\x00\x00\xb5Q\x00\x00\x00\x01\x00\x00\xdf\x91\x02\x00\x00\x01\x00\x00\xf5Q\x00\x00\x00\x01\x00\x00\x03R\x00\x00\x00\x01\x00\x00\xdf4\x00\x00\x00\x01\x00\x00;R\x00\x00\x00\x01\x00\x00FR\x00\x00\x00\x01\x00\x00'
+  b'rR\x00\x00\x00\x01\x00\x00wR\x00\x00\x00\x01\x00\x00\x155\x00\x00\x00\x01\x00\x00\xc7R\x00\x00\x00\x01\x00\x00\xc9R\x00\x00\x00\x01\x00\x00\xe4R\x00\x00\x00\x01\x00\x00\xfaR\x00\x00\x00\x01\x00\x00\x05S\x00\x00\x00\x01\x00\x00'
+  b'\x06S\x00\x00\x00\x01\x00\x00\x17S\x00\x00\x00\x01\x00\x00IS\x00\x00\x00\x01\x00\x00QS\x00\x00\x00\x01\x00\x00ZS\x00\x00\x00\x01\x00\x00sS\x00\x00\x00\x01\x00\x00}S\x00\x00\x00\x01\x00\x00\x7fS\x00\x00\x00\x01\x00\x00'
+  b'\x7fS\x00\x00\x00\x01\x00\x00\x7fS\x00\x00\x00\x01\x00\x00,\n\x02\x00\x00\x01\x00\x00pp\x00\x00\x00\x01\x00\x00\xcaS\x00\x00\x00\x01\x00\x00\xdfS\x00\x00\x00\x01\x00\x00c\x0b\x02\x00\x00\x01\x00\x00\xebS\x00\x00\x00\x01\x00\x00'
+  b'\xf1S\x00\x00\x00\x01\x00\x00\x06T\x00\x00\x00\x01\x00\x00\x9eT\x00\x00\x00\x01\x00\x008T\x00\x00\x00\x01\x00\x00HT\x00\x00\x00\x01\x00\x00hT\x00\x00\x00\x01\x00\x00\xa2T\x00\x00\x00\x01\x00\x00\xf6T\x00\x00\x00\x01\x00\x00'
+  b'\x10U\x00\x00\x00\x01\x00\x00SU\x00\x00\x00\x01\x00\x00cU\x00\x00\x00\x01\x00\x00\x84U\x00\x00\x00\x01\x00\x00\x84U\x00\x00\x00\x01\x00\x00\x99U\x00\x00\x00\x01\x00\x00\xabU\x00\x00\x00\x01\x00\x00\xb3U\x00\x00\x00\x01\x00\x00'
+  b'\xc2U\x00\x00\x00\x01\x00\x00\x16W\x00\x00\x00\x01\x00\x00\x06V\x00\x00\x00\x01\x00\x00\x17W\x00\x00\x00\x01\x00\x00QV\x00\x00\x00\x01\x00\x00tV\x00\x00\x00\x01\x00\x00\x07R\x00\x00\x00\x01\x00\x00\xeeX\x00\x00\x00\x01\x00\x00'
+  b'\xceW\x00\x00\x00\x01\x00\x00\xf4W\x00\x00\x00\x01\x00\x00\rX\x00\x00\x00\x01\x00\x00\x8bW\x00\x00\x00\x01\x00\x002X\x00\x00\x00\x01\x00\x001X\x00\x00\x00\x01\x00\x00\xacX\x00\x00\x00\x01\x00\x00\xe4\x14\x02\x00\x00\x01\x00\x00'
+  b'\xf2X\x00\x00\x00\x01\x00\x00\xf7X\x00\x00\x00\x01\x00\x00\x06Y\x00\x00\x00\x01\x00\x00\x1aY\x00\x00\x00\x01\x00\x00"Y\x00\x00\x00\x01\x00\x00bY\x00\x00\x00\x01\x00\x00\xa8\x16\x02\x00\x00\x01\x00\x00\xea\x16\x02\x00\x00\x01\x00\x00'
+  b"\xecY\x00\x00\x00\x01\x00\x00\x1bZ\x00\x00\x00\x01\x00\x00'Z\x00\x00\x00\x01\x00\x00\xd8Y\x00\x00\x00\x01\x00\x00fZ\x00\x00\x00\x01\x00\x00\xee6\x00\x00\x00\x01\x00\x00\xfc6\x00\x00\x00\x01\x00\x00\x08[\x00\x00\x00\x01\x00\x00"
+  b'>[\x00\x00\x00\x01\x00\x00>[\x00\x00\x00\x01\x00\x00\xc8\x19\x02\x00\x00\x01\x00\x00\xc3[\x00\x00\x00\x01\x00\x00\xd8[\x00\x00\x00\x01\x00\x00\xe7[\x00\x00\x00\x01\x00\x00\xf3[\x00\x00\x00\x01\x00\x00\x18\x1b\x02\x00\x00\x01\x00\x00'
+  b'\xff[\x00\x00\x00\x01\x00\x00\x06\\\x00\x00\x00\x01\x00\x00S_\x00\x00\x00\x01\x00\x00"\\\x00\x00\x00\x01\x00\x00\x817\x00\x00\x00\x01\x00\x00`\\\x00\x00\x00\x01\x00\x00n\\\x00\x00\x00\x01\x00\x00\xc0\\\x00\x00\x00\x01\x00\x00'
+  b'\x8d\\\x00\x00\x00\x01\x00\x00\xe4\x1d\x02\x00\x00\x01\x00\x00C]\x00\x00\x00\x01\x00\x00\xe6\x1d\x02\x00\x00\x01\x00\x00n]\x00\x00\x00\x01\x00\x00k]\x00\x00\x00\x01\x00\x00|]\x00\x00\x00\x01\x00\x00\xe1]\x00\x00\x00\x01\x00\x00'
+  b'\xe2]\x00\x00\x00\x01\x00\x00/8\x00\x00\x00\x01\x00\x00\xfd]\x00\x00\x00\x01\x00\x00(^\x00\x00\x00\x01\x00\x00=^\x00\x00\x00\x01\x00\x00i^\x00\x00\x00\x01\x00\x00b8\x00\x00\x00\x01\x00\x00\x83!\x02\x00\x00\x01\x00\x00'
+  b'|8\x00\x00\x00\x01\x00\x00\xb0^\x00\x00\x00\x01\x00\x00\xb3^\x00\x00\x00\x01\x00\x00\xb6^\x00\x00\x00\x01\x00\x00\xca^\x00\x00\x00\x01\x00\x00\x92\xa3\x02\x00\x00\x01\x00\x00\xfe^\x00\x00\x00\x01\x00\x001#\x02\x00\x00\x01\x00\x00'
+  b'1#\x02\x00\x00\x01\x00\x00\x01\x82\x00\x00\x00\x01\x00\x00"_\x00\x00\x00\x01\x00\x00"_\x00\x00\x00\x01\x00\x00\xc78\x00\x00\x00\x01\x00\x00\xb82\x02\x00\x00\x01\x00\x00\xdaa\x02\x00\x00\x01\x00\x00b_\x00\x00\x00\x01\x00\x00'
+  b'k_\x00\x00\x00\x01\x00\x00\xe38\x00\x00\x00\x01\x00\x00\x9a_\x00\x00\x00\x01\x00\x00\xcd_\x00\x00\x00\x01\x00\x00\xd7_\x00\x00\x00\x01\x00\x00\xf9_\x00\x00\x00\x01\x00\x00\x81`\x00\x00\x00\x01\x00\x00:9\x00\x00\x00\x01\x00\x00'
+  b'\x1c9\x00\x00\x00\x01\x00\x00\x94`\x00\x00\x00\x01\x00\x00\xd4&\x02\x00\x00\x01\x00\x00\xc7`\x00\x00\x00\x01\x00\x00Ha\x00\x00\x00\x01\x00\x00La\x00\x00\x00\x01\x00\x00Na\x00\x00\x00\x01\x00\x00La\x00\x00\x00\x01\x00\x00'
+  b'za\x00\x00\x00\x01\x00\x00\x8ea\x00\x00\x00\x01\x00\x00\xb2a\x00\x00\x00\x01\x00\x00\xa4a\x00\x00\x00\x01\x00\x00\xafa\x00\x00\x00\x01\x00\x00\xdea\x00\x00\x00\x01\x00\x00\xf2a\x00\x00\x00\x01\x00\x00\xf6a\x00\x00\x00\x01\x00\x00'
+  b'\x10b\x00\x00\x00\x01\x00\x00\x1bb\x00\x00\x00\x01\x00\x00]b\x00\x00\x00\x01\x00\x00\xb1b\x00\x00\x00\x01\x00\x00\xd4b\x00\x00\x00\x01\x00\x00Pc\x00\x00\x00\x01\x00\x00\x0c+\x02\x00\x00\x01\x00\x00=c\x00\x00\x00\x01\x00\x00'
+  b'\xfcb\x00\x00\x00\x01\x00\x00hc\x00\x00\x00\x01\x00\x00\x83c\x00\x00\x00\x01\x00\x00\xe4c\x00\x00\x00\x01\x00\x00\xf1+\x02\x00\x00\x01\x00\x00"d\x00\x00\x00\x01\x00\x00\xc5c\x00\x00\x00\x01\x00\x00\xa9c\x00\x00\x00\x01\x00\x00'
+  b'.:\x00\x00\x00\x01\x00\x00id\x00\x00\x00\x01\x00\x00~d\x00\x00\x00\x01\x00\x00\x9dd\x00\x00\x00\x01\x00\x00wd\x00\x00\x00\x01\x00\x00l:\x00\x00\x00\x01\x00\x00Oe\x00\x00\x00\x01\x00\x00le\x00\x00\x00\x01\x00\x00'
+  b'\n0\x02\x00\x00\x01\x00\x00\xe3e\x00\x00\x00\x01\x00\x00\xf8f\x00\x00\x00\x01\x00\x00If\x00\x00\x00\x01\x00\x00\x19;\x00\x00\x00\x01\x00\x00\x91f\x00\x00\x00\x01\x00\x00\x08;\x00\x00\x00\x01\x00\x00\xe4:\x00\x00\x00\x01\x00\x00'
+  b'\x92Q\x00\x00\x00\x01\x00\x00\x95Q\x00\x00\x00\x01\x00\x00\x00g\x00\x00\x00\x01\x00\x00\x9cf\x00\x00\x00\x01\x00\x00\xad\x80\x00\x00\x00\x01\x00\x00\xd9C\x00\x00\x00\x01\x00\x00\x17g\x00\x00\x00\x01\x00\x00\x1bg\x00\x00\x00\x01\x00\x00'
+  b'!g\x00\x00\x00\x01\x00\x00^g\x00\x00\x00\x01\x00\x00Sg\x00\x00\x00\x01\x00\x00\xc33\x02\x00\x00\x01\x00\x00I;\x00\x00\x00\x01\x00\x00\xfag\x00\x00\x00\x01\x00\x00\x85g\x00\x00\x00\x01\x00\x00Rh\x00\x00\x00\x01\x00\x00'
+  b'\x85h\x00\x00\x00\x01\x00\x00m4\x02\x00\x00\x01\x00\x00\x8eh\x00\x00\x00\x01\x00\x00\x1fh\x00\x00\x00\x01\x00\x00\x14i\x00\x00\x00\x01\x00\x00\x9d;\x00\x00\x00\x01\x00\x00Bi\x00\x00\x00\x01\x00\x00\xa3i\x00\x00\x00\x01\x00\x00'
+  b'\xeai\x00\x00\x00\x01\x00\x00\xa8j\x00\x00\x00\x01\x00\x00\xa36\x02\x00\x00\x01\x00\x00\xdbj\x00\x00\x00\x01\x00\x00\x18<\x00\x00\x00\x01\x00\x00!k\x00\x00\x00\x01\x00\x00\xa78\x02\x00\x00\x01\x00\x00Tk\x00\x00\x00\x01\x00\x00'
+  b'N<\x00\x00\x00\x01\x00\x00rk\x00\x00\x00\x01\x00\x00\x9fk\x00\x00\x00\x01\x00\x00\xbak\x00\x00\x00\x01\x00\x00\xbbk\x00\x00\x00\x01\x00\x00\x8d:\x02\x00\x00\x01\x00\x00\x0b\x1d\x02\x00\x00\x01\x00\x00\xfa:\x02\x00\x00\x01\x00\x00'
+  b'Nl\x00\x00\x00\x01\x00\x00\xbc<\x02\x00\x00\x01\x00\x00\xbfl\x00\x00\x00\x01\x00\x00\xcdl\x00\x00\x00\x01\x00\x00gl\x00\x00\x00\x01\x00\x00\x16m\x00\x00\x00\x01\x00\x00>m\x00\x00\x00\x01\x00\x00wm\x00\x00\x00\x01\x00\x00'
+  b'Am\x00\x00\x00\x01\x00\x00im\x00\x00\x00\x01\x00\x00xm\x00\x00\x00\x01\x00\x00\x85m\x00\x00\x00\x01\x00\x00\x1e=\x02\x00\x00\x01\x00\x004m\x00\x00\x00\x01\x00\x00/n\x00\x00\x00\x01\x00\x00nn\x00\x00\x00\x01\x00\x00'
+  b'3=\x00\x00\x00\x01\x00\x00\xcbn\x00\x00\x00\x01\x00\x00\xc7n\x00\x00\x00\x01\x00\x00\xd1>\x02\x00\x00\x01\x00\x00\xf9m\x00\x00\x00\x01\x00\x00no\x00\x00\x00\x01\x00\x00^?\x02\x00\x00\x01\x00\x00\x8e?\x02\x00\x00\x01\x00\x00'
+  b'\xc6o\x00\x00\x00\x01\x00\x009p\x00\x00\x00\x01\x00\x00\x1ep\x00\x00\x00\x01\x00\x00\x1bp\x00\x00\x00\x01\x00\x00\x96=\x00\x00\x00\x01\x00\x00Jp\x00\x00\x00\x01\x00\x00}p\x00\x00\x00\x01\x00\x00wp\x00\x00\x00\x01\x00\x00'
+  b'\xadp\x00\x00\x00\x01\x00\x00%\x05\x02\x00\x00\x01\x00\x00Eq\x00\x00\x00\x01\x00\x00cB\x02\x00\x00\x01\x00\x00\x9cq\x00\x00\x00\x01\x00\x00\xabC\x02\x00\x00\x01\x00\x00(r\x00\x00\x00\x01\x00\x005r\x00\x00\x00\x01\x00\x00'
+  b'Pr\x00\x00\x00\x01\x00\x00\x08F\x02\x00\x00\x01\x00\x00\x80r\x00\x00\x00\x01\x00\x00\x95r\x00\x00\x00\x01\x00\x005G\x02\x00\x00\x01\x00\x00\x14H\x02\x00\x00\x01\x00\x00zs\x00\x00\x00\x01\x00\x00\x8bs\x00\x00\x00\x01\x00\x00'
+  b'\xac>\x00\x00\x00\x01\x00\x00\xa5s\x00\x00\x00\x01\x00\x00\xb8>\x00\x00\x00\x01\x00\x00\xb8>\x00\x00\x00\x01\x00\x00Gt\x00\x00\x00\x01\x00\x00\\t\x00\x00\x00\x01\x00\x00qt\x00\x00\x00\x01\x00\x00\x85t\x00\x00\x00\x01\x00\x00'
+  b'\xcat\x00\x00\x00\x01\x00\x00\x1b?\x00\x00\x00\x01\x00\x00$u\x00\x00\x00\x01\x00\x006L\x02\x00\x00\x01\x00\x00>u\x00\x00\x00\x01\x00\x00\x92L\x02\x00\x00\x01\x00\x00pu\x00\x00\x00\x01\x00\x00\x9f!\x02\x00\x00\x01\x00\x00'
+  b'\x10v\x00\x00\x00\x01\x00\x00\xa1O\x02\x00\x00\x01\x00\x00\xb8O\x02\x00\x00\x01\x00\x00DP\x02\x00\x00\x01\x00\x00\xfc?\x00\x00\x00\x01\x00\x00\x08@\x00\x00\x00\x01\x00\x00\xf4v\x00\x00\x00\x01\x00\x00\xf3P\x02\x00\x00\x01\x00\x00'
+  b'\xf2P\x02\x00\x00\x01\x00\x00\x19Q\x02\x00\x00\x01\x00\x003Q\x02\x00\x00\x01\x00\x00\x1ew\x00\x00\x00\x01\x00\x00\x1fw\x00\x00\x00\x01\x00\x00\x1fw\x00\x00\x00\x01\x00\x00Jw\x00\x00\x00\x01\x00\x009@\x00\x00\x00\x01\x00\x00'
+  b'\x8bw\x00\x00\x00\x01\x00\x00F@\x00\x00\x00\x01\x00\x00\x96@\x00\x00\x00\x01\x00\x00\x1dT\x02\x00\x00\x01\x00\x00Nx\x00\x00\x00\x01\x00\x00\x8cx\x00\x00\x00\x01\x00\x00\xccx\x00\x00\x00\x01\x00\x00\xe3@\x00\x00\x00\x01\x00\x00'
+  b'&V\x02\x00\x00\x01\x00\x00Vy\x00\x00\x00\x01\x00\x00\x9aV\x02\x00\x00\x01\x00\x00\xc5V\x02\x00\x00\x01\x00\x00\x8fy\x00\x00\x00\x01\x00\x00\xeby\x00\x00\x00\x01\x00\x00/A\x00\x00\x00\x01\x00\x00@z\x00\x00\x00\x01\x00\x00'
+  b'Jz\x00\x00\x00\x01\x00\x00Oz\x00\x00\x00\x01\x00\x00|Y\x02\x00\x00\x01\x00\x00\xa7Z\x02\x00\x00\x01\x00\x00\xa7Z\x02\x00\x00\x01\x00\x00\xeez\x00\x00\x00\x01\x00\x00\x02B\x00\x00\x00\x01\x00\x00\xab[\x02\x00\x00\x01\x00\x00'
+  b"\xc6{\x00\x00\x00\x01\x00\x00\xc9{\x00\x00\x00\x01\x00\x00'B\x00\x00\x00\x01\x00\x00\x80\\\x02\x00\x00\x01\x00\x00\xd2|\x00\x00\x00\x01\x00\x00\xa0B\x00\x00\x00\x01\x00\x00\xe8|\x00\x00\x00\x01\x00\x00\xe3|\x00\x00\x00\x01\x00\x00"
+  b'\x00}\x00\x00\x00\x01\x00\x00\x86_\x02\x00\x00\x01\x00\x00c}\x00\x00\x00\x01\x00\x00\x01C\x00\x00\x00\x01\x00\x00\xc7}\x00\x00\x00\x01\x00\x00\x02~\x00\x00\x00\x01\x00\x00E~\x00\x00\x00\x01\x00\x004C\x00\x00\x00\x01\x00\x00'
+  b'(b\x02\x00\x00\x01\x00\x00Gb\x02\x00\x00\x01\x00\x00YC\x00\x00\x00\x01\x00\x00\xd9b\x02\x00\x00\x01\x00\x00z\x7f\x00\x00\x00\x01\x00\x00>c\x02\x00\x00\x01\x00\x00\x95\x7f\x00\x00\x00\x01\x00\x00\xfa\x7f\x00\x00\x00\x01\x00\x00'
+  b'\x05\x80\x00\x00\x00\x01\x00\x00\xdad\x02\x00\x00\x01\x00\x00#e\x02\x00\x00\x01\x00\x00`\x80\x00\x00\x00\x01\x00\x00\xa8e\x02\x00\x00\x01\x00\x00p\x80\x00\x00\x00\x01\x00\x00_3\x02\x00\x00\x01\x00\x00\xd5C\x00\x00\x00\x01\x00\x00'
+  b'\xb2\x80\x00\x00\x00\x01\x00\x00\x03\x81\x00\x00\x00\x01\x00\x00\x0bD\x00\x00\x00\x01\x00\x00>\x81\x00\x00\x00\x01\x00\x00\xb5Z\x00\x00\x00\x01\x00\x00\xa7g\x02\x00\x00\x01\x00\x00\xb5g\x02\x00\x00\x01\x00\x00\x933\x02\x00\x00\x01\x00\x00'
+  b'\x9c3\x02\x00\x00\x01\x00\x00\x01\x82\x00\x00\x00\x01\x00\x00\x04\x82\x00\x00\x00\x01\x00\x00\x9e\x8f\x00\x00\x00\x01\x00\x00kD\x00\x00\x00\x01\x00\x00\x91\x82\x00\x00\x00\x01\x00\x00\x8b\x82\x00\x00\x00\x01\x00\x00\x9d\x82\x00\x00\x00\x01\x00\x00'
+  b'\xb3R\x00\x00\x00\x01\x00\x00\xb1\x82\x00\x00\x00\x01\x00\x00\xb3\x82\x00\x00\x00\x01\x00\x00\xbd\x82\x00\x00\x00\x01\x00\x00\xe6\x82\x00\x00\x00\x01\x00\x00<k\x02\x00\x00\x01\x00\x00\xe5\x82\x00\x00\x00\x01\x00\x00\x1d\x83\x00\x00\x00\x01\x00\x00'
+  b'c\x83\x00\x00\x00\x01\x00\x00\xad\x83\x00\x00\x00\x01\x00\x00#\x83\x00\x00\x00\x01\x00\x00\xbd\x83\x00\x00\x00\x01\x00\x00\xe7\x83\x00\x00\x00\x01\x00\x00W\x84\x00\x00\x00\x01\x00\x00S\x83\x00\x00\x00\x01\x00\x00\xca\x83\x00\x00\x00\x01\x00\x00'
+  b'\xcc\x83\x00\x00\x00\x01\x00\x00\xdc\x83\x00\x00\x00\x01\x00\x006l\x02\x00\x00\x01\x00\x00km\x02\x00\x00\x01\x00\x00\xd5l\x02\x00\x00\x01\x00\x00+E\x00\x00\x00\x01\x00\x00\xf1\x84\x00\x00\x00\x01\x00\x00\xf3\x84\x00\x00\x00\x01\x00\x00'
+  b'\x16\x85\x00\x00\x00\x01\x00\x00\xcas\x02\x00\x00\x01\x00\x00d\x85\x00\x00\x00\x01\x00\x00,o\x02\x00\x00\x01\x00\x00]E\x00\x00\x00\x01\x00\x00aE\x00\x00\x00\x01\x00\x00\xb1o\x02\x00\x00\x01\x00\x00\xd2p\x02\x00\x00\x01\x00\x00'
+  b'kE\x00\x00\x00\x01\x00\x00P\x86\x00\x00\x00\x01\x00\x00\\\x86\x00\x00\x00\x01\x00\x00g\x86\x00\x00\x00\x01\x00\x00i\x86\x00\x00\x00\x01\x00\x00\xa9\x86\x00\x00\x00\x01\x00\x00\x88\x86\x00\x00\x00\x01\x00\x00\x0e\x87\x00\x00\x00\x01\x00\x00'
+  b'\xe2\x86\x00\x00\x00\x01\x00\x00y\x87\x00\x00\x00\x01\x00\x00(\x87\x00\x00\x00\x01\x00\x00k\x87\x00\x00\x00\x01\x00\x00\x86\x87\x00\x00\x00\x01\x00\x00\xd7E\x00\x00\x00\x01\x00\x00\xe1\x87\x00\x00\x00\x01\x00\x00\x01\x88\x00\x00\x00\x01\x00\x00'
+  b'\xf9E\x00\x00\x00\x01\x00\x00`\x88\x00\x00\x00\x01\x00\x00c\x88\x00\x00\x00\x01\x00\x00gv\x02\x00\x00\x01\x00\x00\xd7\x88\x00\x00\x00\x01\x00\x00\xde\x88\x00\x00\x00\x01\x00\x005F\x00\x00\x00\x01\x00\x00\xfa\x88\x00\x00\x00\x01\x00\x00'
+  b'\xbb4\x00\x00\x00\x01\x00\x00\xaex\x02\x00\x00\x01\x00\x00fy\x02\x00\x00\x01\x00\x00\xbeF\x00\x00\x00\x01\x00\x00\xc7F\x00\x00\x00\x01\x00\x00\xa0\x8a\x00\x00\x00\x01\x00\x00\xed\x8a\x00\x00\x00\x01\x00\x00\x8a\x8b\x00\x00\x00\x01\x00\x00'
+  b'U\x8c\x00\x00\x00\x01\x00\x00\xa8|\x02\x00\x00\x01\x00\x00\xab\x8c\x00\x00\x00\x01\x00\x00\xc1\x8c\x00\x00\x00\x01\x00\x00\x1b\x8d\x00\x00\x00\x01\x00\x00w\x8d\x00\x00\x00\x01\x00\x00/\x7f\x02\x00\x00\x01\x00\x00\x04\x08\x02\x00\x00\x01\x00\x00'
+  b'\xcb\x8d\x00\x00\x00\x01\x00\x00\xbc\x8d\x00\x00\x00\x01\x00\x00\xf0\x8d\x00\x00\x00\x01\x00\x00\xde\x08\x02\x00\x00\x01\x00\x00\xd4\x8e\x00\x00\x00\x01\x00\x008\x8f\x00\x00\x00\x01\x00\x00\xd2\x85\x02\x00\x00\x01\x00\x00\xed\x85\x02\x00\x00\x01\x00\x00'
+  b'\x94\x90\x00\x00\x00\x01\x00\x00\xf1\x90\x00\x00\x00\x01\x00\x00\x11\x91\x00\x00\x00\x01\x00\x00.\x87\x02\x00\x00\x01\x00\x00\x1b\x91\x00\x00\x00\x01\x00\x008\x92\x00\x00\x00\x01\x00\x00\xd7\x92\x00\x00\x00\x01\x00\x00\xd8\x92\x00\x00\x00\x01\x00\x00'
+  b'|\x92\x00\x00\x00\x01\x00\x00\xf9\x93\x00\x00\x00\x01\x00\x00\x15\x94\x00\x00\x00\x01\x00\x00\xfa\x8b\x02\x00\x00\x01\x00\x00\x8b\x95\x00\x00\x00\x01\x00\x00\x95I\x00\x00\x00\x01\x00\x00\xb7\x95\x00\x00\x00\x01\x00\x00w\x8d\x02\x00\x00\x01\x00\x00'
+  b'\xe6I\x00\x00\x00\x01\x00\x00\xc3\x96\x00\x00\x00\x01\x00\x00\xb2]\x00\x00\x00\x01\x00\x00#\x97\x00\x00\x00\x01\x00\x00E\x91\x02\x00\x00\x01\x00\x00\x1a\x92\x02\x00\x00\x01\x00\x00nJ\x00\x00\x00\x01\x00\x00vJ\x00\x00\x00\x01\x00\x00'
+  b'\xe0\x97\x00\x00\x00\x01\x00\x00\n\x94\x02\x00\x00\x01\x00\x00\xb2J\x00\x00\x00\x01\x00\x00\x96\x94\x02\x00\x00\x01\x00\x00\x0b\x98\x00\x00\x00\x01\x00\x00\x0b\x98\x00\x00\x00\x01\x00\x00)\x98\x00\x00\x00\x01\x00\x00\xb6\x95\x02\x00\x00\x01\x00\x00'
+  b'\xe2\x98\x00\x00\x00\x01\x00\x003K\x00\x00\x00\x01\x00\x00)\x99\x00\x00\x00\x01\x00\x00\xa7\x99\x00\x00\x00\x01\x00\x00\xc2\x99\x00\x00\x00\x01\x00\x00\xfe\x99\x00\x00\x00\x01\x00\x00\xceK\x00\x00\x00\x01\x00\x000\x9b\x02\x00\x00\x01\x00\x00'
+  b'\x12\x9b\x00\x00\x00\x01\x00\x00@\x9c\x00\x00\x00\x01\x00\x00\xfd\x9c\x00\x00\x00\x01\x00\x00\xceL\x00\x00\x00\x01\x00\x00\xedL\x00\x00\x00\x01\x00\x00g\x9d\x00\x00\x00\x01\x00\x00\xce\xa0\x02\x00\x00\x01\x00\x00\xf8L\x00\x00\x00\x01\x00\x00'
+  b'\x05\xa1\x02\x00\x00\x01\x00\x00\x0e\xa2\x02\x00\x00\x01\x00\x00\x91\xa2\x02\x00\x00\x01\x00\x00\xbb\x9e\x00\x00\x00\x01\x00\x00VM\x00\x00\x00\x01\x00\x00\xf9\x9e\x00\x00\x00\x01\x00\x00\xfe\x9e\x00\x00\x00\x01\x00\x00\x05\x9f\x00\x00\x00\x01\x00\x00'
+  b'\x0f\x9f\x00\x00\x00\x01\x00\x00\x16\x9f\x00\x00\x00\x01\x00\x00;\x9f\x00\x00\x00\x01\x00\x00\x00\xa6\x02\x00'
+))
+if byteorder == "big":  # pragma: no cover
+  decomp_data.byteswap()
+
+decomp_index1 = array('B', (
+  b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\x00\n\x0b\x0c\x00\x00\x00\x00\r\x0e\x0f\x00\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1c\x00\x00\x00\x1d\x1e\x1f !"'
+  b"#$%&'()\x00*+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00,-\x00\x00.\x00/\x00\x000123456789:\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00;<=\x00\x00\x00\x00\x00\x00>\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00?@ABCDEFGHIJKL'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00MN\x00\x00\x00O\x00\x00P\x00Q\x00\x00\x00\x00\x00\x00R\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00ST\x00\x00\x00\x00UVWXYZ[\\\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00]^\x00\x00\x00\x00_`a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00b\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00cdefg\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+
+decomp_index2 = array('H', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x00\x00\x00\x00\x00\x0b\x00\r\x00\x0f\x00\x12\x00\x00\x00\x00\x00\x14\x00\x17\x00\x19\x00\x00\x00\x1b\x00\x1f\x00#\x00\x00\x00'
+  b"'\x00*\x00-\x000\x003\x006\x00\x00\x009\x00<\x00?\x00B\x00E\x00H\x00K\x00N\x00Q\x00\x00\x00T\x00W\x00Z\x00]\x00`\x00c\x00\x00\x00\x00\x00f\x00i\x00l\x00o\x00r\x00\x00\x00\x00\x00"
+  b'u\x00x\x00{\x00~\x00\x81\x00\x84\x00\x00\x00\x87\x00\x8a\x00\x8d\x00\x90\x00\x93\x00\x96\x00\x99\x00\x9c\x00\x9f\x00\x00\x00\xa2\x00\xa5\x00\xa8\x00\xab\x00\xae\x00\xb1\x00\x00\x00\x00\x00\xb4\x00\xb7\x00\xba\x00\xbd\x00\xc0\x00\x00\x00\xc3\x00'
+  b'\xc6\x00\xc9\x00\xcc\x00\xcf\x00\xd2\x00\xd5\x00\xd8\x00\xdb\x00\xde\x00\xe1\x00\xe4\x00\xe7\x00\xea\x00\xed\x00\xf0\x00\xf3\x00\x00\x00\x00\x00\xf6\x00\xf9\x00\xfc\x00\xff\x00\x02\x01\x05\x01\x08\x01\x0b\x01\x0e\x01\x11\x01\x14\x01\x17\x01\x1a\x01\x1d\x01'
+  b' \x01#\x01&\x01)\x01,\x01/\x01\x00\x00\x00\x002\x015\x018\x01;\x01>\x01A\x01D\x01G\x01J\x01\x00\x00M\x01P\x01S\x01V\x01Y\x01\\\x01\x00\x00_\x01b\x01e\x01h\x01k\x01n\x01q\x01'
+  b't\x01\x00\x00\x00\x00w\x01z\x01}\x01\x80\x01\x83\x01\x86\x01\x89\x01\x00\x00\x00\x00\x8c\x01\x8f\x01\x92\x01\x95\x01\x98\x01\x9b\x01\x00\x00\x00\x00\x9e\x01\xa1\x01\xa4\x01\xa7\x01\xaa\x01\xad\x01\xb0\x01\xb3\x01\xb6\x01\xb9\x01\xbc\x01\xbf\x01'
+  b'\xc2\x01\xc5\x01\xc8\x01\xcb\x01\xce\x01\xd1\x01\x00\x00\x00\x00\xd4\x01\xd7\x01\xda\x01\xdd\x01\xe0\x01\xe3\x01\xe6\x01\xe9\x01\xec\x01\xef\x01\xf2\x01\xf5\x01\xf8\x01\xfb\x01\xfe\x01\x01\x02\x04\x02\x07\x02\n\x02\r\x02\x10\x02\x13\x02\x16\x02\x19\x02'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x1b\x02\x1e\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00!\x02$\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b"\x00\x00\x00\x00\x00\x00\x00\x00'\x02*\x02-\x020\x023\x026\x029\x02<\x02?\x02B\x02E\x02H\x02K\x02N\x02Q\x02T\x02W\x02Z\x02]\x02`\x02c\x02f\x02i\x02l\x02o\x02\x00\x00r\x02u\x02"
+  b'x\x02{\x02~\x02\x81\x02\x00\x00\x00\x00\x84\x02\x87\x02\x8a\x02\x8d\x02\x90\x02\x93\x02\x96\x02\x99\x02\x9c\x02\x9f\x02\xa2\x02\xa5\x02\xa8\x02\xab\x02\xae\x02\xb1\x02\x00\x00\x00\x00\xb4\x02\xb7\x02\xba\x02\xbd\x02\xc0\x02\xc3\x02\xc6\x02\xc9\x02'
+  b'\xcc\x02\xcf\x02\xd2\x02\xd5\x02\xd8\x02\xdb\x02\xde\x02\xe1\x02\xe4\x02\xe7\x02\xea\x02\xed\x02\xf0\x02\xf3\x02\xf6\x02\xf9\x02\xfc\x02\xff\x02\x02\x03\x05\x03\x08\x03\x0b\x03\x0e\x03\x11\x03\x14\x03\x17\x03\x1a\x03\x1d\x03\x00\x00\x00\x00 \x03#\x03'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00&\x03)\x03,\x03/\x032\x035\x038\x03;\x03>\x03A\x03D\x03G\x03J\x03M\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00P\x03R\x03T\x03V\x03X\x03Z\x03\\\x03^\x03`\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00b\x03e\x03h\x03k\x03n\x03q\x03\x00\x00\x00\x00'
+  b't\x03v\x03x\x03z\x03|\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'~\x03\x80\x03\x00\x00\x82\x03\x84\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x87\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x89\x03\x00\x00\x00\x00\x00\x00\x8c\x03\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x8e\x03\x91\x03\x94\x03\x97\x03\x99\x03\x9c\x03\x9f\x03\x00\x00\xa2\x03\x00\x00\xa5\x03\xa8\x03\xab\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xae\x03\xb1\x03\xb4\x03\xb7\x03\xba\x03\xbd\x03\xc0\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc3\x03\xc6\x03\xc9\x03\xcc\x03\xcf\x03\x00\x00\xd2\x03\xd4\x03\xd6\x03\xd8\x03\xdb\x03\xde\x03\xe0\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe2\x03\xe4\x03\xe6\x03\x00\x00\xe8\x03\xea\x03\x00\x00\x00\x00\x00\x00\xec\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\xee\x03\xf1\x03\x00\x00\xf4\x03\x00\x00\x00\x00\x00\x00\xf7\x03\x00\x00\x00\x00\x00\x00\x00\x00\xfa\x03\xfd\x03\x00\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\t\x04\x0c\x04\x00\x00\x0f\x04\x00\x00\x00\x00\x00\x00\x12\x04\x00\x00\x00\x00\x00\x00\x00\x00\x15\x04\x18\x04\x1b\x04\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1e\x04!\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b"\x00\x00$\x04'\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00*\x04-\x040\x043\x04\x00\x00\x00\x006\x049\x04\x00\x00\x00\x00<\x04?\x04B\x04E\x04H\x04K\x04"
+  b'\x00\x00\x00\x00N\x04Q\x04T\x04W\x04Z\x04]\x04\x00\x00\x00\x00`\x04c\x04f\x04i\x04l\x04o\x04r\x04u\x04x\x04{\x04~\x04\x81\x04\x00\x00\x00\x00\x84\x04\x87\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8a\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x8d\x04\x90\x04\x93\x04\x96\x04\x99\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x9c\x04\x9f\x04\xa2\x04\xa5\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\xa8\x04\x00\x00\xab\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xae\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb1\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb4\x04\x00\x00\x00\x00\xb7\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xba\x04\xbd\x04\xc0\x04\xc3\x04\xc6\x04\xc9\x04\xcc\x04\xcf\x04'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd2\x04\xd5\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd8\x04\xdb\x04\x00\x00\xde\x04'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe1\x04\x00\x00\x00\x00\xe4\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe7\x04\xea\x04\xed\x04\x00\x00\x00\x00\xf0\x04\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x04\x00\x00\x00\x00\xf6\x04\xf9\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\x04\xff\x04\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x05\x05\x08\x05\x0b\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0e\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x11\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x14\x05\x17\x05\x00\x00\x1a\x05\x1d\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00 \x05#\x05&\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00)\x05\x00\x00,\x05/\x052\x05\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x005\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x008\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00;\x05>\x05\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00A\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00C\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00F\x05\x00\x00\x00\x00\x00\x00\x00\x00I\x05\x00\x00\x00\x00\x00\x00\x00\x00L\x05\x00\x00\x00\x00\x00\x00\x00\x00O\x05\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00R\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00U\x05\x00\x00X\x05[\x05^\x05a\x05d\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00g\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00j\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00m\x05\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00p\x05\x00\x00\x00\x00\x00\x00\x00\x00s\x05\x00\x00\x00\x00\x00\x00\x00\x00v\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00y\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x05\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x81\x05\x00\x00\x84\x05\x00\x00\x87\x05\x00\x00\x8a\x05\x00\x00\x8d\x05\x00\x00\x00\x00\x00\x00\x90\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x05\x00\x00\x96\x05\x00\x00\x00\x00'
+  b'\x99\x05\x9c\x05\x00\x00\x9f\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa2\x05\xa4\x05\xa6\x05\x00\x00\xa8\x05\xaa\x05\xac\x05\xae\x05\xb0\x05\xb2\x05\xb4\x05\xb6\x05\xb8\x05\xba\x05\xbc\x05\x00\x00\xbe\x05\xc0\x05\xc2\x05\xc4\x05'
+  b'\xc6\x05\xc8\x05\xca\x05\xcc\x05\xce\x05\xd0\x05\xd2\x05\xd4\x05\xd6\x05\xd8\x05\xda\x05\xdc\x05\xde\x05\xe0\x05\x00\x00\xe2\x05\xe4\x05\xe6\x05\xe8\x05\xea\x05\xec\x05\xee\x05\xf0\x05\xf2\x05\xf4\x05\xf6\x05\xf8\x05\xfa\x05\xfc\x05\xfe\x05\x00\x06\x02\x06'
+  b'\x04\x06\x06\x06\x08\x06\n\x06\x0c\x06\x0e\x06\x10\x06\x12\x06\x14\x06\x16\x06\x18\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1c\x06\x1e\x06 \x06"\x06$\x06'
+  b'&\x06(\x06*\x06,\x06.\x060\x062\x064\x066\x068\x06:\x06<\x06>\x06@\x06B\x06D\x06F\x06H\x06J\x06L\x06N\x06P\x06R\x06T\x06V\x06X\x06Z\x06\\\x06^\x06`\x06b\x06d\x06'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'f\x06i\x06l\x06o\x06r\x06u\x06x\x06{\x06~\x06\x81\x06\x84\x06\x87\x06\x8a\x06\x8d\x06\x90\x06\x93\x06\x96\x06\x99\x06\x9c\x06\x9f\x06\xa2\x06\xa5\x06\xa8\x06\xab\x06\xae\x06\xb1\x06\xb4\x06\xb7\x06\xba\x06\xbd\x06\xc0\x06\xc3\x06'
+  b'\xc6\x06\xc9\x06\xcc\x06\xcf\x06\xd2\x06\xd5\x06\xd8\x06\xdb\x06\xde\x06\xe1\x06\xe4\x06\xe7\x06\xea\x06\xed\x06\xf0\x06\xf3\x06\xf6\x06\xf9\x06\xfc\x06\xff\x06\x02\x07\x05\x07\x08\x07\x0b\x07\x0e\x07\x11\x07\x14\x07\x17\x07\x1a\x07\x1d\x07 \x07#\x07'
+  b'&\x07)\x07,\x07/\x072\x075\x078\x07;\x07>\x07A\x07D\x07G\x07J\x07M\x07P\x07S\x07V\x07Y\x07\\\x07_\x07b\x07e\x07h\x07k\x07n\x07q\x07t\x07w\x07z\x07}\x07\x80\x07\x83\x07'
+  b'\x86\x07\x89\x07\x8c\x07\x8f\x07\x92\x07\x95\x07\x98\x07\x9b\x07\x9e\x07\xa1\x07\xa4\x07\xa7\x07\xaa\x07\xad\x07\xb0\x07\xb3\x07\xb6\x07\xb9\x07\xbc\x07\xbf\x07\xc2\x07\xc5\x07\xc8\x07\xcb\x07\xce\x07\xd1\x07\xd4\x07\xd7\x07\xda\x07\xdd\x07\xe0\x07\xe3\x07'
+  b'\xe6\x07\xe9\x07\xec\x07\xef\x07\xf2\x07\xf5\x07\xf8\x07\xfb\x07\xfe\x07\x01\x08\x04\x08\x07\x08\n\x08\r\x08\x10\x08\x13\x08\x16\x08\x19\x08\x1c\x08\x1f\x08"\x08%\x08(\x08+\x08.\x081\x084\x087\x08\x00\x00\x00\x00\x00\x00\x00\x00'
+  b':\x08=\x08@\x08C\x08F\x08I\x08L\x08O\x08R\x08U\x08X\x08[\x08^\x08a\x08d\x08g\x08j\x08m\x08p\x08s\x08v\x08y\x08|\x08\x7f\x08\x82\x08\x85\x08\x88\x08\x8b\x08\x8e\x08\x91\x08\x94\x08\x97\x08'
+  b'\x9a\x08\x9d\x08\xa0\x08\xa3\x08\xa6\x08\xa9\x08\xac\x08\xaf\x08\xb2\x08\xb5\x08\xb8\x08\xbb\x08\xbe\x08\xc1\x08\xc4\x08\xc7\x08\xca\x08\xcd\x08\xd0\x08\xd3\x08\xd6\x08\xd9\x08\xdc\x08\xdf\x08\xe2\x08\xe5\x08\xe8\x08\xeb\x08\xee\x08\xf1\x08\xf4\x08\xf7\x08'
+  b"\xfa\x08\xfd\x08\x00\t\x03\t\x06\t\t\t\x0c\t\x0f\t\x12\t\x15\t\x18\t\x1b\t\x1e\t!\t$\t'\t*\t-\t0\t3\t6\t9\t<\t?\tB\tE\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+  b'H\tK\tN\tQ\tT\tW\tZ\t]\t`\tc\tf\ti\tl\to\tr\tu\tx\t{\t~\t\x81\t\x84\t\x87\t\x00\x00\x00\x00\x8a\t\x8d\t\x90\t\x93\t\x96\t\x99\t\x00\x00\x00\x00'
+  b'\x9c\t\x9f\t\xa2\t\xa5\t\xa8\t\xab\t\xae\t\xb1\t\xb4\t\xb7\t\xba\t\xbd\t\xc0\t\xc3\t\xc6\t\xc9\t\xcc\t\xcf\t\xd2\t\xd5\t\xd8\t\xdb\t\xde\t\xe1\t\xe4\t\xe7\t\xea\t\xed\t\xf0\t\xf3\t\xf6\t\xf9\t'
+  b'\xfc\t\xff\t\x02\n\x05\n\x08\n\x0b\n\x00\x00\x00\x00\x0e\n\x11\n\x14\n\x17\n\x1a\n\x1d\n\x00\x00\x00\x00 \n#\n&\n)\n,\n/\n2\n5\n\x00\x008\n\x00\x00;\n\x00\x00>\n\x00\x00A\n'
+  b'D\nG\nJ\nM\nP\nS\nV\nY\n\\\n_\nb\ne\nh\nk\nn\nq\nt\nw\ny\n|\n~\n\x81\n\x83\n\x86\n\x88\n\x8b\n\x8d\n\x90\n\x92\n\x95\n\x00\x00\x00\x00'
+  b'\x97\n\x9a\n\x9d\n\xa0\n\xa3\n\xa6\n\xa9\n\xac\n\xaf\n\xb2\n\xb5\n\xb8\n\xbb\n\xbe\n\xc1\n\xc4\n\xc7\n\xca\n\xcd\n\xd0\n\xd3\n\xd6\n\xd9\n\xdc\n\xdf\n\xe2\n\xe5\n\xe8\n\xeb\n\xee\n\xf1\n\xf4\n'
+  b"\xf7\n\xfa\n\xfd\n\x00\x0b\x03\x0b\x06\x0b\t\x0b\x0c\x0b\x0f\x0b\x12\x0b\x15\x0b\x18\x0b\x1b\x0b\x1e\x0b!\x0b$\x0b'\x0b*\x0b-\x0b0\x0b3\x0b\x00\x006\x0b9\x0b<\x0b?\x0bB\x0bE\x0bG\x0bJ\x0bM\x0bO\x0b"
+  b'R\x0bU\x0bX\x0b[\x0b^\x0b\x00\x00a\x0bd\x0bg\x0bj\x0bl\x0bo\x0bq\x0bt\x0bw\x0bz\x0b}\x0b\x80\x0b\x83\x0b\x86\x0b\x00\x00\x00\x00\x88\x0b\x8b\x0b\x8e\x0b\x91\x0b\x94\x0b\x97\x0b\x00\x00\x99\x0b\x9c\x0b\x9f\x0b'
+  b'\xa2\x0b\xa5\x0b\xa8\x0b\xab\x0b\xad\x0b\xb0\x0b\xb3\x0b\xb6\x0b\xb9\x0b\xbc\x0b\xbf\x0b\xc2\x0b\xc4\x0b\xc7\x0b\xca\x0b\xcc\x0b\x00\x00\x00\x00\xce\x0b\xd1\x0b\xd4\x0b\x00\x00\xd7\x0b\xda\x0b\xdd\x0b\xe0\x0b\xe2\x0b\xe5\x0b\xe7\x0b\xea\x0b\xec\x0b\x00\x00'
+  b'\xef\x0b\xf1\x0b\xf3\x0b\xf5\x0b\xf7\x0b\xf9\x0b\xfb\x0b\xfd\x0b\xff\x0b\x01\x0c\x03\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x05\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\n\x0c\x0c\x0c\x0f\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x13\x0c\x00\x00\x00\x00\x00\x00\x15\x0c\x18\x0c\x00\x00\x1c\x0c\x1f\x0c\x00\x00\x00\x00\x00\x00\x00\x00#\x0c\x00\x00&\x0c\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00)\x0c,\x0c/\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x002\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x007\x0c'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x009\x0c;\x0c\x00\x00\x00\x00=\x0c?\x0cA\x0cC\x0cE\x0cG\x0cI\x0cK\x0cM\x0cO\x0cQ\x0cS\x0c'
+  b'U\x0cW\x0cY\x0c[\x0c]\x0c_\x0ca\x0cc\x0ce\x0cg\x0ci\x0ck\x0cm\x0co\x0cq\x0c\x00\x00s\x0cu\x0cw\x0cy\x0c{\x0c}\x0c\x7f\x0c\x81\x0c\x83\x0c\x85\x0c\x87\x0c\x89\x0c\x8b\x0c\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x90\x0c\x94\x0c\x98\x0c\x9a\x0c\x00\x00\x9d\x0c\xa1\x0c\xa5\x0c\x00\x00\xa7\x0c\xaa\x0c\xac\x0c\xae\x0c\xb0\x0c\xb2\x0c\xb4\x0c\xb6\x0c\xb8\x0c\xba\x0c\xbc\x0c\x00\x00\xbe\x0c\xc0\x0c\x00\x00\x00\x00\xc3\x0c\xc5\x0c\xc7\x0c\xc9\x0c\xcb\x0c\x00\x00\x00\x00'
+  b'\xcd\x0c\xd0\x0c\xd4\x0c\x00\x00\xd7\x0c\x00\x00\xd9\x0c\x00\x00\xdb\x0c\x00\x00\xdd\x0c\xdf\x0c\xe1\x0c\xe3\x0c\x00\x00\xe5\x0c\xe7\x0c\xe9\x0c\x00\x00\xeb\x0c\xed\x0c\xef\x0c\xf1\x0c\xf3\x0c\xf5\x0c\xf7\x0c\x00\x00\xf9\x0c\xfd\x0c\xff\x0c\x01\r\x03\r'
+  b'\x05\r\x00\x00\x00\x00\x00\x00\x00\x00\x07\r\t\r\x0b\r\r\r\x0f\r\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x11\r\x15\r\x19\r\x1e\r"\r&\r*\r.\r2\r6\r:\r>\rB\rF\rJ\rN\r'
+  b'Q\rS\rV\rZ\r]\r_\rb\rf\rk\rn\rp\rs\rw\ry\r{\r}\r\x7f\r\x81\r\x84\r\x88\r\x8b\r\x8d\r\x90\r\x94\r\x99\r\x9c\r\x9e\r\xa1\r\xa5\r\xa7\r\xa9\r\xab\r'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xad\r\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb1\r\xb4\r\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb7\r\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xba\r\xbd\r\xc0\r\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\xc3\r\x00\x00\x00\x00\x00\x00\x00\x00\xc6\r\x00\x00\x00\x00\xc9\r\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\xcc\r\x00\x00\xcf\r\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd2\r\xd5\r\x00\x00\xd9\r\xdc\r\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\xe0\r\x00\x00\x00\x00\xe3\r\x00\x00\x00\x00\xe6\r\x00\x00\xe9\r\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\xec\r\x00\x00\xef\r\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf2\r\xf5\r\xf8\r\xfb\r\xfe\r\x00\x00\x00\x00\x01\x0e\x04\x0e\x00\x00\x00\x00\x07\x0e\n\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\r\x0e\x10\x0e\x00\x00\x00\x00\x13\x0e\x16\x0e\x00\x00\x00\x00\x19\x0e\x1c\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x0e"\x0e%\x0e(\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'+\x0e.\x0e1\x0e4\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x007\x0e:\x0e=\x0e@\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00C\x0eE\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'G\x0eI\x0eK\x0eM\x0eO\x0eQ\x0eS\x0eU\x0eW\x0eY\x0e\\\x0e_\x0eb\x0ee\x0eh\x0ek\x0en\x0eq\x0et\x0ew\x0ez\x0e~\x0e\x82\x0e\x86\x0e\x8a\x0e\x8e\x0e\x92\x0e\x96\x0e\x9a\x0e\x9e\x0e\xa3\x0e\xa8\x0e'
+  b'\xad\x0e\xb2\x0e\xb7\x0e\xbc\x0e\xc1\x0e\xc6\x0e\xcb\x0e\xd0\x0e\xd5\x0e\xd8\x0e\xdb\x0e\xde\x0e\xe1\x0e\xe4\x0e\xe7\x0e\xea\x0e\xed\x0e\xf0\x0e\xf4\x0e\xf8\x0e\xfc\x0e\x00\x0f\x04\x0f\x08\x0f\x0c\x0f\x10\x0f\x14\x0f\x18\x0f\x1c\x0f \x0f$\x0f(\x0f'
+  b',\x0f0\x0f4\x0f8\x0f<\x0f@\x0fD\x0fH\x0fL\x0fP\x0fT\x0fX\x0f\\\x0f`\x0fd\x0fh\x0fl\x0fp\x0ft\x0fx\x0f|\x0f\x80\x0f\x84\x0f\x86\x0f\x88\x0f\x8a\x0f\x8c\x0f\x8e\x0f\x90\x0f\x92\x0f\x94\x0f\x96\x0f'
+  b'\x98\x0f\x9a\x0f\x9c\x0f\x9e\x0f\xa0\x0f\xa2\x0f\xa4\x0f\xa6\x0f\xa8\x0f\xaa\x0f\xac\x0f\xae\x0f\xb0\x0f\xb2\x0f\xb4\x0f\xb6\x0f\xb8\x0f\xba\x0f\xbc\x0f\xbe\x0f\xc0\x0f\xc2\x0f\xc4\x0f\xc6\x0f\xc8\x0f\xca\x0f\xcc\x0f\xce\x0f\xd0\x0f\xd2\x0f\xd4\x0f\xd6\x0f'
+  b'\xd8\x0f\xda\x0f\xdc\x0f\xde\x0f\xe0\x0f\xe2\x0f\xe4\x0f\xe6\x0f\xe8\x0f\xea\x0f\xec\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xee\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x0f\xf7\x0f\xfa\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\x0f\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x10\x03\x10\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x05\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x10'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\t\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b"\x0b\x10\r\x10\x0f\x10\x11\x10\x13\x10\x15\x10\x17\x10\x19\x10\x1b\x10\x1d\x10\x1f\x10!\x10#\x10%\x10'\x10)\x10+\x10-\x10/\x101\x103\x105\x107\x109\x10;\x10=\x10?\x10A\x10C\x10E\x10G\x10I\x10"
+  b'K\x10M\x10O\x10Q\x10S\x10U\x10W\x10Y\x10[\x10]\x10_\x10a\x10c\x10e\x10g\x10i\x10k\x10m\x10o\x10q\x10s\x10u\x10w\x10y\x10{\x10}\x10\x7f\x10\x81\x10\x83\x10\x85\x10\x87\x10\x89\x10'
+  b'\x8b\x10\x8d\x10\x8f\x10\x91\x10\x93\x10\x95\x10\x97\x10\x99\x10\x9b\x10\x9d\x10\x9f\x10\xa1\x10\xa3\x10\xa5\x10\xa7\x10\xa9\x10\xab\x10\xad\x10\xaf\x10\xb1\x10\xb3\x10\xb5\x10\xb7\x10\xb9\x10\xbb\x10\xbd\x10\xbf\x10\xc1\x10\xc3\x10\xc5\x10\xc7\x10\xc9\x10'
+  b'\xcb\x10\xcd\x10\xcf\x10\xd1\x10\xd3\x10\xd5\x10\xd7\x10\xd9\x10\xdb\x10\xdd\x10\xdf\x10\xe1\x10\xe3\x10\xe5\x10\xe7\x10\xe9\x10\xeb\x10\xed\x10\xef\x10\xf1\x10\xf3\x10\xf5\x10\xf7\x10\xf9\x10\xfb\x10\xfd\x10\xff\x10\x01\x11\x03\x11\x05\x11\x07\x11\t\x11'
+  b"\x0b\x11\r\x11\x0f\x11\x11\x11\x13\x11\x15\x11\x17\x11\x19\x11\x1b\x11\x1d\x11\x1f\x11!\x11#\x11%\x11'\x11)\x11+\x11-\x11/\x111\x113\x115\x117\x119\x11;\x11=\x11?\x11A\x11C\x11E\x11G\x11I\x11"
+  b'K\x11M\x11O\x11Q\x11S\x11U\x11W\x11Y\x11[\x11]\x11_\x11a\x11c\x11e\x11g\x11i\x11k\x11m\x11o\x11q\x11s\x11u\x11w\x11y\x11{\x11}\x11\x7f\x11\x81\x11\x83\x11\x85\x11\x87\x11\x89\x11'
+  b'\x8b\x11\x8d\x11\x8f\x11\x91\x11\x93\x11\x95\x11\x97\x11\x99\x11\x9b\x11\x9d\x11\x9f\x11\xa1\x11\xa3\x11\xa5\x11\xa7\x11\xa9\x11\xab\x11\xad\x11\xaf\x11\xb1\x11\xb3\x11\xb5\x11\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\xb7\x11\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb9\x11\x00\x00\xbb\x11\xbd\x11\xbf\x11\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc1\x11\x00\x00\xc4\x11\x00\x00\xc7\x11\x00\x00\xca\x11\x00\x00\xcd\x11\x00\x00\xd0\x11\x00\x00\xd3\x11\x00\x00\xd6\x11\x00\x00\xd9\x11\x00\x00\xdc\x11\x00\x00'
+  b'\xdf\x11\x00\x00\xe2\x11\x00\x00\x00\x00\xe5\x11\x00\x00\xe8\x11\x00\x00\xeb\x11\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xee\x11\xf1\x11\x00\x00\xf4\x11\xf7\x11\x00\x00\xfa\x11\xfd\x11\x00\x00\x00\x12\x03\x12\x00\x00\x06\x12\t\x12\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x12\x12\x12\x00\x00\x15\x12\x18\x12'
+  b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x12\x00\x00\x1e\x12\x00\x00!\x12\x00\x00$\x12\x00\x00'\x12\x00\x00*\x12\x00\x00-\x12\x00\x000\x12\x00\x003\x12\x00\x006\x12\x00\x00"
+  b'9\x12\x00\x00<\x12\x00\x00\x00\x00?\x12\x00\x00B\x12\x00\x00E\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x12K\x12\x00\x00N\x12Q\x12\x00\x00T\x12W\x12\x00\x00Z\x12]\x12\x00\x00`\x12c\x12\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00f\x12\x00\x00\x00\x00i\x12l\x12o\x12r\x12\x00\x00\x00\x00\x00\x00u\x12x\x12'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00{\x12}\x12\x7f\x12\x81\x12\x83\x12\x85\x12\x87\x12\x89\x12\x8b\x12\x8d\x12\x8f\x12\x91\x12\x93\x12\x95\x12\x97\x12'
+  b'\x99\x12\x9b\x12\x9d\x12\x9f\x12\xa1\x12\xa3\x12\xa5\x12\xa7\x12\xa9\x12\xab\x12\xad\x12\xaf\x12\xb1\x12\xb3\x12\xb5\x12\xb7\x12\xb9\x12\xbb\x12\xbd\x12\xbf\x12\xc1\x12\xc3\x12\xc5\x12\xc7\x12\xc9\x12\xcb\x12\xcd\x12\xcf\x12\xd1\x12\xd3\x12\xd5\x12\xd7\x12'
+  b'\xd9\x12\xdb\x12\xdd\x12\xdf\x12\xe1\x12\xe3\x12\xe5\x12\xe7\x12\xe9\x12\xeb\x12\xed\x12\xef\x12\xf1\x12\xf3\x12\xf5\x12\xf7\x12\xf9\x12\xfb\x12\xfd\x12\xff\x12\x01\x13\x03\x13\x05\x13\x07\x13\t\x13\x0b\x13\r\x13\x0f\x13\x11\x13\x13\x13\x15\x13\x17\x13'
+  b"\x19\x13\x1b\x13\x1d\x13\x1f\x13!\x13#\x13%\x13'\x13)\x13+\x13-\x13/\x131\x133\x135\x13\x00\x00\x00\x00\x00\x007\x139\x13;\x13=\x13?\x13A\x13C\x13E\x13G\x13I\x13K\x13M\x13O\x13Q\x13"
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'S\x13W\x13[\x13_\x13c\x13g\x13k\x13o\x13s\x13w\x13{\x13\x7f\x13\x83\x13\x87\x13\x8b\x13\x90\x13\x95\x13\x9a\x13\x9f\x13\xa4\x13\xa9\x13\xae\x13\xb3\x13\xb8\x13\xbd\x13\xc2\x13\xc7\x13\xcc\x13\xd1\x13\xd6\x13\xde\x13\x00\x00'
+  b'\xe5\x13\xe9\x13\xed\x13\xf1\x13\xf5\x13\xf9\x13\xfd\x13\x01\x14\x05\x14\t\x14\r\x14\x11\x14\x15\x14\x19\x14\x1d\x14!\x14%\x14)\x14-\x141\x145\x149\x14=\x14A\x14E\x14I\x14M\x14Q\x14U\x14Y\x14]\x14a\x14'
+  b'e\x14i\x14m\x14q\x14u\x14w\x14y\x14{\x14\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00}\x14\x81\x14\x84\x14\x87\x14\x8a\x14\x8d\x14\x90\x14\x93\x14\x96\x14\x99\x14\x9c\x14\x9f\x14\xa2\x14\xa5\x14\xa8\x14\xab\x14'
+  b'\xae\x14\xb0\x14\xb2\x14\xb4\x14\xb6\x14\xb8\x14\xba\x14\xbc\x14\xbe\x14\xc0\x14\xc2\x14\xc4\x14\xc6\x14\xc8\x14\xca\x14\xcd\x14\xd0\x14\xd3\x14\xd6\x14\xd9\x14\xdc\x14\xdf\x14\xe2\x14\xe5\x14\xe8\x14\xeb\x14\xee\x14\xf1\x14\xf4\x14\xfa\x14\xff\x14\x00\x00'
+  b'\x02\x15\x04\x15\x06\x15\x08\x15\n\x15\x0c\x15\x0e\x15\x10\x15\x12\x15\x14\x15\x16\x15\x18\x15\x1a\x15\x1c\x15\x1e\x15 \x15"\x15$\x15&\x15(\x15*\x15,\x15.\x150\x152\x154\x156\x158\x15:\x15<\x15>\x15@\x15'
+  b'B\x15D\x15F\x15H\x15J\x15L\x15N\x15P\x15R\x15T\x15V\x15X\x15Z\x15\\\x15^\x15`\x15b\x15d\x15g\x15j\x15m\x15p\x15s\x15v\x15y\x15|\x15\x7f\x15\x82\x15\x85\x15\x88\x15\x8b\x15\x8e\x15'
+  b'\x91\x15\x94\x15\x97\x15\x9a\x15\x9d\x15\xa0\x15\xa3\x15\xa6\x15\xa9\x15\xac\x15\xb0\x15\xb4\x15\xb8\x15\xbb\x15\xbf\x15\xc2\x15\xc6\x15\xc8\x15\xca\x15\xcc\x15\xce\x15\xd0\x15\xd2\x15\xd4\x15\xd6\x15\xd8\x15\xda\x15\xdc\x15\xde\x15\xe0\x15\xe2\x15\xe4\x15'
+  b'\xe6\x15\xe8\x15\xea\x15\xec\x15\xee\x15\xf0\x15\xf2\x15\xf4\x15\xf6\x15\xf8\x15\xfa\x15\xfc\x15\xfe\x15\x00\x16\x02\x16\x04\x16\x06\x16\x08\x16\n\x16\x0c\x16\x0e\x16\x10\x16\x12\x16\x14\x16\x16\x16\x18\x16\x1a\x16\x1c\x16\x1e\x16 \x16"\x16$\x16'
+  b"'\x16,\x161\x166\x16:\x16?\x16C\x16G\x16M\x16R\x16V\x16Z\x16^\x16c\x16h\x16l\x16p\x16s\x16w\x16|\x16\x81\x16\x84\x16\x8a\x16\x91\x16\x97\x16\x9b\x16\xa1\x16\xa7\x16\xac\x16\xb0\x16\xb4\x16\xb8\x16"
+  b'\xbd\x16\xc3\x16\xc8\x16\xcc\x16\xd0\x16\xd4\x16\xd7\x16\xda\x16\xdd\x16\xe0\x16\xe4\x16\xe8\x16\xee\x16\xf2\x16\xf7\x16\xfd\x16\x01\x17\x04\x17\x07\x17\r\x17\x12\x17\x18\x17\x1c\x17"\x17%\x17)\x17-\x171\x175\x179\x17>\x17B\x17'
+  b'E\x17I\x17M\x17Q\x17V\x17Z\x17^\x17b\x17h\x17m\x17p\x17v\x17y\x17~\x17\x83\x17\x87\x17\x8b\x17\x8f\x17\x94\x17\x97\x17\x9b\x17\xa0\x17\xa3\x17\xa9\x17\xad\x17\xb0\x17\xb3\x17\xb6\x17\xb9\x17\xbc\x17\xbf\x17\xc2\x17'
+  b'\xc5\x17\xc8\x17\xcb\x17\xcf\x17\xd3\x17\xd7\x17\xdb\x17\xdf\x17\xe3\x17\xe7\x17\xeb\x17\xef\x17\xf3\x17\xf7\x17\xfb\x17\xff\x17\x03\x18\x07\x18\x0b\x18\x0e\x18\x11\x18\x15\x18\x18\x18\x1b\x18\x1e\x18"\x18&\x18)\x18,\x18/\x182\x185\x18'
+  b':\x18=\x18@\x18C\x18F\x18I\x18L\x18O\x18R\x18V\x18[\x18^\x18a\x18d\x18g\x18j\x18m\x18p\x18t\x18x\x18|\x18\x80\x18\x83\x18\x86\x18\x89\x18\x8c\x18\x8f\x18\x92\x18\x95\x18\x98\x18\x9b\x18\x9e\x18'
+  b'\xa2\x18\xa6\x18\xa9\x18\xad\x18\xb1\x18\xb5\x18\xb8\x18\xbc\x18\xc0\x18\xc5\x18\xc8\x18\xcc\x18\xd0\x18\xd4\x18\xd8\x18\xde\x18\xe5\x18\xe8\x18\xeb\x18\xee\x18\xf1\x18\xf4\x18\xf7\x18\xfa\x18\xfd\x18\x00\x19\x03\x19\x06\x19\t\x19\x0c\x19\x0f\x19\x12\x19'
+  b'\x15\x19\x18\x19\x1b\x19 \x19#\x19&\x19)\x19.\x192\x195\x198\x19;\x19>\x19A\x19D\x19G\x19J\x19M\x19P\x19T\x19W\x19Z\x19^\x19b\x19e\x19j\x19n\x19q\x19t\x19w\x19z\x19~\x19'
+  b'\x82\x19\x85\x19\x88\x19\x8b\x19\x8e\x19\x91\x19\x94\x19\x97\x19\x9a\x19\x9d\x19\xa1\x19\xa5\x19\xa9\x19\xad\x19\xb1\x19\xb5\x19\xb9\x19\xbd\x19\xc1\x19\xc5\x19\xc9\x19\xcd\x19\xd1\x19\xd5\x19\xd9\x19\xdd\x19\xe1\x19\xe5\x19\xe9\x19\xed\x19\xf1\x19\xf5\x19'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf9\x19\xfb\x19\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfd\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x19\x01\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x1a\x05\x1a\x07\x1a\t\x1a'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0b\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b"\r\x1a\x0f\x1a\x11\x1a\x13\x1a\x15\x1a\x17\x1a\x19\x1a\x1b\x1a\x1d\x1a\x1f\x1a!\x1a#\x1a%\x1a'\x1a)\x1a+\x1a-\x1a/\x1a1\x1a3\x1a5\x1a7\x1a9\x1a;\x1a=\x1a?\x1aA\x1aC\x1aE\x1aG\x1aI\x1aK\x1a"
+  b'M\x1aO\x1aQ\x1aS\x1aU\x1aW\x1aY\x1a[\x1a]\x1a_\x1aa\x1ac\x1ae\x1ag\x1ai\x1ak\x1am\x1ao\x1aq\x1as\x1au\x1aw\x1ay\x1a{\x1a}\x1a\x7f\x1a\x81\x1a\x83\x1a\x85\x1a\x87\x1a\x89\x1a\x8b\x1a'
+  b'\x8d\x1a\x8f\x1a\x91\x1a\x93\x1a\x95\x1a\x97\x1a\x99\x1a\x9b\x1a\x9d\x1a\x9f\x1a\xa1\x1a\xa3\x1a\xa5\x1a\xa7\x1a\xa9\x1a\xab\x1a\xad\x1a\xaf\x1a\xb1\x1a\xb3\x1a\xb5\x1a\xb7\x1a\xb9\x1a\xbb\x1a\xbd\x1a\xbf\x1a\xc1\x1a\xc3\x1a\xc5\x1a\xc7\x1a\xc9\x1a\xcb\x1a'
+  b'\xcd\x1a\xcf\x1a\xd1\x1a\xd3\x1a\xd5\x1a\xd7\x1a\xd9\x1a\xdb\x1a\xdd\x1a\xdf\x1a\xe1\x1a\xe3\x1a\xe5\x1a\xe7\x1a\xe9\x1a\xeb\x1a\xed\x1a\xef\x1a\xf1\x1a\xf3\x1a\xf5\x1a\xf7\x1a\xf9\x1a\xfb\x1a\xfd\x1a\xff\x1a\x01\x1b\x03\x1b\x05\x1b\x07\x1b\t\x1b\x0b\x1b'
+  b"\r\x1b\x0f\x1b\x11\x1b\x13\x1b\x15\x1b\x17\x1b\x19\x1b\x1b\x1b\x1d\x1b\x1f\x1b!\x1b#\x1b%\x1b'\x1b)\x1b+\x1b-\x1b/\x1b1\x1b3\x1b5\x1b7\x1b9\x1b;\x1b=\x1b?\x1bA\x1bC\x1bE\x1bG\x1bI\x1bK\x1b"
+  b'M\x1bO\x1bQ\x1bS\x1bU\x1bW\x1bY\x1b[\x1b]\x1b_\x1ba\x1bc\x1be\x1bg\x1bi\x1bk\x1bm\x1bo\x1bq\x1bs\x1bu\x1bw\x1by\x1b{\x1b}\x1b\x7f\x1b\x81\x1b\x83\x1b\x85\x1b\x87\x1b\x89\x1b\x8b\x1b'
+  b'\x8d\x1b\x8f\x1b\x91\x1b\x93\x1b\x95\x1b\x97\x1b\x99\x1b\x9b\x1b\x9d\x1b\x9f\x1b\xa1\x1b\xa3\x1b\xa5\x1b\xa7\x1b\xa9\x1b\xab\x1b\xad\x1b\xaf\x1b\xb1\x1b\xb3\x1b\xb5\x1b\xb7\x1b\xb9\x1b\xbb\x1b\xbd\x1b\xbf\x1b\xc1\x1b\xc3\x1b\xc5\x1b\xc7\x1b\xc9\x1b\xcb\x1b'
+  b'\xcd\x1b\xcf\x1b\xd1\x1b\xd3\x1b\xd5\x1b\xd7\x1b\xd9\x1b\xdb\x1b\xdd\x1b\xdf\x1b\xe1\x1b\xe3\x1b\xe5\x1b\xe7\x1b\xe9\x1b\xeb\x1b\xed\x1b\xef\x1b\xf1\x1b\xf3\x1b\xf5\x1b\xf7\x1b\xf9\x1b\xfb\x1b\xfd\x1b\xff\x1b\x01\x1c\x03\x1c\x05\x1c\x07\x1c\t\x1c\x0b\x1c'
+  b"\r\x1c\x0f\x1c\x11\x1c\x13\x1c\x15\x1c\x17\x1c\x19\x1c\x1b\x1c\x1d\x1c\x1f\x1c!\x1c#\x1c%\x1c'\x1c\x00\x00\x00\x00)\x1c\x00\x00+\x1c\x00\x00\x00\x00-\x1c/\x1c1\x1c3\x1c5\x1c7\x1c9\x1c;\x1c=\x1c?\x1c\x00\x00"
+  b'A\x1c\x00\x00C\x1c\x00\x00\x00\x00E\x1cG\x1c\x00\x00\x00\x00\x00\x00I\x1cK\x1cM\x1cO\x1cQ\x1cS\x1cU\x1cW\x1cY\x1c[\x1c]\x1c_\x1ca\x1cc\x1ce\x1cg\x1ci\x1ck\x1cm\x1co\x1cq\x1cs\x1c'
+  b'u\x1cw\x1cy\x1c{\x1c}\x1c\x7f\x1c\x81\x1c\x83\x1c\x85\x1c\x87\x1c\x89\x1c\x8b\x1c\x8d\x1c\x8f\x1c\x91\x1c\x93\x1c\x95\x1c\x97\x1c\x99\x1c\x9b\x1c\x9d\x1c\x9f\x1c\xa1\x1c\xa3\x1c\xa5\x1c\xa7\x1c\xa9\x1c\xab\x1c\xad\x1c\xaf\x1c\xb1\x1c\xb3\x1c'
+  b'\xb5\x1c\xb7\x1c\xb9\x1c\xbb\x1c\xbd\x1c\xbf\x1c\xc1\x1c\xc3\x1c\xc5\x1c\xc7\x1c\xc9\x1c\xcb\x1c\xcd\x1c\xcf\x1c\x00\x00\x00\x00\xd1\x1c\xd3\x1c\xd5\x1c\xd7\x1c\xd9\x1c\xdb\x1c\xdd\x1c\xdf\x1c\xe1\x1c\xe3\x1c\xe5\x1c\xe7\x1c\xe9\x1c\xeb\x1c\xed\x1c\xef\x1c'
+  b"\xf1\x1c\xf3\x1c\xf5\x1c\xf7\x1c\xf9\x1c\xfb\x1c\xfd\x1c\xff\x1c\x01\x1d\x03\x1d\x05\x1d\x07\x1d\t\x1d\x0b\x1d\r\x1d\x0f\x1d\x11\x1d\x13\x1d\x15\x1d\x17\x1d\x19\x1d\x1b\x1d\x1d\x1d\x1f\x1d!\x1d#\x1d%\x1d'\x1d)\x1d+\x1d-\x1d/\x1d"
+  b'1\x1d3\x1d5\x1d7\x1d9\x1d;\x1d=\x1d?\x1dA\x1dC\x1dE\x1dG\x1dI\x1dK\x1dM\x1dO\x1dQ\x1dS\x1dU\x1dW\x1dY\x1d[\x1d]\x1d_\x1da\x1dc\x1de\x1dg\x1di\x1dk\x1dm\x1do\x1d'
+  b'q\x1ds\x1du\x1dw\x1dy\x1d{\x1d}\x1d\x7f\x1d\x81\x1d\x83\x1d\x85\x1d\x87\x1d\x89\x1d\x8b\x1d\x8d\x1d\x8f\x1d\x91\x1d\x93\x1d\x95\x1d\x97\x1d\x99\x1d\x9b\x1d\x9d\x1d\x9f\x1d\xa1\x1d\xa3\x1d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\xa5\x1d\xa8\x1d\xab\x1d\xae\x1d\xb2\x1d\xb6\x1d\xb9\x1d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbc\x1d\xbf\x1d\xc2\x1d\xc5\x1d\xc8\x1d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xcb\x1d\x00\x00\xce\x1d'
+  b'\xd1\x1d\xd3\x1d\xd5\x1d\xd7\x1d\xd9\x1d\xdb\x1d\xdd\x1d\xdf\x1d\xe1\x1d\xe3\x1d\xe5\x1d\xe8\x1d\xeb\x1d\xee\x1d\xf1\x1d\xf4\x1d\xf7\x1d\xfa\x1d\xfd\x1d\x00\x1e\x03\x1e\x06\x1e\t\x1e\x00\x00\x0c\x1e\x0f\x1e\x12\x1e\x15\x1e\x18\x1e\x00\x00\x1b\x1e\x00\x00'
+  b"\x1e\x1e!\x1e\x00\x00$\x1e'\x1e\x00\x00*\x1e-\x1e0\x1e3\x1e6\x1e9\x1e<\x1e?\x1eB\x1eE\x1eH\x1eJ\x1eL\x1eN\x1eP\x1eR\x1eT\x1eV\x1eX\x1eZ\x1e\\\x1e^\x1e`\x1eb\x1ed\x1ef\x1e"
+  b'h\x1ej\x1el\x1en\x1ep\x1er\x1et\x1ev\x1ex\x1ez\x1e|\x1e~\x1e\x80\x1e\x82\x1e\x84\x1e\x86\x1e\x88\x1e\x8a\x1e\x8c\x1e\x8e\x1e\x90\x1e\x92\x1e\x94\x1e\x96\x1e\x98\x1e\x9a\x1e\x9c\x1e\x9e\x1e\xa0\x1e\xa2\x1e\xa4\x1e\xa6\x1e'
+  b'\xa8\x1e\xaa\x1e\xac\x1e\xae\x1e\xb0\x1e\xb2\x1e\xb4\x1e\xb6\x1e\xb8\x1e\xba\x1e\xbc\x1e\xbe\x1e\xc0\x1e\xc2\x1e\xc4\x1e\xc6\x1e\xc8\x1e\xca\x1e\xcc\x1e\xce\x1e\xd0\x1e\xd2\x1e\xd4\x1e\xd6\x1e\xd8\x1e\xda\x1e\xdc\x1e\xde\x1e\xe0\x1e\xe2\x1e\xe4\x1e\xe6\x1e'
+  b'\xe8\x1e\xea\x1e\xec\x1e\xee\x1e\xf0\x1e\xf2\x1e\xf4\x1e\xf6\x1e\xf8\x1e\xfa\x1e\xfc\x1e\xfe\x1e\x00\x1f\x02\x1f\x04\x1f\x06\x1f\x08\x1f\n\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x1f\x0e\x1f\x10\x1f\x12\x1f\x14\x1f\x16\x1f\x18\x1f\x1a\x1f\x1c\x1f\x1e\x1f \x1f"\x1f$\x1f'
+  b'&\x1f(\x1f*\x1f,\x1f.\x1f0\x1f2\x1f4\x1f6\x1f8\x1f:\x1f=\x1f@\x1fC\x1fF\x1fI\x1fL\x1fO\x1fR\x1fU\x1fX\x1f[\x1f^\x1fa\x1fd\x1fg\x1fj\x1fm\x1fp\x1fr\x1ft\x1fv\x1f'
+  b'x\x1f{\x1f~\x1f\x81\x1f\x84\x1f\x87\x1f\x8a\x1f\x8d\x1f\x90\x1f\x93\x1f\x96\x1f\x99\x1f\x9c\x1f\x9f\x1f\xa2\x1f\xa5\x1f\xa8\x1f\xab\x1f\xae\x1f\xb1\x1f\xb4\x1f\xb7\x1f\xba\x1f\xbd\x1f\xc0\x1f\xc3\x1f\xc6\x1f\xc9\x1f\xcc\x1f\xcf\x1f\xd2\x1f\xd5\x1f'
+  b'\xd8\x1f\xdb\x1f\xde\x1f\xe1\x1f\xe4\x1f\xe7\x1f\xea\x1f\xed\x1f\xf0\x1f\xf3\x1f\xf6\x1f\xf9\x1f\xfc\x1f\xff\x1f\x02 \x05 \x08 \x0b \x0e \x11 \x14 \x17 \x1a \x1d   # & ) , / 2 5 '
+  b'8 ; > A D G J M P S V Y \\ _ b e h k n q t w z } \x80 \x83 \x86 \x89 \x8c \x8f \x92 \x96 '
+  b'\x9a \x9e \xa2 \xa6 \xaa \xad \xb0 \xb3 \xb6 \xb9 \xbc \xbf \xc2 \xc5 \xc8 \xcb \xce \xd1 \xd4 \xd7 \xda \xdd \xe0 \xe3 \xe6 \xe9 \xec \xef \xf2 \xf5 \xf8 \xfb '
+  b'\xfe \x01!\x04!\x07!\n!\r!\x10!\x13!\x16!\x19!\x1c!\x1f!"!%!(!+!.!1!4!7!:!=!@!C!F!I!L!O!R!U!X![!'
+  b'^!a!d!g!j!m!p!s!v!y!|!\x7f!\x82!\x85!\x88!\x8b!\x8e!\x91!\x94!\x97!\x9a!\x9d!\xa0!\xa3!\xa6!\xa9!\xac!\xaf!\xb2!\xb5!\xb8!\xbb!'
+  b'\xbe!\xc1!\xc4!\xc7!\xca!\xcd!\xd0!\xd3!\xd6!\xd9!\xdc!\xdf!\xe2!\xe5!\xe8!\xeb!\xee!\xf1!\xf4!\xf7!\xfa!\xfd!\x00"\x03"\x06"\t"\x0c"\x0f"\x12"\x15"\x18"\x1b"'
+  b'\x1e"!"$"\'"*"-"0"3"6"9"<"?"B"E"H"K"N"Q"T"X"\\"`"c"f"i"l"o"r"u"x"{"~"'
+  b'\x81"\x84"\x87"\x8a"\x8d"\x90"\x93"\x96"\x99"\x9c"\x9f"\xa2"\xa5"\xa8"\xab"\xae"\xb1"\xb4"\xb7"\xba"\xbd"\xc0"\xc3"\xc6"\xc9"\xcc"\xcf"\xd2"\xd5"\xd8"\xdb"\xde"'
+  b'\xe1"\xe4"\xe7"\xea"\xed"\xf0"\xf3"\xf6"\xf9"\xfc"\xff"\x02#\x05#\x08#\x0b#\x0e#\x11#\x14#\x17#\x1a#\x1d# ###&#)#,#/#2#5#8#\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00;#?#C#G#K#O#S#W#[#_#c#g#k#o#s#w#'
+  b'{#\x7f#\x83#\x87#\x8b#\x8f#\x93#\x97#\x9b#\x9f#\xa3#\xa7#\xab#\xaf#\xb3#\xb7#\xbb#\xbf#\xc3#\xc7#\xcb#\xcf#\xd3#\xd7#\xdb#\xdf#\xe3#\xe7#\xeb#\xef#\xf3#\xf7#'
+  b"\xfb#\xff#\x03$\x07$\x0b$\x0f$\x13$\x17$\x1b$\x1f$#$'$+$/$3$7$\x00\x00\x00\x00;$?$C$G$K$O$S$W$[$_$c$g$k$o$"
+  b's$w${$\x7f$\x83$\x87$\x8b$\x8f$\x93$\x97$\x9b$\x9f$\xa3$\xa7$\xab$\xaf$\xb3$\xb7$\xbb$\xbf$\xc3$\xc7$\xcb$\xcf$\xd3$\xd7$\xdb$\xdf$\xe3$\xe7$\xeb$\xef$'
+  b'\xf3$\xf7$\xfb$\xff$\x03%\x07%\x0b%\x0f%\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x13%\x17%\x1b% %%%*%/%4%9%>%B%U%^%\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00c%e%g%i%k%m%o%q%s%u%\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00w%y%{%}%\x7f%\x81%\x83%\x85%\x87%\x89%\x8b%\x8d%\x8f%\x91%\x93%\x95%'
+  b'\x97%\x99%\x9b%\x9d%\x9f%\x00\x00\x00\x00\xa1%\xa3%\xa5%\xa7%\xa9%\xab%\xad%\xaf%\xb1%\xb3%\xb5%\xb7%\x00\x00\xb9%\xbb%\xbd%\xbf%\xc1%\xc3%\xc5%\xc7%\xc9%\xcb%\xcd%\xcf%'
+  b'\xd1%\xd3%\xd5%\xd7%\xd9%\xdb%\xdd%\x00\x00\xdf%\xe1%\xe3%\xe5%\x00\x00\x00\x00\x00\x00\x00\x00\xe7%\xea%\xed%\x00\x00\xf0%\x00\x00\xf3%\xf6%\xf9%\xfc%\xff%\x02&\x05&\x08&\x0b&\x0e&'
+  b"\x11&\x13&\x15&\x17&\x19&\x1b&\x1d&\x1f&!&#&%&'&)&+&-&/&1&3&5&7&9&;&=&?&A&C&E&G&I&K&M&O&"
+  b'Q&S&U&W&Y&[&]&_&a&c&e&g&i&k&m&o&q&s&u&w&y&{&}&\x7f&\x81&\x83&\x85&\x87&\x89&\x8b&\x8d&\x8f&'
+  b'\x91&\x93&\x95&\x97&\x99&\x9b&\x9d&\x9f&\xa1&\xa3&\xa5&\xa7&\xa9&\xab&\xad&\xaf&\xb1&\xb3&\xb5&\xb7&\xb9&\xbb&\xbd&\xbf&\xc1&\xc3&\xc5&\xc7&\xc9&\xcb&\xcd&\xcf&'
+  b"\xd1&\xd3&\xd5&\xd7&\xd9&\xdb&\xdd&\xdf&\xe1&\xe3&\xe5&\xe7&\xe9&\xeb&\xed&\xef&\xf1&\xf3&\xf5&\xf7&\xf9&\xfb&\xfe&\x01'\x04'\x07'\n'\r'\x10'\x00\x00\x00\x00\x00\x00"
+  b"\x00\x00\x13'\x15'\x17'\x19'\x1b'\x1d'\x1f'!'#'%''')'+'-'/'1'3'5'7'9';'='?'A'C'E'G'I'K'M'O'"
+  b"Q'S'U'W'Y'[']'_'a'c'e'g'i'k'm'o'q's'u'w'y'{'}'\x7f'\x81'\x83'\x85'\x87'\x89'\x8b'\x8d'\x8f'"
+  b"\x91'\x93'\x95'\x97'\x99'\x9b'\x9d'\x9f'\xa1'\xa3'\xa5'\xa7'\xa9'\xab'\xad'\xaf'\xb1'\xb3'\xb5'\xb7'\xb9'\xbb'\xbd'\xbf'\xc1'\xc3'\xc5'\xc7'\xc9'\xcb'\xcd'\xcf'"
+  b"\xd1'\xd3'\xd5'\xd7'\xd9'\xdb'\xdd'\xdf'\xe1'\xe3'\xe5'\xe7'\xe9'\xeb'\xed'\xef'\xf1'\xf3'\xf5'\xf7'\xf9'\xfb'\xfd'\xff'\x01(\x03(\x05(\x07(\t(\x0b(\r(\x0f("
+  b"\x11(\x13(\x15(\x17(\x19(\x1b(\x1d(\x1f(!(#(%('()(+(-(/(1(3(5(7(9(;(=(?(A(C(E(G(I(K(M(O("
+  b'Q(S(U(W(Y([(](_(a(c(e(g(i(k(m(o(q(s(u(w(y({(}(\x7f(\x81(\x83(\x85(\x87(\x89(\x8b(\x8d(\x00\x00'
+  b'\x00\x00\x00\x00\x8f(\x91(\x93(\x95(\x97(\x99(\x00\x00\x00\x00\x9b(\x9d(\x9f(\xa1(\xa3(\xa5(\x00\x00\x00\x00\xa7(\xa9(\xab(\xad(\xaf(\xb1(\x00\x00\x00\x00\xb3(\xb5(\xb7(\x00\x00\x00\x00\x00\x00'
+  b'\xb9(\xbb(\xbd(\xbf(\xc1(\xc3(\xc5(\x00\x00\xc7(\xc9(\xcb(\xcd(\xcf(\xd1(\xd3(\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd5(\x00\x00\xd8(\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdb(\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xde(\xe1(\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe4(\xe7(\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xea(\xed(\x00\x00\xf0(\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3(\xf6(\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf9(\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc(\xff('
+  b'\x02)\x05)\x08)\x0b)\x0e)\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x11)\x14)\x17)\x1a)\x1d)'
+  b' )\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b"#)%)')))+)-)/)1)3)5)7)9);)=)?)A)C)E)G)I)K)M)O)Q)S)U)W)Y)[)])_)a)"
+  b'c)e)g)i)k)m)o)q)s)u)w)y){)})\x7f)\x81)\x83)\x85)\x87)\x89)\x8b)\x8d)\x8f)\x91)\x93)\x95)\x97)\x99)\x9b)\x9d)\x9f)\xa1)'
+  b'\xa3)\xa5)\xa7)\xa9)\xab)\xad)\xaf)\xb1)\xb3)\xb5)\xb7)\xb9)\xbb)\xbd)\xbf)\xc1)\xc3)\xc5)\xc7)\xc9)\xcb)\x00\x00\xcd)\xcf)\xd1)\xd3)\xd5)\xd7)\xd9)\xdb)\xdd)\xdf)'
+  b'\xe1)\xe3)\xe5)\xe7)\xe9)\xeb)\xed)\xef)\xf1)\xf3)\xf5)\xf7)\xf9)\xfb)\xfd)\xff)\x01*\x03*\x05*\x07*\t*\x0b*\r*\x0f*\x11*\x13*\x15*\x17*\x19*\x1b*\x1d*\x1f*'
+  b"!*#*%*'*)*+*-*/*1*3*5*7*9*;*=*?*A*C*E*G*I*K*M*O*Q*S*U*W*Y*\x00\x00[*]*"
+  b'\x00\x00\x00\x00_*\x00\x00\x00\x00a*c*\x00\x00\x00\x00e*g*i*k*\x00\x00m*o*q*s*u*w*y*{*}*\x7f*\x81*\x83*\x00\x00\x85*\x00\x00\x87*\x89*\x8b*'
+  b'\x8d*\x8f*\x91*\x93*\x00\x00\x95*\x97*\x99*\x9b*\x9d*\x9f*\xa1*\xa3*\xa5*\xa7*\xa9*\xab*\xad*\xaf*\xb1*\xb3*\xb5*\xb7*\xb9*\xbb*\xbd*\xbf*\xc1*\xc3*\xc5*\xc7*\xc9*'
+  b'\xcb*\xcd*\xcf*\xd1*\xd3*\xd5*\xd7*\xd9*\xdb*\xdd*\xdf*\xe1*\xe3*\xe5*\xe7*\xe9*\xeb*\xed*\xef*\xf1*\xf3*\xf5*\xf7*\xf9*\xfb*\xfd*\xff*\x01+\x03+\x05+\x07+\t+'
+  b"\x0b+\r+\x0f+\x11+\x13+\x15+\x00\x00\x17+\x19+\x1b+\x1d+\x00\x00\x00\x00\x1f+!+#+%+'+)+++-+\x00\x00/+1+3+5+7+9+;+\x00\x00=+?+"
+  b'A+C+E+G+I+K+M+O+Q+S+U+W+Y+[+]+_+a+c+e+g+i+k+m+o+q+s+\x00\x00u+w+y+{+\x00\x00'
+  b'}+\x7f+\x81+\x83+\x85+\x00\x00\x87+\x00\x00\x00\x00\x00\x00\x89+\x8b+\x8d+\x8f+\x91+\x93+\x95+\x00\x00\x97+\x99+\x9b+\x9d+\x9f+\xa1+\xa3+\xa5+\xa7+\xa9+\xab+\xad+\xaf+\xb1+'
+  b'\xb3+\xb5+\xb7+\xb9+\xbb+\xbd+\xbf+\xc1+\xc3+\xc5+\xc7+\xc9+\xcb+\xcd+\xcf+\xd1+\xd3+\xd5+\xd7+\xd9+\xdb+\xdd+\xdf+\xe1+\xe3+\xe5+\xe7+\xe9+\xeb+\xed+\xef+\xf1+'
+  b"\xf3+\xf5+\xf7+\xf9+\xfb+\xfd+\xff+\x01,\x03,\x05,\x07,\t,\x0b,\r,\x0f,\x11,\x13,\x15,\x17,\x19,\x1b,\x1d,\x1f,!,#,%,',),+,-,/,1,"
+  b'3,5,7,9,;,=,?,A,C,E,G,I,K,M,O,Q,S,U,W,Y,[,],_,a,c,e,g,i,k,m,o,q,'
+  b's,u,w,y,{,},\x7f,\x81,\x83,\x85,\x87,\x89,\x8b,\x8d,\x8f,\x91,\x93,\x95,\x97,\x99,\x9b,\x9d,\x9f,\xa1,\xa3,\xa5,\xa7,\xa9,\xab,\xad,\xaf,\xb1,'
+  b'\xb3,\xb5,\xb7,\xb9,\xbb,\xbd,\xbf,\xc1,\xc3,\xc5,\xc7,\xc9,\xcb,\xcd,\xcf,\xd1,\xd3,\xd5,\xd7,\xd9,\xdb,\xdd,\xdf,\xe1,\xe3,\xe5,\xe7,\xe9,\xeb,\xed,\xef,\xf1,'
+  b"\xf3,\xf5,\xf7,\xf9,\xfb,\xfd,\xff,\x01-\x03-\x05-\x07-\t-\x0b-\r-\x0f-\x11-\x13-\x15-\x17-\x19-\x1b-\x1d-\x1f-!-#-%-'-)-+---/-1-"
+  b'3-5-7-9-;-=-?-A-C-E-G-I-K-M-O-Q-S-U-W-Y-[-]-_-a-c-e-g-i-k-m-o-q-'
+  b's-u-w-y-{-}-\x7f-\x81-\x83-\x85-\x87-\x89-\x8b-\x8d-\x8f-\x91-\x93-\x95-\x97-\x99-\x9b-\x9d-\x9f-\xa1-\xa3-\xa5-\xa7-\xa9-\xab-\xad-\xaf-\xb1-'
+  b'\xb3-\xb5-\xb7-\xb9-\xbb-\xbd-\xbf-\xc1-\xc3-\xc5-\xc7-\xc9-\xcb-\xcd-\xcf-\xd1-\xd3-\xd5-\xd7-\xd9-\xdb-\xdd-\xdf-\xe1-\xe3-\xe5-\xe7-\xe9-\xeb-\xed-\xef-\xf1-'
+  b"\xf3-\xf5-\xf7-\xf9-\xfb-\xfd-\xff-\x01.\x03.\x05.\x07.\t.\x0b.\r.\x0f.\x11.\x13.\x15.\x17.\x19.\x1b.\x1d.\x1f.!.#.%.'.).+.-./.1."
+  b'3.5.7.9.;.=.\x00\x00\x00\x00?.A.C.E.G.I.K.M.O.Q.S.U.W.Y.[.]._.a.c.e.g.i.k.m.'
+  b'o.q.s.u.w.y.{.}.\x7f.\x81.\x83.\x85.\x87.\x89.\x8b.\x8d.\x8f.\x91.\x93.\x95.\x97.\x99.\x9b.\x9d.\x9f.\xa1.\xa3.\xa5.\xa7.\xa9.\xab.\xad.'
+  b'\xaf.\xb1.\xb3.\xb5.\xb7.\xb9.\xbb.\xbd.\xbf.\xc1.\xc3.\xc5.\xc7.\xc9.\xcb.\xcd.\xcf.\xd1.\xd3.\xd5.\xd7.\xd9.\xdb.\xdd.\xdf.\xe1.\xe3.\xe5.\xe7.\xe9.\xeb.\xed.'
+  b"\xef.\xf1.\xf3.\xf5.\xf7.\xf9.\xfb.\xfd.\xff.\x01/\x03/\x05/\x07/\t/\x0b/\r/\x0f/\x11/\x13/\x15/\x17/\x19/\x1b/\x1d/\x1f/!/#/%/'/)/+/-/"
+  b'//1/3/5/7/9/;/=/?/A/C/E/G/I/K/M/O/Q/S/U/W/Y/[/]/_/a/c/e/g/i/k/m/'
+  b'o/q/s/u/w/y/{/}/\x7f/\x81/\x83/\x85/\x87/\x89/\x8b/\x8d/\x8f/\x91/\x93/\x95/\x97/\x99/\x9b/\x9d/\x9f/\xa1/\xa3/\xa5/\xa7/\xa9/\xab/\xad/'
+  b'\xaf/\xb1/\xb3/\xb5/\xb7/\xb9/\xbb/\xbd/\xbf/\xc1/\xc3/\xc5/\xc7/\xc9/\xcb/\xcd/\xcf/\xd1/\xd3/\xd5/\xd7/\xd9/\xdb/\xdd/\xdf/\xe1/\xe3/\xe5/\xe7/\xe9/\xeb/\xed/'
+  b"\xef/\xf1/\xf3/\xf5/\xf7/\xf9/\xfb/\xfd/\xff/\x010\x030\x050\x070\t0\x0b0\r0\x0f0\x110\x130\x150\x170\x190\x1b0\x1d0\x1f0!0#0%0'0)0+0-0"
+  b'/01030507090;0=0?0A0C0E0G0I0K0M0O0Q0S0U0W0Y0[0]0_0a0c0e0g0i0k0m0'
+  b'o0q0s0u0w0y0{0}0\x7f0\x810\x830\x850\x00\x00\x00\x00\x870\x890\x8b0\x8d0\x8f0\x910\x930\x950\x970\x990\x9b0\x9d0\x9f0\xa10\xa30\xa50\xa70\xa90'
+  b'\xab0\xad0\xaf0\xb10\xb30\xb50\xb70\xb90\xbb0\xbd0\xbf0\xc10\xc30\xc50\xc70\xc90\xcb0\xcd0\xcf0\xd10\xd30\xd50\xd70\xd90\xdb0\xdd0\xdf0\xe10\xe30\xe50\xe70\xe90'
+  b"\xeb0\xed0\xef0\xf10\x00\x00\xf30\xf50\xf70\xf90\xfb0\xfd0\xff0\x011\x031\x051\x071\t1\x0b1\r1\x0f1\x111\x131\x151\x171\x191\x1b1\x1d1\x1f1!1#1%1'1"
+  b'\x00\x00)1+1\x00\x00-1\x00\x00\x00\x00/1\x00\x001131517191;1=1?1A1C1\x00\x00E1G1I1K1\x00\x00M1\x00\x00O1\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00Q1\x00\x00\x00\x00\x00\x00\x00\x00S1\x00\x00U1\x00\x00W1\x00\x00Y1[1]1\x00\x00_1a1\x00\x00c1\x00\x00\x00\x00e1\x00\x00g1\x00\x00i1\x00\x00k1\x00\x00m1'
+  b'\x00\x00o1q1\x00\x00s1\x00\x00\x00\x00u1w1y1{1\x00\x00}1\x7f1\x811\x831\x851\x871\x891\x00\x00\x8b1\x8d1\x8f1\x911\x00\x00\x931\x951\x971\x991\x00\x00\x9b1\x00\x00'
+  b'\x9d1\x9f1\xa11\xa31\xa51\xa71\xa91\xab1\xad1\xaf1\x00\x00\xb11\xb31\xb51\xb71\xb91\xbb1\xbd1\xbf1\xc11\xc31\xc51\xc71\xc91\xcb1\xcd1\xcf1\xd11\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\xd31\xd51\xd71\x00\x00\xd91\xdb1\xdd1\xdf1\xe11\x00\x00\xe31\xe51\xe71\xe91\xeb1\xed1\xef1\xf11\xf31\xf51\xf71\xf91\xfb1\xfd1\xff1\x012\x032\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x052\x082\x0b2\x0e2\x112\x142\x172\x1a2\x1d2 2#2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00&2*2.22262:2>2B2F2J2N2R2V2Z2^2b2'
+  b'f2j2n2r2v2z2~2\x822\x862\x8a2\x8e2\x922\x942\x962\x992\x00\x00\x9c2\x9e2\xa02\xa22\xa42\xa62\xa82\xaa2\xac2\xae2\xb02\xb22\xb42\xb62\xb82\xba2'
+  b'\xbc2\xbe2\xc02\xc22\xc42\xc62\xc82\xca2\xcc2\xce2\xd02\xd32\xd62\xd92\xdc2\xe02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe32\xe62\xe92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xec2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\xef2\xf22\xf52\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf72\xf92\xfb2\xfd2\xff2\x013\x033\x053\x073\t3\x0b3\r3\x0f3\x113\x133\x153'
+  b"\x173\x193\x1b3\x1d3\x1f3!3#3%3'3)3+3-3/31333537393;3=3?3A3C3E3G3I3K3M3\x00\x00\x00\x00\x00\x00\x00\x00"
+  b'O3S3W3[3_3c3g3k3o3\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00s3u3\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00w3y3{3}3\x7f3\x813\x833\x853\x873\x893\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x8b3\x8d3\x8f3\x913\x933\x953\x973\x993\x9b3\x9d3\x9f3\xa13\xa33\xa53\xa73\xa93\xab3\xad3\xaf3\xb13\xb33\xb53\xb73\xb93\xbb3\xbd3\xbf3\xc13\xc33\xc53\xc73\xc93'
+  b'\xcb3\xcd3\xcf3\xd13\xd33\xd53\xd73\xd93\xdb3\xdd3\xdf3\xe13\xe33\xe53\xe73\xe93\xeb3\xed3\xef3\xf13\xf33\xf53\xf73\xf93\xfb3\xfd3\xff3\x014\x034\x054\x074\t4'
+  b"\x0b4\r4\x0f4\x114\x134\x154\x174\x194\x1b4\x1d4\x1f4!4#4%4'4)4+4-4/41434547494;4=4?4A4C4E4G4I4"
+  b'K4M4O4Q4S4U4W4Y4[4]4_4a4c4e4g4i4k4m4o4q4s4u4w4y4{4}4\x7f4\x814\x834\x854\x874\x894'
+  b'\x8b4\x8d4\x8f4\x914\x934\x954\x974\x994\x9b4\x9d4\x9f4\xa14\xa34\xa54\xa74\xa94\xab4\xad4\xaf4\xb14\xb34\xb54\xb74\xb94\xbb4\xbd4\xbf4\xc14\xc34\xc54\xc74\xc94'
+  b'\xcb4\xcd4\xcf4\xd14\xd34\xd54\xd74\xd94\xdb4\xdd4\xdf4\xe14\xe34\xe54\xe74\xe94\xeb4\xed4\xef4\xf14\xf34\xf54\xf74\xf94\xfb4\xfd4\xff4\x015\x035\x055\x075\t5'
+  b"\x0b5\r5\x0f5\x115\x135\x155\x175\x195\x1b5\x1d5\x1f5!5#5%5'5)5+5-5/51535557595;5=5?5A5C5E5G5I5"
+  b'K5M5O5Q5S5U5W5Y5[5]5_5a5c5e5g5i5k5m5o5q5s5u5w5y5{5}5\x7f5\x815\x835\x855\x875\x895'
+  b'\x8b5\x8d5\x8f5\x915\x935\x955\x975\x995\x9b5\x9d5\x9f5\xa15\xa35\xa55\xa75\xa95\xab5\xad5\xaf5\xb15\xb35\xb55\xb75\xb95\xbb5\xbd5\xbf5\xc15\xc35\xc55\xc75\xc95'
+  b'\xcb5\xcd5\xcf5\xd15\xd35\xd55\xd75\xd95\xdb5\xdd5\xdf5\xe15\xe35\xe55\xe75\xe95\xeb5\xed5\xef5\xf15\xf35\xf55\xf75\xf95\xfb5\xfd5\xff5\x016\x036\x056\x076\t6'
+  b"\x0b6\r6\x0f6\x116\x136\x156\x176\x196\x1b6\x1d6\x1f6!6#6%6'6)6+6-6/61636567696;6=6?6A6C6E6G6I6"
+  b'K6M6O6Q6S6U6W6Y6[6]6_6a6c6e6g6i6k6m6o6q6s6u6w6y6{6}6\x7f6\x816\x836\x856\x876\x896'
+  b'\x8b6\x8d6\x8f6\x916\x936\x956\x976\x996\x9b6\x9d6\x9f6\xa16\xa36\xa56\xa76\xa96\xab6\xad6\xaf6\xb16\xb36\xb56\xb76\xb96\xbb6\xbd6\xbf6\xc16\xc36\xc56\xc76\xc96'
+  b'\xcb6\xcd6\xcf6\xd16\xd36\xd56\xd76\xd96\xdb6\xdd6\xdf6\xe16\xe36\xe56\xe76\xe96\xeb6\xed6\xef6\xf16\xf36\xf56\xf76\xf96\xfb6\xfd6\xff6\x017\x037\x057\x077\t7'
+  b"\x0b7\r7\x0f7\x117\x137\x157\x177\x197\x1b7\x1d7\x1f7!7#7%7'7)7+7-7/71737577797;7=7?7A7C7E7G7I7"
+  b'K7M7O7Q7S7U7W7Y7[7]7_7a7c7e7g7i7k7m7o7q7s7u7w7y7{7}7\x7f7\x817\x837\x857\x877\x897'
+  b'\x8b7\x8d7\x8f7\x917\x937\x957\x977\x997\x9b7\x9d7\x9f7\xa17\xa37\xa57\xa77\xa97\xab7\xad7\xaf7\xb17\xb37\xb57\xb77\xb97\xbb7\xbd7\xbf7\xc17\xc37\xc57\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+if byteorder == "big":  # pragma: no cover
+  decomp_index2.byteswap()
+
+comp_pairs = array('I', (
+  b'<\x00\x00\x008\x03\x00\x00n"\x00\x00=\x00\x00\x008\x03\x00\x00`"\x00\x00>\x00\x00\x008\x03\x00\x00o"\x00\x00A\x00\x00\x00\x00\x03\x00\x00\xc0\x00\x00\x00A\x00\x00\x00\x01\x03\x00\x00\xc1\x00\x00\x00A\x00\x00\x00'
+  b'\x02\x03\x00\x00\xc2\x00\x00\x00A\x00\x00\x00\x03\x03\x00\x00\xc3\x00\x00\x00A\x00\x00\x00\x04\x03\x00\x00\x00\x01\x00\x00A\x00\x00\x00\x06\x03\x00\x00\x02\x01\x00\x00A\x00\x00\x00\x07\x03\x00\x00&\x02\x00\x00A\x00\x00\x00\x08\x03\x00\x00'
+  b'\xc4\x00\x00\x00A\x00\x00\x00\t\x03\x00\x00\xa2\x1e\x00\x00A\x00\x00\x00\n\x03\x00\x00\xc5\x00\x00\x00A\x00\x00\x00\x0c\x03\x00\x00\xcd\x01\x00\x00A\x00\x00\x00\x0f\x03\x00\x00\x00\x02\x00\x00A\x00\x00\x00\x11\x03\x00\x00\x02\x02\x00\x00'
+  b'A\x00\x00\x00#\x03\x00\x00\xa0\x1e\x00\x00A\x00\x00\x00%\x03\x00\x00\x00\x1e\x00\x00A\x00\x00\x00(\x03\x00\x00\x04\x01\x00\x00B\x00\x00\x00\x07\x03\x00\x00\x02\x1e\x00\x00B\x00\x00\x00#\x03\x00\x00\x04\x1e\x00\x00B\x00\x00\x00'
+  b"1\x03\x00\x00\x06\x1e\x00\x00C\x00\x00\x00\x01\x03\x00\x00\x06\x01\x00\x00C\x00\x00\x00\x02\x03\x00\x00\x08\x01\x00\x00C\x00\x00\x00\x07\x03\x00\x00\n\x01\x00\x00C\x00\x00\x00\x0c\x03\x00\x00\x0c\x01\x00\x00C\x00\x00\x00'\x03\x00\x00"
+  b"\xc7\x00\x00\x00D\x00\x00\x00\x07\x03\x00\x00\n\x1e\x00\x00D\x00\x00\x00\x0c\x03\x00\x00\x0e\x01\x00\x00D\x00\x00\x00#\x03\x00\x00\x0c\x1e\x00\x00D\x00\x00\x00'\x03\x00\x00\x10\x1e\x00\x00D\x00\x00\x00-\x03\x00\x00\x12\x1e\x00\x00"
+  b'D\x00\x00\x001\x03\x00\x00\x0e\x1e\x00\x00E\x00\x00\x00\x00\x03\x00\x00\xc8\x00\x00\x00E\x00\x00\x00\x01\x03\x00\x00\xc9\x00\x00\x00E\x00\x00\x00\x02\x03\x00\x00\xca\x00\x00\x00E\x00\x00\x00\x03\x03\x00\x00\xbc\x1e\x00\x00E\x00\x00\x00'
+  b'\x04\x03\x00\x00\x12\x01\x00\x00E\x00\x00\x00\x06\x03\x00\x00\x14\x01\x00\x00E\x00\x00\x00\x07\x03\x00\x00\x16\x01\x00\x00E\x00\x00\x00\x08\x03\x00\x00\xcb\x00\x00\x00E\x00\x00\x00\t\x03\x00\x00\xba\x1e\x00\x00E\x00\x00\x00\x0c\x03\x00\x00'
+  b"\x1a\x01\x00\x00E\x00\x00\x00\x0f\x03\x00\x00\x04\x02\x00\x00E\x00\x00\x00\x11\x03\x00\x00\x06\x02\x00\x00E\x00\x00\x00#\x03\x00\x00\xb8\x1e\x00\x00E\x00\x00\x00'\x03\x00\x00(\x02\x00\x00E\x00\x00\x00(\x03\x00\x00\x18\x01\x00\x00"
+  b'E\x00\x00\x00-\x03\x00\x00\x18\x1e\x00\x00E\x00\x00\x000\x03\x00\x00\x1a\x1e\x00\x00F\x00\x00\x00\x07\x03\x00\x00\x1e\x1e\x00\x00G\x00\x00\x00\x01\x03\x00\x00\xf4\x01\x00\x00G\x00\x00\x00\x02\x03\x00\x00\x1c\x01\x00\x00G\x00\x00\x00'
+  b'\x04\x03\x00\x00 \x1e\x00\x00G\x00\x00\x00\x06\x03\x00\x00\x1e\x01\x00\x00G\x00\x00\x00\x07\x03\x00\x00 \x01\x00\x00G\x00\x00\x00\x0c\x03\x00\x00\xe6\x01\x00\x00G\x00\x00\x00\'\x03\x00\x00"\x01\x00\x00H\x00\x00\x00\x02\x03\x00\x00'
+  b'$\x01\x00\x00H\x00\x00\x00\x07\x03\x00\x00"\x1e\x00\x00H\x00\x00\x00\x08\x03\x00\x00&\x1e\x00\x00H\x00\x00\x00\x0c\x03\x00\x00\x1e\x02\x00\x00H\x00\x00\x00#\x03\x00\x00$\x1e\x00\x00H\x00\x00\x00\'\x03\x00\x00(\x1e\x00\x00'
+  b'H\x00\x00\x00.\x03\x00\x00*\x1e\x00\x00I\x00\x00\x00\x00\x03\x00\x00\xcc\x00\x00\x00I\x00\x00\x00\x01\x03\x00\x00\xcd\x00\x00\x00I\x00\x00\x00\x02\x03\x00\x00\xce\x00\x00\x00I\x00\x00\x00\x03\x03\x00\x00(\x01\x00\x00I\x00\x00\x00'
+  b'\x04\x03\x00\x00*\x01\x00\x00I\x00\x00\x00\x06\x03\x00\x00,\x01\x00\x00I\x00\x00\x00\x07\x03\x00\x000\x01\x00\x00I\x00\x00\x00\x08\x03\x00\x00\xcf\x00\x00\x00I\x00\x00\x00\t\x03\x00\x00\xc8\x1e\x00\x00I\x00\x00\x00\x0c\x03\x00\x00'
+  b'\xcf\x01\x00\x00I\x00\x00\x00\x0f\x03\x00\x00\x08\x02\x00\x00I\x00\x00\x00\x11\x03\x00\x00\n\x02\x00\x00I\x00\x00\x00#\x03\x00\x00\xca\x1e\x00\x00I\x00\x00\x00(\x03\x00\x00.\x01\x00\x00I\x00\x00\x000\x03\x00\x00,\x1e\x00\x00'
+  b"J\x00\x00\x00\x02\x03\x00\x004\x01\x00\x00K\x00\x00\x00\x01\x03\x00\x000\x1e\x00\x00K\x00\x00\x00\x0c\x03\x00\x00\xe8\x01\x00\x00K\x00\x00\x00#\x03\x00\x002\x1e\x00\x00K\x00\x00\x00'\x03\x00\x006\x01\x00\x00K\x00\x00\x00"
+  b"1\x03\x00\x004\x1e\x00\x00L\x00\x00\x00\x01\x03\x00\x009\x01\x00\x00L\x00\x00\x00\x0c\x03\x00\x00=\x01\x00\x00L\x00\x00\x00#\x03\x00\x006\x1e\x00\x00L\x00\x00\x00'\x03\x00\x00;\x01\x00\x00L\x00\x00\x00-\x03\x00\x00"
+  b'<\x1e\x00\x00L\x00\x00\x001\x03\x00\x00:\x1e\x00\x00M\x00\x00\x00\x01\x03\x00\x00>\x1e\x00\x00M\x00\x00\x00\x07\x03\x00\x00@\x1e\x00\x00M\x00\x00\x00#\x03\x00\x00B\x1e\x00\x00N\x00\x00\x00\x00\x03\x00\x00\xf8\x01\x00\x00'
+  b'N\x00\x00\x00\x01\x03\x00\x00C\x01\x00\x00N\x00\x00\x00\x03\x03\x00\x00\xd1\x00\x00\x00N\x00\x00\x00\x07\x03\x00\x00D\x1e\x00\x00N\x00\x00\x00\x0c\x03\x00\x00G\x01\x00\x00N\x00\x00\x00#\x03\x00\x00F\x1e\x00\x00N\x00\x00\x00'
+  b"'\x03\x00\x00E\x01\x00\x00N\x00\x00\x00-\x03\x00\x00J\x1e\x00\x00N\x00\x00\x001\x03\x00\x00H\x1e\x00\x00O\x00\x00\x00\x00\x03\x00\x00\xd2\x00\x00\x00O\x00\x00\x00\x01\x03\x00\x00\xd3\x00\x00\x00O\x00\x00\x00\x02\x03\x00\x00"
+  b'\xd4\x00\x00\x00O\x00\x00\x00\x03\x03\x00\x00\xd5\x00\x00\x00O\x00\x00\x00\x04\x03\x00\x00L\x01\x00\x00O\x00\x00\x00\x06\x03\x00\x00N\x01\x00\x00O\x00\x00\x00\x07\x03\x00\x00.\x02\x00\x00O\x00\x00\x00\x08\x03\x00\x00\xd6\x00\x00\x00'
+  b'O\x00\x00\x00\t\x03\x00\x00\xce\x1e\x00\x00O\x00\x00\x00\x0b\x03\x00\x00P\x01\x00\x00O\x00\x00\x00\x0c\x03\x00\x00\xd1\x01\x00\x00O\x00\x00\x00\x0f\x03\x00\x00\x0c\x02\x00\x00O\x00\x00\x00\x11\x03\x00\x00\x0e\x02\x00\x00O\x00\x00\x00'
+  b'\x1b\x03\x00\x00\xa0\x01\x00\x00O\x00\x00\x00#\x03\x00\x00\xcc\x1e\x00\x00O\x00\x00\x00(\x03\x00\x00\xea\x01\x00\x00P\x00\x00\x00\x01\x03\x00\x00T\x1e\x00\x00P\x00\x00\x00\x07\x03\x00\x00V\x1e\x00\x00R\x00\x00\x00\x01\x03\x00\x00'
+  b'T\x01\x00\x00R\x00\x00\x00\x07\x03\x00\x00X\x1e\x00\x00R\x00\x00\x00\x0c\x03\x00\x00X\x01\x00\x00R\x00\x00\x00\x0f\x03\x00\x00\x10\x02\x00\x00R\x00\x00\x00\x11\x03\x00\x00\x12\x02\x00\x00R\x00\x00\x00#\x03\x00\x00Z\x1e\x00\x00'
+  b"R\x00\x00\x00'\x03\x00\x00V\x01\x00\x00R\x00\x00\x001\x03\x00\x00^\x1e\x00\x00S\x00\x00\x00\x01\x03\x00\x00Z\x01\x00\x00S\x00\x00\x00\x02\x03\x00\x00\\\x01\x00\x00S\x00\x00\x00\x07\x03\x00\x00`\x1e\x00\x00S\x00\x00\x00"
+  b"\x0c\x03\x00\x00`\x01\x00\x00S\x00\x00\x00#\x03\x00\x00b\x1e\x00\x00S\x00\x00\x00&\x03\x00\x00\x18\x02\x00\x00S\x00\x00\x00'\x03\x00\x00^\x01\x00\x00T\x00\x00\x00\x07\x03\x00\x00j\x1e\x00\x00T\x00\x00\x00\x0c\x03\x00\x00"
+  b"d\x01\x00\x00T\x00\x00\x00#\x03\x00\x00l\x1e\x00\x00T\x00\x00\x00&\x03\x00\x00\x1a\x02\x00\x00T\x00\x00\x00'\x03\x00\x00b\x01\x00\x00T\x00\x00\x00-\x03\x00\x00p\x1e\x00\x00T\x00\x00\x001\x03\x00\x00n\x1e\x00\x00"
+  b'U\x00\x00\x00\x00\x03\x00\x00\xd9\x00\x00\x00U\x00\x00\x00\x01\x03\x00\x00\xda\x00\x00\x00U\x00\x00\x00\x02\x03\x00\x00\xdb\x00\x00\x00U\x00\x00\x00\x03\x03\x00\x00h\x01\x00\x00U\x00\x00\x00\x04\x03\x00\x00j\x01\x00\x00U\x00\x00\x00'
+  b'\x06\x03\x00\x00l\x01\x00\x00U\x00\x00\x00\x08\x03\x00\x00\xdc\x00\x00\x00U\x00\x00\x00\t\x03\x00\x00\xe6\x1e\x00\x00U\x00\x00\x00\n\x03\x00\x00n\x01\x00\x00U\x00\x00\x00\x0b\x03\x00\x00p\x01\x00\x00U\x00\x00\x00\x0c\x03\x00\x00'
+  b'\xd3\x01\x00\x00U\x00\x00\x00\x0f\x03\x00\x00\x14\x02\x00\x00U\x00\x00\x00\x11\x03\x00\x00\x16\x02\x00\x00U\x00\x00\x00\x1b\x03\x00\x00\xaf\x01\x00\x00U\x00\x00\x00#\x03\x00\x00\xe4\x1e\x00\x00U\x00\x00\x00$\x03\x00\x00r\x1e\x00\x00'
+  b'U\x00\x00\x00(\x03\x00\x00r\x01\x00\x00U\x00\x00\x00-\x03\x00\x00v\x1e\x00\x00U\x00\x00\x000\x03\x00\x00t\x1e\x00\x00V\x00\x00\x00\x03\x03\x00\x00|\x1e\x00\x00V\x00\x00\x00#\x03\x00\x00~\x1e\x00\x00W\x00\x00\x00'
+  b'\x00\x03\x00\x00\x80\x1e\x00\x00W\x00\x00\x00\x01\x03\x00\x00\x82\x1e\x00\x00W\x00\x00\x00\x02\x03\x00\x00t\x01\x00\x00W\x00\x00\x00\x07\x03\x00\x00\x86\x1e\x00\x00W\x00\x00\x00\x08\x03\x00\x00\x84\x1e\x00\x00W\x00\x00\x00#\x03\x00\x00'
+  b'\x88\x1e\x00\x00X\x00\x00\x00\x07\x03\x00\x00\x8a\x1e\x00\x00X\x00\x00\x00\x08\x03\x00\x00\x8c\x1e\x00\x00Y\x00\x00\x00\x00\x03\x00\x00\xf2\x1e\x00\x00Y\x00\x00\x00\x01\x03\x00\x00\xdd\x00\x00\x00Y\x00\x00\x00\x02\x03\x00\x00v\x01\x00\x00'
+  b'Y\x00\x00\x00\x03\x03\x00\x00\xf8\x1e\x00\x00Y\x00\x00\x00\x04\x03\x00\x002\x02\x00\x00Y\x00\x00\x00\x07\x03\x00\x00\x8e\x1e\x00\x00Y\x00\x00\x00\x08\x03\x00\x00x\x01\x00\x00Y\x00\x00\x00\t\x03\x00\x00\xf6\x1e\x00\x00Y\x00\x00\x00'
+  b'#\x03\x00\x00\xf4\x1e\x00\x00Z\x00\x00\x00\x01\x03\x00\x00y\x01\x00\x00Z\x00\x00\x00\x02\x03\x00\x00\x90\x1e\x00\x00Z\x00\x00\x00\x07\x03\x00\x00{\x01\x00\x00Z\x00\x00\x00\x0c\x03\x00\x00}\x01\x00\x00Z\x00\x00\x00#\x03\x00\x00'
+  b'\x92\x1e\x00\x00Z\x00\x00\x001\x03\x00\x00\x94\x1e\x00\x00a\x00\x00\x00\x00\x03\x00\x00\xe0\x00\x00\x00a\x00\x00\x00\x01\x03\x00\x00\xe1\x00\x00\x00a\x00\x00\x00\x02\x03\x00\x00\xe2\x00\x00\x00a\x00\x00\x00\x03\x03\x00\x00\xe3\x00\x00\x00'
+  b"a\x00\x00\x00\x04\x03\x00\x00\x01\x01\x00\x00a\x00\x00\x00\x06\x03\x00\x00\x03\x01\x00\x00a\x00\x00\x00\x07\x03\x00\x00'\x02\x00\x00a\x00\x00\x00\x08\x03\x00\x00\xe4\x00\x00\x00a\x00\x00\x00\t\x03\x00\x00\xa3\x1e\x00\x00a\x00\x00\x00"
+  b'\n\x03\x00\x00\xe5\x00\x00\x00a\x00\x00\x00\x0c\x03\x00\x00\xce\x01\x00\x00a\x00\x00\x00\x0f\x03\x00\x00\x01\x02\x00\x00a\x00\x00\x00\x11\x03\x00\x00\x03\x02\x00\x00a\x00\x00\x00#\x03\x00\x00\xa1\x1e\x00\x00a\x00\x00\x00%\x03\x00\x00'
+  b'\x01\x1e\x00\x00a\x00\x00\x00(\x03\x00\x00\x05\x01\x00\x00b\x00\x00\x00\x07\x03\x00\x00\x03\x1e\x00\x00b\x00\x00\x00#\x03\x00\x00\x05\x1e\x00\x00b\x00\x00\x001\x03\x00\x00\x07\x1e\x00\x00c\x00\x00\x00\x01\x03\x00\x00\x07\x01\x00\x00'
+  b"c\x00\x00\x00\x02\x03\x00\x00\t\x01\x00\x00c\x00\x00\x00\x07\x03\x00\x00\x0b\x01\x00\x00c\x00\x00\x00\x0c\x03\x00\x00\r\x01\x00\x00c\x00\x00\x00'\x03\x00\x00\xe7\x00\x00\x00d\x00\x00\x00\x07\x03\x00\x00\x0b\x1e\x00\x00d\x00\x00\x00"
+  b"\x0c\x03\x00\x00\x0f\x01\x00\x00d\x00\x00\x00#\x03\x00\x00\r\x1e\x00\x00d\x00\x00\x00'\x03\x00\x00\x11\x1e\x00\x00d\x00\x00\x00-\x03\x00\x00\x13\x1e\x00\x00d\x00\x00\x001\x03\x00\x00\x0f\x1e\x00\x00e\x00\x00\x00\x00\x03\x00\x00"
+  b'\xe8\x00\x00\x00e\x00\x00\x00\x01\x03\x00\x00\xe9\x00\x00\x00e\x00\x00\x00\x02\x03\x00\x00\xea\x00\x00\x00e\x00\x00\x00\x03\x03\x00\x00\xbd\x1e\x00\x00e\x00\x00\x00\x04\x03\x00\x00\x13\x01\x00\x00e\x00\x00\x00\x06\x03\x00\x00\x15\x01\x00\x00'
+  b'e\x00\x00\x00\x07\x03\x00\x00\x17\x01\x00\x00e\x00\x00\x00\x08\x03\x00\x00\xeb\x00\x00\x00e\x00\x00\x00\t\x03\x00\x00\xbb\x1e\x00\x00e\x00\x00\x00\x0c\x03\x00\x00\x1b\x01\x00\x00e\x00\x00\x00\x0f\x03\x00\x00\x05\x02\x00\x00e\x00\x00\x00'
+  b"\x11\x03\x00\x00\x07\x02\x00\x00e\x00\x00\x00#\x03\x00\x00\xb9\x1e\x00\x00e\x00\x00\x00'\x03\x00\x00)\x02\x00\x00e\x00\x00\x00(\x03\x00\x00\x19\x01\x00\x00e\x00\x00\x00-\x03\x00\x00\x19\x1e\x00\x00e\x00\x00\x000\x03\x00\x00"
+  b'\x1b\x1e\x00\x00f\x00\x00\x00\x07\x03\x00\x00\x1f\x1e\x00\x00g\x00\x00\x00\x01\x03\x00\x00\xf5\x01\x00\x00g\x00\x00\x00\x02\x03\x00\x00\x1d\x01\x00\x00g\x00\x00\x00\x04\x03\x00\x00!\x1e\x00\x00g\x00\x00\x00\x06\x03\x00\x00\x1f\x01\x00\x00'
+  b"g\x00\x00\x00\x07\x03\x00\x00!\x01\x00\x00g\x00\x00\x00\x0c\x03\x00\x00\xe7\x01\x00\x00g\x00\x00\x00'\x03\x00\x00#\x01\x00\x00h\x00\x00\x00\x02\x03\x00\x00%\x01\x00\x00h\x00\x00\x00\x07\x03\x00\x00#\x1e\x00\x00h\x00\x00\x00"
+  b"\x08\x03\x00\x00'\x1e\x00\x00h\x00\x00\x00\x0c\x03\x00\x00\x1f\x02\x00\x00h\x00\x00\x00#\x03\x00\x00%\x1e\x00\x00h\x00\x00\x00'\x03\x00\x00)\x1e\x00\x00h\x00\x00\x00.\x03\x00\x00+\x1e\x00\x00h\x00\x00\x001\x03\x00\x00"
+  b'\x96\x1e\x00\x00i\x00\x00\x00\x00\x03\x00\x00\xec\x00\x00\x00i\x00\x00\x00\x01\x03\x00\x00\xed\x00\x00\x00i\x00\x00\x00\x02\x03\x00\x00\xee\x00\x00\x00i\x00\x00\x00\x03\x03\x00\x00)\x01\x00\x00i\x00\x00\x00\x04\x03\x00\x00+\x01\x00\x00'
+  b'i\x00\x00\x00\x06\x03\x00\x00-\x01\x00\x00i\x00\x00\x00\x08\x03\x00\x00\xef\x00\x00\x00i\x00\x00\x00\t\x03\x00\x00\xc9\x1e\x00\x00i\x00\x00\x00\x0c\x03\x00\x00\xd0\x01\x00\x00i\x00\x00\x00\x0f\x03\x00\x00\t\x02\x00\x00i\x00\x00\x00'
+  b'\x11\x03\x00\x00\x0b\x02\x00\x00i\x00\x00\x00#\x03\x00\x00\xcb\x1e\x00\x00i\x00\x00\x00(\x03\x00\x00/\x01\x00\x00i\x00\x00\x000\x03\x00\x00-\x1e\x00\x00j\x00\x00\x00\x02\x03\x00\x005\x01\x00\x00j\x00\x00\x00\x0c\x03\x00\x00'
+  b"\xf0\x01\x00\x00k\x00\x00\x00\x01\x03\x00\x001\x1e\x00\x00k\x00\x00\x00\x0c\x03\x00\x00\xe9\x01\x00\x00k\x00\x00\x00#\x03\x00\x003\x1e\x00\x00k\x00\x00\x00'\x03\x00\x007\x01\x00\x00k\x00\x00\x001\x03\x00\x005\x1e\x00\x00"
+  b"l\x00\x00\x00\x01\x03\x00\x00:\x01\x00\x00l\x00\x00\x00\x0c\x03\x00\x00>\x01\x00\x00l\x00\x00\x00#\x03\x00\x007\x1e\x00\x00l\x00\x00\x00'\x03\x00\x00<\x01\x00\x00l\x00\x00\x00-\x03\x00\x00=\x1e\x00\x00l\x00\x00\x00"
+  b'1\x03\x00\x00;\x1e\x00\x00m\x00\x00\x00\x01\x03\x00\x00?\x1e\x00\x00m\x00\x00\x00\x07\x03\x00\x00A\x1e\x00\x00m\x00\x00\x00#\x03\x00\x00C\x1e\x00\x00n\x00\x00\x00\x00\x03\x00\x00\xf9\x01\x00\x00n\x00\x00\x00\x01\x03\x00\x00'
+  b"D\x01\x00\x00n\x00\x00\x00\x03\x03\x00\x00\xf1\x00\x00\x00n\x00\x00\x00\x07\x03\x00\x00E\x1e\x00\x00n\x00\x00\x00\x0c\x03\x00\x00H\x01\x00\x00n\x00\x00\x00#\x03\x00\x00G\x1e\x00\x00n\x00\x00\x00'\x03\x00\x00F\x01\x00\x00"
+  b'n\x00\x00\x00-\x03\x00\x00K\x1e\x00\x00n\x00\x00\x001\x03\x00\x00I\x1e\x00\x00o\x00\x00\x00\x00\x03\x00\x00\xf2\x00\x00\x00o\x00\x00\x00\x01\x03\x00\x00\xf3\x00\x00\x00o\x00\x00\x00\x02\x03\x00\x00\xf4\x00\x00\x00o\x00\x00\x00'
+  b'\x03\x03\x00\x00\xf5\x00\x00\x00o\x00\x00\x00\x04\x03\x00\x00M\x01\x00\x00o\x00\x00\x00\x06\x03\x00\x00O\x01\x00\x00o\x00\x00\x00\x07\x03\x00\x00/\x02\x00\x00o\x00\x00\x00\x08\x03\x00\x00\xf6\x00\x00\x00o\x00\x00\x00\t\x03\x00\x00'
+  b'\xcf\x1e\x00\x00o\x00\x00\x00\x0b\x03\x00\x00Q\x01\x00\x00o\x00\x00\x00\x0c\x03\x00\x00\xd2\x01\x00\x00o\x00\x00\x00\x0f\x03\x00\x00\r\x02\x00\x00o\x00\x00\x00\x11\x03\x00\x00\x0f\x02\x00\x00o\x00\x00\x00\x1b\x03\x00\x00\xa1\x01\x00\x00'
+  b'o\x00\x00\x00#\x03\x00\x00\xcd\x1e\x00\x00o\x00\x00\x00(\x03\x00\x00\xeb\x01\x00\x00p\x00\x00\x00\x01\x03\x00\x00U\x1e\x00\x00p\x00\x00\x00\x07\x03\x00\x00W\x1e\x00\x00r\x00\x00\x00\x01\x03\x00\x00U\x01\x00\x00r\x00\x00\x00'
+  b"\x07\x03\x00\x00Y\x1e\x00\x00r\x00\x00\x00\x0c\x03\x00\x00Y\x01\x00\x00r\x00\x00\x00\x0f\x03\x00\x00\x11\x02\x00\x00r\x00\x00\x00\x11\x03\x00\x00\x13\x02\x00\x00r\x00\x00\x00#\x03\x00\x00[\x1e\x00\x00r\x00\x00\x00'\x03\x00\x00"
+  b'W\x01\x00\x00r\x00\x00\x001\x03\x00\x00_\x1e\x00\x00s\x00\x00\x00\x01\x03\x00\x00[\x01\x00\x00s\x00\x00\x00\x02\x03\x00\x00]\x01\x00\x00s\x00\x00\x00\x07\x03\x00\x00a\x1e\x00\x00s\x00\x00\x00\x0c\x03\x00\x00a\x01\x00\x00'
+  b"s\x00\x00\x00#\x03\x00\x00c\x1e\x00\x00s\x00\x00\x00&\x03\x00\x00\x19\x02\x00\x00s\x00\x00\x00'\x03\x00\x00_\x01\x00\x00t\x00\x00\x00\x07\x03\x00\x00k\x1e\x00\x00t\x00\x00\x00\x08\x03\x00\x00\x97\x1e\x00\x00t\x00\x00\x00"
+  b"\x0c\x03\x00\x00e\x01\x00\x00t\x00\x00\x00#\x03\x00\x00m\x1e\x00\x00t\x00\x00\x00&\x03\x00\x00\x1b\x02\x00\x00t\x00\x00\x00'\x03\x00\x00c\x01\x00\x00t\x00\x00\x00-\x03\x00\x00q\x1e\x00\x00t\x00\x00\x001\x03\x00\x00"
+  b'o\x1e\x00\x00u\x00\x00\x00\x00\x03\x00\x00\xf9\x00\x00\x00u\x00\x00\x00\x01\x03\x00\x00\xfa\x00\x00\x00u\x00\x00\x00\x02\x03\x00\x00\xfb\x00\x00\x00u\x00\x00\x00\x03\x03\x00\x00i\x01\x00\x00u\x00\x00\x00\x04\x03\x00\x00k\x01\x00\x00'
+  b'u\x00\x00\x00\x06\x03\x00\x00m\x01\x00\x00u\x00\x00\x00\x08\x03\x00\x00\xfc\x00\x00\x00u\x00\x00\x00\t\x03\x00\x00\xe7\x1e\x00\x00u\x00\x00\x00\n\x03\x00\x00o\x01\x00\x00u\x00\x00\x00\x0b\x03\x00\x00q\x01\x00\x00u\x00\x00\x00'
+  b'\x0c\x03\x00\x00\xd4\x01\x00\x00u\x00\x00\x00\x0f\x03\x00\x00\x15\x02\x00\x00u\x00\x00\x00\x11\x03\x00\x00\x17\x02\x00\x00u\x00\x00\x00\x1b\x03\x00\x00\xb0\x01\x00\x00u\x00\x00\x00#\x03\x00\x00\xe5\x1e\x00\x00u\x00\x00\x00$\x03\x00\x00'
+  b's\x1e\x00\x00u\x00\x00\x00(\x03\x00\x00s\x01\x00\x00u\x00\x00\x00-\x03\x00\x00w\x1e\x00\x00u\x00\x00\x000\x03\x00\x00u\x1e\x00\x00v\x00\x00\x00\x03\x03\x00\x00}\x1e\x00\x00v\x00\x00\x00#\x03\x00\x00\x7f\x1e\x00\x00'
+  b'w\x00\x00\x00\x00\x03\x00\x00\x81\x1e\x00\x00w\x00\x00\x00\x01\x03\x00\x00\x83\x1e\x00\x00w\x00\x00\x00\x02\x03\x00\x00u\x01\x00\x00w\x00\x00\x00\x07\x03\x00\x00\x87\x1e\x00\x00w\x00\x00\x00\x08\x03\x00\x00\x85\x1e\x00\x00w\x00\x00\x00'
+  b'\n\x03\x00\x00\x98\x1e\x00\x00w\x00\x00\x00#\x03\x00\x00\x89\x1e\x00\x00x\x00\x00\x00\x07\x03\x00\x00\x8b\x1e\x00\x00x\x00\x00\x00\x08\x03\x00\x00\x8d\x1e\x00\x00y\x00\x00\x00\x00\x03\x00\x00\xf3\x1e\x00\x00y\x00\x00\x00\x01\x03\x00\x00'
+  b'\xfd\x00\x00\x00y\x00\x00\x00\x02\x03\x00\x00w\x01\x00\x00y\x00\x00\x00\x03\x03\x00\x00\xf9\x1e\x00\x00y\x00\x00\x00\x04\x03\x00\x003\x02\x00\x00y\x00\x00\x00\x07\x03\x00\x00\x8f\x1e\x00\x00y\x00\x00\x00\x08\x03\x00\x00\xff\x00\x00\x00'
+  b'y\x00\x00\x00\t\x03\x00\x00\xf7\x1e\x00\x00y\x00\x00\x00\n\x03\x00\x00\x99\x1e\x00\x00y\x00\x00\x00#\x03\x00\x00\xf5\x1e\x00\x00z\x00\x00\x00\x01\x03\x00\x00z\x01\x00\x00z\x00\x00\x00\x02\x03\x00\x00\x91\x1e\x00\x00z\x00\x00\x00'
+  b'\x07\x03\x00\x00|\x01\x00\x00z\x00\x00\x00\x0c\x03\x00\x00~\x01\x00\x00z\x00\x00\x00#\x03\x00\x00\x93\x1e\x00\x00z\x00\x00\x001\x03\x00\x00\x95\x1e\x00\x00\xa8\x00\x00\x00\x00\x03\x00\x00\xed\x1f\x00\x00\xa8\x00\x00\x00\x01\x03\x00\x00'
+  b'\x85\x03\x00\x00\xa8\x00\x00\x00B\x03\x00\x00\xc1\x1f\x00\x00\xc2\x00\x00\x00\x00\x03\x00\x00\xa6\x1e\x00\x00\xc2\x00\x00\x00\x01\x03\x00\x00\xa4\x1e\x00\x00\xc2\x00\x00\x00\x03\x03\x00\x00\xaa\x1e\x00\x00\xc2\x00\x00\x00\t\x03\x00\x00\xa8\x1e\x00\x00'
+  b'\xc4\x00\x00\x00\x04\x03\x00\x00\xde\x01\x00\x00\xc5\x00\x00\x00\x01\x03\x00\x00\xfa\x01\x00\x00\xc6\x00\x00\x00\x01\x03\x00\x00\xfc\x01\x00\x00\xc6\x00\x00\x00\x04\x03\x00\x00\xe2\x01\x00\x00\xc7\x00\x00\x00\x01\x03\x00\x00\x08\x1e\x00\x00\xca\x00\x00\x00'
+  b'\x00\x03\x00\x00\xc0\x1e\x00\x00\xca\x00\x00\x00\x01\x03\x00\x00\xbe\x1e\x00\x00\xca\x00\x00\x00\x03\x03\x00\x00\xc4\x1e\x00\x00\xca\x00\x00\x00\t\x03\x00\x00\xc2\x1e\x00\x00\xcf\x00\x00\x00\x01\x03\x00\x00.\x1e\x00\x00\xd4\x00\x00\x00\x00\x03\x00\x00'
+  b'\xd2\x1e\x00\x00\xd4\x00\x00\x00\x01\x03\x00\x00\xd0\x1e\x00\x00\xd4\x00\x00\x00\x03\x03\x00\x00\xd6\x1e\x00\x00\xd4\x00\x00\x00\t\x03\x00\x00\xd4\x1e\x00\x00\xd5\x00\x00\x00\x01\x03\x00\x00L\x1e\x00\x00\xd5\x00\x00\x00\x04\x03\x00\x00,\x02\x00\x00'
+  b'\xd5\x00\x00\x00\x08\x03\x00\x00N\x1e\x00\x00\xd6\x00\x00\x00\x04\x03\x00\x00*\x02\x00\x00\xd8\x00\x00\x00\x01\x03\x00\x00\xfe\x01\x00\x00\xdc\x00\x00\x00\x00\x03\x00\x00\xdb\x01\x00\x00\xdc\x00\x00\x00\x01\x03\x00\x00\xd7\x01\x00\x00\xdc\x00\x00\x00'
+  b'\x04\x03\x00\x00\xd5\x01\x00\x00\xdc\x00\x00\x00\x0c\x03\x00\x00\xd9\x01\x00\x00\xe2\x00\x00\x00\x00\x03\x00\x00\xa7\x1e\x00\x00\xe2\x00\x00\x00\x01\x03\x00\x00\xa5\x1e\x00\x00\xe2\x00\x00\x00\x03\x03\x00\x00\xab\x1e\x00\x00\xe2\x00\x00\x00\t\x03\x00\x00'
+  b'\xa9\x1e\x00\x00\xe4\x00\x00\x00\x04\x03\x00\x00\xdf\x01\x00\x00\xe5\x00\x00\x00\x01\x03\x00\x00\xfb\x01\x00\x00\xe6\x00\x00\x00\x01\x03\x00\x00\xfd\x01\x00\x00\xe6\x00\x00\x00\x04\x03\x00\x00\xe3\x01\x00\x00\xe7\x00\x00\x00\x01\x03\x00\x00\t\x1e\x00\x00'
+  b'\xea\x00\x00\x00\x00\x03\x00\x00\xc1\x1e\x00\x00\xea\x00\x00\x00\x01\x03\x00\x00\xbf\x1e\x00\x00\xea\x00\x00\x00\x03\x03\x00\x00\xc5\x1e\x00\x00\xea\x00\x00\x00\t\x03\x00\x00\xc3\x1e\x00\x00\xef\x00\x00\x00\x01\x03\x00\x00/\x1e\x00\x00\xf4\x00\x00\x00'
+  b'\x00\x03\x00\x00\xd3\x1e\x00\x00\xf4\x00\x00\x00\x01\x03\x00\x00\xd1\x1e\x00\x00\xf4\x00\x00\x00\x03\x03\x00\x00\xd7\x1e\x00\x00\xf4\x00\x00\x00\t\x03\x00\x00\xd5\x1e\x00\x00\xf5\x00\x00\x00\x01\x03\x00\x00M\x1e\x00\x00\xf5\x00\x00\x00\x04\x03\x00\x00'
+  b'-\x02\x00\x00\xf5\x00\x00\x00\x08\x03\x00\x00O\x1e\x00\x00\xf6\x00\x00\x00\x04\x03\x00\x00+\x02\x00\x00\xf8\x00\x00\x00\x01\x03\x00\x00\xff\x01\x00\x00\xfc\x00\x00\x00\x00\x03\x00\x00\xdc\x01\x00\x00\xfc\x00\x00\x00\x01\x03\x00\x00\xd8\x01\x00\x00'
+  b'\xfc\x00\x00\x00\x04\x03\x00\x00\xd6\x01\x00\x00\xfc\x00\x00\x00\x0c\x03\x00\x00\xda\x01\x00\x00\x02\x01\x00\x00\x00\x03\x00\x00\xb0\x1e\x00\x00\x02\x01\x00\x00\x01\x03\x00\x00\xae\x1e\x00\x00\x02\x01\x00\x00\x03\x03\x00\x00\xb4\x1e\x00\x00\x02\x01\x00\x00'
+  b'\t\x03\x00\x00\xb2\x1e\x00\x00\x03\x01\x00\x00\x00\x03\x00\x00\xb1\x1e\x00\x00\x03\x01\x00\x00\x01\x03\x00\x00\xaf\x1e\x00\x00\x03\x01\x00\x00\x03\x03\x00\x00\xb5\x1e\x00\x00\x03\x01\x00\x00\t\x03\x00\x00\xb3\x1e\x00\x00\x12\x01\x00\x00\x00\x03\x00\x00'
+  b'\x14\x1e\x00\x00\x12\x01\x00\x00\x01\x03\x00\x00\x16\x1e\x00\x00\x13\x01\x00\x00\x00\x03\x00\x00\x15\x1e\x00\x00\x13\x01\x00\x00\x01\x03\x00\x00\x17\x1e\x00\x00L\x01\x00\x00\x00\x03\x00\x00P\x1e\x00\x00L\x01\x00\x00\x01\x03\x00\x00R\x1e\x00\x00'
+  b'M\x01\x00\x00\x00\x03\x00\x00Q\x1e\x00\x00M\x01\x00\x00\x01\x03\x00\x00S\x1e\x00\x00Z\x01\x00\x00\x07\x03\x00\x00d\x1e\x00\x00[\x01\x00\x00\x07\x03\x00\x00e\x1e\x00\x00`\x01\x00\x00\x07\x03\x00\x00f\x1e\x00\x00a\x01\x00\x00'
+  b'\x07\x03\x00\x00g\x1e\x00\x00h\x01\x00\x00\x01\x03\x00\x00x\x1e\x00\x00i\x01\x00\x00\x01\x03\x00\x00y\x1e\x00\x00j\x01\x00\x00\x08\x03\x00\x00z\x1e\x00\x00k\x01\x00\x00\x08\x03\x00\x00{\x1e\x00\x00\x7f\x01\x00\x00\x07\x03\x00\x00'
+  b'\x9b\x1e\x00\x00\xa0\x01\x00\x00\x00\x03\x00\x00\xdc\x1e\x00\x00\xa0\x01\x00\x00\x01\x03\x00\x00\xda\x1e\x00\x00\xa0\x01\x00\x00\x03\x03\x00\x00\xe0\x1e\x00\x00\xa0\x01\x00\x00\t\x03\x00\x00\xde\x1e\x00\x00\xa0\x01\x00\x00#\x03\x00\x00\xe2\x1e\x00\x00'
+  b'\xa1\x01\x00\x00\x00\x03\x00\x00\xdd\x1e\x00\x00\xa1\x01\x00\x00\x01\x03\x00\x00\xdb\x1e\x00\x00\xa1\x01\x00\x00\x03\x03\x00\x00\xe1\x1e\x00\x00\xa1\x01\x00\x00\t\x03\x00\x00\xdf\x1e\x00\x00\xa1\x01\x00\x00#\x03\x00\x00\xe3\x1e\x00\x00\xaf\x01\x00\x00'
+  b'\x00\x03\x00\x00\xea\x1e\x00\x00\xaf\x01\x00\x00\x01\x03\x00\x00\xe8\x1e\x00\x00\xaf\x01\x00\x00\x03\x03\x00\x00\xee\x1e\x00\x00\xaf\x01\x00\x00\t\x03\x00\x00\xec\x1e\x00\x00\xaf\x01\x00\x00#\x03\x00\x00\xf0\x1e\x00\x00\xb0\x01\x00\x00\x00\x03\x00\x00'
+  b'\xeb\x1e\x00\x00\xb0\x01\x00\x00\x01\x03\x00\x00\xe9\x1e\x00\x00\xb0\x01\x00\x00\x03\x03\x00\x00\xef\x1e\x00\x00\xb0\x01\x00\x00\t\x03\x00\x00\xed\x1e\x00\x00\xb0\x01\x00\x00#\x03\x00\x00\xf1\x1e\x00\x00\xb7\x01\x00\x00\x0c\x03\x00\x00\xee\x01\x00\x00'
+  b"\xea\x01\x00\x00\x04\x03\x00\x00\xec\x01\x00\x00\xeb\x01\x00\x00\x04\x03\x00\x00\xed\x01\x00\x00&\x02\x00\x00\x04\x03\x00\x00\xe0\x01\x00\x00'\x02\x00\x00\x04\x03\x00\x00\xe1\x01\x00\x00(\x02\x00\x00\x06\x03\x00\x00\x1c\x1e\x00\x00)\x02\x00\x00"
+  b'\x06\x03\x00\x00\x1d\x1e\x00\x00.\x02\x00\x00\x04\x03\x00\x000\x02\x00\x00/\x02\x00\x00\x04\x03\x00\x001\x02\x00\x00\x92\x02\x00\x00\x0c\x03\x00\x00\xef\x01\x00\x00\x91\x03\x00\x00\x00\x03\x00\x00\xba\x1f\x00\x00\x91\x03\x00\x00\x01\x03\x00\x00'
+  b'\x86\x03\x00\x00\x91\x03\x00\x00\x04\x03\x00\x00\xb9\x1f\x00\x00\x91\x03\x00\x00\x06\x03\x00\x00\xb8\x1f\x00\x00\x91\x03\x00\x00\x13\x03\x00\x00\x08\x1f\x00\x00\x91\x03\x00\x00\x14\x03\x00\x00\t\x1f\x00\x00\x91\x03\x00\x00E\x03\x00\x00\xbc\x1f\x00\x00'
+  b'\x95\x03\x00\x00\x00\x03\x00\x00\xc8\x1f\x00\x00\x95\x03\x00\x00\x01\x03\x00\x00\x88\x03\x00\x00\x95\x03\x00\x00\x13\x03\x00\x00\x18\x1f\x00\x00\x95\x03\x00\x00\x14\x03\x00\x00\x19\x1f\x00\x00\x97\x03\x00\x00\x00\x03\x00\x00\xca\x1f\x00\x00\x97\x03\x00\x00'
+  b'\x01\x03\x00\x00\x89\x03\x00\x00\x97\x03\x00\x00\x13\x03\x00\x00(\x1f\x00\x00\x97\x03\x00\x00\x14\x03\x00\x00)\x1f\x00\x00\x97\x03\x00\x00E\x03\x00\x00\xcc\x1f\x00\x00\x99\x03\x00\x00\x00\x03\x00\x00\xda\x1f\x00\x00\x99\x03\x00\x00\x01\x03\x00\x00'
+  b'\x8a\x03\x00\x00\x99\x03\x00\x00\x04\x03\x00\x00\xd9\x1f\x00\x00\x99\x03\x00\x00\x06\x03\x00\x00\xd8\x1f\x00\x00\x99\x03\x00\x00\x08\x03\x00\x00\xaa\x03\x00\x00\x99\x03\x00\x00\x13\x03\x00\x008\x1f\x00\x00\x99\x03\x00\x00\x14\x03\x00\x009\x1f\x00\x00'
+  b'\x9f\x03\x00\x00\x00\x03\x00\x00\xf8\x1f\x00\x00\x9f\x03\x00\x00\x01\x03\x00\x00\x8c\x03\x00\x00\x9f\x03\x00\x00\x13\x03\x00\x00H\x1f\x00\x00\x9f\x03\x00\x00\x14\x03\x00\x00I\x1f\x00\x00\xa1\x03\x00\x00\x14\x03\x00\x00\xec\x1f\x00\x00\xa5\x03\x00\x00'
+  b'\x00\x03\x00\x00\xea\x1f\x00\x00\xa5\x03\x00\x00\x01\x03\x00\x00\x8e\x03\x00\x00\xa5\x03\x00\x00\x04\x03\x00\x00\xe9\x1f\x00\x00\xa5\x03\x00\x00\x06\x03\x00\x00\xe8\x1f\x00\x00\xa5\x03\x00\x00\x08\x03\x00\x00\xab\x03\x00\x00\xa5\x03\x00\x00\x14\x03\x00\x00'
+  b'Y\x1f\x00\x00\xa9\x03\x00\x00\x00\x03\x00\x00\xfa\x1f\x00\x00\xa9\x03\x00\x00\x01\x03\x00\x00\x8f\x03\x00\x00\xa9\x03\x00\x00\x13\x03\x00\x00h\x1f\x00\x00\xa9\x03\x00\x00\x14\x03\x00\x00i\x1f\x00\x00\xa9\x03\x00\x00E\x03\x00\x00\xfc\x1f\x00\x00'
+  b'\xac\x03\x00\x00E\x03\x00\x00\xb4\x1f\x00\x00\xae\x03\x00\x00E\x03\x00\x00\xc4\x1f\x00\x00\xb1\x03\x00\x00\x00\x03\x00\x00p\x1f\x00\x00\xb1\x03\x00\x00\x01\x03\x00\x00\xac\x03\x00\x00\xb1\x03\x00\x00\x04\x03\x00\x00\xb1\x1f\x00\x00\xb1\x03\x00\x00'
+  b'\x06\x03\x00\x00\xb0\x1f\x00\x00\xb1\x03\x00\x00\x13\x03\x00\x00\x00\x1f\x00\x00\xb1\x03\x00\x00\x14\x03\x00\x00\x01\x1f\x00\x00\xb1\x03\x00\x00B\x03\x00\x00\xb6\x1f\x00\x00\xb1\x03\x00\x00E\x03\x00\x00\xb3\x1f\x00\x00\xb5\x03\x00\x00\x00\x03\x00\x00'
+  b'r\x1f\x00\x00\xb5\x03\x00\x00\x01\x03\x00\x00\xad\x03\x00\x00\xb5\x03\x00\x00\x13\x03\x00\x00\x10\x1f\x00\x00\xb5\x03\x00\x00\x14\x03\x00\x00\x11\x1f\x00\x00\xb7\x03\x00\x00\x00\x03\x00\x00t\x1f\x00\x00\xb7\x03\x00\x00\x01\x03\x00\x00\xae\x03\x00\x00'
+  b'\xb7\x03\x00\x00\x13\x03\x00\x00 \x1f\x00\x00\xb7\x03\x00\x00\x14\x03\x00\x00!\x1f\x00\x00\xb7\x03\x00\x00B\x03\x00\x00\xc6\x1f\x00\x00\xb7\x03\x00\x00E\x03\x00\x00\xc3\x1f\x00\x00\xb9\x03\x00\x00\x00\x03\x00\x00v\x1f\x00\x00\xb9\x03\x00\x00'
+  b'\x01\x03\x00\x00\xaf\x03\x00\x00\xb9\x03\x00\x00\x04\x03\x00\x00\xd1\x1f\x00\x00\xb9\x03\x00\x00\x06\x03\x00\x00\xd0\x1f\x00\x00\xb9\x03\x00\x00\x08\x03\x00\x00\xca\x03\x00\x00\xb9\x03\x00\x00\x13\x03\x00\x000\x1f\x00\x00\xb9\x03\x00\x00\x14\x03\x00\x00'
+  b'1\x1f\x00\x00\xb9\x03\x00\x00B\x03\x00\x00\xd6\x1f\x00\x00\xbf\x03\x00\x00\x00\x03\x00\x00x\x1f\x00\x00\xbf\x03\x00\x00\x01\x03\x00\x00\xcc\x03\x00\x00\xbf\x03\x00\x00\x13\x03\x00\x00@\x1f\x00\x00\xbf\x03\x00\x00\x14\x03\x00\x00A\x1f\x00\x00'
+  b'\xc1\x03\x00\x00\x13\x03\x00\x00\xe4\x1f\x00\x00\xc1\x03\x00\x00\x14\x03\x00\x00\xe5\x1f\x00\x00\xc5\x03\x00\x00\x00\x03\x00\x00z\x1f\x00\x00\xc5\x03\x00\x00\x01\x03\x00\x00\xcd\x03\x00\x00\xc5\x03\x00\x00\x04\x03\x00\x00\xe1\x1f\x00\x00\xc5\x03\x00\x00'
+  b'\x06\x03\x00\x00\xe0\x1f\x00\x00\xc5\x03\x00\x00\x08\x03\x00\x00\xcb\x03\x00\x00\xc5\x03\x00\x00\x13\x03\x00\x00P\x1f\x00\x00\xc5\x03\x00\x00\x14\x03\x00\x00Q\x1f\x00\x00\xc5\x03\x00\x00B\x03\x00\x00\xe6\x1f\x00\x00\xc9\x03\x00\x00\x00\x03\x00\x00'
+  b'|\x1f\x00\x00\xc9\x03\x00\x00\x01\x03\x00\x00\xce\x03\x00\x00\xc9\x03\x00\x00\x13\x03\x00\x00`\x1f\x00\x00\xc9\x03\x00\x00\x14\x03\x00\x00a\x1f\x00\x00\xc9\x03\x00\x00B\x03\x00\x00\xf6\x1f\x00\x00\xc9\x03\x00\x00E\x03\x00\x00\xf3\x1f\x00\x00'
+  b'\xca\x03\x00\x00\x00\x03\x00\x00\xd2\x1f\x00\x00\xca\x03\x00\x00\x01\x03\x00\x00\x90\x03\x00\x00\xca\x03\x00\x00B\x03\x00\x00\xd7\x1f\x00\x00\xcb\x03\x00\x00\x00\x03\x00\x00\xe2\x1f\x00\x00\xcb\x03\x00\x00\x01\x03\x00\x00\xb0\x03\x00\x00\xcb\x03\x00\x00'
+  b'B\x03\x00\x00\xe7\x1f\x00\x00\xce\x03\x00\x00E\x03\x00\x00\xf4\x1f\x00\x00\xd2\x03\x00\x00\x01\x03\x00\x00\xd3\x03\x00\x00\xd2\x03\x00\x00\x08\x03\x00\x00\xd4\x03\x00\x00\x06\x04\x00\x00\x08\x03\x00\x00\x07\x04\x00\x00\x10\x04\x00\x00\x06\x03\x00\x00'
+  b'\xd0\x04\x00\x00\x10\x04\x00\x00\x08\x03\x00\x00\xd2\x04\x00\x00\x13\x04\x00\x00\x01\x03\x00\x00\x03\x04\x00\x00\x15\x04\x00\x00\x00\x03\x00\x00\x00\x04\x00\x00\x15\x04\x00\x00\x06\x03\x00\x00\xd6\x04\x00\x00\x15\x04\x00\x00\x08\x03\x00\x00\x01\x04\x00\x00'
+  b'\x16\x04\x00\x00\x06\x03\x00\x00\xc1\x04\x00\x00\x16\x04\x00\x00\x08\x03\x00\x00\xdc\x04\x00\x00\x17\x04\x00\x00\x08\x03\x00\x00\xde\x04\x00\x00\x18\x04\x00\x00\x00\x03\x00\x00\r\x04\x00\x00\x18\x04\x00\x00\x04\x03\x00\x00\xe2\x04\x00\x00\x18\x04\x00\x00'
+  b'\x06\x03\x00\x00\x19\x04\x00\x00\x18\x04\x00\x00\x08\x03\x00\x00\xe4\x04\x00\x00\x1a\x04\x00\x00\x01\x03\x00\x00\x0c\x04\x00\x00\x1e\x04\x00\x00\x08\x03\x00\x00\xe6\x04\x00\x00#\x04\x00\x00\x04\x03\x00\x00\xee\x04\x00\x00#\x04\x00\x00\x06\x03\x00\x00'
+  b"\x0e\x04\x00\x00#\x04\x00\x00\x08\x03\x00\x00\xf0\x04\x00\x00#\x04\x00\x00\x0b\x03\x00\x00\xf2\x04\x00\x00'\x04\x00\x00\x08\x03\x00\x00\xf4\x04\x00\x00+\x04\x00\x00\x08\x03\x00\x00\xf8\x04\x00\x00-\x04\x00\x00\x08\x03\x00\x00\xec\x04\x00\x00"
+  b'0\x04\x00\x00\x06\x03\x00\x00\xd1\x04\x00\x000\x04\x00\x00\x08\x03\x00\x00\xd3\x04\x00\x003\x04\x00\x00\x01\x03\x00\x00S\x04\x00\x005\x04\x00\x00\x00\x03\x00\x00P\x04\x00\x005\x04\x00\x00\x06\x03\x00\x00\xd7\x04\x00\x005\x04\x00\x00'
+  b'\x08\x03\x00\x00Q\x04\x00\x006\x04\x00\x00\x06\x03\x00\x00\xc2\x04\x00\x006\x04\x00\x00\x08\x03\x00\x00\xdd\x04\x00\x007\x04\x00\x00\x08\x03\x00\x00\xdf\x04\x00\x008\x04\x00\x00\x00\x03\x00\x00]\x04\x00\x008\x04\x00\x00\x04\x03\x00\x00'
+  b'\xe3\x04\x00\x008\x04\x00\x00\x06\x03\x00\x009\x04\x00\x008\x04\x00\x00\x08\x03\x00\x00\xe5\x04\x00\x00:\x04\x00\x00\x01\x03\x00\x00\\\x04\x00\x00>\x04\x00\x00\x08\x03\x00\x00\xe7\x04\x00\x00C\x04\x00\x00\x04\x03\x00\x00\xef\x04\x00\x00'
+  b'C\x04\x00\x00\x06\x03\x00\x00^\x04\x00\x00C\x04\x00\x00\x08\x03\x00\x00\xf1\x04\x00\x00C\x04\x00\x00\x0b\x03\x00\x00\xf3\x04\x00\x00G\x04\x00\x00\x08\x03\x00\x00\xf5\x04\x00\x00K\x04\x00\x00\x08\x03\x00\x00\xf9\x04\x00\x00M\x04\x00\x00'
+  b'\x08\x03\x00\x00\xed\x04\x00\x00V\x04\x00\x00\x08\x03\x00\x00W\x04\x00\x00t\x04\x00\x00\x0f\x03\x00\x00v\x04\x00\x00u\x04\x00\x00\x0f\x03\x00\x00w\x04\x00\x00\xd8\x04\x00\x00\x08\x03\x00\x00\xda\x04\x00\x00\xd9\x04\x00\x00\x08\x03\x00\x00'
+  b'\xdb\x04\x00\x00\xe8\x04\x00\x00\x08\x03\x00\x00\xea\x04\x00\x00\xe9\x04\x00\x00\x08\x03\x00\x00\xeb\x04\x00\x00\'\x06\x00\x00S\x06\x00\x00"\x06\x00\x00\'\x06\x00\x00T\x06\x00\x00#\x06\x00\x00\'\x06\x00\x00U\x06\x00\x00%\x06\x00\x00'
+  b'H\x06\x00\x00T\x06\x00\x00$\x06\x00\x00J\x06\x00\x00T\x06\x00\x00&\x06\x00\x00\xc1\x06\x00\x00T\x06\x00\x00\xc2\x06\x00\x00\xd2\x06\x00\x00T\x06\x00\x00\xd3\x06\x00\x00\xd5\x06\x00\x00T\x06\x00\x00\xc0\x06\x00\x00(\t\x00\x00'
+  b'<\t\x00\x00)\t\x00\x000\t\x00\x00<\t\x00\x001\t\x00\x003\t\x00\x00<\t\x00\x004\t\x00\x00\xc7\t\x00\x00\xbe\t\x00\x00\xcb\t\x00\x00\xc7\t\x00\x00\xd7\t\x00\x00\xcc\t\x00\x00G\x0b\x00\x00>\x0b\x00\x00'
+  b'K\x0b\x00\x00G\x0b\x00\x00V\x0b\x00\x00H\x0b\x00\x00G\x0b\x00\x00W\x0b\x00\x00L\x0b\x00\x00\x92\x0b\x00\x00\xd7\x0b\x00\x00\x94\x0b\x00\x00\xc6\x0b\x00\x00\xbe\x0b\x00\x00\xca\x0b\x00\x00\xc6\x0b\x00\x00\xd7\x0b\x00\x00\xcc\x0b\x00\x00'
+  b'\xc7\x0b\x00\x00\xbe\x0b\x00\x00\xcb\x0b\x00\x00F\x0c\x00\x00V\x0c\x00\x00H\x0c\x00\x00\xbf\x0c\x00\x00\xd5\x0c\x00\x00\xc0\x0c\x00\x00\xc6\x0c\x00\x00\xc2\x0c\x00\x00\xca\x0c\x00\x00\xc6\x0c\x00\x00\xd5\x0c\x00\x00\xc7\x0c\x00\x00\xc6\x0c\x00\x00'
+  b'\xd6\x0c\x00\x00\xc8\x0c\x00\x00\xca\x0c\x00\x00\xd5\x0c\x00\x00\xcb\x0c\x00\x00F\r\x00\x00>\r\x00\x00J\r\x00\x00F\r\x00\x00W\r\x00\x00L\r\x00\x00G\r\x00\x00>\r\x00\x00K\r\x00\x00\xd9\r\x00\x00\xca\r\x00\x00'
+  b'\xda\r\x00\x00\xd9\r\x00\x00\xcf\r\x00\x00\xdc\r\x00\x00\xd9\r\x00\x00\xdf\r\x00\x00\xde\r\x00\x00\xdc\r\x00\x00\xca\r\x00\x00\xdd\r\x00\x00%\x10\x00\x00.\x10\x00\x00&\x10\x00\x00\x05\x1b\x00\x005\x1b\x00\x00\x06\x1b\x00\x00'
+  b'\x07\x1b\x00\x005\x1b\x00\x00\x08\x1b\x00\x00\t\x1b\x00\x005\x1b\x00\x00\n\x1b\x00\x00\x0b\x1b\x00\x005\x1b\x00\x00\x0c\x1b\x00\x00\r\x1b\x00\x005\x1b\x00\x00\x0e\x1b\x00\x00\x11\x1b\x00\x005\x1b\x00\x00\x12\x1b\x00\x00:\x1b\x00\x00'
+  b'5\x1b\x00\x00;\x1b\x00\x00<\x1b\x00\x005\x1b\x00\x00=\x1b\x00\x00>\x1b\x00\x005\x1b\x00\x00@\x1b\x00\x00?\x1b\x00\x005\x1b\x00\x00A\x1b\x00\x00B\x1b\x00\x005\x1b\x00\x00C\x1b\x00\x006\x1e\x00\x00\x04\x03\x00\x00'
+  b'8\x1e\x00\x007\x1e\x00\x00\x04\x03\x00\x009\x1e\x00\x00Z\x1e\x00\x00\x04\x03\x00\x00\\\x1e\x00\x00[\x1e\x00\x00\x04\x03\x00\x00]\x1e\x00\x00b\x1e\x00\x00\x07\x03\x00\x00h\x1e\x00\x00c\x1e\x00\x00\x07\x03\x00\x00i\x1e\x00\x00'
+  b'\xa0\x1e\x00\x00\x02\x03\x00\x00\xac\x1e\x00\x00\xa0\x1e\x00\x00\x06\x03\x00\x00\xb6\x1e\x00\x00\xa1\x1e\x00\x00\x02\x03\x00\x00\xad\x1e\x00\x00\xa1\x1e\x00\x00\x06\x03\x00\x00\xb7\x1e\x00\x00\xb8\x1e\x00\x00\x02\x03\x00\x00\xc6\x1e\x00\x00\xb9\x1e\x00\x00'
+  b'\x02\x03\x00\x00\xc7\x1e\x00\x00\xcc\x1e\x00\x00\x02\x03\x00\x00\xd8\x1e\x00\x00\xcd\x1e\x00\x00\x02\x03\x00\x00\xd9\x1e\x00\x00\x00\x1f\x00\x00\x00\x03\x00\x00\x02\x1f\x00\x00\x00\x1f\x00\x00\x01\x03\x00\x00\x04\x1f\x00\x00\x00\x1f\x00\x00B\x03\x00\x00'
+  b'\x06\x1f\x00\x00\x00\x1f\x00\x00E\x03\x00\x00\x80\x1f\x00\x00\x01\x1f\x00\x00\x00\x03\x00\x00\x03\x1f\x00\x00\x01\x1f\x00\x00\x01\x03\x00\x00\x05\x1f\x00\x00\x01\x1f\x00\x00B\x03\x00\x00\x07\x1f\x00\x00\x01\x1f\x00\x00E\x03\x00\x00\x81\x1f\x00\x00'
+  b'\x02\x1f\x00\x00E\x03\x00\x00\x82\x1f\x00\x00\x03\x1f\x00\x00E\x03\x00\x00\x83\x1f\x00\x00\x04\x1f\x00\x00E\x03\x00\x00\x84\x1f\x00\x00\x05\x1f\x00\x00E\x03\x00\x00\x85\x1f\x00\x00\x06\x1f\x00\x00E\x03\x00\x00\x86\x1f\x00\x00\x07\x1f\x00\x00'
+  b'E\x03\x00\x00\x87\x1f\x00\x00\x08\x1f\x00\x00\x00\x03\x00\x00\n\x1f\x00\x00\x08\x1f\x00\x00\x01\x03\x00\x00\x0c\x1f\x00\x00\x08\x1f\x00\x00B\x03\x00\x00\x0e\x1f\x00\x00\x08\x1f\x00\x00E\x03\x00\x00\x88\x1f\x00\x00\t\x1f\x00\x00\x00\x03\x00\x00'
+  b'\x0b\x1f\x00\x00\t\x1f\x00\x00\x01\x03\x00\x00\r\x1f\x00\x00\t\x1f\x00\x00B\x03\x00\x00\x0f\x1f\x00\x00\t\x1f\x00\x00E\x03\x00\x00\x89\x1f\x00\x00\n\x1f\x00\x00E\x03\x00\x00\x8a\x1f\x00\x00\x0b\x1f\x00\x00E\x03\x00\x00\x8b\x1f\x00\x00'
+  b'\x0c\x1f\x00\x00E\x03\x00\x00\x8c\x1f\x00\x00\r\x1f\x00\x00E\x03\x00\x00\x8d\x1f\x00\x00\x0e\x1f\x00\x00E\x03\x00\x00\x8e\x1f\x00\x00\x0f\x1f\x00\x00E\x03\x00\x00\x8f\x1f\x00\x00\x10\x1f\x00\x00\x00\x03\x00\x00\x12\x1f\x00\x00\x10\x1f\x00\x00'
+  b'\x01\x03\x00\x00\x14\x1f\x00\x00\x11\x1f\x00\x00\x00\x03\x00\x00\x13\x1f\x00\x00\x11\x1f\x00\x00\x01\x03\x00\x00\x15\x1f\x00\x00\x18\x1f\x00\x00\x00\x03\x00\x00\x1a\x1f\x00\x00\x18\x1f\x00\x00\x01\x03\x00\x00\x1c\x1f\x00\x00\x19\x1f\x00\x00\x00\x03\x00\x00'
+  b'\x1b\x1f\x00\x00\x19\x1f\x00\x00\x01\x03\x00\x00\x1d\x1f\x00\x00 \x1f\x00\x00\x00\x03\x00\x00"\x1f\x00\x00 \x1f\x00\x00\x01\x03\x00\x00$\x1f\x00\x00 \x1f\x00\x00B\x03\x00\x00&\x1f\x00\x00 \x1f\x00\x00E\x03\x00\x00\x90\x1f\x00\x00'
+  b'!\x1f\x00\x00\x00\x03\x00\x00#\x1f\x00\x00!\x1f\x00\x00\x01\x03\x00\x00%\x1f\x00\x00!\x1f\x00\x00B\x03\x00\x00\'\x1f\x00\x00!\x1f\x00\x00E\x03\x00\x00\x91\x1f\x00\x00"\x1f\x00\x00E\x03\x00\x00\x92\x1f\x00\x00#\x1f\x00\x00'
+  b"E\x03\x00\x00\x93\x1f\x00\x00$\x1f\x00\x00E\x03\x00\x00\x94\x1f\x00\x00%\x1f\x00\x00E\x03\x00\x00\x95\x1f\x00\x00&\x1f\x00\x00E\x03\x00\x00\x96\x1f\x00\x00'\x1f\x00\x00E\x03\x00\x00\x97\x1f\x00\x00(\x1f\x00\x00\x00\x03\x00\x00"
+  b'*\x1f\x00\x00(\x1f\x00\x00\x01\x03\x00\x00,\x1f\x00\x00(\x1f\x00\x00B\x03\x00\x00.\x1f\x00\x00(\x1f\x00\x00E\x03\x00\x00\x98\x1f\x00\x00)\x1f\x00\x00\x00\x03\x00\x00+\x1f\x00\x00)\x1f\x00\x00\x01\x03\x00\x00-\x1f\x00\x00'
+  b')\x1f\x00\x00B\x03\x00\x00/\x1f\x00\x00)\x1f\x00\x00E\x03\x00\x00\x99\x1f\x00\x00*\x1f\x00\x00E\x03\x00\x00\x9a\x1f\x00\x00+\x1f\x00\x00E\x03\x00\x00\x9b\x1f\x00\x00,\x1f\x00\x00E\x03\x00\x00\x9c\x1f\x00\x00-\x1f\x00\x00'
+  b'E\x03\x00\x00\x9d\x1f\x00\x00.\x1f\x00\x00E\x03\x00\x00\x9e\x1f\x00\x00/\x1f\x00\x00E\x03\x00\x00\x9f\x1f\x00\x000\x1f\x00\x00\x00\x03\x00\x002\x1f\x00\x000\x1f\x00\x00\x01\x03\x00\x004\x1f\x00\x000\x1f\x00\x00B\x03\x00\x00'
+  b'6\x1f\x00\x001\x1f\x00\x00\x00\x03\x00\x003\x1f\x00\x001\x1f\x00\x00\x01\x03\x00\x005\x1f\x00\x001\x1f\x00\x00B\x03\x00\x007\x1f\x00\x008\x1f\x00\x00\x00\x03\x00\x00:\x1f\x00\x008\x1f\x00\x00\x01\x03\x00\x00<\x1f\x00\x00'
+  b'8\x1f\x00\x00B\x03\x00\x00>\x1f\x00\x009\x1f\x00\x00\x00\x03\x00\x00;\x1f\x00\x009\x1f\x00\x00\x01\x03\x00\x00=\x1f\x00\x009\x1f\x00\x00B\x03\x00\x00?\x1f\x00\x00@\x1f\x00\x00\x00\x03\x00\x00B\x1f\x00\x00@\x1f\x00\x00'
+  b'\x01\x03\x00\x00D\x1f\x00\x00A\x1f\x00\x00\x00\x03\x00\x00C\x1f\x00\x00A\x1f\x00\x00\x01\x03\x00\x00E\x1f\x00\x00H\x1f\x00\x00\x00\x03\x00\x00J\x1f\x00\x00H\x1f\x00\x00\x01\x03\x00\x00L\x1f\x00\x00I\x1f\x00\x00\x00\x03\x00\x00'
+  b'K\x1f\x00\x00I\x1f\x00\x00\x01\x03\x00\x00M\x1f\x00\x00P\x1f\x00\x00\x00\x03\x00\x00R\x1f\x00\x00P\x1f\x00\x00\x01\x03\x00\x00T\x1f\x00\x00P\x1f\x00\x00B\x03\x00\x00V\x1f\x00\x00Q\x1f\x00\x00\x00\x03\x00\x00S\x1f\x00\x00'
+  b'Q\x1f\x00\x00\x01\x03\x00\x00U\x1f\x00\x00Q\x1f\x00\x00B\x03\x00\x00W\x1f\x00\x00Y\x1f\x00\x00\x00\x03\x00\x00[\x1f\x00\x00Y\x1f\x00\x00\x01\x03\x00\x00]\x1f\x00\x00Y\x1f\x00\x00B\x03\x00\x00_\x1f\x00\x00`\x1f\x00\x00'
+  b'\x00\x03\x00\x00b\x1f\x00\x00`\x1f\x00\x00\x01\x03\x00\x00d\x1f\x00\x00`\x1f\x00\x00B\x03\x00\x00f\x1f\x00\x00`\x1f\x00\x00E\x03\x00\x00\xa0\x1f\x00\x00a\x1f\x00\x00\x00\x03\x00\x00c\x1f\x00\x00a\x1f\x00\x00\x01\x03\x00\x00'
+  b'e\x1f\x00\x00a\x1f\x00\x00B\x03\x00\x00g\x1f\x00\x00a\x1f\x00\x00E\x03\x00\x00\xa1\x1f\x00\x00b\x1f\x00\x00E\x03\x00\x00\xa2\x1f\x00\x00c\x1f\x00\x00E\x03\x00\x00\xa3\x1f\x00\x00d\x1f\x00\x00E\x03\x00\x00\xa4\x1f\x00\x00'
+  b'e\x1f\x00\x00E\x03\x00\x00\xa5\x1f\x00\x00f\x1f\x00\x00E\x03\x00\x00\xa6\x1f\x00\x00g\x1f\x00\x00E\x03\x00\x00\xa7\x1f\x00\x00h\x1f\x00\x00\x00\x03\x00\x00j\x1f\x00\x00h\x1f\x00\x00\x01\x03\x00\x00l\x1f\x00\x00h\x1f\x00\x00'
+  b'B\x03\x00\x00n\x1f\x00\x00h\x1f\x00\x00E\x03\x00\x00\xa8\x1f\x00\x00i\x1f\x00\x00\x00\x03\x00\x00k\x1f\x00\x00i\x1f\x00\x00\x01\x03\x00\x00m\x1f\x00\x00i\x1f\x00\x00B\x03\x00\x00o\x1f\x00\x00i\x1f\x00\x00E\x03\x00\x00'
+  b'\xa9\x1f\x00\x00j\x1f\x00\x00E\x03\x00\x00\xaa\x1f\x00\x00k\x1f\x00\x00E\x03\x00\x00\xab\x1f\x00\x00l\x1f\x00\x00E\x03\x00\x00\xac\x1f\x00\x00m\x1f\x00\x00E\x03\x00\x00\xad\x1f\x00\x00n\x1f\x00\x00E\x03\x00\x00\xae\x1f\x00\x00'
+  b'o\x1f\x00\x00E\x03\x00\x00\xaf\x1f\x00\x00p\x1f\x00\x00E\x03\x00\x00\xb2\x1f\x00\x00t\x1f\x00\x00E\x03\x00\x00\xc2\x1f\x00\x00|\x1f\x00\x00E\x03\x00\x00\xf2\x1f\x00\x00\xb6\x1f\x00\x00E\x03\x00\x00\xb7\x1f\x00\x00\xbf\x1f\x00\x00'
+  b'\x00\x03\x00\x00\xcd\x1f\x00\x00\xbf\x1f\x00\x00\x01\x03\x00\x00\xce\x1f\x00\x00\xbf\x1f\x00\x00B\x03\x00\x00\xcf\x1f\x00\x00\xc6\x1f\x00\x00E\x03\x00\x00\xc7\x1f\x00\x00\xf6\x1f\x00\x00E\x03\x00\x00\xf7\x1f\x00\x00\xfe\x1f\x00\x00\x00\x03\x00\x00'
+  b'\xdd\x1f\x00\x00\xfe\x1f\x00\x00\x01\x03\x00\x00\xde\x1f\x00\x00\xfe\x1f\x00\x00B\x03\x00\x00\xdf\x1f\x00\x00\x90!\x00\x008\x03\x00\x00\x9a!\x00\x00\x92!\x00\x008\x03\x00\x00\x9b!\x00\x00\x94!\x00\x008\x03\x00\x00\xae!\x00\x00'
+  b'\xd0!\x00\x008\x03\x00\x00\xcd!\x00\x00\xd2!\x00\x008\x03\x00\x00\xcf!\x00\x00\xd4!\x00\x008\x03\x00\x00\xce!\x00\x00\x03"\x00\x008\x03\x00\x00\x04"\x00\x00\x08"\x00\x008\x03\x00\x00\t"\x00\x00\x0b"\x00\x00'
+  b'8\x03\x00\x00\x0c"\x00\x00#"\x00\x008\x03\x00\x00$"\x00\x00%"\x00\x008\x03\x00\x00&"\x00\x00<"\x00\x008\x03\x00\x00A"\x00\x00C"\x00\x008\x03\x00\x00D"\x00\x00E"\x00\x008\x03\x00\x00'
+  b'G"\x00\x00H"\x00\x008\x03\x00\x00I"\x00\x00M"\x00\x008\x03\x00\x00m"\x00\x00a"\x00\x008\x03\x00\x00b"\x00\x00d"\x00\x008\x03\x00\x00p"\x00\x00e"\x00\x008\x03\x00\x00q"\x00\x00'
+  b'r"\x00\x008\x03\x00\x00t"\x00\x00s"\x00\x008\x03\x00\x00u"\x00\x00v"\x00\x008\x03\x00\x00x"\x00\x00w"\x00\x008\x03\x00\x00y"\x00\x00z"\x00\x008\x03\x00\x00\x80"\x00\x00{"\x00\x00'
+  b'8\x03\x00\x00\x81"\x00\x00|"\x00\x008\x03\x00\x00\xe0"\x00\x00}"\x00\x008\x03\x00\x00\xe1"\x00\x00\x82"\x00\x008\x03\x00\x00\x84"\x00\x00\x83"\x00\x008\x03\x00\x00\x85"\x00\x00\x86"\x00\x008\x03\x00\x00'
+  b'\x88"\x00\x00\x87"\x00\x008\x03\x00\x00\x89"\x00\x00\x91"\x00\x008\x03\x00\x00\xe2"\x00\x00\x92"\x00\x008\x03\x00\x00\xe3"\x00\x00\xa2"\x00\x008\x03\x00\x00\xac"\x00\x00\xa8"\x00\x008\x03\x00\x00\xad"\x00\x00'
+  b'\xa9"\x00\x008\x03\x00\x00\xae"\x00\x00\xab"\x00\x008\x03\x00\x00\xaf"\x00\x00\xb2"\x00\x008\x03\x00\x00\xea"\x00\x00\xb3"\x00\x008\x03\x00\x00\xeb"\x00\x00\xb4"\x00\x008\x03\x00\x00\xec"\x00\x00\xb5"\x00\x00'
+  b'8\x03\x00\x00\xed"\x00\x00F0\x00\x00\x990\x00\x00\x940\x00\x00K0\x00\x00\x990\x00\x00L0\x00\x00M0\x00\x00\x990\x00\x00N0\x00\x00O0\x00\x00\x990\x00\x00P0\x00\x00Q0\x00\x00\x990\x00\x00'
+  b'R0\x00\x00S0\x00\x00\x990\x00\x00T0\x00\x00U0\x00\x00\x990\x00\x00V0\x00\x00W0\x00\x00\x990\x00\x00X0\x00\x00Y0\x00\x00\x990\x00\x00Z0\x00\x00[0\x00\x00\x990\x00\x00\\0\x00\x00'
+  b']0\x00\x00\x990\x00\x00^0\x00\x00_0\x00\x00\x990\x00\x00`0\x00\x00a0\x00\x00\x990\x00\x00b0\x00\x00d0\x00\x00\x990\x00\x00e0\x00\x00f0\x00\x00\x990\x00\x00g0\x00\x00h0\x00\x00'
+  b'\x990\x00\x00i0\x00\x00o0\x00\x00\x990\x00\x00p0\x00\x00o0\x00\x00\x9a0\x00\x00q0\x00\x00r0\x00\x00\x990\x00\x00s0\x00\x00r0\x00\x00\x9a0\x00\x00t0\x00\x00u0\x00\x00\x990\x00\x00'
+  b'v0\x00\x00u0\x00\x00\x9a0\x00\x00w0\x00\x00x0\x00\x00\x990\x00\x00y0\x00\x00x0\x00\x00\x9a0\x00\x00z0\x00\x00{0\x00\x00\x990\x00\x00|0\x00\x00{0\x00\x00\x9a0\x00\x00}0\x00\x00'
+  b'\x9d0\x00\x00\x990\x00\x00\x9e0\x00\x00\xa60\x00\x00\x990\x00\x00\xf40\x00\x00\xab0\x00\x00\x990\x00\x00\xac0\x00\x00\xad0\x00\x00\x990\x00\x00\xae0\x00\x00\xaf0\x00\x00\x990\x00\x00\xb00\x00\x00\xb10\x00\x00'
+  b'\x990\x00\x00\xb20\x00\x00\xb30\x00\x00\x990\x00\x00\xb40\x00\x00\xb50\x00\x00\x990\x00\x00\xb60\x00\x00\xb70\x00\x00\x990\x00\x00\xb80\x00\x00\xb90\x00\x00\x990\x00\x00\xba0\x00\x00\xbb0\x00\x00\x990\x00\x00'
+  b'\xbc0\x00\x00\xbd0\x00\x00\x990\x00\x00\xbe0\x00\x00\xbf0\x00\x00\x990\x00\x00\xc00\x00\x00\xc10\x00\x00\x990\x00\x00\xc20\x00\x00\xc40\x00\x00\x990\x00\x00\xc50\x00\x00\xc60\x00\x00\x990\x00\x00\xc70\x00\x00'
+  b'\xc80\x00\x00\x990\x00\x00\xc90\x00\x00\xcf0\x00\x00\x990\x00\x00\xd00\x00\x00\xcf0\x00\x00\x9a0\x00\x00\xd10\x00\x00\xd20\x00\x00\x990\x00\x00\xd30\x00\x00\xd20\x00\x00\x9a0\x00\x00\xd40\x00\x00\xd50\x00\x00'
+  b'\x990\x00\x00\xd60\x00\x00\xd50\x00\x00\x9a0\x00\x00\xd70\x00\x00\xd80\x00\x00\x990\x00\x00\xd90\x00\x00\xd80\x00\x00\x9a0\x00\x00\xda0\x00\x00\xdb0\x00\x00\x990\x00\x00\xdc0\x00\x00\xdb0\x00\x00\x9a0\x00\x00'
+  b'\xdd0\x00\x00\xef0\x00\x00\x990\x00\x00\xf70\x00\x00\xf00\x00\x00\x990\x00\x00\xf80\x00\x00\xf10\x00\x00\x990\x00\x00\xf90\x00\x00\xf20\x00\x00\x990\x00\x00\xfa0\x00\x00\xfd0\x00\x00\x990\x00\x00\xfe0\x00\x00'
+  b"\x99\x10\x01\x00\xba\x10\x01\x00\x9a\x10\x01\x00\x9b\x10\x01\x00\xba\x10\x01\x00\x9c\x10\x01\x00\xa5\x10\x01\x00\xba\x10\x01\x00\xab\x10\x01\x001\x11\x01\x00'\x11\x01\x00.\x11\x01\x002\x11\x01\x00'\x11\x01\x00/\x11\x01\x00G\x13\x01\x00"
+  b'>\x13\x01\x00K\x13\x01\x00G\x13\x01\x00W\x13\x01\x00L\x13\x01\x00\xb9\x14\x01\x00\xb0\x14\x01\x00\xbc\x14\x01\x00\xb9\x14\x01\x00\xba\x14\x01\x00\xbb\x14\x01\x00\xb9\x14\x01\x00\xbd\x14\x01\x00\xbe\x14\x01\x00\xb8\x15\x01\x00\xaf\x15\x01\x00'
+  b'\xba\x15\x01\x00\xb9\x15\x01\x00\xaf\x15\x01\x00\xbb\x15\x01\x005\x19\x01\x000\x19\x01\x008\x19\x01\x00'
+))
+if byteorder == "big":  # pragma: no cover
+  comp_pairs.byteswap()
+
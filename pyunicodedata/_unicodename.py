@@ -0,0 +1,630 @@
+#!/usr/bin/env python3
+#
+#  _unicodename.py
+"""
+Character names, based on CPython C source code.
+
+The name tables for a version of Unicode are only loaded when its :class:`~.NameDatabase` is first needed.
+"""
+#
+#  Based on CPython.
+#  Licensed under the Python Software Foundation License Version 2.
+#  Copyright © 2001-2020 Python Software Foundation. All rights reserved.
+#  Copyright © 2000 BeOpen.com. All rights reserved.
+#  Copyright © 1995-2000 Corporation for National Research Initiatives. All rights reserved.
+#  Copyright © 1991-1995 Stichting Mathematisch Centrum. All rights reserved.
+#
+#  See the LICENSE file for details.
+#
+
+# this package
+from ._database import OLD_VERSIONS, load_name_tables, load_tables
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+	# stdlib
+	from typing import Dict, List, Optional, Set, Tuple, Union
+
+# Hangul syllables are named algorithmically.
+SBase = 0xAC00
+LCount = 19
+VCount = 21
+TCount = 28
+NCount = VCount * TCount
+SCount = LCount * NCount
+
+# The short names of the conjoining jamo, which make up the names of the Hangul syllables.
+JAMO_L = ('G', "GG", 'N', 'D', "DD", 'R', 'M', 'B', "BB", 'S', "SS", '', 'J', "JJ", 'C', 'K', 'T', 'P', 'H')
+JAMO_V = (
+		'A',
+		"AE",
+		"YA",
+		"YAE",
+		"EO",
+		'E',
+		"YEO",
+		"YE",
+		'O',
+		"WA",
+		"WAE",
+		"OE",
+		"YO",
+		'U',
+		"WEO",
+		"WE",
+		"WI",
+		"YU",
+		"EU",
+		"YI",
+		'I',
+		)
+JAMO_T = (
+		'',
+		'G',
+		"GG",
+		"GS",
+		'N',
+		"NJ",
+		"NH",
+		'D',
+		'L',
+		"LG",
+		"LM",
+		"LB",
+		"LS",
+		"LT",
+		"LP",
+		"LH",
+		'M',
+		'B',
+		"BS",
+		'S',
+		"SS",
+		"NG",
+		'J',
+		'C',
+		'K',
+		'T',
+		'P',
+		'H',
+		)
+
+# The names of the Hangul syllables, without the "HANGUL SYLLABLE " prefix, filled in when first needed.
+# These are the same in every version of Unicode.
+_syllable_names: "List[str]" = []
+
+
+def _find_syllable(name: str, pos: int, jamo: "Tuple[str, ...]") -> "Tuple[int, int]":
+	"""
+	Returns the index of the longest short jamo name in ``jamo`` which ``name`` has at ``pos``,
+	and the length of that short name.
+
+	The index is ``-1`` if there is no such short name.
+
+	:param name:
+	:param pos:
+	:param jamo:
+	"""
+
+	index = -1
+	length = -1
+
+	for i, short_name in enumerate(jamo):
+		if len(short_name) > length and name.startswith(short_name, pos):
+			index = i
+			length = len(short_name)
+
+	return index, max(length, 0)
+
+
+class NameDatabase:
+	"""
+	The character name tables for a version of Unicode, and the functions which use them.
+
+	Use :func:`~.database` rather than creating these directly, so the tables for each version are only loaded once.
+
+	:param unidata_version: The version of Unicode to load the tables for, or :py:obj:`None` for the default version.
+	"""
+
+	def __init__(self, unidata_version: "Optional[str]" = None):
+		#: The version of Unicode of the tables, or :py:obj:`None` for the default version.
+		self.unidata_version = unidata_version
+
+		tables = load_name_tables(unidata_version)
+		self.NAME_MAXLEN: int = tables["NAME_MAXLEN"]
+
+		# The words of the names. The last character of each word has bit 7 set,
+		# and the last word in a name ends with 0x80.
+		self.lexicon = tables["lexicon"]
+		self.lexicon_offset = tables["lexicon_offset"]
+
+		# The names, as indices into lexicon_offset.
+		# Indices below PHRASEBOOK_SHORT take one byte, and the others two.
+		self.PHRASEBOOK_SHIFT: int = tables["PHRASEBOOK_SHIFT"]
+		self.PHRASEBOOK_SHORT: int = tables["PHRASEBOOK_SHORT"]
+		self.phrasebook = tables["phrasebook"]
+		self.phrasebook_offset1 = tables["phrasebook_offset1"]
+		self.phrasebook_offset2 = tables["phrasebook_offset2"]
+
+		# The name -> code point hash table.
+		self.CODE_MAGIC: int = tables["CODE_MAGIC"]
+		self.CODE_SIZE: int = tables["CODE_SIZE"]
+		self.CODE_POLY: int = tables["CODE_POLY"]
+		self.code_hash = tables["code_hash"]
+
+		# Aliases and named sequences are stored in the Private Use Area.
+		self.ALIASES_START: int = tables["ALIASES_START"]
+		self.ALIASES_END: int = tables["ALIASES_END"]
+		self.name_aliases = tables["name_aliases"]
+		self.NAMED_SEQUENCES_START: int = tables["NAMED_SEQUENCES_START"]
+		self.NAMED_SEQUENCES_END: int = tables["NAMED_SEQUENCES_END"]
+		self.named_sequences = tables["named_sequences"]
+		self.named_sequence_offsets = tables["named_sequence_offsets"]
+
+		# The CJK unified ideographs, as (first, last) pairs.
+		self.cjk_ideograph_ranges = tables["cjk_ideograph_ranges"]
+
+		# The inverted word index: the words of the names in alphabetical order, as indices into lexicon_offset,
+		# and the characters whose names contain each word.
+		self.search_words = tables["search_words"]
+		self.search_postings = tables["search_postings"]
+		self.search_postings_offset = tables["search_postings_offset"]
+
+		# The words of the lexicon which have been decoded, by index.
+		self._words: "Dict[int, Tuple[str, bool]]" = {}
+
+		# The code points of the names looked up in the hash table, keyed by upper case name.
+		self._codes: "Dict[str, int]" = {}
+
+	def __repr__(self) -> str:
+		return f"{type(self).__name__}({self.unidata_version!r})"
+
+	def is_unified_ideograph(self, code: int) -> bool:
+		"""
+		Returns whether the given code point is a CJK unified ideograph.
+
+		:param code:
+		"""
+
+		for i in range(0, len(self.cjk_ideograph_ranges), 2):
+			if self.cjk_ideograph_ranges[i] <= code <= self.cjk_ideograph_ranges[i + 1]:
+				return True
+
+		return False
+
+	def _getword(self, index: int) -> "Tuple[str, bool]":
+		"""
+		Returns the word at the given index in the lexicon, and whether it ends a name.
+
+		:param index:
+		"""
+
+		try:
+			return self._words[index]
+		except KeyError:
+			pass
+
+		start = end = self.lexicon_offset[index]
+		while self.lexicon[end] < 128:
+			end += 1
+
+		last = self.lexicon[end] == 128
+		word = bytes(self.lexicon[start:end]).decode("ascii")
+		if not last:
+			word += chr(self.lexicon[end] & 127)
+
+		self._words[index] = result = (word, last)
+		return result
+
+	def _getucname(self, code: int, with_alias_and_seq: bool) -> "Optional[str]":
+		"""
+		Returns the name of the given code point, or :py:obj:`None` if it has no name.
+
+		:param code:
+		:param with_alias_and_seq: Whether to return the names of aliases and named sequences,
+			which are stored in the Private Use Area.
+		"""
+
+		if code >= 0x110000:
+			return None
+
+		if not with_alias_and_seq and (
+				self.ALIASES_START <= code < self.ALIASES_END
+				or self.NAMED_SEQUENCES_START <= code < self.NAMED_SEQUENCES_END
+				):
+			return None
+
+		if SBase <= code < SBase + SCount:
+			SIndex = code - SBase
+			L = SIndex // NCount
+			V = (SIndex % NCount) // TCount
+			T = SIndex % TCount
+			return f"HANGUL SYLLABLE {JAMO_L[L]}{JAMO_V[V]}{JAMO_T[T]}"
+
+		if self.is_unified_ideograph(code):
+			return f"CJK UNIFIED IDEOGRAPH-{code:X}"
+
+		# get offset into phrasebook
+		offset = self.phrasebook_offset1[(code >> self.PHRASEBOOK_SHIFT)]
+		offset = self.phrasebook_offset2[(offset << self.PHRASEBOOK_SHIFT) + (code & ((1 << self.PHRASEBOOK_SHIFT) - 1))]
+
+		if not offset:
+			return None
+
+		words = []
+		while True:
+			# get word index
+			word = self.phrasebook[offset] - self.PHRASEBOOK_SHORT
+			if word >= 0:
+				word = (word << 8) + self.phrasebook[offset + 1]
+				offset += 2
+			else:
+				word = self.phrasebook[offset]
+				offset += 1
+
+			text, last = self._getword(word)
+			words.append(text)
+			if last:
+				break
+
+		return ' '.join(words)
+
+	def _gethash(self, name: str) -> int:
+		"""
+		Returns the hash of the upper case name ``name``, as computed by ``makeunicodedata.py``.
+
+		:param name:
+		"""
+
+		h = 0
+		for c in map(ord, name):
+			h = (h * self.CODE_MAGIC) + c
+			ix = h & 0xff000000
+			if ix:
+				h = (h ^ ((ix >> 24) & 0xff)) & 0x00ffffff
+
+		return h
+
+	def _getcode(self, name: str, with_named_seq: bool) -> "Optional[int]":
+		"""
+		Returns the code point with the given name, or :py:obj:`None` if there is no such character.
+
+		:param name: An ASCII string.
+		:param with_named_seq: Whether to return the code points in the Private Use Area
+			which represent named sequences.
+		"""
+
+		# Check for hangul syllables.
+		if name.startswith("HANGUL SYLLABLE "):
+			pos = 16
+			L, length = _find_syllable(name, pos, JAMO_L)
+			pos += length
+			V, length = _find_syllable(name, pos, JAMO_V)
+			pos += length
+			T, length = _find_syllable(name, pos, JAMO_T)
+			pos += length
+			if L != -1 and V != -1 and T != -1 and pos == len(name):
+				return SBase + (L * VCount + V) * TCount + T
+
+			# Otherwise, it's an illegal syllable name.
+			return None
+
+		# Check for unified ideographs.
+		if name.startswith("CJK UNIFIED IDEOGRAPH-"):
+			# Four or five hexdigits must follow.
+			digits = name[22:]
+			if len(digits) not in {4, 5} or digits.strip("0123456789ABCDEF"):
+				return None
+
+			code = int(digits, 16)
+			if not self.is_unified_ideograph(code):
+				return None
+
+			return code
+
+		# the following is the same as python's dictionary lookup, with
+		# only minor changes.  see the makeunicodedata script for more
+		# details
+
+		name = name.upper()
+		try:
+			v = self._codes[name]
+		except KeyError:
+			v = self._lookup_hash(name)
+			if not v:
+				return None
+			self._codes[name] = v
+
+		# check if named sequences are allowed
+		if not with_named_seq and self.NAMED_SEQUENCES_START <= v < self.NAMED_SEQUENCES_END:
+			return None
+		# if the code point is in the PUA range that we use for aliases,
+		# convert it to obtain the right code point
+		if self.ALIASES_START <= v < self.ALIASES_END:
+			return self.name_aliases[v - self.ALIASES_START]
+		return v
+
+	def _lookup_hash(self, name: str) -> int:
+		"""
+		Returns the code point with the given upper case name in the hash table, or ``0`` if there is no such name.
+
+		:param name:
+		"""
+
+		h = self._gethash(name)
+		mask = self.CODE_SIZE - 1
+		i = (~h) & mask
+		incr = (h ^ (h >> 3)) & mask
+		if not incr:
+			incr = mask
+
+		while True:
+			v = self.code_hash[i]
+			if not v or self._getucname(v, True) == name:
+				return v
+
+			i = (i + incr) & mask
+			incr = incr << 1
+			if incr > mask:
+				incr = incr ^ self.CODE_POLY
+
+	def unicodedata_UCD_name_impl(self, chr: str) -> "Optional[str]":  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Returns the name assigned to the character chr as a string, or :py:obj:`None` if it has no name.
+
+		:param chr:
+		"""
+
+		return self._getucname(ord(chr), False)
+
+	def unicodedata_UCD_lookup_impl(self, name: "Union[str, bytes]") -> str:
+		"""
+		Look up character by name.
+
+		If a character with the given name is found, return the corresponding character.
+
+		:param name:
+
+		:raises KeyError: If no character with the given name is found.
+		"""
+
+		if isinstance(name, str):
+			if not name.isascii():
+				raise KeyError(f"undefined character name {name!r}")
+		elif isinstance(name, (bytes, bytearray)):
+			if not name.isascii():
+				raise KeyError(f"undefined character name {name.decode('utf-8', 'replace')!r}")
+			name = name.decode("ascii")
+		else:
+			raise TypeError(f"lookup() argument must be str or a bytes-like object, not {type(name).__name__}")
+
+		if len(name) > self.NAME_MAXLEN:
+			raise KeyError("name too long")
+
+		code = self._getcode(name, True)
+		if code is None:
+			raise KeyError(f"undefined character name {name!r}")
+
+		# check if code is in the PUA range that we use for named sequences
+		# and convert it
+		if self.NAMED_SEQUENCES_START <= code < self.NAMED_SEQUENCES_END:
+			index = code - self.NAMED_SEQUENCES_START
+			return ''.join(map(chr, self.named_sequences[self.named_sequence_offsets[index]:self.named_sequence_offsets[index + 1]]))
+
+		return chr(code)
+
+	def _search_index(self, word: str, prefix: bool) -> "Set[int]":
+		"""
+		Returns the characters in the word index whose names contain ``word``,
+		or, if ``prefix`` is :py:obj:`True`, a word starting with ``word``.
+
+		:param word: An upper case word.
+		:param prefix:
+		"""
+
+		# Find the first word which is not less than the given one.
+		lo, hi = 0, len(self.search_words)
+		while lo < hi:
+			mid = (lo + hi) // 2
+			if self._getword(self.search_words[mid])[0] < word:
+				lo = mid + 1
+			else:
+				hi = mid
+
+		end = lo
+		while end < len(self.search_words):
+			text = self._getword(self.search_words[end])[0]
+			if text == word or (prefix and text.startswith(word)):
+				end += 1
+			else:
+				break
+
+		return set(self.search_postings[self.search_postings_offset[lo]:self.search_postings_offset[end]])
+
+	def _search_algorithmic(self, word: str, prefix: bool) -> "Set[int]":
+		"""
+		Returns the Hangul syllables and CJK unified ideographs, which are named algorithmically,
+		whose names contain ``word``, or, if ``prefix`` is :py:obj:`True`, a word starting with ``word``.
+
+		:param word: An upper case word.
+		:param prefix:
+		"""
+
+		def matches(name_word: str) -> bool:
+			return name_word == word or (prefix and name_word.startswith(word))
+
+		result: "Set[int]" = set()
+
+		if matches("HANGUL") or matches("SYLLABLE"):
+			result.update(range(SBase, SBase + SCount))
+		elif prefix:
+			if not _syllable_names:
+				_syllable_names.extend(L + V + T for L in JAMO_L for V in JAMO_V for T in JAMO_T)
+			for index, syllable_name in enumerate(_syllable_names):
+				if syllable_name.startswith(word):
+					result.add(SBase + index)
+		else:
+			code = self._getcode(f"HANGUL SYLLABLE {word}", False)
+			if code is not None:
+				result.add(code)
+
+		for i in range(0, len(self.cjk_ideograph_ranges), 2):
+			first, last = self.cjk_ideograph_ranges[i], self.cjk_ideograph_ranges[i + 1]
+			if matches("CJK") or matches("UNIFIED") or (prefix and "IDEOGRAPH-".startswith(word)):
+				result.update(range(first, last + 1))
+			elif word.startswith("IDEOGRAPH-"):
+				digits = word[10:]
+				if digits.strip("0123456789ABCDEF"):
+					continue
+				# The names have four or five hexadecimal digits.
+				for length in (4, 5):
+					if len(digits) == length or (prefix and len(digits) < length):
+						lo = int(digits.ljust(length, '0'), 16)
+						hi = int(digits.ljust(length, 'F'), 16)
+						result.update(range(max(lo, first, 16**(length - 1)), min(hi, last) + 1))
+
+		return result
+
+	def search_names_impl(self, query: str, prefix: bool = False) -> "List[int]":
+		"""
+		Returns the code points of the characters whose names contain all the words in ``query``, in order.
+
+		:param query: Words separated by whitespace, in any case.
+		:param prefix: If :py:obj:`True`, the last word of the query only has to be the start of a word in the name.
+		"""
+
+		if not isinstance(query, str):
+			raise TypeError(f"search_names() argument 1 must be str, not {type(query).__name__}")
+
+		words = query.upper().split()
+		if not words or not query.isascii():
+			return []
+
+		result: "Optional[Set[int]]" = None
+
+		for i, word in enumerate(words):
+			is_prefix = prefix and i == len(words) - 1
+			matches = self._search_index(word, is_prefix)
+			matches |= self._search_algorithmic(word, is_prefix)
+
+			if result is None:
+				result = matches
+			else:
+				result &= matches
+
+			if not result:
+				return []
+
+		return sorted(result)  # type: ignore[arg-type]
+
+
+class PreviousNameDatabase(NameDatabase):
+	"""
+	The character names for a version of Unicode from :data:`~.OLD_VERSIONS`,
+	which are those of the default version for the characters which were assigned in that version.
+
+	:param unidata_version:
+	"""
+
+	def __init__(self, unidata_version: str):
+		super().__init__(unidata_version)
+
+		# The categories of the characters in that version, to find those which were not yet assigned.
+		cversion = unidata_version.replace('.', '_')
+		changes = load_tables(unidata_version)
+		self.CHANGES_SHIFT: int = changes[f"CHANGES_{cversion}_SHIFT"]
+		self.changes_index1 = changes[f"changes_{cversion}_index1"]
+		self.changes_index2 = changes[f"changes_{cversion}_index2"]
+		self.changes_category = changes[f"changes_{cversion}_category"]
+
+	def _is_assigned(self, code: int) -> bool:
+		"""
+		Returns whether the given code point was assigned in the older version of Unicode.
+
+		:param code:
+		"""
+
+		if code >= 0x110000:
+			return False
+
+		index = self.changes_index1[(code >> self.CHANGES_SHIFT)]
+		index = self.changes_index2[(index << self.CHANGES_SHIFT) + (code & ((1 << self.CHANGES_SHIFT) - 1))]
+		return self.changes_category[index] != 0
+
+	def is_unified_ideograph(self, code: int) -> bool:
+		"""
+		Returns whether the given code point is a CJK unified ideograph in the older version of Unicode.
+
+		The ranges of the ideographs are those of the default version, less the code points not yet assigned.
+
+		:param code:
+		"""
+
+		return super().is_unified_ideograph(code) and self._is_assigned(code)
+
+	def _getucname(self, code: int, with_alias_and_seq: bool) -> "Optional[str]":
+		"""
+		Returns the name of the given code point in the older version of Unicode,
+		or :py:obj:`None` if it has no name.
+
+		:param code:
+		:param with_alias_and_seq: Ignored, as the older versions have no aliases or named sequences.
+		"""
+
+		if self.ALIASES_START <= code < self.ALIASES_END or self.NAMED_SEQUENCES_START <= code < self.NAMED_SEQUENCES_END:
+			return None
+
+		if not self._is_assigned(code):
+			return None
+
+		return super()._getucname(code, with_alias_and_seq)
+
+	def _search_index(self, word: str, prefix: bool) -> "Set[int]":
+		"""
+		Returns the characters in the word index whose names contain ``word``,
+		or, if ``prefix`` is :py:obj:`True`, a word starting with ``word``,
+		which were assigned in the older version of Unicode.
+
+		:param word: An upper case word.
+		:param prefix:
+		"""
+
+		return set(filter(self._is_assigned, super()._search_index(word, prefix)))
+
+	def _search_algorithmic(self, word: str, prefix: bool) -> "Set[int]":
+		"""
+		Returns the Hangul syllables and CJK unified ideographs of the older version of Unicode whose names
+		contain ``word``, or, if ``prefix`` is :py:obj:`True`, a word starting with ``word``.
+
+		:param word: An upper case word.
+		:param prefix:
+		"""
+
+		return set(filter(self._is_assigned, super()._search_algorithmic(word, prefix)))
+
+
+# The name database for each version of Unicode, keyed by version, created by database() when first needed.
+_databases: "Dict[Optional[str], NameDatabase]" = {}
+
+
+def database(unidata_version: "Optional[str]" = None) -> NameDatabase:
+	"""
+	Returns the :class:`~.NameDatabase` for the given version of Unicode, loading its tables the first time.
+
+	:param unidata_version: The version of Unicode, which must be one of :data:`~.OLD_VERSIONS`
+		or have a ``ucd_X_Y_Z`` subpackage, or :py:obj:`None` for the default version.
+	"""
+
+	try:
+		return _databases[unidata_version]
+	except KeyError:
+		pass
+
+	if unidata_version in OLD_VERSIONS:
+		result: NameDatabase = PreviousNameDatabase(unidata_version)
+	else:
+		result = NameDatabase(unidata_version)
+
+	_databases[unidata_version] = result
+	return result
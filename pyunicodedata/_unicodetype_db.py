@@ -1,505 +1,541 @@
-data = [
-  [0, 0, 0, 0, 0, 0],
-  [0, 0, 0, 0, 0, 0],
-  [0, 0, 0, 0, 0, 32],
-  [0, 0, 0, 0, 0, 48],
-  [0, 0, 0, 0, 0, 1056],
-  [0, 0, 0, 0, 0, 1024],
-  [0, 0, 0, 0, 0, 5120],
-  [0, 0, 0, 0, 0, 3590],
-  [0, 0, 0, 1, 1, 3590],
-  [0, 0, 0, 2, 2, 3590],
-  [0, 0, 0, 3, 3, 3590],
-  [0, 0, 0, 4, 4, 3590],
-  [0, 0, 0, 5, 5, 3590],
-  [0, 0, 0, 6, 6, 3590],
-  [0, 0, 0, 7, 7, 3590],
-  [0, 0, 0, 8, 8, 3590],
-  [0, 0, 0, 9, 9, 3590],
-  [0, 32, 0, 0, 0, 10113],
-  [0, 0, 0, 0, 0, 1536],
-  [-32, 0, -32, 0, 0, 9993],
-  [0, 0, 0, 0, 0, 9993],
-  [0, 0, 0, 0, 0, 4096],
-  [0, 0, 0, 0, 2, 3076],
-  [0, 0, 0, 0, 3, 3076],
-  [16777218, 17825792, 16777218, 0, 0, 26377],
-  [0, 0, 0, 0, 0, 5632],
-  [0, 0, 0, 0, 1, 3076],
-  [0, 0, 0, 0, 0, 3072],
-  [33554438, 18874371, 33554440, 0, 0, 26377],
-  [121, 0, 121, 0, 0, 9993],
-  [0, 1, 0, 0, 0, 10113],
-  [-1, 0, -1, 0, 0, 9993],
-  [16777228, 33554442, 16777228, 0, 0, 26497],
-  [-232, 0, -232, 0, 0, 9993],
-  [33554448, 18874381, 33554448, 0, 0, 26377],
-  [0, -121, 0, 0, 0, 10113],
-  [16777236, 17825810, 16777236, 0, 0, 26377],
-  [195, 0, 195, 0, 0, 9993],
-  [0, 210, 0, 0, 0, 10113],
-  [0, 206, 0, 0, 0, 10113],
-  [0, 205, 0, 0, 0, 10113],
-  [0, 79, 0, 0, 0, 10113],
-  [0, 202, 0, 0, 0, 10113],
-  [0, 203, 0, 0, 0, 10113],
-  [0, 207, 0, 0, 0, 10113],
-  [97, 0, 97, 0, 0, 9993],
-  [0, 211, 0, 0, 0, 10113],
-  [0, 209, 0, 0, 0, 10113],
-  [163, 0, 163, 0, 0, 9993],
-  [0, 213, 0, 0, 0, 10113],
-  [130, 0, 130, 0, 0, 9993],
-  [0, 214, 0, 0, 0, 10113],
-  [0, 218, 0, 0, 0, 10113],
-  [0, 217, 0, 0, 0, 10113],
-  [0, 219, 0, 0, 0, 10113],
-  [0, 0, 0, 0, 0, 1793],
-  [56, 0, 56, 0, 0, 9993],
-  [0, 2, 1, 0, 0, 10113],
-  [-1, 1, 0, 0, 0, 10049],
-  [-2, 0, -1, 0, 0, 9993],
-  [-79, 0, -79, 0, 0, 9993],
-  [33554456, 18874389, 33554456, 0, 0, 26377],
-  [0, -97, 0, 0, 0, 10113],
-  [0, -56, 0, 0, 0, 10113],
-  [0, -130, 0, 0, 0, 10113],
-  [0, 10795, 0, 0, 0, 10113],
-  [0, -163, 0, 0, 0, 10113],
-  [0, 10792, 0, 0, 0, 10113],
-  [10815, 0, 10815, 0, 0, 9993],
-  [0, -195, 0, 0, 0, 10113],
-  [0, 69, 0, 0, 0, 10113],
-  [0, 71, 0, 0, 0, 10113],
-  [10783, 0, 10783, 0, 0, 9993],
-  [10780, 0, 10780, 0, 0, 9993],
-  [10782, 0, 10782, 0, 0, 9993],
-  [-210, 0, -210, 0, 0, 9993],
-  [-206, 0, -206, 0, 0, 9993],
-  [-205, 0, -205, 0, 0, 9993],
-  [-202, 0, -202, 0, 0, 9993],
-  [-203, 0, -203, 0, 0, 9993],
-  [42319, 0, 42319, 0, 0, 9993],
-  [42315, 0, 42315, 0, 0, 9993],
-  [-207, 0, -207, 0, 0, 9993],
-  [42280, 0, 42280, 0, 0, 9993],
-  [42308, 0, 42308, 0, 0, 9993],
-  [-209, 0, -209, 0, 0, 9993],
-  [-211, 0, -211, 0, 0, 9993],
-  [10743, 0, 10743, 0, 0, 9993],
-  [42305, 0, 42305, 0, 0, 9993],
-  [10749, 0, 10749, 0, 0, 9993],
-  [-213, 0, -213, 0, 0, 9993],
-  [-214, 0, -214, 0, 0, 9993],
-  [10727, 0, 10727, 0, 0, 9993],
-  [-218, 0, -218, 0, 0, 9993],
-  [42307, 0, 42307, 0, 0, 9993],
-  [42282, 0, 42282, 0, 0, 9993],
-  [-69, 0, -69, 0, 0, 9993],
-  [-217, 0, -217, 0, 0, 9993],
-  [-71, 0, -71, 0, 0, 9993],
-  [-219, 0, -219, 0, 0, 9993],
-  [42261, 0, 42261, 0, 0, 9993],
-  [42258, 0, 42258, 0, 0, 9993],
-  [0, 0, 0, 0, 0, 14089],
-  [0, 0, 0, 0, 0, 5889],
-  [16777244, 17825818, 16777244, 0, 0, 30216],
-  [0, 0, 0, 0, 0, 13321],
-  [0, 116, 0, 0, 0, 10113],
-  [0, 38, 0, 0, 0, 10113],
-  [0, 37, 0, 0, 0, 10113],
-  [0, 64, 0, 0, 0, 10113],
-  [0, 63, 0, 0, 0, 10113],
-  [50331681, 19922973, 50331681, 0, 0, 26377],
-  [-38, 0, -38, 0, 0, 9993],
-  [-37, 0, -37, 0, 0, 9993],
-  [50331688, 19922980, 50331688, 0, 0, 26377],
-  [16777261, 17825835, 16777261, 0, 0, 26377],
-  [-64, 0, -64, 0, 0, 9993],
-  [-63, 0, -63, 0, 0, 9993],
-  [0, 8, 0, 0, 0, 10113],
-  [16777264, 17825838, 16777264, 0, 0, 26377],
-  [16777267, 17825841, 16777267, 0, 0, 26377],
-  [0, 0, 0, 0, 0, 10113],
-  [16777270, 17825844, 16777270, 0, 0, 26377],
-  [16777273, 17825847, 16777273, 0, 0, 26377],
-  [-8, 0, -8, 0, 0, 9993],
-  [16777276, 17825850, 16777276, 0, 0, 26377],
-  [16777279, 17825853, 16777279, 0, 0, 26377],
-  [7, 0, 7, 0, 0, 9993],
-  [-116, 0, -116, 0, 0, 9993],
-  [0, -60, 0, 0, 0, 10113],
-  [16777282, 17825856, 16777282, 0, 0, 26377],
-  [0, -7, 0, 0, 0, 10113],
-  [0, 80, 0, 0, 0, 10113],
-  [-80, 0, -80, 0, 0, 9993],
-  [0, 15, 0, 0, 0, 10113],
-  [-15, 0, -15, 0, 0, 9993],
-  [0, 48, 0, 0, 0, 10113],
-  [-48, 0, -48, 0, 0, 9993],
-  [33554502, 18874435, 33554504, 0, 0, 26377],
-  [0, 0, 0, 0, 0, 1537],
-  [0, 7264, 0, 0, 0, 10113],
-  [3008, 0, 0, 0, 0, 9993],
-  [0, 0, 0, 0, 1, 3588],
-  [0, 0, 0, 0, 2, 3588],
-  [0, 0, 0, 0, 3, 3588],
-  [0, 0, 0, 0, 4, 3588],
-  [0, 0, 0, 0, 5, 3588],
-  [0, 0, 0, 0, 6, 3588],
-  [0, 0, 0, 0, 7, 3588],
-  [0, 0, 0, 0, 8, 3588],
-  [0, 0, 0, 0, 9, 3588],
-  [16777292, 17825866, 16777292, 0, 0, 26497],
-  [16777295, 17825869, 16777295, 0, 0, 26497],
-  [16777298, 17825872, 16777298, 0, 0, 26497],
-  [16777301, 17825875, 16777301, 0, 0, 26497],
-  [16777304, 17825878, 16777304, 0, 0, 26497],
-  [16777307, 17825881, 16777307, 0, 0, 26497],
-  [16777310, 17825884, 16777310, 0, 0, 26497],
-  [16777313, 17825887, 16777313, 0, 0, 26497],
-  [16777316, 17825890, 16777316, 0, 0, 26497],
-  [16777319, 17825893, 16777319, 0, 0, 26497],
-  [16777322, 17825896, 16777322, 0, 0, 26497],
-  [16777325, 17825899, 16777325, 0, 0, 26497],
-  [16777328, 17825902, 16777328, 0, 0, 26497],
-  [16777331, 17825905, 16777331, 0, 0, 26497],
-  [16777334, 17825908, 16777334, 0, 0, 26497],
-  [16777337, 17825911, 16777337, 0, 0, 26497],
-  [16777340, 17825914, 16777340, 0, 0, 26497],
-  [16777343, 17825917, 16777343, 0, 0, 26497],
-  [16777346, 17825920, 16777346, 0, 0, 26497],
-  [16777349, 17825923, 16777349, 0, 0, 26497],
-  [16777352, 17825926, 16777352, 0, 0, 26497],
-  [16777355, 17825929, 16777355, 0, 0, 26497],
-  [16777358, 17825932, 16777358, 0, 0, 26497],
-  [16777361, 17825935, 16777361, 0, 0, 26497],
-  [16777364, 17825938, 16777364, 0, 0, 26497],
-  [16777367, 17825941, 16777367, 0, 0, 26497],
-  [16777370, 17825944, 16777370, 0, 0, 26497],
-  [16777373, 17825947, 16777373, 0, 0, 26497],
-  [16777376, 17825950, 16777376, 0, 0, 26497],
-  [16777379, 17825953, 16777379, 0, 0, 26497],
-  [16777382, 17825956, 16777382, 0, 0, 26497],
-  [16777385, 17825959, 16777385, 0, 0, 26497],
-  [16777388, 17825962, 16777388, 0, 0, 26497],
-  [16777391, 17825965, 16777391, 0, 0, 26497],
-  [16777394, 17825968, 16777394, 0, 0, 26497],
-  [16777397, 17825971, 16777397, 0, 0, 26497],
-  [16777400, 17825974, 16777400, 0, 0, 26497],
-  [16777403, 17825977, 16777403, 0, 0, 26497],
-  [16777406, 17825980, 16777406, 0, 0, 26497],
-  [16777409, 17825983, 16777409, 0, 0, 26497],
-  [16777412, 17825986, 16777412, 0, 0, 26497],
-  [16777415, 17825989, 16777415, 0, 0, 26497],
-  [16777418, 17825992, 16777418, 0, 0, 26497],
-  [16777421, 17825995, 16777421, 0, 0, 26497],
-  [16777424, 17825998, 16777424, 0, 0, 26497],
-  [16777427, 17826001, 16777427, 0, 0, 26497],
-  [16777430, 17826004, 16777430, 0, 0, 26497],
-  [16777433, 17826007, 16777433, 0, 0, 26497],
-  [16777436, 17826010, 16777436, 0, 0, 26497],
-  [16777439, 17826013, 16777439, 0, 0, 26497],
-  [16777442, 17826016, 16777442, 0, 0, 26497],
-  [16777445, 17826019, 16777445, 0, 0, 26497],
-  [16777448, 17826022, 16777448, 0, 0, 26497],
-  [16777451, 17826025, 16777451, 0, 0, 26497],
-  [16777454, 17826028, 16777454, 0, 0, 26497],
-  [16777457, 17826031, 16777457, 0, 0, 26497],
-  [16777460, 17826034, 16777460, 0, 0, 26497],
-  [16777463, 17826037, 16777463, 0, 0, 26497],
-  [16777466, 17826040, 16777466, 0, 0, 26497],
-  [16777469, 17826043, 16777469, 0, 0, 26497],
-  [16777472, 17826046, 16777472, 0, 0, 26497],
-  [16777475, 17826049, 16777475, 0, 0, 26497],
-  [16777478, 17826052, 16777478, 0, 0, 26497],
-  [16777481, 17826055, 16777481, 0, 0, 26497],
-  [16777484, 17826058, 16777484, 0, 0, 26497],
-  [16777487, 17826061, 16777487, 0, 0, 26497],
-  [16777490, 17826064, 16777490, 0, 0, 26497],
-  [16777493, 17826067, 16777493, 0, 0, 26497],
-  [16777496, 17826070, 16777496, 0, 0, 26497],
-  [16777499, 17826073, 16777499, 0, 0, 26497],
-  [16777502, 17826076, 16777502, 0, 0, 26497],
-  [16777505, 17826079, 16777505, 0, 0, 26497],
-  [16777508, 17826082, 16777508, 0, 0, 26497],
-  [16777511, 17826085, 16777511, 0, 0, 26497],
-  [16777514, 17826088, 16777514, 0, 0, 26497],
-  [16777517, 17826091, 16777517, 0, 0, 26497],
-  [16777520, 17826094, 16777520, 0, 0, 26497],
-  [16777523, 17826097, 16777523, 0, 0, 26497],
-  [16777526, 17826100, 16777526, 0, 0, 26497],
-  [16777529, 17826103, 16777529, 0, 0, 26497],
-  [16777532, 17826106, 16777532, 0, 0, 26497],
-  [16777535, 17826109, 16777535, 0, 0, 26497],
-  [16777538, 17826112, 16777538, 0, 0, 26497],
-  [16777541, 17826115, 16777541, 0, 0, 26497],
-  [16777544, 17826118, 16777544, 0, 0, 26497],
-  [16777547, 17826121, 16777547, 0, 0, 26497],
-  [16777550, 17826124, 16777550, 0, 0, 26377],
-  [16777553, 17826127, 16777553, 0, 0, 26377],
-  [16777556, 17826130, 16777556, 0, 0, 26377],
-  [16777559, 17826133, 16777559, 0, 0, 26377],
-  [16777562, 17826136, 16777562, 0, 0, 26377],
-  [16777565, 17826139, 16777565, 0, 0, 26377],
-  [0, 0, 0, 0, 0, 3840],
-  [0, 0, 0, 0, 0, 5888],
-  [16777568, 17826142, 16777568, 0, 0, 26377],
-  [16777571, 17826145, 16777571, 0, 0, 26377],
-  [16777574, 17826148, 16777574, 0, 0, 26377],
-  [16777577, 17826151, 16777577, 0, 0, 26377],
-  [16777580, 17826154, 16777580, 0, 0, 26377],
-  [16777583, 17826157, 16777583, 0, 0, 26377],
-  [16777586, 17826160, 16777586, 0, 0, 26377],
-  [16777589, 17826163, 16777589, 0, 0, 26377],
-  [16777592, 17826166, 16777592, 0, 0, 26377],
-  [0, -3008, 0, 0, 0, 10113],
-  [35332, 0, 35332, 0, 0, 9993],
-  [3814, 0, 3814, 0, 0, 9993],
-  [35384, 0, 35384, 0, 0, 9993],
-  [33554812, 18874745, 33554812, 0, 0, 26377],
-  [33554817, 18874750, 33554817, 0, 0, 26377],
-  [33554822, 18874755, 33554822, 0, 0, 26377],
-  [33554827, 18874760, 33554827, 0, 0, 26377],
-  [33554832, 18874765, 33554832, 0, 0, 26377],
-  [16777620, 17826194, 16777620, 0, 0, 26377],
-  [16777624, 18874773, 16777624, 0, 0, 26497],
-  [8, 0, 8, 0, 0, 9993],
-  [0, -8, 0, 0, 0, 10113],
-  [33554844, 18874777, 33554844, 0, 0, 26377],
-  [50332066, 19923358, 50332066, 0, 0, 26377],
-  [50332073, 19923365, 50332073, 0, 0, 26377],
-  [50332080, 19923372, 50332080, 0, 0, 26377],
-  [74, 0, 74, 0, 0, 9993],
-  [86, 0, 86, 0, 0, 9993],
-  [100, 0, 100, 0, 0, 9993],
-  [128, 0, 128, 0, 0, 9993],
-  [112, 0, 112, 0, 0, 9993],
-  [126, 0, 126, 0, 0, 9993],
-  [33554870, 18874803, 16777656, 0, 0, 26377],
-  [33554876, 18874809, 16777662, 0, 0, 26377],
-  [33554882, 18874815, 16777668, 0, 0, 26377],
-  [33554888, 18874821, 16777674, 0, 0, 26377],
-  [33554894, 18874827, 16777680, 0, 0, 26377],
-  [33554900, 18874833, 16777686, 0, 0, 26377],
-  [33554906, 18874839, 16777692, 0, 0, 26377],
-  [33554912, 18874845, 16777698, 0, 0, 26377],
-  [33554918, 18874851, 16777704, 0, 0, 26433],
-  [33554924, 18874857, 16777710, 0, 0, 26433],
-  [33554930, 18874863, 16777716, 0, 0, 26433],
-  [33554936, 18874869, 16777722, 0, 0, 26433],
-  [33554942, 18874875, 16777728, 0, 0, 26433],
-  [33554948, 18874881, 16777734, 0, 0, 26433],
-  [33554954, 18874887, 16777740, 0, 0, 26433],
-  [33554960, 18874893, 16777746, 0, 0, 26433],
-  [33554966, 18874899, 16777752, 0, 0, 26377],
-  [33554972, 18874905, 16777758, 0, 0, 26377],
-  [33554978, 18874911, 16777764, 0, 0, 26377],
-  [33554984, 18874917, 16777770, 0, 0, 26377],
-  [33554990, 18874923, 16777776, 0, 0, 26377],
-  [33554996, 18874929, 16777782, 0, 0, 26377],
-  [33555002, 18874935, 16777788, 0, 0, 26377],
-  [33555008, 18874941, 16777794, 0, 0, 26377],
-  [33555014, 18874947, 16777800, 0, 0, 26433],
-  [33555020, 18874953, 16777806, 0, 0, 26433],
-  [33555026, 18874959, 16777812, 0, 0, 26433],
-  [33555032, 18874965, 16777818, 0, 0, 26433],
-  [33555038, 18874971, 16777824, 0, 0, 26433],
-  [33555044, 18874977, 16777830, 0, 0, 26433],
-  [33555050, 18874983, 16777836, 0, 0, 26433],
-  [33555056, 18874989, 16777842, 0, 0, 26433],
-  [33555062, 18874995, 16777848, 0, 0, 26377],
-  [33555068, 18875001, 16777854, 0, 0, 26377],
-  [33555074, 18875007, 16777860, 0, 0, 26377],
-  [33555080, 18875013, 16777866, 0, 0, 26377],
-  [33555086, 18875019, 16777872, 0, 0, 26377],
-  [33555092, 18875025, 16777878, 0, 0, 26377],
-  [33555098, 18875031, 16777884, 0, 0, 26377],
-  [33555104, 18875037, 16777890, 0, 0, 26377],
-  [33555110, 18875043, 16777896, 0, 0, 26433],
-  [33555116, 18875049, 16777902, 0, 0, 26433],
-  [33555122, 18875055, 16777908, 0, 0, 26433],
-  [33555128, 18875061, 16777914, 0, 0, 26433],
-  [33555134, 18875067, 16777920, 0, 0, 26433],
-  [33555140, 18875073, 16777926, 0, 0, 26433],
-  [33555146, 18875079, 16777932, 0, 0, 26433],
-  [33555152, 18875085, 16777938, 0, 0, 26433],
-  [33555158, 18875091, 33555160, 0, 0, 26377],
-  [33555165, 18875098, 16777951, 0, 0, 26377],
-  [33555171, 18875104, 33555173, 0, 0, 26377],
-  [33555178, 18875111, 33555178, 0, 0, 26377],
-  [50332400, 19923692, 50332403, 0, 0, 26377],
-  [0, -74, 0, 0, 0, 10113],
-  [33555193, 18875126, 16777979, 0, 0, 26433],
-  [16777982, 17826556, 16777982, 0, 0, 26377],
-  [33555202, 18875135, 33555204, 0, 0, 26377],
-  [33555209, 18875142, 16777995, 0, 0, 26377],
-  [33555215, 18875148, 33555217, 0, 0, 26377],
-  [33555222, 18875155, 33555222, 0, 0, 26377],
-  [50332444, 19923736, 50332447, 0, 0, 26377],
-  [0, -86, 0, 0, 0, 10113],
-  [33555237, 18875170, 16778023, 0, 0, 26433],
-  [50332460, 19923752, 50332460, 0, 0, 26377],
-  [50332467, 19923759, 50332467, 0, 0, 26377],
-  [33555257, 18875190, 33555257, 0, 0, 26377],
-  [50332479, 19923771, 50332479, 0, 0, 26377],
-  [0, -100, 0, 0, 0, 10113],
-  [50332486, 19923778, 50332486, 0, 0, 26377],
-  [50332493, 19923785, 50332493, 0, 0, 26377],
-  [33555283, 18875216, 33555283, 0, 0, 26377],
-  [33555288, 18875221, 33555288, 0, 0, 26377],
-  [50332510, 19923802, 50332510, 0, 0, 26377],
-  [0, -112, 0, 0, 0, 10113],
-  [33555300, 18875233, 33555302, 0, 0, 26377],
-  [33555307, 18875240, 16778093, 0, 0, 26377],
-  [33555313, 18875246, 33555315, 0, 0, 26377],
-  [33555320, 18875253, 33555320, 0, 0, 26377],
-  [50332542, 19923834, 50332545, 0, 0, 26377],
-  [0, -128, 0, 0, 0, 10113],
-  [0, -126, 0, 0, 0, 10113],
-  [33555335, 18875268, 16778121, 0, 0, 26433],
-  [0, 0, 0, 0, 0, 3076],
-  [0, 0, 0, 0, 4, 3076],
-  [0, 0, 0, 0, 5, 3076],
-  [0, 0, 0, 0, 6, 3076],
-  [0, 0, 0, 0, 7, 3076],
-  [0, 0, 0, 0, 8, 3076],
-  [0, 0, 0, 0, 9, 3076],
-  [0, 0, 0, 0, 0, 1792],
-  [0, -7517, 0, 0, 0, 10113],
-  [0, -8383, 0, 0, 0, 10113],
-  [0, -8262, 0, 0, 0, 10113],
-  [0, 28, 0, 0, 0, 10113],
-  [-28, 0, -28, 0, 0, 9993],
-  [0, 16, 0, 0, 0, 12160],
-  [-16, 0, -16, 0, 0, 12040],
-  [0, 26, 0, 0, 0, 9344],
-  [-26, 0, -26, 0, 0, 9224],
-  [0, -10743, 0, 0, 0, 10113],
-  [0, -3814, 0, 0, 0, 10113],
-  [0, -10727, 0, 0, 0, 10113],
-  [-10795, 0, -10795, 0, 0, 9993],
-  [-10792, 0, -10792, 0, 0, 9993],
-  [0, -10780, 0, 0, 0, 10113],
-  [0, -10749, 0, 0, 0, 10113],
-  [0, -10783, 0, 0, 0, 10113],
-  [0, -10782, 0, 0, 0, 10113],
-  [0, -10815, 0, 0, 0, 10113],
-  [-7264, 0, -7264, 0, 0, 9993],
-  [0, 0, 0, 0, 0, 5121],
-  [0, 0, 0, 0, 0, 3841],
-  [0, -35332, 0, 0, 0, 10113],
-  [0, -42280, 0, 0, 0, 10113],
-  [48, 0, 48, 0, 0, 9993],
-  [0, -42308, 0, 0, 0, 10113],
-  [0, -42319, 0, 0, 0, 10113],
-  [0, -42315, 0, 0, 0, 10113],
-  [0, -42305, 0, 0, 0, 10113],
-  [0, -42258, 0, 0, 0, 10113],
-  [0, -42282, 0, 0, 0, 10113],
-  [0, -42261, 0, 0, 0, 10113],
-  [0, 928, 0, 0, 0, 10113],
-  [0, -48, 0, 0, 0, 10113],
-  [0, -42307, 0, 0, 0, 10113],
-  [0, -35384, 0, 0, 0, 10113],
-  [-928, 0, -928, 0, 0, 9993],
-  [16778124, 17826698, 16778124, 0, 0, 26377],
-  [16778127, 17826701, 16778127, 0, 0, 26377],
-  [16778130, 17826704, 16778130, 0, 0, 26377],
-  [16778133, 17826707, 16778133, 0, 0, 26377],
-  [16778136, 17826710, 16778136, 0, 0, 26377],
-  [16778139, 17826713, 16778139, 0, 0, 26377],
-  [16778142, 17826716, 16778142, 0, 0, 26377],
-  [16778145, 17826719, 16778145, 0, 0, 26377],
-  [16778148, 17826722, 16778148, 0, 0, 26377],
-  [16778151, 17826725, 16778151, 0, 0, 26377],
-  [16778154, 17826728, 16778154, 0, 0, 26377],
-  [16778157, 17826731, 16778157, 0, 0, 26377],
-  [16778160, 17826734, 16778160, 0, 0, 26377],
-  [16778163, 17826737, 16778163, 0, 0, 26377],
-  [16778166, 17826740, 16778166, 0, 0, 26377],
-  [16778169, 17826743, 16778169, 0, 0, 26377],
-  [16778172, 17826746, 16778172, 0, 0, 26377],
-  [16778175, 17826749, 16778175, 0, 0, 26377],
-  [16778178, 17826752, 16778178, 0, 0, 26377],
-  [16778181, 17826755, 16778181, 0, 0, 26377],
-  [16778184, 17826758, 16778184, 0, 0, 26377],
-  [16778187, 17826761, 16778187, 0, 0, 26377],
-  [16778190, 17826764, 16778190, 0, 0, 26377],
-  [16778193, 17826767, 16778193, 0, 0, 26377],
-  [16778196, 17826770, 16778196, 0, 0, 26377],
-  [16778199, 17826773, 16778199, 0, 0, 26377],
-  [16778202, 17826776, 16778202, 0, 0, 26377],
-  [16778205, 17826779, 16778205, 0, 0, 26377],
-  [16778208, 17826782, 16778208, 0, 0, 26377],
-  [16778211, 17826785, 16778211, 0, 0, 26377],
-  [16778214, 17826788, 16778214, 0, 0, 26377],
-  [16778217, 17826791, 16778217, 0, 0, 26377],
-  [16778220, 17826794, 16778220, 0, 0, 26377],
-  [16778223, 17826797, 16778223, 0, 0, 26377],
-  [16778226, 17826800, 16778226, 0, 0, 26377],
-  [16778229, 17826803, 16778229, 0, 0, 26377],
-  [16778232, 17826806, 16778232, 0, 0, 26377],
-  [16778235, 17826809, 16778235, 0, 0, 26377],
-  [16778238, 17826812, 16778238, 0, 0, 26377],
-  [16778241, 17826815, 16778241, 0, 0, 26377],
-  [16778244, 17826818, 16778244, 0, 0, 26377],
-  [16778247, 17826821, 16778247, 0, 0, 26377],
-  [16778250, 17826824, 16778250, 0, 0, 26377],
-  [16778253, 17826827, 16778253, 0, 0, 26377],
-  [16778256, 17826830, 16778256, 0, 0, 26377],
-  [16778259, 17826833, 16778259, 0, 0, 26377],
-  [16778262, 17826836, 16778262, 0, 0, 26377],
-  [16778265, 17826839, 16778265, 0, 0, 26377],
-  [16778268, 17826842, 16778268, 0, 0, 26377],
-  [16778271, 17826845, 16778271, 0, 0, 26377],
-  [16778274, 17826848, 16778274, 0, 0, 26377],
-  [16778277, 17826851, 16778277, 0, 0, 26377],
-  [16778280, 17826854, 16778280, 0, 0, 26377],
-  [16778283, 17826857, 16778283, 0, 0, 26377],
-  [16778286, 17826860, 16778286, 0, 0, 26377],
-  [16778289, 17826863, 16778289, 0, 0, 26377],
-  [16778292, 17826866, 16778292, 0, 0, 26377],
-  [16778295, 17826869, 16778295, 0, 0, 26377],
-  [16778298, 17826872, 16778298, 0, 0, 26377],
-  [16778301, 17826875, 16778301, 0, 0, 26377],
-  [16778304, 17826878, 16778304, 0, 0, 26377],
-  [16778307, 17826881, 16778307, 0, 0, 26377],
-  [16778310, 17826884, 16778310, 0, 0, 26377],
-  [16778313, 17826887, 16778313, 0, 0, 26377],
-  [16778316, 17826890, 16778316, 0, 0, 26377],
-  [16778319, 17826893, 16778319, 0, 0, 26377],
-  [16778322, 17826896, 16778322, 0, 0, 26377],
-  [16778325, 17826899, 16778325, 0, 0, 26377],
-  [16778328, 17826902, 16778328, 0, 0, 26377],
-  [16778331, 17826905, 16778331, 0, 0, 26377],
-  [16778334, 17826908, 16778334, 0, 0, 26377],
-  [16778337, 17826911, 16778337, 0, 0, 26377],
-  [16778340, 17826914, 16778340, 0, 0, 26377],
-  [16778343, 17826917, 16778343, 0, 0, 26377],
-  [16778346, 17826920, 16778346, 0, 0, 26377],
-  [16778349, 17826923, 16778349, 0, 0, 26377],
-  [16778352, 17826926, 16778352, 0, 0, 26377],
-  [16778355, 17826929, 16778355, 0, 0, 26377],
-  [16778358, 17826932, 16778358, 0, 0, 26377],
-  [16778361, 17826935, 16778361, 0, 0, 26377],
-  [33555581, 18875514, 33555583, 0, 0, 26377],
-  [33555588, 18875521, 33555590, 0, 0, 26377],
-  [33555595, 18875528, 33555597, 0, 0, 26377],
-  [50332819, 19924111, 50332822, 0, 0, 26377],
-  [50332829, 19924121, 50332832, 0, 0, 26377],
-  [33555622, 18875555, 33555624, 0, 0, 26377],
-  [33555629, 18875562, 33555631, 0, 0, 26377],
-  [33555636, 18875569, 33555638, 0, 0, 26377],
-  [33555643, 18875576, 33555645, 0, 0, 26377],
-  [33555650, 18875583, 33555652, 0, 0, 26377],
-  [33555657, 18875590, 33555659, 0, 0, 26377],
-  [33555664, 18875597, 33555666, 0, 0, 26377],
-  [0, 0, 0, 0, 0, 1025],
-  [0, 0, 0, 0, 0, 5633],
-  [0, 40, 0, 0, 0, 10113],
-  [-40, 0, -40, 0, 0, 9993],
-  [0, 34, 0, 0, 0, 10113],
-  [-34, 0, -34, 0, 0, 9993],
-  [0, 0, 0, 0, 0, 9344]
-]
+# stdlib
+from array import array
+from sys import byteorder
+
+record_upper = array('i', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x05\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x00\x00\x02y\x00\x00\x00'
+  b'\x00\x00\x00\x00\xff\xff\xff\xff\x15\x00\x00\x01\x18\xff\xff\xff\x1c\x00\x00\x02\x00\x00\x00\x00#\x00\x00\x01\xc3\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00a\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\xa3\x00\x00\x00\x00\x00\x00\x00\x82\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x008\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfe\xff\xff\xff\xb1\xff\xff\xff*\x00\x00\x02'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00?*\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f*\x00\x00\x1c*\x00\x00\x1e*\x00\x00.\xff\xff\xff2\xff\xff\xff3\xff\xff\xff'
+  b'6\xff\xff\xff5\xff\xff\xffO\xa5\x00\x00K\xa5\x00\x001\xff\xff\xff(\xa5\x00\x00D\xa5\x00\x00/\xff\xff\xff-\xff\xff\xff\xf7)\x00\x00A\xa5\x00\x00\xfd)\x00\x00+\xff\xff\xff*\xff\xff\xff\xe7)\x00\x00&\xff\xff\xff'
+  b"C\xa5\x00\x00*\xa5\x00\x00\xbb\xff\xff\xff'\xff\xff\xff\xb9\xff\xff\xff%\xff\xff\xff\x15\xa5\x00\x00\x12\xa5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x001\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+  b'\x00\x00\x00\x009\x00\x00\x03\xda\xff\xff\xff\xdb\xff\xff\xffC\x00\x00\x03K\x00\x00\x01\xc0\xff\xff\xff\xc1\xff\xff\xff\x00\x00\x00\x00Q\x00\x00\x01W\x00\x00\x01\x00\x00\x00\x00]\x00\x00\x01c\x00\x00\x01\xf8\xff\xff\xffi\x00\x00\x01'
+  b'o\x00\x00\x01\x07\x00\x00\x00\x8c\xff\xff\xff\x00\x00\x00\x00u\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\xb0\xff\xff\xff\x00\x00\x00\x00\xf1\xff\xff\xff\x00\x00\x00\x00\xd0\xff\xff\xff|\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x0b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x86\x00\x00\x01\x8c\x00\x00\x01\x92\x00\x00\x01'
+  b'\x98\x00\x00\x01\x9e\x00\x00\x01\xa4\x00\x00\x01\xaa\x00\x00\x01\xb0\x00\x00\x01\xb6\x00\x00\x01\xbc\x00\x00\x01\xc2\x00\x00\x01\xc8\x00\x00\x01\xce\x00\x00\x01\xd4\x00\x00\x01\xda\x00\x00\x01\xe0\x00\x00\x01\xe6\x00\x00\x01\xec\x00\x00\x01\xf2\x00\x00\x01'
+  b'\xf8\x00\x00\x01\xfe\x00\x00\x01\x04\x01\x00\x01\n\x01\x00\x01\x10\x01\x00\x01\x16\x01\x00\x01\x1c\x01\x00\x01"\x01\x00\x01(\x01\x00\x01.\x01\x00\x014\x01\x00\x01:\x01\x00\x01@\x01\x00\x01F\x01\x00\x01L\x01\x00\x01R\x01\x00\x01'
+  b'X\x01\x00\x01^\x01\x00\x01d\x01\x00\x01j\x01\x00\x01p\x01\x00\x01v\x01\x00\x01|\x01\x00\x01\x82\x01\x00\x01\x88\x01\x00\x01\x8e\x01\x00\x01\x94\x01\x00\x01\x9a\x01\x00\x01\xa0\x01\x00\x01\xa6\x01\x00\x01\xac\x01\x00\x01\xb2\x01\x00\x01'
+  b'\xb8\x01\x00\x01\xbe\x01\x00\x01\xc4\x01\x00\x01\xca\x01\x00\x01\xd0\x01\x00\x01\xd6\x01\x00\x01\xdc\x01\x00\x01\xe2\x01\x00\x01\xe8\x01\x00\x01\xee\x01\x00\x01\xf4\x01\x00\x01\xfa\x01\x00\x01\x00\x02\x00\x01\x06\x02\x00\x01\x0c\x02\x00\x01\x12\x02\x00\x01'
+  b'\x18\x02\x00\x01\x1e\x02\x00\x01$\x02\x00\x01*\x02\x00\x010\x02\x00\x016\x02\x00\x01<\x02\x00\x01B\x02\x00\x01H\x02\x00\x01N\x02\x00\x01T\x02\x00\x01Z\x02\x00\x01`\x02\x00\x01f\x02\x00\x01l\x02\x00\x01r\x02\x00\x01'
+  b'x\x02\x00\x01~\x02\x00\x01\x84\x02\x00\x01\x8a\x02\x00\x01\x90\x02\x00\x01\x96\x02\x00\x01\x9c\x02\x00\x01\xa2\x02\x00\x01\xa8\x02\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xae\x02\x00\x01\xb4\x02\x00\x01\xba\x02\x00\x01\xc0\x02\x00\x01\xc6\x02\x00\x01\xcc\x02\x00\x01\xd2\x02\x00\x01\xd8\x02\x00\x01\xde\x02\x00\x01\x00\x00\x00\x00\x04\x8a\x00\x00\xe6\x0e\x00\x008\x8a\x00\x00'
+  b'\xe5\x02\x00\x02\xed\x02\x00\x02\xf5\x02\x00\x02\xfd\x02\x00\x02\x05\x03\x00\x02\x0c\x03\x00\x01\x13\x03\x00\x01\x08\x00\x00\x00\x00\x00\x00\x00\x1a\x03\x00\x02#\x03\x00\x03-\x03\x00\x037\x03\x00\x03J\x00\x00\x00V\x00\x00\x00d\x00\x00\x00'
+  b'\x80\x00\x00\x00p\x00\x00\x00~\x00\x00\x00@\x03\x00\x02J\x03\x00\x02T\x03\x00\x02^\x03\x00\x02h\x03\x00\x02r\x03\x00\x02|\x03\x00\x02\x86\x03\x00\x02\x90\x03\x00\x02\x9a\x03\x00\x02\xa4\x03\x00\x02\xae\x03\x00\x02\xb8\x03\x00\x02'
+  b'\xc2\x03\x00\x02\xcc\x03\x00\x02\xd6\x03\x00\x02\xe0\x03\x00\x02\xea\x03\x00\x02\xf4\x03\x00\x02\xfe\x03\x00\x02\x08\x04\x00\x02\x12\x04\x00\x02\x1c\x04\x00\x02&\x04\x00\x020\x04\x00\x02:\x04\x00\x02D\x04\x00\x02N\x04\x00\x02X\x04\x00\x02'
+  b'b\x04\x00\x02l\x04\x00\x02v\x04\x00\x02\x80\x04\x00\x02\x8a\x04\x00\x02\x94\x04\x00\x02\x9e\x04\x00\x02\xa8\x04\x00\x02\xb2\x04\x00\x02\xbc\x04\x00\x02\xc6\x04\x00\x02\xd0\x04\x00\x02\xda\x04\x00\x02\xe4\x04\x00\x02\xee\x04\x00\x02\xf8\x04\x00\x02'
+  b'\x02\x05\x00\x02\x0c\x05\x00\x02\x16\x05\x00\x02 \x05\x00\x02+\x05\x00\x025\x05\x00\x02@\x05\x00\x02I\x05\x00\x03\x00\x00\x00\x00V\x05\x00\x02_\x05\x00\x01f\x05\x00\x02q\x05\x00\x02{\x05\x00\x02\x86\x05\x00\x02\x8f\x05\x00\x03'
+  b'\x00\x00\x00\x00\x9c\x05\x00\x02\xa7\x05\x00\x03\xb1\x05\x00\x03\xba\x05\x00\x02\xc3\x05\x00\x03\x00\x00\x00\x00\xcd\x05\x00\x03\xd7\x05\x00\x03\xe0\x05\x00\x02\xe8\x05\x00\x02\xf1\x05\x00\x03\x00\x00\x00\x00\xfa\x05\x00\x02\x05\x06\x00\x02\x0f\x06\x00\x02'
+  b'\x1a\x06\x00\x02#\x06\x00\x03\x00\x00\x00\x00\x00\x00\x00\x000\x06\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\xe4\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\xff\xff\xff\xf0\xff\xff\xff'
+  b'\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe6\xff\xff\xff\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\xd5\xd5\xff\xff\xd8\xd5\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa0\xe3\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x000\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00`\xfc\xff\xff9\x06\x00\x01?\x06\x00\x01E\x06\x00\x01K\x06\x00\x01Q\x06\x00\x01W\x06\x00\x01]\x06\x00\x01c\x06\x00\x01i\x06\x00\x01o\x06\x00\x01u\x06\x00\x01{\x06\x00\x01'
+  b'\x81\x06\x00\x01\x87\x06\x00\x01\x8d\x06\x00\x01\x93\x06\x00\x01\x99\x06\x00\x01\x9f\x06\x00\x01\xa5\x06\x00\x01\xab\x06\x00\x01\xb1\x06\x00\x01\xb7\x06\x00\x01\xbd\x06\x00\x01\xc3\x06\x00\x01\xc9\x06\x00\x01\xcf\x06\x00\x01\xd5\x06\x00\x01\xdb\x06\x00\x01'
+  b'\xe1\x06\x00\x01\xe7\x06\x00\x01\xed\x06\x00\x01\xf3\x06\x00\x01\xf9\x06\x00\x01\xff\x06\x00\x01\x05\x07\x00\x01\x0b\x07\x00\x01\x11\x07\x00\x01\x17\x07\x00\x01\x1d\x07\x00\x01#\x07\x00\x01)\x07\x00\x01/\x07\x00\x015\x07\x00\x01;\x07\x00\x01'
+  b'A\x07\x00\x01G\x07\x00\x01M\x07\x00\x01S\x07\x00\x01Y\x07\x00\x01_\x07\x00\x01e\x07\x00\x01k\x07\x00\x01q\x07\x00\x01w\x07\x00\x01}\x07\x00\x01\x83\x07\x00\x01\x89\x07\x00\x01\x8f\x07\x00\x01\x95\x07\x00\x01\x9b\x07\x00\x01'
+  b'\xa1\x07\x00\x01\xa7\x07\x00\x01\xad\x07\x00\x01\xb3\x07\x00\x01\xb9\x07\x00\x01\xbf\x07\x00\x01\xc5\x07\x00\x01\xcb\x07\x00\x01\xd1\x07\x00\x01\xd7\x07\x00\x01\xdd\x07\x00\x01\xe3\x07\x00\x01\xe9\x07\x00\x01\xef\x07\x00\x01\xf5\x07\x00\x01\xfb\x07\x00\x01'
+  b'\x01\x08\x00\x01\x07\x08\x00\x01\r\x08\x00\x01\x13\x08\x00\x01\x1a\x08\x00\x02%\x08\x00\x020\x08\x00\x02<\x08\x00\x03J\x08\x00\x03W\x08\x00\x02b\x08\x00\x02m\x08\x00\x02x\x08\x00\x02\x83\x08\x00\x02\x8e\x08\x00\x02\x99\x08\x00\x02'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\xd8\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xde\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+if byteorder == "big":  # pragma: no cover
+  record_upper.byteswap()
+
+record_lower = array('i', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00 \x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x00 \x01\x00\x00\x00\x00'
+  b'\x01\x00\x00\x00\x00\x00\x00\x00\x12\x00\x00\x02\x00\x00\x00\x00\x17\x00 \x01\x87\xff\xff\xff\x1f\x00\x10\x01\x00\x00\x00\x00\xd2\x00\x00\x00\xce\x00\x00\x00\xcd\x00\x00\x00O\x00\x00\x00\xca\x00\x00\x00\xcb\x00\x00\x00\xcf\x00\x00\x00\x00\x00\x00\x00'
+  b'\xd3\x00\x00\x00\xd1\x00\x00\x00\x00\x00\x00\x00\xd5\x00\x00\x00\x00\x00\x00\x00\xd6\x00\x00\x00\xda\x00\x00\x00\xd9\x00\x00\x00\xdb\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00%\x00 \x01'
+  b'\x9f\xff\xff\xff\xc8\xff\xff\xff~\xff\xff\xff+*\x00\x00]\xff\xff\xff(*\x00\x00\x00\x00\x00\x00=\xff\xff\xffE\x00\x00\x00G\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00-\x00\x10\x01\x00\x00\x00\x00t\x00\x00\x00&\x00\x00\x00%\x00\x00\x00@\x00\x00\x00'
+  b'?\x00\x00\x003\x000\x01\x00\x00\x00\x00\x00\x00\x00\x00=\x000\x01G\x00\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\x08\x00\x00\x00M\x00\x10\x01S\x00\x10\x01\x00\x00\x00\x00Y\x00\x10\x01_\x00\x10\x01\x00\x00\x00\x00e\x00\x10\x01'
+  b'k\x00\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\xc4\xff\xff\xffq\x00\x10\x01\xf9\xff\xff\xffP\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x00\x00\x00\x000\x00\x00\x00\x00\x00\x00\x00w\x00 \x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00`\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x82\x00\x10\x01\x88\x00\x10\x01\x8e\x00\x10\x01'
+  b'\x94\x00\x10\x01\x9a\x00\x10\x01\xa0\x00\x10\x01\xa6\x00\x10\x01\xac\x00\x10\x01\xb2\x00\x10\x01\xb8\x00\x10\x01\xbe\x00\x10\x01\xc4\x00\x10\x01\xca\x00\x10\x01\xd0\x00\x10\x01\xd6\x00\x10\x01\xdc\x00\x10\x01\xe2\x00\x10\x01\xe8\x00\x10\x01\xee\x00\x10\x01'
+  b'\xf4\x00\x10\x01\xfa\x00\x10\x01\x00\x01\x10\x01\x06\x01\x10\x01\x0c\x01\x10\x01\x12\x01\x10\x01\x18\x01\x10\x01\x1e\x01\x10\x01$\x01\x10\x01*\x01\x10\x010\x01\x10\x016\x01\x10\x01<\x01\x10\x01B\x01\x10\x01H\x01\x10\x01N\x01\x10\x01'
+  b'T\x01\x10\x01Z\x01\x10\x01`\x01\x10\x01f\x01\x10\x01l\x01\x10\x01r\x01\x10\x01x\x01\x10\x01~\x01\x10\x01\x84\x01\x10\x01\x8a\x01\x10\x01\x90\x01\x10\x01\x96\x01\x10\x01\x9c\x01\x10\x01\xa2\x01\x10\x01\xa8\x01\x10\x01\xae\x01\x10\x01'
+  b'\xb4\x01\x10\x01\xba\x01\x10\x01\xc0\x01\x10\x01\xc6\x01\x10\x01\xcc\x01\x10\x01\xd2\x01\x10\x01\xd8\x01\x10\x01\xde\x01\x10\x01\xe4\x01\x10\x01\xea\x01\x10\x01\xf0\x01\x10\x01\xf6\x01\x10\x01\xfc\x01\x10\x01\x02\x02\x10\x01\x08\x02\x10\x01\x0e\x02\x10\x01'
+  b'\x14\x02\x10\x01\x1a\x02\x10\x01 \x02\x10\x01&\x02\x10\x01,\x02\x10\x012\x02\x10\x018\x02\x10\x01>\x02\x10\x01D\x02\x10\x01J\x02\x10\x01P\x02\x10\x01V\x02\x10\x01\\\x02\x10\x01b\x02\x10\x01h\x02\x10\x01n\x02\x10\x01'
+  b't\x02\x10\x01z\x02\x10\x01\x80\x02\x10\x01\x86\x02\x10\x01\x8c\x02\x10\x01\x92\x02\x10\x01\x98\x02\x10\x01\x9e\x02\x10\x01\xa4\x02\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaa\x02\x10\x01\xb0\x02\x10\x01\xb6\x02\x10\x01\xbc\x02\x10\x01\xc2\x02\x10\x01\xc8\x02\x10\x01\xce\x02\x10\x01\xd4\x02\x10\x01\xda\x02\x10\x01@\xf4\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b"\xe0\x02 \x01\xe8\x02 \x01\xf0\x02 \x01\xf8\x02 \x01\x00\x03 \x01\x08\x03\x10\x01\x0e\x03 \x01\x00\x00\x00\x00\xf8\xff\xff\xff\x15\x03 \x01\x1d\x030\x01'\x030\x011\x030\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00;\x03 \x01E\x03 \x01O\x03 \x01Y\x03 \x01c\x03 \x01m\x03 \x01w\x03 \x01\x81\x03 \x01\x8b\x03 \x01\x95\x03 \x01\x9f\x03 \x01\xa9\x03 \x01\xb3\x03 \x01'
+  b'\xbd\x03 \x01\xc7\x03 \x01\xd1\x03 \x01\xdb\x03 \x01\xe5\x03 \x01\xef\x03 \x01\xf9\x03 \x01\x03\x04 \x01\r\x04 \x01\x17\x04 \x01!\x04 \x01+\x04 \x015\x04 \x01?\x04 \x01I\x04 \x01S\x04 \x01'
+  b']\x04 \x01g\x04 \x01q\x04 \x01{\x04 \x01\x85\x04 \x01\x8f\x04 \x01\x99\x04 \x01\xa3\x04 \x01\xad\x04 \x01\xb7\x04 \x01\xc1\x04 \x01\xcb\x04 \x01\xd5\x04 \x01\xdf\x04 \x01\xe9\x04 \x01\xf3\x04 \x01'
+  b'\xfd\x04 \x01\x07\x05 \x01\x11\x05 \x01\x1b\x05 \x01&\x05 \x010\x05 \x01;\x05 \x01C\x050\x01\xb6\xff\xff\xffQ\x05 \x01[\x05\x10\x01a\x05 \x01l\x05 \x01v\x05 \x01\x81\x05 \x01\x89\x050\x01'
+  b'\xaa\xff\xff\xff\x97\x05 \x01\xa1\x050\x01\xab\x050\x01\xb5\x05 \x01\xbd\x050\x01\x9c\xff\xff\xff\xc7\x050\x01\xd1\x050\x01\xdb\x05 \x01\xe3\x05 \x01\xeb\x050\x01\x90\xff\xff\xff\xf5\x05 \x01\x00\x06 \x01\n\x06 \x01'
+  b'\x15\x06 \x01\x1d\x060\x01\x80\xff\xff\xff\x82\xff\xff\xff+\x06 \x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa3\xe2\xff\xffA\xdf\xff\xff\xba\xdf\xff\xff'
+  b'\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00'
+  b'\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\t\xd6\xff\xff'
+  b'\x1a\xf1\xff\xff\x19\xd6\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\xe4\xd5\xff\xff\x03\xd6\xff\xff\xe1\xd5\xff\xff\xe2\xd5\xff\xff\xc1\xd5\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfcu\xff\xff\xd8Z\xff\xff\x00\x00\x00\x00\xbcZ\xff\xff\xb1Z\xff\xff\xb5Z\xff\xff\xbfZ\xff\xff\xeeZ\xff\xff\xd6Z\xff\xff\xebZ\xff\xff\xa0\x03\x00\x00'
+  b'\xd0\xff\xff\xff\xbdZ\xff\xff\xc8u\xff\xff\x00\x00\x00\x005\x06\x10\x01;\x06\x10\x01A\x06\x10\x01G\x06\x10\x01M\x06\x10\x01S\x06\x10\x01Y\x06\x10\x01_\x06\x10\x01e\x06\x10\x01k\x06\x10\x01q\x06\x10\x01w\x06\x10\x01'
+  b'}\x06\x10\x01\x83\x06\x10\x01\x89\x06\x10\x01\x8f\x06\x10\x01\x95\x06\x10\x01\x9b\x06\x10\x01\xa1\x06\x10\x01\xa7\x06\x10\x01\xad\x06\x10\x01\xb3\x06\x10\x01\xb9\x06\x10\x01\xbf\x06\x10\x01\xc5\x06\x10\x01\xcb\x06\x10\x01\xd1\x06\x10\x01\xd7\x06\x10\x01'
+  b'\xdd\x06\x10\x01\xe3\x06\x10\x01\xe9\x06\x10\x01\xef\x06\x10\x01\xf5\x06\x10\x01\xfb\x06\x10\x01\x01\x07\x10\x01\x07\x07\x10\x01\r\x07\x10\x01\x13\x07\x10\x01\x19\x07\x10\x01\x1f\x07\x10\x01%\x07\x10\x01+\x07\x10\x011\x07\x10\x017\x07\x10\x01'
+  b'=\x07\x10\x01C\x07\x10\x01I\x07\x10\x01O\x07\x10\x01U\x07\x10\x01[\x07\x10\x01a\x07\x10\x01g\x07\x10\x01m\x07\x10\x01s\x07\x10\x01y\x07\x10\x01\x7f\x07\x10\x01\x85\x07\x10\x01\x8b\x07\x10\x01\x91\x07\x10\x01\x97\x07\x10\x01'
+  b'\x9d\x07\x10\x01\xa3\x07\x10\x01\xa9\x07\x10\x01\xaf\x07\x10\x01\xb5\x07\x10\x01\xbb\x07\x10\x01\xc1\x07\x10\x01\xc7\x07\x10\x01\xcd\x07\x10\x01\xd3\x07\x10\x01\xd9\x07\x10\x01\xdf\x07\x10\x01\xe5\x07\x10\x01\xeb\x07\x10\x01\xf1\x07\x10\x01\xf7\x07\x10\x01'
+  b'\xfd\x07\x10\x01\x03\x08\x10\x01\t\x08\x10\x01\x0f\x08\x10\x01\x15\x08 \x01 \x08 \x01+\x08 \x016\x080\x01D\x080\x01R\x08 \x01]\x08 \x01h\x08 \x01s\x08 \x01~\x08 \x01\x89\x08 \x01\x94\x08 \x01'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00(\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+if byteorder == "big":  # pragma: no cover
+  record_lower.byteswap()
+
+record_title = array('i', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x05\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x02y\x00\x00\x00'
+  b'\x00\x00\x00\x00\xff\xff\xff\xff\x15\x00\x00\x01\x18\xff\xff\xff\x1c\x00\x00\x02\x00\x00\x00\x00#\x00\x00\x01\xc3\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00a\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\xa3\x00\x00\x00\x00\x00\x00\x00\x82\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x008\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xb1\xff\xff\xff*\x00\x00\x02'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00?*\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f*\x00\x00\x1c*\x00\x00\x1e*\x00\x00.\xff\xff\xff2\xff\xff\xff3\xff\xff\xff'
+  b'6\xff\xff\xff5\xff\xff\xffO\xa5\x00\x00K\xa5\x00\x001\xff\xff\xff(\xa5\x00\x00D\xa5\x00\x00/\xff\xff\xff-\xff\xff\xff\xf7)\x00\x00A\xa5\x00\x00\xfd)\x00\x00+\xff\xff\xff*\xff\xff\xff\xe7)\x00\x00&\xff\xff\xff'
+  b"C\xa5\x00\x00*\xa5\x00\x00\xbb\xff\xff\xff'\xff\xff\xff\xb9\xff\xff\xff%\xff\xff\xff\x15\xa5\x00\x00\x12\xa5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x001\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+  b'\x00\x00\x00\x009\x00\x00\x03\xda\xff\xff\xff\xdb\xff\xff\xffC\x00\x00\x03K\x00\x00\x01\xc0\xff\xff\xff\xc1\xff\xff\xff\x00\x00\x00\x00Q\x00\x00\x01W\x00\x00\x01\x00\x00\x00\x00]\x00\x00\x01c\x00\x00\x01\xf8\xff\xff\xffi\x00\x00\x01'
+  b'o\x00\x00\x01\x07\x00\x00\x00\x8c\xff\xff\xff\x00\x00\x00\x00u\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\xb0\xff\xff\xff\x00\x00\x00\x00\xf1\xff\xff\xff\x00\x00\x00\x00\xd0\xff\xff\xff\x7f\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x86\x00\x00\x01\x8c\x00\x00\x01\x92\x00\x00\x01'
+  b'\x98\x00\x00\x01\x9e\x00\x00\x01\xa4\x00\x00\x01\xaa\x00\x00\x01\xb0\x00\x00\x01\xb6\x00\x00\x01\xbc\x00\x00\x01\xc2\x00\x00\x01\xc8\x00\x00\x01\xce\x00\x00\x01\xd4\x00\x00\x01\xda\x00\x00\x01\xe0\x00\x00\x01\xe6\x00\x00\x01\xec\x00\x00\x01\xf2\x00\x00\x01'
+  b'\xf8\x00\x00\x01\xfe\x00\x00\x01\x04\x01\x00\x01\n\x01\x00\x01\x10\x01\x00\x01\x16\x01\x00\x01\x1c\x01\x00\x01"\x01\x00\x01(\x01\x00\x01.\x01\x00\x014\x01\x00\x01:\x01\x00\x01@\x01\x00\x01F\x01\x00\x01L\x01\x00\x01R\x01\x00\x01'
+  b'X\x01\x00\x01^\x01\x00\x01d\x01\x00\x01j\x01\x00\x01p\x01\x00\x01v\x01\x00\x01|\x01\x00\x01\x82\x01\x00\x01\x88\x01\x00\x01\x8e\x01\x00\x01\x94\x01\x00\x01\x9a\x01\x00\x01\xa0\x01\x00\x01\xa6\x01\x00\x01\xac\x01\x00\x01\xb2\x01\x00\x01'
+  b'\xb8\x01\x00\x01\xbe\x01\x00\x01\xc4\x01\x00\x01\xca\x01\x00\x01\xd0\x01\x00\x01\xd6\x01\x00\x01\xdc\x01\x00\x01\xe2\x01\x00\x01\xe8\x01\x00\x01\xee\x01\x00\x01\xf4\x01\x00\x01\xfa\x01\x00\x01\x00\x02\x00\x01\x06\x02\x00\x01\x0c\x02\x00\x01\x12\x02\x00\x01'
+  b'\x18\x02\x00\x01\x1e\x02\x00\x01$\x02\x00\x01*\x02\x00\x010\x02\x00\x016\x02\x00\x01<\x02\x00\x01B\x02\x00\x01H\x02\x00\x01N\x02\x00\x01T\x02\x00\x01Z\x02\x00\x01`\x02\x00\x01f\x02\x00\x01l\x02\x00\x01r\x02\x00\x01'
+  b'x\x02\x00\x01~\x02\x00\x01\x84\x02\x00\x01\x8a\x02\x00\x01\x90\x02\x00\x01\x96\x02\x00\x01\x9c\x02\x00\x01\xa2\x02\x00\x01\xa8\x02\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xae\x02\x00\x01\xb4\x02\x00\x01\xba\x02\x00\x01\xc0\x02\x00\x01\xc6\x02\x00\x01\xcc\x02\x00\x01\xd2\x02\x00\x01\xd8\x02\x00\x01\xde\x02\x00\x01\x00\x00\x00\x00\x04\x8a\x00\x00\xe6\x0e\x00\x008\x8a\x00\x00'
+  b'\xe5\x02\x00\x02\xed\x02\x00\x02\xf5\x02\x00\x02\xfd\x02\x00\x02\x05\x03\x00\x02\x0c\x03\x00\x01\x13\x03\x00\x01\x08\x00\x00\x00\x00\x00\x00\x00\x1a\x03\x00\x02#\x03\x00\x03-\x03\x00\x037\x03\x00\x03J\x00\x00\x00V\x00\x00\x00d\x00\x00\x00'
+  b'\x80\x00\x00\x00p\x00\x00\x00~\x00\x00\x00C\x03\x00\x01M\x03\x00\x01W\x03\x00\x01a\x03\x00\x01k\x03\x00\x01u\x03\x00\x01\x7f\x03\x00\x01\x89\x03\x00\x01\x93\x03\x00\x01\x9d\x03\x00\x01\xa7\x03\x00\x01\xb1\x03\x00\x01\xbb\x03\x00\x01'
+  b'\xc5\x03\x00\x01\xcf\x03\x00\x01\xd9\x03\x00\x01\xe3\x03\x00\x01\xed\x03\x00\x01\xf7\x03\x00\x01\x01\x04\x00\x01\x0b\x04\x00\x01\x15\x04\x00\x01\x1f\x04\x00\x01)\x04\x00\x013\x04\x00\x01=\x04\x00\x01G\x04\x00\x01Q\x04\x00\x01[\x04\x00\x01'
+  b'e\x04\x00\x01o\x04\x00\x01y\x04\x00\x01\x83\x04\x00\x01\x8d\x04\x00\x01\x97\x04\x00\x01\xa1\x04\x00\x01\xab\x04\x00\x01\xb5\x04\x00\x01\xbf\x04\x00\x01\xc9\x04\x00\x01\xd3\x04\x00\x01\xdd\x04\x00\x01\xe7\x04\x00\x01\xf1\x04\x00\x01\xfb\x04\x00\x01'
+  b'\x05\x05\x00\x01\x0f\x05\x00\x01\x19\x05\x00\x01#\x05\x00\x02.\x05\x00\x018\x05\x00\x02@\x05\x00\x02M\x05\x00\x03\x00\x00\x00\x00Y\x05\x00\x01_\x05\x00\x01i\x05\x00\x02t\x05\x00\x01~\x05\x00\x02\x86\x05\x00\x02\x93\x05\x00\x03'
+  b'\x00\x00\x00\x00\x9f\x05\x00\x01\xa7\x05\x00\x03\xb1\x05\x00\x03\xba\x05\x00\x02\xc3\x05\x00\x03\x00\x00\x00\x00\xcd\x05\x00\x03\xd7\x05\x00\x03\xe0\x05\x00\x02\xe8\x05\x00\x02\xf1\x05\x00\x03\x00\x00\x00\x00\xfd\x05\x00\x02\x08\x06\x00\x01\x12\x06\x00\x02'
+  b"\x1a\x06\x00\x02'\x06\x00\x03\x00\x00\x00\x00\x00\x00\x00\x003\x06\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+  b'\x00\x00\x00\x00\xe4\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\xff\xff\xff\xf0\xff\xff\xff'
+  b'\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe6\xff\xff\xff\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\xd5\xd5\xff\xff\xd8\xd5\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa0\xe3\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x000\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00`\xfc\xff\xff9\x06\x00\x01?\x06\x00\x01E\x06\x00\x01K\x06\x00\x01Q\x06\x00\x01W\x06\x00\x01]\x06\x00\x01c\x06\x00\x01i\x06\x00\x01o\x06\x00\x01u\x06\x00\x01{\x06\x00\x01'
+  b'\x81\x06\x00\x01\x87\x06\x00\x01\x8d\x06\x00\x01\x93\x06\x00\x01\x99\x06\x00\x01\x9f\x06\x00\x01\xa5\x06\x00\x01\xab\x06\x00\x01\xb1\x06\x00\x01\xb7\x06\x00\x01\xbd\x06\x00\x01\xc3\x06\x00\x01\xc9\x06\x00\x01\xcf\x06\x00\x01\xd5\x06\x00\x01\xdb\x06\x00\x01'
+  b'\xe1\x06\x00\x01\xe7\x06\x00\x01\xed\x06\x00\x01\xf3\x06\x00\x01\xf9\x06\x00\x01\xff\x06\x00\x01\x05\x07\x00\x01\x0b\x07\x00\x01\x11\x07\x00\x01\x17\x07\x00\x01\x1d\x07\x00\x01#\x07\x00\x01)\x07\x00\x01/\x07\x00\x015\x07\x00\x01;\x07\x00\x01'
+  b'A\x07\x00\x01G\x07\x00\x01M\x07\x00\x01S\x07\x00\x01Y\x07\x00\x01_\x07\x00\x01e\x07\x00\x01k\x07\x00\x01q\x07\x00\x01w\x07\x00\x01}\x07\x00\x01\x83\x07\x00\x01\x89\x07\x00\x01\x8f\x07\x00\x01\x95\x07\x00\x01\x9b\x07\x00\x01'
+  b'\xa1\x07\x00\x01\xa7\x07\x00\x01\xad\x07\x00\x01\xb3\x07\x00\x01\xb9\x07\x00\x01\xbf\x07\x00\x01\xc5\x07\x00\x01\xcb\x07\x00\x01\xd1\x07\x00\x01\xd7\x07\x00\x01\xdd\x07\x00\x01\xe3\x07\x00\x01\xe9\x07\x00\x01\xef\x07\x00\x01\xf5\x07\x00\x01\xfb\x07\x00\x01'
+  b'\x01\x08\x00\x01\x07\x08\x00\x01\r\x08\x00\x01\x13\x08\x00\x01\x1d\x08\x00\x02(\x08\x00\x023\x08\x00\x02@\x08\x00\x03N\x08\x00\x03Z\x08\x00\x02e\x08\x00\x02p\x08\x00\x02{\x08\x00\x02\x86\x08\x00\x02\x91\x08\x00\x02\x9c\x08\x00\x02'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\xd8\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xde\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+if byteorder == "big":  # pragma: no cover
+  record_title.byteswap()
+
+record_decimal = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+
+record_digit = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\x00\x00\x00\x00\x00\x02\x03\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x05\x06\x07\x08\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+
+record_flags = array('H', (
+  b"\x00\x00\x00\x00 \x000\x00 \x04\x00\x04\x00\x14\x06\x0e\x06\x0e\x06\x0e\x06\x0e\x06\x0e\x06\x0e\x06\x0e\x06\x0e\x06\x0e\x06\x0e\x81'\x00\x06\t'\t'\x00\x10\x04\x0c\x04\x0c\tg\x00\x16\x04\x0c\x00\x0c\x00\x0c\x00\x0c\tg\t'"
+  b"\x81'\t'\x81g\t'\tg\x81'\tg\t'\x81'\x81'\x81'\x81'\x81'\x81'\x81'\t'\x81'\x81'\t'\x81'\t'\x81'\x81'\x81'\x81'\x01\x07\t'\x81'A'\t'\t'\tg"
+  b"\x81'\x81'\x81'\x81'\x81'\x81'\t'\x81'\x81'\x81'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'"
+  b"\t'\t'\t'\t'\t'\t'\t'\t'\t7\x01\x17\x08v\t4\x81'\x81'\x81'\x81'\x81'\tg\t'\t'\tg\tg\t'\t'\x81'\tg\tg\x81'\tg\tg\t'\tg"
+  b"\tg\t'\t'\x81'\tg\x81'\x81'\t'\x81'\t'\x81'\t'\tg\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x01\x06"
+  b"\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x81'\t'\x04\x0e\x04\x0e\x04\x0e\x04\x0e\x04\x0e\x04\x0e\x04\x0e\x04\x0e\x04\x0e\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x81g\x81g\x81g"
+  b'\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g'
+  b'\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g'
+  b'\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\tg\tg\tg\tg\tg\tg\x00\x0f\x00\x0f\x00\x0f\x00\x0c\x00\x0c\x00\x0c\x00\x0c'
+  b"\x00\x0c\x00\x0c\x00\x17\tg\tg\tg\tg\tg\tg\tg\tg\tg\x81'\t'\t'\t'\tg\tg\tg\tg\tg\tg\x81g\t'\x81'\tg\tg\tg\tg\t'\t'\t'"
+  b"\t'\t'\t'\tg\tg\tg\tg\tg\tg\tg\tgAgAgAgAgAgAgAgAg\tg\tg\tg\tg\tg\tg\tg\tgAgAgAgAgAg"
+  b"AgAgAg\tg\tg\tg\tg\tg\tg\tg\tgAgAgAgAgAgAgAgAg\tg\tg\tg\tg\tg\x81'Ag\tg\tg\tg\tg\tg\tg"
+  b"\x81'Ag\tg\tg\tg\tg\x81'\tg\tg\tg\tg\tg\x81'\tg\tg\tg\tg\tg\x81'\x81'Ag\x04\x0c\x04\x0c\x04\x0c\x04\x0c\x04\x0c\x04\x0c\x04\x0c\x00\x07\x81'\x81'\x81'"
+  b"\x81'\t'\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x80/\x80/\x80/\x80/\x80/\x80/\x80/\x80/\x80/\x80/\x80/\x80/\x80/\x80/\x80/\x80/\x08/\x08/"
+  b"\x08/\x08/\x08/\x08/\x08/\x08/\x08/\x08/\x08/\x08/\x08/\x08/\x08/\x08/\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x80$\x08$\x81'"
+  b"\x81'\x81'\t'\t'\x81'\x81'\x81'\x81'\x81'\t'\x01\x14\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c"
+  b'\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f'
+  b"\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x81'\x81'\t'\x81'\x81'\x81'\x81'\x81'\x81'\x81'\x81'\x81'\x81'\x81'\t'\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg"
+  b'\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg'
+  b'\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg'
+  b'\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\x01\x04\x01\x16\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c'
+  b"\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x81'\t'\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c"
+  b"\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x81'\t'\x00\x0c\x00\x0c\x80$"
+))
+if byteorder == "big":  # pragma: no cover
+  record_flags.byteswap()
+
+record_numeric = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\x00\x00\x00\x00\x00\x02\x03\x00\x00\x01\n\x0b\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\r\x0e\x0f\x10\x11\x12\x13\x00\x01\x02\x03\x14\x15\x16\x17\x18\x19\x1a\x00\x1b\x1c\x1d\x1e\x1f !"#\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t$%&\'()*+,\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00-./\x04\x05\x06\x07\x08\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x05\x06\x07\x08\t\x00\x00\x00\x00\x00\x000123456789:;\x01\x02\x03\x04\x05\x06\x07\x08\t\x11<='\x12>\x13\x01\x02"
+  b"\x03\x04\x05\x06\x07\x08\t\x11<='\x12>\x13\x13?,\x06'@A<=BCD-./\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x07\x08\t\x11$%EFGHIJKLM"
+  b'NOPQRSTUVWXYZ[\\]^_\x05\x02\x07\x01,\x03\t\x04`\x11\x13\x12a\x08\x06$%&\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00bcd>efghijk?lmnopqr@stuv\n\x0b>\x12c+h\x00\x00wAxyz{|}~\x7f\x80\x81\x82'
+  b'\x83\x84\x85\x86\x87\x88\x89\x8a\x8b\x8c\x8d\x8e\x8f\x90238\x0e7&\x91`\x92a\x00\x00\x93\x94\x00'
+))
+
+record_is_alpha = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x01\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00'
+))
+
+record_is_decimal = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+
+record_is_digit = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x01\x01\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+
+record_is_lower = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x01\x01\x00\x01\x00\x01\x01\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x01\x00\x01\x00\x00\x00\x00\x00\x01\x00\x00\x01\x01\x01'
+  b'\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x00\x01\x01\x01\x01'
+  b'\x01\x01\x01\x00\x01\x00\x00\x01\x00\x01\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x00\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x00\x00\x01\x01\x01\x01\x01\x01'
+  b'\x00\x00\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x01\x01\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00'
+))
+
+record_is_linebreak = array('B', (
+  b'\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+
+record_is_space = array('B', (
+  b'\x00\x00\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+
+record_is_title = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00'
+  b'\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+
+record_is_upper = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x01\x00\x00\x01\x00\x00\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x00\x01\x00\x01\x01\x01\x01\x00\x00\x01\x00\x00\x00\x00'
+  b'\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x01\x00\x00\x00\x00'
+  b'\x00\x00\x00\x01\x00\x01\x01\x00\x01\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x01\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00'
+  b'\x01\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x01\x01\x01\x00\x00\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x01'
+))
+
+record_is_xid_start = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x01\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x01\x01\x00\x00\x00'
+))
+
+record_is_xid_continue = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x01\x01\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x01\x01\x00\x00\x00'
+))
+
+record_is_printable = array('B', (
+  b'\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+))
+
+record_is_numeric = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x01\x01\x00\x00\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x01\x01\x00'
+))
+
+record_is_case_ignorable = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+
+record_is_cased = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x01\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x01'
+))
+
+record_is_extended_case = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x01\x00\x00\x00\x01\x00\x01\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x01\x00\x00\x01\x01\x00\x00\x00\x01\x01\x00\x01\x01\x00\x01'
+  b'\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x00\x00\x01\x01\x01\x01\x00\x00\x00'
+  b'\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01\x01'
+  b'\x00\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+
+extended_case = array('H', (
+  b'\xb5\x00\xb5\x00\xbc\x03\xbc\x03\x9c\x03\x9c\x03\xdf\x00\xdf\x00\xdf\x00s\x00s\x00\xdf\x00S\x00S\x00\xdf\x00S\x00s\x00i\x00i\x00\x07\x030\x010\x01I\x01I\x01I\x01\xbc\x02n\x00I\x01\xbc\x02N\x00\x7f\x01\x7f\x01'
+  b's\x00s\x00S\x00S\x00\xf0\x01\xf0\x01\xf0\x01j\x00\x0c\x03\xf0\x01J\x00\x0c\x03E\x03E\x03\xb9\x03\xb9\x03\x99\x03\x99\x03\x90\x03\x90\x03\x90\x03\xb9\x03\x08\x03\x01\x03\x90\x03\x99\x03\x08\x03\x01\x03\xb0\x03\xb0\x03\xb0\x03\xc5\x03'
+  b'\x08\x03\x01\x03\xb0\x03\xa5\x03\x08\x03\x01\x03\xc2\x03\xc2\x03\xc3\x03\xc3\x03\xa3\x03\xa3\x03\xd0\x03\xd0\x03\xb2\x03\xb2\x03\x92\x03\x92\x03\xd1\x03\xd1\x03\xb8\x03\xb8\x03\x98\x03\x98\x03\xd5\x03\xd5\x03\xc6\x03\xc6\x03\xa6\x03\xa6\x03\xd6\x03\xd6\x03'
+  b'\xc0\x03\xc0\x03\xa0\x03\xa0\x03\xf0\x03\xf0\x03\xba\x03\xba\x03\x9a\x03\x9a\x03\xf1\x03\xf1\x03\xc1\x03\xc1\x03\xa1\x03\xa1\x03\xf5\x03\xf5\x03\xb5\x03\xb5\x03\x95\x03\x95\x03\x87\x05\x87\x05\x87\x05e\x05\x82\x05\x87\x055\x05R\x05\x87\x055\x05'
+  b'\x82\x05p\xabp\xab\xa0\x13\xa0\x13\xa0\x13\xa0\x13q\xabq\xab\xa1\x13\xa1\x13\xa1\x13\xa1\x13r\xabr\xab\xa2\x13\xa2\x13\xa2\x13\xa2\x13s\xabs\xab\xa3\x13\xa3\x13\xa3\x13\xa3\x13t\xabt\xab\xa4\x13\xa4\x13\xa4\x13\xa4\x13u\xab'
+  b'u\xab\xa5\x13\xa5\x13\xa5\x13\xa5\x13v\xabv\xab\xa6\x13\xa6\x13\xa6\x13\xa6\x13w\xabw\xab\xa7\x13\xa7\x13\xa7\x13\xa7\x13x\xabx\xab\xa8\x13\xa8\x13\xa8\x13\xa8\x13y\xaby\xab\xa9\x13\xa9\x13\xa9\x13\xa9\x13z\xabz\xab\xaa\x13'
+  b'\xaa\x13\xaa\x13\xaa\x13{\xab{\xab\xab\x13\xab\x13\xab\x13\xab\x13|\xab|\xab\xac\x13\xac\x13\xac\x13\xac\x13}\xab}\xab\xad\x13\xad\x13\xad\x13\xad\x13~\xab~\xab\xae\x13\xae\x13\xae\x13\xae\x13\x7f\xab\x7f\xab\xaf\x13\xaf\x13\xaf\x13'
+  b'\xaf\x13\x80\xab\x80\xab\xb0\x13\xb0\x13\xb0\x13\xb0\x13\x81\xab\x81\xab\xb1\x13\xb1\x13\xb1\x13\xb1\x13\x82\xab\x82\xab\xb2\x13\xb2\x13\xb2\x13\xb2\x13\x83\xab\x83\xab\xb3\x13\xb3\x13\xb3\x13\xb3\x13\x84\xab\x84\xab\xb4\x13\xb4\x13\xb4\x13\xb4\x13\x85\xab'
+  b'\x85\xab\xb5\x13\xb5\x13\xb5\x13\xb5\x13\x86\xab\x86\xab\xb6\x13\xb6\x13\xb6\x13\xb6\x13\x87\xab\x87\xab\xb7\x13\xb7\x13\xb7\x13\xb7\x13\x88\xab\x88\xab\xb8\x13\xb8\x13\xb8\x13\xb8\x13\x89\xab\x89\xab\xb9\x13\xb9\x13\xb9\x13\xb9\x13\x8a\xab\x8a\xab\xba\x13'
+  b'\xba\x13\xba\x13\xba\x13\x8b\xab\x8b\xab\xbb\x13\xbb\x13\xbb\x13\xbb\x13\x8c\xab\x8c\xab\xbc\x13\xbc\x13\xbc\x13\xbc\x13\x8d\xab\x8d\xab\xbd\x13\xbd\x13\xbd\x13\xbd\x13\x8e\xab\x8e\xab\xbe\x13\xbe\x13\xbe\x13\xbe\x13\x8f\xab\x8f\xab\xbf\x13\xbf\x13\xbf\x13'
+  b'\xbf\x13\x90\xab\x90\xab\xc0\x13\xc0\x13\xc0\x13\xc0\x13\x91\xab\x91\xab\xc1\x13\xc1\x13\xc1\x13\xc1\x13\x92\xab\x92\xab\xc2\x13\xc2\x13\xc2\x13\xc2\x13\x93\xab\x93\xab\xc3\x13\xc3\x13\xc3\x13\xc3\x13\x94\xab\x94\xab\xc4\x13\xc4\x13\xc4\x13\xc4\x13\x95\xab'
+  b'\x95\xab\xc5\x13\xc5\x13\xc5\x13\xc5\x13\x96\xab\x96\xab\xc6\x13\xc6\x13\xc6\x13\xc6\x13\x97\xab\x97\xab\xc7\x13\xc7\x13\xc7\x13\xc7\x13\x98\xab\x98\xab\xc8\x13\xc8\x13\xc8\x13\xc8\x13\x99\xab\x99\xab\xc9\x13\xc9\x13\xc9\x13\xc9\x13\x9a\xab\x9a\xab\xca\x13'
+  b'\xca\x13\xca\x13\xca\x13\x9b\xab\x9b\xab\xcb\x13\xcb\x13\xcb\x13\xcb\x13\x9c\xab\x9c\xab\xcc\x13\xcc\x13\xcc\x13\xcc\x13\x9d\xab\x9d\xab\xcd\x13\xcd\x13\xcd\x13\xcd\x13\x9e\xab\x9e\xab\xce\x13\xce\x13\xce\x13\xce\x13\x9f\xab\x9f\xab\xcf\x13\xcf\x13\xcf\x13'
+  b'\xcf\x13\xa0\xab\xa0\xab\xd0\x13\xd0\x13\xd0\x13\xd0\x13\xa1\xab\xa1\xab\xd1\x13\xd1\x13\xd1\x13\xd1\x13\xa2\xab\xa2\xab\xd2\x13\xd2\x13\xd2\x13\xd2\x13\xa3\xab\xa3\xab\xd3\x13\xd3\x13\xd3\x13\xd3\x13\xa4\xab\xa4\xab\xd4\x13\xd4\x13\xd4\x13\xd4\x13\xa5\xab'
+  b'\xa5\xab\xd5\x13\xd5\x13\xd5\x13\xd5\x13\xa6\xab\xa6\xab\xd6\x13\xd6\x13\xd6\x13\xd6\x13\xa7\xab\xa7\xab\xd7\x13\xd7\x13\xd7\x13\xd7\x13\xa8\xab\xa8\xab\xd8\x13\xd8\x13\xd8\x13\xd8\x13\xa9\xab\xa9\xab\xd9\x13\xd9\x13\xd9\x13\xd9\x13\xaa\xab\xaa\xab\xda\x13'
+  b'\xda\x13\xda\x13\xda\x13\xab\xab\xab\xab\xdb\x13\xdb\x13\xdb\x13\xdb\x13\xac\xab\xac\xab\xdc\x13\xdc\x13\xdc\x13\xdc\x13\xad\xab\xad\xab\xdd\x13\xdd\x13\xdd\x13\xdd\x13\xae\xab\xae\xab\xde\x13\xde\x13\xde\x13\xde\x13\xaf\xab\xaf\xab\xdf\x13\xdf\x13\xdf\x13'
+  b'\xdf\x13\xb0\xab\xb0\xab\xe0\x13\xe0\x13\xe0\x13\xe0\x13\xb1\xab\xb1\xab\xe1\x13\xe1\x13\xe1\x13\xe1\x13\xb2\xab\xb2\xab\xe2\x13\xe2\x13\xe2\x13\xe2\x13\xb3\xab\xb3\xab\xe3\x13\xe3\x13\xe3\x13\xe3\x13\xb4\xab\xb4\xab\xe4\x13\xe4\x13\xe4\x13\xe4\x13\xb5\xab'
+  b'\xb5\xab\xe5\x13\xe5\x13\xe5\x13\xe5\x13\xb6\xab\xb6\xab\xe6\x13\xe6\x13\xe6\x13\xe6\x13\xb7\xab\xb7\xab\xe7\x13\xe7\x13\xe7\x13\xe7\x13\xb8\xab\xb8\xab\xe8\x13\xe8\x13\xe8\x13\xe8\x13\xb9\xab\xb9\xab\xe9\x13\xe9\x13\xe9\x13\xe9\x13\xba\xab\xba\xab\xea\x13'
+  b'\xea\x13\xea\x13\xea\x13\xbb\xab\xbb\xab\xeb\x13\xeb\x13\xeb\x13\xeb\x13\xbc\xab\xbc\xab\xec\x13\xec\x13\xec\x13\xec\x13\xbd\xab\xbd\xab\xed\x13\xed\x13\xed\x13\xed\x13\xbe\xab\xbe\xab\xee\x13\xee\x13\xee\x13\xee\x13\xbf\xab\xbf\xab\xef\x13\xef\x13\xef\x13'
+  b'\xef\x13\xf8\x13\xf8\x13\xf0\x13\xf0\x13\xf0\x13\xf0\x13\xf9\x13\xf9\x13\xf1\x13\xf1\x13\xf1\x13\xf1\x13\xfa\x13\xfa\x13\xf2\x13\xf2\x13\xf2\x13\xf2\x13\xfb\x13\xfb\x13\xf3\x13\xf3\x13\xf3\x13\xf3\x13\xfc\x13\xfc\x13\xf4\x13\xf4\x13\xf4\x13\xf4\x13\xfd\x13'
+  b'\xfd\x13\xf5\x13\xf5\x13\xf5\x13\xf5\x13\xf8\x13\xf8\x13\xf0\x13\xf0\x13\xf0\x13\xf0\x13\xf9\x13\xf9\x13\xf1\x13\xf1\x13\xf1\x13\xf1\x13\xfa\x13\xfa\x13\xf2\x13\xf2\x13\xf2\x13\xf2\x13\xfb\x13\xfb\x13\xf3\x13\xf3\x13\xf3\x13\xf3\x13\xfc\x13\xfc\x13\xf4\x13'
+  b'\xf4\x13\xf4\x13\xf4\x13\xfd\x13\xfd\x13\xf5\x13\xf5\x13\xf5\x13\xf5\x13\x80\x1c\x80\x1c2\x042\x04\x12\x04\x12\x04\x81\x1c\x81\x1c4\x044\x04\x14\x04\x14\x04\x82\x1c\x82\x1c>\x04>\x04\x1e\x04\x1e\x04\x83\x1c\x83\x1cA\x04A\x04!\x04'
+  b'!\x04\x84\x1c\x84\x1cB\x04B\x04"\x04"\x04\x85\x1c\x85\x1cB\x04B\x04"\x04"\x04\x86\x1c\x86\x1cJ\x04J\x04*\x04*\x04\x87\x1c\x87\x1cc\x04c\x04b\x04b\x04\x88\x1c\x88\x1cK\xa6K\xa6J\xa6J\xa6\x96\x1e'
+  b'\x96\x1e\x96\x1eh\x001\x03\x96\x1eH\x001\x03\x97\x1e\x97\x1e\x97\x1et\x00\x08\x03\x97\x1eT\x00\x08\x03\x98\x1e\x98\x1e\x98\x1ew\x00\n\x03\x98\x1eW\x00\n\x03\x99\x1e\x99\x1e\x99\x1ey\x00\n\x03\x99\x1eY\x00\n\x03\x9a\x1e'
+  b'\x9a\x1e\x9a\x1ea\x00\xbe\x02\x9a\x1eA\x00\xbe\x02\x9b\x1e\x9b\x1ea\x1ea\x1e`\x1e`\x1e\xdf\x00\xdf\x00\xdf\x00s\x00s\x00\x9e\x1e\x9e\x1eP\x1fP\x1fP\x1f\xc5\x03\x13\x03P\x1f\xa5\x03\x13\x03R\x1fR\x1fR\x1f\xc5\x03'
+  b'\x13\x03\x00\x03R\x1f\xa5\x03\x13\x03\x00\x03T\x1fT\x1fT\x1f\xc5\x03\x13\x03\x01\x03T\x1f\xa5\x03\x13\x03\x01\x03V\x1fV\x1fV\x1f\xc5\x03\x13\x03B\x03V\x1f\xa5\x03\x13\x03B\x03\x80\x1f\x80\x1f\x80\x1f\x00\x1f\xb9\x03\x88\x1f'
+  b'\x08\x1f\x99\x03\x88\x1f\x88\x1f\x81\x1f\x81\x1f\x81\x1f\x01\x1f\xb9\x03\x89\x1f\t\x1f\x99\x03\x89\x1f\x89\x1f\x82\x1f\x82\x1f\x82\x1f\x02\x1f\xb9\x03\x8a\x1f\n\x1f\x99\x03\x8a\x1f\x8a\x1f\x83\x1f\x83\x1f\x83\x1f\x03\x1f\xb9\x03\x8b\x1f\x0b\x1f\x99\x03'
+  b'\x8b\x1f\x8b\x1f\x84\x1f\x84\x1f\x84\x1f\x04\x1f\xb9\x03\x8c\x1f\x0c\x1f\x99\x03\x8c\x1f\x8c\x1f\x85\x1f\x85\x1f\x85\x1f\x05\x1f\xb9\x03\x8d\x1f\r\x1f\x99\x03\x8d\x1f\x8d\x1f\x86\x1f\x86\x1f\x86\x1f\x06\x1f\xb9\x03\x8e\x1f\x0e\x1f\x99\x03\x8e\x1f\x8e\x1f'
+  b'\x87\x1f\x87\x1f\x87\x1f\x07\x1f\xb9\x03\x8f\x1f\x0f\x1f\x99\x03\x8f\x1f\x8f\x1f\x80\x1f\x80\x1f\x80\x1f\x00\x1f\xb9\x03\x88\x1f\x08\x1f\x99\x03\x88\x1f\x88\x1f\x81\x1f\x81\x1f\x81\x1f\x01\x1f\xb9\x03\x89\x1f\t\x1f\x99\x03\x89\x1f\x89\x1f\x82\x1f\x82\x1f'
+  b'\x82\x1f\x02\x1f\xb9\x03\x8a\x1f\n\x1f\x99\x03\x8a\x1f\x8a\x1f\x83\x1f\x83\x1f\x83\x1f\x03\x1f\xb9\x03\x8b\x1f\x0b\x1f\x99\x03\x8b\x1f\x8b\x1f\x84\x1f\x84\x1f\x84\x1f\x04\x1f\xb9\x03\x8c\x1f\x0c\x1f\x99\x03\x8c\x1f\x8c\x1f\x85\x1f\x85\x1f\x85\x1f\x05\x1f'
+  b'\xb9\x03\x8d\x1f\r\x1f\x99\x03\x8d\x1f\x8d\x1f\x86\x1f\x86\x1f\x86\x1f\x06\x1f\xb9\x03\x8e\x1f\x0e\x1f\x99\x03\x8e\x1f\x8e\x1f\x87\x1f\x87\x1f\x87\x1f\x07\x1f\xb9\x03\x8f\x1f\x0f\x1f\x99\x03\x8f\x1f\x8f\x1f\x90\x1f\x90\x1f\x90\x1f \x1f\xb9\x03\x98\x1f'
+  b'(\x1f\x99\x03\x98\x1f\x98\x1f\x91\x1f\x91\x1f\x91\x1f!\x1f\xb9\x03\x99\x1f)\x1f\x99\x03\x99\x1f\x99\x1f\x92\x1f\x92\x1f\x92\x1f"\x1f\xb9\x03\x9a\x1f*\x1f\x99\x03\x9a\x1f\x9a\x1f\x93\x1f\x93\x1f\x93\x1f#\x1f\xb9\x03\x9b\x1f+\x1f\x99\x03'
+  b'\x9b\x1f\x9b\x1f\x94\x1f\x94\x1f\x94\x1f$\x1f\xb9\x03\x9c\x1f,\x1f\x99\x03\x9c\x1f\x9c\x1f\x95\x1f\x95\x1f\x95\x1f%\x1f\xb9\x03\x9d\x1f-\x1f\x99\x03\x9d\x1f\x9d\x1f\x96\x1f\x96\x1f\x96\x1f&\x1f\xb9\x03\x9e\x1f.\x1f\x99\x03\x9e\x1f\x9e\x1f'
+  b"\x97\x1f\x97\x1f\x97\x1f'\x1f\xb9\x03\x9f\x1f/\x1f\x99\x03\x9f\x1f\x9f\x1f\x90\x1f\x90\x1f\x90\x1f \x1f\xb9\x03\x98\x1f(\x1f\x99\x03\x98\x1f\x98\x1f\x91\x1f\x91\x1f\x91\x1f!\x1f\xb9\x03\x99\x1f)\x1f\x99\x03\x99\x1f\x99\x1f\x92\x1f\x92\x1f"
+  b'\x92\x1f"\x1f\xb9\x03\x9a\x1f*\x1f\x99\x03\x9a\x1f\x9a\x1f\x93\x1f\x93\x1f\x93\x1f#\x1f\xb9\x03\x9b\x1f+\x1f\x99\x03\x9b\x1f\x9b\x1f\x94\x1f\x94\x1f\x94\x1f$\x1f\xb9\x03\x9c\x1f,\x1f\x99\x03\x9c\x1f\x9c\x1f\x95\x1f\x95\x1f\x95\x1f%\x1f'
+  b"\xb9\x03\x9d\x1f-\x1f\x99\x03\x9d\x1f\x9d\x1f\x96\x1f\x96\x1f\x96\x1f&\x1f\xb9\x03\x9e\x1f.\x1f\x99\x03\x9e\x1f\x9e\x1f\x97\x1f\x97\x1f\x97\x1f'\x1f\xb9\x03\x9f\x1f/\x1f\x99\x03\x9f\x1f\x9f\x1f\xa0\x1f\xa0\x1f\xa0\x1f`\x1f\xb9\x03\xa8\x1f"
+  b'h\x1f\x99\x03\xa8\x1f\xa8\x1f\xa1\x1f\xa1\x1f\xa1\x1fa\x1f\xb9\x03\xa9\x1fi\x1f\x99\x03\xa9\x1f\xa9\x1f\xa2\x1f\xa2\x1f\xa2\x1fb\x1f\xb9\x03\xaa\x1fj\x1f\x99\x03\xaa\x1f\xaa\x1f\xa3\x1f\xa3\x1f\xa3\x1fc\x1f\xb9\x03\xab\x1fk\x1f\x99\x03'
+  b'\xab\x1f\xab\x1f\xa4\x1f\xa4\x1f\xa4\x1fd\x1f\xb9\x03\xac\x1fl\x1f\x99\x03\xac\x1f\xac\x1f\xa5\x1f\xa5\x1f\xa5\x1fe\x1f\xb9\x03\xad\x1fm\x1f\x99\x03\xad\x1f\xad\x1f\xa6\x1f\xa6\x1f\xa6\x1ff\x1f\xb9\x03\xae\x1fn\x1f\x99\x03\xae\x1f\xae\x1f'
+  b'\xa7\x1f\xa7\x1f\xa7\x1fg\x1f\xb9\x03\xaf\x1fo\x1f\x99\x03\xaf\x1f\xaf\x1f\xa0\x1f\xa0\x1f\xa0\x1f`\x1f\xb9\x03\xa8\x1fh\x1f\x99\x03\xa8\x1f\xa8\x1f\xa1\x1f\xa1\x1f\xa1\x1fa\x1f\xb9\x03\xa9\x1fi\x1f\x99\x03\xa9\x1f\xa9\x1f\xa2\x1f\xa2\x1f'
+  b'\xa2\x1fb\x1f\xb9\x03\xaa\x1fj\x1f\x99\x03\xaa\x1f\xaa\x1f\xa3\x1f\xa3\x1f\xa3\x1fc\x1f\xb9\x03\xab\x1fk\x1f\x99\x03\xab\x1f\xab\x1f\xa4\x1f\xa4\x1f\xa4\x1fd\x1f\xb9\x03\xac\x1fl\x1f\x99\x03\xac\x1f\xac\x1f\xa5\x1f\xa5\x1f\xa5\x1fe\x1f'
+  b'\xb9\x03\xad\x1fm\x1f\x99\x03\xad\x1f\xad\x1f\xa6\x1f\xa6\x1f\xa6\x1ff\x1f\xb9\x03\xae\x1fn\x1f\x99\x03\xae\x1f\xae\x1f\xa7\x1f\xa7\x1f\xa7\x1fg\x1f\xb9\x03\xaf\x1fo\x1f\x99\x03\xaf\x1f\xaf\x1f\xb2\x1f\xb2\x1f\xb2\x1fp\x1f\xb9\x03\xb2\x1f'
+  b'\xba\x1f\x99\x03\xb2\x1f\xba\x1fE\x03\xb3\x1f\xb3\x1f\xb3\x1f\xb1\x03\xb9\x03\xbc\x1f\x91\x03\x99\x03\xbc\x1f\xbc\x1f\xb4\x1f\xb4\x1f\xb4\x1f\xac\x03\xb9\x03\xb4\x1f\x86\x03\x99\x03\xb4\x1f\x86\x03E\x03\xb6\x1f\xb6\x1f\xb6\x1f\xb1\x03B\x03\xb6\x1f'
+  b'\x91\x03B\x03\xb7\x1f\xb7\x1f\xb7\x1f\xb1\x03B\x03\xb9\x03\xb7\x1f\x91\x03B\x03\x99\x03\xb7\x1f\x91\x03B\x03E\x03\xb3\x1f\xb3\x1f\xb3\x1f\xb1\x03\xb9\x03\xbc\x1f\x91\x03\x99\x03\xbc\x1f\xbc\x1f\xbe\x1f\xbe\x1f\xb9\x03\xb9\x03\x99\x03\x99\x03'
+  b'\xc2\x1f\xc2\x1f\xc2\x1ft\x1f\xb9\x03\xc2\x1f\xca\x1f\x99\x03\xc2\x1f\xca\x1fE\x03\xc3\x1f\xc3\x1f\xc3\x1f\xb7\x03\xb9\x03\xcc\x1f\x97\x03\x99\x03\xcc\x1f\xcc\x1f\xc4\x1f\xc4\x1f\xc4\x1f\xae\x03\xb9\x03\xc4\x1f\x89\x03\x99\x03\xc4\x1f\x89\x03E\x03'
+  b'\xc6\x1f\xc6\x1f\xc6\x1f\xb7\x03B\x03\xc6\x1f\x97\x03B\x03\xc7\x1f\xc7\x1f\xc7\x1f\xb7\x03B\x03\xb9\x03\xc7\x1f\x97\x03B\x03\x99\x03\xc7\x1f\x97\x03B\x03E\x03\xc3\x1f\xc3\x1f\xc3\x1f\xb7\x03\xb9\x03\xcc\x1f\x97\x03\x99\x03\xcc\x1f\xcc\x1f'
+  b'\xd2\x1f\xd2\x1f\xd2\x1f\xb9\x03\x08\x03\x00\x03\xd2\x1f\x99\x03\x08\x03\x00\x03\xd3\x1f\xd3\x1f\xd3\x1f\xb9\x03\x08\x03\x01\x03\xd3\x1f\x99\x03\x08\x03\x01\x03\xd6\x1f\xd6\x1f\xd6\x1f\xb9\x03B\x03\xd6\x1f\x99\x03B\x03\xd7\x1f\xd7\x1f\xd7\x1f\xb9\x03'
+  b'\x08\x03B\x03\xd7\x1f\x99\x03\x08\x03B\x03\xe2\x1f\xe2\x1f\xe2\x1f\xc5\x03\x08\x03\x00\x03\xe2\x1f\xa5\x03\x08\x03\x00\x03\xe3\x1f\xe3\x1f\xe3\x1f\xc5\x03\x08\x03\x01\x03\xe3\x1f\xa5\x03\x08\x03\x01\x03\xe4\x1f\xe4\x1f\xe4\x1f\xc1\x03\x13\x03\xe4\x1f'
+  b'\xa1\x03\x13\x03\xe6\x1f\xe6\x1f\xe6\x1f\xc5\x03B\x03\xe6\x1f\xa5\x03B\x03\xe7\x1f\xe7\x1f\xe7\x1f\xc5\x03\x08\x03B\x03\xe7\x1f\xa5\x03\x08\x03B\x03\xf2\x1f\xf2\x1f\xf2\x1f|\x1f\xb9\x03\xf2\x1f\xfa\x1f\x99\x03\xf2\x1f\xfa\x1fE\x03\xf3\x1f'
+  b'\xf3\x1f\xf3\x1f\xc9\x03\xb9\x03\xfc\x1f\xa9\x03\x99\x03\xfc\x1f\xfc\x1f\xf4\x1f\xf4\x1f\xf4\x1f\xce\x03\xb9\x03\xf4\x1f\x8f\x03\x99\x03\xf4\x1f\x8f\x03E\x03\xf6\x1f\xf6\x1f\xf6\x1f\xc9\x03B\x03\xf6\x1f\xa9\x03B\x03\xf7\x1f\xf7\x1f\xf7\x1f\xc9\x03'
+  b'B\x03\xb9\x03\xf7\x1f\xa9\x03B\x03\x99\x03\xf7\x1f\xa9\x03B\x03E\x03\xf3\x1f\xf3\x1f\xf3\x1f\xc9\x03\xb9\x03\xfc\x1f\xa9\x03\x99\x03\xfc\x1f\xfc\x1fp\xabp\xab\xa0\x13\xa0\x13\xa0\x13\xa0\x13q\xabq\xab\xa1\x13\xa1\x13\xa1\x13\xa1\x13'
+  b'r\xabr\xab\xa2\x13\xa2\x13\xa2\x13\xa2\x13s\xabs\xab\xa3\x13\xa3\x13\xa3\x13\xa3\x13t\xabt\xab\xa4\x13\xa4\x13\xa4\x13\xa4\x13u\xabu\xab\xa5\x13\xa5\x13\xa5\x13\xa5\x13v\xabv\xab\xa6\x13\xa6\x13\xa6\x13\xa6\x13w\xabw\xab'
+  b'\xa7\x13\xa7\x13\xa7\x13\xa7\x13x\xabx\xab\xa8\x13\xa8\x13\xa8\x13\xa8\x13y\xaby\xab\xa9\x13\xa9\x13\xa9\x13\xa9\x13z\xabz\xab\xaa\x13\xaa\x13\xaa\x13\xaa\x13{\xab{\xab\xab\x13\xab\x13\xab\x13\xab\x13|\xab|\xab\xac\x13\xac\x13'
+  b'\xac\x13\xac\x13}\xab}\xab\xad\x13\xad\x13\xad\x13\xad\x13~\xab~\xab\xae\x13\xae\x13\xae\x13\xae\x13\x7f\xab\x7f\xab\xaf\x13\xaf\x13\xaf\x13\xaf\x13\x80\xab\x80\xab\xb0\x13\xb0\x13\xb0\x13\xb0\x13\x81\xab\x81\xab\xb1\x13\xb1\x13\xb1\x13\xb1\x13'
+  b'\x82\xab\x82\xab\xb2\x13\xb2\x13\xb2\x13\xb2\x13\x83\xab\x83\xab\xb3\x13\xb3\x13\xb3\x13\xb3\x13\x84\xab\x84\xab\xb4\x13\xb4\x13\xb4\x13\xb4\x13\x85\xab\x85\xab\xb5\x13\xb5\x13\xb5\x13\xb5\x13\x86\xab\x86\xab\xb6\x13\xb6\x13\xb6\x13\xb6\x13\x87\xab\x87\xab'
+  b'\xb7\x13\xb7\x13\xb7\x13\xb7\x13\x88\xab\x88\xab\xb8\x13\xb8\x13\xb8\x13\xb8\x13\x89\xab\x89\xab\xb9\x13\xb9\x13\xb9\x13\xb9\x13\x8a\xab\x8a\xab\xba\x13\xba\x13\xba\x13\xba\x13\x8b\xab\x8b\xab\xbb\x13\xbb\x13\xbb\x13\xbb\x13\x8c\xab\x8c\xab\xbc\x13\xbc\x13'
+  b'\xbc\x13\xbc\x13\x8d\xab\x8d\xab\xbd\x13\xbd\x13\xbd\x13\xbd\x13\x8e\xab\x8e\xab\xbe\x13\xbe\x13\xbe\x13\xbe\x13\x8f\xab\x8f\xab\xbf\x13\xbf\x13\xbf\x13\xbf\x13\x90\xab\x90\xab\xc0\x13\xc0\x13\xc0\x13\xc0\x13\x91\xab\x91\xab\xc1\x13\xc1\x13\xc1\x13\xc1\x13'
+  b'\x92\xab\x92\xab\xc2\x13\xc2\x13\xc2\x13\xc2\x13\x93\xab\x93\xab\xc3\x13\xc3\x13\xc3\x13\xc3\x13\x94\xab\x94\xab\xc4\x13\xc4\x13\xc4\x13\xc4\x13\x95\xab\x95\xab\xc5\x13\xc5\x13\xc5\x13\xc5\x13\x96\xab\x96\xab\xc6\x13\xc6\x13\xc6\x13\xc6\x13\x97\xab\x97\xab'
+  b'\xc7\x13\xc7\x13\xc7\x13\xc7\x13\x98\xab\x98\xab\xc8\x13\xc8\x13\xc8\x13\xc8\x13\x99\xab\x99\xab\xc9\x13\xc9\x13\xc9\x13\xc9\x13\x9a\xab\x9a\xab\xca\x13\xca\x13\xca\x13\xca\x13\x9b\xab\x9b\xab\xcb\x13\xcb\x13\xcb\x13\xcb\x13\x9c\xab\x9c\xab\xcc\x13\xcc\x13'
+  b'\xcc\x13\xcc\x13\x9d\xab\x9d\xab\xcd\x13\xcd\x13\xcd\x13\xcd\x13\x9e\xab\x9e\xab\xce\x13\xce\x13\xce\x13\xce\x13\x9f\xab\x9f\xab\xcf\x13\xcf\x13\xcf\x13\xcf\x13\xa0\xab\xa0\xab\xd0\x13\xd0\x13\xd0\x13\xd0\x13\xa1\xab\xa1\xab\xd1\x13\xd1\x13\xd1\x13\xd1\x13'
+  b'\xa2\xab\xa2\xab\xd2\x13\xd2\x13\xd2\x13\xd2\x13\xa3\xab\xa3\xab\xd3\x13\xd3\x13\xd3\x13\xd3\x13\xa4\xab\xa4\xab\xd4\x13\xd4\x13\xd4\x13\xd4\x13\xa5\xab\xa5\xab\xd5\x13\xd5\x13\xd5\x13\xd5\x13\xa6\xab\xa6\xab\xd6\x13\xd6\x13\xd6\x13\xd6\x13\xa7\xab\xa7\xab'
+  b'\xd7\x13\xd7\x13\xd7\x13\xd7\x13\xa8\xab\xa8\xab\xd8\x13\xd8\x13\xd8\x13\xd8\x13\xa9\xab\xa9\xab\xd9\x13\xd9\x13\xd9\x13\xd9\x13\xaa\xab\xaa\xab\xda\x13\xda\x13\xda\x13\xda\x13\xab\xab\xab\xab\xdb\x13\xdb\x13\xdb\x13\xdb\x13\xac\xab\xac\xab\xdc\x13\xdc\x13'
+  b'\xdc\x13\xdc\x13\xad\xab\xad\xab\xdd\x13\xdd\x13\xdd\x13\xdd\x13\xae\xab\xae\xab\xde\x13\xde\x13\xde\x13\xde\x13\xaf\xab\xaf\xab\xdf\x13\xdf\x13\xdf\x13\xdf\x13\xb0\xab\xb0\xab\xe0\x13\xe0\x13\xe0\x13\xe0\x13\xb1\xab\xb1\xab\xe1\x13\xe1\x13\xe1\x13\xe1\x13'
+  b'\xb2\xab\xb2\xab\xe2\x13\xe2\x13\xe2\x13\xe2\x13\xb3\xab\xb3\xab\xe3\x13\xe3\x13\xe3\x13\xe3\x13\xb4\xab\xb4\xab\xe4\x13\xe4\x13\xe4\x13\xe4\x13\xb5\xab\xb5\xab\xe5\x13\xe5\x13\xe5\x13\xe5\x13\xb6\xab\xb6\xab\xe6\x13\xe6\x13\xe6\x13\xe6\x13\xb7\xab\xb7\xab'
+  b'\xe7\x13\xe7\x13\xe7\x13\xe7\x13\xb8\xab\xb8\xab\xe8\x13\xe8\x13\xe8\x13\xe8\x13\xb9\xab\xb9\xab\xe9\x13\xe9\x13\xe9\x13\xe9\x13\xba\xab\xba\xab\xea\x13\xea\x13\xea\x13\xea\x13\xbb\xab\xbb\xab\xeb\x13\xeb\x13\xeb\x13\xeb\x13\xbc\xab\xbc\xab\xec\x13\xec\x13'
+  b'\xec\x13\xec\x13\xbd\xab\xbd\xab\xed\x13\xed\x13\xed\x13\xed\x13\xbe\xab\xbe\xab\xee\x13\xee\x13\xee\x13\xee\x13\xbf\xab\xbf\xab\xef\x13\xef\x13\xef\x13\xef\x13\x00\xfb\x00\xfb\x00\xfbf\x00f\x00\x00\xfbF\x00F\x00\x00\xfbF\x00f\x00\x01\xfb'
+  b'\x01\xfb\x01\xfbf\x00i\x00\x01\xfbF\x00I\x00\x01\xfbF\x00i\x00\x02\xfb\x02\xfb\x02\xfbf\x00l\x00\x02\xfbF\x00L\x00\x02\xfbF\x00l\x00\x03\xfb\x03\xfb\x03\xfbf\x00f\x00i\x00\x03\xfbF\x00F\x00I\x00\x03\xfb'
+  b'F\x00f\x00i\x00\x04\xfb\x04\xfb\x04\xfbf\x00f\x00l\x00\x04\xfbF\x00F\x00L\x00\x04\xfbF\x00f\x00l\x00\x05\xfb\x05\xfb\x05\xfbs\x00t\x00\x05\xfbS\x00T\x00\x05\xfbS\x00t\x00\x06\xfb\x06\xfb\x06\xfbs\x00'
+  b't\x00\x06\xfbS\x00T\x00\x06\xfbS\x00t\x00\x13\xfb\x13\xfb\x13\xfbt\x05v\x05\x13\xfbD\x05F\x05\x13\xfbD\x05v\x05\x14\xfb\x14\xfb\x14\xfbt\x05e\x05\x14\xfbD\x055\x05\x14\xfbD\x05e\x05\x15\xfb\x15\xfb\x15\xfb'
+  b't\x05k\x05\x15\xfbD\x05;\x05\x15\xfbD\x05k\x05\x16\xfb\x16\xfb\x16\xfb~\x05v\x05\x16\xfbN\x05F\x05\x16\xfbN\x05v\x05\x17\xfb\x17\xfb\x17\xfbt\x05m\x05\x17\xfbD\x05=\x05\x17\xfbD\x05m\x05'
+))
+if byteorder == "big":  # pragma: no cover
+  extended_case.byteswap()
+
+whitespace = array('H', (
+  b'\t\x00\n\x00\x0b\x00\x0c\x00\r\x00\x1c\x00\x1d\x00\x1e\x00\x1f\x00 \x00\x85\x00\xa0\x00\x80\x16\x00 \x01 \x02 \x03 \x04 \x05 \x06 \x07 \x08 \t \n ( ) / _ \x000'
+))
+if byteorder == "big":  # pragma: no cover
+  whitespace.byteswap()
+
+linebreaks = array('H', (
+  b'\n\x00\x0b\x00\x0c\x00\r\x00\x1c\x00\x1d\x00\x1e\x00\x85\x00( ) '
+))
+if byteorder == "big":  # pragma: no cover
+  linebreaks.byteswap()
+
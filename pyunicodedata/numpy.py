@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+#
+#  numpy.py
+"""
+Vectorised character property lookups for arrays of code points.
+
+This module requires NumPy, which can be installed with ``pip install pyunicodedata[numpy]``.
+It is not imported by :mod:`pyunicodedata` itself.
+
+The functions accept anything :func:`numpy.asarray` can convert to an integer array,
+such as the output of :func:`~.codepoints`:
+
+.. code-block:: python
+
+	>>> from pyunicodedata.numpy import codepoints, decimal
+	>>> decimal(codepoints("v1.2"))
+	array([-1,  1, -1,  2], dtype=int32)
+
+Code points outside ``range(0x110000)`` have no properties.
+"""
+#
+#  Copyright © 2021 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#  Licensed under the Python Software Foundation License Version 2.
+#
+#  See the LICENSE file for details.
+#
+
+# 3rd party
+import numpy
+
+# this package
+from pyunicodedata import _c_unicodedata
+
+__all__ = [
+		"codepoints",
+		"record_index",
+		"decimal",
+		"digit",
+		"numeric",
+		"isalpha",
+		"iscased",
+		"iscaseignorable",
+		"isdecimal",
+		"isdigit",
+		"islinebreak",
+		"islower",
+		"isnumeric",
+		"isprintable",
+		"isspace",
+		"istitle",
+		"isupper",
+		"isxidcontinue",
+		"isxidstart",
+		]
+
+# The tables of the default version of Unicode.
+_database = _c_unicodedata.database()
+
+#: The number of low bits of a code point used to index into :data:`~.index2`.
+SHIFT: int = _database.SHIFT
+
+#: The first level of the type record index, indexed by ``code >> SHIFT``.
+index1: numpy.ndarray = numpy.asarray(_database.index1)
+
+#: The second level of the type record index.
+index2: numpy.ndarray = numpy.asarray(_database.index2)
+
+# The columns of the type records.
+upper: numpy.ndarray = numpy.asarray(_database.record_upper)
+lower: numpy.ndarray = numpy.asarray(_database.record_lower)
+title: numpy.ndarray = numpy.asarray(_database.record_title)
+decimal_values: numpy.ndarray = numpy.asarray(_database.record_decimal)
+digit_values: numpy.ndarray = numpy.asarray(_database.record_digit)
+flags: numpy.ndarray = numpy.asarray(_database.record_flags)
+numeric_indices: numpy.ndarray = numpy.asarray(_database.record_numeric)
+
+#: The distinct numeric values, indexed by ``numeric_indices``.
+numeric_values: numpy.ndarray = numpy.asarray(_database.numeric_values)
+
+
+def codepoints(s: str) -> numpy.ndarray:
+	"""
+	Returns the code points of ``s`` as an array of :class:`numpy.uint32`.
+
+	Lone surrogates are included, as they are by the other functions of :mod:`pyunicodedata`.
+
+	:param s:
+	"""
+
+	return numpy.frombuffer(s.encode("utf-32-le", "surrogatepass"), "<u4")
+
+
+def record_index(codes) -> numpy.ndarray:
+	"""
+	Returns the index of the type record for each code point.
+
+	:param codes: An array of code points.
+	"""
+
+	codes = numpy.asarray(codes, dtype=numpy.int64)
+	valid = (codes >= 0) & (codes < 0x110000)
+	codes = numpy.where(valid, codes, 0)
+
+	index = index1[codes >> SHIFT].astype(numpy.int64)
+	index = index2[(index << SHIFT) + (codes & ((1 << SHIFT) - 1))]
+
+	return numpy.where(valid, index, 0)
+
+
+def _value(codes, column: numpy.ndarray, mask: int, default) -> numpy.ndarray:
+	index = record_index(codes)
+	return numpy.where(flags[index] & mask, column[index].astype(numpy.int32), default)
+
+
+def decimal(codes, default: int = -1) -> numpy.ndarray:
+	"""
+	Returns the decimal value of each code point, or ``default`` where there is no such value.
+
+	:param codes: An array of code points.
+	:param default:
+	"""
+
+	return _value(codes, decimal_values, _c_unicodedata.DECIMAL_MASK, default)
+
+
+def digit(codes, default: int = -1) -> numpy.ndarray:
+	"""
+	Returns the digit value of each code point, or ``default`` where there is no such value.
+
+	:param codes: An array of code points.
+	:param default:
+	"""
+
+	return _value(codes, digit_values, _c_unicodedata.DIGIT_MASK, default)
+
+
+def numeric(codes, default: float = -1.0) -> numpy.ndarray:
+	"""
+	Returns the numeric value of each code point as a float, or ``default`` where there is no such value.
+
+	:param codes: An array of code points.
+	:param default:
+	"""
+
+	index = record_index(codes)
+	values = numeric_values[numeric_indices[index]]
+	return numpy.where(flags[index] & _c_unicodedata.NUMERIC_MASK, values, default)
+
+
+def _predicate(name: str, bitmap, description: str):
+	bitmap = numpy.asarray(bitmap).view(numpy.bool_)
+
+	def predicate(codes) -> numpy.ndarray:
+		return bitmap[record_index(codes)]
+
+	predicate.__name__ = predicate.__qualname__ = name
+	predicate.__doc__ = f"""
+	Returns a boolean array which is :py:obj:`True` for code points {description}.
+
+	:param codes: An array of code points.
+	"""
+
+	return predicate
+
+
+isalpha = _predicate("isalpha", _database.record_is_alpha, "which are alphabetic")
+iscased = _predicate("iscased", _database.record_is_cased, "having the Cased property")
+iscaseignorable = _predicate(
+		"iscaseignorable",
+		_database.record_is_case_ignorable,
+		"having the Case_Ignorable property",
+		)
+isdecimal = _predicate("isdecimal", _database.record_is_decimal, "having a decimal value")
+isdigit = _predicate("isdigit", _database.record_is_digit, "having a digit value")
+islinebreak = _predicate("islinebreak", _database.record_is_linebreak, "which are line breaks")
+islower = _predicate("islower", _database.record_is_lower, "which are lowercase")
+isnumeric = _predicate("isnumeric", _database.record_is_numeric, "having a numeric value")
+isprintable = _predicate("isprintable", _database.record_is_printable, "which are printable")
+isspace = _predicate("isspace", _database.record_is_space, "which are whitespace")
+istitle = _predicate("istitle", _database.record_is_title, "which are titlecase")
+isupper = _predicate("isupper", _database.record_is_upper, "which are uppercase")
+isxidcontinue = _predicate("isxidcontinue", _database.record_is_xid_continue, "having the XID_Continue property")
+isxidstart = _predicate("isxidstart", _database.record_is_xid_start, "having the XID_Start property")
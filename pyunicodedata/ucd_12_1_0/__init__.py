@@ -0,0 +1,3 @@
+"""
+Tables for version 12.1.0 of Unicode, generated by /tmp/regen/regen_extra.py.
+"""
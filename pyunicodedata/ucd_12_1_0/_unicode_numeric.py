@@ -0,0 +1,62 @@
+# stdlib
+from array import array
+from sys import byteorder
+
+numeric_values = array('d', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\x00@\x00\x00\x00\x00\x00\x00\x08@\x00\x00\x00\x00\x00\x00\x10@\x00\x00\x00\x00\x00\x00\x14@\x00\x00\x00\x00\x00\x00\x18@\x00\x00\x00\x00\x00\x00\x1c@'
+  b'\x00\x00\x00\x00\x00\x00 @\x00\x00\x00\x00\x00\x00"@\x00\x00\x00\x00\x00\x00\xd0?\x00\x00\x00\x00\x00\x00\xe0?\x00\x00\x00\x00\x00\x00\xe8?\x00\x00\x00\x00\x00\x00\xb0?\x00\x00\x00\x00\x00\x00\xc0?\x00\x00\x00\x00\x00\x00\xc8?'
+  b'\x00\x00\x00\x00\x00\x000@\x00\x00\x00\x00\x00\x00$@\x00\x00\x00\x00\x00\x00Y@\x00\x00\x00\x00\x00@\x8f@\x9a\x99\x99\x99\x99\x99y?\x9a\x99\x99\x99\x99\x99\x99?333333\xa3?\x9a\x99\x99\x99\x99\x99\xa9?'
+  b'\x9a\x99\x99\x99\x99\x99\xb9?333333\xc3?\x9a\x99\x99\x99\x99\x99\xc9?\x00\x00\x00\x00\x00\x00\xf8?\x00\x00\x00\x00\x00\x00\x04@\x00\x00\x00\x00\x00\x00\x0c@\x00\x00\x00\x00\x00\x00\x12@\x00\x00\x00\x00\x00\x00\x16@'
+  b'\x00\x00\x00\x00\x00\x00\x1a@\x00\x00\x00\x00\x00\x00\x1e@\x00\x00\x00\x00\x00\x00!@\x00\x00\x00\x00\x00\x00\xe0\xbf\x00\x00\x00\x00\x00\x004@\x00\x00\x00\x00\x00\x00>@\x00\x00\x00\x00\x00\x00D@\x00\x00\x00\x00\x00\x00I@'
+  b'\x00\x00\x00\x00\x00\x00N@\x00\x00\x00\x00\x00\x80Q@\x00\x00\x00\x00\x00\x00T@\x00\x00\x00\x00\x00\x80V@\x00\x00\x00\x00\x00\x88\xc3@\x00\x00\x00\x00\x00\x001@\x00\x00\x00\x00\x00\x002@\x00\x00\x00\x00\x00\x003@'
+  b'\x92$I\x92$I\xc2?\x1c\xc7q\x1c\xc7q\xbc?UUUUUU\xd5?UUUUUU\xe5?\x9a\x99\x99\x99\x99\x99\xd9?333333\xe3?\x9a\x99\x99\x99\x99\x99\xe9?UUUUUU\xc5?'
+  b'\xab\xaa\xaa\xaa\xaa\xaa\xea?\x00\x00\x00\x00\x00\x00\xd8?\x00\x00\x00\x00\x00\x00\xe4?\x00\x00\x00\x00\x00\x00\xec?\x00\x00\x00\x00\x00\x00&@\x00\x00\x00\x00\x00\x00(@\x00\x00\x00\x00\x00@\x7f@\x00\x00\x00\x00\x00\x88\xb3@'
+  b'\x00\x00\x00\x00\x00j\xe8@\x00\x00\x00\x00\x00j\xf8@\x00\x00\x00\x00\x00\x00*@\x00\x00\x00\x00\x00\x00,@\x00\x00\x00\x00\x00\x00.@\x00\x00\x00\x00\x00\x005@\x00\x00\x00\x00\x00\x006@\x00\x00\x00\x00\x00\x007@'
+  b'\x00\x00\x00\x00\x00\x008@\x00\x00\x00\x00\x00\x009@\x00\x00\x00\x00\x00\x00:@\x00\x00\x00\x00\x00\x00;@\x00\x00\x00\x00\x00\x00<@\x00\x00\x00\x00\x00\x00=@\x00\x00\x00\x00\x00\x00?@\x00\x00\x00\x00\x00\x00@@'
+  b'\x00\x00\x00\x00\x00\x80@@\x00\x00\x00\x00\x00\x00A@\x00\x00\x00\x00\x00\x80A@\x00\x00\x00\x00\x00\x00B@\x00\x00\x00\x00\x00\x80B@\x00\x00\x00\x00\x00\x00C@\x00\x00\x00\x00\x00\x80C@\x00\x00\x00\x00\x00\x80D@'
+  b'\x00\x00\x00\x00\x00\x00E@\x00\x00\x00\x00\x00\x80E@\x00\x00\x00\x00\x00\x00F@\x00\x00\x00\x00\x00\x80F@\x00\x00\x00\x00\x00\x00G@\x00\x00\x00\x00\x00\x80G@\x00\x00\x00\x00\x00\x00H@\x00\x00\x00\x00\x00\x80H@'
+  b'\x00\x00\x00\x00\x84\xd7\x97A\x00\x00\x00\xa2\x94\x1amB\x00\x00\x00\x00\x00\x00i@\x00\x00\x00\x00\x00\xc0r@\x00\x00\x00\x00\x00\x00y@\x00\x00\x00\x00\x00\xc0\x82@\x00\x00\x00\x00\x00\xe0\x85@\x00\x00\x00\x00\x00\x00\x89@'
+  b'\x00\x00\x00\x00\x00 \x8c@\x00\x00\x00\x00\x00@\x9f@\x00\x00\x00\x00\x00p\xa7@\x00\x00\x00\x00\x00@\xaf@\x00\x00\x00\x00\x00p\xb7@\x00\x00\x00\x00\x00X\xbb@\x00\x00\x00\x00\x00@\xbf@\x00\x00\x00\x00\x00\x94\xc1@'
+  b'\x00\x00\x00\x00\x00\x88\xd3@\x00\x00\x00\x00\x00L\xdd@\x00\x00\x00\x00\x00\x88\xe3@\x00\x00\x00\x00\x00L\xed@\x00\x00\x00\x00\x00\x17\xf1@\x00\x00\x00\x00\x00\x88\xf3@\x00\x00\x00\x00\x00\xf9\xf5@UUUUUU\xed?'
+  b'\x00\x00\x00\x00\x00j\x08A\x00\x00\x00\x00\x80O\x12A\x00\x00\x00\x00\x00j\x18A\x00\x00\x00\x00\x80\x84\x1eA\x00\x00\x00\x00\x80O"A\x00\x00\x00\x00\xc0\\%A\x00\x00\x00\x00\x00j(A\x00\x00\x00\x00@w+A'
+  b'UUUUUU\xb5?UUUUUU\xc5?\x00\x00\x00\x00\x00\x00\xd0?UUUUUU\xd5?\xab\xaa\xaa\xaa\xaa\xaa\xda?\x00\x00\x00\x00\x00\x00\xe0?\xab\xaa\xaa\xaa\xaa\xaa\xe2?UUUUUU\xe5?'
+  b'\x00\x00\x00\x00\x00\x00\xe8?\xab\xaa\xaa\xaa\xaa\xaa\xea?\x9a\x99\x99\x99\x99\x99i?\x9a\x99\x99\x99\x99\x99\x89?\x00\x00\x00\x00\x00\x00\x90?\x00\x00\x00\x00\x00\x00\xa0?\x00\x00\x00\x00\x00\x00\xa8?\x00\x00\x00\x00\x00^\nA'
+  b'\x00\x00\x00\x00\x00^\x1aA\x00\x00\x00\x00\x80\x84.A\x00\x00\x00 _\xa0\x02B\x00\x00\x00\x00\xd0\x12cA\x00\x00\x00\x00\xd0\x12sA'
+))
+if byteorder == "big":  # pragma: no cover
+  numeric_values.byteswap()
+
+numeric_numerators = array('q', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\x00\x00\x00\x00\x05\x00\x00\x00\x00\x00\x00\x00\x06\x00\x00\x00\x00\x00\x00\x00\x07\x00\x00\x00\x00\x00\x00\x00'
+  b'\x08\x00\x00\x00\x00\x00\x00\x00\t\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00'
+  b'\x10\x00\x00\x00\x00\x00\x00\x00\n\x00\x00\x00\x00\x00\x00\x00d\x00\x00\x00\x00\x00\x00\x00\xe8\x03\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00'
+  b'\x01\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\x05\x00\x00\x00\x00\x00\x00\x00\x07\x00\x00\x00\x00\x00\x00\x00\t\x00\x00\x00\x00\x00\x00\x00\x0b\x00\x00\x00\x00\x00\x00\x00'
+  b'\r\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x00\x00\x00\x00\x11\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\x14\x00\x00\x00\x00\x00\x00\x00\x1e\x00\x00\x00\x00\x00\x00\x00(\x00\x00\x00\x00\x00\x00\x002\x00\x00\x00\x00\x00\x00\x00'
+  b"<\x00\x00\x00\x00\x00\x00\x00F\x00\x00\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Z\x00\x00\x00\x00\x00\x00\x00\x10'\x00\x00\x00\x00\x00\x00\x11\x00\x00\x00\x00\x00\x00\x00\x12\x00\x00\x00\x00\x00\x00\x00\x13\x00\x00\x00\x00\x00\x00\x00"
+  b'\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00'
+  b'\x05\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\x05\x00\x00\x00\x00\x00\x00\x00\x07\x00\x00\x00\x00\x00\x00\x00\x0b\x00\x00\x00\x00\x00\x00\x00\x0c\x00\x00\x00\x00\x00\x00\x00\xf4\x01\x00\x00\x00\x00\x00\x00\x88\x13\x00\x00\x00\x00\x00\x00'
+  b'P\xc3\x00\x00\x00\x00\x00\x00\xa0\x86\x01\x00\x00\x00\x00\x00\r\x00\x00\x00\x00\x00\x00\x00\x0e\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x00\x00\x00\x00\x15\x00\x00\x00\x00\x00\x00\x00\x16\x00\x00\x00\x00\x00\x00\x00\x17\x00\x00\x00\x00\x00\x00\x00'
+  b'\x18\x00\x00\x00\x00\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x00\x00\x00\x00\x00\x00\x1c\x00\x00\x00\x00\x00\x00\x00\x1d\x00\x00\x00\x00\x00\x00\x00\x1f\x00\x00\x00\x00\x00\x00\x00 \x00\x00\x00\x00\x00\x00\x00'
+  b'!\x00\x00\x00\x00\x00\x00\x00"\x00\x00\x00\x00\x00\x00\x00#\x00\x00\x00\x00\x00\x00\x00$\x00\x00\x00\x00\x00\x00\x00%\x00\x00\x00\x00\x00\x00\x00&\x00\x00\x00\x00\x00\x00\x00\'\x00\x00\x00\x00\x00\x00\x00)\x00\x00\x00\x00\x00\x00\x00'
+  b'*\x00\x00\x00\x00\x00\x00\x00+\x00\x00\x00\x00\x00\x00\x00,\x00\x00\x00\x00\x00\x00\x00-\x00\x00\x00\x00\x00\x00\x00.\x00\x00\x00\x00\x00\x00\x00/\x00\x00\x00\x00\x00\x00\x000\x00\x00\x00\x00\x00\x00\x001\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\xe1\xf5\x05\x00\x00\x00\x00\x00\x10\xa5\xd4\xe8\x00\x00\x00\xc8\x00\x00\x00\x00\x00\x00\x00,\x01\x00\x00\x00\x00\x00\x00\x90\x01\x00\x00\x00\x00\x00\x00X\x02\x00\x00\x00\x00\x00\x00\xbc\x02\x00\x00\x00\x00\x00\x00 \x03\x00\x00\x00\x00\x00\x00'
+  b'\x84\x03\x00\x00\x00\x00\x00\x00\xd0\x07\x00\x00\x00\x00\x00\x00\xb8\x0b\x00\x00\x00\x00\x00\x00\xa0\x0f\x00\x00\x00\x00\x00\x00p\x17\x00\x00\x00\x00\x00\x00X\x1b\x00\x00\x00\x00\x00\x00@\x1f\x00\x00\x00\x00\x00\x00(#\x00\x00\x00\x00\x00\x00'
+  b' N\x00\x00\x00\x00\x00\x000u\x00\x00\x00\x00\x00\x00@\x9c\x00\x00\x00\x00\x00\x00`\xea\x00\x00\x00\x00\x00\x00p\x11\x01\x00\x00\x00\x00\x00\x808\x01\x00\x00\x00\x00\x00\x90_\x01\x00\x00\x00\x00\x00\x0b\x00\x00\x00\x00\x00\x00\x00'
+  b"@\r\x03\x00\x00\x00\x00\x00\xe0\x93\x04\x00\x00\x00\x00\x00\x80\x1a\x06\x00\x00\x00\x00\x00 \xa1\x07\x00\x00\x00\x00\x00\xc0'\t\x00\x00\x00\x00\x00`\xae\n\x00\x00\x00\x00\x00\x005\x0c\x00\x00\x00\x00\x00\xa0\xbb\r\x00\x00\x00\x00\x00"
+  b'\x01\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\x00\x00\x00\x00\x05\x00\x00\x00\x00\x00\x00\x00\x06\x00\x00\x00\x00\x00\x00\x00\x07\x00\x00\x00\x00\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00'
+  b'\t\x00\x00\x00\x00\x00\x00\x00\n\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\xc0K\x03\x00\x00\x00\x00\x00'
+  b'\x80\x97\x06\x00\x00\x00\x00\x00@B\x0f\x00\x00\x00\x00\x00\x00\xe4\x0bT\x02\x00\x00\x00\x80\x96\x98\x00\x00\x00\x00\x00\x00-1\x01\x00\x00\x00\x00'
+))
+if byteorder == "big":  # pragma: no cover
+  numeric_numerators.byteswap()
+
+numeric_denominators = array('H', (
+  b'\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x04\x00\x02\x00\x04\x00\x10\x00\x08\x00\x10\x00\x01\x00\x01\x00\x01\x00\x01\x00\xa0\x00(\x00P\x00\x14\x00\n\x00\x14\x00\x05\x00\x02\x00\x02\x00\x02\x00\x02\x00\x02\x00'
+  b'\x02\x00\x02\x00\x02\x00\x02\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x07\x00\t\x00\x03\x00\x03\x00\x05\x00\x05\x00\x05\x00\x06\x00\x06\x00\x08\x00\x08\x00\x08\x00\x01\x00\x01\x00\x01\x00\x01\x00'
+  b'\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00'
+  b'\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x0c\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00'
+  b'\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00@\x01P\x00@\x00 \x00@\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00'
+))
+if byteorder == "big":  # pragma: no cover
+  numeric_denominators.byteswap()
+
@@ -0,0 +1,4 @@
+# stdlib
+from array import array
+from sys import byteorder
+
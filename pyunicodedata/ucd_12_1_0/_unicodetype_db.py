@@ -0,0 +1,541 @@
+# stdlib
+from array import array
+from sys import byteorder
+
+record_upper = array('i', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x05\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x00\x00\x02y\x00\x00\x00'
+  b'\x00\x00\x00\x00\xff\xff\xff\xff\x15\x00\x00\x01\x18\xff\xff\xff\x1c\x00\x00\x02\x00\x00\x00\x00#\x00\x00\x01\xc3\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00a\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\xa3\x00\x00\x00\x00\x00\x00\x00\x82\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x008\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfe\xff\xff\xff\xb1\xff\xff\xff*\x00\x00\x02'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00?*\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f*\x00\x00\x1c*\x00\x00\x1e*\x00\x00.\xff\xff\xff2\xff\xff\xff3\xff\xff\xff'
+  b'6\xff\xff\xff5\xff\xff\xffO\xa5\x00\x00K\xa5\x00\x001\xff\xff\xff(\xa5\x00\x00D\xa5\x00\x00/\xff\xff\xff-\xff\xff\xff\xf7)\x00\x00A\xa5\x00\x00\xfd)\x00\x00+\xff\xff\xff*\xff\xff\xff\xe7)\x00\x00&\xff\xff\xff'
+  b"C\xa5\x00\x00*\xa5\x00\x00\xbb\xff\xff\xff'\xff\xff\xff\xb9\xff\xff\xff%\xff\xff\xff\x15\xa5\x00\x00\x12\xa5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x001\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+  b'\x00\x00\x00\x009\x00\x00\x03\xda\xff\xff\xff\xdb\xff\xff\xffC\x00\x00\x03K\x00\x00\x01\xc0\xff\xff\xff\xc1\xff\xff\xff\x00\x00\x00\x00Q\x00\x00\x01W\x00\x00\x01\x00\x00\x00\x00]\x00\x00\x01c\x00\x00\x01\xf8\xff\xff\xffi\x00\x00\x01'
+  b'o\x00\x00\x01\x07\x00\x00\x00\x8c\xff\xff\xff\x00\x00\x00\x00u\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\xb0\xff\xff\xff\x00\x00\x00\x00\xf1\xff\xff\xff\x00\x00\x00\x00\xd0\xff\xff\xff|\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x0b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x86\x00\x00\x01\x8c\x00\x00\x01\x92\x00\x00\x01'
+  b'\x98\x00\x00\x01\x9e\x00\x00\x01\xa4\x00\x00\x01\xaa\x00\x00\x01\xb0\x00\x00\x01\xb6\x00\x00\x01\xbc\x00\x00\x01\xc2\x00\x00\x01\xc8\x00\x00\x01\xce\x00\x00\x01\xd4\x00\x00\x01\xda\x00\x00\x01\xe0\x00\x00\x01\xe6\x00\x00\x01\xec\x00\x00\x01\xf2\x00\x00\x01'
+  b'\xf8\x00\x00\x01\xfe\x00\x00\x01\x04\x01\x00\x01\n\x01\x00\x01\x10\x01\x00\x01\x16\x01\x00\x01\x1c\x01\x00\x01"\x01\x00\x01(\x01\x00\x01.\x01\x00\x014\x01\x00\x01:\x01\x00\x01@\x01\x00\x01F\x01\x00\x01L\x01\x00\x01R\x01\x00\x01'
+  b'X\x01\x00\x01^\x01\x00\x01d\x01\x00\x01j\x01\x00\x01p\x01\x00\x01v\x01\x00\x01|\x01\x00\x01\x82\x01\x00\x01\x88\x01\x00\x01\x8e\x01\x00\x01\x94\x01\x00\x01\x9a\x01\x00\x01\xa0\x01\x00\x01\xa6\x01\x00\x01\xac\x01\x00\x01\xb2\x01\x00\x01'
+  b'\xb8\x01\x00\x01\xbe\x01\x00\x01\xc4\x01\x00\x01\xca\x01\x00\x01\xd0\x01\x00\x01\xd6\x01\x00\x01\xdc\x01\x00\x01\xe2\x01\x00\x01\xe8\x01\x00\x01\xee\x01\x00\x01\xf4\x01\x00\x01\xfa\x01\x00\x01\x00\x02\x00\x01\x06\x02\x00\x01\x0c\x02\x00\x01\x12\x02\x00\x01'
+  b'\x18\x02\x00\x01\x1e\x02\x00\x01$\x02\x00\x01*\x02\x00\x010\x02\x00\x016\x02\x00\x01<\x02\x00\x01B\x02\x00\x01H\x02\x00\x01N\x02\x00\x01T\x02\x00\x01Z\x02\x00\x01`\x02\x00\x01f\x02\x00\x01l\x02\x00\x01r\x02\x00\x01'
+  b'x\x02\x00\x01~\x02\x00\x01\x84\x02\x00\x01\x8a\x02\x00\x01\x90\x02\x00\x01\x96\x02\x00\x01\x9c\x02\x00\x01\xa2\x02\x00\x01\xa8\x02\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xae\x02\x00\x01\xb4\x02\x00\x01\xba\x02\x00\x01\xc0\x02\x00\x01\xc6\x02\x00\x01\xcc\x02\x00\x01\xd2\x02\x00\x01\xd8\x02\x00\x01\xde\x02\x00\x01\x00\x00\x00\x00\x04\x8a\x00\x00\xe6\x0e\x00\x008\x8a\x00\x00'
+  b'\xe5\x02\x00\x02\xed\x02\x00\x02\xf5\x02\x00\x02\xfd\x02\x00\x02\x05\x03\x00\x02\x0c\x03\x00\x01\x13\x03\x00\x01\x08\x00\x00\x00\x00\x00\x00\x00\x1a\x03\x00\x02#\x03\x00\x03-\x03\x00\x037\x03\x00\x03J\x00\x00\x00V\x00\x00\x00d\x00\x00\x00'
+  b'\x80\x00\x00\x00p\x00\x00\x00~\x00\x00\x00@\x03\x00\x02J\x03\x00\x02T\x03\x00\x02^\x03\x00\x02h\x03\x00\x02r\x03\x00\x02|\x03\x00\x02\x86\x03\x00\x02\x90\x03\x00\x02\x9a\x03\x00\x02\xa4\x03\x00\x02\xae\x03\x00\x02\xb8\x03\x00\x02'
+  b'\xc2\x03\x00\x02\xcc\x03\x00\x02\xd6\x03\x00\x02\xe0\x03\x00\x02\xea\x03\x00\x02\xf4\x03\x00\x02\xfe\x03\x00\x02\x08\x04\x00\x02\x12\x04\x00\x02\x1c\x04\x00\x02&\x04\x00\x020\x04\x00\x02:\x04\x00\x02D\x04\x00\x02N\x04\x00\x02X\x04\x00\x02'
+  b'b\x04\x00\x02l\x04\x00\x02v\x04\x00\x02\x80\x04\x00\x02\x8a\x04\x00\x02\x94\x04\x00\x02\x9e\x04\x00\x02\xa8\x04\x00\x02\xb2\x04\x00\x02\xbc\x04\x00\x02\xc6\x04\x00\x02\xd0\x04\x00\x02\xda\x04\x00\x02\xe4\x04\x00\x02\xee\x04\x00\x02\xf8\x04\x00\x02'
+  b'\x02\x05\x00\x02\x0c\x05\x00\x02\x16\x05\x00\x02 \x05\x00\x02+\x05\x00\x025\x05\x00\x02@\x05\x00\x02I\x05\x00\x03\x00\x00\x00\x00V\x05\x00\x02_\x05\x00\x01f\x05\x00\x02q\x05\x00\x02{\x05\x00\x02\x86\x05\x00\x02\x8f\x05\x00\x03'
+  b'\x00\x00\x00\x00\x9c\x05\x00\x02\xa7\x05\x00\x03\xb1\x05\x00\x03\xba\x05\x00\x02\xc3\x05\x00\x03\x00\x00\x00\x00\xcd\x05\x00\x03\xd7\x05\x00\x03\xe0\x05\x00\x02\xe8\x05\x00\x02\xf1\x05\x00\x03\x00\x00\x00\x00\xfa\x05\x00\x02\x05\x06\x00\x02\x0f\x06\x00\x02'
+  b'\x1a\x06\x00\x02#\x06\x00\x03\x00\x00\x00\x00\x00\x00\x00\x000\x06\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\xe4\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\xff\xff\xff\xf0\xff\xff\xff'
+  b'\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe6\xff\xff\xff\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\xd5\xd5\xff\xff\xd8\xd5\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa0\xe3\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x000\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00`\xfc\xff\xff9\x06\x00\x01?\x06\x00\x01E\x06\x00\x01K\x06\x00\x01Q\x06\x00\x01W\x06\x00\x01]\x06\x00\x01c\x06\x00\x01i\x06\x00\x01o\x06\x00\x01u\x06\x00\x01{\x06\x00\x01'
+  b'\x81\x06\x00\x01\x87\x06\x00\x01\x8d\x06\x00\x01\x93\x06\x00\x01\x99\x06\x00\x01\x9f\x06\x00\x01\xa5\x06\x00\x01\xab\x06\x00\x01\xb1\x06\x00\x01\xb7\x06\x00\x01\xbd\x06\x00\x01\xc3\x06\x00\x01\xc9\x06\x00\x01\xcf\x06\x00\x01\xd5\x06\x00\x01\xdb\x06\x00\x01'
+  b'\xe1\x06\x00\x01\xe7\x06\x00\x01\xed\x06\x00\x01\xf3\x06\x00\x01\xf9\x06\x00\x01\xff\x06\x00\x01\x05\x07\x00\x01\x0b\x07\x00\x01\x11\x07\x00\x01\x17\x07\x00\x01\x1d\x07\x00\x01#\x07\x00\x01)\x07\x00\x01/\x07\x00\x015\x07\x00\x01;\x07\x00\x01'
+  b'A\x07\x00\x01G\x07\x00\x01M\x07\x00\x01S\x07\x00\x01Y\x07\x00\x01_\x07\x00\x01e\x07\x00\x01k\x07\x00\x01q\x07\x00\x01w\x07\x00\x01}\x07\x00\x01\x83\x07\x00\x01\x89\x07\x00\x01\x8f\x07\x00\x01\x95\x07\x00\x01\x9b\x07\x00\x01'
+  b'\xa1\x07\x00\x01\xa7\x07\x00\x01\xad\x07\x00\x01\xb3\x07\x00\x01\xb9\x07\x00\x01\xbf\x07\x00\x01\xc5\x07\x00\x01\xcb\x07\x00\x01\xd1\x07\x00\x01\xd7\x07\x00\x01\xdd\x07\x00\x01\xe3\x07\x00\x01\xe9\x07\x00\x01\xef\x07\x00\x01\xf5\x07\x00\x01\xfb\x07\x00\x01'
+  b'\x01\x08\x00\x01\x07\x08\x00\x01\r\x08\x00\x01\x13\x08\x00\x01\x1a\x08\x00\x02%\x08\x00\x020\x08\x00\x02<\x08\x00\x03J\x08\x00\x03W\x08\x00\x02b\x08\x00\x02m\x08\x00\x02x\x08\x00\x02\x83\x08\x00\x02\x8e\x08\x00\x02\x99\x08\x00\x02'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\xd8\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xde\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+if byteorder == "big":  # pragma: no cover
+  record_upper.byteswap()
+
+record_lower = array('i', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00 \x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x00 \x01\x00\x00\x00\x00'
+  b'\x01\x00\x00\x00\x00\x00\x00\x00\x12\x00\x00\x02\x00\x00\x00\x00\x17\x00 \x01\x87\xff\xff\xff\x1f\x00\x10\x01\x00\x00\x00\x00\xd2\x00\x00\x00\xce\x00\x00\x00\xcd\x00\x00\x00O\x00\x00\x00\xca\x00\x00\x00\xcb\x00\x00\x00\xcf\x00\x00\x00\x00\x00\x00\x00'
+  b'\xd3\x00\x00\x00\xd1\x00\x00\x00\x00\x00\x00\x00\xd5\x00\x00\x00\x00\x00\x00\x00\xd6\x00\x00\x00\xda\x00\x00\x00\xd9\x00\x00\x00\xdb\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00%\x00 \x01'
+  b'\x9f\xff\xff\xff\xc8\xff\xff\xff~\xff\xff\xff+*\x00\x00]\xff\xff\xff(*\x00\x00\x00\x00\x00\x00=\xff\xff\xffE\x00\x00\x00G\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00-\x00\x10\x01\x00\x00\x00\x00t\x00\x00\x00&\x00\x00\x00%\x00\x00\x00@\x00\x00\x00'
+  b'?\x00\x00\x003\x000\x01\x00\x00\x00\x00\x00\x00\x00\x00=\x000\x01G\x00\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\x08\x00\x00\x00M\x00\x10\x01S\x00\x10\x01\x00\x00\x00\x00Y\x00\x10\x01_\x00\x10\x01\x00\x00\x00\x00e\x00\x10\x01'
+  b'k\x00\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\xc4\xff\xff\xffq\x00\x10\x01\xf9\xff\xff\xffP\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x00\x00\x00\x000\x00\x00\x00\x00\x00\x00\x00w\x00 \x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00`\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x82\x00\x10\x01\x88\x00\x10\x01\x8e\x00\x10\x01'
+  b'\x94\x00\x10\x01\x9a\x00\x10\x01\xa0\x00\x10\x01\xa6\x00\x10\x01\xac\x00\x10\x01\xb2\x00\x10\x01\xb8\x00\x10\x01\xbe\x00\x10\x01\xc4\x00\x10\x01\xca\x00\x10\x01\xd0\x00\x10\x01\xd6\x00\x10\x01\xdc\x00\x10\x01\xe2\x00\x10\x01\xe8\x00\x10\x01\xee\x00\x10\x01'
+  b'\xf4\x00\x10\x01\xfa\x00\x10\x01\x00\x01\x10\x01\x06\x01\x10\x01\x0c\x01\x10\x01\x12\x01\x10\x01\x18\x01\x10\x01\x1e\x01\x10\x01$\x01\x10\x01*\x01\x10\x010\x01\x10\x016\x01\x10\x01<\x01\x10\x01B\x01\x10\x01H\x01\x10\x01N\x01\x10\x01'
+  b'T\x01\x10\x01Z\x01\x10\x01`\x01\x10\x01f\x01\x10\x01l\x01\x10\x01r\x01\x10\x01x\x01\x10\x01~\x01\x10\x01\x84\x01\x10\x01\x8a\x01\x10\x01\x90\x01\x10\x01\x96\x01\x10\x01\x9c\x01\x10\x01\xa2\x01\x10\x01\xa8\x01\x10\x01\xae\x01\x10\x01'
+  b'\xb4\x01\x10\x01\xba\x01\x10\x01\xc0\x01\x10\x01\xc6\x01\x10\x01\xcc\x01\x10\x01\xd2\x01\x10\x01\xd8\x01\x10\x01\xde\x01\x10\x01\xe4\x01\x10\x01\xea\x01\x10\x01\xf0\x01\x10\x01\xf6\x01\x10\x01\xfc\x01\x10\x01\x02\x02\x10\x01\x08\x02\x10\x01\x0e\x02\x10\x01'
+  b'\x14\x02\x10\x01\x1a\x02\x10\x01 \x02\x10\x01&\x02\x10\x01,\x02\x10\x012\x02\x10\x018\x02\x10\x01>\x02\x10\x01D\x02\x10\x01J\x02\x10\x01P\x02\x10\x01V\x02\x10\x01\\\x02\x10\x01b\x02\x10\x01h\x02\x10\x01n\x02\x10\x01'
+  b't\x02\x10\x01z\x02\x10\x01\x80\x02\x10\x01\x86\x02\x10\x01\x8c\x02\x10\x01\x92\x02\x10\x01\x98\x02\x10\x01\x9e\x02\x10\x01\xa4\x02\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaa\x02\x10\x01\xb0\x02\x10\x01\xb6\x02\x10\x01\xbc\x02\x10\x01\xc2\x02\x10\x01\xc8\x02\x10\x01\xce\x02\x10\x01\xd4\x02\x10\x01\xda\x02\x10\x01@\xf4\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b"\xe0\x02 \x01\xe8\x02 \x01\xf0\x02 \x01\xf8\x02 \x01\x00\x03 \x01\x08\x03\x10\x01\x0e\x03 \x01\x00\x00\x00\x00\xf8\xff\xff\xff\x15\x03 \x01\x1d\x030\x01'\x030\x011\x030\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00;\x03 \x01E\x03 \x01O\x03 \x01Y\x03 \x01c\x03 \x01m\x03 \x01w\x03 \x01\x81\x03 \x01\x8b\x03 \x01\x95\x03 \x01\x9f\x03 \x01\xa9\x03 \x01\xb3\x03 \x01'
+  b'\xbd\x03 \x01\xc7\x03 \x01\xd1\x03 \x01\xdb\x03 \x01\xe5\x03 \x01\xef\x03 \x01\xf9\x03 \x01\x03\x04 \x01\r\x04 \x01\x17\x04 \x01!\x04 \x01+\x04 \x015\x04 \x01?\x04 \x01I\x04 \x01S\x04 \x01'
+  b']\x04 \x01g\x04 \x01q\x04 \x01{\x04 \x01\x85\x04 \x01\x8f\x04 \x01\x99\x04 \x01\xa3\x04 \x01\xad\x04 \x01\xb7\x04 \x01\xc1\x04 \x01\xcb\x04 \x01\xd5\x04 \x01\xdf\x04 \x01\xe9\x04 \x01\xf3\x04 \x01'
+  b'\xfd\x04 \x01\x07\x05 \x01\x11\x05 \x01\x1b\x05 \x01&\x05 \x010\x05 \x01;\x05 \x01C\x050\x01\xb6\xff\xff\xffQ\x05 \x01[\x05\x10\x01a\x05 \x01l\x05 \x01v\x05 \x01\x81\x05 \x01\x89\x050\x01'
+  b'\xaa\xff\xff\xff\x97\x05 \x01\xa1\x050\x01\xab\x050\x01\xb5\x05 \x01\xbd\x050\x01\x9c\xff\xff\xff\xc7\x050\x01\xd1\x050\x01\xdb\x05 \x01\xe3\x05 \x01\xeb\x050\x01\x90\xff\xff\xff\xf5\x05 \x01\x00\x06 \x01\n\x06 \x01'
+  b'\x15\x06 \x01\x1d\x060\x01\x80\xff\xff\xff\x82\xff\xff\xff+\x06 \x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa3\xe2\xff\xffA\xdf\xff\xff\xba\xdf\xff\xff'
+  b'\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00'
+  b'\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\t\xd6\xff\xff'
+  b'\x1a\xf1\xff\xff\x19\xd6\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\xe4\xd5\xff\xff\x03\xd6\xff\xff\xe1\xd5\xff\xff\xe2\xd5\xff\xff\xc1\xd5\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfcu\xff\xff\xd8Z\xff\xff\x00\x00\x00\x00\xbcZ\xff\xff\xb1Z\xff\xff\xb5Z\xff\xff\xbfZ\xff\xff\xeeZ\xff\xff\xd6Z\xff\xff\xebZ\xff\xff\xa0\x03\x00\x00'
+  b'\xd0\xff\xff\xff\xbdZ\xff\xff\xc8u\xff\xff\x00\x00\x00\x005\x06\x10\x01;\x06\x10\x01A\x06\x10\x01G\x06\x10\x01M\x06\x10\x01S\x06\x10\x01Y\x06\x10\x01_\x06\x10\x01e\x06\x10\x01k\x06\x10\x01q\x06\x10\x01w\x06\x10\x01'
+  b'}\x06\x10\x01\x83\x06\x10\x01\x89\x06\x10\x01\x8f\x06\x10\x01\x95\x06\x10\x01\x9b\x06\x10\x01\xa1\x06\x10\x01\xa7\x06\x10\x01\xad\x06\x10\x01\xb3\x06\x10\x01\xb9\x06\x10\x01\xbf\x06\x10\x01\xc5\x06\x10\x01\xcb\x06\x10\x01\xd1\x06\x10\x01\xd7\x06\x10\x01'
+  b'\xdd\x06\x10\x01\xe3\x06\x10\x01\xe9\x06\x10\x01\xef\x06\x10\x01\xf5\x06\x10\x01\xfb\x06\x10\x01\x01\x07\x10\x01\x07\x07\x10\x01\r\x07\x10\x01\x13\x07\x10\x01\x19\x07\x10\x01\x1f\x07\x10\x01%\x07\x10\x01+\x07\x10\x011\x07\x10\x017\x07\x10\x01'
+  b'=\x07\x10\x01C\x07\x10\x01I\x07\x10\x01O\x07\x10\x01U\x07\x10\x01[\x07\x10\x01a\x07\x10\x01g\x07\x10\x01m\x07\x10\x01s\x07\x10\x01y\x07\x10\x01\x7f\x07\x10\x01\x85\x07\x10\x01\x8b\x07\x10\x01\x91\x07\x10\x01\x97\x07\x10\x01'
+  b'\x9d\x07\x10\x01\xa3\x07\x10\x01\xa9\x07\x10\x01\xaf\x07\x10\x01\xb5\x07\x10\x01\xbb\x07\x10\x01\xc1\x07\x10\x01\xc7\x07\x10\x01\xcd\x07\x10\x01\xd3\x07\x10\x01\xd9\x07\x10\x01\xdf\x07\x10\x01\xe5\x07\x10\x01\xeb\x07\x10\x01\xf1\x07\x10\x01\xf7\x07\x10\x01'
+  b'\xfd\x07\x10\x01\x03\x08\x10\x01\t\x08\x10\x01\x0f\x08\x10\x01\x15\x08 \x01 \x08 \x01+\x08 \x016\x080\x01D\x080\x01R\x08 \x01]\x08 \x01h\x08 \x01s\x08 \x01~\x08 \x01\x89\x08 \x01\x94\x08 \x01'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00(\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+if byteorder == "big":  # pragma: no cover
+  record_lower.byteswap()
+
+record_title = array('i', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x05\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x02y\x00\x00\x00'
+  b'\x00\x00\x00\x00\xff\xff\xff\xff\x15\x00\x00\x01\x18\xff\xff\xff\x1c\x00\x00\x02\x00\x00\x00\x00#\x00\x00\x01\xc3\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00a\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\xa3\x00\x00\x00\x00\x00\x00\x00\x82\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x008\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xb1\xff\xff\xff*\x00\x00\x02'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00?*\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f*\x00\x00\x1c*\x00\x00\x1e*\x00\x00.\xff\xff\xff2\xff\xff\xff3\xff\xff\xff'
+  b'6\xff\xff\xff5\xff\xff\xffO\xa5\x00\x00K\xa5\x00\x001\xff\xff\xff(\xa5\x00\x00D\xa5\x00\x00/\xff\xff\xff-\xff\xff\xff\xf7)\x00\x00A\xa5\x00\x00\xfd)\x00\x00+\xff\xff\xff*\xff\xff\xff\xe7)\x00\x00&\xff\xff\xff'
+  b"C\xa5\x00\x00*\xa5\x00\x00\xbb\xff\xff\xff'\xff\xff\xff\xb9\xff\xff\xff%\xff\xff\xff\x15\xa5\x00\x00\x12\xa5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x001\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+  b'\x00\x00\x00\x009\x00\x00\x03\xda\xff\xff\xff\xdb\xff\xff\xffC\x00\x00\x03K\x00\x00\x01\xc0\xff\xff\xff\xc1\xff\xff\xff\x00\x00\x00\x00Q\x00\x00\x01W\x00\x00\x01\x00\x00\x00\x00]\x00\x00\x01c\x00\x00\x01\xf8\xff\xff\xffi\x00\x00\x01'
+  b'o\x00\x00\x01\x07\x00\x00\x00\x8c\xff\xff\xff\x00\x00\x00\x00u\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\xb0\xff\xff\xff\x00\x00\x00\x00\xf1\xff\xff\xff\x00\x00\x00\x00\xd0\xff\xff\xff\x7f\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x86\x00\x00\x01\x8c\x00\x00\x01\x92\x00\x00\x01'
+  b'\x98\x00\x00\x01\x9e\x00\x00\x01\xa4\x00\x00\x01\xaa\x00\x00\x01\xb0\x00\x00\x01\xb6\x00\x00\x01\xbc\x00\x00\x01\xc2\x00\x00\x01\xc8\x00\x00\x01\xce\x00\x00\x01\xd4\x00\x00\x01\xda\x00\x00\x01\xe0\x00\x00\x01\xe6\x00\x00\x01\xec\x00\x00\x01\xf2\x00\x00\x01'
+  b'\xf8\x00\x00\x01\xfe\x00\x00\x01\x04\x01\x00\x01\n\x01\x00\x01\x10\x01\x00\x01\x16\x01\x00\x01\x1c\x01\x00\x01"\x01\x00\x01(\x01\x00\x01.\x01\x00\x014\x01\x00\x01:\x01\x00\x01@\x01\x00\x01F\x01\x00\x01L\x01\x00\x01R\x01\x00\x01'
+  b'X\x01\x00\x01^\x01\x00\x01d\x01\x00\x01j\x01\x00\x01p\x01\x00\x01v\x01\x00\x01|\x01\x00\x01\x82\x01\x00\x01\x88\x01\x00\x01\x8e\x01\x00\x01\x94\x01\x00\x01\x9a\x01\x00\x01\xa0\x01\x00\x01\xa6\x01\x00\x01\xac\x01\x00\x01\xb2\x01\x00\x01'
+  b'\xb8\x01\x00\x01\xbe\x01\x00\x01\xc4\x01\x00\x01\xca\x01\x00\x01\xd0\x01\x00\x01\xd6\x01\x00\x01\xdc\x01\x00\x01\xe2\x01\x00\x01\xe8\x01\x00\x01\xee\x01\x00\x01\xf4\x01\x00\x01\xfa\x01\x00\x01\x00\x02\x00\x01\x06\x02\x00\x01\x0c\x02\x00\x01\x12\x02\x00\x01'
+  b'\x18\x02\x00\x01\x1e\x02\x00\x01$\x02\x00\x01*\x02\x00\x010\x02\x00\x016\x02\x00\x01<\x02\x00\x01B\x02\x00\x01H\x02\x00\x01N\x02\x00\x01T\x02\x00\x01Z\x02\x00\x01`\x02\x00\x01f\x02\x00\x01l\x02\x00\x01r\x02\x00\x01'
+  b'x\x02\x00\x01~\x02\x00\x01\x84\x02\x00\x01\x8a\x02\x00\x01\x90\x02\x00\x01\x96\x02\x00\x01\x9c\x02\x00\x01\xa2\x02\x00\x01\xa8\x02\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xae\x02\x00\x01\xb4\x02\x00\x01\xba\x02\x00\x01\xc0\x02\x00\x01\xc6\x02\x00\x01\xcc\x02\x00\x01\xd2\x02\x00\x01\xd8\x02\x00\x01\xde\x02\x00\x01\x00\x00\x00\x00\x04\x8a\x00\x00\xe6\x0e\x00\x008\x8a\x00\x00'
+  b'\xe5\x02\x00\x02\xed\x02\x00\x02\xf5\x02\x00\x02\xfd\x02\x00\x02\x05\x03\x00\x02\x0c\x03\x00\x01\x13\x03\x00\x01\x08\x00\x00\x00\x00\x00\x00\x00\x1a\x03\x00\x02#\x03\x00\x03-\x03\x00\x037\x03\x00\x03J\x00\x00\x00V\x00\x00\x00d\x00\x00\x00'
+  b'\x80\x00\x00\x00p\x00\x00\x00~\x00\x00\x00C\x03\x00\x01M\x03\x00\x01W\x03\x00\x01a\x03\x00\x01k\x03\x00\x01u\x03\x00\x01\x7f\x03\x00\x01\x89\x03\x00\x01\x93\x03\x00\x01\x9d\x03\x00\x01\xa7\x03\x00\x01\xb1\x03\x00\x01\xbb\x03\x00\x01'
+  b'\xc5\x03\x00\x01\xcf\x03\x00\x01\xd9\x03\x00\x01\xe3\x03\x00\x01\xed\x03\x00\x01\xf7\x03\x00\x01\x01\x04\x00\x01\x0b\x04\x00\x01\x15\x04\x00\x01\x1f\x04\x00\x01)\x04\x00\x013\x04\x00\x01=\x04\x00\x01G\x04\x00\x01Q\x04\x00\x01[\x04\x00\x01'
+  b'e\x04\x00\x01o\x04\x00\x01y\x04\x00\x01\x83\x04\x00\x01\x8d\x04\x00\x01\x97\x04\x00\x01\xa1\x04\x00\x01\xab\x04\x00\x01\xb5\x04\x00\x01\xbf\x04\x00\x01\xc9\x04\x00\x01\xd3\x04\x00\x01\xdd\x04\x00\x01\xe7\x04\x00\x01\xf1\x04\x00\x01\xfb\x04\x00\x01'
+  b'\x05\x05\x00\x01\x0f\x05\x00\x01\x19\x05\x00\x01#\x05\x00\x02.\x05\x00\x018\x05\x00\x02@\x05\x00\x02M\x05\x00\x03\x00\x00\x00\x00Y\x05\x00\x01_\x05\x00\x01i\x05\x00\x02t\x05\x00\x01~\x05\x00\x02\x86\x05\x00\x02\x93\x05\x00\x03'
+  b'\x00\x00\x00\x00\x9f\x05\x00\x01\xa7\x05\x00\x03\xb1\x05\x00\x03\xba\x05\x00\x02\xc3\x05\x00\x03\x00\x00\x00\x00\xcd\x05\x00\x03\xd7\x05\x00\x03\xe0\x05\x00\x02\xe8\x05\x00\x02\xf1\x05\x00\x03\x00\x00\x00\x00\xfd\x05\x00\x02\x08\x06\x00\x01\x12\x06\x00\x02'
+  b"\x1a\x06\x00\x02'\x06\x00\x03\x00\x00\x00\x00\x00\x00\x00\x003\x06\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+  b'\x00\x00\x00\x00\xe4\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\xff\xff\xff\xf0\xff\xff\xff'
+  b'\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\xf0\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe6\xff\xff\xff\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\xd5\xd5\xff\xff\xd8\xd5\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa0\xe3\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x000\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00`\xfc\xff\xff9\x06\x00\x01?\x06\x00\x01E\x06\x00\x01K\x06\x00\x01Q\x06\x00\x01W\x06\x00\x01]\x06\x00\x01c\x06\x00\x01i\x06\x00\x01o\x06\x00\x01u\x06\x00\x01{\x06\x00\x01'
+  b'\x81\x06\x00\x01\x87\x06\x00\x01\x8d\x06\x00\x01\x93\x06\x00\x01\x99\x06\x00\x01\x9f\x06\x00\x01\xa5\x06\x00\x01\xab\x06\x00\x01\xb1\x06\x00\x01\xb7\x06\x00\x01\xbd\x06\x00\x01\xc3\x06\x00\x01\xc9\x06\x00\x01\xcf\x06\x00\x01\xd5\x06\x00\x01\xdb\x06\x00\x01'
+  b'\xe1\x06\x00\x01\xe7\x06\x00\x01\xed\x06\x00\x01\xf3\x06\x00\x01\xf9\x06\x00\x01\xff\x06\x00\x01\x05\x07\x00\x01\x0b\x07\x00\x01\x11\x07\x00\x01\x17\x07\x00\x01\x1d\x07\x00\x01#\x07\x00\x01)\x07\x00\x01/\x07\x00\x015\x07\x00\x01;\x07\x00\x01'
+  b'A\x07\x00\x01G\x07\x00\x01M\x07\x00\x01S\x07\x00\x01Y\x07\x00\x01_\x07\x00\x01e\x07\x00\x01k\x07\x00\x01q\x07\x00\x01w\x07\x00\x01}\x07\x00\x01\x83\x07\x00\x01\x89\x07\x00\x01\x8f\x07\x00\x01\x95\x07\x00\x01\x9b\x07\x00\x01'
+  b'\xa1\x07\x00\x01\xa7\x07\x00\x01\xad\x07\x00\x01\xb3\x07\x00\x01\xb9\x07\x00\x01\xbf\x07\x00\x01\xc5\x07\x00\x01\xcb\x07\x00\x01\xd1\x07\x00\x01\xd7\x07\x00\x01\xdd\x07\x00\x01\xe3\x07\x00\x01\xe9\x07\x00\x01\xef\x07\x00\x01\xf5\x07\x00\x01\xfb\x07\x00\x01'
+  b'\x01\x08\x00\x01\x07\x08\x00\x01\r\x08\x00\x01\x13\x08\x00\x01\x1d\x08\x00\x02(\x08\x00\x023\x08\x00\x02@\x08\x00\x03N\x08\x00\x03Z\x08\x00\x02e\x08\x00\x02p\x08\x00\x02{\x08\x00\x02\x86\x08\x00\x02\x91\x08\x00\x02\x9c\x08\x00\x02'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\xd8\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xde\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+if byteorder == "big":  # pragma: no cover
+  record_title.byteswap()
+
+record_decimal = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+
+record_digit = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\x00\x00\x00\x00\x00\x02\x03\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x05\x06\x07\x08\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+
+record_flags = array('H', (
+  b"\x00\x00\x00\x00 \x000\x00 \x04\x00\x04\x00\x14\x06\x0e\x06\x0e\x06\x0e\x06\x0e\x06\x0e\x06\x0e\x06\x0e\x06\x0e\x06\x0e\x06\x0e\x81'\x00\x06\t'\t'\x00\x10\x04\x0c\x04\x0c\tg\x00\x16\x04\x0c\x00\x0c\x00\x0c\x00\x0c\tg\t'"
+  b"\x81'\t'\x81g\t'\tg\x81'\tg\t'\x81'\x81'\x81'\x81'\x81'\x81'\x81'\t'\x81'\x81'\t'\x81'\t'\x81'\x81'\x81'\x81'\x01\x07\t'\x81'A'\t'\t'\tg"
+  b"\x81'\x81'\x81'\x81'\x81'\x81'\t'\x81'\x81'\x81'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'\t'"
+  b"\t'\t'\t'\t'\t'\t'\t'\t'\t7\x01\x17\x08v\t4\x81'\x81'\x81'\x81'\x81'\tg\t'\t'\tg\tg\t'\t'\x81'\tg\tg\x81'\tg\tg\t'\tg"
+  b"\tg\t'\t'\x81'\tg\x81'\x81'\t'\x81'\t'\x81'\t'\tg\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x01\x06"
+  b"\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x81'\t'\x04\x0e\x04\x0e\x04\x0e\x04\x0e\x04\x0e\x04\x0e\x04\x0e\x04\x0e\x04\x0e\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x81g\x81g\x81g"
+  b'\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g'
+  b'\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g'
+  b'\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\x81g\tg\tg\tg\tg\tg\tg\x00\x0f\x00\x0f\x00\x0f\x00\x0c\x00\x0c\x00\x0c\x00\x0c'
+  b"\x00\x0c\x00\x0c\x00\x17\tg\tg\tg\tg\tg\tg\tg\tg\tg\x81'\t'\t'\t'\tg\tg\tg\tg\tg\tg\x81g\t'\x81'\tg\tg\tg\tg\t'\t'\t'"
+  b"\t'\t'\t'\tg\tg\tg\tg\tg\tg\tg\tgAgAgAgAgAgAgAgAg\tg\tg\tg\tg\tg\tg\tg\tgAgAgAgAgAg"
+  b"AgAgAg\tg\tg\tg\tg\tg\tg\tg\tgAgAgAgAgAgAgAgAg\tg\tg\tg\tg\tg\x81'Ag\tg\tg\tg\tg\tg\tg"
+  b"\x81'Ag\tg\tg\tg\tg\x81'\tg\tg\tg\tg\tg\x81'\tg\tg\tg\tg\tg\x81'\x81'Ag\x04\x0c\x04\x0c\x04\x0c\x04\x0c\x04\x0c\x04\x0c\x04\x0c\x00\x07\x81'\x81'\x81'"
+  b"\x81'\t'\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x80/\x80/\x80/\x80/\x80/\x80/\x80/\x80/\x80/\x80/\x80/\x80/\x80/\x80/\x80/\x80/\x08/\x08/"
+  b"\x08/\x08/\x08/\x08/\x08/\x08/\x08/\x08/\x08/\x08/\x08/\x08/\x08/\x08/\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x80$\x08$\x81'"
+  b"\x81'\x81'\t'\t'\x81'\x81'\x81'\x81'\x81'\t'\x01\x14\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c"
+  b'\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f'
+  b"\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x01\x0f\x81'\x81'\t'\x81'\x81'\x81'\x81'\x81'\x81'\x81'\x81'\x81'\x81'\x81'\t'\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg"
+  b'\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg'
+  b'\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg'
+  b'\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\tg\x01\x04\x01\x16\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c'
+  b"\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x81'\t'\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c"
+  b"\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x81'\t'\x00\x0c\x00\x0c\x80$"
+))
+if byteorder == "big":  # pragma: no cover
+  record_flags.byteswap()
+
+record_numeric = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\x00\x00\x00\x00\x00\x02\x03\x00\x00\x01\n\x0b\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\r\x0e\x0f\x10\x11\x12\x13\x00\x01\x02\x03\x14\x15\x16\x17\x18\x19\x1a\x00\x1b\x1c\x1d\x1e\x1f !"#\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t$%&\'()*+,\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00-./\x04\x05\x06\x07\x08\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x05\x06\x07\x08\t\x00\x00\x00\x00\x00\x000123456789:;\x01\x02\x03\x04\x05\x06\x07\x08\t\x11<='\x12>\x13\x01\x02"
+  b"\x03\x04\x05\x06\x07\x08\t\x11<='\x12>\x13\x13?,\x06'@A<=BCD-./\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x07\x08\t\x11$%EFGHIJKLM"
+  b'NOPQRSTUVWXYZ[\\]^_\x05\x02\x07\x01,\x03\t\x04`\x11\x13\x12a\x08\x06$%&\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00bcd>efghijk?lmnopqr@stuv\n\x0b>\x12c+h\x00\x00wAxyz{|}~\x7f\x80\x81\x82'
+  b'\x83\x84\x85\x86\x87\x88\x89\x8a\x8b\x8c\x8d\x8e\x8f\x90238\x0e7&\x91`\x92a\x00\x00\x93\x94\x00'
+))
+
+record_is_alpha = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x01\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00'
+))
+
+record_is_decimal = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+
+record_is_digit = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x01\x01\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+
+record_is_lower = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x01\x01\x00\x01\x00\x01\x01\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x01\x00\x01\x00\x00\x00\x00\x00\x01\x00\x00\x01\x01\x01'
+  b'\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x00\x01\x01\x01\x01'
+  b'\x01\x01\x01\x00\x01\x00\x00\x01\x00\x01\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x00\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x00\x00\x01\x01\x01\x01\x01\x01'
+  b'\x00\x00\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x01\x01\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00'
+))
+
+record_is_linebreak = array('B', (
+  b'\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+
+record_is_space = array('B', (
+  b'\x00\x00\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+
+record_is_title = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00'
+  b'\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+
+record_is_upper = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x01\x00\x00\x01\x00\x00\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x00\x01\x00\x01\x01\x01\x01\x00\x00\x01\x00\x00\x00\x00'
+  b'\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x01\x00\x00\x00\x00'
+  b'\x00\x00\x00\x01\x00\x01\x01\x00\x01\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x01\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00'
+  b'\x01\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x01\x01\x01\x00\x00\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x01'
+))
+
+record_is_xid_start = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x01\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x01\x01\x00\x00\x00'
+))
+
+record_is_xid_continue = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x01\x01\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x01\x01\x00\x00\x00'
+))
+
+record_is_printable = array('B', (
+  b'\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+))
+
+record_is_numeric = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x01\x01\x00\x00\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x01\x01\x00'
+))
+
+record_is_case_ignorable = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+
+record_is_cased = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x01\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x00\x00\x01'
+))
+
+record_is_extended_case = array('B', (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x01\x00\x00\x00\x01\x00\x01\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x01\x00\x00\x01\x01\x00\x00\x00\x01\x01\x00\x01\x01\x00\x01'
+  b'\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x00\x00\x01\x01\x01\x01\x00\x00\x00'
+  b'\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01\x01'
+  b'\x00\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+  b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+))
+
+extended_case = array('H', (
+  b'\xb5\x00\xb5\x00\xbc\x03\xbc\x03\x9c\x03\x9c\x03\xdf\x00\xdf\x00\xdf\x00s\x00s\x00\xdf\x00S\x00S\x00\xdf\x00S\x00s\x00i\x00i\x00\x07\x030\x010\x01I\x01I\x01I\x01\xbc\x02n\x00I\x01\xbc\x02N\x00\x7f\x01\x7f\x01'
+  b's\x00s\x00S\x00S\x00\xf0\x01\xf0\x01\xf0\x01j\x00\x0c\x03\xf0\x01J\x00\x0c\x03E\x03E\x03\xb9\x03\xb9\x03\x99\x03\x99\x03\x90\x03\x90\x03\x90\x03\xb9\x03\x08\x03\x01\x03\x90\x03\x99\x03\x08\x03\x01\x03\xb0\x03\xb0\x03\xb0\x03\xc5\x03'
+  b'\x08\x03\x01\x03\xb0\x03\xa5\x03\x08\x03\x01\x03\xc2\x03\xc2\x03\xc3\x03\xc3\x03\xa3\x03\xa3\x03\xd0\x03\xd0\x03\xb2\x03\xb2\x03\x92\x03\x92\x03\xd1\x03\xd1\x03\xb8\x03\xb8\x03\x98\x03\x98\x03\xd5\x03\xd5\x03\xc6\x03\xc6\x03\xa6\x03\xa6\x03\xd6\x03\xd6\x03'
+  b'\xc0\x03\xc0\x03\xa0\x03\xa0\x03\xf0\x03\xf0\x03\xba\x03\xba\x03\x9a\x03\x9a\x03\xf1\x03\xf1\x03\xc1\x03\xc1\x03\xa1\x03\xa1\x03\xf5\x03\xf5\x03\xb5\x03\xb5\x03\x95\x03\x95\x03\x87\x05\x87\x05\x87\x05e\x05\x82\x05\x87\x055\x05R\x05\x87\x055\x05'
+  b'\x82\x05p\xabp\xab\xa0\x13\xa0\x13\xa0\x13\xa0\x13q\xabq\xab\xa1\x13\xa1\x13\xa1\x13\xa1\x13r\xabr\xab\xa2\x13\xa2\x13\xa2\x13\xa2\x13s\xabs\xab\xa3\x13\xa3\x13\xa3\x13\xa3\x13t\xabt\xab\xa4\x13\xa4\x13\xa4\x13\xa4\x13u\xab'
+  b'u\xab\xa5\x13\xa5\x13\xa5\x13\xa5\x13v\xabv\xab\xa6\x13\xa6\x13\xa6\x13\xa6\x13w\xabw\xab\xa7\x13\xa7\x13\xa7\x13\xa7\x13x\xabx\xab\xa8\x13\xa8\x13\xa8\x13\xa8\x13y\xaby\xab\xa9\x13\xa9\x13\xa9\x13\xa9\x13z\xabz\xab\xaa\x13'
+  b'\xaa\x13\xaa\x13\xaa\x13{\xab{\xab\xab\x13\xab\x13\xab\x13\xab\x13|\xab|\xab\xac\x13\xac\x13\xac\x13\xac\x13}\xab}\xab\xad\x13\xad\x13\xad\x13\xad\x13~\xab~\xab\xae\x13\xae\x13\xae\x13\xae\x13\x7f\xab\x7f\xab\xaf\x13\xaf\x13\xaf\x13'
+  b'\xaf\x13\x80\xab\x80\xab\xb0\x13\xb0\x13\xb0\x13\xb0\x13\x81\xab\x81\xab\xb1\x13\xb1\x13\xb1\x13\xb1\x13\x82\xab\x82\xab\xb2\x13\xb2\x13\xb2\x13\xb2\x13\x83\xab\x83\xab\xb3\x13\xb3\x13\xb3\x13\xb3\x13\x84\xab\x84\xab\xb4\x13\xb4\x13\xb4\x13\xb4\x13\x85\xab'
+  b'\x85\xab\xb5\x13\xb5\x13\xb5\x13\xb5\x13\x86\xab\x86\xab\xb6\x13\xb6\x13\xb6\x13\xb6\x13\x87\xab\x87\xab\xb7\x13\xb7\x13\xb7\x13\xb7\x13\x88\xab\x88\xab\xb8\x13\xb8\x13\xb8\x13\xb8\x13\x89\xab\x89\xab\xb9\x13\xb9\x13\xb9\x13\xb9\x13\x8a\xab\x8a\xab\xba\x13'
+  b'\xba\x13\xba\x13\xba\x13\x8b\xab\x8b\xab\xbb\x13\xbb\x13\xbb\x13\xbb\x13\x8c\xab\x8c\xab\xbc\x13\xbc\x13\xbc\x13\xbc\x13\x8d\xab\x8d\xab\xbd\x13\xbd\x13\xbd\x13\xbd\x13\x8e\xab\x8e\xab\xbe\x13\xbe\x13\xbe\x13\xbe\x13\x8f\xab\x8f\xab\xbf\x13\xbf\x13\xbf\x13'
+  b'\xbf\x13\x90\xab\x90\xab\xc0\x13\xc0\x13\xc0\x13\xc0\x13\x91\xab\x91\xab\xc1\x13\xc1\x13\xc1\x13\xc1\x13\x92\xab\x92\xab\xc2\x13\xc2\x13\xc2\x13\xc2\x13\x93\xab\x93\xab\xc3\x13\xc3\x13\xc3\x13\xc3\x13\x94\xab\x94\xab\xc4\x13\xc4\x13\xc4\x13\xc4\x13\x95\xab'
+  b'\x95\xab\xc5\x13\xc5\x13\xc5\x13\xc5\x13\x96\xab\x96\xab\xc6\x13\xc6\x13\xc6\x13\xc6\x13\x97\xab\x97\xab\xc7\x13\xc7\x13\xc7\x13\xc7\x13\x98\xab\x98\xab\xc8\x13\xc8\x13\xc8\x13\xc8\x13\x99\xab\x99\xab\xc9\x13\xc9\x13\xc9\x13\xc9\x13\x9a\xab\x9a\xab\xca\x13'
+  b'\xca\x13\xca\x13\xca\x13\x9b\xab\x9b\xab\xcb\x13\xcb\x13\xcb\x13\xcb\x13\x9c\xab\x9c\xab\xcc\x13\xcc\x13\xcc\x13\xcc\x13\x9d\xab\x9d\xab\xcd\x13\xcd\x13\xcd\x13\xcd\x13\x9e\xab\x9e\xab\xce\x13\xce\x13\xce\x13\xce\x13\x9f\xab\x9f\xab\xcf\x13\xcf\x13\xcf\x13'
+  b'\xcf\x13\xa0\xab\xa0\xab\xd0\x13\xd0\x13\xd0\x13\xd0\x13\xa1\xab\xa1\xab\xd1\x13\xd1\x13\xd1\x13\xd1\x13\xa2\xab\xa2\xab\xd2\x13\xd2\x13\xd2\x13\xd2\x13\xa3\xab\xa3\xab\xd3\x13\xd3\x13\xd3\x13\xd3\x13\xa4\xab\xa4\xab\xd4\x13\xd4\x13\xd4\x13\xd4\x13\xa5\xab'
+  b'\xa5\xab\xd5\x13\xd5\x13\xd5\x13\xd5\x13\xa6\xab\xa6\xab\xd6\x13\xd6\x13\xd6\x13\xd6\x13\xa7\xab\xa7\xab\xd7\x13\xd7\x13\xd7\x13\xd7\x13\xa8\xab\xa8\xab\xd8\x13\xd8\x13\xd8\x13\xd8\x13\xa9\xab\xa9\xab\xd9\x13\xd9\x13\xd9\x13\xd9\x13\xaa\xab\xaa\xab\xda\x13'
+  b'\xda\x13\xda\x13\xda\x13\xab\xab\xab\xab\xdb\x13\xdb\x13\xdb\x13\xdb\x13\xac\xab\xac\xab\xdc\x13\xdc\x13\xdc\x13\xdc\x13\xad\xab\xad\xab\xdd\x13\xdd\x13\xdd\x13\xdd\x13\xae\xab\xae\xab\xde\x13\xde\x13\xde\x13\xde\x13\xaf\xab\xaf\xab\xdf\x13\xdf\x13\xdf\x13'
+  b'\xdf\x13\xb0\xab\xb0\xab\xe0\x13\xe0\x13\xe0\x13\xe0\x13\xb1\xab\xb1\xab\xe1\x13\xe1\x13\xe1\x13\xe1\x13\xb2\xab\xb2\xab\xe2\x13\xe2\x13\xe2\x13\xe2\x13\xb3\xab\xb3\xab\xe3\x13\xe3\x13\xe3\x13\xe3\x13\xb4\xab\xb4\xab\xe4\x13\xe4\x13\xe4\x13\xe4\x13\xb5\xab'
+  b'\xb5\xab\xe5\x13\xe5\x13\xe5\x13\xe5\x13\xb6\xab\xb6\xab\xe6\x13\xe6\x13\xe6\x13\xe6\x13\xb7\xab\xb7\xab\xe7\x13\xe7\x13\xe7\x13\xe7\x13\xb8\xab\xb8\xab\xe8\x13\xe8\x13\xe8\x13\xe8\x13\xb9\xab\xb9\xab\xe9\x13\xe9\x13\xe9\x13\xe9\x13\xba\xab\xba\xab\xea\x13'
+  b'\xea\x13\xea\x13\xea\x13\xbb\xab\xbb\xab\xeb\x13\xeb\x13\xeb\x13\xeb\x13\xbc\xab\xbc\xab\xec\x13\xec\x13\xec\x13\xec\x13\xbd\xab\xbd\xab\xed\x13\xed\x13\xed\x13\xed\x13\xbe\xab\xbe\xab\xee\x13\xee\x13\xee\x13\xee\x13\xbf\xab\xbf\xab\xef\x13\xef\x13\xef\x13'
+  b'\xef\x13\xf8\x13\xf8\x13\xf0\x13\xf0\x13\xf0\x13\xf0\x13\xf9\x13\xf9\x13\xf1\x13\xf1\x13\xf1\x13\xf1\x13\xfa\x13\xfa\x13\xf2\x13\xf2\x13\xf2\x13\xf2\x13\xfb\x13\xfb\x13\xf3\x13\xf3\x13\xf3\x13\xf3\x13\xfc\x13\xfc\x13\xf4\x13\xf4\x13\xf4\x13\xf4\x13\xfd\x13'
+  b'\xfd\x13\xf5\x13\xf5\x13\xf5\x13\xf5\x13\xf8\x13\xf8\x13\xf0\x13\xf0\x13\xf0\x13\xf0\x13\xf9\x13\xf9\x13\xf1\x13\xf1\x13\xf1\x13\xf1\x13\xfa\x13\xfa\x13\xf2\x13\xf2\x13\xf2\x13\xf2\x13\xfb\x13\xfb\x13\xf3\x13\xf3\x13\xf3\x13\xf3\x13\xfc\x13\xfc\x13\xf4\x13'
+  b'\xf4\x13\xf4\x13\xf4\x13\xfd\x13\xfd\x13\xf5\x13\xf5\x13\xf5\x13\xf5\x13\x80\x1c\x80\x1c2\x042\x04\x12\x04\x12\x04\x81\x1c\x81\x1c4\x044\x04\x14\x04\x14\x04\x82\x1c\x82\x1c>\x04>\x04\x1e\x04\x1e\x04\x83\x1c\x83\x1cA\x04A\x04!\x04'
+  b'!\x04\x84\x1c\x84\x1cB\x04B\x04"\x04"\x04\x85\x1c\x85\x1cB\x04B\x04"\x04"\x04\x86\x1c\x86\x1cJ\x04J\x04*\x04*\x04\x87\x1c\x87\x1cc\x04c\x04b\x04b\x04\x88\x1c\x88\x1cK\xa6K\xa6J\xa6J\xa6\x96\x1e'
+  b'\x96\x1e\x96\x1eh\x001\x03\x96\x1eH\x001\x03\x97\x1e\x97\x1e\x97\x1et\x00\x08\x03\x97\x1eT\x00\x08\x03\x98\x1e\x98\x1e\x98\x1ew\x00\n\x03\x98\x1eW\x00\n\x03\x99\x1e\x99\x1e\x99\x1ey\x00\n\x03\x99\x1eY\x00\n\x03\x9a\x1e'
+  b'\x9a\x1e\x9a\x1ea\x00\xbe\x02\x9a\x1eA\x00\xbe\x02\x9b\x1e\x9b\x1ea\x1ea\x1e`\x1e`\x1e\xdf\x00\xdf\x00\xdf\x00s\x00s\x00\x9e\x1e\x9e\x1eP\x1fP\x1fP\x1f\xc5\x03\x13\x03P\x1f\xa5\x03\x13\x03R\x1fR\x1fR\x1f\xc5\x03'
+  b'\x13\x03\x00\x03R\x1f\xa5\x03\x13\x03\x00\x03T\x1fT\x1fT\x1f\xc5\x03\x13\x03\x01\x03T\x1f\xa5\x03\x13\x03\x01\x03V\x1fV\x1fV\x1f\xc5\x03\x13\x03B\x03V\x1f\xa5\x03\x13\x03B\x03\x80\x1f\x80\x1f\x80\x1f\x00\x1f\xb9\x03\x88\x1f'
+  b'\x08\x1f\x99\x03\x88\x1f\x88\x1f\x81\x1f\x81\x1f\x81\x1f\x01\x1f\xb9\x03\x89\x1f\t\x1f\x99\x03\x89\x1f\x89\x1f\x82\x1f\x82\x1f\x82\x1f\x02\x1f\xb9\x03\x8a\x1f\n\x1f\x99\x03\x8a\x1f\x8a\x1f\x83\x1f\x83\x1f\x83\x1f\x03\x1f\xb9\x03\x8b\x1f\x0b\x1f\x99\x03'
+  b'\x8b\x1f\x8b\x1f\x84\x1f\x84\x1f\x84\x1f\x04\x1f\xb9\x03\x8c\x1f\x0c\x1f\x99\x03\x8c\x1f\x8c\x1f\x85\x1f\x85\x1f\x85\x1f\x05\x1f\xb9\x03\x8d\x1f\r\x1f\x99\x03\x8d\x1f\x8d\x1f\x86\x1f\x86\x1f\x86\x1f\x06\x1f\xb9\x03\x8e\x1f\x0e\x1f\x99\x03\x8e\x1f\x8e\x1f'
+  b'\x87\x1f\x87\x1f\x87\x1f\x07\x1f\xb9\x03\x8f\x1f\x0f\x1f\x99\x03\x8f\x1f\x8f\x1f\x80\x1f\x80\x1f\x80\x1f\x00\x1f\xb9\x03\x88\x1f\x08\x1f\x99\x03\x88\x1f\x88\x1f\x81\x1f\x81\x1f\x81\x1f\x01\x1f\xb9\x03\x89\x1f\t\x1f\x99\x03\x89\x1f\x89\x1f\x82\x1f\x82\x1f'
+  b'\x82\x1f\x02\x1f\xb9\x03\x8a\x1f\n\x1f\x99\x03\x8a\x1f\x8a\x1f\x83\x1f\x83\x1f\x83\x1f\x03\x1f\xb9\x03\x8b\x1f\x0b\x1f\x99\x03\x8b\x1f\x8b\x1f\x84\x1f\x84\x1f\x84\x1f\x04\x1f\xb9\x03\x8c\x1f\x0c\x1f\x99\x03\x8c\x1f\x8c\x1f\x85\x1f\x85\x1f\x85\x1f\x05\x1f'
+  b'\xb9\x03\x8d\x1f\r\x1f\x99\x03\x8d\x1f\x8d\x1f\x86\x1f\x86\x1f\x86\x1f\x06\x1f\xb9\x03\x8e\x1f\x0e\x1f\x99\x03\x8e\x1f\x8e\x1f\x87\x1f\x87\x1f\x87\x1f\x07\x1f\xb9\x03\x8f\x1f\x0f\x1f\x99\x03\x8f\x1f\x8f\x1f\x90\x1f\x90\x1f\x90\x1f \x1f\xb9\x03\x98\x1f'
+  b'(\x1f\x99\x03\x98\x1f\x98\x1f\x91\x1f\x91\x1f\x91\x1f!\x1f\xb9\x03\x99\x1f)\x1f\x99\x03\x99\x1f\x99\x1f\x92\x1f\x92\x1f\x92\x1f"\x1f\xb9\x03\x9a\x1f*\x1f\x99\x03\x9a\x1f\x9a\x1f\x93\x1f\x93\x1f\x93\x1f#\x1f\xb9\x03\x9b\x1f+\x1f\x99\x03'
+  b'\x9b\x1f\x9b\x1f\x94\x1f\x94\x1f\x94\x1f$\x1f\xb9\x03\x9c\x1f,\x1f\x99\x03\x9c\x1f\x9c\x1f\x95\x1f\x95\x1f\x95\x1f%\x1f\xb9\x03\x9d\x1f-\x1f\x99\x03\x9d\x1f\x9d\x1f\x96\x1f\x96\x1f\x96\x1f&\x1f\xb9\x03\x9e\x1f.\x1f\x99\x03\x9e\x1f\x9e\x1f'
+  b"\x97\x1f\x97\x1f\x97\x1f'\x1f\xb9\x03\x9f\x1f/\x1f\x99\x03\x9f\x1f\x9f\x1f\x90\x1f\x90\x1f\x90\x1f \x1f\xb9\x03\x98\x1f(\x1f\x99\x03\x98\x1f\x98\x1f\x91\x1f\x91\x1f\x91\x1f!\x1f\xb9\x03\x99\x1f)\x1f\x99\x03\x99\x1f\x99\x1f\x92\x1f\x92\x1f"
+  b'\x92\x1f"\x1f\xb9\x03\x9a\x1f*\x1f\x99\x03\x9a\x1f\x9a\x1f\x93\x1f\x93\x1f\x93\x1f#\x1f\xb9\x03\x9b\x1f+\x1f\x99\x03\x9b\x1f\x9b\x1f\x94\x1f\x94\x1f\x94\x1f$\x1f\xb9\x03\x9c\x1f,\x1f\x99\x03\x9c\x1f\x9c\x1f\x95\x1f\x95\x1f\x95\x1f%\x1f'
+  b"\xb9\x03\x9d\x1f-\x1f\x99\x03\x9d\x1f\x9d\x1f\x96\x1f\x96\x1f\x96\x1f&\x1f\xb9\x03\x9e\x1f.\x1f\x99\x03\x9e\x1f\x9e\x1f\x97\x1f\x97\x1f\x97\x1f'\x1f\xb9\x03\x9f\x1f/\x1f\x99\x03\x9f\x1f\x9f\x1f\xa0\x1f\xa0\x1f\xa0\x1f`\x1f\xb9\x03\xa8\x1f"
+  b'h\x1f\x99\x03\xa8\x1f\xa8\x1f\xa1\x1f\xa1\x1f\xa1\x1fa\x1f\xb9\x03\xa9\x1fi\x1f\x99\x03\xa9\x1f\xa9\x1f\xa2\x1f\xa2\x1f\xa2\x1fb\x1f\xb9\x03\xaa\x1fj\x1f\x99\x03\xaa\x1f\xaa\x1f\xa3\x1f\xa3\x1f\xa3\x1fc\x1f\xb9\x03\xab\x1fk\x1f\x99\x03'
+  b'\xab\x1f\xab\x1f\xa4\x1f\xa4\x1f\xa4\x1fd\x1f\xb9\x03\xac\x1fl\x1f\x99\x03\xac\x1f\xac\x1f\xa5\x1f\xa5\x1f\xa5\x1fe\x1f\xb9\x03\xad\x1fm\x1f\x99\x03\xad\x1f\xad\x1f\xa6\x1f\xa6\x1f\xa6\x1ff\x1f\xb9\x03\xae\x1fn\x1f\x99\x03\xae\x1f\xae\x1f'
+  b'\xa7\x1f\xa7\x1f\xa7\x1fg\x1f\xb9\x03\xaf\x1fo\x1f\x99\x03\xaf\x1f\xaf\x1f\xa0\x1f\xa0\x1f\xa0\x1f`\x1f\xb9\x03\xa8\x1fh\x1f\x99\x03\xa8\x1f\xa8\x1f\xa1\x1f\xa1\x1f\xa1\x1fa\x1f\xb9\x03\xa9\x1fi\x1f\x99\x03\xa9\x1f\xa9\x1f\xa2\x1f\xa2\x1f'
+  b'\xa2\x1fb\x1f\xb9\x03\xaa\x1fj\x1f\x99\x03\xaa\x1f\xaa\x1f\xa3\x1f\xa3\x1f\xa3\x1fc\x1f\xb9\x03\xab\x1fk\x1f\x99\x03\xab\x1f\xab\x1f\xa4\x1f\xa4\x1f\xa4\x1fd\x1f\xb9\x03\xac\x1fl\x1f\x99\x03\xac\x1f\xac\x1f\xa5\x1f\xa5\x1f\xa5\x1fe\x1f'
+  b'\xb9\x03\xad\x1fm\x1f\x99\x03\xad\x1f\xad\x1f\xa6\x1f\xa6\x1f\xa6\x1ff\x1f\xb9\x03\xae\x1fn\x1f\x99\x03\xae\x1f\xae\x1f\xa7\x1f\xa7\x1f\xa7\x1fg\x1f\xb9\x03\xaf\x1fo\x1f\x99\x03\xaf\x1f\xaf\x1f\xb2\x1f\xb2\x1f\xb2\x1fp\x1f\xb9\x03\xb2\x1f'
+  b'\xba\x1f\x99\x03\xb2\x1f\xba\x1fE\x03\xb3\x1f\xb3\x1f\xb3\x1f\xb1\x03\xb9\x03\xbc\x1f\x91\x03\x99\x03\xbc\x1f\xbc\x1f\xb4\x1f\xb4\x1f\xb4\x1f\xac\x03\xb9\x03\xb4\x1f\x86\x03\x99\x03\xb4\x1f\x86\x03E\x03\xb6\x1f\xb6\x1f\xb6\x1f\xb1\x03B\x03\xb6\x1f'
+  b'\x91\x03B\x03\xb7\x1f\xb7\x1f\xb7\x1f\xb1\x03B\x03\xb9\x03\xb7\x1f\x91\x03B\x03\x99\x03\xb7\x1f\x91\x03B\x03E\x03\xb3\x1f\xb3\x1f\xb3\x1f\xb1\x03\xb9\x03\xbc\x1f\x91\x03\x99\x03\xbc\x1f\xbc\x1f\xbe\x1f\xbe\x1f\xb9\x03\xb9\x03\x99\x03\x99\x03'
+  b'\xc2\x1f\xc2\x1f\xc2\x1ft\x1f\xb9\x03\xc2\x1f\xca\x1f\x99\x03\xc2\x1f\xca\x1fE\x03\xc3\x1f\xc3\x1f\xc3\x1f\xb7\x03\xb9\x03\xcc\x1f\x97\x03\x99\x03\xcc\x1f\xcc\x1f\xc4\x1f\xc4\x1f\xc4\x1f\xae\x03\xb9\x03\xc4\x1f\x89\x03\x99\x03\xc4\x1f\x89\x03E\x03'
+  b'\xc6\x1f\xc6\x1f\xc6\x1f\xb7\x03B\x03\xc6\x1f\x97\x03B\x03\xc7\x1f\xc7\x1f\xc7\x1f\xb7\x03B\x03\xb9\x03\xc7\x1f\x97\x03B\x03\x99\x03\xc7\x1f\x97\x03B\x03E\x03\xc3\x1f\xc3\x1f\xc3\x1f\xb7\x03\xb9\x03\xcc\x1f\x97\x03\x99\x03\xcc\x1f\xcc\x1f'
+  b'\xd2\x1f\xd2\x1f\xd2\x1f\xb9\x03\x08\x03\x00\x03\xd2\x1f\x99\x03\x08\x03\x00\x03\xd3\x1f\xd3\x1f\xd3\x1f\xb9\x03\x08\x03\x01\x03\xd3\x1f\x99\x03\x08\x03\x01\x03\xd6\x1f\xd6\x1f\xd6\x1f\xb9\x03B\x03\xd6\x1f\x99\x03B\x03\xd7\x1f\xd7\x1f\xd7\x1f\xb9\x03'
+  b'\x08\x03B\x03\xd7\x1f\x99\x03\x08\x03B\x03\xe2\x1f\xe2\x1f\xe2\x1f\xc5\x03\x08\x03\x00\x03\xe2\x1f\xa5\x03\x08\x03\x00\x03\xe3\x1f\xe3\x1f\xe3\x1f\xc5\x03\x08\x03\x01\x03\xe3\x1f\xa5\x03\x08\x03\x01\x03\xe4\x1f\xe4\x1f\xe4\x1f\xc1\x03\x13\x03\xe4\x1f'
+  b'\xa1\x03\x13\x03\xe6\x1f\xe6\x1f\xe6\x1f\xc5\x03B\x03\xe6\x1f\xa5\x03B\x03\xe7\x1f\xe7\x1f\xe7\x1f\xc5\x03\x08\x03B\x03\xe7\x1f\xa5\x03\x08\x03B\x03\xf2\x1f\xf2\x1f\xf2\x1f|\x1f\xb9\x03\xf2\x1f\xfa\x1f\x99\x03\xf2\x1f\xfa\x1fE\x03\xf3\x1f'
+  b'\xf3\x1f\xf3\x1f\xc9\x03\xb9\x03\xfc\x1f\xa9\x03\x99\x03\xfc\x1f\xfc\x1f\xf4\x1f\xf4\x1f\xf4\x1f\xce\x03\xb9\x03\xf4\x1f\x8f\x03\x99\x03\xf4\x1f\x8f\x03E\x03\xf6\x1f\xf6\x1f\xf6\x1f\xc9\x03B\x03\xf6\x1f\xa9\x03B\x03\xf7\x1f\xf7\x1f\xf7\x1f\xc9\x03'
+  b'B\x03\xb9\x03\xf7\x1f\xa9\x03B\x03\x99\x03\xf7\x1f\xa9\x03B\x03E\x03\xf3\x1f\xf3\x1f\xf3\x1f\xc9\x03\xb9\x03\xfc\x1f\xa9\x03\x99\x03\xfc\x1f\xfc\x1fp\xabp\xab\xa0\x13\xa0\x13\xa0\x13\xa0\x13q\xabq\xab\xa1\x13\xa1\x13\xa1\x13\xa1\x13'
+  b'r\xabr\xab\xa2\x13\xa2\x13\xa2\x13\xa2\x13s\xabs\xab\xa3\x13\xa3\x13\xa3\x13\xa3\x13t\xabt\xab\xa4\x13\xa4\x13\xa4\x13\xa4\x13u\xabu\xab\xa5\x13\xa5\x13\xa5\x13\xa5\x13v\xabv\xab\xa6\x13\xa6\x13\xa6\x13\xa6\x13w\xabw\xab'
+  b'\xa7\x13\xa7\x13\xa7\x13\xa7\x13x\xabx\xab\xa8\x13\xa8\x13\xa8\x13\xa8\x13y\xaby\xab\xa9\x13\xa9\x13\xa9\x13\xa9\x13z\xabz\xab\xaa\x13\xaa\x13\xaa\x13\xaa\x13{\xab{\xab\xab\x13\xab\x13\xab\x13\xab\x13|\xab|\xab\xac\x13\xac\x13'
+  b'\xac\x13\xac\x13}\xab}\xab\xad\x13\xad\x13\xad\x13\xad\x13~\xab~\xab\xae\x13\xae\x13\xae\x13\xae\x13\x7f\xab\x7f\xab\xaf\x13\xaf\x13\xaf\x13\xaf\x13\x80\xab\x80\xab\xb0\x13\xb0\x13\xb0\x13\xb0\x13\x81\xab\x81\xab\xb1\x13\xb1\x13\xb1\x13\xb1\x13'
+  b'\x82\xab\x82\xab\xb2\x13\xb2\x13\xb2\x13\xb2\x13\x83\xab\x83\xab\xb3\x13\xb3\x13\xb3\x13\xb3\x13\x84\xab\x84\xab\xb4\x13\xb4\x13\xb4\x13\xb4\x13\x85\xab\x85\xab\xb5\x13\xb5\x13\xb5\x13\xb5\x13\x86\xab\x86\xab\xb6\x13\xb6\x13\xb6\x13\xb6\x13\x87\xab\x87\xab'
+  b'\xb7\x13\xb7\x13\xb7\x13\xb7\x13\x88\xab\x88\xab\xb8\x13\xb8\x13\xb8\x13\xb8\x13\x89\xab\x89\xab\xb9\x13\xb9\x13\xb9\x13\xb9\x13\x8a\xab\x8a\xab\xba\x13\xba\x13\xba\x13\xba\x13\x8b\xab\x8b\xab\xbb\x13\xbb\x13\xbb\x13\xbb\x13\x8c\xab\x8c\xab\xbc\x13\xbc\x13'
+  b'\xbc\x13\xbc\x13\x8d\xab\x8d\xab\xbd\x13\xbd\x13\xbd\x13\xbd\x13\x8e\xab\x8e\xab\xbe\x13\xbe\x13\xbe\x13\xbe\x13\x8f\xab\x8f\xab\xbf\x13\xbf\x13\xbf\x13\xbf\x13\x90\xab\x90\xab\xc0\x13\xc0\x13\xc0\x13\xc0\x13\x91\xab\x91\xab\xc1\x13\xc1\x13\xc1\x13\xc1\x13'
+  b'\x92\xab\x92\xab\xc2\x13\xc2\x13\xc2\x13\xc2\x13\x93\xab\x93\xab\xc3\x13\xc3\x13\xc3\x13\xc3\x13\x94\xab\x94\xab\xc4\x13\xc4\x13\xc4\x13\xc4\x13\x95\xab\x95\xab\xc5\x13\xc5\x13\xc5\x13\xc5\x13\x96\xab\x96\xab\xc6\x13\xc6\x13\xc6\x13\xc6\x13\x97\xab\x97\xab'
+  b'\xc7\x13\xc7\x13\xc7\x13\xc7\x13\x98\xab\x98\xab\xc8\x13\xc8\x13\xc8\x13\xc8\x13\x99\xab\x99\xab\xc9\x13\xc9\x13\xc9\x13\xc9\x13\x9a\xab\x9a\xab\xca\x13\xca\x13\xca\x13\xca\x13\x9b\xab\x9b\xab\xcb\x13\xcb\x13\xcb\x13\xcb\x13\x9c\xab\x9c\xab\xcc\x13\xcc\x13'
+  b'\xcc\x13\xcc\x13\x9d\xab\x9d\xab\xcd\x13\xcd\x13\xcd\x13\xcd\x13\x9e\xab\x9e\xab\xce\x13\xce\x13\xce\x13\xce\x13\x9f\xab\x9f\xab\xcf\x13\xcf\x13\xcf\x13\xcf\x13\xa0\xab\xa0\xab\xd0\x13\xd0\x13\xd0\x13\xd0\x13\xa1\xab\xa1\xab\xd1\x13\xd1\x13\xd1\x13\xd1\x13'
+  b'\xa2\xab\xa2\xab\xd2\x13\xd2\x13\xd2\x13\xd2\x13\xa3\xab\xa3\xab\xd3\x13\xd3\x13\xd3\x13\xd3\x13\xa4\xab\xa4\xab\xd4\x13\xd4\x13\xd4\x13\xd4\x13\xa5\xab\xa5\xab\xd5\x13\xd5\x13\xd5\x13\xd5\x13\xa6\xab\xa6\xab\xd6\x13\xd6\x13\xd6\x13\xd6\x13\xa7\xab\xa7\xab'
+  b'\xd7\x13\xd7\x13\xd7\x13\xd7\x13\xa8\xab\xa8\xab\xd8\x13\xd8\x13\xd8\x13\xd8\x13\xa9\xab\xa9\xab\xd9\x13\xd9\x13\xd9\x13\xd9\x13\xaa\xab\xaa\xab\xda\x13\xda\x13\xda\x13\xda\x13\xab\xab\xab\xab\xdb\x13\xdb\x13\xdb\x13\xdb\x13\xac\xab\xac\xab\xdc\x13\xdc\x13'
+  b'\xdc\x13\xdc\x13\xad\xab\xad\xab\xdd\x13\xdd\x13\xdd\x13\xdd\x13\xae\xab\xae\xab\xde\x13\xde\x13\xde\x13\xde\x13\xaf\xab\xaf\xab\xdf\x13\xdf\x13\xdf\x13\xdf\x13\xb0\xab\xb0\xab\xe0\x13\xe0\x13\xe0\x13\xe0\x13\xb1\xab\xb1\xab\xe1\x13\xe1\x13\xe1\x13\xe1\x13'
+  b'\xb2\xab\xb2\xab\xe2\x13\xe2\x13\xe2\x13\xe2\x13\xb3\xab\xb3\xab\xe3\x13\xe3\x13\xe3\x13\xe3\x13\xb4\xab\xb4\xab\xe4\x13\xe4\x13\xe4\x13\xe4\x13\xb5\xab\xb5\xab\xe5\x13\xe5\x13\xe5\x13\xe5\x13\xb6\xab\xb6\xab\xe6\x13\xe6\x13\xe6\x13\xe6\x13\xb7\xab\xb7\xab'
+  b'\xe7\x13\xe7\x13\xe7\x13\xe7\x13\xb8\xab\xb8\xab\xe8\x13\xe8\x13\xe8\x13\xe8\x13\xb9\xab\xb9\xab\xe9\x13\xe9\x13\xe9\x13\xe9\x13\xba\xab\xba\xab\xea\x13\xea\x13\xea\x13\xea\x13\xbb\xab\xbb\xab\xeb\x13\xeb\x13\xeb\x13\xeb\x13\xbc\xab\xbc\xab\xec\x13\xec\x13'
+  b'\xec\x13\xec\x13\xbd\xab\xbd\xab\xed\x13\xed\x13\xed\x13\xed\x13\xbe\xab\xbe\xab\xee\x13\xee\x13\xee\x13\xee\x13\xbf\xab\xbf\xab\xef\x13\xef\x13\xef\x13\xef\x13\x00\xfb\x00\xfb\x00\xfbf\x00f\x00\x00\xfbF\x00F\x00\x00\xfbF\x00f\x00\x01\xfb'
+  b'\x01\xfb\x01\xfbf\x00i\x00\x01\xfbF\x00I\x00\x01\xfbF\x00i\x00\x02\xfb\x02\xfb\x02\xfbf\x00l\x00\x02\xfbF\x00L\x00\x02\xfbF\x00l\x00\x03\xfb\x03\xfb\x03\xfbf\x00f\x00i\x00\x03\xfbF\x00F\x00I\x00\x03\xfb'
+  b'F\x00f\x00i\x00\x04\xfb\x04\xfb\x04\xfbf\x00f\x00l\x00\x04\xfbF\x00F\x00L\x00\x04\xfbF\x00f\x00l\x00\x05\xfb\x05\xfb\x05\xfbs\x00t\x00\x05\xfbS\x00T\x00\x05\xfbS\x00t\x00\x06\xfb\x06\xfb\x06\xfbs\x00'
+  b't\x00\x06\xfbS\x00T\x00\x06\xfbS\x00t\x00\x13\xfb\x13\xfb\x13\xfbt\x05v\x05\x13\xfbD\x05F\x05\x13\xfbD\x05v\x05\x14\xfb\x14\xfb\x14\xfbt\x05e\x05\x14\xfbD\x055\x05\x14\xfbD\x05e\x05\x15\xfb\x15\xfb\x15\xfb'
+  b't\x05k\x05\x15\xfbD\x05;\x05\x15\xfbD\x05k\x05\x16\xfb\x16\xfb\x16\xfb~\x05v\x05\x16\xfbN\x05F\x05\x16\xfbN\x05v\x05\x17\xfb\x17\xfb\x17\xfbt\x05m\x05\x17\xfbD\x05=\x05\x17\xfbD\x05m\x05'
+))
+if byteorder == "big":  # pragma: no cover
+  extended_case.byteswap()
+
+whitespace = array('H', (
+  b'\t\x00\n\x00\x0b\x00\x0c\x00\r\x00\x1c\x00\x1d\x00\x1e\x00\x1f\x00 \x00\x85\x00\xa0\x00\x80\x16\x00 \x01 \x02 \x03 \x04 \x05 \x06 \x07 \x08 \t \n ( ) / _ \x000'
+))
+if byteorder == "big":  # pragma: no cover
+  whitespace.byteswap()
+
+linebreaks = array('H', (
+  b'\n\x00\x0b\x00\x0c\x00\r\x00\x1c\x00\x1d\x00\x1e\x00\x85\x00( ) '
+))
+if byteorder == "big":  # pragma: no cover
+  linebreaks.byteswap()
+
@@ -2,13 +2,28 @@
 import importlib
 
 # this package
+import pyunicodedata._c_unicodedata
+import pyunicodedata._database
 import pyunicodedata._unicode_numeric
+import pyunicodedata._unicodedata_changes
+import pyunicodedata._unicodedata_db
+import pyunicodedata._unicodedata_decomp
+import pyunicodedata._unicodedata_index
+import pyunicodedata._unicodename
+import pyunicodedata._unicodename_db
 import pyunicodedata._unicodetype_db
 import pyunicodedata._unicodetype_index
 
 importlib.reload(pyunicodedata)
+importlib.reload(pyunicodedata._database)
 importlib.reload(pyunicodedata._c_unicodedata)
 importlib.reload(pyunicodedata._unicode_numeric)
+importlib.reload(pyunicodedata._unicodedata_changes)
+importlib.reload(pyunicodedata._unicodedata_db)
+importlib.reload(pyunicodedata._unicodedata_decomp)
+importlib.reload(pyunicodedata._unicodedata_index)
+importlib.reload(pyunicodedata._unicodename_db)
+importlib.reload(pyunicodedata._unicodename)
 importlib.reload(pyunicodedata._unicodetype_db)
 importlib.reload(pyunicodedata._unicodetype_index)
 
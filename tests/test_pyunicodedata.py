@@ -8,13 +8,38 @@
 
 # stdlib
 import hashlib
+import os
 import sys
 import unicodedata
 import unittest
+import unittest.mock
+from array import array
+from fractions import Fraction
 from test.support import requires_resource, script_helper  # type: ignore[import-not-found]
 
+# 3rd party
+from domdf_python_tools.paths import TemporaryPathPlus
+
+try:
+	# 3rd party
+	import numpy
+except ImportError:  # pragma: no cover
+	numpy = None  # type: ignore[assignment]
+
 # this package
 import pyunicodedata
+from pyunicodedata._database import (
+		DATABASE_ENTRY,
+		DATABASE_FORMAT,
+		DATABASE_HEADER,
+		DATABASE_MAGIC,
+		DATABASE_SCALAR,
+		DATABASE_SHARED,
+		database_version,
+		database_versions,
+		open_database,
+		version_package
+		)
 
 
 class UnicodeMethodsTest(unittest.TestCase):
@@ -87,26 +112,29 @@ class UnicodeFunctionsTest(unittest.TestCase):
 					format(pyunicodedata.digit(char, -1), ".12g"),
 					format(pyunicodedata.numeric(char, -1), ".12g"),
 					format(pyunicodedata.decimal(char, -1), ".12g"),
-					unicodedata.category(char),
-					unicodedata.bidirectional(char),
-					unicodedata.decomposition(char),
-					str(unicodedata.mirrored(char)),
-					str(unicodedata.combining(char)),
+					pyunicodedata.category(char),
+					pyunicodedata.bidirectional(char),
+					pyunicodedata.decomposition(char),
+					str(pyunicodedata.mirrored(char)),
+					str(pyunicodedata.combining(char)),
 					]
 			h.update(''.join(data).encode("ascii"))
 		result = h.hexdigest()
 
-		if sys.version_info[:2] == (3, 8):
-			self.assertEqual(result, "417249d799929ac756bac3faf9d5601bea36df57")
-		elif sys.version_info[:2] == (3, 11):
-			self.assertEqual(result, "63bc6ce2f302c7fcfc20c381f2790b550b92a870")
-		elif sys.version_info[:2] == (3, 12):
-			self.assertEqual(result, "e2b4d9c97d5f05a8bc8d50550145b5142354efc8")
-		elif sys.version_info[:2] >= (3, 13):
-			# Update this from CPython if the database changes.
-			self.assertEqual(result, "53dc045369330865087e35f4808496ee84423e92")
-		elif sys.version_info[:2] >= (3, 9):
-			self.assertEqual(result, "d1e37a2854df60ac607b47b51189b9bf1b54bfdb")
+		# The checksum for Unicode 13.0.0, as in CPython 3.9 and 3.10
+		self.assertEqual(result, "d1e37a2854df60ac607b47b51189b9bf1b54bfdb")
+
+	@requires_resource("cpu")
+	def test_normalize_checksum(self):
+		h = hashlib.sha1()  # nosec: B303
+
+		for i in range(sys.maxunicode + 1):
+			char = chr(i)
+			data = [pyunicodedata.normalize(form, char) for form in ("NFC", "NFD", "NFKC", "NFKD")]
+			h.update(''.join(data).encode("utf-8", "surrogatepass"))
+		result = h.hexdigest()
+
+		self.assertEqual(result, "5b698a2e4fa65971b63d7dffdd176b0f8b8578cc")
 
 	def test_digit(self):
 		self.assertEqual(pyunicodedata.digit('A', None), None)
@@ -133,6 +161,616 @@ class UnicodeFunctionsTest(unittest.TestCase):
 		self.assertRaises(TypeError, pyunicodedata.numeric, "xx")
 		self.assertRaises(ValueError, pyunicodedata.numeric, 'x')
 
+	def test_numeric_fraction(self):
+		self.assertEqual(pyunicodedata.numeric_fraction('A', None), None)
+		self.assertEqual(pyunicodedata.numeric_fraction('9'), 9)
+		self.assertEqual(pyunicodedata.numeric_fraction('⅛'), Fraction(1, 8))
+		self.assertEqual(pyunicodedata.numeric_fraction('⅓'), Fraction(1, 3))
+		self.assertEqual(pyunicodedata.numeric_fraction('༳'), Fraction(-1, 2))
+		self.assertEqual(pyunicodedata.numeric_fraction('𠀀', None), None)
+		self.assertEqual(pyunicodedata.numeric_fraction('𐄪'), 9000)
+		self.assertIsInstance(pyunicodedata.numeric_fraction('9'), Fraction)
+
+		# Characters with the same value share a Fraction.
+		self.assertIs(pyunicodedata.numeric_fraction('⅓'), pyunicodedata.numeric_fraction('⅓'))
+		self.assertIs(pyunicodedata.numeric_fraction('9'), pyunicodedata.numeric_fraction('⑨'))
+
+		self.assertRaises(TypeError, pyunicodedata.numeric_fraction)
+		self.assertRaises(TypeError, pyunicodedata.numeric_fraction, "xx")
+		self.assertRaises(ValueError, pyunicodedata.numeric_fraction, 'x')
+
+	@requires_resource("cpu")
+	def test_numeric_fraction_matches_numeric(self):
+		for i in range(sys.maxunicode + 1):
+			char = chr(i)
+			value = pyunicodedata.numeric_fraction(char, None)
+			if value is None:
+				self.assertEqual(pyunicodedata.numeric(char, None), None)
+			else:
+				self.assertEqual(float(value), pyunicodedata.numeric(char), char)
+
+	def test_category(self):
+		self.assertEqual(pyunicodedata.category('\uFFFE'), "Cn")
+		self.assertEqual(pyunicodedata.category('a'), "Ll")
+		self.assertEqual(pyunicodedata.category('A'), "Lu")
+		self.assertEqual(pyunicodedata.category('\U00020000'), "Lo")
+		self.assertEqual(pyunicodedata.category('\U0001012A'), "No")
+
+		self.assertRaises(TypeError, pyunicodedata.category)
+		self.assertRaises(TypeError, pyunicodedata.category, "xx")
+
+	def test_bidirectional(self):
+		self.assertEqual(pyunicodedata.bidirectional('\uFFFE'), '')
+		self.assertEqual(pyunicodedata.bidirectional(' '), "WS")
+		self.assertEqual(pyunicodedata.bidirectional('A'), 'L')
+		self.assertEqual(pyunicodedata.bidirectional('\U00020000'), 'L')
+
+		self.assertRaises(TypeError, pyunicodedata.bidirectional)
+		self.assertRaises(TypeError, pyunicodedata.bidirectional, "xx")
+
+	def test_mirrored(self):
+		self.assertEqual(pyunicodedata.mirrored('\uFFFE'), 0)
+		self.assertEqual(pyunicodedata.mirrored('a'), 0)
+		self.assertEqual(pyunicodedata.mirrored('\u2201'), 1)
+		self.assertEqual(pyunicodedata.mirrored('\U00020000'), 0)
+
+		self.assertRaises(TypeError, pyunicodedata.mirrored)
+		self.assertRaises(TypeError, pyunicodedata.mirrored, "xx")
+
+	def test_combining(self):
+		self.assertEqual(pyunicodedata.combining('\uFFFE'), 0)
+		self.assertEqual(pyunicodedata.combining('a'), 0)
+		self.assertEqual(pyunicodedata.combining('\u20e1'), 230)
+		self.assertEqual(pyunicodedata.combining('\U00020000'), 0)
+
+		self.assertRaises(TypeError, pyunicodedata.combining)
+		self.assertRaises(TypeError, pyunicodedata.combining, "xx")
+
+	def test_east_asian_width(self):
+		eaw = pyunicodedata.east_asian_width
+		self.assertRaises(TypeError, eaw, bytearray())
+		self.assertRaises(TypeError, eaw, '')
+		self.assertRaises(TypeError, eaw, "ra")
+		self.assertEqual(eaw('\x1e'), 'N')
+		self.assertEqual(eaw('\x20'), "Na")
+		self.assertEqual(eaw('\uC894'), 'W')
+		self.assertEqual(eaw('\uFF66'), 'H')
+		self.assertEqual(eaw('\uFF1F'), 'F')
+		self.assertEqual(eaw('\u2010'), 'A')
+		self.assertEqual(eaw('\U00020000'), 'W')
+
+	def test_decomposition(self):
+		self.assertEqual(pyunicodedata.decomposition('\uFFFE'), '')
+		self.assertEqual(pyunicodedata.decomposition('\u00bc'), "<fraction> 0031 2044 0034")
+		self.assertEqual(pyunicodedata.decomposition('\u00e9'), "0065 0301")
+		self.assertEqual(pyunicodedata.decomposition('\uac00'), '')
+
+		self.assertRaises(TypeError, pyunicodedata.decomposition)
+		self.assertRaises(TypeError, pyunicodedata.decomposition, "xx")
+
+	def test_normalize(self):
+		self.assertRaises(TypeError, pyunicodedata.normalize)
+		self.assertRaises(TypeError, pyunicodedata.normalize, "NFC", b"xx")
+		self.assertRaises(TypeError, pyunicodedata.normalize, b"NFC", "xx")
+		self.assertRaises(ValueError, pyunicodedata.normalize, "unknown", "xx")
+		self.assertEqual(pyunicodedata.normalize("NFKC", ''), '')
+
+		self.assertEqual(pyunicodedata.normalize("NFC", "e\u0301"), "\u00e9")
+		self.assertEqual(pyunicodedata.normalize("NFD", "\u00e9"), "e\u0301")
+		self.assertEqual(pyunicodedata.normalize("NFKC", "\u00bc"), "1\u20444")
+		self.assertEqual(pyunicodedata.normalize("NFKD", "\ufb01"), "fi")
+		self.assertEqual(pyunicodedata.normalize("NFC", "\u1100\u1161\u11a8"), "\uac01")
+		self.assertEqual(pyunicodedata.normalize("NFD", "\uac01"), "\u1100\u1161\u11a8")
+
+		# canonical reordering
+		self.assertEqual(pyunicodedata.normalize("NFD", "a\u0301\u0323"), "a\u0323\u0301")
+		self.assertEqual(pyunicodedata.normalize("NFC", "a\u0301\u0323"), "\u1ea1\u0301")
+
+		# only the parts which need it are normalized
+		text = "ASCII, Caf\u00e9 and Cafe\u0301 \u00bd"
+		self.assertEqual(pyunicodedata.normalize("NFC", text), "ASCII, Caf\u00e9 and Caf\u00e9 \u00bd")
+		self.assertEqual(pyunicodedata.normalize("NFD", text), "ASCII, Cafe\u0301 and Cafe\u0301 \u00bd")
+		self.assertEqual(pyunicodedata.normalize("NFKC", text), "ASCII, Caf\u00e9 and Caf\u00e9 1\u20442")
+
+	def test_normalize_unchanged(self):
+		# Normalized input is returned as-is, rather than copied.
+		for text in ["ASCII", "Caf\u00e9 \u00bd", "\U00020000" * 3]:
+			for form in ("NFC", "NFKC", "NFD", "NFKD"):
+				normalized = pyunicodedata.normalize(form, text)
+				if normalized == text:
+					self.assertIs(normalized, text)
+
+		text = "Caf\u00e9 \u00bd"
+		self.assertIs(pyunicodedata.normalize("NFC", text), text)
+		self.assertIsNot(pyunicodedata.normalize("NFKC", text), text)
+
+	def test_is_normalized(self):
+		self.assertRaises(TypeError, pyunicodedata.is_normalized)
+		self.assertRaises(TypeError, pyunicodedata.is_normalized, "NFC", b"xx")
+		self.assertRaises(ValueError, pyunicodedata.is_normalized, "unknown", "xx")
+
+		for form in ("NFC", "NFD", "NFKC", "NFKD"):
+			self.assertTrue(pyunicodedata.is_normalized(form, ''))
+			self.assertTrue(pyunicodedata.is_normalized(form, "ASCII text"))
+
+		self.assertTrue(pyunicodedata.is_normalized("NFC", "Caf\u00e9"))
+		self.assertFalse(pyunicodedata.is_normalized("NFD", "Caf\u00e9"))
+		self.assertFalse(pyunicodedata.is_normalized("NFC", "Cafe\u0301"))
+		self.assertTrue(pyunicodedata.is_normalized("NFD", "Cafe\u0301"))
+		self.assertTrue(pyunicodedata.is_normalized("NFC", "\u00bd"))
+		self.assertFalse(pyunicodedata.is_normalized("NFKC", "\u00bd"))
+
+		# canonical ordering
+		self.assertFalse(pyunicodedata.is_normalized("NFD", "a\u0301\u0323"))
+		self.assertTrue(pyunicodedata.is_normalized("NFD", "a\u0323\u0301"))
+
+		# "maybe" from the quickcheck
+		self.assertTrue(pyunicodedata.is_normalized("NFC", "\u0b47\u0300\u0b3e"))
+		self.assertFalse(pyunicodedata.is_normalized("NFC", "\u0b47\u0b3e"))
+		self.assertFalse(pyunicodedata.is_normalized("NFC", "\u1100\u1161"))
+
+		for text in ["Caf\u00e9 \u00bd", "Cafe\u0301", "\u1100\u1161\u11a8", "C\u0338" * 20 + "C\u0327"]:
+			for form in ("NFC", "NFKC", "NFD", "NFKD"):
+				with self.subTest(text=text, form=form):
+					expected = pyunicodedata.normalize(form, text) == text
+					self.assertEqual(pyunicodedata.is_normalized(form, text), expected)
+
+	def test_normalize_hangul(self):
+		syllables = "\ud55c\uad6d\uc5b4 \uac00\ub098\ub2e4\ud7a3."  # 한국어 가나다힣.
+		jamo = (
+				"\u1112\u1161\u11ab\u1100\u116e\u11a8\u110b\u1165 "
+				"\u1100\u1161\u1102\u1161\u1103\u1161\u1112\u1175\u11c2."
+				)
+
+		for form in ("NFD", "NFKD"):
+			self.assertEqual(pyunicodedata.normalize(form, syllables), jamo)
+			self.assertIs(pyunicodedata.normalize(form, jamo), jamo)
+			self.assertTrue(pyunicodedata.is_normalized(form, jamo))
+			self.assertFalse(pyunicodedata.is_normalized(form, syllables))
+
+		for form in ("NFC", "NFKC"):
+			self.assertEqual(pyunicodedata.normalize(form, jamo), syllables)
+			self.assertIs(pyunicodedata.normalize(form, syllables), syllables)
+			self.assertTrue(pyunicodedata.is_normalized(form, syllables))
+			self.assertFalse(pyunicodedata.is_normalized(form, jamo))
+
+		# Mixed with other characters which need normalizing
+		self.assertEqual(pyunicodedata.normalize("NFD", "\uac00\u00e9\uac01"), "\u1100\u1161e\u0301\u1100\u1161\u11a8")
+		self.assertEqual(pyunicodedata.normalize("NFC", "\u1100\u1161e\u0301\u1100\u1161\u11a8"), "\uac00\u00e9\uac01")
+		self.assertEqual(pyunicodedata.normalize("NFKD", "\u3200\uac00"), "(\u1100)\u1100\u1161")
+
+		# A syllable followed by a trailing consonant
+		self.assertEqual(pyunicodedata.normalize("NFC", "\uac00\u11a8"), "\uac01")
+		self.assertFalse(pyunicodedata.is_normalized("NFC", "\uac00\u11a8"))
+
+		# Old jamo don't compose
+		self.assertEqual(pyunicodedata.normalize("NFC", "\u1113\u1161"), "\u1113\u1161")
+		self.assertTrue(pyunicodedata.is_normalized("NFC", "\u1100\u1176"))
+
+		self.assertEqual(pyunicodedata.decomposition("\uac00"), '')
+
+	def test_pr29(self):
+		# http://www.unicode.org/review/pr-29.html
+		# See issues #1054943 and #10254.
+		composed = (
+				"\u0b47\u0300\u0b3e",
+				"\u1100\u0300\u1161",
+				"Li\u030dt-s\u1e73\u0301",
+				"\u092e\u093e\u0930\u094d\u0915 \u091c\u093c" + "\u0941\u0915\u0947\u0930\u092c\u0930\u094d\u0917",
+				"\u0915\u093f\u0930\u094d\u0917\u093f\u091c\u093c" + "\u0938\u094d\u0924\u093e\u0928",
+				)
+		for text in composed:
+			self.assertEqual(pyunicodedata.normalize("NFC", text), text)
+
+	def test_issue10254(self):
+		# Crash reported in #10254
+		a = "C\u0338" * 20 + "C\u0327"
+		b = "C\u0338" * 20 + "\xC7"
+		self.assertEqual(pyunicodedata.normalize("NFC", a), b)
+
+	def test_issue29456(self):
+		# Fix #29456
+		u1176_str_a = "\u1100\u1176\u11a8"
+		u1176_str_b = "\u1100\u1176\u11a8"
+		u11a7_str_a = "\u1100\u1175\u11a7"
+		u11a7_str_b = "\uae30\u11a7"
+		u11c3_str_a = "\u1100\u1175\u11c3"
+		u11c3_str_b = "\uae30\u11c3"
+		self.assertEqual(pyunicodedata.normalize("NFC", u1176_str_a), u1176_str_b)
+		self.assertEqual(pyunicodedata.normalize("NFC", u11a7_str_a), u11a7_str_b)
+		self.assertEqual(pyunicodedata.normalize("NFC", u11c3_str_a), u11c3_str_b)
+
+	def test_name(self):
+		self.assertEqual(pyunicodedata.name('a'), "LATIN SMALL LETTER A")
+		self.assertEqual(pyunicodedata.name('\u00e9'), "LATIN SMALL LETTER E WITH ACUTE")
+		self.assertEqual(pyunicodedata.name('\U0001F600'), "GRINNING FACE")
+		self.assertEqual(pyunicodedata.name('\uac00'), "HANGUL SYLLABLE GA")
+		self.assertEqual(pyunicodedata.name('\uc544'), "HANGUL SYLLABLE A")
+		self.assertEqual(pyunicodedata.name('\ud7a3'), "HANGUL SYLLABLE HIH")
+		self.assertEqual(pyunicodedata.name('\u4e00'), "CJK UNIFIED IDEOGRAPH-4E00")
+		self.assertEqual(pyunicodedata.name('\U00020000'), "CJK UNIFIED IDEOGRAPH-20000")
+
+		# no name
+		self.assertRaises(ValueError, pyunicodedata.name, '\x00')
+		self.assertRaises(ValueError, pyunicodedata.name, '\ue000')
+		self.assertEqual(pyunicodedata.name('\x00', None), None)
+		self.assertEqual(pyunicodedata.name('\U0010ffff', "default"), "default")
+
+		# aliases and named sequences are stored in the Private Use Area, but are not its names
+		self.assertRaises(ValueError, pyunicodedata.name, '\U000f0000')
+		self.assertRaises(ValueError, pyunicodedata.name, '\U000f0200')
+
+		self.assertRaises(TypeError, pyunicodedata.name)
+		self.assertRaises(TypeError, pyunicodedata.name, "xx")
+
+	def test_lookup(self):
+		self.assertEqual(pyunicodedata.lookup("LATIN SMALL LETTER A"), 'a')
+		self.assertEqual(pyunicodedata.lookup("latin small letter e with acute"), '\u00e9')
+		self.assertEqual(pyunicodedata.lookup(b"GRINNING FACE"), '\U0001F600')
+		self.assertEqual(pyunicodedata.lookup("HANGUL SYLLABLE GA"), '\uac00')
+		self.assertEqual(pyunicodedata.lookup("HANGUL SYLLABLE A"), '\uc544')
+		self.assertEqual(pyunicodedata.lookup("CJK UNIFIED IDEOGRAPH-4E00"), '\u4e00')
+		self.assertEqual(pyunicodedata.lookup("CJK UNIFIED IDEOGRAPH-20000"), '\U00020000')
+
+		# aliases
+		self.assertEqual(pyunicodedata.lookup("NULL"), '\x00')
+		self.assertEqual(pyunicodedata.lookup("BYTE ORDER MARK"), '\ufeff')
+		self.assertEqual(pyunicodedata.lookup("LATIN CAPITAL LETTER GHA"), '\u01a2')
+
+		# named sequences
+		self.assertEqual(pyunicodedata.lookup("LATIN SMALL LETTER R WITH TILDE"), "r\u0303")
+		self.assertEqual(pyunicodedata.lookup("KEYCAP NUMBER SIGN"), "#\ufe0f\u20e3")
+
+		for name in [
+				"NO SUCH NAME",
+				"LATIN SMALL LETTER \u00e4",
+				"HANGUL SYLLABLE GAX",
+				"hangul syllable ga",
+				"CJK UNIFIED IDEOGRAPH-4e00",
+				"CJK UNIFIED IDEOGRAPH-FFFF",
+				"CJK UNIFIED IDEOGRAPH-2",
+				'',
+				]:
+			with self.subTest(name=name):
+				self.assertRaises(KeyError, pyunicodedata.lookup, name)
+
+		self.assertRaisesRegex(KeyError, "name too long", pyunicodedata.lookup, 'a' * 257)
+		self.assertRaises(TypeError, pyunicodedata.lookup)
+		self.assertRaises(TypeError, pyunicodedata.lookup, 1)
+
+	def test_search_names(self):
+		self.assertEqual(pyunicodedata.search_names("greek small letter alpha")[:2], [0x3ac, 0x3b1])
+		self.assertEqual(pyunicodedata.search_names("latin capital letter a with gr", prefix=True), [0xc0, 0x200, 0x1ea6, 0x1eb0])
+		self.assertEqual(pyunicodedata.search_names("latin capital letter a with gr"), [])
+		self.assertEqual(pyunicodedata.search_names("NORTH  east\tarrow")[:2], [0x2197, 0x21d7])
+
+		for code in pyunicodedata.search_names("arrow"):
+			self.assertIn("ARROW", pyunicodedata.name(chr(code)).split())
+		for code in pyunicodedata.search_names("arr", prefix=True):
+			self.assertTrue(any(word.startswith("ARR") for word in pyunicodedata.name(chr(code)).split()))
+
+		# Hangul syllables and CJK unified ideographs
+		self.assertEqual(pyunicodedata.search_names("hangul syllable gag"), [0xac01])
+		self.assertEqual(pyunicodedata.search_names("hangul syllable gg", prefix=True)[0], 0xae4c)
+		self.assertEqual(len(pyunicodedata.search_names("hangul syllable")), 11172)
+		self.assertEqual(pyunicodedata.search_names("CJK COMPATIBILITY IDEOGRAPH-4E00"), [])
+		# also SQUARED CJK UNIFIED IDEOGRAPH-4E00, which is in the index
+		self.assertEqual(pyunicodedata.search_names("cjk unified ideograph-4e00"), [0x4e00, 0x1f229])
+		self.assertEqual(pyunicodedata.search_names("unified ideograph-4e0", prefix=True)[:17], [*range(0x4e00, 0x4e10), 0x1f229])
+		self.assertEqual(pyunicodedata.search_names("ideograph-2a6d", prefix=True)[-1], 0x2a6dd)
+
+		# aliases and named sequences are not characters' names
+		self.assertNotIn(0xf0000, pyunicodedata.search_names("null"))
+		self.assertEqual(pyunicodedata.search_names("keycap number sign"), [])
+
+		self.assertEqual(pyunicodedata.search_names(''), [])
+		self.assertEqual(pyunicodedata.search_names("no such words"), [])
+		self.assertEqual(pyunicodedata.search_names("\u00e4"), [])
+		self.assertRaises(TypeError, pyunicodedata.search_names, b"arrow")
+
+	@requires_resource("cpu")
+	def test_name_lookup_roundtrip(self):
+		count = 0
+		for i in range(sys.maxunicode + 1):
+			char = chr(i)
+			name = pyunicodedata.name(char, None)
+			if name is not None:
+				self.assertEqual(pyunicodedata.lookup(name), char)
+				count += 1
+
+		# The number of named characters in Unicode 13.0.0
+		self.assertEqual(count, 137714)
+
+	def test_simple_case(self):
+		self.assertEqual(pyunicodedata.simple_upper('a'), 'A')
+		self.assertEqual(pyunicodedata.simple_lower('\u0130'), 'i')
+		self.assertEqual(pyunicodedata.simple_title('\u01c6'), '\u01c5')
+		self.assertEqual(pyunicodedata.simple_upper('\u01c6'), '\u01c4')
+
+		# the simple mapping of a character whose full mapping is several characters
+		self.assertEqual(pyunicodedata.simple_upper('\u00df'), '\u00df')
+		self.assertEqual(pyunicodedata.simple_upper('\ufb01'), '\ufb01')
+		self.assertEqual(pyunicodedata.simple_upper('\u1f80'), '\u1f88')
+		self.assertEqual(pyunicodedata.simple_upper('\u017f'), 'S')
+
+		self.assertEqual(pyunicodedata.simple_casefold('A'), 'a')
+		self.assertEqual(pyunicodedata.simple_casefold('\u00df'), '\u00df')
+		self.assertEqual(pyunicodedata.simple_casefold('\u1e9e'), '\u00df')
+		self.assertEqual(pyunicodedata.simple_casefold('\u1f88'), '\u1f80')
+		self.assertEqual(pyunicodedata.simple_casefold('\u0130'), '\u0130')
+		self.assertEqual(pyunicodedata.simple_casefold('\uab70'), '\u13a0')
+
+		self.assertEqual(pyunicodedata.simple_lower('1'), '1')
+		self.assertEqual(pyunicodedata.simple_upper('\U0010ffff'), '\U0010ffff')
+		self.assertRaises(TypeError, pyunicodedata.simple_upper, "ab")
+
+	def test_case(self):
+		self.assertEqual(pyunicodedata.to_upper("stra\u00dfe"), "STRASSE")
+		self.assertEqual(pyunicodedata.to_upper("\ufb01n"), "FIN")
+		self.assertEqual(pyunicodedata.to_title("\ufb01n \u01c6emal"), "Fin \u01c5emal")
+		self.assertEqual(pyunicodedata.to_lower("\u0130"), "i\u0307")
+		self.assertEqual(pyunicodedata.casefold("Stra\u00dfe"), "strasse")
+		self.assertEqual(pyunicodedata.casefold("\u13f8"), "\u13f0")
+		self.assertEqual(pyunicodedata.to_lower("Hello World"), "hello world")
+		self.assertEqual(pyunicodedata.to_title("hello world"), "Hello World")
+		self.assertEqual(pyunicodedata.to_upper(''), '')
+
+		# final sigma
+		self.assertEqual(pyunicodedata.to_lower("\u03a3"), "\u03c3")
+		self.assertEqual(pyunicodedata.to_lower("\u039f\u03a3"), "\u03bf\u03c2")
+		self.assertEqual(pyunicodedata.to_lower("\u039f\u03a3 \u03a3\u039f"), "\u03bf\u03c2 \u03c3\u03bf")
+		self.assertEqual(pyunicodedata.to_lower("\u039f\u03a3'."), "\u03bf\u03c2'.")
+		self.assertEqual(pyunicodedata.to_lower("\u039f\u03a3'\u039f"), "\u03bf\u03c3'\u03bf")
+		self.assertEqual(pyunicodedata.to_lower("\u03a3\u03a3\u03a3"), "\u03c3\u03c3\u03c2")
+		self.assertEqual(pyunicodedata.to_title("\u039f\u03a3\u03a3"), "\u039f\u03c3\u03c2")
+		self.assertEqual(pyunicodedata.casefold("\u039f\u03a3"), "\u03bf\u03c3")
+
+		self.assertRaises(TypeError, pyunicodedata.to_lower, b"abc")
+
+	@requires_resource("cpu")
+	def test_case_matches_str(self):
+		# Compare with the interpreter's own tables, for the characters assigned in both versions of Unicode.
+		chars = [
+				chr(code) for code in range(sys.maxunicode + 1)
+				if pyunicodedata.category(chr(code)) == unicodedata.category(chr(code)) != "Cn"
+				]
+		for ch in chars:
+			self.assertEqual(pyunicodedata.to_lower(ch), ch.lower())
+			self.assertEqual(pyunicodedata.to_upper(ch), ch.upper())
+			self.assertEqual(pyunicodedata.to_title(ch), ch.title())
+			self.assertEqual(pyunicodedata.casefold(ch), ch.casefold())
+
+		text = ''.join(chars)
+		self.assertEqual(pyunicodedata.to_lower(text), text.lower())
+		self.assertEqual(pyunicodedata.to_title(text), text.title())
+
+	def test_translation_tables(self):
+		table = pyunicodedata.decimal_translation_table()
+		self.assertIs(pyunicodedata.decimal_translation_table(), table)
+		self.assertEqual("\u0661\u0669\u0668\u0664".translate(table), "1984")
+		self.assertEqual("v\uff11.\U0001d7d8 \u00b2\u2468".translate(table), "v1.0 \u00b2\u2468")
+		self.assertNotIn(ord('1'), table)
+		self.assertEqual(
+				table,
+				{
+						code: str(pyunicodedata.decimal(chr(code)))
+						for code in range(0x3a, sys.maxunicode + 1)
+						if pyunicodedata.decimal(chr(code), None) is not None
+						},
+				)
+
+		table = pyunicodedata.simple_casefold_table()
+		self.assertIs(pyunicodedata.simple_casefold_table(), table)
+		self.assertEqual("Stra\u00dfe STRA\u1e9eE \u212a".translate(table), "stra\u00dfe stra\u00dfe k")
+		for code, folded in table.items():
+			self.assertEqual(pyunicodedata.simple_casefold(chr(code)), folded)
+		self.assertEqual(len(table), 1414)
+
+	def test_parse_int(self):
+		self.assertEqual(pyunicodedata.parse_int("1984"), 1984)
+		self.assertEqual(pyunicodedata.parse_int("\u0661\u0669\u0668\u0664"), 1984)
+		self.assertEqual(pyunicodedata.parse_int("\u0967\u096f\u096e\u096a"), 1984)
+		self.assertEqual(pyunicodedata.parse_int(" -\uff14\uff12\n"), -42)
+		self.assertEqual(pyunicodedata.parse_int("+\U0001d7cf\U0001d7ce"), 10)
+		self.assertEqual(pyunicodedata.parse_int("1_000_000"), 1000000)
+		self.assertEqual(pyunicodedata.parse_int("\u0661_\u0660\u0660\u0660"), 1000)
+		self.assertEqual(pyunicodedata.parse_int("ff", base=16), 255)
+		self.assertEqual(pyunicodedata.parse_int("\u0661\u0660", base=2), 2)
+		self.assertEqual(pyunicodedata.parse_int("Zz", base=36), 1295)
+
+		# The whitespace is that of the package's tables, not the interpreter's.
+		# this package
+		from pyunicodedata._c_unicodedata import database
+
+		for char in database().WHITESPACE:
+			self.assertEqual(pyunicodedata.parse_int(f"{char}1{char}"), 1)
+		self.assertRaisesRegex(ValueError, "invalid literal", pyunicodedata.parse_int, "\u180e1")
+
+		# mixed scripts
+		for text in ["1\u0662", "\u0662\u06f2", "\u0661_2", "\U0001d7cf\U0001d7d9", "\u0661f"]:
+			with self.subTest(text=text):
+				self.assertRaisesRegex(ValueError, "different scripts", pyunicodedata.parse_int, text, base=16)
+				self.assertEqual(
+						pyunicodedata.parse_int(text, base=16, allow_mixed_scripts=True),
+						int(text.translate(pyunicodedata.decimal_translation_table()), 16),
+						)
+
+		for text in [
+				'',
+				'-',
+				"--1",
+				"- 1",
+				"1 2",
+				"_1",
+				"1_",
+				"1__0",
+				"1.5",
+				"\u00b2",
+				"\u2460",
+				"a",
+				"\u0661a",
+				"0x10",
+				"\uff41",
+				]:
+			with self.subTest(text=text):
+				self.assertRaisesRegex(ValueError, "invalid literal", pyunicodedata.parse_int, text)
+
+		self.assertRaisesRegex(ValueError, "invalid literal", pyunicodedata.parse_int, "0x10", base=16)
+		self.assertRaisesRegex(ValueError, "invalid literal", pyunicodedata.parse_int, "12", base=2)
+		self.assertRaises(ValueError, pyunicodedata.parse_int, "1", base=1)
+		self.assertRaises(ValueError, pyunicodedata.parse_int, "1", base=37)
+		self.assertRaises(TypeError, pyunicodedata.parse_int, b"1")
+		self.assertRaises(TypeError, pyunicodedata.parse_int, 1)
+		self.assertRaises(TypeError, pyunicodedata.parse_int, "1", 10)
+
+	def test_isspace(self):
+		self.assertTrue(pyunicodedata.isspace(" \t\n\u3000\u2028"))
+		self.assertTrue(pyunicodedata.isspace("\x1f"))
+		self.assertFalse(pyunicodedata.isspace(" x "))
+		self.assertFalse(pyunicodedata.isspace("\u200b"))
+		self.assertFalse(pyunicodedata.isspace(''))
+
+		self.assertTrue(pyunicodedata.islinebreak("\r\n\x85\u2029"))
+		self.assertFalse(pyunicodedata.islinebreak("\n "))
+		self.assertFalse(pyunicodedata.islinebreak("\x1f"))
+		self.assertFalse(pyunicodedata.islinebreak(''))
+
+		self.assertRaises(TypeError, pyunicodedata.isspace, b' ')
+
+	@requires_resource("cpu")
+	def test_isspace_all(self):
+		# The whitespace and line breaks have not changed since Unicode 6.3
+		for i in range(sys.maxunicode + 1):
+			char = chr(i)
+			self.assertEqual(pyunicodedata.isspace(char), char.isspace())
+			self.assertEqual(pyunicodedata.islinebreak(char), len(('a' + char + 'b').splitlines()) == 2)
+
+	def test_splitlines(self):
+		for text in [
+				'',
+				"abc",
+				"a\nb\r\nc\rd",
+				"caf\u00e9\nna\u00efve\n",
+				"one\u2028two\u2029three\x85",
+				"\r\r\n\n\u00e9",
+				"x\x0b\x0c\x1c\x1d\x1e\u2028",
+				"\u2028",
+				]:
+			with self.subTest(text=text):
+				self.assertEqual(pyunicodedata.splitlines(text), text.splitlines())
+				self.assertEqual(pyunicodedata.splitlines(text, keepends=True), text.splitlines(keepends=True))
+
+		self.assertRaises(TypeError, pyunicodedata.splitlines, b"a\nb")
+
+	def test_is_identifier(self):
+		for name in ["a", "_", "user_name", "\u00e9t\u00e9", "\u03b1\u03b2", "x\u0301", "\u5b57\u6bb5", "_1"]:
+			with self.subTest(name=name):
+				self.assertTrue(pyunicodedata.is_identifier(name))
+				self.assertEqual(pyunicodedata.find_invalid_identifier_chars(name), [])
+
+		for name, invalid in [
+				("user-name.first", [4, 9]),
+				("2nd_field", [0]),
+				("\u0301x", [0]),
+				("a\u00b7\u2028b", [2]),
+				("caf\u00e9 au lait", [4, 7]),
+				("\uff3fname", [0]),
+				]:
+			with self.subTest(name=name):
+				self.assertFalse(pyunicodedata.is_identifier(name))
+				self.assertEqual(pyunicodedata.find_invalid_identifier_chars(name), invalid)
+
+		self.assertFalse(pyunicodedata.is_identifier(''))
+		self.assertEqual(pyunicodedata.find_invalid_identifier_chars(''), [])
+
+		# NFKC normalization
+		self.assertTrue(pyunicodedata.is_identifier("\uff3fname", normalize=True))
+		self.assertEqual(pyunicodedata.find_invalid_identifier_chars("\uff3fname", normalize=True), [])
+		self.assertTrue(pyunicodedata.is_identifier("\ufb01le", normalize=True))
+		self.assertEqual(pyunicodedata.find_invalid_identifier_chars("\u00bd\ufb01", normalize=True), [0, 1])
+
+		self.assertRaises(TypeError, pyunicodedata.is_identifier, b"name")
+		self.assertRaises(TypeError, pyunicodedata.find_invalid_identifier_chars, None)
+
+	@requires_resource("cpu")
+	def test_is_identifier_matches_str(self):
+		# Compare with the interpreter's own tables, for the characters assigned in both versions of Unicode.
+		for i in range(sys.maxunicode + 1):
+			char = chr(i)
+			if pyunicodedata.category(char) == unicodedata.category(char) != "Cn":
+				self.assertEqual(pyunicodedata.is_identifier(char), char.isidentifier())
+				self.assertEqual(pyunicodedata.is_identifier('a' + char), ('a' + char).isidentifier())
+
+	def test_isprintable(self):
+		self.assertTrue(pyunicodedata.isprintable(''))
+		self.assertTrue(pyunicodedata.isprintable("caf\u00e9 \u2014 \U0001f600"))
+		self.assertFalse(pyunicodedata.isprintable("tab\there"))
+		self.assertFalse(pyunicodedata.isprintable("\u00a0"))
+		self.assertFalse(pyunicodedata.isprintable("\u200b"))
+		self.assertFalse(pyunicodedata.isprintable("\U0010ffff"))
+		self.assertRaises(TypeError, pyunicodedata.isprintable, b"abc")
+
+	def test_escape_nonprintable(self):
+		for text in [
+				'',
+				"abc",
+				"caf\u00e9\tbar\x1b[0m\u200b\n",
+				"\x00\x7f\x80\x9f\u00a0\u00ad",
+				"\u2028\u2029\ue000\U000e0001\U0010ffff\ud800",
+				"\r\n\r\n",
+				]:
+			with self.subTest(text=text):
+				self.assertEqual(pyunicodedata.escape_nonprintable(text), repr(text)[1:-1])
+
+		# many distinct non-printable characters
+		text = ''.join(
+				chr(code) for code in range(0x2060)
+				if pyunicodedata.category(chr(code)) == unicodedata.category(chr(code)) and chr(code) not in "'\\"
+				)
+		self.assertEqual(pyunicodedata.escape_nonprintable(text), repr(text)[1:-1])
+
+		# only non-printable characters are escaped
+		self.assertEqual(pyunicodedata.escape_nonprintable("'\\\""), "'\\\"")
+		self.assertEqual(pyunicodedata.escape_nonprintable("\\x00\x00"), "\\x00\\x00")
+		self.assertRaises(TypeError, pyunicodedata.escape_nonprintable, b"abc")
+
+	@requires_resource("cpu")
+	def test_isprintable_matches_str(self):
+		# Compare with the interpreter's own tables, for the characters assigned in both versions of Unicode.
+		for i in range(sys.maxunicode + 1):
+			char = chr(i)
+			if pyunicodedata.category(char) == unicodedata.category(char):
+				self.assertEqual(pyunicodedata.isprintable(char), char.isprintable())
+				if char not in "'\\":
+					self.assertEqual(pyunicodedata.escape_nonprintable(char), repr(char)[1:-1])
+
+	def test_many(self):
+		text = "A9⅛⑨𠀀𝟽꘧𐄪x"
+		for single, many in [
+				(pyunicodedata.decimal, pyunicodedata.decimal_many),
+				(pyunicodedata.digit, pyunicodedata.digit_many),
+				(pyunicodedata.numeric, pyunicodedata.numeric_many),
+				]:
+			with self.subTest(many.__name__):
+				expected = [single(ch, None) for ch in text]
+				self.assertEqual(many(text), expected)
+				self.assertEqual(many(map(ord, text)), expected)
+				self.assertEqual(many(text, -1), [single(ch, -1) for ch in text])
+				self.assertEqual(many(''), [])
+
+				self.assertRaises(ValueError, many, [0x110000])
+				self.assertRaises(ValueError, many, [-1])
+				self.assertRaises(TypeError, many, [1.5])
+
+		self.assertEqual(pyunicodedata.decimal_many("2021-09-30"), [2, 0, 2, 1, None, 0, 9, None, 3, 0])
+
+	@requires_resource("cpu")
+	def test_many_all(self):
+		text = ''.join(map(chr, range(sys.maxunicode + 1)))
+		self.assertEqual(pyunicodedata.decimal_many(text), [pyunicodedata.decimal(ch, None) for ch in text])
+		self.assertEqual(pyunicodedata.digit_many(text), [pyunicodedata.digit(ch, None) for ch in text])
+		self.assertEqual(pyunicodedata.numeric_many(text), [pyunicodedata.numeric(ch, None) for ch in text])
+
 	def test_decimal(self):
 		self.assertEqual(pyunicodedata.decimal('A', None), None)
 		self.assertEqual(pyunicodedata.decimal('9'), 9)
@@ -161,6 +799,262 @@ class UnicodeMiscTest(unittest.TestCase):
 		error = "SyntaxError: (unicode error) \\N escapes not supported (can't load unicodedata module)"
 		self.assertIn(error, result.err.decode("ascii"))
 
+	def test_lazy_tables(self):
+		# Importing the package and installing the patch, as the .pth file does,
+		# should not load any of the character tables.
+		code = '\n'.join([
+				"import sys",
+				f"sys.path.insert(0, {os.path.dirname(pyunicodedata.__path__[0])!r})",
+				"import pyunicodedata",
+				"pyunicodedata.install_patch()",
+				"tables = ['_c_unicodedata', '_unicode_numeric', '_unicodedata_changes', '_unicodedata_db', '_unicodedata_decomp', '_unicodedata_index', '_unicodetype_db', '_unicodetype_index']",
+				"tables += ['_unicodename', '_unicodename_db']",
+				"assert not [m for m in tables if f'pyunicodedata.{m}' in sys.modules]",
+				"assert pyunicodedata.numeric('\\u216b') == 12.0",
+				"assert 'pyunicodedata._c_unicodedata' in sys.modules",
+				"assert pyunicodedata.Py_UNICODE_TONUMERIC.__module__ == 'pyunicodedata._c_unicodedata'",
+				# The names are only loaded when they are needed.
+				"assert 'pyunicodedata._unicodename' not in sys.modules",
+				"assert pyunicodedata.name('\\u216b') == 'ROMAN NUMERAL TWELVE'",
+				"assert 'pyunicodedata._unicodename' in sys.modules",
+				"assert pyunicodedata.unicodedata_UCD_lookup_impl.__module__ == 'pyunicodedata._unicodename'",
+				"assert 'numpy' not in sys.modules",
+				])
+		script_helper.assert_python_ok("-c", code)
+
+	def test_lazy_ucd_3_2_0(self):
+		# When the interpreter has no ucd_3_2_0, install_patch() adds one which is created on first use.
+		code = '\n'.join([
+				"import sys, unicodedata",
+				f"sys.path.insert(0, {os.path.dirname(pyunicodedata.__path__[0])!r})",
+				"del unicodedata.ucd_3_2_0",
+				"import pyunicodedata",
+				"pyunicodedata.install_patch()",
+				"assert 'pyunicodedata._database' not in sys.modules",
+				"assert 'ucd_3_2_0' not in vars(unicodedata)",
+				"assert unicodedata.ucd_3_2_0 is pyunicodedata.ucd_3_2_0",
+				"assert unicodedata.ucd_3_2_0.unidata_version == '3.2.0'",
+				"assert not hasattr(unicodedata, 'ucd_4_0_0')",
+				])
+		script_helper.assert_python_ok("-c", code)
+
+	def test_ucd(self):
+		version = pyunicodedata._default_version()
+		ucd = pyunicodedata.UCD(version)
+		self.assertEqual(ucd.unidata_version, version)
+		self.assertEqual(repr(ucd), f"UCD({version!r})")
+
+		for char in "a\u00bd\u0663\u216b\u0300\ufb01\U0001f600\U000e0000":
+			self.assertEqual(ucd.category(char), pyunicodedata.category(char))
+			self.assertEqual(ucd.bidirectional(char), pyunicodedata.bidirectional(char))
+			self.assertEqual(ucd.combining(char), pyunicodedata.combining(char))
+			self.assertEqual(ucd.mirrored(char), pyunicodedata.mirrored(char))
+			self.assertEqual(ucd.east_asian_width(char), pyunicodedata.east_asian_width(char))
+			self.assertEqual(ucd.decomposition(char), pyunicodedata.decomposition(char))
+			self.assertEqual(ucd.decimal(char, None), pyunicodedata.decimal(char, None))
+			self.assertEqual(ucd.digit(char, None), pyunicodedata.digit(char, None))
+			self.assertEqual(ucd.numeric(char, None), pyunicodedata.numeric(char, None))
+			self.assertEqual(ucd.name(char, None), pyunicodedata.name(char, None))
+			self.assertEqual(ucd.normalize("NFKD", char), pyunicodedata.normalize("NFKD", char))
+			self.assertEqual(ucd.is_normalized("NFC", char), pyunicodedata.is_normalized("NFC", char))
+
+		self.assertEqual(ucd.lookup("ROMAN NUMERAL TWELVE"), '\u216b')
+		self.assertRaises(ValueError, ucd.decimal, 'a')
+		self.assertRaises(ValueError, ucd.digit, 'a')
+		self.assertRaises(ValueError, ucd.numeric, 'a')
+		self.assertRaises(ValueError, ucd.name, '\U000e0000')
+		self.assertRaises(KeyError, ucd.lookup, "NOT A CHARACTER NAME")
+
+		self.assertRaises(ValueError, pyunicodedata.UCD, "1.0.0")
+		self.assertRaises(ValueError, pyunicodedata.UCD, "not a version")
+
+	def test_ucd_3_2_0(self):
+		ucd = pyunicodedata.ucd_3_2_0
+		self.assertIs(pyunicodedata.ucd_3_2_0, ucd)
+		self.assertEqual(ucd.unidata_version, "3.2.0")
+
+		# Characters added since 3.2.0 are unassigned.
+		self.assertEqual(ucd.category('\U0001f600'), "Cn")
+		self.assertEqual(ucd.bidirectional('\U0001f600'), '')
+		self.assertEqual(ucd.east_asian_width('\U0001f600'), 'F')
+		self.assertEqual(ucd.decomposition('\u1b06'), '')
+		self.assertEqual(ucd.normalize("NFD", "\u1b06"), "\u1b06")
+		self.assertEqual(pyunicodedata.normalize("NFD", "\u1b06"), "\u1b05\u1b35")
+		self.assertIsNone(ucd.name('\U0001f600', None))
+		self.assertRaises(KeyError, ucd.lookup, "GRINNING FACE")
+		self.assertEqual(ucd.decimal('\u0e50'), 0)
+
+		# Including the CJK unified ideographs, whose names are algorithmic.
+		self.assertEqual(pyunicodedata.name('\u9fa6'), "CJK UNIFIED IDEOGRAPH-9FA6")
+		self.assertIsNone(ucd.name('\u9fa6', None))
+		self.assertRaises(KeyError, ucd.lookup, "CJK UNIFIED IDEOGRAPH-9FA6")
+		self.assertEqual(ucd.lookup("CJK UNIFIED IDEOGRAPH-9FA5"), '\u9fa5')
+
+		# this package
+		from pyunicodedata import _unicodename
+
+		names = _unicodename.database("3.2.0")
+		self.assertEqual(names.search_names_impl("CJK UNIFIED IDEOGRAPH-9FA", True)[-1], 0x9fa5)
+		self.assertEqual(names.search_names_impl("GRINNING FACE", False), [])
+		self.assertIn(0x1f600, pyunicodedata.search_names("GRINNING FACE"))
+		self.assertRaises(ValueError, ucd.decimal, '\U000104a0')
+
+		# There are no aliases or named sequences.
+		self.assertEqual(pyunicodedata.lookup("LATIN CAPITAL LETTER GHA"), '\u01a2')
+		self.assertRaises(KeyError, ucd.lookup, "LATIN CAPITAL LETTER GHA")
+		self.assertEqual(ucd.lookup("LATIN CAPITAL LETTER OI"), '\u01a2')
+
+		# Changes to records and to normalization.
+		self.assertEqual(ucd.category('\u00aa'), "Ll")
+		self.assertEqual(pyunicodedata.category('\u00aa'), "Lo")
+		self.assertEqual(ucd.bidirectional('+'), "ET")
+		self.assertEqual(pyunicodedata.bidirectional('+'), "ES")
+		self.assertEqual(ucd.decimal('\u00b2'), 2)
+		self.assertEqual(ucd.numeric('\u00b2'), 2.0)
+		self.assertRaises(ValueError, pyunicodedata.decimal, '\u00b2')
+		self.assertEqual(ucd.category('\u00b5'), pyunicodedata.category('\u00b5'))
+		self.assertEqual(ucd.normalize("NFD", '\U0002f868'), '\U0002136a')
+		self.assertEqual(pyunicodedata.normalize("NFD", '\U0002f868'), '\u36fc')
+		self.assertFalse(ucd.is_normalized("NFD", '\U0002f868'))
+
+		# IDNA 2003, as in encodings.idna.nameprep().
+		self.assertEqual(ucd.normalize("NFKC", "Bücher\u2126"), "Bücher\u03a9")
+
+	def test_ucd_12_1_0(self):
+		self.assertIn("12.1.0", database_versions())
+		ucd = pyunicodedata.UCD("12.1.0")
+
+		# Characters added in 13.0.0 are unassigned.
+		self.assertEqual(ucd.category('\U0001f972'), "Cn")
+		self.assertEqual(pyunicodedata.category('\U0001f972'), "So")
+		self.assertIsNone(ucd.name('\U0001f972', None))
+		self.assertRaises(KeyError, ucd.lookup, "SMILING FACE WITH TEAR")
+		self.assertRaises(ValueError, ucd.decimal, '\U0001fbf1')
+		self.assertEqual(pyunicodedata.decimal('\U0001fbf1'), 1)
+
+		# Including the CJK unified ideographs, whose names are algorithmic.
+		self.assertEqual(ucd.name('\u9fef'), "CJK UNIFIED IDEOGRAPH-9FEF")
+		self.assertIsNone(ucd.name('\u9ff0', None))
+		self.assertEqual(pyunicodedata.name('\u9ff0'), "CJK UNIFIED IDEOGRAPH-9FF0")
+		self.assertEqual(ucd.category('\u4db6'), "Cn")
+		self.assertRaises(KeyError, ucd.lookup, "CJK UNIFIED IDEOGRAPH-30000")
+
+		# Characters which are the same in both versions.
+		for char in ('a', '\u00b2', '\u0661', '\uac00', '\U0001f600'):
+			self.assertEqual(ucd.category(char), pyunicodedata.category(char))
+			self.assertEqual(ucd.name(char), pyunicodedata.name(char))
+			self.assertEqual(ucd.numeric(char, None), pyunicodedata.numeric(char, None))
+			self.assertEqual(ucd.normalize("NFKD", char), pyunicodedata.normalize("NFKD", char))
+
+		code = '\n'.join([
+				"import sys, unicodedata",
+				f"sys.path.insert(0, {os.path.dirname(pyunicodedata.__path__[0])!r})",
+				"import pyunicodedata",
+				"unicodedata.unidata_version = '12.1.0'",
+				"del unicodedata.category, unicodedata.name",
+				"assert pyunicodedata.match_interpreter() == '12.1.0'",
+				"assert pyunicodedata.category('\\U0001f972') == 'Cn'",
+				"assert pyunicodedata.name('\\U0001f972', None) is None",
+				"assert pyunicodedata.search_names('SMILING FACE WITH TEAR') == []",
+				])
+		script_helper.assert_python_ok("-c", code)
+
+	def test_match_interpreter(self):
+		code = '\n'.join([
+				"import sys, unicodedata, warnings",
+				f"sys.path.insert(0, {os.path.dirname(pyunicodedata.__path__[0])!r})",
+				"import pyunicodedata",
+				"with warnings.catch_warnings(record=True) as w:",
+				"    warnings.simplefilter('always')",
+				"    version = pyunicodedata.match_interpreter()",
+				"assert version in {None, unicodedata.unidata_version}",
+				"if version is None:",
+				"    assert [warning for warning in w if warning.category is RuntimeWarning], w",
+				"    assert pyunicodedata.category is not unicodedata.category",
+				"else:",
+				"    assert pyunicodedata.category is unicodedata.category",
+				"    assert pyunicodedata.normalize is unicodedata.normalize",
+				"    assert pyunicodedata.ucd_3_2_0 is unicodedata.ucd_3_2_0",
+				])
+		script_helper.assert_python_ok("-c", code)
+
+	def test_match_interpreter_no_tables(self):
+		# Pretend the interpreter is for a version of Unicode there are no tables for.
+		code = '\n'.join([
+				"import sys, unicodedata, warnings",
+				f"sys.path.insert(0, {os.path.dirname(pyunicodedata.__path__[0])!r})",
+				"import pyunicodedata",
+				"unicodedata.unidata_version = '3.2.0'",
+				"with warnings.catch_warnings():",
+				"    warnings.simplefilter('ignore')",
+				"    assert pyunicodedata.match_interpreter() == '3.2.0'",
+				"assert pyunicodedata.category is unicodedata.category",
+				"assert pyunicodedata.numeric_fraction('\\u00b2') == 2",
+				"unicodedata.unidata_version = '2.1.9'",
+				"with warnings.catch_warnings(record=True) as w:",
+				"    warnings.simplefilter('always')",
+				"    assert pyunicodedata.match_interpreter() is None",
+				"assert [str(warning.message) for warning in w] == [",
+				"        'There are no tables for Unicode 2.1.9, the version used by unicodedata; '",
+				"        f'the tables for Unicode {pyunicodedata._default_version()} are used instead.',",
+				"        ]",
+				# Nothing is delegated, so every function uses the same tables.
+				"assert pyunicodedata.category is not unicodedata.category",
+				"assert pyunicodedata.category('\\U0001f600') == 'So'",
+				"assert pyunicodedata.decimal('\\u00b2', None) is None",
+				"assert pyunicodedata.numeric_fraction('\\u00b2') == 2",
+				])
+		script_helper.assert_python_ok("-c", code)
+
+	def test_match_interpreter_tables(self):
+		# Pretend the interpreter is for Unicode 3.2.0, and has no unicodedata.category()
+		code = '\n'.join([
+				"import sys, unicodedata, warnings",
+				f"sys.path.insert(0, {os.path.dirname(pyunicodedata.__path__[0])!r})",
+				"import pyunicodedata",
+				"assert pyunicodedata.category('\\u00aa') == 'Lo'",
+				"unicodedata.unidata_version = '3.2.0'",
+				"with warnings.catch_warnings(record=True) as w:",
+				"    warnings.simplefilter('always')",
+				"    assert pyunicodedata.match_interpreter() == '3.2.0'",
+				# the sample finds characters added since 3.2.0
+				"assert [str(warning.message) for warning in w if warning.category is RuntimeWarning], w",
+				# the sample is only checked once for each version
+				"with warnings.catch_warnings():",
+				"    warnings.simplefilter('error')",
+				"    assert pyunicodedata.match_interpreter() == '3.2.0'",
+				"del unicodedata.category",
+				"with warnings.catch_warnings():",
+				"    warnings.simplefilter('error')",
+				"    assert pyunicodedata.match_interpreter() == '3.2.0'",
+				"assert pyunicodedata.category('\\u00aa') == 'Ll'",
+				"assert pyunicodedata.decimal is unicodedata.decimal",
+				])
+		script_helper.assert_python_ok("-c", code)
+
+	def test_match_interpreter_decimal(self):
+		# The Latin-1 results and the lookups of many characters use the tables for 3.2.0 too,
+		# in which the superscript digits are decimal digits.
+		code = '\n'.join([
+				"import sys, unicodedata, warnings",
+				f"sys.path.insert(0, {os.path.dirname(pyunicodedata.__path__[0])!r})",
+				"import pyunicodedata",
+				"assert pyunicodedata.decimal('\\u00b2', None) is None",
+				"assert pyunicodedata.decimal_many('\\u00b2') == [None]",
+				"unicodedata.unidata_version = '3.2.0'",
+				"del unicodedata.decimal, unicodedata.digit, unicodedata.numeric",
+				"with warnings.catch_warnings():",
+				"    warnings.simplefilter('ignore')",
+				"    assert pyunicodedata.match_interpreter() == '3.2.0'",
+				"assert pyunicodedata.decimal('\\u00b2') == 2",
+				"assert pyunicodedata.digit('\\u00b2') == 2",
+				"assert pyunicodedata.numeric('\\u00b2') == 2.0",
+				"assert pyunicodedata.decimal_many('a\\u00b2\\u00b9') == [None, 2, 1]",
+				"assert pyunicodedata.numeric_many([0xb2, 0x1f600]) == [2.0, None]",
+				"assert pyunicodedata.parse_int('\\u00b2\\u00b3') == 23",
+				])
+		script_helper.assert_python_ok("-c", code)
+
 	def test_decimal_numeric_consistent(self):
 		# Test that decimal and numeric are consistent,
 		# i.e. if a character has a decimal value,
@@ -194,6 +1088,8 @@ class UnicodeMiscTest(unittest.TestCase):
 		# In UCD 5.1.0, a mirrored property changed wrt. UCD 3.2.0
 		self.assertTrue(unicodedata.mirrored('༺'))
 		self.assertTrue(not unicodedata.ucd_3_2_0.mirrored('༺'))
+		self.assertTrue(pyunicodedata.mirrored('༺'))
+		self.assertTrue(not pyunicodedata.ucd_3_2_0.mirrored('༺'))
 		# Also, we now have two ways of representing
 		# the upper-case mapping: as delta, or as absolute value
 		self.assertTrue('a'.upper() == 'A')
@@ -222,5 +1118,297 @@ class UnicodeMiscTest(unittest.TestCase):
 				self.assertEqual(len(lines), 1, r"\u%.4x should not be a linebreak" % i)
 
 
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class NumpyTest(unittest.TestCase):
+
+	def setUp(self):
+		# this package
+		import pyunicodedata.numpy
+
+		self.np = pyunicodedata.numpy
+
+	def test_codepoints(self):
+		self.assertEqual(self.np.codepoints("a⑨𝟽").tolist(), [0x61, 0x2468, 0x1d7fd])
+		self.assertEqual(self.np.codepoints('').tolist(), [])
+		self.assertEqual(self.np.codepoints("a\ud800\udfff").tolist(), [0x61, 0xd800, 0xdfff])
+		self.assertEqual(self.np.isprintable(self.np.codepoints("a\ud800")).tolist(), [True, False])
+
+	def test_values(self):
+		text = "A9⅛⑨𠀀𝟽꘧𐄪x"
+		codes = self.np.codepoints(text)
+		self.assertEqual(self.np.decimal(codes).tolist(), pyunicodedata.decimal_many(text, -1))
+		self.assertEqual(self.np.digit(codes).tolist(), pyunicodedata.digit_many(text, -1))
+		self.assertEqual(self.np.numeric(codes).tolist(), pyunicodedata.numeric_many(text, -1.0))
+		self.assertEqual(self.np.decimal(codes, 99).tolist(), pyunicodedata.decimal_many(text, 99))
+
+		# Out of range code points have no properties.
+		self.assertEqual(self.np.decimal([-1, 0x110000]).tolist(), [-1, -1])
+		self.assertEqual(self.np.isprintable([-1, 0x110000]).tolist(), [False, False])
+
+	@requires_resource("cpu")
+	def test_values_all(self):
+		text = ''.join(map(chr, range(sys.maxunicode + 1)))
+		codes = numpy.arange(sys.maxunicode + 1)
+		self.assertEqual(self.np.decimal(codes).tolist(), pyunicodedata.decimal_many(text, -1))
+		self.assertEqual(self.np.digit(codes).tolist(), pyunicodedata.digit_many(text, -1))
+		self.assertEqual(self.np.numeric(codes).tolist(), pyunicodedata.numeric_many(text, -1.0))
+
+	def test_predicates(self):
+		codes = self.np.codepoints("aA\u01c5 1\n_\x00")
+		self.assertEqual(self.np.islower(codes).tolist(), [1, 0, 0, 0, 0, 0, 0, 0])
+		self.assertEqual(self.np.isupper(codes).tolist(), [0, 1, 0, 0, 0, 0, 0, 0])
+		self.assertEqual(self.np.istitle(codes).tolist(), [0, 0, 1, 0, 0, 0, 0, 0])
+		self.assertEqual(self.np.isalpha(codes).tolist(), [1, 1, 1, 0, 0, 0, 0, 0])
+		self.assertEqual(self.np.isspace(codes).tolist(), [0, 0, 0, 1, 0, 1, 0, 0])
+		self.assertEqual(self.np.islinebreak(codes).tolist(), [0, 0, 0, 0, 0, 1, 0, 0])
+		self.assertEqual(self.np.isdecimal(codes).tolist(), [0, 0, 0, 0, 1, 0, 0, 0])
+		self.assertEqual(self.np.isprintable(codes).tolist(), [1, 1, 1, 1, 1, 0, 1, 0])
+		self.assertEqual(self.np.isxidstart(codes).tolist(), [1, 1, 1, 0, 0, 0, 0, 0])
+		self.assertEqual(self.np.isxidcontinue(codes).tolist(), [1, 1, 1, 0, 1, 0, 1, 0])
+		self.assertEqual(self.np.iscased(codes).tolist(), [1, 1, 1, 0, 0, 0, 0, 0])
+
+
+class DatabaseTest(unittest.TestCase):
+
+	def test_matches_modules(self):
+		# this package
+		from pyunicodedata import (
+				_unicode_numeric,
+				_unicodedata_changes,
+				_unicodedata_db,
+				_unicodedata_decomp,
+				_unicodedata_index,
+				_unicodetype_db,
+				_unicodetype_index
+				)
+
+		tables = open_database()
+		self.assertEqual(tables["SHIFT"], _unicodetype_index.SHIFT)
+		self.assertEqual(tables["DB_SHIFT"], _unicodedata_index.DB_SHIFT)
+		self.assertEqual(tables["DECOMP_SHIFT"], _unicodedata_decomp.DECOMP_SHIFT)
+
+		modules = [
+				_unicodedata_index,
+				_unicodedata_db,
+				_unicodedata_decomp,
+				_unicodedata_changes,
+				_unicodetype_index,
+				_unicodetype_db,
+				_unicode_numeric,
+				]
+		arrays = [name for module in modules for name, value in vars(module).items() if isinstance(value, array)]
+		self.assertEqual(sorted(arrays), sorted(name for name in tables if not name.endswith("SHIFT")))
+
+		for module in modules:
+			for name, value in vars(module).items():
+				if isinstance(value, array):
+					self.assertEqual(tables[name].tolist(), value.tolist(), name)
+
+	def test_latin1(self):
+		# this package
+		from pyunicodedata import _c_unicodedata
+
+		database = _c_unicodedata.database()
+		self.assertEqual(list(database.latin1_records), list(map(database.gettyperecordindex, range(256))))
+
+		for code in range(256):
+			char = chr(code)
+			self.assertEqual(database.latin1_decimal[char], unicodedata.decimal(char, -1))
+			self.assertEqual(database.latin1_digit[char], unicodedata.digit(char, -1))
+			self.assertEqual(database.latin1_numeric[char], unicodedata.numeric(char, -1.0))
+
+	def test_bitmaps(self):
+		# this package
+		from pyunicodedata import _c_unicodedata
+
+		database = _c_unicodedata.database()
+		for name in dir(_c_unicodedata):
+			if name.endswith("_MASK"):
+				bitmap = getattr(database, f"record_is_{name[:-5].lower()}")
+				mask = getattr(_c_unicodedata, name)
+				self.assertEqual(list(bitmap), [int(flags & mask != 0) for flags in database.record_flags])
+
+	def test_name_database(self):
+		# this package
+		from pyunicodedata import _unicodename_db
+		from pyunicodedata._database import NAME_DATABASE
+
+		tables = open_database(NAME_DATABASE)
+
+		for name, value in vars(_unicodename_db).items():
+			if isinstance(value, array):
+				self.assertEqual(tables.pop(name).tolist(), value.tolist(), name)
+			elif isinstance(value, int):
+				self.assertEqual(tables.pop(name), value, name)
+
+		self.assertEqual(tables, {})
+
+	def test_missing(self):
+		with TemporaryPathPlus() as tmpdir:
+			self.assertRaises(FileNotFoundError, open_database, str(tmpdir / "unicodedata.db"))
+
+			(tmpdir / "unicodedata.db").write_bytes(b"not a database")
+			self.assertRaises(ValueError, open_database, str(tmpdir / "unicodedata.db"))
+
+	def test_truncated(self):
+		# this package
+		from pyunicodedata import _database, _unicodetype_index
+
+		with open(_database.DATABASE, "rb") as fp:
+			data = fp.read()
+
+		_, _, count, _ = DATABASE_HEADER.unpack_from(data)
+
+		with TemporaryPathPlus() as tmpdir:
+			filename = str(tmpdir / "unicodedata.db")
+
+			# Cut short in the directory, and in the data.
+			for size in (DATABASE_HEADER.size + DATABASE_ENTRY.size * count // 2, len(data) - 1):
+				(tmpdir / "unicodedata.db").write_bytes(data[:size])
+				self.assertRaises(ValueError, open_database, filename)
+
+				with unittest.mock.patch.object(_database, "DATABASE", filename):
+					_database._default_tables.cache_clear()
+					try:
+						tables = _database.load_tables()
+					finally:
+						_database._default_tables.cache_clear()
+
+				self.assertIsInstance(tables["index1"], array)
+				self.assertEqual(tables["index1"], _unicodetype_index.index1)
+
+	def test_shared(self):
+		# A versioned database can refer to the tables of the default version.
+		offset = DATABASE_HEADER.size + DATABASE_ENTRY.size * 2
+		offset += -offset % 8
+		data = DATABASE_HEADER.pack(DATABASE_MAGIC, DATABASE_FORMAT, 2, b"12.1.0")
+		data += DATABASE_ENTRY.pack(b"index1", b'B', DATABASE_SHARED, 0, 0)
+		data += DATABASE_ENTRY.pack(b"SHIFT", b'q', DATABASE_SCALAR, offset, 1)
+		data += b'\0' * (offset - len(data)) + (3).to_bytes(8, "little")
+
+		with TemporaryPathPlus() as tmpdir:
+			(tmpdir / "unicodedata.db").write_bytes(data)
+			filename = str(tmpdir / "unicodedata.db")
+
+			self.assertEqual(database_version(filename), "12.1.0")
+			self.assertRaises(ValueError, open_database, filename)
+
+			default = open_database()
+			tables = open_database(filename, shared=default)
+			self.assertEqual(tables["SHIFT"], 3)
+			self.assertIs(tables["index1"], default["index1"])
+
+	def test_default_tables_loaded_once(self):
+		# this package
+		from pyunicodedata._database import load_name_tables, load_tables
+
+		self.assertIs(load_tables()["index1"], load_tables("3.2.0")["index1"])
+		self.assertIs(load_name_tables()["phrasebook"], load_name_tables("3.2.0")["phrasebook"])
+
+	def test_versions(self):
+		versions = database_versions()
+		self.assertIsInstance(versions, list)
+		self.assertNotIn(pyunicodedata._default_version(), versions)
+
+		for version in versions:
+			self.assertEqual(database_version(os.path.join(pyunicodedata.__path__[0], version_package(version), "unicodedata.db")), version)
+
+	def test_version_package(self):
+		# this package
+		from pyunicodedata import _c_unicodedata, _database, _unicodename
+
+		# Subpackages for other versions, in which U+0661 ARABIC-INDIC DIGIT ONE has the type record of digit two.
+		default = _database.load_tables()
+		shift = default["SHIFT"]
+
+		def position(char):
+			return (default["index1"][ord(char) >> shift] << shift) + (ord(char) & ((1 << shift) - 1))
+
+		typecode = default["index2"].format if isinstance(default["index2"], memoryview) else default["index2"].typecode
+		one, two = position('\u0661'), position('\u0662')
+		index2 = array(typecode, default["index2"])
+		index2[one] = index2[two]
+
+		def write_database(filename, version, tables, changed):
+			# Every table is shared with the default version except those in ``changed``.
+			offset = DATABASE_HEADER.size + DATABASE_ENTRY.size * len(tables)
+			offset += -offset % 8
+			directory = DATABASE_HEADER.pack(DATABASE_MAGIC, DATABASE_FORMAT, len(tables), version.encode("ascii"))
+			data = b''
+
+			for name in tables:
+				if name in changed:
+					data += b'\0' * (-(offset + len(data)) % 8)
+					directory += DATABASE_ENTRY.pack(
+							name.encode("ascii"),
+							changed[name].typecode.encode("ascii"),
+							0,
+							offset + len(data),
+							len(changed[name]),
+							)
+					data += changed[name].tobytes()
+				else:
+					directory += DATABASE_ENTRY.pack(name.encode("ascii"), b'B', DATABASE_SHARED, 0, 0)
+
+			with open(filename, "wb") as fp:
+				fp.write(directory + b'\0' * (offset - len(directory)) + data)
+
+		with TemporaryPathPlus() as tmpdir:
+			# Version 11.0.0 is memory-mapped from its databases.
+			(tmpdir / "ucd_11_0_0").mkdir()
+			(tmpdir / "ucd_11_0_0" / "__init__.py").write_text('')
+			write_database(tmpdir / "ucd_11_0_0" / "unicodedata.db", "11.0.0", default, {"index2": index2})
+			write_database(tmpdir / "ucd_11_0_0" / "unicodename.db", "11.0.0", _database.load_name_tables(), {})
+
+			# Version 12.0.0 only has the generated modules.
+			(tmpdir / "ucd_12_0_0").mkdir()
+			(tmpdir / "ucd_12_0_0" / "__init__.py").write_text('')
+			for module in [*_database._TABLE_MODULES, "_unicodename_db"]:
+				(tmpdir / "ucd_12_0_0" / f"{module}.py").write_text(f"from pyunicodedata.{module} import *\n")
+			(tmpdir / "ucd_12_0_0" / "_unicodetype_index.py").write_text(
+					"from array import array\n"
+					"from pyunicodedata._unicodetype_index import *\n"
+					"from pyunicodedata._unicodetype_index import index2 as _index2\n"
+					"index2 = array(_index2.typecode, _index2)\n"
+					f"index2[{one}] = index2[{two}]\n"
+					)
+
+			pyunicodedata.__path__.append(str(tmpdir))
+			try:
+				self.assertEqual(database_versions(), ["11.0.0", "12.0.0", "12.1.0"])
+				self.assertEqual(database_version(str(tmpdir / "ucd_11_0_0" / "unicodedata.db")), "11.0.0")
+
+				tables = _database.load_tables("11.0.0")
+				self.assertIs(tables["index1"], _database.load_tables()["index1"])
+				self.assertIsInstance(tables["index2"], memoryview)
+				self.assertEqual(tables["index2"].tolist(), index2.tolist())
+				self.assertIs(_database.load_name_tables("11.0.0")["phrasebook"], _database.load_name_tables()["phrasebook"])
+
+				tables = _database.load_tables("12.0.0")
+				self.assertIsInstance(tables["index1"], array)
+				self.assertEqual(tables["index2"].tolist(), index2.tolist())
+
+				for version in ("11.0.0", "12.0.0"):
+					ucd = pyunicodedata.UCD(version)
+					self.assertEqual(ucd.decimal('\u0661'), 2)
+					self.assertEqual(ucd.decimal('\u0663'), 3)
+					self.assertEqual(ucd.name('\u0661'), "ARABIC-INDIC DIGIT ONE")
+					self.assertEqual(ucd.lookup("ARABIC-INDIC DIGIT ONE"), '\u0661')
+
+				self.assertEqual(pyunicodedata.decimal('\u0661'), 1)
+
+			finally:
+				pyunicodedata.__path__.remove(str(tmpdir))
+				for key in list(pyunicodedata._version_databases):
+					if key[1] in {"11.0.0", "12.0.0"}:
+						del pyunicodedata._version_databases[key]
+				for databases in (_c_unicodedata._databases, _unicodename._databases):
+					databases.pop("11.0.0", None)
+					databases.pop("12.0.0", None)
+				for name in list(sys.modules):
+					if name.startswith(("pyunicodedata.ucd_11_0_0", "pyunicodedata.ucd_12_0_0")):
+						del sys.modules[name]
+
+
 if __name__ == "__main__":
 	unittest.main()